@@ -20,6 +20,11 @@ from models.modalities.chat_state import ChatState
 from models.modalities.calendar_state import CalendarState
 from models.modalities.location_state import LocationState
 from models.modalities.time_state import TimeState
+from models.modalities.filesystem_state import FileSystemState
+from models.modalities.slack_state import SlackState
+from models.modalities.discord_state import DiscordState
+from models.modalities.social_state import SocialMediaState
+from models.modalities.screen_state import ScreenState
 
 
 # Global state
@@ -83,6 +88,11 @@ def initialize_simulation_engine() -> SimulationEngine:
     initial_calendar = CalendarState(last_updated=now)
     initial_location = LocationState(last_updated=now)
     initial_time_prefs = TimeState(last_updated=now)
+    initial_filesystem = FileSystemState(last_updated=now)
+    initial_slack = SlackState(last_updated=now)
+    initial_discord = DiscordState(last_updated=now)
+    initial_social = SocialMediaState(last_updated=now)
+    initial_screen = ScreenState(last_updated=now)
     
     # Create initial environment with all modalities registered
     initial_environment = Environment(
@@ -94,6 +104,11 @@ def initialize_simulation_engine() -> SimulationEngine:
             "calendar": initial_calendar,
             "location": initial_location,
             "time": initial_time_prefs,
+            "filesystem": initial_filesystem,
+            "slack": initial_slack,
+            "discord": initial_discord,
+            "social": initial_social,
+            "screen": initial_screen,
         },
         time_state=initial_time,
     )
@@ -0,0 +1,378 @@
+"""In-process dispatch of API requests, without HTTP.
+
+Agents that run in the same process as the simulator still pay for the whole
+HTTP stack on every call: JSON encoding of the request, HTTP framing, ASGI
+middleware and routing, then JSON encoding of the response and parsing it
+again on the client side. EmbeddedAPI serves the same requests by calling the
+route endpoints directly:
+- The route is looked up from the method and path (static paths with one
+  dict lookup).
+- Path, query, header and body parameters are validated through the route's
+  own FastAPI fields, so validation errors are exactly the ones FastAPI
+  reports. The engine dependency is the engine EmbeddedAPI was created with.
+- Results are dumped through the route's response model in Python mode
+  (MessagePackRoute.serialize()), so datetimes stay datetime objects and no
+  JSON is produced.
+- Exceptions are turned into responses by the application's exception
+  handlers, so error bodies are identical to the HTTP ones.
+
+Only streamed responses (chunked JSON and NDJSON) are encoded, because their
+endpoints produce bytes. See client/_embedded.py for the client side.
+
+EmbeddedAPI.run_batch() also serves the sub-requests of POST /batch (see
+api/routes/batch.py), one after another on an engine worker.
+"""
+
+import functools
+import inspect
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+from fastapi import HTTPException
+from fastapi.exception_handlers import http_exception_handler
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic_core import from_json, to_jsonable_python
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.routing import Match
+
+from api.dependencies import get_simulation_engine
+from api.exceptions import EXCEPTION_HANDLERS
+from api.executor import engine_calls_inline
+from api.streaming import NDJSON_MEDIA_TYPE
+from api.wire_format import MessagePackRoute
+from models.simulation import SimulationEngine
+
+# Exception handlers in the order Starlette consults them for a request
+_HANDLERS = {StarletteHTTPException: http_exception_handler, **EXCEPTION_HANDLERS}
+
+
+class ErrorResponse(Exception):
+    """An error response produced while dispatching a request.
+
+    Attributes:
+        status_code: HTTP status code of the response.
+        body: Decoded response body.
+    """
+
+    def __init__(self, status_code: int, body: Any) -> None:
+        self.status_code = status_code
+        self.body = body
+        super().__init__(f"HTTP {status_code}")
+
+
+def _missing(kind: str, alias: str | None = None) -> dict[str, Any]:
+    """Build the error FastAPI reports for a missing required parameter."""
+    return {
+        "type": "missing",
+        "loc": (kind, alias) if alias else (kind,),
+        "msg": "Field required",
+        "input": None,
+    }
+
+
+_RouteIndex = tuple[
+    dict[tuple[str, str], MessagePackRoute], frozenset[str], tuple[MessagePackRoute, ...]
+]
+
+
+@functools.cache
+def _route_index() -> _RouteIndex:
+    """Index the application's routes for lookup by method and path.
+
+    Built on first use rather than at import, because api.routes.batch
+    imports this module while the routers are being collected.
+
+    Returns:
+        The routes without path parameters keyed by method and path, the
+        paths of those routes, and the routes with path parameters.
+    """
+    from api.routes import ROUTERS
+
+    static: dict[tuple[str, str], MessagePackRoute] = {}
+    static_paths: set[str] = set()
+    dynamic: list[MessagePackRoute] = []
+    for router in ROUTERS:
+        for route in router.routes:
+            if route.param_convertors:
+                dynamic.append(route)
+                continue
+            static_paths.add(route.path)
+            for method in route.methods:
+                static.setdefault((method, route.path), route)
+    return static, frozenset(static_paths), tuple(dynamic)
+
+
+async def _read_body(response: Response) -> bytes:
+    """Collect the body of a response, draining it if it is streamed."""
+    if not isinstance(response, StreamingResponse):
+        return response.body
+    chunks = []
+    async for chunk in response.body_iterator:
+        chunks.append(chunk.encode() if isinstance(chunk, str) else chunk)
+    return b"".join(chunks)
+
+
+def _decode(response: Response, body: bytes) -> Any:
+    """Decode a response body the way the HTTP client would."""
+    if not body:
+        return None
+    if (response.media_type or "").startswith("text/"):
+        return body.decode(response.charset)
+    return from_json(body)
+
+
+async def _iter_ndjson(response: StreamingResponse) -> AsyncIterator[Any]:
+    """Decode an NDJSON response one document at a time."""
+    pending = b""
+    async for chunk in response.body_iterator:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            if line:
+                yield from_json(line)
+    if pending:
+        yield from_json(pending)
+
+
+class EmbeddedAPI:
+    """Serves API requests against an engine by calling endpoints directly.
+
+    Attributes:
+        engine: The engine injected into every endpoint.
+    """
+
+    def __init__(self, engine: SimulationEngine) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            engine: The engine to serve requests against.
+        """
+        self.engine = engine
+        self._static, self._static_paths, self._dynamic = _route_index()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+    ) -> Any:
+        """Handle a request and return its decoded response body.
+
+        Args:
+            method: The HTTP method.
+            path: The URL path.
+            params: Query parameters.
+            json: The request body, as Python data.
+
+        Returns:
+            The response body as Python data, or None if it is empty.
+
+        Raises:
+            ErrorResponse: If the response has an error status.
+        """
+        return await self._read(await self._dispatch(method, path, params, json, None))
+
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+    ) -> AsyncIterator[Any]:
+        """Handle a request for NDJSON and iterate over the documents.
+
+        Args:
+            method: The HTTP method.
+            path: The URL path.
+            params: Query parameters.
+            json: The request body, as Python data.
+
+        Yields:
+            Each document of the response.
+
+        Raises:
+            ErrorResponse: If the response has an error status.
+        """
+        response = await self._dispatch(method, path, params, json, NDJSON_MEDIA_TYPE)
+        if isinstance(response, StreamingResponse) and response.status_code < 400:
+            async for document in _iter_ndjson(response):
+                yield document
+        else:
+            yield await self._read(response)
+
+    def run_batch(
+        self, requests: Iterable[tuple[str, str, dict[str, Any] | None, Any]]
+    ) -> list[tuple[int, Any]]:
+        """Handle requests one after another on the current thread.
+
+        Meant to run as engine work that holds the engine's write lock: the
+        endpoints' own engine calls run inline and reenter that lock, so no
+        other request can change the simulation between two of these. Since
+        those calls no longer wait for anything, each endpoint runs to
+        completion without an event loop. A request whose endpoint does wait
+        (a profile) or streams its response cannot be batched and gets a 400
+        response instead; it does not affect the others.
+
+        Args:
+            requests: (method, path, query parameters, body) of each request.
+
+        Returns:
+            The status code and decoded body of each response, in order.
+        """
+        with engine_calls_inline():
+            return [self._run_now(*request) for request in requests]
+
+    def _run_now(
+        self, method: str, path: str, params: dict[str, Any] | None, json: Any
+    ) -> tuple[int, Any]:
+        """Dispatch one request of a batch without an event loop.
+
+        Returns:
+            The status code and decoded body of the response.
+        """
+        dispatch = self._dispatch(method, path, params, json, None)
+        try:
+            dispatch.send(None)
+        except StopIteration as done:
+            response = done.value
+        else:
+            dispatch.close()
+            return 400, {"detail": f"{method} {path} cannot be batched"}
+        if not isinstance(response, Response):
+            return 200, response
+        if isinstance(response, StreamingResponse):
+            detail = f"{method} {path} streams its response and cannot be batched"
+            return 400, {"detail": detail}
+        return response.status_code, _decode(response, response.body)
+
+    async def _read(self, response: Any) -> Any:
+        """Return the body of a dispatched request.
+
+        Args:
+            response: A Response, or a result already dumped to Python data.
+
+        Returns:
+            The decoded body.
+
+        Raises:
+            ErrorResponse: If the response has an error status.
+        """
+        if not isinstance(response, Response):
+            return response
+        body = await _read_body(response)
+        if response.status_code >= 400:
+            raise ErrorResponse(response.status_code, _decode(response, body))
+        return _decode(response, body)
+
+    async def _dispatch(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        json: Any,
+        accept: str | None,
+    ) -> Any:
+        """Run a request's endpoint, converting exceptions to responses.
+
+        Returns:
+            A Response (streamed results and errors) or the endpoint's
+            result dumped to Python data.
+        """
+        try:
+            route, path_params = self._match(method, path)
+            content = await self._call(route, path_params, params or {}, json, accept)
+            if isinstance(content, Response):
+                return content
+            if route.response_field is None:
+                return to_jsonable_python(content)
+            return route.serialize(content)
+        except Exception as exc:
+            for exception_class in type(exc).__mro__:
+                handler = _HANDLERS.get(exception_class)
+                if handler is not None:
+                    return await handler(None, exc)
+            raise
+
+    def _match(self, method: str, path: str) -> tuple[MessagePackRoute, dict[str, Any]]:
+        """Find the route for a request.
+
+        Raises:
+            HTTPException: 404 if no route has the path, 405 if none of the
+                routes with the path accepts the method.
+        """
+        route = self._static.get((method, path))
+        if route is not None:
+            return route, {}
+        scope = {"type": "http", "method": method, "path": path}
+        allowed = path in self._static_paths
+        for route in self._dynamic:
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                return route, child_scope["path_params"]
+            allowed = allowed or match == Match.PARTIAL
+        if allowed:
+            raise HTTPException(status_code=405, detail="Method Not Allowed")
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    async def _call(
+        self,
+        route: MessagePackRoute,
+        path_params: dict[str, Any],
+        params: dict[str, Any],
+        json: Any,
+        accept: str | None,
+    ) -> Any:
+        """Validate a request's parameters and call the route's endpoint.
+
+        Raises:
+            RequestValidationError: If any parameter fails validation.
+        """
+        dependant = route.dependant
+        values: dict[str, Any] = {}
+        errors: list[Any] = []
+
+        for kind, fields, received in (
+            ("path", dependant.path_params, path_params),
+            ("query", dependant.query_params, params),
+            ("header", dependant.header_params, {"accept": accept}),
+        ):
+            for field in fields:
+                value = received.get(field.alias)
+                if value is None:
+                    if field.field_info.is_required():
+                        errors.append(_missing(kind, field.alias))
+                    else:
+                        values[field.name] = field.get_default()
+                    continue
+                values[field.name], field_errors = field.validate(
+                    value, values, loc=(kind, field.alias)
+                )
+                errors.extend(field_errors)
+
+        # Every route takes at most one body parameter, which is not embedded
+        for field in dependant.body_params:
+            if json is None:
+                if field.field_info.is_required():
+                    errors.append(_missing("body"))
+                else:
+                    values[field.name] = field.get_default()
+                continue
+            values[field.name], field_errors = field.validate(json, values, loc=("body",))
+            errors.extend(field_errors)
+
+        for dependency in dependant.dependencies:
+            if dependency.call is not get_simulation_engine:
+                raise TypeError(f"Unsupported dependency {dependency.call!r}")
+            values[dependency.name] = self.engine
+
+        if errors:
+            raise RequestValidationError(errors, body=json)
+
+        content = route.endpoint(**values)
+        if inspect.isawaitable(content):
+            content = await content
+        return content
@@ -4,6 +4,8 @@ This module defines custom exception handlers that convert Python exceptions
 into consistent, user-friendly JSON responses.
 """
 
+from collections.abc import Awaitable, Callable
+
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
@@ -40,6 +42,20 @@ class SimulationNotRunningError(Exception):
         super().__init__(message)
 
 
+class EngineTimeoutError(Exception):
+    """Raised when engine work does not finish within the request timeout.
+    
+    Args:
+        operation: Name of the engine operation that timed out.
+        timeout: The timeout that was exceeded, in seconds.
+    """
+    
+    def __init__(self, operation: str, timeout: float | None):
+        self.operation = operation
+        self.timeout = timeout
+        super().__init__(f"Operation '{operation}' timed out after {timeout} seconds")
+
+
 # Exception Handlers
 # These convert exceptions into JSON responses
 
@@ -90,6 +106,30 @@ async def simulation_not_running_handler(request: Request, exc: SimulationNotRun
     )
 
 
+async def engine_timeout_handler(request: Request, exc: EngineTimeoutError):
+    """Handle EngineTimeoutError exceptions.
+    
+    Returns a 504 (Gateway Timeout). The operation may still complete in the
+    background, so clients should re-read state before retrying writes.
+    
+    Args:
+        request: The incoming request that triggered the error.
+        exc: The EngineTimeoutError exception.
+    
+    Returns:
+        JSONResponse with 504 status.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={
+            "error": "Engine Timeout",
+            "detail": str(exc),
+            "operation": exc.operation,
+            "timeout_seconds": exc.timeout,
+        },
+    )
+
+
 async def request_validation_exception_handler(
     request: Request, exc: RequestValidationError
 ):
@@ -209,3 +249,16 @@ async def generic_exception_handler(request: Request, exc: Exception):
             "type": type(exc).__name__,
         },
     )
+
+
+# Handlers in registration order: specific exceptions before general ones
+EXCEPTION_HANDLERS: dict[type[Exception], Callable[..., Awaitable[JSONResponse]]] = {
+    RequestValidationError: request_validation_exception_handler,
+    ModalityNotFoundError: modality_not_found_handler,
+    SimulationNotRunningError: simulation_not_running_handler,
+    EngineTimeoutError: engine_timeout_handler,
+    ValidationError: validation_exception_handler,
+    ValueError: value_error_handler,
+    RuntimeError: runtime_error_handler,
+    Exception: generic_exception_handler,
+}
@@ -0,0 +1,211 @@
+"""Bounded worker pool for blocking simulation engine work.
+
+Route handlers are async, so anything they call synchronously runs on the
+event loop. Advancing time, undoing events, clearing state and querying large
+modality states can each take long enough to stall every other request,
+including health checks. Handlers therefore hand such work to run_in_engine(),
+which runs it on a small, bounded thread pool and waits for it with a timeout.
+Cheap reads (health, current time, status) stay on the event loop.
+
+The pool is configured from the environment:
+- UES_ENGINE_WORKERS: Number of worker threads (default 4). 0 runs engine
+  work inline on the event loop, as before.
+- UES_ENGINE_TIMEOUT: Seconds a request waits for engine work before failing
+  with 504 Gateway Timeout (default 30). 0 disables the timeout.
+
+Work that already runs on an engine worker with the engine lock held (a
+POST /batch) wraps its nested calls in engine_calls_inline(), so they run on
+the same thread and reenter the lock instead of waiting on another worker.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any, TypeVar
+
+from api.exceptions import EngineTimeoutError
+from api.middleware import record_engine_time
+
+T = TypeVar("T")
+
+DEFAULT_ENGINE_WORKERS = 4
+DEFAULT_ENGINE_TIMEOUT = 30.0
+
+# Worker threads are named with this prefix, so diagnostics can find them
+ENGINE_THREAD_NAME_PREFIX = "ues-engine"
+
+# Global pool, created lazily on first use or when the app starts
+_engine_executor: ThreadPoolExecutor | None = None
+_engine_timeout: float | None = DEFAULT_ENGINE_TIMEOUT
+_initialized = False
+
+# Set while engine work runs inline inside an enclosing engine call
+_inline_calls: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "ues_engine_calls_inline", default=False
+)
+
+
+def _read_env_number(name: str, default: float) -> float:
+    """Read a non-negative number from an environment variable.
+
+    Args:
+        name: Name of the environment variable.
+        default: Value to use when the variable is unset or empty.
+
+    Returns:
+        The configured value.
+
+    Raises:
+        ValueError: If the variable is not a non-negative number.
+    """
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {raw!r}")
+    if value < 0:
+        raise ValueError(f"{name} must not be negative, got {raw!r}")
+    return value
+
+
+def initialize_engine_executor(
+    max_workers: int | None = None, timeout: float | None = None
+) -> ThreadPoolExecutor | None:
+    """Create the worker pool used for engine work.
+
+    Replaces any existing pool. Values not passed explicitly are read from
+    UES_ENGINE_WORKERS and UES_ENGINE_TIMEOUT.
+
+    Args:
+        max_workers: Number of worker threads. 0 runs engine work inline.
+        timeout: Seconds to wait for engine work. 0 disables the timeout.
+
+    Returns:
+        The new pool, or None if engine work runs inline.
+    """
+    global _engine_executor, _engine_timeout, _initialized
+
+    shutdown_engine_executor()
+
+    if max_workers is None:
+        max_workers = int(_read_env_number("UES_ENGINE_WORKERS", DEFAULT_ENGINE_WORKERS))
+    if timeout is None:
+        timeout = _read_env_number("UES_ENGINE_TIMEOUT", DEFAULT_ENGINE_TIMEOUT)
+
+    if max_workers > 0:
+        _engine_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=ENGINE_THREAD_NAME_PREFIX
+        )
+    _engine_timeout = timeout or None
+    _initialized = True
+
+    return _engine_executor
+
+
+def get_engine_executor() -> ThreadPoolExecutor | None:
+    """Get the worker pool, creating it from the environment if needed.
+
+    Returns:
+        The shared pool, or None if engine work runs inline.
+    """
+    if not _initialized:
+        initialize_engine_executor()
+    return _engine_executor
+
+
+def shutdown_engine_executor() -> None:
+    """Shut down the worker pool.
+
+    Waits for running work to finish and drops queued work. The next call
+    to get_engine_executor() creates a fresh pool.
+    """
+    global _engine_executor, _initialized
+
+    if _engine_executor is not None:
+        _engine_executor.shutdown(wait=True, cancel_futures=True)
+
+    _engine_executor = None
+    _initialized = False
+
+
+def _call_locked(
+    lock: AbstractContextManager, func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Call func while holding lock."""
+    with lock:
+        return func(*args, **kwargs)
+
+
+@contextmanager
+def engine_calls_inline() -> Iterator[None]:
+    """Run engine work started in this context on the current thread.
+
+    For code that is itself engine work holding the engine lock. Handing its
+    nested run_in_engine() calls to the pool would move them to threads that
+    cannot reenter that lock; inline, they reenter it, and their time is
+    already part of the enclosing call's engine time.
+    """
+    token = _inline_calls.set(True)
+    try:
+        yield
+    finally:
+        _inline_calls.reset(token)
+
+
+async def run_in_engine(
+    func: Callable[..., T],
+    /,
+    *args: Any,
+    lock: AbstractContextManager | None = None,
+    **kwargs: Any,
+) -> T:
+    """Run blocking engine work without blocking the event loop.
+
+    The call runs on the engine worker pool with the caller's context
+    variables. The request gives up waiting after the configured timeout;
+    the work itself cannot be interrupted and finishes in its worker. The
+    time spent waiting is added to the request's engine time (see
+    api/middleware.py).
+
+    Args:
+        func: The function to call.
+        *args: Positional arguments for func.
+        lock: Lock to hold while func runs, such as the engine's
+            operation_lock for reads that must see a consistent state.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        Whatever func returns.
+
+    Raises:
+        EngineTimeoutError: If the work did not finish within the timeout.
+    """
+    call = functools.partial(_call_locked, lock or nullcontext(), func, *args, **kwargs)
+    if _inline_calls.get():
+        return call()
+    start = time.perf_counter()
+
+    executor = get_engine_executor()
+    if executor is None:
+        try:
+            return call()
+        finally:
+            record_engine_time(time.perf_counter() - start)
+
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    future = loop.run_in_executor(executor, context.run, call)
+    try:
+        return await asyncio.wait_for(future, timeout=_engine_timeout)
+    except TimeoutError:
+        raise EngineTimeoutError(getattr(func, "__name__", repr(func)), _engine_timeout)
+    finally:
+        record_engine_time(time.perf_counter() - start)
+
@@ -0,0 +1,393 @@
+"""Request metrics middleware and slow-request log.
+
+RequestMetricsMiddleware records, for every sampled HTTP request, latency by
+route template, request and response body sizes, and the number of requests
+in flight, all in the shared metrics registry served at GET /metrics. It
+also keeps the N slowest requests, with their query parameters and a
+breakdown of where the time went, for GET /debug/slow-requests.
+
+The breakdown is collected through a context variable that lives for the
+duration of the request:
+- Engine time: wall time spent in run_in_engine(), including waiting for a
+  worker and for the engine lock.
+- Serialization time: from the endpoint returning to the last response body
+  byte being handed to the server, which covers response validation and
+  JSON/MessagePack encoding (and, for streaming responses, the stream).
+
+The middleware is configured from the environment:
+- UES_REQUEST_SAMPLE_RATE: Fraction of requests to record, from 0 to 1
+  (default 1). Unsampled requests are only counted in flight, so turning
+  this down makes the middleware close to free.
+- UES_SLOW_REQUEST_COUNT: Number of slowest requests to keep (default 50).
+"""
+
+import heapq
+import os
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from models.metrics import LATENCY_BUCKETS, REGISTRY, SIZE_BUCKETS
+
+DEFAULT_SAMPLE_RATE = 1.0
+DEFAULT_SLOW_REQUEST_COUNT = 50
+
+# Route label for requests that did not match any route
+UNMATCHED_ROUTE = "<unmatched>"
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "ues_http_request_duration_seconds",
+    "Time to handle an HTTP request, by route template.",
+    ("method", "route", "status"),
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUEST_BYTES = REGISTRY.histogram(
+    "ues_http_request_size_bytes",
+    "HTTP request body size.",
+    ("method", "route"),
+    buckets=SIZE_BUCKETS,
+)
+HTTP_RESPONSE_BYTES = REGISTRY.histogram(
+    "ues_http_response_size_bytes",
+    "HTTP response body size.",
+    ("method", "route"),
+    buckets=SIZE_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "ues_http_requests_in_flight",
+    "HTTP requests currently being handled.",
+)
+
+
+class RequestTiming:
+    """Where a request's time went, filled in while it is handled.
+
+    Attributes:
+        engine_seconds: Total wall time spent in run_in_engine().
+        endpoint_finished: perf_counter() value when the endpoint returned,
+            or None if it has not (or the route is not instrumented).
+    """
+
+    __slots__ = ("engine_seconds", "endpoint_finished")
+
+    def __init__(self) -> None:
+        self.engine_seconds = 0.0
+        self.endpoint_finished: float | None = None
+
+
+# Timing for the request being handled, or None if it is not sampled
+_request_timing: ContextVar[RequestTiming | None] = ContextVar(
+    "request_timing", default=None
+)
+
+
+def record_engine_time(seconds: float) -> None:
+    """Add engine time to the current request, if it is being sampled.
+
+    Args:
+        seconds: Wall time spent on engine work.
+    """
+    timing = _request_timing.get()
+    if timing is not None:
+        timing.engine_seconds += seconds
+
+
+def mark_endpoint_finished() -> None:
+    """Note that the current request's endpoint has returned its result."""
+    timing = _request_timing.get()
+    if timing is not None:
+        timing.endpoint_finished = time.perf_counter()
+
+
+@dataclass
+class SlowRequest:
+    """A request kept in the slow-request log.
+
+    Attributes:
+        method: HTTP method.
+        path: Request path as sent.
+        route: Matched route template.
+        query_params: Query string parameters.
+        status_code: Response status code.
+        duration_seconds: Total time to handle the request.
+        engine_seconds: Time spent on engine work.
+        serialization_seconds: Time from the endpoint returning to the
+            response being sent, or None if unknown.
+        request_bytes: Request body size.
+        response_bytes: Response body size.
+        started_at: Wall-clock time the request arrived.
+    """
+
+    method: str
+    path: str
+    route: str
+    query_params: dict[str, str]
+    status_code: int
+    duration_seconds: float
+    engine_seconds: float
+    serialization_seconds: float | None
+    request_bytes: int
+    response_bytes: int
+    started_at: datetime
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the entry as a dictionary."""
+        return asdict(self)
+
+
+class SlowRequestLog:
+    """Keeps the N slowest requests seen so far.
+
+    Backed by a min-heap of size N, so recording a request that is not
+    among the slowest costs one comparison.
+
+    Args:
+        capacity: Number of requests to keep. 0 keeps none.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_SLOW_REQUEST_COUNT) -> None:
+        self.capacity = capacity
+        self._heap: list[tuple[float, int, SlowRequest]] = []
+        self._counter = 0
+
+    def would_keep(self, duration: float) -> bool:
+        """Whether a request of this duration would enter the log."""
+        if len(self._heap) < self.capacity:
+            return True
+        return bool(self._heap) and duration > self._heap[0][0]
+
+    def record(self, entry: SlowRequest) -> None:
+        """Add a request, evicting the fastest one if the log is full.
+
+        Args:
+            entry: The request to record.
+        """
+        if not self.would_keep(entry.duration_seconds):
+            return
+        # The counter breaks ties so entries themselves are never compared
+        self._counter += 1
+        item = (entry.duration_seconds, self._counter, entry)
+        if len(self._heap) < self.capacity:
+            heapq.heappush(self._heap, item)
+        else:
+            heapq.heapreplace(self._heap, item)
+
+    def entries(self) -> list[SlowRequest]:
+        """Return the kept requests, slowest first."""
+        return [entry for _, _, entry in sorted(self._heap, reverse=True)]
+
+    def clear(self) -> None:
+        """Forget all recorded requests."""
+        self._heap.clear()
+
+
+def _read_env_number(name: str, default: float, maximum: float | None = None) -> float:
+    """Read a non-negative number from an environment variable.
+
+    Args:
+        name: Name of the environment variable.
+        default: Value to use when the variable is unset or empty.
+        maximum: Largest allowed value, if any.
+
+    Returns:
+        The configured value.
+
+    Raises:
+        ValueError: If the variable is not a number in range.
+    """
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {raw!r}")
+    if value < 0 or (maximum is not None and value > maximum):
+        raise ValueError(f"{name} is out of range, got {raw!r}")
+    return value
+
+
+def _content_length(scope: Scope) -> int | None:
+    """Return the request's Content-Length, or None if absent or invalid."""
+    for name, value in scope["headers"]:
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+# Global slow-request log, created on first use
+_slow_request_log: SlowRequestLog | None = None
+
+
+def get_slow_request_log() -> SlowRequestLog:
+    """Get the slow-request log, creating it from the environment if needed.
+
+    Returns:
+        The shared log.
+    """
+    global _slow_request_log
+
+    if _slow_request_log is None:
+        _slow_request_log = SlowRequestLog(
+            int(_read_env_number("UES_SLOW_REQUEST_COUNT", DEFAULT_SLOW_REQUEST_COUNT))
+        )
+    return _slow_request_log
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware that records per-route request metrics.
+
+    Args:
+        app: The ASGI application to wrap.
+        sample_rate: Fraction of requests to record, from 0 to 1. Read from
+            UES_REQUEST_SAMPLE_RATE when not given.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float | None = None) -> None:
+        self.app = app
+        if sample_rate is None:
+            sample_rate = _read_env_number(
+                "UES_REQUEST_SAMPLE_RATE", DEFAULT_SAMPLE_RATE, maximum=1.0
+            )
+        self.sample_rate = sample_rate
+
+    def _sampled(self) -> bool:
+        """Decide whether to record the next request."""
+        if self.sample_rate >= 1.0:
+            return True
+        return self.sample_rate > 0.0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            if self._sampled() and REGISTRY.enabled:
+                await self._handle_sampled(scope, receive, send)
+            else:
+                await self.app(scope, receive, send)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+
+    async def _handle_sampled(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request while measuring it.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        started_at = time.time()
+        start = time.perf_counter()
+        timing = RequestTiming()
+        token = _request_timing.set(timing)
+
+        request_bytes = _content_length(scope)
+        response_bytes = 0
+        status_code = 500
+        finished = start
+
+        async def counting_receive() -> Message:
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                request_bytes += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message: Message) -> None:
+            nonlocal response_bytes, status_code, finished
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+            finished = time.perf_counter()
+
+        # Count body chunks only when the client did not declare a length
+        if request_bytes is None:
+            request_bytes = 0
+        else:
+            counting_receive = receive
+
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            _request_timing.reset(token)
+            # If nothing was sent, the app raised and the server responds
+            if finished == start:
+                finished = time.perf_counter()
+            self._record(
+                scope,
+                started_at,
+                finished - start,
+                status_code,
+                request_bytes,
+                response_bytes,
+                timing,
+                finished,
+            )
+
+    def _record(
+        self,
+        scope: Scope,
+        started_at: float,
+        duration: float,
+        status_code: int,
+        request_bytes: int,
+        response_bytes: int,
+        timing: RequestTiming,
+        finished: float,
+    ) -> None:
+        """Record a measured request in the registry and slow-request log.
+
+        Args:
+            scope: The ASGI connection scope, after routing.
+            started_at: Wall-clock arrival time, as a Unix timestamp.
+            duration: Seconds from arrival to the last byte sent.
+            status_code: Response status code.
+            request_bytes: Request body size.
+            response_bytes: Response body size.
+            timing: Engine and endpoint timing collected during the request.
+            finished: perf_counter() value when the last byte was sent.
+        """
+        method = scope["method"]
+        route = scope.get("route")
+        route_path = getattr(route, "path", None) or UNMATCHED_ROUTE
+
+        HTTP_REQUEST_SECONDS.labels(method, route_path, str(status_code)).observe(duration)
+        HTTP_REQUEST_BYTES.labels(method, route_path).observe(request_bytes)
+        HTTP_RESPONSE_BYTES.labels(method, route_path).observe(response_bytes)
+
+        slow_requests = get_slow_request_log()
+        if not slow_requests.would_keep(duration):
+            return
+
+        serialization = None
+        if timing.endpoint_finished is not None:
+            serialization = max(0.0, finished - timing.endpoint_finished)
+        slow_requests.record(
+            SlowRequest(
+                method=method,
+                path=scope["path"],
+                route=route_path,
+                query_params=dict(parse_qsl(scope["query_string"].decode("latin-1"))),
+                status_code=status_code,
+                duration_seconds=duration,
+                engine_seconds=timing.engine_seconds,
+                serialization_seconds=serialization,
+                request_bytes=request_bytes,
+                response_bytes=response_bytes,
+                started_at=datetime.fromtimestamp(started_at, timezone.utc),
+            )
+        )
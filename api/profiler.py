@@ -0,0 +1,169 @@
+"""Sampling profiler for the running server.
+
+A stack sampler built on sys._current_frames(), so it needs nothing beyond
+the standard library and can be pointed at a live server without attaching
+a debugger. While it runs, a background thread periodically captures the
+stacks of the threads that do UES work:
+- event-loop: the asyncio loop that runs route handlers
+- simulation-loop: the auto-advance thread (SimulationLoop)
+- engine-worker: the engine worker pool (see api/executor.py)
+
+Each sample is reduced to the thread label followed by the UES frames on its
+stack (modules under api. and models., plus main), root first. Library code
+is not listed frame by frame; time spent in it is attributed to a final
+[package] frame naming the library at the top of the stack, such as
+[pydantic] or [json]. Samples are aggregated into collapsed-stack lines
+("frame;frame;frame count") that flamegraph.pl and speedscope read directly.
+
+The profiler is disabled by default. Set UES_ENABLE_PROFILER=1 to allow
+POST /debug/profile.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+from api.executor import ENGINE_THREAD_NAME_PREFIX
+from models.simulation import SIMULATION_LOOP_THREAD_NAME
+
+# Modules whose frames are kept in collapsed stacks
+PROJECT_MODULE_PREFIXES = ("api.", "models.")
+PROJECT_MODULES = frozenset({"main"})
+
+# Thread labels used as the root frame of each stack
+EVENT_LOOP_LABEL = "event-loop"
+SIMULATION_LOOP_LABEL = "simulation-loop"
+ENGINE_WORKER_LABEL = "engine-worker"
+
+# Only one profile may run at a time
+_profile_lock = threading.Lock()
+
+
+def profiler_enabled() -> bool:
+    """Whether POST /debug/profile is allowed, from UES_ENABLE_PROFILER.
+
+    Returns:
+        True if UES_ENABLE_PROFILER is set to 1, true, yes, or on.
+    """
+    value = os.environ.get("UES_ENABLE_PROFILER", "")
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _is_project_module(module: str) -> bool:
+    """Whether a module's frames belong in collapsed stacks."""
+    return module.startswith(PROJECT_MODULE_PREFIXES) or module in PROJECT_MODULES
+
+
+def collapse_stack(label: str, frame: FrameType) -> str:
+    """Reduce a thread's stack to a collapsed-stack key.
+
+    Args:
+        label: Thread label used as the root frame.
+        frame: The innermost frame of the thread.
+
+    Returns:
+        Semicolon-separated frames, root first: the label, each UES frame as
+        module:qualname, and a [package] frame if the innermost frame is
+        library code.
+    """
+    names = []
+    leaf_package = None
+    current: FrameType | None = frame
+    while current is not None:
+        module = current.f_globals.get("__name__", "?")
+        if _is_project_module(module):
+            names.append(f"{module}:{current.f_code.co_qualname}")
+        elif not names and leaf_package is None:
+            leaf_package = f"[{module.partition('.')[0]}]"
+        current = current.f_back
+
+    names.reverse()
+    if leaf_package is not None:
+        names.append(leaf_package)
+    return ";".join([label, *names])
+
+
+def format_collapsed(counts: Counter[str]) -> str:
+    """Format aggregated stacks as collapsed-stack text.
+
+    Args:
+        counts: Number of samples per collapsed stack.
+
+    Returns:
+        One "stack count" line per stack, most frequent first.
+    """
+    return "".join(f"{stack} {count}\n" for stack, count in counts.most_common())
+
+
+class StackSampler:
+    """Periodically samples the stacks of UES threads.
+
+    Args:
+        event_loop_thread: Ident of the thread running the asyncio loop.
+        interval: Seconds between samples.
+    """
+
+    def __init__(self, event_loop_thread: int, interval: float = 0.01) -> None:
+        self.event_loop_thread = event_loop_thread
+        self.interval = interval
+        self.samples = 0
+
+    def _thread_labels(self) -> dict[int, str]:
+        """Map the idents of threads to sample to their labels."""
+        labels = {self.event_loop_thread: EVENT_LOOP_LABEL}
+        for thread in threading.enumerate():
+            if thread.name == SIMULATION_LOOP_THREAD_NAME:
+                labels[thread.ident] = SIMULATION_LOOP_LABEL
+            elif thread.name.startswith(ENGINE_THREAD_NAME_PREFIX):
+                labels[thread.ident] = ENGINE_WORKER_LABEL
+        return labels
+
+    def run(self, seconds: float) -> Counter[str]:
+        """Sample for a period of time on the calling thread.
+
+        Threads that start while sampling (new pool workers, a restarted
+        simulation loop) are picked up as they appear.
+
+        Args:
+            seconds: How long to sample for.
+
+        Returns:
+            Number of samples per collapsed stack.
+        """
+        counts: Counter[str] = Counter()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            labels = self._thread_labels()
+            for ident, frame in sys._current_frames().items():
+                label = labels.get(ident)
+                if label is not None:
+                    counts[collapse_stack(label, frame)] += 1
+            self.samples += 1
+            time.sleep(self.interval)
+        return counts
+
+
+def profile(event_loop_thread: int, seconds: float, interval: float = 0.01) -> str | None:
+    """Run the sampler and return collapsed stacks, one profile at a time.
+
+    Blocks for the whole period, so call it from a thread other than the
+    event loop.
+
+    Args:
+        event_loop_thread: Ident of the thread running the asyncio loop.
+        seconds: How long to sample for.
+        interval: Seconds between samples.
+
+    Returns:
+        Collapsed-stack text, or None if another profile is already running.
+    """
+    if not _profile_lock.acquire(blocking=False):
+        return None
+    try:
+        sampler = StackSampler(event_loop_thread, interval)
+        return format_collapsed(sampler.run(seconds))
+    finally:
+        _profile_lock.release()
@@ -2,3 +2,46 @@
 
 Each module in this package corresponds to a group of related endpoints.
 """
+
+from api.routes import (
+    batch,
+    calendar,
+    chat,
+    debug,
+    discord,
+    email,
+    environment,
+    events,
+    filesystem,
+    location,
+    metrics,
+    screen,
+    simulation,
+    slack,
+    sms,
+    social,
+    time,
+    weather,
+)
+
+# Routers served by the application, in registration order
+ROUTERS = [
+    time.router,
+    environment.router,
+    events.router,
+    simulation.router,
+    weather.router,
+    email.router,
+    sms.router,
+    chat.router,
+    calendar.router,
+    location.router,
+    filesystem.router,
+    slack.router,
+    discord.router,
+    social.router,
+    screen.router,
+    metrics.router,
+    debug.router,
+    batch.router,
+]
@@ -0,0 +1,113 @@
+"""Batch endpoint for running several API requests in one round-trip.
+
+Agents often issue bursts of small calls (mark a few emails read, fetch the
+SMS state, fetch the calendar window). Each one pays for a round-trip, the
+HTTP stack and an engine lock acquisition of its own. POST /batch takes an
+ordered list of sub-requests and runs them all as one piece of engine work
+holding the engine's write lock once, so they also see no simulation changes
+from other clients in between.
+
+Sub-requests are served by api.embedded.EmbeddedAPI, so their results and
+error bodies are the ones the individual endpoints return. A failing
+sub-request does not stop the ones after it.
+"""
+
+from typing import Any, Literal
+
+from fastapi import APIRouter
+from pydantic import BaseModel, Field
+
+from api.dependencies import SimulationEngineDep
+from api.embedded import EmbeddedAPI
+from api.executor import run_in_engine
+from api.wire_format import MessagePackRoute
+
+# Most sub-requests per batch; a batch holds off every other request while it runs
+MAX_BATCH_REQUESTS = 1000
+
+# Create router for the batch endpoint
+router = APIRouter(
+    tags=["batch"],
+    route_class=MessagePackRoute,
+)
+
+
+# Request/Response Models
+
+
+class BatchRequestItem(BaseModel):
+    """A single request within a batch.
+
+    Attributes:
+        method: The HTTP method.
+        path: The URL path, without query string.
+        params: Query parameters.
+        body: The JSON request body, if any.
+    """
+
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
+    path: str = Field(..., pattern="^/", description="URL path, e.g. /email/state")
+    params: dict[str, Any] | None = None
+    body: Any = None
+
+
+class BatchRequest(BaseModel):
+    """Request model for running a batch.
+
+    Attributes:
+        requests: The requests to run, in order.
+    """
+
+    requests: list[BatchRequestItem] = Field(..., max_length=MAX_BATCH_REQUESTS)
+
+
+class BatchResult(BaseModel):
+    """The response to a single request within a batch.
+
+    Attributes:
+        status_code: HTTP status code the request would have received.
+        body: The response body.
+    """
+
+    status_code: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    """Response model for a batch.
+
+    Attributes:
+        responses: One response per request, in request order.
+    """
+
+    responses: list[BatchResult]
+
+
+# Route Handlers
+
+
+@router.post("/batch", response_model=BatchResponse)
+async def run_batch(request: BatchRequest, engine: SimulationEngineDep):
+    """Run several API requests in order as one engine operation.
+
+    The sub-requests run one after another under a single acquisition of
+    the engine's write lock. Each gets the status code and body it would
+    have received on its own; a failing sub-request does not stop the rest.
+    Sub-requests that stream their response or wait on something other than
+    the engine (profiles) cannot be batched and get 400.
+
+    Args:
+        request: The sub-requests to run.
+        engine: The simulation engine (injected).
+
+    Returns:
+        The response to each sub-request, in order.
+    """
+    results = await run_in_engine(
+        EmbeddedAPI(engine).run_batch,
+        [(item.method, item.path, item.params, item.body) for item in request.requests],
+        lock=engine.operation_lock.write(),
+    )
+    return BatchResponse(
+        responses=[BatchResult(status_code=code, body=body) for code, body in results]
+    )
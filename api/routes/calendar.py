@@ -5,14 +5,17 @@ deleting, and querying calendar data.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field, ValidationError
 
 from api.dependencies import SimulationEngineDep
+from api.exceptions import EngineTimeoutError
+from api.executor import run_in_engine
 from api.models import ModalityActionResponse
 from api.utils import create_immediate_event
+from api.wire_format import MessagePackRoute, unvalidated_response
 from models.modalities.calendar_input import (
     Attendee,
     AttendeeResponse,
@@ -26,10 +29,12 @@ from models.modalities.calendar_input import (
     Reminder,
 )
 from models.modalities.calendar_state import CalendarEvent, CalendarState
+from models.projection import validate_fields
 
 router = APIRouter(
     prefix="/calendar",
     tags=["calendar"],
+    route_class=MessagePackRoute,
 )
 
 
@@ -206,6 +211,8 @@ class CalendarQueryRequest(BaseModel):
         offset: Number of results to skip (pagination).
         sort_by: Field to sort by.
         sort_order: Sort order.
+        fields: Only return these CalendarEvent fields for each result.
+        cursor: Resume after the position in a previous response's next_cursor.
     """
 
     calendar_ids: Optional[list[str]] = Field(
@@ -226,6 +233,12 @@ class CalendarQueryRequest(BaseModel):
     offset: int = Field(default=0, description="Pagination offset")
     sort_by: str = Field(default="start", description="Sort field")
     sort_order: str = Field(default="asc", description="Sort order")
+    fields: Optional[list[str]] = Field(
+        default=None, description="CalendarEvent fields to include (default: all)"
+    )
+    cursor: Optional[str] = Field(
+        default=None, description="Cursor from a previous response's next_cursor"
+    )
 
 
 # TODO: Invitation response not implemented in CalendarInput/CalendarState
@@ -275,15 +288,32 @@ class CalendarQueryResponse(BaseModel):
 
     Args:
         modality_type: Always "calendar".
-        events: List of CalendarEvent objects matching query.
+        events: List of CalendarEvent objects matching query. Partial dicts
+            containing only the requested fields when the query used a projection.
         count: Number of events returned.
-        total_count: Total matching events.
+        total_count: Total matching events. None for pages fetched with a
+            cursor, which do not scan every match.
+        next_cursor: Cursor for the next page, or None if there are no more
+            results.
     """
 
     modality_type: str = "calendar"
-    events: list[CalendarEvent]
+    events: list[CalendarEvent] | list[dict[str, Any]] = Field(union_mode="left_to_right")
     count: int
-    total_count: int
+    total_count: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+class ProjectedCalendarQueryResponse(CalendarQueryResponse):
+    """CalendarQueryResponse for a query that used a projection.
+
+    Its events are the partial dicts produced by the projection. Routes
+    return it with unvalidated_response(), because validating it as a
+    CalendarQueryResponse would turn dicts naming every required field into full
+    events with the unrequested fields filled in.
+    """
+
+    events: list[dict[str, Any]]
 
 
 # Route Handlers
@@ -311,8 +341,12 @@ async def get_calendar_state(engine: SimulationEngineDep):
                 status_code=500, detail="Calendar state not properly initialized"
             )
 
-        snapshot = calendar_state.get_snapshot()
+        snapshot = await run_in_engine(
+            calendar_state.get_snapshot, lock=engine.operation_lock.read()
+        )
         return CalendarStateResponse(**snapshot)
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to get calendar state: {str(e)}"
@@ -326,6 +360,10 @@ async def query_calendar(request: CalendarQueryRequest, engine: SimulationEngine
     Allows filtering and searching calendar events by various criteria including
     date range, status, attendees, recurrence, and text search.
 
+    Paged responses include a next_cursor. Sending it back as cursor fetches
+    the following page from a sorted index rather than re-filtering and
+    re-sorting every event.
+
     Args:
         request: Query parameters including filters and pagination.
         engine: Simulation engine dependency.
@@ -334,8 +372,14 @@ async def query_calendar(request: CalendarQueryRequest, engine: SimulationEngine
         Matching events with pagination info.
 
     Raises:
-        HTTPException: If query fails.
+        HTTPException: If the requested fields or cursor are invalid or the
+            query fails.
     """
+    try:
+        fields = validate_fields(request.fields, CalendarEvent)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         calendar_state = engine.environment.get_state("calendar")
         if not isinstance(calendar_state, CalendarState):
@@ -356,14 +400,32 @@ async def query_calendar(request: CalendarQueryRequest, engine: SimulationEngine
             "offset": request.offset,
             "sort_by": request.sort_by,
             "sort_order": request.sort_order,
+            "fields": fields,
+            "cursor": request.cursor,
         }
 
-        results = calendar_state.query(query_params)
+        results = await run_in_engine(
+            calendar_state.query, query_params, lock=engine.operation_lock.read()
+        )
+        if fields is not None:
+            return unvalidated_response(
+                ProjectedCalendarQueryResponse(
+                    events=results["events"],
+                    count=results["count"],
+                    total_count=results["total_count"],
+                    next_cursor=results["next_cursor"],
+                )
+            )
         return CalendarQueryResponse(
-            events=results["events"],
+            events=[event.to_model() for event in results["events"]],
             count=results["count"],
             total_count=results["total_count"],
+            next_cursor=results["next_cursor"],
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to query calendar: {str(e)}"
@@ -417,10 +479,10 @@ async def create_calendar_event(
         )
 
         # Validate and auto-generate event_id
-        calendar_input.validate_input()
+        calendar_input.ensure_valid()
 
         # Create and execute immediate event
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="calendar",
             data=calendar_input,
@@ -434,6 +496,8 @@ async def create_calendar_event(
             message=f"Created calendar event: {request.title} (calendar_event_id: {calendar_input.event_id})",
             modality="calendar",
         )
+    except EngineTimeoutError:
+        raise
     except ValidationError as e:
         # Pydantic validation failed
         raise HTTPException(status_code=422, detail=f"Validation error: {str(e)}")
@@ -495,10 +559,10 @@ async def update_calendar_event(
         calendar_input = CalendarInput(**input_kwargs)
 
         # Validate
-        calendar_input.validate_input()
+        calendar_input.ensure_valid()
 
         # Create and execute immediate event
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="calendar",
             data=calendar_input,
@@ -512,6 +576,8 @@ async def update_calendar_event(
             message=f"Updated calendar event: {request.event_id}",
             modality="calendar",
         )
+    except EngineTimeoutError:
+        raise
     except ValidationError as e:
         # Pydantic validation failed
         raise HTTPException(status_code=422, detail=f"Validation error: {str(e)}")
@@ -558,10 +624,10 @@ async def delete_calendar_event(
         )
 
         # Validate
-        calendar_input.validate_input()
+        calendar_input.ensure_valid()
 
         # Create and execute immediate event
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="calendar",
             data=calendar_input,
@@ -575,6 +641,8 @@ async def delete_calendar_event(
             message=f"Deleted calendar event: {request.event_id}",
             modality="calendar",
         )
+    except EngineTimeoutError:
+        raise
     except ValidationError as e:
         # Pydantic validation failed
         raise HTTPException(status_code=422, detail=f"Validation error: {str(e)}")
@@ -6,20 +6,25 @@ conversation state.
 """
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from api.dependencies import SimulationEngineDep
+from api.exceptions import EngineTimeoutError
+from api.executor import run_in_engine
 from api.models import ModalityActionResponse
 from api.utils import create_immediate_event
+from api.wire_format import MessagePackRoute, unvalidated_response
 from models.modalities.chat_input import ChatInput
 from models.modalities.chat_state import ChatMessage, ConversationMetadata, ChatState
+from models.projection import validate_fields
 
 router = APIRouter(
     prefix="/chat",
     tags=["chat"],
+    route_class=MessagePackRoute,
 )
 
 
@@ -88,6 +93,7 @@ class ChatQueryRequest(BaseModel):
         offset: Number of results to skip (for pagination).
         sort_by: Field to sort by.
         sort_order: Sort direction ("asc" or "desc").
+        fields: Only return these ChatMessage fields for each result.
     """
 
     conversation_id: str | None = Field(
@@ -115,6 +121,10 @@ class ChatQueryRequest(BaseModel):
     sort_order: Literal["asc", "desc"] | None = Field(
         default="asc", description="Sort direction"
     )
+    fields: list[str] | None = Field(
+        default=None,
+        description="ChatMessage fields to include in each result (default: all fields)",
+    )
 
 
 # ============================================================================
@@ -149,19 +159,61 @@ class ChatQueryResponse(BaseModel):
 
     Attributes:
         modality_type: Always "chat".
-        messages: Query results (matching messages).
+        messages: Query results (matching messages). Partial dicts containing
+            only the requested fields when the query used a projection.
         total_count: Total number of results matching query.
         returned_count: Number of results returned (after pagination).
         query: Echo of query parameters for debugging.
     """
 
     modality_type: str = Field(default="chat")
-    messages: list[ChatMessage]
+    messages: list[ChatMessage] | list[dict[str, Any]] = Field(union_mode="left_to_right")
     total_count: int
     returned_count: int
     query: dict
 
 
+class ProjectedChatQueryResponse(ChatQueryResponse):
+    """ChatQueryResponse for a query that used a projection.
+
+    Its messages are the partial dicts produced by the projection. Routes
+    return it with unvalidated_response(), because validating it as a
+    ChatQueryResponse would turn dicts naming every required field into full
+    messages with the unrequested fields filled in.
+    """
+
+    messages: list[dict[str, Any]]
+
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+
+def _build_chat_state_response(
+    chat_state: ChatState, current_time: datetime
+) -> ChatStateResponse:
+    """Build the chat state response.
+
+    Runs under the engine's read lock so the snapshot is consistent.
+
+    Args:
+        chat_state: The chat state to snapshot.
+        current_time: Current simulator time.
+
+    Returns:
+        The chat state response.
+    """
+    return ChatStateResponse(
+        current_time=current_time,
+        conversations=chat_state.conversations,
+        messages=[message.to_model() for message in chat_state.messages],
+        total_message_count=len(chat_state.messages),
+        conversation_count=len(chat_state.conversations),
+        max_history_size=chat_state.max_history_size,
+    )
+
+
 # ============================================================================
 # Route Handlers
 # ============================================================================
@@ -187,13 +239,11 @@ async def get_chat_state(engine: SimulationEngineDep) -> ChatStateResponse:
             detail="Chat state not properly initialized",
         )
 
-    return ChatStateResponse(
-        current_time=engine.environment.time_state.current_time,
-        conversations=chat_state.conversations,
-        messages=chat_state.messages,
-        total_message_count=len(chat_state.messages),
-        conversation_count=len(chat_state.conversations),
-        max_history_size=chat_state.max_history_size,
+    return await run_in_engine(
+        _build_chat_state_response,
+        chat_state,
+        engine.environment.time_state.current_time,
+        lock=engine.operation_lock.read(),
     )
 
 
@@ -213,6 +263,11 @@ async def query_chat(
     Returns:
         Filtered message results with counts.
     """
+    try:
+        fields = validate_fields(request.fields, ChatMessage)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     chat_state = engine.environment.get_state("chat")
 
     if not isinstance(chat_state, ChatState):
@@ -241,9 +296,24 @@ async def query_chat(
         query_params["sort_by"] = request.sort_by
     if request.sort_order:
         query_params["sort_order"] = request.sort_order
+    if fields is not None:
+        query_params["fields"] = fields
 
     # Execute query using ChatState's built-in query method
-    result = chat_state.query(query_params)
+    result = await run_in_engine(
+        chat_state.query, query_params, lock=engine.operation_lock.read()
+    )
+
+    # Projected results are already partial dicts; return them as-is
+    if fields is not None:
+        return unvalidated_response(
+            ProjectedChatQueryResponse(
+                messages=result["messages"],
+                total_count=result["total_count"],
+                returned_count=result["count"],
+                query=request.model_dump(exclude_none=True),
+            )
+        )
 
     # Convert message dicts back to ChatMessage objects for response
     messages = [
@@ -294,7 +364,7 @@ async def send_chat_message(
         )
 
         # Create and add event
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="chat",
             data=chat_input,
@@ -308,6 +378,8 @@ async def send_chat_message(
             message=f"Chat message sent from {request.role}",
             modality="chat",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -339,7 +411,7 @@ async def delete_chat_message(
         )
 
         # Create and add event
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="chat",
             data=chat_input,
@@ -353,6 +425,8 @@ async def delete_chat_message(
             message=f"Deleted message {request.message_id}",
             modality="chat",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -384,7 +458,7 @@ async def clear_conversation(
         )
 
         # Create and add event
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="chat",
             data=chat_input,
@@ -398,6 +472,8 @@ async def clear_conversation(
             message=f"Cleared conversation {request.conversation_id}",
             modality="chat",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -0,0 +1,141 @@
+"""Debugging and diagnostics endpoints.
+
+These endpoints help find out why a running server is slow. They report on
+the server itself rather than on the simulation.
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
+
+from api.middleware import get_slow_request_log
+from api.profiler import profile, profiler_enabled
+from api.wire_format import MessagePackRoute
+
+# Create router for debugging endpoints
+router = APIRouter(
+    prefix="/debug",
+    tags=["debug"],
+    route_class=MessagePackRoute,
+)
+
+
+# Response Models
+
+
+class SlowRequestEntry(BaseModel):
+    """A request from the slow-request log.
+
+    Attributes:
+        method: HTTP method.
+        path: Request path as sent.
+        route: Matched route template.
+        query_params: Query string parameters.
+        status_code: Response status code.
+        duration_seconds: Total time to handle the request.
+        engine_seconds: Time spent on engine work, including waiting for a
+            worker and the engine lock.
+        serialization_seconds: Time from the endpoint returning to the
+            response being sent, or None if unknown.
+        request_bytes: Request body size.
+        response_bytes: Response body size.
+        started_at: Wall-clock time the request arrived.
+    """
+
+    method: str
+    path: str
+    route: str
+    query_params: dict[str, str]
+    status_code: int
+    duration_seconds: float
+    engine_seconds: float
+    serialization_seconds: float | None
+    request_bytes: int
+    response_bytes: int
+    started_at: datetime
+
+
+class SlowRequestsResponse(BaseModel):
+    """Response model for the slow-request log.
+
+    Attributes:
+        capacity: Number of requests the log keeps.
+        requests: The slowest requests seen, slowest first.
+    """
+
+    capacity: int
+    requests: list[SlowRequestEntry] = Field(
+        description="Slowest sampled requests, slowest first"
+    )
+
+
+# Route Handlers
+
+
+@router.get("/slow-requests", response_model=SlowRequestsResponse)
+async def get_slow_requests(
+    limit: int | None = Query(default=None, ge=1, description="Maximum entries to return"),
+):
+    """Get the slowest requests the server has handled.
+
+    Only sampled requests are considered (see UES_REQUEST_SAMPLE_RATE). Each
+    entry splits the request's time into engine work and serialization, so
+    expensive calls can be told apart from expensive responses.
+
+    Args:
+        limit: Maximum number of entries to return.
+
+    Returns:
+        SlowRequestsResponse with the log's capacity and entries.
+    """
+    slow_requests = get_slow_request_log()
+    entries = slow_requests.entries()[:limit]
+    return SlowRequestsResponse(
+        capacity=slow_requests.capacity,
+        requests=[SlowRequestEntry(**entry.to_dict()) for entry in entries],
+    )
+
+
+@router.post("/profile", response_class=PlainTextResponse)
+async def profile_server(
+    seconds: float = Query(default=5.0, gt=0, le=60, description="How long to sample"),
+    interval: float = Query(
+        default=0.01, ge=0.001, le=1.0, description="Seconds between samples"
+    ),
+):
+    """Sample the server's stacks and return them as collapsed stacks.
+
+    Samples the event loop, the auto-advance thread, and the engine worker
+    pool for the requested period, then returns flamegraph-ready
+    collapsed-stack text. Frames are reduced to UES modules (api.*,
+    models.*), with library time attributed to a final [package] frame.
+    Disabled unless UES_ENABLE_PROFILER is set.
+
+    Args:
+        seconds: How long to sample for.
+        interval: Seconds between samples.
+
+    Returns:
+        Plain text with one "frame;frame;frame count" line per stack.
+
+    Raises:
+        HTTPException: 403 if the profiler is disabled, 409 if a profile is
+            already running.
+    """
+    if not profiler_enabled():
+        raise HTTPException(
+            status_code=403,
+            detail="Profiler is disabled. Set UES_ENABLE_PROFILER=1 to enable it.",
+        )
+
+    # Sample from a separate thread so the event loop itself can be sampled
+    collapsed = await asyncio.to_thread(
+        profile, threading.get_ident(), seconds, interval
+    )
+    if collapsed is None:
+        raise HTTPException(status_code=409, detail="A profile is already running.")
+    return PlainTextResponse(collapsed)
@@ -0,0 +1,43 @@
+"""Discord modality endpoints.
+
+Provides REST API access to Discord channels, messages, threads, mentions and
+read state. The endpoints are shared with the other team chat modality; see
+api/routes/team_chat.py.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter
+from pydantic import BaseModel, Field
+
+from api.routes.team_chat import add_team_chat_routes
+from api.wire_format import MessagePackRoute
+from models.modalities.discord_input import DiscordInput
+from models.modalities.discord_state import DiscordState
+
+router = APIRouter(
+    prefix="/discord",
+    tags=["discord"],
+    route_class=MessagePackRoute,
+)
+
+
+class CreateDiscordChannelRequest(BaseModel):
+    """Request to create a Discord channel.
+
+    Args:
+        channel_id: Channel ID.
+        channel_name: Display name (defaults to the ID).
+        server_id: Discord server the channel belongs to.
+        topic: Channel topic.
+        is_private: Whether the channel is private.
+    """
+
+    channel_id: str = Field(description="Channel ID")
+    channel_name: Optional[str] = Field(default=None, description="Display name")
+    server_id: Optional[str] = Field(default=None, description="Discord server ID")
+    topic: Optional[str] = Field(default=None, description="Channel topic")
+    is_private: bool = Field(default=False, description="Whether the channel is private")
+
+
+add_team_chat_routes(router, "discord", DiscordState, DiscordInput, CreateDiscordChannelRequest)
@@ -5,21 +5,36 @@ reading, organizing, and querying email messages. Supports full email lifecycle
 from composition to archival/deletion.
 """
 
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field, field_validator
+from fastapi import APIRouter, Header, HTTPException
+from pydantic import BaseModel, Field
 
 from api.dependencies import SimulationEngineDep
+from api.exceptions import EngineTimeoutError
+from api.executor import run_in_engine
 from api.models import ModalityActionResponse, ModalityStateResponse
+from api.streaming import (
+    JSONObjectStream,
+    LockedRows,
+    accepts_ndjson,
+    locked_mapping_items,
+    ndjson_response,
+    streaming_json_response,
+)
 from api.utils import create_immediate_event
+from api.wire_format import MessagePackRoute, unvalidated_response
 from models.modalities.email_input import EmailInput
+from models.projection import project, validate_fields
 from models.modalities.email_state import Email, EmailState, EmailSummary, EmailThread
 
 router = APIRouter(
     prefix="/email",
     tags=["email"],
+    route_class=MessagePackRoute,
 )
 
 
@@ -179,6 +194,9 @@ class EmailQueryRequest(BaseModel):
         offset: Number of results to skip (for pagination).
         sort_by: Field to sort by.
         sort_order: Sort direction ("asc" or "desc").
+        fields: Only return these Email fields for each result.
+        cursor: Resume after the position in a previous response's
+            next_cursor (cannot be combined with offset).
     """
 
     folder: str | None = Field(default=None, description="Filter by folder name")
@@ -225,6 +243,13 @@ class EmailQueryRequest(BaseModel):
     sort_order: Literal["asc", "desc"] | None = Field(
         default="desc", description="Sort direction"
     )
+    fields: list[str] | None = Field(
+        default=None,
+        description="Email fields to include in each result (default: all fields)",
+    )
+    cursor: str | None = Field(
+        default=None, description="Cursor from a previous response's next_cursor"
+    )
 
 
 # ============================================================================
@@ -291,19 +316,150 @@ class EmailQueryResponse(BaseModel):
 
     Attributes:
         modality_type: Always "email".
-        emails: Query results (matching emails).
-        total_count: Total number of results matching query.
+        emails: Query results (matching emails). Partial dicts containing
+            only the requested fields when the query used a projection.
+        total_count: Total number of results matching query. None for pages
+            fetched with a cursor, which do not scan every match.
         returned_count: Number of results returned (after pagination).
+        next_cursor: Cursor for the next page, or None if there are no more
+            results.
         query: Echo of query parameters for debugging.
     """
 
     modality_type: str = Field(default="email")
-    emails: list[Email]
-    total_count: int
+    emails: list[Email] | list[dict[str, Any]] = Field(union_mode="left_to_right")
+    total_count: int | None
     returned_count: int
+    next_cursor: str | None = None
     query: dict
 
 
+class ProjectedEmailQueryResponse(EmailQueryResponse):
+    """EmailQueryResponse for a query that used a projection.
+
+    Its emails are the partial dicts produced by the projection. Routes
+    return it with unvalidated_response(), because validating it as an
+    EmailQueryResponse would turn dicts naming every required field into full
+    emails with the unrequested fields filled in.
+    """
+
+    emails: list[dict[str, Any]]
+
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+
+def _count_emails(email_state: EmailState) -> dict[str, Any]:
+    """Count emails per folder and label and by read and starred status.
+
+    Args:
+        email_state: The email state to count.
+
+    Returns:
+        Dict with folders and labels (name to count), unread_count, and
+        starred_count.
+    """
+    return {
+        "folders": {
+            folder: len(message_ids)
+            for folder, message_ids in email_state.folders.items()
+        },
+        "labels": {
+            label: len(message_ids) for label, message_ids in email_state.labels.items()
+        },
+        "unread_count": sum(
+            1 for email in email_state.emails.values() if not email.is_read
+        ),
+        "starred_count": sum(
+            1 for email in email_state.emails.values() if email.is_starred
+        ),
+    }
+
+
+def _build_email_state_response(
+    email_state: EmailState, current_time: datetime, summary: bool
+) -> EmailStateResponse | EmailSummaryStateResponse:
+    """Build the full or summary email state response.
+
+    Runs under the engine's read lock so the snapshot is consistent.
+
+    Args:
+        email_state: The email state to snapshot.
+        current_time: Current simulator time.
+        summary: If True, build compact summaries without email bodies.
+
+    Returns:
+        The email state response.
+    """
+    if summary:
+        summary_data = email_state.get_summary_data()
+        return EmailSummaryStateResponse(
+            current_time=current_time,
+            user_email_address=summary_data["user_email_address"],
+            statistics=summary_data["statistics"],
+            folders=summary_data["folders"],
+            labels=summary_data["labels"],
+            emails=summary_data["emails"],
+            threads=summary_data["threads"],
+        )
+
+    counts = _count_emails(email_state)
+    return EmailStateResponse(
+        current_time=current_time,
+        user_email_address=email_state.user_email_address,
+        emails={
+            message_id: email.to_model()
+            for message_id, email in email_state.emails.items()
+        },
+        threads=email_state.threads,
+        folders=counts["folders"],
+        labels=counts["labels"],
+        total_email_count=len(email_state.emails),
+        unread_count=counts["unread_count"],
+        starred_count=counts["starred_count"],
+    )
+
+
+def _stream_email_state(
+    email_state: EmailState,
+    current_time: datetime,
+    lock: Callable[[], AbstractContextManager],
+) -> dict[str, Any]:
+    """Build the full email state document for streaming.
+
+    Runs under the engine's read lock. Counts are taken here; emails and
+    threads are copied out in batches, each under lock(), as the response
+    is encoded.
+
+    Args:
+        email_state: The email state to snapshot.
+        current_time: Current simulator time.
+        lock: Factory for the lock to hold while a batch is copied.
+
+    Returns:
+        The document to encode, shaped like EmailStateResponse.
+    """
+    counts = _count_emails(email_state)
+    return {
+        "modality_type": "email",
+        "current_time": current_time,
+        "user_email_address": email_state.user_email_address,
+        "emails": JSONObjectStream(
+            locked_mapping_items(
+                email_state.emails, lock, build=lambda email: email.to_model()
+            )
+        ),
+        "threads": JSONObjectStream(locked_mapping_items(email_state.threads, lock)),
+        "folders": counts["folders"],
+        "labels": counts["labels"],
+        "total_email_count": len(email_state.emails),
+        "unread_count": counts["unread_count"],
+        "starred_count": counts["starred_count"],
+    }
+
+
 # ============================================================================
 # Route Handlers
 # ============================================================================
@@ -313,6 +469,7 @@ class EmailQueryResponse(BaseModel):
 async def get_email_state(
     engine: SimulationEngineDep,
     summary: bool = False,
+    stream: bool = False,
 ) -> EmailStateResponse | EmailSummaryStateResponse:
     """Get current email state.
 
@@ -323,6 +480,10 @@ async def get_email_state(
         engine: The simulation engine dependency.
         summary: If True, return compact summaries without full email body
             content. Useful for getting an overview without large payloads.
+        stream: If True, encode the full state incrementally as chunked JSON.
+            The document is identical to the non-streaming response, but
+            emails and threads are serialized one at a time so memory use
+            stays bounded for very large mailboxes. Ignored if summary=True.
 
     Returns:
         Complete email state with all messages, or summary if summary=True.
@@ -336,61 +497,55 @@ async def get_email_state(
         )
 
     current_time = engine.environment.time_state.current_time
-
-    # Return summary response if requested
-    if summary:
-        summary_data = email_state.get_summary_data()
-        return EmailSummaryStateResponse(
-            current_time=current_time,
-            user_email_address=summary_data["user_email_address"],
-            statistics=summary_data["statistics"],
-            folders=summary_data["folders"],
-            labels=summary_data["labels"],
-            emails=summary_data["emails"],
-            threads=summary_data["threads"],
+    read_lock = engine.operation_lock.read()
+
+    if stream and not summary:
+        document = await run_in_engine(
+            _stream_email_state,
+            email_state,
+            current_time,
+            engine.operation_lock.read,
+            lock=read_lock,
         )
+        return streaming_json_response(document)
 
-    # Calculate folder and label counts
-    folder_counts = {
-        folder: len(message_ids) for folder, message_ids in email_state.folders.items()
-    }
-    label_counts = {
-        label: len(message_ids) for label, message_ids in email_state.labels.items()
-    }
-
-    # Calculate total counts
-    unread_count = sum(1 for email in email_state.emails.values() if not email.is_read)
-    starred_count = sum(1 for email in email_state.emails.values() if email.is_starred)
-
-    return EmailStateResponse(
-        current_time=current_time,
-        user_email_address=email_state.user_email_address,
-        emails=email_state.emails,
-        threads=email_state.threads,
-        folders=folder_counts,
-        labels=label_counts,
-        total_email_count=len(email_state.emails),
-        unread_count=unread_count,
-        starred_count=starred_count,
+    return await run_in_engine(
+        _build_email_state_response, email_state, current_time, summary, lock=read_lock
     )
 
 
 @router.post("/query", response_model=EmailQueryResponse)
 async def query_emails(
-    request: EmailQueryRequest, engine: SimulationEngineDep
+    request: EmailQueryRequest,
+    engine: SimulationEngineDep,
+    accept: str | None = Header(default=None),
 ) -> EmailQueryResponse:
     """Query emails with filters.
 
     Allows filtering and searching through email data with various criteria
     including folder, read status, sender, subject, date ranges, etc.
 
+    Paged responses include a next_cursor. Sending it back as cursor fetches
+    the following page from a sorted index rather than re-filtering and
+    re-sorting the whole mailbox.
+
+    If the Accept header requests application/x-ndjson, matching emails are
+    streamed one JSON object per line instead of being wrapped in an
+    EmailQueryResponse.
+
     Args:
         request: Query filters and pagination parameters.
         engine: The simulation engine dependency.
+        accept: The Accept header, used to select NDJSON output.
 
     Returns:
         Filtered email results with counts.
     """
+    try:
+        fields = validate_fields(request.fields, Email)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     email_state = engine.environment.get_state("email")
 
     if not isinstance(email_state, EmailState):
@@ -419,16 +574,42 @@ async def query_emails(
         "offset": request.offset,
         "sort_by": request.sort_by,
         "sort_order": request.sort_order,
+        "fields": fields,
+        "cursor": request.cursor,
     }
 
-    result = email_state.query(query_params)
+    try:
+        if accepts_ndjson(accept):
+            emails, _, _ = await run_in_engine(
+                email_state.select_emails,
+                query_params,
+                lock=engine.operation_lock.read(),
+            )
+            if fields is not None:
+                return ndjson_response(
+                    LockedRows(
+                        emails, lambda e: project(e, fields), engine.operation_lock.read
+                    )
+                )
+            return ndjson_response(
+                LockedRows(emails, lambda e: e.to_model(), engine.operation_lock.read)
+            )
+
+        result = await run_in_engine(
+            email_state.query, query_params, lock=engine.operation_lock.read()
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return EmailQueryResponse(
+    response_cls = EmailQueryResponse if fields is None else ProjectedEmailQueryResponse
+    response = response_cls(
         emails=result["emails"],
         total_count=result["total_count"],
         returned_count=result["returned_count"],
+        next_cursor=result["next_cursor"],
         query=request.model_dump(exclude_none=True),
     )
+    return response if fields is None else unvalidated_response(response)
 
 
 @router.post("/send", response_model=ModalityActionResponse)
@@ -465,7 +646,7 @@ async def send_email(
         )
 
         # Create and add event
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="email",
             data=email_input,
@@ -479,6 +660,8 @@ async def send_email(
             message="Email sent successfully",
             modality="email",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -524,7 +707,7 @@ async def receive_email(
         )
 
         # Create and add event
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="email",
             data=email_input,
@@ -538,6 +721,8 @@ async def receive_email(
             message="Email received successfully",
             modality="email",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -568,7 +753,7 @@ async def mark_emails_read(
             message_ids=request.message_ids,
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="email",
             data=email_input,
@@ -582,6 +767,8 @@ async def mark_emails_read(
             message=f"Marked {len(request.message_ids)} email(s) as read",
             modality="email",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -612,7 +799,7 @@ async def mark_emails_unread(
             message_ids=request.message_ids,
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="email",
             data=email_input,
@@ -626,6 +813,8 @@ async def mark_emails_unread(
             message=f"Marked {len(request.message_ids)} email(s) as unread",
             modality="email",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -656,7 +845,7 @@ async def star_emails(
             message_ids=request.message_ids,
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="email",
             data=email_input,
@@ -670,6 +859,8 @@ async def star_emails(
             message=f"Starred {len(request.message_ids)} email(s)",
             modality="email",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -700,7 +891,7 @@ async def unstar_emails(
             message_ids=request.message_ids,
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="email",
             data=email_input,
@@ -714,6 +905,8 @@ async def unstar_emails(
             message=f"Unstarred {len(request.message_ids)} email(s)",
             modality="email",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -744,7 +937,7 @@ async def archive_emails(
             message_ids=request.message_ids,
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="email",
             data=email_input,
@@ -758,6 +951,8 @@ async def archive_emails(
             message=f"Archived {len(request.message_ids)} email(s)",
             modality="email",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -788,7 +983,7 @@ async def delete_emails(
             message_ids=request.message_ids,
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="email",
             data=email_input,
@@ -802,6 +997,8 @@ async def delete_emails(
             message=f"Deleted {len(request.message_ids)} email(s)",
             modality="email",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -833,7 +1030,7 @@ async def add_labels_to_emails(
             labels=request.labels,
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="email",
             data=email_input,
@@ -847,6 +1044,8 @@ async def add_labels_to_emails(
             message=f"Added {len(request.labels)} label(s) to {len(request.message_ids)} email(s)",
             modality="email",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -878,7 +1077,7 @@ async def remove_labels_from_emails(
             labels=request.labels,
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="email",
             data=email_input,
@@ -892,6 +1091,8 @@ async def remove_labels_from_emails(
             message=f"Removed {len(request.labels)} label(s) from {len(request.message_ids)} email(s)",
             modality="email",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -923,7 +1124,7 @@ async def move_emails(
             folder=request.folder,
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="email",
             data=email_input,
@@ -937,6 +1138,8 @@ async def move_emails(
             message=f"Moved {len(request.message_ids)} email(s) to {request.folder}",
             modality="email",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
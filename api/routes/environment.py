@@ -4,6 +4,8 @@ These endpoints allow clients to query the current state of the simulated enviro
 including all modality states.
 """
 
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from datetime import datetime
 from typing import Any
 
@@ -11,12 +13,17 @@ from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
 from api.dependencies import SimulationEngineDep
-from api.exceptions import ModalityNotFoundError
+from api.exceptions import EngineTimeoutError, ModalityNotFoundError
+from api.executor import run_in_engine
+from api.streaming import JSONObjectStream, locked_model_fields, streaming_json_response
+from api.wire_format import MessagePackRoute
+from models.environment import Environment
 
 # Create router for environment-related endpoints
 router = APIRouter(
     prefix="/environment",
     tags=["environment"],
+    route_class=MessagePackRoute,
 )
 
 
@@ -63,11 +70,53 @@ class ModalityListResponse(BaseModel):
     count: int
 
 
+def _dump_modality_states(env: Environment) -> dict[str, Any]:
+    """Dump every modality state to a plain dict.
+    
+    Dumps in JSON mode, so set-valued fields are listed in the state's own
+    iteration order, the same order the streaming path produces.
+    
+    Args:
+        env: The environment whose states to dump.
+    
+    Returns:
+        Dictionary mapping modality names to their dumped state.
+    """
+    return {
+        name: state.model_dump(mode="json")
+        for name, state in env.modality_states.items()
+    }
+
+
+def _stream_modality_states(
+    env: Environment, lock: Callable[[], AbstractContextManager]
+) -> JSONObjectStream:
+    """Snapshot every modality state for streaming.
+
+    Runs under the engine's read lock. Scalar fields are copied here; large
+    collections are copied out in batches, each under lock(), as the
+    response is encoded.
+
+    Args:
+        env: The environment whose states to stream.
+        lock: Factory for the lock to hold while a batch is copied.
+
+    Returns:
+        Object stream mapping modality names to their state's fields.
+    """
+    return JSONObjectStream(
+        [
+            (name, JSONObjectStream(locked_model_fields(state, lock)))
+            for name, state in env.modality_states.items()
+        ]
+    )
+
+
 # Route Handlers
 
 
 @router.get("/state", response_model=EnvironmentStateResponse)
-async def get_environment_state(engine: SimulationEngineDep):
+async def get_environment_state(engine: SimulationEngineDep, stream: bool = False):
     """Get a complete snapshot of the current environment state.
     
     Returns the full state of all modalities plus the current simulator time.
@@ -75,17 +124,16 @@ async def get_environment_state(engine: SimulationEngineDep):
     
     Args:
         engine: The SimulationEngine instance (injected by FastAPI).
+        stream: If True, encode the snapshot incrementally as chunked JSON.
+            The document is identical to the non-streaming response, but
+            modality collections are walked lazily so memory use stays
+            bounded however large the state is.
     
     Returns:
         Complete environment state including all modality states.
     """
     env = engine.environment
     
-    # Build full modality states dict
-    modalities_dict = {
-        name: state.model_dump() for name, state in env.modality_states.items()
-    }
-    
     # Build summary list using each state's summary property
     summaries = [
         ModalitySummary(
@@ -95,6 +143,26 @@ async def get_environment_state(engine: SimulationEngineDep):
         for name, state in env.modality_states.items()
     ]
     
+    if stream:
+        modalities = await run_in_engine(
+            _stream_modality_states,
+            env,
+            engine.operation_lock.read,
+            lock=engine.operation_lock.read(),
+        )
+        return streaming_json_response(
+            {
+                "current_time": env.time_state.current_time.isoformat(),
+                "modalities": modalities,
+                "summary": summaries,
+            }
+        )
+    
+    # Build full modality states dict off the event loop; large states take a while
+    modalities_dict = await run_in_engine(
+        _dump_modality_states, env, lock=engine.operation_lock.read()
+    )
+    
     return EnvironmentStateResponse(
         current_time=env.time_state.current_time.isoformat(),
         modalities=modalities_dict,
@@ -186,7 +254,7 @@ async def validate_environment(engine: SimulationEngineDep):
     Returns:
         Validation results with any errors found.
     """
-    errors = engine.validate()
+    errors = await run_in_engine(engine.validate, lock=engine.operation_lock.read())
     
     return ValidationResponse(
         valid=len(errors) == 0,
@@ -285,6 +353,55 @@ async def query_modality(modality_name: str, query_params: dict[str, Any], engin
         - until: End of time range (datetime)
         - timezone: Filter by specific timezone
         - limit: Max results
+    
+    Filesystem:
+        - path: Directory to list or file to stat (default "/")
+        - recursive: Include everything below path (bool)
+        - pattern: Glob pattern matched against names
+        - kind: "file" or "directory"
+        - limit: Max results
+        - offset: Pagination offset
+        - sort_by: Sort field ("path", "name", "size", "modified_at")
+        - sort_order: Sort order ("asc", "desc")
+    
+    Slack / Discord:
+        - channel_id: Page through a channel's history (omit to list channels)
+        - thread_seq: With channel_id, read the thread containing this message
+        - mentions_of: Find mentions of this user across channels
+        - unread_only: Only unread messages, mentions or channels (bool)
+        - since: Messages at or after this time (datetime)
+        - until: Messages before this time (datetime)
+        - cursor: next_cursor of the previous page
+        - order: Sort order ("asc", "desc")
+        - author: Filter by author
+        - search: Search message text
+        - include_replies: Include thread replies in history (bool)
+        - include_deleted: Include deleted messages (bool)
+        - space_id: Filter channels by workspace or server
+        - limit: Max results
+        - offset: Pagination offset when listing channels
+    
+    Social:
+        - feed_of: User whose ranked feed to read (default: simulated user)
+        - cursor: next_cursor of the previous feed page
+        - as_of: Time to compute post scores at (datetime)
+        - replies_to: List replies to this post
+        - author: List this user's posts and reposts
+        - followers_of: List this user's followers
+        - following_of: List the users this user follows
+        - limit: Max results
+        - offset: Pagination offset (except feeds)
+    
+    Screen:
+        - at: Rebuild the screen as it was at this time (datetime)
+        - role: Only elements with this role
+        - root: Only this element and its descendants
+        - history: List interactions instead of the screen (bool)
+        - since: Interactions at or after this time (datetime)
+        - until: Interactions before this time (datetime)
+        - interaction_type: Filter interactions by type
+        - limit: Max interactions
+        - offset: Pagination offset for interactions
     """
     env = engine.environment
     
@@ -299,7 +416,9 @@ async def query_modality(modality_name: str, query_params: dict[str, Any], engin
     # Call the state's query method if it exists
     if hasattr(state, 'query'):
         try:
-            results = state.query(query_params)
+            results = await run_in_engine(
+                state.query, query_params, lock=engine.operation_lock.read()
+            )
             
             # All modality query methods now return dict[str, Any]
             return {
@@ -307,6 +426,8 @@ async def query_modality(modality_name: str, query_params: dict[str, Any], engin
                 "query": query_params,
                 "results": results,
             }
+        except EngineTimeoutError:
+            raise
         except Exception as e:
             from fastapi import HTTPException
             raise HTTPException(
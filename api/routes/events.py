@@ -6,37 +6,26 @@ These endpoints allow clients to create, query, and manage simulation events.
 from datetime import datetime
 from typing import Any, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
 from pydantic import BaseModel, Field, ValidationError
 
 from api.dependencies import SimulationEngineDep
+from api.exceptions import EngineTimeoutError
+from api.executor import run_in_engine
+from api.streaming import LockedRows, accepts_ndjson, ndjson_response
+from api.wire_format import MessagePackRoute, unvalidated_response
 from models.base_input import ModalityInput
 from models.event import EventStatus, SimulatorEvent
-from models.modalities.calendar_input import CalendarInput
-from models.modalities.chat_input import ChatInput
-from models.modalities.email_input import EmailInput
-from models.modalities.location_input import LocationInput
-from models.modalities.sms_input import SMSInput
-from models.modalities.time_input import TimeInput
-from models.modalities.weather_input import WeatherInput
+from models.inputs import MODALITY_INPUT_ADAPTER, MODALITY_INPUT_CLASSES
+from models.projection import project, validate_fields
 
 # Create router for event-related endpoints
 router = APIRouter(
     prefix="/events",
     tags=["events"],
+    route_class=MessagePackRoute,
 )
 
-# Mapping of modality names to their input classes
-MODALITY_INPUT_CLASSES: dict[str, type[ModalityInput]] = {
-    "email": EmailInput,
-    "sms": SMSInput,
-    "chat": ChatInput,
-    "calendar": CalendarInput,
-    "location": LocationInput,
-    "weather": WeatherInput,
-    "time": TimeInput,
-}
-
 
 def deserialize_modality_input(
     modality: str, data: dict[str, Any], timestamp: datetime
@@ -54,10 +43,7 @@ def deserialize_modality_input(
     Raises:
         HTTPException: If modality is unknown or data is invalid.
     """
-    # Get the input class for this modality
-    input_class = MODALITY_INPUT_CLASSES.get(modality)
-    
-    if input_class is None:
+    if modality not in MODALITY_INPUT_CLASSES:
         raise HTTPException(
             status_code=404,
             detail=f"Unknown modality: {modality}. Supported modalities: {', '.join(MODALITY_INPUT_CLASSES.keys())}",
@@ -72,7 +58,7 @@ def deserialize_modality_input(
     
     # Deserialize into the proper class
     try:
-        return input_class(**data_with_metadata)
+        return MODALITY_INPUT_ADAPTER.validate_python(data_with_metadata)
     except ValidationError as e:
         # Pydantic validation failed - return helpful error
         raise HTTPException(
@@ -152,20 +138,37 @@ class EventListResponse(BaseModel):
     """Response model for event listing.
     
     Attributes:
-        events: List of event summaries.
-        total: Total number of events.
+        events: List of event summaries. Partial dicts containing only the
+            requested fields when the listing used a projection.
+        total: Total number of events. None for pages fetched with a cursor,
+            which do not scan every match.
         pending: Count of pending events.
         executed: Count of executed events.
         failed: Count of failed events.
         skipped: Count of skipped events.
+        next_cursor: Cursor for the next page, or None if there are no more
+            events.
     """
 
-    events: list[EventResponse]
-    total: int
+    events: list[EventResponse] | list[dict[str, Any]] = Field(union_mode="left_to_right")
+    total: Optional[int]
     pending: int
     executed: int
     failed: int
     skipped: int
+    next_cursor: Optional[str] = None
+
+
+class ProjectedEventListResponse(EventListResponse):
+    """EventListResponse for a query that used a projection.
+
+    Its events are the partial dicts produced by the projection. Routes
+    return it with unvalidated_response(), because validating it as an
+    EventListResponse would turn dicts naming every required field into full
+    events with the unrequested fields filled in.
+    """
+
+    events: list[dict[str, Any]]
 
 
 class EventSummaryResponse(BaseModel):
@@ -190,6 +193,27 @@ class EventSummaryResponse(BaseModel):
     next_event_time: Optional[datetime] = None
 
 
+def _to_event_response(event: SimulatorEvent) -> EventResponse:
+    """Build the listing representation of an event (without its payload).
+    
+    Args:
+        event: The event to convert.
+    
+    Returns:
+        EventResponse for the event, with data left unset.
+    """
+    return EventResponse(
+        event_id=event.event_id,
+        scheduled_time=event.scheduled_time,
+        modality=event.modality,
+        status=event.status.value,
+        priority=event.priority,
+        created_at=event.created_at,
+        executed_at=event.executed_at,
+        error_message=event.error_message,
+    )
+
+
 # Route Handlers
 
 
@@ -202,10 +226,18 @@ async def list_events(
     modality: Optional[str] = None,
     limit: Optional[int] = None,
     offset: int = 0,
+    fields: Optional[str] = None,
+    cursor: Optional[str] = None,
+    accept: Optional[str] = Header(default=None),
 ):
     """List events with optional filters.
     
     Query parameters allow filtering by status, time range, and modality.
+    Paged responses include a next_cursor; passing it back as cursor reads
+    the next page by walking the (already sorted) event queue from that
+    position instead of filtering the whole queue again.
+    If the Accept header requests application/x-ndjson, matching events are
+    streamed one JSON object per line instead of an EventListResponse.
     
     Args:
         engine: The SimulationEngine instance (injected by FastAPI).
@@ -215,6 +247,11 @@ async def list_events(
         modality: Filter by modality type.
         limit: Maximum number of events to return.
         offset: Number of events to skip (for pagination).
+        fields: Comma-separated EventResponse fields to include for each event
+            (default: all fields).
+        cursor: next_cursor from a previous page (cannot be combined with
+            offset).
+        accept: The Accept header, used to select NDJSON output.
     
     Returns:
         List of events matching the filters.
@@ -230,51 +267,90 @@ async def list_events(
                 detail=f"Invalid status: {status}. Must be one of: pending, executed, failed, skipped, cancelled",
             )
     
-    # Query events
-    events = engine.query_events(
-        status=event_status,
-        start_time=start_time,
-        end_time=end_time,
-        modality=modality,
-    )
+    # Parse projection if provided
+    projection = None
+    if fields is not None:
+        try:
+            projection = validate_fields(
+                [name.strip() for name in fields.split(",") if name.strip()],
+                EventResponse,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
     
-    # Apply pagination
-    total = len(events)
-    if limit:
-        events = events[offset : offset + limit]
+    if cursor is not None:
+        if offset:
+            raise HTTPException(
+                status_code=400, detail="offset cannot be combined with cursor"
+            )
+        try:
+            events, next_cursor = await run_in_engine(
+                engine.page_events,
+                status=event_status,
+                start_time=start_time,
+                end_time=end_time,
+                modality=modality,
+                limit=limit or None,
+                cursor=cursor,
+                lock=engine.operation_lock.read(),
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        total = None
     else:
-        events = events[offset:]
-    
-    # Convert to response format
-    event_responses = [
-        EventResponse(
-            event_id=e.event_id,
-            scheduled_time=e.scheduled_time,
-            modality=e.modality,
-            status=e.status.value,
-            priority=e.priority,
-            created_at=e.created_at,
-            executed_at=e.executed_at,
-            error_message=e.error_message,
+        # Query events
+        events = await run_in_engine(
+            engine.query_events,
+            status=event_status,
+            start_time=start_time,
+            end_time=end_time,
+            modality=modality,
+            lock=engine.operation_lock.read(),
+        )
+        
+        # Apply pagination
+        total = len(events)
+        if limit:
+            events = events[offset : offset + limit]
+        else:
+            events = events[offset:]
+        
+        next_cursor = None
+        if limit and events and offset + len(events) < total:
+            next_cursor = engine.event_queue.cursor_for(events[-1])
+    
+    if accepts_ndjson(accept):
+        if projection is not None:
+            return ndjson_response(
+                LockedRows(
+                    events,
+                    lambda e: project(_to_event_response(e), projection),
+                    engine.operation_lock.read,
+                )
+            )
+        return ndjson_response(
+            LockedRows(events, _to_event_response, engine.operation_lock.read)
         )
-        for e in events
-    ]
     
     # Count by status
     all_events = engine.event_queue.events
-    pending = sum(1 for e in all_events if e.status == EventStatus.PENDING)
-    executed = sum(1 for e in all_events if e.status == EventStatus.EXECUTED)
-    failed = sum(1 for e in all_events if e.status == EventStatus.FAILED)
-    skipped = sum(1 for e in all_events if e.status == EventStatus.SKIPPED)
-    
-    return EventListResponse(
-        events=event_responses,
-        total=total,
-        pending=pending,
-        executed=executed,
-        failed=failed,
-        skipped=skipped,
-    )
+    counts = {
+        "total": total,
+        "pending": sum(1 for e in all_events if e.status == EventStatus.PENDING),
+        "executed": sum(1 for e in all_events if e.status == EventStatus.EXECUTED),
+        "failed": sum(1 for e in all_events if e.status == EventStatus.FAILED),
+        "skipped": sum(1 for e in all_events if e.status == EventStatus.SKIPPED),
+        "next_cursor": next_cursor,
+    }
+
+    if projection is not None:
+        return unvalidated_response(
+            ProjectedEventListResponse(
+                events=[project(_to_event_response(e), projection) for e in events],
+                **counts,
+            )
+        )
+    return EventListResponse(events=[_to_event_response(e) for e in events], **counts)
 
 
 @router.post("", response_model=EventResponse)
@@ -324,7 +400,7 @@ async def create_event(request: CreateEventRequest, engine: SimulationEngineDep)
         )
         
         # Add to simulation
-        engine.add_event(event)
+        await run_in_engine(engine.add_event, event)
         
         return EventResponse(
             event_id=event.event_id,
@@ -336,6 +412,8 @@ async def create_event(request: CreateEventRequest, engine: SimulationEngineDep)
             executed_at=event.executed_at,
             error_message=event.error_message,
         )
+    except EngineTimeoutError:
+        raise
     except HTTPException:
         raise
     except ValueError as e:
@@ -387,7 +465,7 @@ async def create_immediate_event(request: ImmediateEventRequest, engine: Simulat
         )
         
         # Add to simulation
-        engine.add_event(event)
+        await run_in_engine(engine.add_event, event)
         
         return EventResponse(
             event_id=event.event_id,
@@ -399,6 +477,8 @@ async def create_immediate_event(request: ImmediateEventRequest, engine: Simulat
             executed_at=event.executed_at,
             error_message=event.error_message,
         )
+    except EngineTimeoutError:
+        raise
     except HTTPException:
         raise
     except ValueError as e:
@@ -554,29 +634,19 @@ async def cancel_event(event_id: str, engine: SimulationEngineDep):
     Raises:
         HTTPException: If event not found or cannot be cancelled.
     """
-    # Find the event
-    event = None
-    for e in engine.event_queue.events:
-        if e.event_id == event_id:
-            event = e
-            break
-    
-    if not event:
+    try:
+        await run_in_engine(engine.cancel_event, event_id)
+    except KeyError:
         raise HTTPException(
             status_code=404,
             detail=f"Event {event_id} not found",
         )
-    
-    # Check if can be cancelled
-    if event.status != EventStatus.PENDING:
+    except ValueError as e:
         raise HTTPException(
             status_code=400,
-            detail=f"Cannot cancel event with status {event.status.value}. Only pending events can be cancelled.",
+            detail=str(e),
         )
     
-    # Cancel the event
-    event.status = EventStatus.CANCELLED
-    
     return {
         "cancelled": True,
         "event_id": event_id,
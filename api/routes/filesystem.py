@@ -0,0 +1,754 @@
+"""File system modality endpoints.
+
+Provides REST API access to the simulated file system and its operations.
+Supports listing and searching directories, reading file content (including
+HTTP byte ranges), and writing, moving, copying and deleting files.
+"""
+
+import base64
+import re
+from typing import Any, Literal, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from pydantic import BaseModel, Field, ValidationError
+
+from api.dependencies import SimulationEngineDep
+from api.exceptions import EngineTimeoutError
+from api.executor import run_in_engine
+from api.models import ModalityActionResponse
+from api.utils import create_immediate_event
+from api.wire_format import MessagePackRoute
+from models.event import EventStatus
+from models.modalities.filesystem_input import FileSystemInput
+from models.modalities.filesystem_state import FileSystemState
+
+router = APIRouter(
+    prefix="/filesystem",
+    tags=["filesystem"],
+    route_class=MessagePackRoute,
+)
+
+# A single byte range: "bytes=first-last", "bytes=first-" or "bytes=-suffix"
+_RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+# Request Models
+
+
+class WriteFileRequest(BaseModel):
+    """Request to write a file.
+
+    Args:
+        path: Absolute file path. Missing parent directories are created.
+        content: File content, in the given encoding.
+        encoding: "utf-8" for text or "base64" for binary content.
+        offset: Byte offset to overwrite from. Without it the whole file is
+            replaced.
+        permissions: Optional octal permissions for a new file.
+        mime_type: Optional MIME type for a new file.
+    """
+
+    path: str = Field(description="Absolute file path")
+    content: str = Field(description="File content")
+    encoding: Literal["utf-8", "base64"] = Field(
+        default="utf-8", description="Content encoding"
+    )
+    offset: Optional[int] = Field(
+        default=None, description="Byte offset to write from", ge=0
+    )
+    permissions: Optional[str] = Field(
+        default=None, description="Octal permissions for a new file"
+    )
+    mime_type: Optional[str] = Field(
+        default=None, description="MIME type for a new file"
+    )
+
+
+class AppendFileRequest(BaseModel):
+    """Request to append to a file.
+
+    Args:
+        path: Absolute file path. The file is created if it does not exist.
+        content: Content to append, in the given encoding.
+        encoding: "utf-8" for text or "base64" for binary content.
+    """
+
+    path: str = Field(description="Absolute file path")
+    content: str = Field(description="Content to append")
+    encoding: Literal["utf-8", "base64"] = Field(
+        default="utf-8", description="Content encoding"
+    )
+
+
+class MakeDirectoryRequest(BaseModel):
+    """Request to create a directory and any missing parents.
+
+    Args:
+        path: Absolute directory path.
+        permissions: Optional octal permissions for the new directory.
+    """
+
+    path: str = Field(description="Absolute directory path")
+    permissions: Optional[str] = Field(
+        default=None, description="Octal permissions for the directory"
+    )
+
+
+class DeletePathRequest(BaseModel):
+    """Request to delete a file or directory.
+
+    Args:
+        path: Absolute path to delete.
+        recursive: Whether a non-empty directory may be deleted.
+    """
+
+    path: str = Field(description="Absolute path to delete")
+    recursive: bool = Field(
+        default=False, description="Allow deleting non-empty directories"
+    )
+
+
+class TransferPathRequest(BaseModel):
+    """Request to move or copy a file or directory.
+
+    Args:
+        path: Absolute source path.
+        destination: Absolute destination path, which must not exist.
+    """
+
+    path: str = Field(description="Absolute source path")
+    destination: str = Field(description="Absolute destination path")
+
+
+class ChmodRequest(BaseModel):
+    """Request to change the permissions of a file or directory.
+
+    Args:
+        path: Absolute path.
+        permissions: Octal permissions (e.g., "644").
+    """
+
+    path: str = Field(description="Absolute path")
+    permissions: str = Field(description="Octal permissions (e.g., '644')")
+
+
+class ReadFileRequest(BaseModel):
+    """Request to read a file's content.
+
+    Args:
+        path: Absolute file path.
+        offset: First byte to read.
+        length: Most bytes to read; reads to the end of the file if omitted.
+        encoding: How to return the content: "utf-8" text or "base64".
+    """
+
+    path: str = Field(description="Absolute file path")
+    offset: int = Field(default=0, description="First byte to read", ge=0)
+    length: Optional[int] = Field(
+        default=None, description="Most bytes to read", ge=0
+    )
+    encoding: Literal["utf-8", "base64"] = Field(
+        default="utf-8", description="Content encoding"
+    )
+
+
+class FileSystemQueryRequest(BaseModel):
+    """Request to list or search a directory.
+
+    Args:
+        path: Directory to list (default: root).
+        recursive: Whether to include all descendants, not just children.
+        pattern: Optional glob pattern matched against entry names.
+        kind: Optional filter by entry kind ("file" or "directory").
+        limit: Optional maximum number of results to return.
+        offset: Number of results to skip for pagination.
+        sort_by: Field to sort by ("path", "name", "size", "modified_at").
+        sort_order: Sort order ("asc" or "desc").
+    """
+
+    path: str = Field(default="/", description="Directory to list")
+    recursive: bool = Field(default=False, description="Include all descendants")
+    pattern: Optional[str] = Field(
+        default=None, description="Glob pattern matched against names"
+    )
+    kind: Optional[Literal["file", "directory"]] = Field(
+        default=None, description="Filter by entry kind"
+    )
+    limit: Optional[int] = Field(
+        default=None, description="Maximum number of results", ge=1
+    )
+    offset: int = Field(default=0, description="Results to skip", ge=0)
+    sort_by: str = Field(default="path", description="Field to sort by")
+    sort_order: Literal["asc", "desc"] = Field(
+        default="asc", description="Sort order (asc or desc)"
+    )
+
+
+# Response Models
+
+
+class FileSystemStateResponse(BaseModel):
+    """Response containing the file system state.
+
+    Args:
+        modality_type: Always "filesystem".
+        last_updated: ISO format timestamp of last update.
+        update_count: Number of file system operations applied.
+        file_count: Number of files.
+        directory_count: Number of directories, not counting the root.
+        total_bytes: Combined size of all files.
+        stored_bytes: Bytes held by the blob store after deduplication.
+        chunk_count: Number of distinct chunks in the blob store.
+        root: Entries of the root directory's children.
+    """
+
+    modality_type: str = Field(description="Modality type identifier")
+    last_updated: str = Field(description="ISO format timestamp of last update")
+    update_count: int = Field(description="Number of operations applied")
+    file_count: int = Field(description="Number of files")
+    directory_count: int = Field(description="Number of directories")
+    total_bytes: int = Field(description="Combined size of all files")
+    stored_bytes: int = Field(description="Bytes stored after deduplication")
+    chunk_count: int = Field(description="Distinct stored chunks")
+    root: list[dict[str, Any]] = Field(description="Root directory entries")
+
+
+class FileSystemQueryResponse(BaseModel):
+    """Response containing directory listing results.
+
+    Args:
+        path: The directory that was listed.
+        entries: Entries matching the query.
+        count: Number of entries returned (after pagination).
+        total_count: Total matching entries (before pagination).
+    """
+
+    path: str = Field(description="Listed directory")
+    entries: list[dict[str, Any]] = Field(description="Matching entries")
+    count: int = Field(description="Number of entries returned")
+    total_count: int = Field(description="Total matching entries")
+
+
+class ReadFileResponse(BaseModel):
+    """Response containing file content.
+
+    Args:
+        path: The file that was read.
+        content: Content read, in the requested encoding.
+        encoding: Encoding of content.
+        offset: Offset the content starts at.
+        length: Number of bytes read.
+        size: Total size of the file.
+    """
+
+    path: str = Field(description="File that was read")
+    content: str = Field(description="Content read")
+    encoding: str = Field(description="Content encoding")
+    offset: int = Field(description="Offset the content starts at")
+    length: int = Field(description="Number of bytes read")
+    size: int = Field(description="Total file size")
+
+
+# Helpers
+
+
+def _get_filesystem_state(engine: SimulationEngineDep) -> FileSystemState:
+    """Return the engine's file system state.
+
+    Raises:
+        HTTPException: If the state is missing or of the wrong type.
+    """
+    filesystem_state = engine.environment.get_state("filesystem")
+    if not isinstance(filesystem_state, FileSystemState):
+        raise HTTPException(
+            status_code=500, detail="File system state not properly initialized"
+        )
+    return filesystem_state
+
+
+def _parse_range(header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """Parse a Range header for a file of the given size.
+
+    Only single byte ranges are honored; multiple ranges and malformed
+    headers are ignored, as RFC 9110 allows, and the whole file is served.
+
+    Args:
+        header: Value of the Range header, if any.
+        size: Size of the file in bytes.
+
+    Returns:
+        (start, stop) of the requested range, clipped to the file, or None to
+        serve the whole file.
+
+    Raises:
+        HTTPException: 416 if the range lies entirely past the end of the file.
+    """
+    if header is None:
+        return None
+    match = _RANGE_PATTERN.fullmatch(header.strip())
+    if match is None or match.group(1) == match.group(2) == "":
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        start, stop = max(size - int(last), 0), size
+    else:
+        start = int(first)
+        stop = size if last == "" else min(int(last) + 1, size)
+        if last != "" and int(last) < start:
+            return None
+
+    if start >= size or start >= stop:
+        raise HTTPException(
+            status_code=416,
+            detail=f"Range not satisfiable for a file of {size} bytes",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, stop
+
+
+def _read_content(
+    filesystem_state: FileSystemState, path: str, range_header: Optional[str]
+) -> tuple[dict[str, Any], bytes, Optional[tuple[int, int]]]:
+    """Look up a file and read the requested range of it.
+
+    Runs as one engine operation so the size used to resolve the range and
+    the bytes read come from the same version of the file.
+
+    Returns:
+        Tuple of (file entry, bytes read, resolved range or None).
+
+    Raises:
+        ValueError: If the path does not exist or is a directory.
+        HTTPException: 416 if the range is not satisfiable.
+    """
+    entry = filesystem_state.stat(path)
+    if entry["kind"] != "file":
+        raise ValueError(f"Is a directory: '{path}'")
+    byte_range = _parse_range(range_header, entry["size"])
+    if byte_range is None:
+        return entry, filesystem_state.read_file(path), None
+    start, stop = byte_range
+    return entry, filesystem_state.read_file(path, start, stop - start), byte_range
+
+
+# Route Handlers
+
+
+@router.get("/state", response_model=FileSystemStateResponse)
+async def get_filesystem_state(engine: SimulationEngineDep):
+    """Get current file system state.
+
+    Returns tree statistics, blob store usage and the entries of the root
+    directory. File content is never included.
+
+    Returns:
+        FileSystemStateResponse: Current file system state.
+
+    Raises:
+        HTTPException: If the file system state is not found.
+    """
+    try:
+        filesystem_state = _get_filesystem_state(engine)
+        snapshot = await run_in_engine(
+            filesystem_state.get_snapshot, lock=engine.operation_lock.read()
+        )
+        return FileSystemStateResponse(**snapshot)
+    except HTTPException:
+        raise
+    except EngineTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get file system state: {str(e)}"
+        )
+
+
+@router.post("/query", response_model=FileSystemQueryResponse)
+async def query_filesystem(
+    request: FileSystemQueryRequest, engine: SimulationEngineDep
+):
+    """List or search a directory.
+
+    Path lookups walk the directory tree one component at a time, so their
+    cost depends on the depth of the path rather than the size of the tree.
+
+    Args:
+        request: Query parameters including filters and pagination.
+        engine: The simulation engine dependency.
+
+    Returns:
+        FileSystemQueryResponse: Matching entries with pagination info.
+
+    Raises:
+        HTTPException: If the directory does not exist or the query is
+            invalid.
+    """
+    try:
+        filesystem_state = _get_filesystem_state(engine)
+        result = await run_in_engine(
+            filesystem_state.query,
+            request.model_dump(),
+            lock=engine.operation_lock.read(),
+        )
+        return FileSystemQueryResponse(**result)
+    except HTTPException:
+        raise
+    except EngineTimeoutError:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to query file system: {str(e)}"
+        )
+
+
+@router.get("/content")
+async def get_file_content(
+    engine: SimulationEngineDep,
+    path: str = Query(description="Absolute file path"),
+    range_header: Optional[str] = Header(default=None, alias="Range"),
+):
+    """Download a file's raw content.
+
+    Honors a single HTTP byte range ("bytes=0-99", "bytes=100-" or
+    "bytes=-100") with a 206 Partial Content response; only the chunks the
+    range overlaps are read. Other Range headers are ignored and the whole
+    file is returned.
+
+    Args:
+        engine: The simulation engine dependency.
+        path: Absolute file path.
+        range_header: Optional Range request header.
+
+    Returns:
+        Response: The content, with the file's MIME type.
+
+    Raises:
+        HTTPException: 404 if the file does not exist, 400 if the path is a
+            directory, or 416 if the range is not satisfiable.
+    """
+    try:
+        filesystem_state = _get_filesystem_state(engine)
+        entry, content, byte_range = await run_in_engine(
+            _read_content,
+            filesystem_state,
+            path,
+            range_header,
+            lock=engine.operation_lock.read(),
+        )
+    except HTTPException:
+        raise
+    except EngineTimeoutError:
+        raise
+    except ValueError as e:
+        status_code = 404 if "No such file" in str(e) else 400
+        raise HTTPException(status_code=status_code, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to read file: {str(e)}"
+        )
+
+    headers = {"Accept-Ranges": "bytes"}
+    if byte_range is None:
+        return Response(content, media_type=entry["mime_type"], headers=headers)
+    start, stop = byte_range
+    headers["Content-Range"] = f"bytes {start}-{stop - 1}/{entry['size']}"
+    return Response(
+        content, status_code=206, media_type=entry["mime_type"], headers=headers
+    )
+
+
+@router.post("/read", response_model=ReadFileResponse)
+async def read_file(request: ReadFileRequest, engine: SimulationEngineDep):
+    """Read a file's content, or a byte range of it, as text or base64.
+
+    Args:
+        request: File path, range and response encoding.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ReadFileResponse: The content read and the file's size.
+
+    Raises:
+        HTTPException: 404 if the file does not exist, or 400 if the path is
+            a directory or the content is not valid UTF-8.
+    """
+    try:
+        filesystem_state = _get_filesystem_state(engine)
+
+        def read() -> tuple[dict[str, Any], bytes]:
+            return (
+                filesystem_state.stat(request.path),
+                filesystem_state.read_file(
+                    request.path, request.offset, request.length
+                ),
+            )
+
+        entry, content = await run_in_engine(read, lock=engine.operation_lock.read())
+        if entry["kind"] != "file":
+            raise ValueError(f"Is a directory: '{request.path}'")
+        if request.encoding == "base64":
+            text = base64.b64encode(content).decode("ascii")
+        else:
+            try:
+                text = content.decode("utf-8")
+            except UnicodeDecodeError:
+                raise ValueError(
+                    "Content is not valid UTF-8; request base64 encoding instead"
+                )
+        return ReadFileResponse(
+            path=entry["path"],
+            content=text,
+            encoding=request.encoding,
+            offset=request.offset,
+            length=len(content),
+            size=entry["size"],
+        )
+    except HTTPException:
+        raise
+    except EngineTimeoutError:
+        raise
+    except ValueError as e:
+        status_code = 404 if "No such file" in str(e) else 400
+        raise HTTPException(status_code=status_code, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to read file: {str(e)}"
+        )
+
+
+async def _apply(
+    engine: SimulationEngineDep, operation: str, message: str, **fields: Any
+) -> ModalityActionResponse:
+    """Apply a file system operation as an immediate event.
+
+    Args:
+        engine: The simulation engine.
+        operation: FileSystemInput operation.
+        message: Confirmation message for the response.
+        **fields: Remaining FileSystemInput fields.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: 422 if the input is invalid, 400 if the operation
+            fails (for example, its path does not exist), or 500 on
+            unexpected errors.
+    """
+    try:
+        filesystem_input = FileSystemInput(
+            timestamp=engine.environment.time_state.current_time,
+            operation=operation,
+            **fields,
+        )
+
+        event = await create_immediate_event(
+            engine=engine,
+            modality="filesystem",
+            data=filesystem_input,
+            priority=100,
+        )
+        if event.status == EventStatus.FAILED:
+            # Failed events stay in the queue; report why this one failed
+            raise ValueError(event.error_message.split(": ", 1)[-1])
+
+        return ModalityActionResponse(
+            event_id=event.event_id,
+            scheduled_time=event.scheduled_time,
+            status="executed",
+            message=message,
+            modality="filesystem",
+        )
+    except HTTPException:
+        raise
+    except EngineTimeoutError:
+        raise
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422, detail=f"Invalid file system data: {str(e)}"
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid file system operation: {str(e)}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to {operation}: {str(e)}"
+        )
+
+
+@router.post("/write", response_model=ModalityActionResponse)
+async def write_file(request: WriteFileRequest, engine: SimulationEngineDep):
+    """Write a file, or overwrite part of it from an offset.
+
+    Content is stored in the content-addressed blob store: chunks identical
+    to ones already stored (for example the unchanged parts of an edited
+    file) are not stored again.
+
+    Args:
+        request: File path, content and options.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(
+        engine,
+        "write",
+        f"Wrote {request.path}",
+        path=request.path,
+        content=request.content,
+        encoding=request.encoding,
+        offset=request.offset,
+        permissions=request.permissions,
+        mime_type=request.mime_type,
+    )
+
+
+@router.post("/append", response_model=ModalityActionResponse)
+async def append_file(request: AppendFileRequest, engine: SimulationEngineDep):
+    """Append content to a file, creating it if needed.
+
+    Args:
+        request: File path and content.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(
+        engine,
+        "append",
+        f"Appended to {request.path}",
+        path=request.path,
+        content=request.content,
+        encoding=request.encoding,
+    )
+
+
+@router.post("/mkdir", response_model=ModalityActionResponse)
+async def make_directory(request: MakeDirectoryRequest, engine: SimulationEngineDep):
+    """Create a directory and any missing parents.
+
+    Args:
+        request: Directory path and permissions.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(
+        engine,
+        "mkdir",
+        f"Created directory {request.path}",
+        path=request.path,
+        permissions=request.permissions,
+    )
+
+
+@router.post("/delete", response_model=ModalityActionResponse)
+async def delete_path(request: DeletePathRequest, engine: SimulationEngineDep):
+    """Delete a file or directory.
+
+    Args:
+        request: Path and whether to delete non-empty directories.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(
+        engine,
+        "delete",
+        f"Deleted {request.path}",
+        path=request.path,
+        recursive=request.recursive,
+    )
+
+
+@router.post("/move", response_model=ModalityActionResponse)
+async def move_path(request: TransferPathRequest, engine: SimulationEngineDep):
+    """Move or rename a file or directory.
+
+    Args:
+        request: Source and destination paths.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(
+        engine,
+        "move",
+        f"Moved {request.path} to {request.destination}",
+        path=request.path,
+        destination=request.destination,
+    )
+
+
+@router.post("/copy", response_model=ModalityActionResponse)
+async def copy_path(request: TransferPathRequest, engine: SimulationEngineDep):
+    """Copy a file or directory.
+
+    Copies share their content chunks with the original, so copying costs
+    no blob storage until either file is changed.
+
+    Args:
+        request: Source and destination paths.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(
+        engine,
+        "copy",
+        f"Copied {request.path} to {request.destination}",
+        path=request.path,
+        destination=request.destination,
+    )
+
+
+@router.post("/chmod", response_model=ModalityActionResponse)
+async def change_permissions(request: ChmodRequest, engine: SimulationEngineDep):
+    """Change the permissions of a file or directory.
+
+    Args:
+        request: Path and octal permissions.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(
+        engine,
+        "chmod",
+        f"Set permissions of {request.path} to {request.permissions}",
+        path=request.path,
+        permissions=request.permissions,
+    )
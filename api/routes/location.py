@@ -11,14 +11,17 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field, ValidationError
 
 from api.dependencies import SimulationEngineDep
+from api.exceptions import EngineTimeoutError
 from api.models import ModalityActionResponse
 from api.utils import create_immediate_event
+from api.wire_format import MessagePackRoute
 from models.modalities.location_input import LocationInput
 from models.modalities.location_state import LocationState
 
 router = APIRouter(
     prefix="/location",
     tags=["location"],
+    route_class=MessagePackRoute,
 )
 
 
@@ -220,7 +223,7 @@ async def update_location(request: UpdateLocationRequest, engine: SimulationEngi
             bearing=request.bearing,
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="location",
             data=location_input,
@@ -234,6 +237,8 @@ async def update_location(request: UpdateLocationRequest, engine: SimulationEngi
             message=f"Location updated to ({request.latitude}, {request.longitude})",
             modality="location",
         )
+    except EngineTimeoutError:
+        raise
     except ValidationError as e:
         # Pydantic validation failed (e.g., lat/lon out of range)
         raise HTTPException(
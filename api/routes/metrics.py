@@ -0,0 +1,89 @@
+"""Prometheus metrics endpoint.
+
+Serves the in-process metrics registry (see models/metrics.py) in the
+Prometheus text exposition format so the simulator can be scraped while it
+runs.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from api.dependencies import SimulationEngineDep
+from api.executor import run_in_engine
+from api.wire_format import MessagePackRoute
+from models.event import EventStatus
+from models.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    QUEUE_EVENTS,
+    REGISTRY,
+    SIMULATION_RUNNING,
+    UNDO_STACK_BYTES,
+    UNDO_STACK_ENTRIES,
+    approx_size,
+)
+from models.simulation import SimulationEngine
+
+# Create router for metrics endpoints
+router = APIRouter(
+    tags=["metrics"],
+    route_class=MessagePackRoute,
+)
+
+
+# Helper Functions
+
+
+def _render_metrics(engine: SimulationEngine) -> str:
+    """Update engine state gauges and render the registry.
+
+    Queue depth and undo stack size are read here, at scrape time, rather
+    than maintained on every change, so they cost nothing between scrapes.
+
+    Args:
+        engine: The simulation engine to read state gauges from.
+
+    Returns:
+        The registry in the Prometheus text format.
+    """
+    counts = {status: 0 for status in EventStatus}
+    for event in engine.event_queue.events:
+        counts[event.status] += 1
+    for status, count in counts.items():
+        QUEUE_EVENTS.labels(status.value).set(count)
+
+    stacks = {
+        "undo": engine.undo_stack.undo_entries,
+        "redo": engine.undo_stack.redo_entries,
+    }
+    for name, entries in stacks.items():
+        UNDO_STACK_ENTRIES.labels(name).set(len(entries))
+        UNDO_STACK_BYTES.labels(name).set(
+            sum(approx_size(entry.undo_data) for entry in entries)
+        )
+
+    SIMULATION_RUNNING.set(1 if engine.is_running else 0)
+
+    return REGISTRY.render()
+
+
+# Route Handlers
+
+
+@router.get("/metrics", response_class=Response)
+async def get_metrics(engine: SimulationEngineDep):
+    """Expose simulator metrics in the Prometheus text format.
+
+    Includes event execution latency by modality and operation, tick duration
+    and lag, event queue operations and depth by status, undo stack entries
+    and bytes, and modality apply/query latency.
+
+    Args:
+        engine: The simulation engine dependency.
+
+    Returns:
+        Plain-text exposition (format version 0.0.4).
+    """
+    body = await run_in_engine(
+        _render_metrics, engine, lock=engine.operation_lock.read()
+    )
+    return Response(content=body, media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,366 @@
+"""Screen modality endpoints.
+
+Provides REST API access to the simulated screen: the current UI tree, the
+screen as it was at any earlier time, the interaction history, and
+endpoints that render screens and apply interactions.
+"""
+
+from datetime import datetime
+from typing import Any, Literal, Optional
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field, ValidationError
+
+from api.dependencies import SimulationEngineDep
+from api.exceptions import EngineTimeoutError
+from api.executor import run_in_engine
+from api.models import ModalityActionResponse
+from api.utils import create_immediate_event
+from api.wire_format import MessagePackRoute
+from models.event import EventStatus
+from models.modalities.screen_input import ScreenElement, ScreenInput
+from models.modalities.screen_state import ScreenState
+
+router = APIRouter(
+    prefix="/screen",
+    tags=["screen"],
+    route_class=MessagePackRoute,
+)
+
+
+# Request Models
+
+
+class RenderScreenRequest(BaseModel):
+    """Request to replace the whole screen.
+
+    Args:
+        app: Application shown.
+        window: Window shown.
+        elements: The whole UI tree, by element ID.
+    """
+
+    app: str = Field(description="Application shown")
+    window: Optional[str] = Field(default=None, description="Window shown")
+    elements: dict[str, ScreenElement] = Field(
+        default_factory=dict, description="UI tree by element ID"
+    )
+
+
+class UpdateScreenRequest(BaseModel):
+    """Request to change part of the screen without a user interaction.
+
+    Args:
+        elements: Elements added or replaced, by ID.
+        removed: IDs of removed elements.
+        app: Application switched to, if it changes.
+        window: Window switched to, if it changes.
+    """
+
+    elements: dict[str, ScreenElement] = Field(
+        default_factory=dict, description="Elements added or replaced"
+    )
+    removed: list[str] = Field(default_factory=list, description="IDs of removed elements")
+    app: Optional[str] = Field(default=None, description="Application switched to")
+    window: Optional[str] = Field(default=None, description="Window switched to")
+
+
+class InteractRequest(BaseModel):
+    """Request to apply a user interaction and the change it makes.
+
+    Args:
+        interaction_type: Type of interaction.
+        target_element: Element interacted with (required for click,
+            type, hover and focus).
+        interaction_data: Interaction-specific data, e.g. typed text.
+        elements: Elements added or replaced by the interaction.
+        removed: IDs of elements removed by the interaction.
+        app: Application switched to, if it changes.
+        window: Window switched to, if it changes.
+    """
+
+    interaction_type: Literal["click", "type", "scroll", "hover", "focus", "key"] = Field(
+        description="Type of interaction"
+    )
+    target_element: Optional[str] = Field(default=None, description="Target element ID")
+    interaction_data: dict[str, Any] = Field(
+        default_factory=dict, description="Interaction-specific data"
+    )
+    elements: dict[str, ScreenElement] = Field(
+        default_factory=dict, description="Elements added or replaced"
+    )
+    removed: list[str] = Field(default_factory=list, description="IDs of removed elements")
+    app: Optional[str] = Field(default=None, description="Application switched to")
+    window: Optional[str] = Field(default=None, description="Window switched to")
+
+
+class ScreenQueryRequest(BaseModel):
+    """Request to read the screen at a time or the interaction history.
+
+    Args:
+        at: Rebuild the screen as it was at this time.
+        role: Only include elements with this role.
+        root: Only include this element and its descendants.
+        history: List interactions instead of the screen.
+        since: Interactions at or after this time.
+        until: Interactions before this time.
+        interaction_type: Filter interactions by type.
+        limit: Maximum number of interactions.
+        offset: Interactions to skip, newest first.
+    """
+
+    at: Optional[datetime] = Field(default=None, description="Time to rebuild the screen at")
+    role: Optional[str] = Field(default=None, description="Element role filter")
+    root: Optional[str] = Field(default=None, description="Root of the subtree to include")
+    history: bool = Field(default=False, description="List interactions instead")
+    since: Optional[datetime] = Field(default=None, description="Interactions from this time")
+    until: Optional[datetime] = Field(default=None, description="Interactions before this time")
+    interaction_type: Optional[str] = Field(default=None, description="Interaction type filter")
+    limit: int = Field(default=100, description="Maximum interactions", ge=1, le=1000)
+    offset: int = Field(default=0, description="Interactions to skip", ge=0)
+
+
+# Response Models
+
+
+class ScreenStateResponse(BaseModel):
+    """Response containing screen state.
+
+    Args:
+        modality_type: Always "screen".
+        last_updated: ISO format timestamp of last update.
+        update_count: Number of interactions applied.
+        current_app: Currently active application.
+        current_window: Currently active window.
+        ui_elements: Visible UI elements by ID.
+        element_count: Number of visible elements.
+        history_length: Number of interactions recorded.
+        keyframe_count: Number of keyframes kept.
+    """
+
+    modality_type: str = Field(description="Modality type identifier")
+    last_updated: str = Field(description="ISO format timestamp of last update")
+    update_count: int = Field(description="Number of interactions applied")
+    current_app: Optional[str] = Field(description="Currently active application")
+    current_window: Optional[str] = Field(description="Currently active window")
+    ui_elements: dict[str, dict[str, Any]] = Field(description="Visible UI elements by ID")
+    element_count: int = Field(description="Number of visible elements")
+    history_length: int = Field(description="Number of interactions recorded")
+    keyframe_count: int = Field(description="Number of keyframes kept")
+
+
+class ScreenQueryResponse(BaseModel):
+    """Response containing screen query results.
+
+    Args:
+        app: Active application at the queried time.
+        window: Active window at the queried time.
+        elements: Matching elements by ID.
+        interactions: Matching interactions, newest first.
+        count: Number of elements or interactions returned.
+    """
+
+    app: Optional[str] = Field(description="Active application")
+    window: Optional[str] = Field(description="Active window")
+    elements: dict[str, dict[str, Any]] = Field(description="Matching elements by ID")
+    interactions: list[dict[str, Any]] = Field(description="Matching interactions")
+    count: int = Field(description="Number of results returned")
+
+
+# Helpers
+
+
+def _get_screen_state(engine: SimulationEngineDep) -> ScreenState:
+    """Return the engine's screen state.
+
+    Raises:
+        HTTPException: If the state is missing or of the wrong type.
+    """
+    screen_state = engine.environment.get_state("screen")
+    if not isinstance(screen_state, ScreenState):
+        raise HTTPException(status_code=500, detail="Screen state not properly initialized")
+    return screen_state
+
+
+async def _apply(
+    engine: SimulationEngineDep, operation: str, message: str, **fields: Any
+) -> ModalityActionResponse:
+    """Apply a screen interaction as an immediate event.
+
+    Args:
+        engine: The simulation engine.
+        operation: Short description of the action, for error messages.
+        message: Confirmation message for the response.
+        **fields: ScreenInput fields.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: 422 if the input is invalid, 400 if the interaction
+            fails (for example, its target is not on screen), or 500 on
+            unexpected errors.
+    """
+    try:
+        screen_input = ScreenInput(
+            timestamp=engine.environment.time_state.current_time,
+            **fields,
+        )
+
+        event = await create_immediate_event(
+            engine=engine,
+            modality="screen",
+            data=screen_input,
+            priority=100,
+        )
+        if event.status == EventStatus.FAILED:
+            # Failed events stay in the queue; report why this one failed
+            raise ValueError(event.error_message.split(": ", 1)[-1])
+
+        return ModalityActionResponse(
+            event_id=event.event_id,
+            scheduled_time=event.scheduled_time,
+            status="executed",
+            message=message,
+            modality="screen",
+        )
+    except HTTPException:
+        raise
+    except EngineTimeoutError:
+        raise
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid screen data: {str(e)}")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid screen interaction: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to {operation}: {str(e)}")
+
+
+@router.get("/state", response_model=ScreenStateResponse)
+async def get_screen_state(engine: SimulationEngineDep):
+    """Get current screen state.
+
+    Returns the active app and window and every visible element, without
+    the interaction history.
+
+    Returns:
+        ScreenStateResponse: Current screen state.
+
+    Raises:
+        HTTPException: If the screen state is not found.
+    """
+    try:
+        screen_state = _get_screen_state(engine)
+        snapshot = await run_in_engine(
+            screen_state.get_snapshot, lock=engine.operation_lock.read()
+        )
+        return ScreenStateResponse(**snapshot)
+    except HTTPException:
+        raise
+    except EngineTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get screen state: {str(e)}")
+
+
+@router.post("/query", response_model=ScreenQueryResponse)
+async def query_screen(request: ScreenQueryRequest, engine: SimulationEngineDep):
+    """Read the screen, now or at an earlier time, or the interaction history.
+
+    Args:
+        request: Query parameters.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ScreenQueryResponse: The screen's elements or matching interactions.
+
+    Raises:
+        HTTPException: If root is not on the screen.
+    """
+    try:
+        screen_state = _get_screen_state(engine)
+        result = await run_in_engine(
+            screen_state.query,
+            request.model_dump(exclude_none=True),
+            lock=engine.operation_lock.read(),
+        )
+        return ScreenQueryResponse(**result)
+    except HTTPException:
+        raise
+    except EngineTimeoutError:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to query screen: {str(e)}")
+
+
+@router.post("/render", response_model=ModalityActionResponse)
+async def render_screen(request: RenderScreenRequest, engine: SimulationEngineDep):
+    """Replace the whole screen, as when switching apps or loading a page.
+
+    Args:
+        request: App, window and UI tree.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(
+        engine,
+        "render screen",
+        f"Rendered {request.app} ({len(request.elements)} elements)",
+        interaction_type="render",
+        **request.model_dump(),
+    )
+
+
+@router.post("/update", response_model=ModalityActionResponse)
+async def update_screen(request: UpdateScreenRequest, engine: SimulationEngineDep):
+    """Change part of the screen, as when a notification or page content appears.
+
+    Args:
+        request: Elements added, replaced and removed.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails, or a removed
+            element is not on screen.
+    """
+    return await _apply(
+        engine,
+        "update screen",
+        f"Updated {len(request.elements) + len(request.removed)} elements",
+        interaction_type="update",
+        **request.model_dump(),
+    )
+
+
+@router.post("/interact", response_model=ModalityActionResponse)
+async def interact(request: InteractRequest, engine: SimulationEngineDep):
+    """Apply a user interaction and the change it makes to the screen.
+
+    Args:
+        request: Interaction, target and resulting changes.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails, or the target is
+            not on screen.
+    """
+    target = f" on {request.target_element}" if request.target_element else ""
+    return await _apply(
+        engine,
+        request.interaction_type,
+        f"Applied {request.interaction_type}{target}",
+        **request.model_dump(),
+    )
@@ -10,12 +10,16 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from api.dependencies import SimulationEngineDep
+from api.exceptions import EngineTimeoutError
+from api.executor import run_in_engine
+from api.wire_format import MessagePackRoute
 from models.event import EventStatus
 
 # Create router for simulation control endpoints
 router = APIRouter(
     prefix="/simulation",
     tags=["simulation"],
+    route_class=MessagePackRoute,
 )
 
 
@@ -179,9 +183,12 @@ async def stop_simulation(engine: SimulationEngineDep):
     
     Returns:
         Summary of simulation execution.
+
+    Raises:
+        HTTPException: If the auto-advance loop cannot be stopped (409).
     """
     try:
-        result = engine.stop()
+        result = await run_in_engine(engine.stop)
         
         return StopSimulationResponse(
             simulation_id=result["simulation_id"],
@@ -191,6 +198,14 @@ async def stop_simulation(engine: SimulationEngineDep):
             events_executed=result["events_executed"],
             events_failed=result["events_failed"],
         )
+    except EngineTimeoutError:
+        raise
+    except (RuntimeError, TimeoutError) as e:
+        # The loop could not be joined; it is still running
+        raise HTTPException(
+            status_code=409,
+            detail=str(e),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -267,7 +282,7 @@ async def reset_simulation(engine: SimulationEngineDep):
         - events_undone: Number of events whose state changes were reversed
         - undo_errors: List of any errors encountered during undo
     """
-    result = engine.reset()
+    result = await run_in_engine(engine.reset)
 
     # Build descriptive message
     if result["events_undone"] > 0:
@@ -425,7 +440,7 @@ async def clear_simulation(
             )
 
     try:
-        result = engine.clear(reset_time_to=reset_time_to)
+        result = await run_in_engine(engine.clear, reset_time_to=reset_time_to)
         
         return ClearSimulationResponse(
             status="cleared",
@@ -434,6 +449,8 @@ async def clear_simulation(
             time_reset=result["time_reset"],
             current_time=result["current_time"],
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -471,7 +488,7 @@ async def undo_simulation(
     count = request.count if request else 1
 
     try:
-        result = engine.undo(count=count)
+        result = await run_in_engine(engine.undo, count=count)
         
         # Convert event details to response model
         undone_events = [
@@ -500,6 +517,8 @@ async def undo_simulation(
             status_code=500,
             detail=f"Undo failed: {str(e)}",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -537,7 +556,7 @@ async def redo_simulation(
     count = request.count if request else 1
 
     try:
-        result = engine.redo(count=count)
+        result = await run_in_engine(engine.redo, count=count)
         
         # Convert event details to response model
         redone_events = [
@@ -566,6 +585,8 @@ async def redo_simulation(
             status_code=500,
             detail=f"Redo failed: {str(e)}",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -0,0 +1,43 @@
+"""Slack modality endpoints.
+
+Provides REST API access to Slack channels, messages, threads, mentions and
+read state. The endpoints are shared with the other team chat modality; see
+api/routes/team_chat.py.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter
+from pydantic import BaseModel, Field
+
+from api.routes.team_chat import add_team_chat_routes
+from api.wire_format import MessagePackRoute
+from models.modalities.slack_input import SlackInput
+from models.modalities.slack_state import SlackState
+
+router = APIRouter(
+    prefix="/slack",
+    tags=["slack"],
+    route_class=MessagePackRoute,
+)
+
+
+class CreateSlackChannelRequest(BaseModel):
+    """Request to create a Slack channel.
+
+    Args:
+        channel_id: Channel ID.
+        channel_name: Display name (defaults to the ID).
+        workspace_id: Slack workspace the channel belongs to.
+        topic: Channel topic.
+        is_private: Whether the channel is private.
+    """
+
+    channel_id: str = Field(description="Channel ID")
+    channel_name: Optional[str] = Field(default=None, description="Display name")
+    workspace_id: Optional[str] = Field(default=None, description="Slack workspace ID")
+    topic: Optional[str] = Field(default=None, description="Channel topic")
+    is_private: bool = Field(default=False, description="Whether the channel is private")
+
+
+add_team_chat_routes(router, "slack", SlackState, SlackInput, CreateSlackChannelRequest)
@@ -5,14 +5,18 @@ receiving, reading, reacting to messages, and managing group conversations.
 """
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
 from pydantic import BaseModel, Field
 
 from api.dependencies import SimulationEngineDep
+from api.exceptions import EngineTimeoutError
+from api.executor import run_in_engine
 from api.models import ModalityActionResponse
+from api.streaming import LockedRows, accepts_ndjson, ndjson_response
 from api.utils import create_immediate_event
+from api.wire_format import MessagePackRoute, unvalidated_response
 from models.modalities.sms_input import SMSInput
 from models.modalities.sms_state import (
     GroupParticipant,
@@ -22,10 +26,12 @@ from models.modalities.sms_state import (
     SMSMessage,
     SMSState,
 )
+from models.projection import project, validate_fields
 
 router = APIRouter(
     prefix="/sms",
     tags=["sms"],
+    route_class=MessagePackRoute,
 )
 
 
@@ -163,6 +169,9 @@ class SMSQueryRequest(BaseModel):
         offset: Number of results to skip (for pagination).
         sort_by: Field to sort by.
         sort_order: Sort direction ("asc" or "desc").
+        fields: Only return these SMSMessage fields for each result.
+        cursor: Resume after the position in a previous response's
+            next_cursor (cannot be combined with offset).
     """
 
     thread_id: str | None = Field(default=None, description="Filter by thread ID")
@@ -203,6 +212,13 @@ class SMSQueryRequest(BaseModel):
     sort_order: Literal["asc", "desc"] | None = Field(
         default="desc", description="Sort direction"
     )
+    fields: list[str] | None = Field(
+        default=None,
+        description="SMSMessage fields to include in each result (default: all fields)",
+    )
+    cursor: str | None = Field(
+        default=None, description="Cursor from a previous response's next_cursor"
+    )
 
 
 # ============================================================================
@@ -239,19 +255,72 @@ class SMSQueryResponse(BaseModel):
 
     Attributes:
         modality_type: Always "sms".
-        messages: Query results (matching messages).
-        total_count: Total number of results matching query.
+        messages: Query results (matching messages). Partial dicts containing
+            only the requested fields when the query used a projection.
+        total_count: Total number of results matching query. None for pages
+            fetched with a cursor, which do not scan every match.
         returned_count: Number of results returned (after pagination).
+        next_cursor: Cursor for the next page, or None if there are no more
+            results.
         query: Echo of query parameters for debugging.
     """
 
     modality_type: str = Field(default="sms")
-    messages: list[SMSMessage]
-    total_count: int
+    messages: list[SMSMessage] | list[dict[str, Any]] = Field(union_mode="left_to_right")
+    total_count: int | None
     returned_count: int
+    next_cursor: str | None = None
     query: dict
 
 
+class ProjectedSMSQueryResponse(SMSQueryResponse):
+    """SMSQueryResponse for a query that used a projection.
+
+    Its messages are the partial dicts produced by the projection. Routes
+    return it with unvalidated_response(), because validating it as an
+    SMSQueryResponse would turn dicts naming every required field into full
+    messages with the unrequested fields filled in.
+    """
+
+    messages: list[dict[str, Any]]
+
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+
+def _build_sms_state_response(
+    sms_state: SMSState, current_time: datetime
+) -> SMSStateResponse:
+    """Build the SMS state response.
+
+    Runs under the engine's read lock so the snapshot is consistent.
+
+    Args:
+        sms_state: The SMS state to snapshot.
+        current_time: Current simulator time.
+
+    Returns:
+        The SMS state response.
+    """
+    # Calculate total counts
+    unread_count = sum(1 for msg in sms_state.messages.values() if not msg.is_read)
+
+    return SMSStateResponse(
+        current_time=current_time,
+        user_phone_number=sms_state.user_phone_number,
+        messages={
+            message_id: message.to_model()
+            for message_id, message in sms_state.messages.items()
+        },
+        conversations=sms_state.conversations,
+        total_message_count=len(sms_state.messages),
+        unread_count=unread_count,
+        total_conversation_count=len(sms_state.conversations),
+    )
+
+
 # ============================================================================
 # Route Handlers
 # ============================================================================
@@ -278,36 +347,46 @@ async def get_sms_state(engine: SimulationEngineDep) -> SMSStateResponse:
             detail="SMS state not properly initialized",
         )
 
-    # Calculate total counts
-    unread_count = sum(1 for msg in sms_state.messages.values() if not msg.is_read)
-
-    return SMSStateResponse(
-        current_time=engine.environment.time_state.current_time,
-        user_phone_number=sms_state.user_phone_number,
-        messages=sms_state.messages,
-        conversations=sms_state.conversations,
-        total_message_count=len(sms_state.messages),
-        unread_count=unread_count,
-        total_conversation_count=len(sms_state.conversations),
+    return await run_in_engine(
+        _build_sms_state_response,
+        sms_state,
+        engine.environment.time_state.current_time,
+        lock=engine.operation_lock.read(),
     )
 
 
 @router.post("/query", response_model=SMSQueryResponse)
 async def query_sms(
-    request: SMSQueryRequest, engine: SimulationEngineDep
+    request: SMSQueryRequest,
+    engine: SimulationEngineDep,
+    accept: str | None = Header(default=None),
 ) -> SMSQueryResponse:
     """Query SMS messages with filters.
 
     Allows filtering and searching through message data with various criteria
     including thread, sender, recipient, text content, date ranges, etc.
 
+    Paged responses include a next_cursor. Sending it back as cursor fetches
+    the following page from a sorted index rather than re-filtering and
+    re-sorting every message.
+
+    If the Accept header requests application/x-ndjson, matching messages are
+    streamed one JSON object per line instead of being wrapped in an
+    SMSQueryResponse.
+
     Args:
         request: Query filters and pagination parameters.
         engine: The simulation engine dependency.
+        accept: The Accept header, used to select NDJSON output.
 
     Returns:
         Filtered message results with counts.
     """
+    try:
+        fields = validate_fields(request.fields, SMSMessage)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     sms_state = engine.environment.get_state("sms")
 
     if not isinstance(sms_state, SMSState):
@@ -334,16 +413,46 @@ async def query_sms(
         "offset": request.offset,
         "sort_by": request.sort_by,
         "sort_order": request.sort_order,
+        "fields": fields,
+        "cursor": request.cursor,
     }
 
-    result = sms_state.query(query_params)
+    try:
+        if accepts_ndjson(accept):
+            messages, _, _ = await run_in_engine(
+                sms_state.select_messages,
+                query_params,
+                lock=engine.operation_lock.read(),
+            )
+            if fields is not None:
+                return ndjson_response(
+                    LockedRows(
+                        messages,
+                        lambda m: project(m, fields),
+                        engine.operation_lock.read,
+                    )
+                )
+            return ndjson_response(
+                LockedRows(
+                    messages, lambda m: m.to_model(), engine.operation_lock.read
+                )
+            )
+
+        result = await run_in_engine(
+            sms_state.query, query_params, lock=engine.operation_lock.read()
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return SMSQueryResponse(
+    response_cls = SMSQueryResponse if fields is None else ProjectedSMSQueryResponse
+    response = response_cls(
         messages=result["messages"],
         total_count=result["total_count"],
         returned_count=result["count"],
+        next_cursor=result["next_cursor"],
         query=request.model_dump(exclude_none=True),
     )
+    return response if fields is None else unvalidated_response(response)
 
 
 @router.post("/send", response_model=ModalityActionResponse)
@@ -387,7 +496,7 @@ async def send_sms(
         )
 
         # Create and add event
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="sms",
             data=sms_input,
@@ -401,6 +510,8 @@ async def send_sms(
             message="SMS message sent successfully",
             modality="sms",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -451,7 +562,7 @@ async def receive_sms(
         )
 
         # Create and add event
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="sms",
             data=sms_input,
@@ -465,6 +576,8 @@ async def receive_sms(
             message="SMS message received successfully",
             modality="sms",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -514,7 +627,7 @@ async def mark_sms_read(
             },
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="sms",
             data=sms_input,
@@ -528,6 +641,8 @@ async def mark_sms_read(
             message=f"Marked {marked_count} message(s) as read",
             modality="sms",
         )
+    except EngineTimeoutError:
+        raise
     except HTTPException:
         raise
     except Exception as e:
@@ -578,7 +693,7 @@ async def mark_sms_unread(
             },
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="sms",
             data=sms_input,
@@ -592,6 +707,8 @@ async def mark_sms_unread(
             message=f"Marked {marked_count} message(s) as unread",
             modality="sms",
         )
+    except EngineTimeoutError:
+        raise
     except HTTPException:
         raise
     except Exception as e:
@@ -650,7 +767,7 @@ async def delete_sms(
             },
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="sms",
             data=event_input,
@@ -664,6 +781,8 @@ async def delete_sms(
             message=f"Deleted {deleted_count} message(s)",
             modality="sms",
         )
+    except EngineTimeoutError:
+        raise
     except HTTPException:
         raise
     except Exception as e:
@@ -700,7 +819,7 @@ async def react_to_sms(
             },
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="sms",
             data=sms_input,
@@ -714,6 +833,8 @@ async def react_to_sms(
             message=f"Added reaction '{request.emoji}' to message",
             modality="sms",
         )
+    except EngineTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
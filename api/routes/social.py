@@ -0,0 +1,473 @@
+"""Social media modality endpoints.
+
+Provides REST API access to the simulated social network: ranked feeds,
+posts and replies, and the follower graph. Feeds are served from
+precomputed timelines, so a page costs the same however many posts exist.
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field, ValidationError
+
+from api.dependencies import SimulationEngineDep
+from api.exceptions import EngineTimeoutError
+from api.executor import run_in_engine
+from api.models import ModalityActionResponse
+from api.utils import create_immediate_event
+from api.wire_format import MessagePackRoute
+from models.event import EventStatus
+from models.modalities.social_input import SocialMediaInput
+from models.modalities.social_state import SocialMediaState
+
+router = APIRouter(
+    prefix="/social",
+    tags=["social"],
+    route_class=MessagePackRoute,
+)
+
+
+# Request Models
+
+
+class CreatePostRequest(BaseModel):
+    """Request to create a post.
+
+    Args:
+        user_id: Author of the post.
+        content: Post text.
+        post_id: ID for the new post (generated if not given).
+    """
+
+    user_id: str = Field(description="Author user ID")
+    content: str = Field(description="Post text")
+    post_id: Optional[str] = Field(default=None, description="ID for the new post")
+
+
+class ReplyRequest(BaseModel):
+    """Request to reply to a post.
+
+    Args:
+        user_id: Author of the reply.
+        reply_to: Post being replied to.
+        content: Reply text.
+        post_id: ID for the new reply (generated if not given).
+    """
+
+    user_id: str = Field(description="Author user ID")
+    reply_to: str = Field(description="Post being replied to")
+    content: str = Field(description="Reply text")
+    post_id: Optional[str] = Field(default=None, description="ID for the new reply")
+
+
+class RepostRequest(BaseModel):
+    """Request to repost a post.
+
+    Args:
+        user_id: User reposting.
+        repost_of: Post being reposted.
+        content: Optional comment on the repost.
+        post_id: ID for the new repost (generated if not given).
+    """
+
+    user_id: str = Field(description="User reposting")
+    repost_of: str = Field(description="Post being reposted")
+    content: Optional[str] = Field(default=None, description="Comment on the repost")
+    post_id: Optional[str] = Field(default=None, description="ID for the new repost")
+
+
+class PostActionRequest(BaseModel):
+    """Request to like, unlike or delete a post.
+
+    Args:
+        user_id: User performing the action.
+        post_id: Post acted on.
+    """
+
+    user_id: str = Field(description="User performing the action")
+    post_id: str = Field(description="Post ID")
+
+
+class FollowRequest(BaseModel):
+    """Request to follow or unfollow a user.
+
+    Args:
+        user_id: User who follows or unfollows.
+        target_user_id: User followed or unfollowed.
+    """
+
+    user_id: str = Field(description="Follower user ID")
+    target_user_id: str = Field(description="User to follow or unfollow")
+
+
+class SocialQueryRequest(BaseModel):
+    """Request to query feeds, posts or the follower graph.
+
+    Args:
+        feed_of: User whose feed to read (defaults to the simulated user).
+        cursor: Continue a feed from a previous page's next_cursor.
+        as_of: Time to compute scores at (defaults to the last update).
+        replies_to: List replies to this post instead.
+        author: List this user's posts and reposts instead.
+        followers_of: List this user's followers instead.
+        following_of: List the users this user follows instead.
+        limit: Maximum number of results.
+        offset: Results to skip (not for feeds, which use cursor).
+    """
+
+    feed_of: Optional[str] = Field(default=None, description="User whose feed to read")
+    cursor: Optional[str] = Field(default=None, description="next_cursor of the previous page")
+    as_of: Optional[datetime] = Field(default=None, description="Time to compute scores at")
+    replies_to: Optional[str] = Field(default=None, description="Post whose replies to list")
+    author: Optional[str] = Field(default=None, description="User whose posts to list")
+    followers_of: Optional[str] = Field(
+        default=None, description="User whose followers to list"
+    )
+    following_of: Optional[str] = Field(
+        default=None, description="User whose followees to list"
+    )
+    limit: int = Field(default=20, description="Maximum number of results", ge=1, le=500)
+    offset: int = Field(default=0, description="Results to skip", ge=0)
+
+
+# Response Models
+
+
+class SocialStateResponse(BaseModel):
+    """Response containing social media state.
+
+    Args:
+        modality_type: Always "social".
+        last_updated: ISO format timestamp of last update.
+        update_count: Number of operations applied.
+        user_id: ID of the simulated user.
+        post_count: Number of posts, replies and reposts.
+        following: Users the simulated user follows.
+        follower_count: Number of users following the simulated user.
+        feed: First page of the simulated user's feed.
+        next_cursor: Cursor for the next feed page.
+    """
+
+    modality_type: str = Field(description="Modality type identifier")
+    last_updated: str = Field(description="ISO format timestamp of last update")
+    update_count: int = Field(description="Number of operations applied")
+    user_id: str = Field(description="ID of the simulated user")
+    post_count: int = Field(description="Number of posts")
+    following: list[str] = Field(description="Users the simulated user follows")
+    follower_count: int = Field(description="Number of followers")
+    feed: list[dict[str, Any]] = Field(description="First page of the feed")
+    next_cursor: Optional[str] = Field(description="Cursor for the next feed page")
+
+
+class SocialQueryResponse(BaseModel):
+    """Response containing social media query results.
+
+    Args:
+        posts: Matching posts, with like_count, liked and score.
+        users: Matching user IDs, for follower queries.
+        count: Number of results returned.
+        next_cursor: Cursor for the next feed page, if there is one.
+    """
+
+    posts: list[dict[str, Any]] = Field(description="Matching posts")
+    users: list[str] = Field(description="Matching user IDs")
+    count: int = Field(description="Number of results returned")
+    next_cursor: Optional[str] = Field(description="Cursor for the next feed page")
+
+
+# Helpers
+
+
+def _get_social_state(engine: SimulationEngineDep) -> SocialMediaState:
+    """Return the engine's social media state.
+
+    Raises:
+        HTTPException: If the state is missing or of the wrong type.
+    """
+    social_state = engine.environment.get_state("social")
+    if not isinstance(social_state, SocialMediaState):
+        raise HTTPException(
+            status_code=500, detail="Social media state not properly initialized"
+        )
+    return social_state
+
+
+async def _apply(
+    engine: SimulationEngineDep, operation: str, message: str, **fields: Any
+) -> ModalityActionResponse:
+    """Apply a social media operation as an immediate event.
+
+    Args:
+        engine: The simulation engine.
+        operation: SocialMediaInput operation.
+        message: Confirmation message for the response.
+        **fields: Remaining SocialMediaInput fields.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: 422 if the input is invalid, 400 if the operation
+            fails (for example, its post does not exist), or 500 on
+            unexpected errors.
+    """
+    try:
+        social_input = SocialMediaInput(
+            timestamp=engine.environment.time_state.current_time,
+            operation=operation,
+            **fields,
+        )
+
+        event = await create_immediate_event(
+            engine=engine,
+            modality="social",
+            data=social_input,
+            priority=100,
+        )
+        if event.status == EventStatus.FAILED:
+            # Failed events stay in the queue; report why this one failed
+            raise ValueError(event.error_message.split(": ", 1)[-1])
+
+        return ModalityActionResponse(
+            event_id=event.event_id,
+            scheduled_time=event.scheduled_time,
+            status="executed",
+            message=message.format(post_id=social_input.new_post_id),
+            modality="social",
+        )
+    except HTTPException:
+        raise
+    except EngineTimeoutError:
+        raise
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422, detail=f"Invalid social media data: {str(e)}"
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid social media operation: {str(e)}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to {operation}: {str(e)}"
+        )
+
+
+@router.get("/state", response_model=SocialStateResponse)
+async def get_social_state(engine: SimulationEngineDep):
+    """Get current social media state.
+
+    Returns counts, the simulated user's follows and the first page of their
+    feed.
+
+    Returns:
+        SocialStateResponse: Current social media state.
+
+    Raises:
+        HTTPException: If the social media state is not found.
+    """
+    try:
+        social_state = _get_social_state(engine)
+        snapshot = await run_in_engine(
+            social_state.get_snapshot, lock=engine.operation_lock.read()
+        )
+        return SocialStateResponse(**snapshot)
+    except HTTPException:
+        raise
+    except EngineTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get social media state: {str(e)}"
+        )
+
+
+@router.post("/query", response_model=SocialQueryResponse)
+async def query_social(request: SocialQueryRequest, engine: SimulationEngineDep):
+    """Read a feed, a post's replies, a user's posts, or the follower graph.
+
+    Feeds are ranked by engagement decayed over simulator time, best first;
+    pass a page's next_cursor as cursor to read the next page.
+
+    Args:
+        request: Query parameters.
+        engine: The simulation engine dependency.
+
+    Returns:
+        SocialQueryResponse: Matching posts or users.
+
+    Raises:
+        HTTPException: If the post does not exist or the cursor is invalid.
+    """
+    try:
+        social_state = _get_social_state(engine)
+        result = await run_in_engine(
+            social_state.query,
+            request.model_dump(exclude_none=True),
+            lock=engine.operation_lock.read(),
+        )
+        return SocialQueryResponse(**result)
+    except HTTPException:
+        raise
+    except EngineTimeoutError:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to query social media: {str(e)}"
+        )
+
+
+@router.post("/post", response_model=ModalityActionResponse)
+async def create_post(request: CreatePostRequest, engine: SimulationEngineDep):
+    """Create a post and push it to the author's followers' feeds.
+
+    Args:
+        request: Author, text and optional post ID.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID; the message
+            includes the new post's ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(engine, "post", "Created post {post_id}", **request.model_dump())
+
+
+@router.post("/reply", response_model=ModalityActionResponse)
+async def reply_to_post(request: ReplyRequest, engine: SimulationEngineDep):
+    """Reply to a post, raising its rank.
+
+    Args:
+        request: Author, post replied to, text and optional post ID.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(engine, "reply", "Created reply {post_id}", **request.model_dump())
+
+
+@router.post("/repost", response_model=ModalityActionResponse)
+async def repost(request: RepostRequest, engine: SimulationEngineDep):
+    """Repost a post to the reposter's followers, raising the original's rank.
+
+    Args:
+        request: User, post reposted, optional comment and post ID.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(engine, "repost", "Created repost {post_id}", **request.model_dump())
+
+
+@router.post("/like", response_model=ModalityActionResponse)
+async def like_post(request: PostActionRequest, engine: SimulationEngineDep):
+    """Like a post.
+
+    Args:
+        request: User and post.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(
+        engine, "like", f"Liked post {request.post_id}", **request.model_dump()
+    )
+
+
+@router.post("/unlike", response_model=ModalityActionResponse)
+async def unlike_post(request: PostActionRequest, engine: SimulationEngineDep):
+    """Remove a like from a post.
+
+    Args:
+        request: User and post.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(
+        engine, "unlike", f"Unliked post {request.post_id}", **request.model_dump()
+    )
+
+
+@router.post("/delete", response_model=ModalityActionResponse)
+async def delete_post(request: PostActionRequest, engine: SimulationEngineDep):
+    """Delete one of the user's posts.
+
+    Args:
+        request: Author and post.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(
+        engine, "delete", f"Deleted post {request.post_id}", **request.model_dump()
+    )
+
+
+@router.post("/follow", response_model=ModalityActionResponse)
+async def follow_user(request: FollowRequest, engine: SimulationEngineDep):
+    """Follow a user, merging their posts into the follower's feed.
+
+    Args:
+        request: Follower and user to follow.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(
+        engine,
+        "follow",
+        f"{request.user_id} followed {request.target_user_id}",
+        **request.model_dump(),
+    )
+
+
+@router.post("/unfollow", response_model=ModalityActionResponse)
+async def unfollow_user(request: FollowRequest, engine: SimulationEngineDep):
+    """Unfollow a user, removing their posts from the follower's feed.
+
+    Args:
+        request: Follower and user to unfollow.
+        engine: The simulation engine dependency.
+
+    Returns:
+        ModalityActionResponse: Confirmation with the event ID.
+
+    Raises:
+        HTTPException: If validation or execution fails.
+    """
+    return await _apply(
+        engine,
+        "unfollow",
+        f"{request.user_id} unfollowed {request.target_user_id}",
+        **request.model_dump(),
+    )
@@ -0,0 +1,488 @@
+"""Endpoints shared by the team chat modalities (Slack and Discord).
+
+The Slack and Discord routers have the same endpoints over the same state
+model (models/modalities/team_chat.py); add_team_chat_routes() registers them
+on a modality's router. Only creating a channel differs, by whether the
+channel belongs to a workspace or a server, so each modality passes its own
+request model for it.
+"""
+
+from datetime import datetime
+from typing import Any, Literal, Optional
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field, ValidationError
+
+from api.dependencies import SimulationEngineDep
+from api.exceptions import EngineTimeoutError
+from api.executor import run_in_engine
+from api.models import ModalityActionResponse
+from api.utils import create_immediate_event
+from models.event import EventStatus
+from models.modalities.team_chat import TeamChatInput, TeamChatState
+
+
+# Request Models
+
+
+class AddUserRequest(BaseModel):
+    """Request to add a user, or rename an existing one.
+
+    Args:
+        user_id: User ID.
+        display_name: Name shown for the user (defaults to the ID).
+    """
+
+    user_id: str = Field(description="User ID")
+    display_name: Optional[str] = Field(default=None, description="Display name")
+
+
+class PostMessageRequest(BaseModel):
+    """Request to post a message to a channel.
+
+    Args:
+        channel_id: Channel to post in. It is created if it does not exist.
+        author: User ID of the author.
+        text: Message text. Mention users as "<@user_id>".
+        thread_seq: Message to reply to in a thread.
+    """
+
+    channel_id: str = Field(description="Channel ID")
+    author: str = Field(description="Author user ID")
+    text: str = Field(description="Message text")
+    thread_seq: Optional[int] = Field(
+        default=None, description="Message to reply to in a thread", ge=0
+    )
+
+
+class EditMessageRequest(BaseModel):
+    """Request to edit a message's text.
+
+    Args:
+        channel_id: Channel holding the message.
+        message_seq: Message sequence number in the channel.
+        text: New message text.
+    """
+
+    channel_id: str = Field(description="Channel ID")
+    message_seq: int = Field(description="Message sequence number", ge=0)
+    text: str = Field(description="New message text")
+
+
+class MessageRequest(BaseModel):
+    """Request addressing one message.
+
+    Args:
+        channel_id: Channel holding the message.
+        message_seq: Message sequence number in the channel.
+    """
+
+    channel_id: str = Field(description="Channel ID")
+    message_seq: int = Field(description="Message sequence number", ge=0)
+
+
+class ReactionRequest(BaseModel):
+    """Request to add or remove a reaction.
+
+    Args:
+        channel_id: Channel holding the message.
+        message_seq: Message sequence number in the channel.
+        emoji: Emoji name (e.g., "thumbsup").
+        user_id: User reacting.
+    """
+
+    channel_id: str = Field(description="Channel ID")
+    message_seq: int = Field(description="Message sequence number", ge=0)
+    emoji: str = Field(description="Emoji name")
+    user_id: str = Field(description="User reacting")
+
+
+class MarkReadRequest(BaseModel):
+    """Request to mark a channel read.
+
+    Args:
+        channel_id: Channel to mark read.
+        message_seq: Last message read (default: the latest).
+    """
+
+    channel_id: str = Field(description="Channel ID")
+    message_seq: Optional[int] = Field(
+        default=None, description="Last message read", ge=0
+    )
+
+
+class TeamChatQueryRequest(BaseModel):
+    """Request to query channels or messages.
+
+    Args:
+        channel_id: Channel whose history to page through.
+        thread_seq: Thread root (or any reply) to read, with channel_id.
+        mentions_of: User whose mentions to find across channels.
+        unread_only: Only unread messages or mentions, or channels with
+            unread messages.
+        since: Only messages at or after this time.
+        until: Only messages before this time.
+        cursor: Continue from a previous page's next_cursor.
+        order: "desc" (newest first) or "asc".
+        author: Only messages by this user.
+        search: Only messages containing this text (case-insensitive).
+        include_replies: Include thread replies in channel history.
+        include_deleted: Include deleted messages.
+        space_id: Only channels in this workspace or server.
+        limit: Maximum number of results.
+        offset: Channels to skip, when listing channels.
+    """
+
+    channel_id: Optional[str] = Field(default=None, description="Channel ID")
+    thread_seq: Optional[int] = Field(default=None, description="Thread to read", ge=0)
+    mentions_of: Optional[str] = Field(
+        default=None, description="User whose mentions to find"
+    )
+    unread_only: bool = Field(default=False, description="Only unread results")
+    since: Optional[datetime] = Field(
+        default=None, description="Only messages at or after this time"
+    )
+    until: Optional[datetime] = Field(
+        default=None, description="Only messages before this time"
+    )
+    cursor: Optional[int] = Field(
+        default=None, description="next_cursor of the previous page", ge=0
+    )
+    order: Literal["asc", "desc"] = Field(default="desc", description="Sort order")
+    author: Optional[str] = Field(default=None, description="Only messages by this user")
+    search: Optional[str] = Field(default=None, description="Text to search for")
+    include_replies: bool = Field(
+        default=False, description="Include thread replies in history"
+    )
+    include_deleted: bool = Field(
+        default=False, description="Include deleted messages"
+    )
+    space_id: Optional[str] = Field(
+        default=None, description="Only channels in this workspace or server"
+    )
+    limit: int = Field(default=100, description="Maximum number of results", ge=1, le=1000)
+    offset: int = Field(default=0, description="Channels to skip", ge=0)
+
+
+# Response Models
+
+
+class TeamChatStateResponse(BaseModel):
+    """Response containing team chat state (channels without messages).
+
+    Args:
+        modality_type: "slack" or "discord".
+        last_updated: ISO format timestamp of last update.
+        update_count: Number of operations applied.
+        user_id: ID of the simulated user.
+        channel_count: Number of channels.
+        message_count: Number of messages across channels.
+        unread_count: Unread messages across channels.
+        unread_mention_count: Unread mentions of the simulated user.
+        channels: Channel summaries with unread counts.
+        users: Known users.
+    """
+
+    modality_type: str = Field(description="Modality type identifier")
+    last_updated: str = Field(description="ISO format timestamp of last update")
+    update_count: int = Field(description="Number of operations applied")
+    user_id: str = Field(description="ID of the simulated user")
+    channel_count: int = Field(description="Number of channels")
+    message_count: int = Field(description="Number of messages")
+    unread_count: int = Field(description="Unread messages")
+    unread_mention_count: int = Field(description="Unread mentions")
+    channels: list[dict[str, Any]] = Field(description="Channel summaries")
+    users: list[dict[str, Any]] = Field(description="Known users")
+
+
+class TeamChatQueryResponse(BaseModel):
+    """Response containing team chat query results.
+
+    Args:
+        channels: Matching channels, when listing channels.
+        messages: Matching messages, each with its channel_id.
+        count: Number of results returned.
+        next_cursor: Cursor for the next page of history, if there is one.
+    """
+
+    channels: list[dict[str, Any]] = Field(description="Matching channels")
+    messages: list[dict[str, Any]] = Field(description="Matching messages")
+    count: int = Field(description="Number of results returned")
+    next_cursor: Optional[int] = Field(description="Cursor for the next page")
+
+
+def add_team_chat_routes(
+    router: APIRouter,
+    modality: str,
+    state_class: type[TeamChatState],
+    input_class: type[TeamChatInput],
+    create_channel_request: type[BaseModel],
+) -> None:
+    """Register the team chat endpoints on a modality's router.
+
+    Args:
+        router: The modality's router.
+        modality: Modality name ("slack" or "discord").
+        state_class: The modality's state class.
+        input_class: The modality's input class.
+        create_channel_request: Request model for creating a channel. Its
+            fields are passed to input_class as they are.
+    """
+    label = modality.capitalize()
+
+    def get_state(engine: SimulationEngineDep) -> TeamChatState:
+        state = engine.environment.get_state(modality)
+        if not isinstance(state, state_class):
+            raise HTTPException(
+                status_code=500, detail=f"{label} state not properly initialized"
+            )
+        return state
+
+    async def apply(
+        engine: SimulationEngineDep, operation: str, message: str, **fields: Any
+    ) -> ModalityActionResponse:
+        try:
+            team_chat_input = input_class(
+                timestamp=engine.environment.time_state.current_time,
+                operation=operation,
+                **fields,
+            )
+
+            event = await create_immediate_event(
+                engine=engine,
+                modality=modality,
+                data=team_chat_input,
+                priority=100,
+            )
+            if event.status == EventStatus.FAILED:
+                # Failed events stay in the queue; report why this one failed
+                raise ValueError(event.error_message.split(": ", 1)[-1])
+
+            return ModalityActionResponse(
+                event_id=event.event_id,
+                scheduled_time=event.scheduled_time,
+                status="executed",
+                message=message,
+                modality=modality,
+            )
+        except HTTPException:
+            raise
+        except EngineTimeoutError:
+            raise
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=422, detail=f"Invalid {label} data: {str(e)}"
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid {label} operation: {str(e)}"
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to {operation}: {str(e)}"
+            )
+
+    @router.get("/state", response_model=TeamChatStateResponse)
+    async def get_team_chat_state(engine: SimulationEngineDep):
+        """Get current state: channels with unread counts, without messages.
+
+        Returns:
+            TeamChatStateResponse: Channel summaries, totals and users.
+        """
+        try:
+            state = get_state(engine)
+            snapshot = await run_in_engine(
+                state.get_snapshot, lock=engine.operation_lock.read()
+            )
+            return TeamChatStateResponse(**snapshot)
+        except HTTPException:
+            raise
+        except EngineTimeoutError:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to get {label} state: {str(e)}"
+            )
+
+    @router.post("/query", response_model=TeamChatQueryResponse)
+    async def query_team_chat(
+        request: TeamChatQueryRequest, engine: SimulationEngineDep
+    ):
+        """Query channels, a channel's history, a thread, or mentions.
+
+        History is paged newest first by default; pass a page's next_cursor
+        as cursor to get the next page. Time windows and cursors map to
+        positions in the channel log, so pages cost the same however long
+        the channel is.
+
+        Args:
+            request: Query parameters.
+            engine: The simulation engine dependency.
+
+        Returns:
+            TeamChatQueryResponse: Matching channels or messages.
+
+        Raises:
+            HTTPException: If the channel or thread does not exist.
+        """
+        try:
+            state = get_state(engine)
+            result = await run_in_engine(
+                state.query,
+                request.model_dump(exclude_none=True),
+                lock=engine.operation_lock.read(),
+            )
+            return TeamChatQueryResponse(**result)
+        except HTTPException:
+            raise
+        except EngineTimeoutError:
+            raise
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to query {label}: {str(e)}"
+            )
+
+    @router.post("/channels", response_model=ModalityActionResponse)
+    async def create_channel(
+        request: create_channel_request, engine: SimulationEngineDep
+    ):
+        """Create a channel.
+
+        Args:
+            request: Channel ID, name and settings.
+            engine: The simulation engine dependency.
+
+        Returns:
+            ModalityActionResponse: Confirmation with the event ID.
+        """
+        return await apply(
+            engine,
+            "create_channel",
+            f"Created channel {request.channel_id}",
+            **request.model_dump(),
+        )
+
+    @router.post("/users", response_model=ModalityActionResponse)
+    async def add_user(request: AddUserRequest, engine: SimulationEngineDep):
+        """Add a user, or rename an existing one.
+
+        Args:
+            request: User ID and display name.
+            engine: The simulation engine dependency.
+
+        Returns:
+            ModalityActionResponse: Confirmation with the event ID.
+        """
+        return await apply(
+            engine, "add_user", f"Added user {request.user_id}", **request.model_dump()
+        )
+
+    @router.post("/post", response_model=ModalityActionResponse)
+    async def post_message(request: PostMessageRequest, engine: SimulationEngineDep):
+        """Post a message, or a thread reply, to a channel.
+
+        Args:
+            request: Channel, author, text and optional thread.
+            engine: The simulation engine dependency.
+
+        Returns:
+            ModalityActionResponse: Confirmation with the event ID.
+        """
+        return await apply(
+            engine,
+            "post_message",
+            f"Posted message to {request.channel_id}",
+            **request.model_dump(),
+        )
+
+    @router.post("/edit", response_model=ModalityActionResponse)
+    async def edit_message(request: EditMessageRequest, engine: SimulationEngineDep):
+        """Edit a message's text.
+
+        Args:
+            request: Channel, message and new text.
+            engine: The simulation engine dependency.
+
+        Returns:
+            ModalityActionResponse: Confirmation with the event ID.
+        """
+        return await apply(
+            engine,
+            "edit_message",
+            f"Edited message {request.message_seq} in {request.channel_id}",
+            **request.model_dump(),
+        )
+
+    @router.post("/delete", response_model=ModalityActionResponse)
+    async def delete_message(request: MessageRequest, engine: SimulationEngineDep):
+        """Delete a message.
+
+        Args:
+            request: Channel and message.
+            engine: The simulation engine dependency.
+
+        Returns:
+            ModalityActionResponse: Confirmation with the event ID.
+        """
+        return await apply(
+            engine,
+            "delete_message",
+            f"Deleted message {request.message_seq} in {request.channel_id}",
+            **request.model_dump(),
+        )
+
+    @router.post("/react", response_model=ModalityActionResponse)
+    async def add_reaction(request: ReactionRequest, engine: SimulationEngineDep):
+        """Add a reaction to a message.
+
+        Args:
+            request: Channel, message, emoji and user.
+            engine: The simulation engine dependency.
+
+        Returns:
+            ModalityActionResponse: Confirmation with the event ID.
+        """
+        return await apply(
+            engine,
+            "add_reaction",
+            f"Added :{request.emoji}: to message {request.message_seq}",
+            **request.model_dump(),
+        )
+
+    @router.post("/unreact", response_model=ModalityActionResponse)
+    async def remove_reaction(request: ReactionRequest, engine: SimulationEngineDep):
+        """Remove a reaction from a message.
+
+        Args:
+            request: Channel, message, emoji and user.
+            engine: The simulation engine dependency.
+
+        Returns:
+            ModalityActionResponse: Confirmation with the event ID.
+        """
+        return await apply(
+            engine,
+            "remove_reaction",
+            f"Removed :{request.emoji}: from message {request.message_seq}",
+            **request.model_dump(),
+        )
+
+    @router.post("/read", response_model=ModalityActionResponse)
+    async def mark_read(request: MarkReadRequest, engine: SimulationEngineDep):
+        """Mark a channel read up to a message (default: the latest).
+
+        Args:
+            request: Channel and last message read.
+            engine: The simulation engine dependency.
+
+        Returns:
+            ModalityActionResponse: Confirmation with the event ID.
+        """
+        return await apply(
+            engine,
+            "mark_read",
+            f"Marked {request.channel_id} read",
+            **request.model_dump(),
+        )
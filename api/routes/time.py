@@ -11,12 +11,16 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from api.dependencies import SimulationEngineDep
+from api.exceptions import EngineTimeoutError
+from api.executor import run_in_engine
+from api.wire_format import MessagePackRoute
 from models.simulation import SimulationEngine
 
 
 router = APIRouter(
     prefix="/simulator/time",
     tags=["time"],  # Groups endpoints in the auto-generated docs
+    route_class=MessagePackRoute,
 )
 
 
@@ -160,7 +164,9 @@ async def advance_time(request: AdvanceTimeRequest, engine: SimulationEngineDep)
         # Capture previous time before advancing
         previous_time = engine.environment.time_state.current_time
         
-        result = engine.advance_time(delta=timedelta(seconds=request.seconds))
+        result = await run_in_engine(
+            engine.advance_time, delta=timedelta(seconds=request.seconds)
+        )
         
         # Calculate events_failed from execution_details
         events_failed = sum(
@@ -184,6 +190,8 @@ async def advance_time(request: AdvanceTimeRequest, engine: SimulationEngineDep)
                 for detail in result["execution_details"]
             ],
         )
+    except EngineTimeoutError:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -260,7 +268,9 @@ async def set_time(request: SetTimeRequest, engine: SimulationEngineDep):
         HTTPException: If the target time is invalid or in the past.
     """
     try:
-        result = engine.set_time(new_time=request.target_time, execute_skipped=False)
+        result = await run_in_engine(
+            engine.set_time, new_time=request.target_time, execute_skipped=False
+        )
         
         return SetTimeResponse(
             current_time=datetime.fromisoformat(result["current_time"]),
@@ -268,6 +278,8 @@ async def set_time(request: SetTimeRequest, engine: SimulationEngineDep):
             skipped_events=result["skipped_events"],
             executed_events=result["executed_events"],
         )
+    except EngineTimeoutError:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -300,7 +312,7 @@ async def skip_to_next_event(engine: SimulationEngineDep):
         # Capture previous time before skipping
         previous_time = engine.environment.time_state.current_time
         
-        result = engine.skip_to_next_event()
+        result = await run_in_engine(engine.skip_to_next_event)
         
         # Check if no pending events
         if "message" in result:
@@ -319,6 +331,8 @@ async def skip_to_next_event(engine: SimulationEngineDep):
                 else None
             ),
         )
+    except EngineTimeoutError:
+        raise
     except HTTPException:
         raise
     except ValueError as e:
@@ -348,7 +362,7 @@ async def set_time_scale(request: SetScaleRequest, engine: SimulationEngineDep):
     """
     try:
         # Update time scale
-        engine.environment.time_state.time_scale = request.scale
+        await run_in_engine(engine.set_time_scale, request.scale)
         
         time_state = engine.environment.time_state
         
@@ -367,6 +381,8 @@ async def set_time_scale(request: SetScaleRequest, engine: SimulationEngineDep):
             auto_advance=time_state.auto_advance,
             mode=mode,
         )
+    except EngineTimeoutError:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -392,7 +408,7 @@ async def pause_time(engine: SimulationEngineDep):
     Returns:
         A confirmation message with the current time and pause state.
     """
-    engine.pause()
+    await run_in_engine(engine.pause)
     
     return {
         "message": "Time paused",
@@ -414,7 +430,7 @@ async def resume_time(engine: SimulationEngineDep):
     Returns:
         A confirmation message with the current time and pause state.
     """
-    engine.resume()
+    await run_in_engine(engine.resume)
     
     return {
         "message": "Time resumed",
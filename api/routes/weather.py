@@ -5,20 +5,25 @@ Supports querying weather data for multiple locations with optional filtering
 and unit conversion. Also supports real-time weather queries via OpenWeather API.
 """
 
+import asyncio
 from typing import Any, Literal, Optional
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field, ValidationError
 
 from api.dependencies import SimulationEngineDep
+from api.exceptions import EngineTimeoutError
+from api.executor import run_in_engine
 from api.models import ModalityActionResponse
 from api.utils import create_immediate_event
+from api.wire_format import MessagePackRoute
 from models.modalities.weather_input import WeatherInput, WeatherReport
 from models.modalities.weather_state import WeatherState
 
 router = APIRouter(
     prefix="/weather",
     tags=["weather"],
+    route_class=MessagePackRoute,
 )
 
 
@@ -145,6 +150,10 @@ async def query_weather(request: WeatherQueryRequest, engine: SimulationEngineDe
     Supports querying simulated weather history or real-time weather from
     OpenWeather API. Can filter by time range, exclude sections, and convert units.
 
+    Real weather is fetched on a separate thread before the query runs, so
+    waiting on OpenWeather neither blocks the event loop nor holds the
+    engine lock; the fetched report is then recorded under the write lock.
+
     Args:
         request: Query parameters including location, filters, and options.
         engine: The simulation engine dependency.
@@ -165,7 +174,24 @@ async def query_weather(request: WeatherQueryRequest, engine: SimulationEngineDe
 
     try:
         query_params = request.model_dump(exclude_unset=True)
-        result = weather_state.query(query_params)
+        if request.real:
+            report = await asyncio.to_thread(
+                weather_state.fetch_openweather_report,
+                request.lat,
+                request.lon,
+                request.exclude,
+            )
+            # Recording the fetched report changes the state
+            result = await run_in_engine(
+                weather_state.query_fetched_report,
+                query_params,
+                report,
+                lock=engine.operation_lock.write(),
+            )
+        else:
+            result = await run_in_engine(
+                weather_state.query, query_params, lock=engine.operation_lock.read()
+            )
 
         # Convert dict reports to WeatherReport objects
         reports = []
@@ -178,6 +204,8 @@ async def query_weather(request: WeatherQueryRequest, engine: SimulationEngineDe
             total_count=result.get("total_count", result.get("count", 0)),
             error=result.get("error"),
         )
+    except EngineTimeoutError:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -216,7 +244,7 @@ async def update_weather(request: UpdateWeatherRequest, engine: SimulationEngine
             report=request.report,
         )
 
-        event = create_immediate_event(
+        event = await create_immediate_event(
             engine=engine,
             modality="weather",
             data=weather_input,
@@ -230,6 +258,8 @@ async def update_weather(request: UpdateWeatherRequest, engine: SimulationEngine
             message=f"Weather updated for location ({request.latitude}, {request.longitude})",
             modality="weather",
         )
+    except EngineTimeoutError:
+        raise
     except ValidationError as e:
         # Pydantic validation failed (e.g., lat/lon out of range)
         raise HTTPException(
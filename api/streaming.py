@@ -0,0 +1,342 @@
+"""Streaming JSON and NDJSON encoding for large API responses.
+
+The regular response path builds the complete response as Python objects,
+validates it through a Pydantic response model and then serializes it in one
+go, so peak memory is a multiple of the payload size. The helpers in this
+module encode responses incrementally instead: containers are walked lazily
+and each leaf value is serialized on its own, with output coalesced into
+fixed-size chunks. Peak memory is bounded by the chunk size plus the largest
+batch of rows, regardless of how large the collection being streamed is.
+
+Streamed rows come from live simulation state, which ticks and event
+execution keep changing while the response is sent. Rows are therefore never
+read from the state during encoding: a LockedRows collection builds them in
+bounded batches through run_in_engine(), holding the engine's read lock, and
+each built row is an independent copy that is safe to encode afterwards.
+
+Two wire formats are supported:
+- Chunked JSON: the exact same document the non-streaming endpoint returns.
+- NDJSON (application/x-ndjson): one JSON object per line, used for list
+  results such as query matches and event listings.
+"""
+
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from contextlib import AbstractContextManager
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json, to_jsonable_python
+
+from api.executor import run_in_engine
+
+# Media type for newline-delimited JSON responses
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Target size of each chunk written to the response body
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Number of rows built per locked engine call
+DEFAULT_BATCH_SIZE = 256
+
+
+class JSONObjectStream:
+    """A JSON object whose members are produced lazily.
+
+    Wraps an iterable of (key, value) pairs so that large mappings can be
+    encoded as a JSON object without building an intermediate dict.
+
+    Attributes:
+        items: Iterable or async iterable of (key, value) pairs to encode.
+    """
+
+    def __init__(
+        self, items: Iterable[tuple[str, Any]] | AsyncIterable[tuple[str, Any]]
+    ) -> None:
+        """Initialize the object stream.
+
+        Args:
+            items: Iterable or async iterable of (key, value) pairs to encode.
+        """
+        self.items = items
+
+
+class LockedRows:
+    """Rows built from live state in batches, each batch under a lock.
+
+    Iterating asynchronously hands each batch of sources to run_in_engine()
+    with the lock held, so every row is built from a consistent state and no
+    live object is touched between batches. The lock is only held while a
+    batch is built, never while rows are sent, so a slow client cannot block
+    the simulation.
+
+    Attributes:
+        sources: The objects or keys to build rows from, snapshotted by the
+            caller.
+        build: Called with the lock held for each source. Returns the row,
+            which must not share mutable values with the state, or None to
+            skip a source that no longer exists.
+        lock: Factory for the lock to hold, such as
+            engine.operation_lock.read.
+        batch_size: Number of rows built per locked call.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[Any],
+        build: Callable[[Any], Any],
+        lock: Callable[[], AbstractContextManager],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize the row collection.
+
+        Args:
+            sources: The objects or keys to build rows from.
+            build: Builds the row for a source, or returns None to skip it.
+            lock: Factory for the lock to hold while a batch is built.
+            batch_size: Number of rows built per locked call.
+        """
+        self.sources = sources
+        self.build = build
+        self.lock = lock
+        self.batch_size = batch_size
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        """Build and yield the rows, one locked batch at a time."""
+        for start in range(0, len(self.sources), self.batch_size):
+            rows = await run_in_engine(
+                _build_rows,
+                self.sources[start : start + self.batch_size],
+                self.build,
+                lock=self.lock(),
+            )
+            for row in rows:
+                yield row
+
+
+def _build_rows(sources: Sequence[Any], build: Callable[[Any], Any]) -> list[Any]:
+    """Build the rows for a batch of sources, dropping skipped ones."""
+    rows = []
+    for source in sources:
+        row = build(source)
+        if row is not None:
+            rows.append(row)
+    return rows
+
+
+def locked_mapping_items(
+    mapping: Mapping[str, Any],
+    lock: Callable[[], AbstractContextManager],
+    build: Callable[[Any], Any] = to_jsonable_python,
+) -> LockedRows:
+    """Stream a mapping's entries as rows built under a lock.
+
+    Must be called with the lock held: the keys are snapshotted here
+    (references only, not values). Entries removed before their batch is
+    built are skipped, and entries added since are left out.
+
+    Args:
+        mapping: The mapping to stream.
+        lock: Factory for the lock to hold while a batch is built.
+        build: Copies a value out of the state. Defaults to converting it
+            to JSON-compatible Python data.
+
+    Returns:
+        LockedRows producing (key, copied value) pairs.
+    """
+
+    def build_item(key: str) -> tuple[str, Any] | None:
+        if key not in mapping:
+            return None
+        return key, build(mapping[key])
+
+    return LockedRows(list(mapping.keys()), build_item, lock)
+
+
+def locked_model_fields(
+    model: BaseModel, lock: Callable[[], AbstractContextManager]
+) -> list[tuple[str, Any]]:
+    """Snapshot a model's fields for streaming, deferring large collections.
+
+    Produces the same members as model.model_dump(), except that dict- and
+    list-valued fields (e.g. messages indexed by ID) are copied out in locked
+    batches as they are encoded. Fields of custom types that define their own
+    Pydantic schema (e.g. a screen timeline) are dumped through the model's
+    serializer. Must be called with the lock held.
+
+    Args:
+        model: The Pydantic model to walk.
+        lock: Factory for the lock to hold while a batch is built.
+
+    Returns:
+        (field name, value) pairs.
+    """
+    fields = []
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        if isinstance(value, Mapping):
+            value = JSONObjectStream(locked_mapping_items(value, lock))
+        elif isinstance(value, list):
+            value = LockedRows(list(value), to_jsonable_python, lock)
+        elif not isinstance(value, BaseModel) and hasattr(
+            type(value), "__get_pydantic_core_schema__"
+        ):
+            value = model.model_dump(mode="json", include={name})[name]
+        else:
+            value = to_jsonable_python(value)
+        fields.append((name, value))
+    return fields
+
+
+async def _aiter(items: Iterable[Any] | AsyncIterable[Any]) -> AsyncIterator[Any]:
+    """Iterate over a regular or async iterable asynchronously."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def _iter_json_fragments(value: Any) -> AsyncIterator[bytes]:
+    """Yield JSON-encoded fragments for a value, walking containers lazily.
+
+    Args:
+        value: The value to encode. Mappings and JSONObjectStream instances
+            become objects, lists, tuples, iterators and LockedRows become
+            arrays, and everything else (including Pydantic models) is
+            serialized as a single leaf.
+
+    Yields:
+        Encoded JSON fragments.
+    """
+    if isinstance(value, JSONObjectStream) or isinstance(value, Mapping):
+        items = value.items if isinstance(value, JSONObjectStream) else value.items()
+        yield b"{"
+        first = True
+        async for key, item in _aiter(items):
+            if not first:
+                yield b","
+            first = False
+            yield to_json(str(key))
+            yield b":"
+            async for fragment in _iter_json_fragments(item):
+                yield fragment
+        yield b"}"
+    elif isinstance(value, (list, tuple, Iterator, LockedRows)):
+        yield b"["
+        first = True
+        async for item in _aiter(value):
+            if not first:
+                yield b","
+            first = False
+            async for fragment in _iter_json_fragments(item):
+                yield fragment
+        yield b"]"
+    else:
+        yield to_json(value)
+
+
+async def _buffered(
+    fragments: AsyncIterable[bytes], chunk_size: int
+) -> AsyncIterator[bytes]:
+    """Coalesce small fragments into chunks of roughly chunk_size bytes.
+
+    Args:
+        fragments: The fragments to coalesce.
+        chunk_size: Target size of each emitted chunk.
+
+    Yields:
+        Chunks of encoded output.
+    """
+    buffer = bytearray()
+    async for fragment in fragments:
+        buffer += fragment
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def iter_json(
+    value: Any, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Encode a value as a single JSON document, yielding it in chunks.
+
+    Args:
+        value: The value to encode (see _iter_json_fragments for the
+            supported container types).
+        chunk_size: Target size of each emitted chunk.
+
+    Yields:
+        Chunks of the encoded JSON document.
+    """
+    async for chunk in _buffered(_iter_json_fragments(value), chunk_size):
+        yield chunk
+
+
+async def iter_ndjson(
+    items: Iterable[Any] | AsyncIterable[Any], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Encode items as newline-delimited JSON, yielding it in chunks.
+
+    Args:
+        items: The items to encode, one JSON document per line, such as
+            LockedRows.
+        chunk_size: Target size of each emitted chunk.
+
+    Yields:
+        Chunks of NDJSON output.
+    """
+    lines = (to_json(item) + b"\n" async for item in _aiter(items))
+    async for chunk in _buffered(lines, chunk_size):
+        yield chunk
+
+
+def accepts_ndjson(accept: str | None) -> bool:
+    """Check whether an Accept header asks for NDJSON.
+
+    Args:
+        accept: The raw Accept header value, if any.
+
+    Returns:
+        True if NDJSON is one of the accepted media types.
+    """
+    if not accept:
+        return False
+    return any(
+        part.split(";")[0].strip() == NDJSON_MEDIA_TYPE for part in accept.split(",")
+    )
+
+
+def streaming_json_response(value: Any) -> StreamingResponse:
+    """Create a chunked JSON response for a lazily encoded value.
+
+    Args:
+        value: The value to encode.
+
+    Returns:
+        A StreamingResponse with media type application/json.
+    """
+    return StreamingResponse(iter_json(value), media_type="application/json")
+
+
+def ndjson_response(items: Iterable[Any] | AsyncIterable[Any]) -> StreamingResponse:
+    """Create an NDJSON response that encodes items one at a time.
+
+    Args:
+        items: The items to encode, one per line.
+
+    Returns:
+        A StreamingResponse with media type application/x-ndjson.
+    """
+    return StreamingResponse(iter_ndjson(items), media_type=NDJSON_MEDIA_TYPE)
@@ -9,11 +9,13 @@ from typing import Any
 
 from fastapi import HTTPException
 
+from api.exceptions import EngineTimeoutError
+from api.executor import run_in_engine
 from models.event import SimulatorEvent
 from models.simulation import SimulationEngine
 
 
-def create_immediate_event(
+async def create_immediate_event(
     engine: SimulationEngine,
     modality: str,
     data: dict[str, Any],
@@ -23,7 +25,9 @@ def create_immediate_event(
     
     This is a common pattern for all modality action endpoints. Creates
     an event scheduled at the current simulator time with high priority,
-    and executes it immediately with undo capture.
+    and executes it immediately with undo capture. Execution goes through
+    the engine's single writer path on the engine worker pool, so it never
+    interleaves with ticks or other writes.
     
     Args:
         engine: The SimulationEngine instance.
@@ -36,6 +40,7 @@ def create_immediate_event(
     
     Raises:
         HTTPException: If event creation or execution fails.
+        EngineTimeoutError: If execution does not finish within the timeout.
     """
     try:
         current_time = engine.environment.time_state.current_time
@@ -48,17 +53,11 @@ def create_immediate_event(
             created_at=current_time,
         )
         
-        engine.add_event(event)
-        
-        # Execute the event immediately with undo capture
-        undo_entry = event.execute(engine.environment, capture_undo=True)
-        
-        # Push undo entry to undo stack if captured
-        if undo_entry is not None:
-            engine.undo_stack.push(undo_entry)
-        
-        return event
+        # Add and execute the event with undo capture as one write
+        return await run_in_engine(engine.execute_immediate_event, event)
     
+    except EngineTimeoutError:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -0,0 +1,296 @@
+"""MessagePack content negotiation for API requests and responses.
+
+JSON encoding and decoding dominate CPU time when clients pull large modality
+states. Every route therefore also speaks MessagePack (application/msgpack):
+- Requests whose Content-Type is application/msgpack have their body decoded
+  with MessagePack and then validated exactly like a JSON body.
+- Responses are encoded with MessagePack when the Accept header prefers it.
+  Response models are dumped in Python mode and packed directly, so
+  timezone-aware datetimes travel as native MessagePack timestamps rather
+  than ISO strings.
+
+Responses that endpoints build themselves (streaming JSON, NDJSON) and error
+responses produced by exception handlers are always JSON, except those built
+with unvalidated_response(), which negotiates like a response model.
+"""
+
+import functools
+import inspect
+from collections.abc import Callable
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any
+
+import msgpack
+from fastapi import Request, Response
+from fastapi.exceptions import ResponseValidationError
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from api.middleware import mark_endpoint_finished
+
+# Media type for MessagePack request and response bodies
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Media types accepted as MessagePack, including common legacy spellings
+MSGPACK_MEDIA_TYPES = frozenset(
+    {MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"}
+)
+
+# Whether the response to the request being handled should be MessagePack
+_respond_with_msgpack: ContextVar[bool] = ContextVar(
+    "respond_with_msgpack", default=False
+)
+
+
+def _media_type(value: str) -> str:
+    """Return the bare, lower-cased media type of a header value."""
+    return value.split(";")[0].strip().lower()
+
+
+def _quality(value: str) -> float:
+    """Return the q parameter of an Accept header entry (default 1.0)."""
+    for param in value.split(";")[1:]:
+        name, _, q = param.partition("=")
+        if name.strip() == "q":
+            try:
+                return float(q)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def is_msgpack(content_type: str | None) -> bool:
+    """Check whether a Content-Type header denotes MessagePack.
+
+    Args:
+        content_type: The raw Content-Type header value, if any.
+
+    Returns:
+        True if the body is MessagePack.
+    """
+    return bool(content_type) and _media_type(content_type) in MSGPACK_MEDIA_TYPES
+
+
+def accepts_msgpack(accept: str | None) -> bool:
+    """Check whether an Accept header prefers MessagePack over JSON.
+
+    Args:
+        accept: The raw Accept header value, if any.
+
+    Returns:
+        True if MessagePack is accepted with a quality at least as high as
+        that of JSON.
+    """
+    if not accept:
+        return False
+    msgpack_q = 0.0
+    json_q = 0.0
+    for part in accept.split(","):
+        media_type = _media_type(part)
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_q = max(msgpack_q, _quality(part))
+        elif media_type == "application/json":
+            json_q = max(json_q, _quality(part))
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+def _default(value: Any) -> Any:
+    """Convert values MessagePack cannot pack natively.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        A packable representation: naive datetimes become ISO strings (the
+        timestamp type requires a timezone), models are dumped in Python
+        mode, and anything else falls back to its JSON-compatible form.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="python")
+    return to_jsonable_python(value)
+
+
+def packb(value: Any) -> bytes:
+    """Encode a value as MessagePack.
+
+    Args:
+        value: The value to encode.
+
+    Returns:
+        The encoded bytes.
+    """
+    return msgpack.packb(value, datetime=True, default=_default)
+
+
+def unpackb(data: bytes) -> Any:
+    """Decode MessagePack bytes, restoring timestamps as aware datetimes.
+
+    Args:
+        data: The encoded bytes.
+
+    Returns:
+        The decoded value.
+    """
+    return msgpack.unpackb(data, timestamp=3)
+
+
+class MessagePackResponse(Response):
+    """Response whose content is encoded with MessagePack."""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return packb(content)
+
+
+def unvalidated_response(content: BaseModel) -> Response:
+    """Encode a model as the response without validating it again.
+
+    Returning a model from a route validates it against the route's response
+    model before encoding. Routes return this instead for models that must
+    not be re-validated, such as projected query results: partial dicts that
+    happen to hold every required field would otherwise be validated as full
+    models and gain every unrequested field with its default. The client's
+    choice of MessagePack or JSON is still honoured.
+
+    Args:
+        content: The model to encode.
+
+    Returns:
+        A MessagePackResponse if the client prefers MessagePack, otherwise a
+        JSON Response.
+    """
+    if _respond_with_msgpack.get():
+        return MessagePackResponse(content.model_dump(mode="python"))
+    return Response(content.model_dump_json(), media_type="application/json")
+
+
+class MessagePackRequest(Request):
+    """Request whose MessagePack body is decoded in place of JSON."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = unpackb(await self.body())
+        return self._json
+
+
+class MessagePackRoute(APIRoute):
+    """Route that negotiates MessagePack for request and response bodies.
+
+    MessagePack request bodies are handed to FastAPI as if they were JSON, so
+    body validation is unchanged. When the client prefers MessagePack, the
+    endpoint's return value is validated against the route's response model
+    as usual and then packed instead of being serialized to JSON.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, self._negotiating(endpoint), **kwargs)
+
+    def _negotiating(self, endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap an endpoint so its result can be returned as MessagePack.
+
+        Args:
+            endpoint: The path operation function.
+
+        Returns:
+            A function with the same signature that returns a
+            MessagePackResponse when the client asked for one. It also marks
+            when the endpoint finished, so encoding counts as serialization
+            time in request metrics.
+        """
+        if inspect.isgeneratorfunction(endpoint) or inspect.isasyncgenfunction(endpoint):
+            return endpoint
+
+        if inspect.iscoroutinefunction(endpoint):
+
+            @functools.wraps(endpoint)
+            async def negotiating_endpoint(*args: Any, **kwargs: Any) -> Any:
+                content = await endpoint(*args, **kwargs)
+                mark_endpoint_finished()
+                return self._encode(content)
+
+        else:
+
+            @functools.wraps(endpoint)
+            def negotiating_endpoint(*args: Any, **kwargs: Any) -> Any:
+                content = endpoint(*args, **kwargs)
+                mark_endpoint_finished()
+                return self._encode(content)
+
+        return negotiating_endpoint
+
+    def _encode(self, content: Any) -> Any:
+        """Encode an endpoint result as MessagePack if it was requested.
+
+        Args:
+            content: The endpoint's return value.
+
+        Returns:
+            The value unchanged for JSON clients or when it already is a
+            Response, otherwise a MessagePackResponse.
+
+        Raises:
+            ResponseValidationError: If the value does not match the route's
+                response model.
+        """
+        if not _respond_with_msgpack.get() or isinstance(content, Response):
+            return content
+        return MessagePackResponse(
+            self.serialize(content), status_code=self.status_code or 200
+        )
+
+    def serialize(self, content: Any) -> Any:
+        """Validate an endpoint result and dump it in Python mode.
+
+        Args:
+            content: The endpoint's return value, not a Response.
+
+        Returns:
+            The value dumped through the route's response model (datetimes
+            stay datetime objects), or unchanged if the route has none.
+
+        Raises:
+            ResponseValidationError: If the value does not match the route's
+                response model.
+        """
+        if self.response_field is None:
+            return content
+        value, errors = self.response_field.validate(content, {}, loc=("response",))
+        if errors:
+            raise ResponseValidationError(errors=errors, body=content)
+        return self.response_field.serialize(
+            value,
+            mode="python",
+            include=self.response_model_include,
+            exclude=self.response_model_exclude,
+            by_alias=self.response_model_by_alias,
+            exclude_unset=self.response_model_exclude_unset,
+            exclude_defaults=self.response_model_exclude_defaults,
+            exclude_none=self.response_model_exclude_none,
+        )
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        handler = super().get_route_handler()
+
+        async def negotiating_handler(request: Request) -> Response:
+            if is_msgpack(request.headers.get("content-type")):
+                # Present the body as JSON so FastAPI hands it to json()
+                scope = dict(request.scope)
+                scope["headers"] = [
+                    (name, b"application/json" if name == b"content-type" else value)
+                    for name, value in request.scope["headers"]
+                ]
+                request = MessagePackRequest(scope, request.receive)
+            token = _respond_with_msgpack.set(
+                accepts_msgpack(request.headers.get("accept"))
+            )
+            try:
+                return await handler(request)
+            finally:
+                _respond_with_msgpack.reset(token)
+
+        return negotiating_handler
@@ -0,0 +1,13 @@
+"""Performance benchmarks for UES.
+
+The benchmark suite (python -m benchmarks) times the core data structures and
+the API at increasing sizes, writes machine-readable JSON results, and can
+compare a run against a stored baseline so CI can flag slowdowns. See
+benchmarks/__main__.py for usage.
+
+The bench_*.py scripts in this directory are standalone experiments that
+compare two ways of doing the same thing (for example, with and without
+metrics), or measure memory and scale beyond what the suite runs, and print
+a table. Anything worth tracking over time belongs in a suite_*.py module,
+imported by __main__.py, so it is checked against benchmarks/baseline.json.
+"""
@@ -0,0 +1,134 @@
+"""Run the benchmark suite.
+
+Run from the repository root:
+
+    python -m benchmarks [--filter PATTERN ...] [--max-size N] [--repeat N]
+        [--output FILE] [--baseline FILE] [--threshold FRACTION] [--list]
+
+Examples:
+
+    # Quick run of everything up to 10k, saved as the new baseline
+    python -m benchmarks --output benchmarks/baseline.json
+
+    # Queue benchmarks up to 1M, checked against the baseline
+    python -m benchmarks --filter "queue.*" --max-size 1000000 \\
+        --baseline benchmarks/baseline.json
+
+Results print as they complete. With --baseline, every result that has a
+baseline entry is compared against it, and the exit status is 1 if any is
+more than --threshold slower, so CI can fail the build. Baselines are only
+meaningful on the machine that recorded them.
+
+benchmarks/baseline.json is the committed baseline: every benchmark at the
+default sizes (up to 10k). The file records the Python version and platform
+it came from. Regenerate it on the machine that will run the comparison,
+and commit it whenever benchmarks are added or an intended change moves
+their timings:
+
+    python -m benchmarks --output benchmarks/baseline.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Importing the suites registers their benchmarks, which run in this order
+from benchmarks import suite_queue  # noqa: F401
+from benchmarks import suite_modalities  # noqa: F401
+from benchmarks import suite_records  # noqa: F401
+from benchmarks import suite_engine  # noqa: F401
+from benchmarks import suite_parse  # noqa: F401
+from benchmarks import suite_api  # noqa: F401
+from benchmarks import suite_client  # noqa: F401
+from benchmarks.harness import (
+    BenchmarkResult,
+    compare,
+    get_benchmarks,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+
+
+def print_result(result: BenchmarkResult) -> None:
+    """Print one result as a table row."""
+    print(
+        f"{result.name:<36}{result.size:>10,}{result.median_seconds * 1000:>14.2f}"
+        f"{result.ops_per_second:>16,.0f}",
+        flush=True,
+    )
+
+
+def main() -> int:
+    """Run the selected benchmarks.
+
+    Returns:
+        Exit status: 1 if any benchmark regressed against the baseline.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run the UES benchmark suite."
+    )
+    parser.add_argument(
+        "--filter",
+        action="append",
+        metavar="PATTERN",
+        help='Only run benchmarks matching this pattern, such as "queue.*" '
+        "(may be repeated)",
+    )
+    parser.add_argument(
+        "--max-size", type=int, default=10_000, help="Largest problem size to run"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions")
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="Compare against this JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Slowdown that counts as a regression (default 0.2, i.e. 20%%)",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List benchmarks and their sizes"
+    )
+    args = parser.parse_args()
+
+    benchmarks = get_benchmarks(args.filter)
+    if args.list:
+        for bench in benchmarks:
+            print(f"{bench.name:<36}{', '.join(f'{s:,}' for s in bench.sizes)}")
+        return 0
+    if not benchmarks:
+        parser.error(f"no benchmarks match {args.filter}")
+
+    print(f"{'benchmark':<36}{'size':>10}{'median ms':>14}{'ops/s':>16}")
+    results = run_benchmarks(benchmarks, args.max_size, args.repeat, print_result)
+
+    if args.output is not None:
+        write_results(args.output, results)
+        print(f"\nwrote {len(results)} results to {args.output}")
+
+    if args.baseline is None:
+        return 0
+
+    comparisons = compare(results, load_results(args.baseline), args.threshold)
+    print(
+        f"\n{'benchmark':<36}{'size':>10}{'baseline min ms':>18}"
+        f"{'min ms':>12}{'change':>10}"
+    )
+    for comparison in comparisons:
+        marker = "  REGRESSION" if comparison.regressed else ""
+        print(
+            f"{comparison.name:<36}{comparison.size:>10,}"
+            f"{comparison.baseline_seconds * 1000:>18.2f}"
+            f"{comparison.seconds * 1000:>12.2f}{comparison.change:>+10.1%}{marker}"
+        )
+    regressions = sum(comparison.regressed for comparison in comparisons)
+    print(
+        f"\n{regressions} of {len(comparisons)} results regressed by more than "
+        f"{args.threshold:.0%}"
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
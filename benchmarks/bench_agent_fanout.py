@@ -0,0 +1,167 @@
+"""Benchmark many concurrent agents sharing one AsyncUESClient.
+
+Starts the API with uvicorn on a local port, then runs 100 agents (asyncio
+tasks) against it through one shared client. Each round an agent fetches the
+email, SMS, calendar and location states and moves the user, the usual
+observe-then-act loop. The run is repeated with httpx's default connection
+pool (at most 20 idle connections kept), with the client's pool defaults,
+and with the states fetched one at a time instead of with gather_states().
+Run from the repository root:
+
+    python benchmarks/bench_agent_fanout.py [--agents N] [--rounds N]
+        [--concurrency N]
+
+HTTP/2 is not measured: uvicorn only speaks HTTP/1.1.
+"""
+
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_loop_latency import percentile  # noqa: E402
+from client import AsyncUESClient  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modalities each agent observes per round
+OBSERVED = ["email", "sms", "calendar", "location"]
+
+# httpx.Limits() defaults, for comparison with the client's own
+HTTPX_DEFAULT_POOL = {
+    "max_connections": 100,
+    "max_keepalive_connections": 20,
+    "keepalive_expiry": 5.0,
+}
+
+
+def free_port() -> int:
+    """Return a TCP port that is free on localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int) -> subprocess.Popen:
+    """Start the API with uvicorn and wait until it answers.
+
+    Args:
+        port: Port to listen on.
+
+    Returns:
+        The server process.
+    """
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=ROOT,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/health").raise_for_status()
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("Server did not start")
+
+
+async def agent(
+    client: AsyncUESClient, index: int, rounds: int, concurrency: int
+) -> list[float]:
+    """Run one agent's observe-then-act loop.
+
+    Args:
+        client: The shared client.
+        index: Agent number, used to vary its writes.
+        rounds: Rounds to run.
+        concurrency: gather_states() concurrency; 0 fetches one at a time.
+
+    Returns:
+        The duration of each round in milliseconds.
+    """
+    timings = []
+    for i in range(rounds):
+        start = time.perf_counter()
+        if concurrency:
+            await client.gather_states(OBSERVED, concurrency=concurrency)
+        else:
+            for name in OBSERVED:
+                await getattr(client, name).get_state()
+        await client.location.update(latitude=40.0 + index * 1e-3, longitude=-74.0 + i * 1e-5)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def run(
+    base_url: str, agents: int, rounds: int, concurrency: int, pool: dict
+) -> tuple[float, list[float]]:
+    """Run all agents through one client.
+
+    Returns:
+        Elapsed seconds and every round's duration in milliseconds.
+    """
+    async with AsyncUESClient(base_url=base_url, **pool) as client:
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(agent(client, index, rounds, concurrency) for index in range(agents))
+        )
+        elapsed = time.perf_counter() - start
+    return elapsed, [timing for timings in results for timing in timings]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=100, help="Concurrent agents")
+    parser.add_argument("--rounds", type=int, default=10, help="Rounds per agent")
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="gather_states() concurrency"
+    )
+    args = parser.parse_args()
+
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = start_server(port)
+    try:
+        httpx.post(f"{base_url}/simulation/start", json={"auto_advance": False})
+        configurations = [
+            ("httpx default pool", args.concurrency, HTTPX_DEFAULT_POOL),
+            ("client default pool", args.concurrency, {}),
+            ("sequential states", 0, {}),
+        ]
+        print(f"agents: {args.agents}, rounds: {args.rounds}")
+        print(f"{'configuration':<22}{'rounds/s':>10}{'p50 ms':>10}{'p95 ms':>10}")
+        for name, concurrency, pool in configurations:
+            # Start each configuration from an empty location history
+            httpx.post(f"{base_url}/simulation/clear").raise_for_status()
+            elapsed, timings = asyncio.run(
+                run(base_url, args.agents, args.rounds, concurrency, pool)
+            )
+            print(
+                f"{name:<22}{len(timings) / elapsed:>10,.0f}"
+                f"{percentile(timings, 0.5):>10.1f}{percentile(timings, 0.95):>10.1f}"
+            )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
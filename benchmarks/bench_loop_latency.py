@@ -0,0 +1,162 @@
+"""Benchmark event-loop latency while heavy engine work runs.
+
+Fills a large mailbox, then measures /health and /simulator/time latency from
+one thread while other threads keep issuing full-text email queries. The run is
+repeated with engine work inline on the event loop (UES_ENGINE_WORKERS=0, the
+old behavior) and on the engine worker pool. With the pool, the cheap reads
+should stay close to their idle latency. Run from the repository root:
+
+    python benchmarks/bench_loop_latency.py [--emails N] [--samples N] [--heavy-threads N]
+        [--workers N]
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from api.dependencies import get_simulation_engine  # noqa: E402
+from api.executor import initialize_engine_executor  # noqa: E402
+from benchmarks.bench_wire_format import populate_email  # noqa: E402
+from main import app  # noqa: E402
+
+PROBES = ["/health", "/simulator/time"]
+
+# Matches nothing, so every query scans every body
+HEAVY_QUERY = {"body_contains": "no such phrase", "limit": 10}
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Return the given percentile of a list of samples.
+
+    Args:
+        samples: Measured values.
+        fraction: Percentile as a fraction between 0 and 1.
+
+    Returns:
+        The value below which the given fraction of samples fall.
+    """
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def hammer(client: TestClient, stop: threading.Event, counter: list[int]) -> None:
+    """Issue heavy queries until told to stop.
+
+    Args:
+        client: The test client to send requests with.
+        stop: Event that ends the loop.
+        counter: Single-item list incremented per completed query.
+    """
+    while not stop.is_set():
+        client.post("/email/query", json=HEAVY_QUERY).raise_for_status()
+        counter[0] += 1
+
+
+def probe(client: TestClient, path: str, samples: int) -> list[float]:
+    """Time cheap reads of one endpoint.
+
+    Args:
+        client: The test client to send requests with.
+        path: Endpoint path.
+        samples: Number of timed requests.
+
+    Returns:
+        Latencies in milliseconds.
+    """
+    for _ in range(10):
+        client.get(path)  # warm up
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        client.get(path).raise_for_status()
+        timings.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.002)
+    return timings
+
+
+def run(client: TestClient, workers: int, samples: int, heavy_threads: int) -> list[tuple]:
+    """Measure probe latency idle and under load for one pool size.
+
+    Args:
+        client: The test client to send requests with.
+        workers: Engine worker count (0 runs engine work inline).
+        samples: Timed requests per probe and condition.
+        heavy_threads: Number of threads issuing heavy queries.
+
+    Returns:
+        Rows of (mode, path, idle p50, idle p99, loaded p50, loaded p99,
+        heavy queries completed).
+    """
+    initialize_engine_executor(max_workers=workers)
+    mode = "inline" if workers == 0 else f"pool ({workers})"
+    rows = []
+    for path in PROBES:
+        idle = probe(client, path, samples)
+
+        stop = threading.Event()
+        counter = [0]
+        threads = [
+            threading.Thread(target=hammer, args=(client, stop, counter))
+            for _ in range(heavy_threads)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        loaded = probe(client, path, samples)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        rows.append(
+            (
+                mode,
+                path,
+                statistics.median(idle),
+                percentile(idle, 0.99),
+                statistics.median(loaded),
+                percentile(loaded, 0.99),
+                counter[0],
+            )
+        )
+    return rows
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--emails", type=int, default=20000, help="Mailbox size")
+    parser.add_argument("--samples", type=int, default=200, help="Probes per run")
+    parser.add_argument("--heavy-threads", type=int, default=2, help="Query threads")
+    parser.add_argument("--workers", type=int, default=4, help="Pool size to compare")
+    args = parser.parse_args()
+
+    rows = []
+    with TestClient(app) as client:
+        populate_email(get_simulation_engine().environment.get_state("email"), args.emails)
+        rows += run(client, 0, args.samples, args.heavy_threads)
+        rows += run(client, args.workers, args.samples, args.heavy_threads)
+
+    print(
+        f"emails: {args.emails}, samples: {args.samples}, "
+        f"heavy threads: {args.heavy_threads}"
+    )
+    print(
+        f"{'mode':<10}{'endpoint':<18}{'idle p50':>10}{'idle p99':>10}"
+        f"{'load p50':>10}{'load p99':>10}{'queries':>9}"
+    )
+    for mode, path, idle_p50, idle_p99, load_p50, load_p99, queries in rows:
+        print(
+            f"{mode:<10}{path:<18}{idle_p50:>10.2f}{idle_p99:>10.2f}"
+            f"{load_p50:>10.2f}{load_p99:>10.2f}{queries:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
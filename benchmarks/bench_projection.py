@@ -0,0 +1,104 @@
+"""Benchmark full vs projected email queries.
+
+Populates an email state with a realistic mailbox and compares the response
+size and end-to-end latency of POST /email/query with and without a fields
+projection. Run from the repository root:
+
+    python benchmarks/bench_projection.py [--emails N] [--repeat N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from api.dependencies import get_simulation_engine  # noqa: E402
+from main import app  # noqa: E402
+from models.modalities.email_input import EmailInput  # noqa: E402
+from models.modalities.email_state import EmailState  # noqa: E402
+
+PROJECTION = ["message_id", "from_address", "subject", "received_at", "is_read"]
+
+
+def populate(email_state: EmailState, count: int) -> None:
+    """Fill an email state with received emails.
+
+    Args:
+        email_state: The state to populate.
+        count: Number of emails to add.
+    """
+    base_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    body = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 40
+    for i in range(count):
+        timestamp = base_time + timedelta(minutes=i)
+        email_state.apply_input(
+            EmailInput(
+                timestamp=timestamp,
+                operation="receive",
+                from_address=f"sender{i % 50}@example.com",
+                to_addresses=["user@example.com"],
+                cc_addresses=[f"cc{i % 7}@example.com"],
+                subject=f"Quarterly report {i}",
+                body_text=body,
+                body_html=f"<p>{body}</p>",
+                labels=["work", f"project-{i % 5}"],
+            )
+        )
+
+
+def measure(client: TestClient, payload: dict, repeat: int) -> tuple[int, float]:
+    """Time a query endpoint call.
+
+    Args:
+        client: The test client to send requests with.
+        payload: The query request body.
+        repeat: Number of timed repetitions.
+
+    Returns:
+        Tuple of (response size in bytes, median latency in milliseconds).
+    """
+    size = 0
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.post("/email/query", json=payload)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        size = len(response.content)
+    return size, statistics.median(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--emails", type=int, default=2000, help="Mailbox size")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed repetitions")
+    args = parser.parse_args()
+
+    with TestClient(app) as client:
+        email_state = get_simulation_engine().environment.get_state("email")
+        populate(email_state, args.emails)
+
+        full_size, full_ms = measure(client, {}, args.repeat)
+        projected_size, projected_ms = measure(
+            client, {"fields": PROJECTION}, args.repeat
+        )
+
+    print(f"emails: {args.emails}, repeat: {args.repeat}")
+    print(f"{'query':<12}{'bytes':>14}{'median ms':>12}")
+    print(f"{'full':<12}{full_size:>14,}{full_ms:>12.2f}")
+    print(f"{'projected':<12}{projected_size:>14,}{projected_ms:>12.2f}")
+    print(
+        f"size reduction: {full_size / projected_size:.1f}x, "
+        f"speedup: {full_ms / projected_ms:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
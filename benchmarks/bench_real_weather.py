@@ -0,0 +1,141 @@
+"""Benchmark fetching real weather through WeatherProvider.
+
+Starts the local OpenWeather stand-in (scenarios/openweather.py) with a
+simulated network latency and fetches reports for a few locations the way
+WeatherState.query() with real=true did before WeatherProvider (a bare
+requests.get() per query) and through a WeatherProvider with its cache off
+and on. Then fetches one location from several threads at once, with the
+cache off, to show coalescing. Run from the repository root:
+
+    python benchmarks/bench_real_weather.py [--queries N] [--locations N]
+        [--latency SECONDS] [--threads N]
+"""
+
+import argparse
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from models.modalities.weather_input import WeatherReport  # noqa: E402
+from models.modalities.weather_provider import WeatherProvider  # noqa: E402
+from scenarios.openweather import ONECALL_PATH  # noqa: E402
+
+API_KEY = "benchmark"
+
+
+def start_standin(latency: float) -> tuple[subprocess.Popen, str]:
+    """Start the stand-in on a free port and wait until it answers.
+
+    Args:
+        latency: Seconds the stand-in waits before answering.
+
+    Returns:
+        Tuple of (server process, One Call URL).
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "scenarios.openweather",
+            "--port",
+            str(port),
+            "--latency",
+            str(latency),
+        ],
+        cwd=ROOT,
+    )
+    url = f"http://127.0.0.1:{port}{ONECALL_PATH}"
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            requests.get(url, timeout=1)
+            return process, url
+        except requests.ConnectionError:
+            if time.monotonic() > deadline:
+                process.terminate()
+                raise RuntimeError("OpenWeather stand-in did not start")
+            time.sleep(0.1)
+
+
+def fetch_bare(url: str, lat: float, lon: float) -> WeatherReport:
+    """Fetch a report the way WeatherState did before WeatherProvider."""
+    response = requests.get(
+        url,
+        params={"lat": lat, "lon": lon, "appid": API_KEY, "units": "standard"},
+        timeout=10,
+    )
+    response.raise_for_status()
+    return WeatherReport(**response.json())
+
+
+def measure(fetch: Callable[[float, float], object], locations: list, queries: int) -> float:
+    """Return the mean milliseconds per query, cycling through the locations."""
+    start = time.perf_counter()
+    for i in range(queries):
+        lat, lon = locations[i % len(locations)]
+        fetch(lat, lon)
+    return (time.perf_counter() - start) * 1000 / queries
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=100, help="Queries per variant")
+    parser.add_argument("--locations", type=int, default=5, help="Distinct locations")
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="Simulated API latency in seconds"
+    )
+    parser.add_argument("--threads", type=int, default=16, help="Concurrent fetches")
+    args = parser.parse_args()
+
+    locations = [(10.0 * i - 40, 20.0 * i - 80) for i in range(args.locations)]
+    process, url = start_standin(args.latency)
+    try:
+        uncached = WeatherProvider(base_url=url, cache_ttl=0)
+        cached = WeatherProvider(base_url=url)
+        variants = (
+            ("requests.get", lambda lat, lon: fetch_bare(url, lat, lon), None),
+            ("provider, no cache", lambda lat, lon: uncached.fetch(lat, lon, API_KEY), uncached),
+            ("provider, cache", lambda lat, lon: cached.fetch(lat, lon, API_KEY), cached),
+        )
+
+        print(
+            f"queries: {args.queries}, locations: {args.locations}, "
+            f"latency: {args.latency * 1000:.0f} ms"
+        )
+        print(f"{'variant':<22}{'ms/query':>10}{'requests':>10}")
+        for name, fetch, provider in variants:
+            latency = measure(fetch, locations, args.queries)
+            made = provider.stats.requests if provider else args.queries
+            print(f"{name:<22}{latency:>10.2f}{made:>10}")
+
+        coalescing = WeatherProvider(base_url=url, cache_ttl=0)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            for _ in range(args.threads):
+                pool.submit(coalescing.fetch, *locations[0], API_KEY)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(
+            f"\n{args.threads} concurrent fetches of one location: "
+            f"{coalescing.stats.requests} request(s), "
+            f"{coalescing.stats.coalesced} coalesced, {elapsed:.0f} ms"
+        )
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main()
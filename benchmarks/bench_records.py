@@ -0,0 +1,106 @@
+"""Benchmark compact entity records against the Pydantic models they mirror.
+
+Modality states hold their high-volume entities (emails, SMS and chat
+messages, calendar events, location and weather history entries) as slotted
+records. For each entity this fills a state through apply_input(), then
+compares holding the same entities as Pydantic models (the previous
+storage) and as records:
+- Memory: bytes held per entity, measured with tracemalloc. Both are built
+  by validating the entity's dumped fields, so both hold their own copies of
+  lists and other values and the difference is the per-object overhead.
+- Construction: microseconds to build one entity from its field values, as
+  apply_input() does for every new entity (validated model construction
+  before, plain record construction now).
+- Serialization: microseconds to model_dump() one entity.
+
+The record-only construction and serialization timings also run in the
+benchmark suite (python -m benchmarks --filter "records.*"), where they are
+compared against the baseline. Run from the repository root:
+
+    python benchmarks/bench_records.py [--count N] [--repeat N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.workloads import stored_records  # noqa: E402
+
+
+def measure_memory(build: Callable[[], list]) -> int:
+    """Return the bytes allocated by build() that are still held after it.
+
+    Args:
+        build: Function creating the stored entities.
+
+    Returns:
+        Allocated bytes held by its result.
+    """
+    tracemalloc.start()
+    stored = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del stored
+    return size
+
+
+def measure_each(fn: Callable, items: list, repeat: int) -> float:
+    """Return the median time to call fn on one item, in microseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        timings.append((time.perf_counter() - start) / len(items) * 1e6)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000, help="Entities per modality")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions")
+    args = parser.parse_args()
+
+    print(
+        f"{'entity':<28}{'count':>7}{'model B':>10}{'record B':>10}"
+        f"{'build us':>10}{'record us':>11}{'dump us':>9}{'record us':>11}"
+    )
+    for modality in ("email", "sms", "chat", "calendar", "location", "weather"):
+        records = stored_records(modality, args.count)
+        record_type = type(records[0])
+        model_type = record_type.model
+        dumps = [record.model_dump() for record in records]
+        fields = [
+            {name: getattr(record, name) for name in record_type.__slots__}
+            for record in records
+        ]
+        models = [model_type.model_validate(dump) for dump in dumps]
+
+        model_memory = measure_memory(
+            lambda: [model_type.model_validate(dump) for dump in dumps]
+        )
+        record_memory = measure_memory(
+            lambda: [record_type.model_validate(dump) for dump in dumps]
+        )
+        model_build = measure_each(lambda f: model_type(**f), fields, args.repeat)
+        record_build = measure_each(lambda f: record_type(**f), fields, args.repeat)
+        model_dump = measure_each(lambda m: m.model_dump(), models, args.repeat)
+        record_dump = measure_each(lambda r: r.model_dump(), records, args.repeat)
+
+        print(
+            f"{model_type.__name__:<28}{len(records):>7,}"
+            f"{model_memory / len(records):>10,.0f}{record_memory / len(records):>10,.0f}"
+            f"{model_build:>10.2f}{record_build:>11.2f}"
+            f"{model_dump:>9.2f}{record_dump:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
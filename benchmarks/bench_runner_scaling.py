@@ -0,0 +1,84 @@
+"""Benchmark how the headless scenario runner scales with worker processes.
+
+Generates a batch of scenario files (one per seed), then runs the whole batch
+with 1, 2, 4, ... worker processes up to the CPU count and reports throughput
+and speedup over a single worker. Scenarios share nothing, so the speedup
+should stay close to the worker count until the machine runs out of cores.
+Run from the repository root:
+
+    python benchmarks/bench_runner_scaling.py [--scenarios N] [--days N]
+        [--max-workers N] [--agent module:function]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scenarios import ScenarioConfig, ScenarioGenerator, write_ndjson  # noqa: E402
+from scenarios.runner import run_scenarios  # noqa: E402
+
+
+def worker_counts(max_workers: int) -> list[int]:
+    """Return powers of two up to max_workers, plus max_workers itself.
+
+    Args:
+        max_workers: Largest worker count to measure.
+
+    Returns:
+        Increasing worker counts starting at 1.
+    """
+    counts = []
+    workers = 1
+    while workers < max_workers:
+        counts.append(workers)
+        workers *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenarios", type=int, default=0, help="Scenarios (default: 2 per CPU)"
+    )
+    parser.add_argument("--days", type=int, default=7, help="Days per scenario")
+    parser.add_argument(
+        "--max-workers", type=int, default=os.cpu_count(), help="Largest pool size"
+    )
+    parser.add_argument("--agent", help="Agent callback as module:function")
+    args = parser.parse_args()
+    count = args.scenarios or 2 * args.max_workers
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for seed in range(count):
+            config = ScenarioConfig(seed=seed, days=args.days)
+            path = Path(directory, f"scenario-{seed}.ndjson")
+            with open(path, "w") as file:
+                write_ndjson(ScenarioGenerator(config).events(), file, config)
+            paths.append(str(path))
+
+        print(f"scenarios: {count} x {args.days} days, cpus: {os.cpu_count()}")
+        print(f"{'workers':>8}{'seconds':>10}{'events/s':>12}{'speedup':>9}")
+        baseline = None
+        for workers in worker_counts(args.max_workers):
+            started = time.perf_counter()
+            results = run_scenarios(
+                paths, workers=workers, agent_path=args.agent, include_snapshot=False
+            )
+            elapsed = time.perf_counter() - started
+            events = sum(result.events for result in results)
+            baseline = baseline or elapsed
+            print(
+                f"{workers:>8}{elapsed:>10.2f}{events / elapsed:>12,.0f}"
+                f"{baseline / elapsed:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
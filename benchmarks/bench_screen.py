@@ -0,0 +1,206 @@
+"""Benchmark the screen timeline under high-frequency interaction scripts.
+
+Drives a ScreenState through a scripted session on a large UI tree: bursts
+of typing (one textbox per keystroke), hovering and scrolling (a window of
+list rows replaced per scroll), page navigations that swap a subtree, and
+occasional app switches that render a new screen. Then measures:
+- Ingestion: steps recorded per second on the timeline, and the rate
+  through apply_input() (input validation, target checks, recording) on a
+  sample of interactions.
+- Reconstruction latency: the screen at random earlier times.
+- Undo latency: create_undo_data(), apply_input() and apply_undo() of one
+  interaction at the end of the session.
+- Memory: element references held by keyframes and deltas, compared with
+  storing a full frame per step, and peak memory (resident set size).
+
+The default is 200,000 interactions, which needs about 1 GB of memory.
+Recording and reconstruction also run in the benchmark suite
+(python -m benchmarks --filter "*.screen.*"), where they are compared
+against the baseline. Run from the repository root:
+
+    python benchmarks/bench_screen.py [--steps N] [--elements N] [--repeat N]
+"""
+
+import argparse
+import random
+import resource
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.workloads import screen_elements  # noqa: E402
+from models.modalities.screen_input import ScreenElement, ScreenInput  # noqa: E402
+from models.modalities.screen_state import ScreenState  # noqa: E402
+from models.modalities.screen_timeline import ScreenStep  # noqa: E402
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+STEP = timedelta(milliseconds=50)
+ROWS_PER_SCROLL = 20
+
+
+def script(steps: int, elements: int, seed: int = 0) -> Iterator[dict]:
+    """Yield ScreenInput fields for a session of steps interactions.
+
+    About 60% keystrokes, 20% hovers, 15% scrolls, 5% clicks of which one
+    in ten navigates (replacing 50 page elements), and an app switch every
+    20,000 steps.
+    """
+    rng = random.Random(seed)
+    text = ""
+    field = "field0"
+    page = 0
+    for number in range(steps):
+        if number % 20_000 == 0:
+            app = f"App{number // 20_000 % 5}"
+            yield {"interaction_type": "render", "app": app, "window": "main",
+                   "elements": screen_elements(app, elements)}
+            text, page = "", 0
+            continue
+        roll = rng.random()
+        if roll < 0.6:
+            text = text[-200:] + rng.choice("abcdefghij ")
+            yield {"interaction_type": "type", "target_element": field,
+                   "interaction_data": {"text": text[-1]},
+                   "elements": {field: ScreenElement(role="textbox", value=text, parent_id="form")}}
+        elif roll < 0.8:
+            target = f"row{rng.randrange(200)}"
+            yield {"interaction_type": "hover", "target_element": target,
+                   "elements": {target: ScreenElement(role="listitem", parent_id="list",
+                                                      properties={"hovered": True})}}
+        elif roll < 0.95:
+            first = rng.randrange(200 - ROWS_PER_SCROLL)
+            yield {"interaction_type": "scroll", "interaction_data": {"first_row": first},
+                   "elements": {f"row{row}": ScreenElement(role="listitem", name=f"Item {row}",
+                                                           parent_id="list",
+                                                           properties={"visible": True})
+                                for row in range(first, first + ROWS_PER_SCROLL)}}
+        elif roll < 0.995:
+            field = f"field{rng.randrange(10)}"
+            text = ""
+            yield {"interaction_type": "click", "target_element": field}
+        else:
+            page += 1
+            yield {"interaction_type": "click", "target_element": "root",
+                   "elements": {f"node{node}": ScreenElement(role="text", name=f"Page {page}",
+                                                             parent_id="page")
+                                for node in range(50)}}
+
+
+def ingest(state: ScreenState, steps: int, elements: int) -> tuple[float, list[datetime]]:
+    """Record a session directly on the state's timeline.
+
+    Returns:
+        Tuple of (steps recorded per second, step timestamps).
+    """
+    timeline = state.timeline
+    times = []
+    timestamp = START
+    elapsed = 0.0
+    for fields in script(steps, elements):
+        timestamp += STEP
+        step = ScreenStep(timestamp=timestamp, **fields)
+        started = time.perf_counter()
+        timeline.record(step)
+        elapsed += time.perf_counter() - started
+        times.append(timestamp)
+    state.last_updated = timestamp
+    state.update_count = len(timeline)
+    return steps / elapsed, times
+
+
+def ingest_inputs(count: int, elements: int) -> float:
+    """Apply a session through apply_input() into a fresh state.
+
+    Returns:
+        Interactions applied per second.
+    """
+    state = ScreenState(last_updated=START)
+    inputs = [
+        ScreenInput(timestamp=START + number * STEP, **fields)
+        for number, fields in enumerate(script(count, elements, seed=1))
+    ]
+    started = time.perf_counter()
+    for screen_input in inputs:
+        state.apply_input(screen_input)
+    return count / (time.perf_counter() - started)
+
+
+def measure(fn: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """Time a callable.
+
+    Returns:
+        Tuple of (median, maximum) latency in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), max(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=200_000, help="Interactions to record")
+    parser.add_argument("--elements", type=int, default=2000, help="Elements per screen")
+    parser.add_argument(
+        "--inputs", type=int, default=50_000, help="Interactions to time through apply_input()"
+    )
+    parser.add_argument("--repeat", type=int, default=200, help="Timed repetitions")
+    args = parser.parse_args()
+
+    state = ScreenState(last_updated=START)
+    record_rate, times = ingest(state, args.steps, args.elements)
+    input_rate = ingest_inputs(args.inputs, args.elements)
+    timeline = state.timeline
+
+    rng = random.Random(2)
+    rebuild_ms = measure(lambda: timeline.frame_at(rng.choice(times)), args.repeat)
+    current_ms = measure(lambda: state.query({"role": "textbox"}), args.repeat)
+
+    def undo_one() -> None:
+        screen_input = ScreenInput(
+            timestamp=state.last_updated,
+            interaction_type="type",
+            target_element="field0",
+            elements={"field0": ScreenElement(role="textbox", value="x", parent_id="form")},
+        )
+        undo_data = state.create_undo_data(screen_input)
+        state.apply_input(screen_input)
+        state.apply_undo(undo_data)
+
+    undo_ms = measure(undo_one, args.repeat)
+
+    held = sum(len(step.elements) for step in timeline._steps if not step.is_render)
+    held += sum(len(frame.elements) for frame in timeline._keyframes)
+    naive = len(timeline) * len(timeline.current.elements)
+
+    print(
+        f"steps: {len(timeline):,}, elements per screen: {len(timeline.current.elements):,}, "
+        f"keyframes: {timeline.keyframe_count:,}"
+    )
+    print(f"timeline record: {record_rate:>12,.0f} steps/s")
+    print(f"apply_input():   {input_rate:>12,.0f} interactions/s")
+    print(f"{'operation':<28}{'median ms':>11}{'max ms':>9}")
+    for label, (median_ms, max_ms) in [
+        ("screen at a random time", rebuild_ms),
+        ("current screen query", current_ms),
+        ("apply + undo", undo_ms),
+    ]:
+        print(f"{label:<28}{median_ms:>11.3f}{max_ms:>9.3f}")
+    print(
+        f"element references held: {held:,} "
+        f"(a full frame per step: {naive:,}, {naive / max(held, 1):,.0f}x more)"
+    )
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"peak memory: {peak:,.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Benchmark team chat ingestion and queries at Slack/Discord scale.
+
+Fills a SlackState with a stream of messages spread unevenly over thousands
+of channels (a few hot channels get most of the traffic), with thread
+replies and @mentions, then measures:
+- Ingestion: messages appended per second to the channel logs, and the rate
+  through apply_input() (input validation, mention parsing, log append) on a
+  sample of posts.
+- Query latency: a channel's latest page, a deep page by cursor, a one-hour
+  time window, author and text filters, a thread, mentions of a user across
+  every channel, and the state snapshot with per-channel unread counts.
+- Peak memory (resident set size).
+
+The default is 10 million messages, which needs about 1.5 GB of memory.
+Posting and channel and mention queries at up to 1 million messages also run
+in the benchmark suite (python -m benchmarks --filter "*.slack.*"), where
+they are compared against the baseline. Run from the repository root:
+
+    python benchmarks/bench_team_chat.py [--messages N] [--channels N] [--repeat N]
+"""
+
+import argparse
+import random
+import resource
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models.modalities.slack_input import SlackInput  # noqa: E402
+from models.modalities.slack_state import SlackState  # noqa: E402
+from models.modalities.team_chat import extract_mentions  # noqa: E402
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+STEP = timedelta(milliseconds=10)
+WORDS = "ship it looks good to me can you review the deploy after lunch standup notes".split()
+
+
+def generate(messages: int, channels: int, users: int, seed: int = 0):
+    """Yield (channel_id, author, text, thread_seq) for a message stream.
+
+    Channel traffic follows a Zipf-like distribution. One message in ten is
+    a thread reply, one in twenty mentions a user and one in five hundred
+    mentions the simulated user.
+    """
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(channels)]
+    channel_ids = [f"C{number:05d}" for number in range(channels)]
+    lengths = dict.fromkeys(channel_ids, 0)
+    batch = 100_000
+    for first in range(0, messages, batch):
+        picks = rng.choices(channel_ids, weights, k=min(batch, messages - first))
+        for number, channel_id in enumerate(picks, first):
+            length = lengths[channel_id]
+            text = " ".join(rng.choices(WORDS, k=8))
+            if number % 20 == 0:
+                text = f"<@U{rng.randrange(users)}> {text}"
+            if number % 500 == 0:
+                text = f"<@user> {text}"
+            thread = None
+            if number % 10 == 0 and length:
+                thread = rng.randrange(max(length - 50, 0), length)
+            lengths[channel_id] = length + 1
+            yield channel_id, f"U{rng.randrange(users)}", text, thread
+
+
+def ingest(state: SlackState, messages: int, channels: int, users: int) -> float:
+    """Append a message stream directly to the channel logs.
+
+    Returns:
+        Messages appended per second.
+    """
+    for number in range(channels):
+        state.apply_input(
+            SlackInput(
+                operation="create_channel",
+                channel_id=f"C{number:05d}",
+                workspace_id="T1",
+                timestamp=START,
+            )
+        )
+    logs = {channel_id: channel.log for channel_id, channel in state.channels.items()}
+    timestamp = START
+    started = time.perf_counter()
+    for channel_id, author, text, thread in generate(messages, channels, users):
+        timestamp += STEP
+        logs[channel_id].append(author, text, timestamp, thread, extract_mentions(text))
+    elapsed = time.perf_counter() - started
+    state.last_updated = timestamp
+    return messages / elapsed
+
+
+def ingest_inputs(count: int, channels: int, users: int) -> float:
+    """Post messages through apply_input() into a fresh state.
+
+    Returns:
+        Messages applied per second.
+    """
+    state = SlackState(last_updated=START)
+    inputs = [
+        SlackInput(
+            operation="post_message",
+            channel_id=channel_id,
+            author=author,
+            text=text,
+            thread_seq=thread,
+            timestamp=START + number * STEP,
+        )
+        for number, (channel_id, author, text, thread) in enumerate(
+            generate(count, channels, users, seed=1)
+        )
+    ]
+    started = time.perf_counter()
+    for slack_input in inputs:
+        state.apply_input(slack_input)
+    return count / (time.perf_counter() - started)
+
+
+def measure(fn: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """Time a callable.
+
+    Returns:
+        Tuple of (median, maximum) latency in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), max(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=10_000_000, help="Messages to ingest")
+    parser.add_argument("--channels", type=int, default=5000, help="Number of channels")
+    parser.add_argument("--users", type=int, default=2000, help="Number of authors")
+    parser.add_argument(
+        "--inputs", type=int, default=50_000, help="Posts to time through apply_input()"
+    )
+    parser.add_argument("--repeat", type=int, default=50, help="Timed repetitions")
+    args = parser.parse_args()
+
+    state = SlackState(last_updated=START)
+    append_rate = ingest(state, args.messages, args.channels, args.users)
+    input_rate = ingest_inputs(args.inputs, args.channels, args.users)
+
+    hot = max(state.channels.values(), key=lambda channel: len(channel.log))
+    hot.last_read_seq = len(hot.log) // 2
+    middle = hot.log.timestamp(len(hot.log) // 2)
+    root = max(
+        (seq for seq in hot.log.select(limit=10_000) if hot.log.replies(seq)),
+        key=lambda seq: len(hot.log.replies(seq)),
+    )
+    author = hot.log.author(0)
+    channel_id = hot.channel_id
+
+    queries: list[tuple[str, dict | None]] = [
+        ("latest page", {"channel_id": channel_id, "limit": 50}),
+        ("deep page (cursor)", {"channel_id": channel_id, "limit": 50, "cursor": len(hot.log) // 2}),
+        ("1-hour window", {"channel_id": channel_id, "since": middle, "until": middle + timedelta(hours=1)}),
+        ("unread page", {"channel_id": channel_id, "unread_only": True, "order": "asc", "limit": 50}),
+        ("author filter", {"channel_id": channel_id, "author": author, "limit": 50}),
+        ("text search", {"channel_id": channel_id, "search": "deploy after lunch", "limit": 50}),
+        ("thread", {"channel_id": channel_id, "thread_seq": root}),
+        ("mentions (all channels)", {"mentions_of": "user", "limit": 50}),
+        ("unread mentions", {"mentions_of": "user", "unread_only": True, "limit": 50}),
+        ("channel list", {"limit": 50}),
+        ("snapshot (unread counts)", None),
+    ]
+
+    print(
+        f"messages: {args.messages:,}, channels: {args.channels:,}, "
+        f"hottest channel: {len(hot.log):,} messages"
+    )
+    print(f"log append:    {append_rate:>12,.0f} messages/s")
+    print(f"apply_input(): {input_rate:>12,.0f} messages/s")
+    print(f"{'query':<28}{'results':>9}{'median ms':>11}{'max ms':>9}")
+    for label, params in queries:
+        if params is None:
+            fn = state.get_snapshot
+            results = len(state.channels)
+        else:
+            fn = lambda params=params: state.query(params)  # noqa: E731
+            results = state.query(params)["count"]
+        median_ms, max_ms = measure(fn, args.repeat)
+        print(f"{label:<28}{results:>9}{median_ms:>11.3f}{max_ms:>9.3f}")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"peak memory: {peak:,.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark columnar weather storage against WeatherReport objects.
+
+Weather keeps up to 100 reports per location, each with 60 minutely, 48
+hourly and 8 daily forecasts. This compares the memory a location's history
+takes as WeatherReport objects (the previous storage) and as ReportColumns,
+and the latency of serving a report in imperial units with one section
+excluded: deepcopy, per-field conversion and model_dump() for the objects,
+vectorized conversion and to_dict() for the columns. Run from the
+repository root:
+
+    python benchmarks/bench_weather_columns.py [--reports N] [--repeat N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from copy import deepcopy
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.workloads import forecast_report  # noqa: E402
+from models.modalities.weather_columns import (  # noqa: E402
+    ReportColumns,
+    convert_speed,
+    convert_temperature,
+)
+from models.modalities.weather_input import WeatherReport  # noqa: E402
+
+UNITS = "imperial"
+EXCLUDE = ["minutely"]
+
+
+def serve_object(report: WeatherReport) -> dict:
+    """Serve a WeatherReport the way WeatherState did before columns."""
+    report = deepcopy(report)
+    report.minutely = None
+    report = deepcopy(report)
+    current = report.current
+    current.temp = convert_temperature(current.temp, UNITS)
+    current.feels_like = convert_temperature(current.feels_like, UNITS)
+    current.dew_point = convert_temperature(current.dew_point, UNITS)
+    current.wind_speed = convert_speed(current.wind_speed, UNITS)
+    if current.wind_gust:
+        current.wind_gust = convert_speed(current.wind_gust, UNITS)
+    for hour in report.hourly:
+        hour.temp = convert_temperature(hour.temp, UNITS)
+        hour.feels_like = convert_temperature(hour.feels_like, UNITS)
+        hour.dew_point = convert_temperature(hour.dew_point, UNITS)
+        hour.wind_speed = convert_speed(hour.wind_speed, UNITS)
+        if hour.wind_gust:
+            hour.wind_gust = convert_speed(hour.wind_gust, UNITS)
+    for day in report.daily:
+        for name in ("day", "min", "max", "night", "eve", "morn"):
+            setattr(day.temp, name, convert_temperature(getattr(day.temp, name), UNITS))
+        for name in ("day", "night", "eve", "morn"):
+            setattr(
+                day.feels_like,
+                name,
+                convert_temperature(getattr(day.feels_like, name), UNITS),
+            )
+        day.dew_point = convert_temperature(day.dew_point, UNITS)
+        day.wind_speed = convert_speed(day.wind_speed, UNITS)
+        if day.wind_gust:
+            day.wind_gust = convert_speed(day.wind_gust, UNITS)
+    return report.model_dump()
+
+
+def serve_columns(report: ReportColumns) -> dict:
+    """Serve a ReportColumns the way WeatherState.query() does."""
+    return report.exclude(EXCLUDE).convert(UNITS).to_dict()
+
+
+def measure_memory(build: Callable[[], list]) -> int:
+    """Return the bytes allocated by build() that are still held after it.
+
+    Args:
+        build: Function creating the stored reports.
+
+    Returns:
+        Allocated bytes held by its result.
+    """
+    tracemalloc.start()
+    stored = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del stored
+    return size
+
+
+def measure_latency(serve: Callable, reports: list, repeat: int) -> float:
+    """Return the median time to serve every report once, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for report in reports:
+            serve(report)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=100, help="Reports in history")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions")
+    args = parser.parse_args()
+
+    reports = [forecast_report(i) for i in range(args.reports)]
+    columns = [ReportColumns.from_report(report) for report in reports]
+    assert serve_columns(columns[0]) == serve_object(reports[0])
+
+    object_memory = measure_memory(
+        lambda: [forecast_report(i) for i in range(args.reports)]
+    )
+    column_memory = measure_memory(
+        lambda: [ReportColumns.from_report(report) for report in reports]
+    )
+    object_latency = measure_latency(serve_object, reports, args.repeat)
+    column_latency = measure_latency(serve_columns, columns, args.repeat)
+
+    print(f"reports: {args.reports}, units: {UNITS}, exclude: {EXCLUDE}")
+    print(f"{'storage':<16}{'memory KiB':>12}{'KiB/report':>12}{'serve ms':>10}")
+    for name, memory, latency in (
+        ("WeatherReport", object_memory, object_latency),
+        ("ReportColumns", column_memory, column_latency),
+    ):
+        print(
+            f"{name:<16}{memory / 1024:>12,.0f}"
+            f"{memory / 1024 / args.reports:>12.1f}{latency:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Benchmark JSON vs MessagePack wire formats.
+
+Populates email and SMS states and compares bytes on the wire and end-to-end
+throughput of the large read endpoints when responses are encoded as JSON or
+as MessagePack. Timings include decoding the body and validating it into the
+client's response models, which is what an agent pulling state pays for.
+Run from the repository root:
+
+    python benchmarks/bench_wire_format.py [--emails N] [--messages N] [--repeat N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.testclient import TestClient  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from api.dependencies import get_simulation_engine  # noqa: E402
+from api.wire_format import MSGPACK_MEDIA_TYPE, unpackb  # noqa: E402
+from client._email import EmailQueryResponse, EmailStateResponse  # noqa: E402
+from client._sms import SMSStateResponse  # noqa: E402
+from main import app  # noqa: E402
+from models.modalities.email_input import EmailInput  # noqa: E402
+from models.modalities.email_state import EmailState  # noqa: E402
+
+# (label, method, path, request body, client response model)
+ENDPOINTS: list[tuple[str, str, str, dict | None, type[BaseModel]]] = [
+    ("GET /email/state", "GET", "/email/state", None, EmailStateResponse),
+    ("POST /email/query", "POST", "/email/query", {}, EmailQueryResponse),
+    ("GET /sms/state", "GET", "/sms/state", None, SMSStateResponse),
+]
+
+
+def populate_email(email_state: EmailState, count: int) -> None:
+    """Fill an email state with received emails.
+
+    Args:
+        email_state: The state to populate.
+        count: Number of emails to add.
+    """
+    base_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    body = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 10
+    for i in range(count):
+        email_state.apply_input(
+            EmailInput(
+                timestamp=base_time + timedelta(minutes=i),
+                operation="receive",
+                from_address=f"sender{i % 50}@example.com",
+                to_addresses=["user@example.com"],
+                subject=f"Quarterly report {i}",
+                body_text=body,
+                labels=["work", f"project-{i % 5}"],
+            )
+        )
+
+
+def populate_sms(client: TestClient, count: int) -> None:
+    """Receive SMS messages through the API.
+
+    Args:
+        client: The test client to send requests with.
+        count: Number of messages to receive.
+    """
+    for i in range(count):
+        client.post(
+            "/sms/receive",
+            json={
+                "from_number": f"+1555000{i % 20:04d}",
+                "to_numbers": ["+15559876543"],
+                "body": f"Message {i}: running a few minutes late, see you soon",
+            },
+        ).raise_for_status()
+
+
+def measure(
+    client: TestClient,
+    method: str,
+    path: str,
+    body: dict | None,
+    model: type[BaseModel],
+    wire_format: str,
+    repeat: int,
+) -> tuple[int, float]:
+    """Time a request, including decoding into the client model.
+
+    Args:
+        client: The test client to send requests with.
+        method: HTTP method.
+        path: Endpoint path.
+        body: Request body, if any.
+        model: Client response model to validate the body into.
+        wire_format: "json" or "msgpack".
+        repeat: Number of timed repetitions.
+
+    Returns:
+        Tuple of (response size in bytes, median latency in milliseconds).
+    """
+    headers = {"Accept": MSGPACK_MEDIA_TYPE} if wire_format == "msgpack" else {}
+    size = 0
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.request(method, path, json=body, headers=headers)
+        response.raise_for_status()
+        data = unpackb(response.content) if wire_format == "msgpack" else response.json()
+        model.model_validate(data)
+        timings.append((time.perf_counter() - start) * 1000)
+        size = len(response.content)
+    return size, statistics.median(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--emails", type=int, default=2000, help="Mailbox size")
+    parser.add_argument("--messages", type=int, default=1000, help="SMS count")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed repetitions")
+    args = parser.parse_args()
+
+    rows = []
+    with TestClient(app) as client:
+        populate_email(get_simulation_engine().environment.get_state("email"), args.emails)
+        populate_sms(client, args.messages)
+
+        for label, method, path, body, model in ENDPOINTS:
+            json_size, json_ms = measure(
+                client, method, path, body, model, "json", args.repeat
+            )
+            msgpack_size, msgpack_ms = measure(
+                client, method, path, body, model, "msgpack", args.repeat
+            )
+            rows.append((label, json_size, json_ms, msgpack_size, msgpack_ms))
+
+    print(f"emails: {args.emails}, messages: {args.messages}, repeat: {args.repeat}")
+    print(
+        f"{'endpoint':<20}{'json bytes':>14}{'json ms':>10}"
+        f"{'msgpack bytes':>16}{'msgpack ms':>12}{'size':>8}{'speedup':>9}"
+    )
+    for label, json_size, json_ms, msgpack_size, msgpack_ms in rows:
+        print(
+            f"{label:<20}{json_size:>14,}{json_ms:>10.2f}"
+            f"{msgpack_size:>16,}{msgpack_ms:>12.2f}"
+            f"{json_size / msgpack_size:>7.2f}x{json_ms / msgpack_ms:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+"""Benchmark registry, runner, and baseline comparison.
+
+A benchmark is a function that takes a problem size, does any setup it
+needs, and returns a Workload: the callable to time and the number of
+operations it performs. The runner calls the function afresh for every
+repetition, so workloads that mutate state (inserting events, undoing them)
+always start from the same point, and setup is never timed.
+
+Benchmarks register themselves with the @benchmark decorator:
+
+    @benchmark("queue.add_events", sizes=SIZES)
+    def queue_add_events(size: int) -> Workload:
+        queue = EventQueue()
+        events = make_events(size)
+        return Workload(lambda: queue.add_events(events), operations=size)
+
+Results are written as JSON so runs can be stored and compared; compare()
+matches results by benchmark name and size and reports how much slower or
+faster each one got. Comparisons use the fastest repetition rather than the
+median, since it is the one least disturbed by other load on the machine.
+"""
+
+import gc
+import json
+import platform
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# Problem sizes benchmarks are defined for; the runner caps them with max_size
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+# Version of the results file layout
+RESULTS_VERSION = 1
+
+
+class Workload(NamedTuple):
+    """The timed part of a benchmark.
+
+    Attributes:
+        run: Callable that performs the work being measured.
+        operations: Number of operations run performs, used for throughput.
+    """
+
+    run: Callable[[], object]
+    operations: int
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A registered benchmark.
+
+    Attributes:
+        name: Dotted name, grouped by the part before the first dot.
+        setup: Function that prepares a Workload for a given size.
+        sizes: Problem sizes the benchmark supports.
+    """
+
+    name: str
+    setup: Callable[[int], Workload]
+    sizes: tuple[int, ...]
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings for one benchmark at one size.
+
+    Attributes:
+        name: Benchmark name.
+        size: Problem size.
+        operations: Operations performed per repetition.
+        repeat: Number of timed repetitions.
+        median_seconds: Median wall time of a repetition.
+        min_seconds: Fastest repetition.
+        ops_per_second: Throughput at the median time.
+    """
+
+    name: str
+    size: int
+    operations: int
+    repeat: int
+    median_seconds: float
+    min_seconds: float
+    ops_per_second: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class Comparison:
+    """A result compared against its baseline.
+
+    Attributes:
+        name: Benchmark name.
+        size: Problem size.
+        baseline_seconds: Fastest repetition in the baseline.
+        seconds: Fastest repetition in this run.
+        change: Relative change in time; 0.25 means 25% slower.
+        regressed: Whether the change exceeds the threshold.
+    """
+
+    name: str
+    size: int
+    baseline_seconds: float
+    seconds: float
+    change: float
+    regressed: bool
+
+
+_benchmarks: dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str, sizes: Iterable[int] = SIZES
+) -> Callable[[Callable[[int], Workload]], Callable[[int], Workload]]:
+    """Register a benchmark.
+
+    Args:
+        name: Unique dotted name, such as "queue.add_events".
+        sizes: Problem sizes the benchmark supports.
+
+    Returns:
+        Decorator that registers the setup function and returns it unchanged.
+
+    Raises:
+        ValueError: If a benchmark with this name is already registered.
+    """
+
+    def decorator(setup: Callable[[int], Workload]) -> Callable[[int], Workload]:
+        if name in _benchmarks:
+            raise ValueError(f"Benchmark {name!r} is already registered")
+        _benchmarks[name] = Benchmark(name=name, setup=setup, sizes=tuple(sizes))
+        return setup
+
+    return decorator
+
+
+def get_benchmarks(patterns: Iterable[str] | None = None) -> list[Benchmark]:
+    """Get registered benchmarks, optionally filtered by name.
+
+    Args:
+        patterns: Shell-style patterns such as "queue.*". A benchmark is
+            selected if it matches any of them. None selects all.
+
+    Returns:
+        Matching benchmarks, in registration order.
+    """
+    patterns = list(patterns or [])
+    return [
+        bench
+        for name, bench in _benchmarks.items()
+        if not patterns or any(fnmatch(name, pattern) for pattern in patterns)
+    ]
+
+
+def run_benchmark(bench: Benchmark, size: int, repeat: int = 5) -> BenchmarkResult:
+    """Time a benchmark at one size.
+
+    Garbage is collected before each repetition so one repetition's garbage
+    is not charged to the next, but collection stays enabled while timing
+    because allocation cost is part of what is measured.
+
+    Args:
+        bench: The benchmark to run.
+        size: Problem size.
+        repeat: Number of timed repetitions.
+
+    Returns:
+        The timings.
+    """
+    timings = []
+    operations = 0
+    for _ in range(repeat):
+        workload = bench.setup(size)
+        operations = workload.operations
+        gc.collect()
+        start = time.perf_counter()
+        workload.run()
+        timings.append(time.perf_counter() - start)
+        del workload
+
+    median = statistics.median(timings)
+    return BenchmarkResult(
+        name=bench.name,
+        size=size,
+        operations=operations,
+        repeat=repeat,
+        median_seconds=median,
+        min_seconds=min(timings),
+        ops_per_second=operations / median if median > 0 else float("inf"),
+    )
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    max_size: int,
+    repeat: int = 5,
+    on_result: Callable[[BenchmarkResult], None] | None = None,
+) -> list[BenchmarkResult]:
+    """Run benchmarks at each of their sizes up to max_size.
+
+    Args:
+        benchmarks: Benchmarks to run.
+        max_size: Largest problem size to run.
+        repeat: Number of timed repetitions per size.
+        on_result: Called with each result as soon as it is available.
+
+    Returns:
+        All results, in run order.
+    """
+    results = []
+    for bench in benchmarks:
+        for size in bench.sizes:
+            if size > max_size:
+                continue
+            result = run_benchmark(bench, size, repeat)
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return results
+
+
+def results_document(results: list[BenchmarkResult]) -> dict[str, Any]:
+    """Build the JSON document for a run.
+
+    Args:
+        results: Results of the run.
+
+    Returns:
+        Dictionary with run metadata and the results.
+    """
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def write_results(path: Path, results: list[BenchmarkResult]) -> None:
+    """Write a run's results to a JSON file.
+
+    Args:
+        path: File to write.
+        results: Results of the run.
+    """
+    path.write_text(json.dumps(results_document(results), indent=2) + "\n")
+
+
+def load_results(path: Path) -> list[BenchmarkResult]:
+    """Read results from a JSON file written by write_results().
+
+    Args:
+        path: File to read.
+
+    Returns:
+        The stored results.
+
+    Raises:
+        ValueError: If the file has an unsupported layout version.
+    """
+    document = json.loads(path.read_text())
+    if document.get("version") != RESULTS_VERSION:
+        raise ValueError(
+            f"Unsupported results version {document.get('version')!r} in {path}"
+        )
+    return [BenchmarkResult(**result) for result in document["results"]]
+
+
+def compare(
+    results: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    threshold: float = 0.2,
+) -> list[Comparison]:
+    """Compare results against a baseline.
+
+    Results with no baseline entry (new benchmarks or sizes) are skipped.
+
+    Args:
+        results: Results of this run.
+        baseline: Stored results to compare against.
+        threshold: Relative slowdown above which a result counts as a
+            regression; 0.2 flags anything more than 20% slower.
+
+    Returns:
+        One comparison per result that has a baseline, in result order.
+    """
+    baseline_times = {(b.name, b.size): b.min_seconds for b in baseline}
+    comparisons = []
+    for result in results:
+        baseline_seconds = baseline_times.get((result.name, result.size))
+        if baseline_seconds is None:
+            continue
+        change = (
+            (result.min_seconds - baseline_seconds) / baseline_seconds
+            if baseline_seconds > 0
+            else 0.0
+        )
+        comparisons.append(
+            Comparison(
+                name=result.name,
+                size=result.size,
+                baseline_seconds=baseline_seconds,
+                seconds=result.min_seconds,
+                change=change,
+                regressed=change > threshold,
+            )
+        )
+    return comparisons
@@ -0,0 +1,80 @@
+"""End-to-end API throughput through httpx's ASGITransport.
+
+Requests go through the full application (middleware, routing, validation,
+the engine worker pool, and response encoding) without a network socket, so
+the numbers reflect the server's own cost per request. Each benchmark sends
+size requests from CONCURRENCY concurrent clients.
+"""
+
+import asyncio
+
+import httpx
+
+from api.dependencies import get_simulation_engine
+from api.executor import initialize_engine_executor
+from benchmarks.harness import Workload, benchmark
+from benchmarks.workloads import create_engine, email_inputs
+from main import app
+from models.simulation import SimulationEngine
+
+# Requests in flight at once
+CONCURRENCY = 8
+
+# Request counts; above 100k a run takes longer than it tells you
+API_SIZES = (1_000, 10_000, 100_000)
+
+# Emails in the mailbox the query benchmark searches
+MAILBOX_SIZE = 1_000
+
+
+def _serve(engine: SimulationEngine) -> None:
+    """Point the app at an engine and start a fresh worker pool."""
+    app.dependency_overrides[get_simulation_engine] = lambda: engine
+    initialize_engine_executor()
+
+
+async def _send_all(method: str, url: str, bodies: list[dict]) -> None:
+    """Send one request per body, CONCURRENCY at a time."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://ues") as client:
+
+        async def worker(start: int) -> None:
+            for body in bodies[start::CONCURRENCY]:
+                response = await client.request(method, url, json=body)
+                response.raise_for_status()
+
+        await asyncio.gather(*(worker(i) for i in range(CONCURRENCY)))
+
+
+@benchmark("api.location_update", sizes=API_SIZES)
+def api_location_update(size: int) -> Workload:
+    """POST /location/update, a small write through the worker pool."""
+    engine = create_engine()
+    engine.start()
+    _serve(engine)
+    bodies = [
+        {"latitude": 40.0 + i * 1e-5, "longitude": -74.0, "speed": 1.5}
+        for i in range(size)
+    ]
+    return Workload(
+        lambda: asyncio.run(_send_all("POST", "/location/update", bodies)),
+        operations=size,
+    )
+
+
+@benchmark("api.email_query", sizes=API_SIZES)
+def api_email_query(size: int) -> Workload:
+    """POST /email/query for a page of 20 from a mailbox of 1,000 emails."""
+    engine = create_engine()
+    email_state = engine.environment.get_state("email")
+    for input_data in email_inputs(MAILBOX_SIZE):
+        email_state.apply_input(input_data)
+    _serve(engine)
+    bodies = [
+        {"from_address": f"contact{i % 50}@example.com", "limit": 20}
+        for i in range(size)
+    ]
+    return Workload(
+        lambda: asyncio.run(_send_all("POST", "/email/query", bodies)),
+        operations=size,
+    )
@@ -0,0 +1,144 @@
+"""Client call cost over ASGI versus the embedded transport and batching.
+
+One agent issues size calls back to back through the client library. The
+client.asgi.* benchmarks go through httpx's ASGITransport (JSON, HTTP
+framing, middleware, routing); the client.embedded.* ones call the same
+endpoints in-process through AsyncUESClient.embedded(). The difference is
+what an agent colocated with the simulator saves per call. The
+client.asgi.batched_* benchmarks make the same calls over ASGI in
+client.batch() blocks of BATCH_SIZE, one POST /batch each.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from api.dependencies import get_simulation_engine
+from api.executor import initialize_engine_executor
+from benchmarks.harness import Workload, benchmark
+from benchmarks.workloads import create_engine, email_inputs
+from client import AsyncBatch, AsyncUESClient
+from main import app
+from models.simulation import SimulationEngine
+
+# Call counts; the ASGI runs take about a minute at 10k
+CLIENT_SIZES = (1_000, 10_000)
+
+# Emails in the mailbox the query benchmarks search
+MAILBOX_SIZE = 1_000
+
+# Calls per client.batch() block in the batched benchmarks
+BATCH_SIZE = 50
+
+
+def _client(engine: SimulationEngine, embedded: bool) -> AsyncUESClient:
+    """Create a client for an engine, in-process or through ASGI."""
+    initialize_engine_executor()
+    if embedded:
+        return AsyncUESClient.embedded(engine)
+    app.dependency_overrides[get_simulation_engine] = lambda: engine
+    return AsyncUESClient(base_url="http://ues", transport=httpx.ASGITransport(app=app))
+
+
+def _calls(
+    engine: SimulationEngine,
+    embedded: bool,
+    size: int,
+    call: Callable[[AsyncUESClient, int], Awaitable[object]],
+) -> Workload:
+    """Build a workload that makes size calls with one client."""
+
+    async def run() -> None:
+        async with _client(engine, embedded) as client:
+            for i in range(size):
+                await call(client, i)
+
+    return Workload(lambda: asyncio.run(run()), operations=size)
+
+
+def _batched_calls(
+    engine: SimulationEngine, size: int, call: Callable[[AsyncBatch, int], object]
+) -> Workload:
+    """Build a workload that makes size calls over ASGI in batches."""
+
+    async def run() -> None:
+        async with _client(engine, False) as client:
+            for start in range(0, size, BATCH_SIZE):
+                async with client.batch() as batch:
+                    for i in range(start, min(start + BATCH_SIZE, size)):
+                        call(batch, i)
+
+    return Workload(lambda: asyncio.run(run()), operations=size)
+
+
+def _update_location(client: AsyncUESClient | AsyncBatch, i: int) -> object:
+    """Move the user slightly."""
+    return client.location.update(latitude=40.0 + i * 1e-5, longitude=-74.0)
+
+
+def _query_emails(client: AsyncUESClient | AsyncBatch, i: int) -> object:
+    """Fetch a page of emails from one of 50 senders."""
+    return client.email.query(from_address=f"contact{i % 50}@example.com", limit=20)
+
+
+def _started_engine() -> SimulationEngine:
+    """Create a running engine for the location benchmarks."""
+    engine = create_engine()
+    engine.start()
+    return engine
+
+
+def _mailbox_engine() -> SimulationEngine:
+    """Create an engine with MAILBOX_SIZE emails for the query benchmarks."""
+    engine = create_engine()
+    email_state = engine.environment.get_state("email")
+    for input_data in email_inputs(MAILBOX_SIZE):
+        email_state.apply_input(input_data)
+    return engine
+
+
+def _location_update(embedded: bool, size: int) -> Workload:
+    """Location updates, a small write."""
+    return _calls(_started_engine(), embedded, size, _update_location)
+
+
+def _email_query(embedded: bool, size: int) -> Workload:
+    """Pages of 20 emails from one sender, out of a mailbox of 1,000."""
+    return _calls(_mailbox_engine(), embedded, size, _query_emails)
+
+
+@benchmark("client.asgi.location_update", sizes=CLIENT_SIZES)
+def client_asgi_location_update(size: int) -> Workload:
+    """client.location.update() through ASGITransport."""
+    return _location_update(False, size)
+
+
+@benchmark("client.embedded.location_update", sizes=CLIENT_SIZES)
+def client_embedded_location_update(size: int) -> Workload:
+    """client.location.update() through the embedded transport."""
+    return _location_update(True, size)
+
+
+@benchmark("client.asgi.email_query", sizes=CLIENT_SIZES)
+def client_asgi_email_query(size: int) -> Workload:
+    """client.email.query() through ASGITransport."""
+    return _email_query(False, size)
+
+
+@benchmark("client.embedded.email_query", sizes=CLIENT_SIZES)
+def client_embedded_email_query(size: int) -> Workload:
+    """client.email.query() through the embedded transport."""
+    return _email_query(True, size)
+
+
+@benchmark("client.asgi.batched_location_update", sizes=CLIENT_SIZES)
+def client_asgi_batched_location_update(size: int) -> Workload:
+    """client.location.update() through ASGITransport, BATCH_SIZE per batch."""
+    return _batched_calls(_started_engine(), size, _update_location)
+
+
+@benchmark("client.asgi.batched_email_query", sizes=CLIENT_SIZES)
+def client_asgi_batched_email_query(size: int) -> Workload:
+    """client.email.query() through ASGITransport, BATCH_SIZE per batch."""
+    return _batched_calls(_mailbox_engine(), size, _query_emails)
@@ -0,0 +1,123 @@
+"""SimulationEngine benchmarks: executing events, undo/redo, reset, snapshots."""
+
+import io
+from datetime import timedelta
+from itertools import islice
+
+from pydantic_core import to_json
+
+from benchmarks.harness import SIZES, Workload, benchmark
+from benchmarks.workloads import create_engine, email_inputs, simulator_events
+from models.simulation import SimulationEngine
+from scenarios import engine as scenario_engine
+from scenarios.generator import ScenarioConfig, ScenarioGenerator
+from scenarios.ndjson import read_ndjson, stream_into_queue, write_ndjson
+
+# Simulator time advanced per step when replaying sensor scenarios
+SENSOR_STEP = timedelta(minutes=1)
+
+
+def _executed_engine(size: int) -> SimulationEngine:
+    """Create a running engine that has executed size events."""
+    engine = create_engine()
+    engine.event_queue.add_events(simulator_events(size))
+    engine.start()
+    engine.advance_time(timedelta(seconds=size + 1))
+    return engine
+
+
+@benchmark("engine.advance_time", sizes=SIZES)
+def engine_advance_time(size: int) -> Workload:
+    """Advance over size queued events, executing each one."""
+    engine = create_engine()
+    engine.event_queue.add_events(simulator_events(size))
+    engine.start()
+    return Workload(
+        lambda: engine.advance_time(timedelta(seconds=size + 1)), operations=size
+    )
+
+
+@benchmark("engine.replay", sizes=SIZES)
+def engine_replay(size: int) -> Workload:
+    """Load a scenario file of size events into an engine and execute them."""
+    file = io.StringIO()
+    write_ndjson(simulator_events(size), file)
+
+    def replay() -> None:
+        file.seek(0)
+        _, events = read_ndjson(file, trusted=True)
+        engine = create_engine()
+        stream_into_queue(events, engine.event_queue)
+        engine.start()
+        engine.advance_time(timedelta(seconds=size + 1))
+
+    return Workload(replay, operations=size)
+
+
+def _sensor_replay(size: int, coalesce: bool) -> Workload:
+    """Replay size per-second GPS fixes and per-minute weather reports."""
+    config = ScenarioConfig(location_interval=1, weather_interval=60)
+    sensor_events = (
+        event
+        for event in ScenarioGenerator(config).events()
+        if event.modality in ("location", "weather")
+    )
+    file = io.StringIO()
+    write_ndjson(islice(sensor_events, size), file)
+
+    def replay() -> None:
+        file.seek(0)
+        _, events = read_ndjson(file, trusted=True)
+        engine = scenario_engine.create_engine(config)
+        engine.event_queue.coalesce = coalesce
+        stream_into_queue(events, engine.event_queue)
+        end = engine.event_queue.events[-1].scheduled_time
+        engine.start()
+        while engine.environment.time_state.current_time < end:
+            engine.advance_time(SENSOR_STEP)
+
+    return Workload(replay, operations=size)
+
+
+@benchmark("engine.replay_sensors", sizes=SIZES)
+def engine_replay_sensors(size: int) -> Workload:
+    """Replay size high-frequency location and weather events one by one."""
+    return _sensor_replay(size, coalesce=False)
+
+
+@benchmark("engine.replay_sensors_coalesced", sizes=SIZES)
+def engine_replay_sensors_coalesced(size: int) -> Workload:
+    """Replay size high-frequency location and weather events, coalesced."""
+    return _sensor_replay(size, coalesce=True)
+
+
+@benchmark("engine.undo", sizes=SIZES)
+def engine_undo(size: int) -> Workload:
+    """Undo all size executed events in one call."""
+    engine = _executed_engine(size)
+    return Workload(lambda: engine.undo(count=size), operations=size)
+
+
+@benchmark("engine.redo", sizes=SIZES)
+def engine_redo(size: int) -> Workload:
+    """Redo all size undone events in one call."""
+    engine = _executed_engine(size)
+    engine.undo(count=size)
+    return Workload(lambda: engine.redo(count=size), operations=size)
+
+
+@benchmark("engine.reset", sizes=SIZES)
+def engine_reset(size: int) -> Workload:
+    """Reset an engine that has executed size events."""
+    engine = _executed_engine(size)
+    return Workload(engine.reset, operations=size)
+
+
+@benchmark("snapshot.serialize", sizes=SIZES)
+def snapshot_serialize(size: int) -> Workload:
+    """Build and JSON-encode a full snapshot of an engine holding size emails."""
+    engine = create_engine()
+    email_state = engine.environment.get_state("email")
+    for input_data in email_inputs(size):
+        email_state.apply_input(input_data)
+    return Workload(lambda: to_json(engine.get_snapshot()), operations=1)
@@ -0,0 +1,236 @@
+"""Modality benchmarks: apply_input throughput and query latency.
+
+Each apply benchmark applies size inputs to a fresh state and reports
+inputs per second, so a per-input cost that grows with the state shows up
+as throughput falling with size. Each query benchmark runs a typical
+filtered query against a state holding size items.
+
+Team chat (Slack) and screen states are built directly rather than through
+create_states(), since their workloads need channels created first or a
+rendered screen to interact with.
+
+SMS and chat apply_input currently do work proportional to the number of
+stored messages, so their benchmarks stop at 10k (100k takes many minutes).
+"""
+
+from datetime import timedelta
+from functools import partial
+
+from benchmarks.harness import SIZES, Workload, benchmark
+from benchmarks.workloads import (
+    BASE_TIME,
+    MODALITY_INPUTS,
+    calendar_update_inputs,
+    create_states,
+    email_inputs,
+    email_mark_read_inputs,
+    forecast_inputs,
+    populated_state,
+    screen_inputs,
+    slack_channel_inputs,
+    slack_post_inputs,
+    sms_inputs,
+)
+from models.modalities.screen_state import ScreenState
+from models.modalities.slack_state import SlackState
+
+# Sizes for modalities whose apply_input slows down as they grow
+SMALL_SIZES = (1_000, 10_000)
+
+# Queries per repetition of a query benchmark
+QUERIES = 100
+
+
+def _apply(modality: str, build_inputs, size: int) -> Workload:
+    """Prepare a workload applying size inputs to an empty state."""
+    state = create_states()[modality]
+    inputs = build_inputs(size)
+
+    def run() -> None:
+        for input_data in inputs:
+            state.apply_input(input_data)
+
+    return Workload(run, operations=size)
+
+
+def _register_apply(name: str, modality: str, build_inputs, sizes=SIZES) -> None:
+    """Register an apply benchmark for a modality operation."""
+    benchmark(f"apply.{name}", sizes=sizes)(partial(_apply, modality, build_inputs))
+
+
+_register_apply("email.receive", "email", partial(email_inputs, operation="receive"))
+_register_apply("email.send", "email", partial(email_inputs, operation="send"))
+_register_apply(
+    "sms.receive_message",
+    "sms",
+    partial(sms_inputs, action="receive_message"),
+    SMALL_SIZES,
+)
+_register_apply(
+    "sms.send_message", "sms", partial(sms_inputs, action="send_message"), SMALL_SIZES
+)
+_register_apply("chat.send_message", "chat", MODALITY_INPUTS["chat"], SMALL_SIZES)
+_register_apply("calendar.create", "calendar", MODALITY_INPUTS["calendar"])
+_register_apply("location.update", "location", MODALITY_INPUTS["location"])
+_register_apply("weather.update", "weather", MODALITY_INPUTS["weather"])
+_register_apply("weather.forecast", "weather", forecast_inputs, SMALL_SIZES)
+_register_apply("time.update", "time", MODALITY_INPUTS["time"])
+
+
+@benchmark("apply.email.mark_read", sizes=SIZES)
+def apply_email_mark_read(size: int) -> Workload:
+    """Mark every email in a mailbox of size emails as read, one at a time."""
+    state = populated_state("email", size)
+    inputs = email_mark_read_inputs(list(state.emails))
+
+    def run() -> None:
+        for input_data in inputs:
+            state.apply_input(input_data)
+
+    return Workload(run, operations=size)
+
+
+@benchmark("apply.calendar.update", sizes=SIZES)
+def apply_calendar_update(size: int) -> Workload:
+    """Update every event in a calendar of size events, one at a time."""
+    state = populated_state("calendar", size)
+    inputs = calendar_update_inputs(list(state.events))
+
+    def run() -> None:
+        for input_data in inputs:
+            state.apply_input(input_data)
+
+    return Workload(run, operations=size)
+
+
+def _query(modality: str, query_params: dict, size: int) -> Workload:
+    """Prepare a workload running one query against a state of size items."""
+    state = populated_state(modality, size)
+
+    def run() -> None:
+        for _ in range(QUERIES):
+            state.query(query_params)
+
+    return Workload(run, operations=QUERIES)
+
+
+def _register_query(modality: str, query_params: dict, sizes=SIZES) -> None:
+    """Register a query benchmark for a modality."""
+    benchmark(f"query.{modality}", sizes=sizes)(
+        partial(_query, modality, query_params)
+    )
+
+
+_register_query(
+    "email", {"from_address": "contact7@example.com", "is_read": False, "limit": 20}
+)
+_register_query("sms", {"phone_number": "+15551000007", "limit": 20}, SMALL_SIZES)
+_register_query("chat", {"conversation_id": "conversation-3", "limit": 20}, SMALL_SIZES)
+_register_query("calendar", {"search": "meeting 7", "limit": 20})
+_register_query("location", {"since": BASE_TIME + timedelta(hours=1), "limit": 20})
+_register_query("weather", {"lat": 37.0, "lon": -122.0, "limit": 20})
+_register_query("time", {"timezone": "Asia/Tokyo", "limit": 20})
+
+
+@benchmark("query.weather.forecast", sizes=SMALL_SIZES)
+def query_weather_forecast(size: int) -> Workload:
+    """Query a location's full forecast history in imperial units."""
+    state = create_states()["weather"]
+    for input_data in forecast_inputs(size):
+        state.apply_input(input_data)
+    query_params = {
+        "lat": 37.0,
+        "lon": -122.0,
+        "from": BASE_TIME,
+        "units": "imperial",
+        "exclude": ["minutely"],
+        "limit": 20,
+    }
+
+    def run() -> None:
+        for _ in range(QUERIES):
+            state.query(query_params)
+
+    return Workload(run, operations=QUERIES)
+
+
+# Channels team chat benchmarks spread their posts over
+CHANNELS = 100
+
+
+def _slack_state(size: int) -> SlackState:
+    """Create a Slack state holding size posts over CHANNELS channels."""
+    state = SlackState(last_updated=BASE_TIME)
+    for input_data in slack_channel_inputs(CHANNELS) + slack_post_inputs(size, CHANNELS):
+        state.apply_input(input_data)
+    return state
+
+
+@benchmark("apply.slack.post_message", sizes=SIZES)
+def apply_slack_post_message(size: int) -> Workload:
+    """Post size messages, half of them to one hot channel."""
+    state = SlackState(last_updated=BASE_TIME)
+    for input_data in slack_channel_inputs(CHANNELS):
+        state.apply_input(input_data)
+    inputs = slack_post_inputs(size, CHANNELS)
+
+    def run() -> None:
+        for input_data in inputs:
+            state.apply_input(input_data)
+
+    return Workload(run, operations=size)
+
+
+@benchmark("query.slack.channel", sizes=SIZES)
+def query_slack_channel(size: int) -> Workload:
+    """Page backwards through the hot channel from its middle."""
+    state = _slack_state(size)
+    query_params = {"channel_id": "C00000", "cursor": size // 4, "limit": 50}
+
+    def run() -> None:
+        for _ in range(QUERIES):
+            state.query(query_params)
+
+    return Workload(run, operations=QUERIES)
+
+
+@benchmark("query.slack.mentions", sizes=SIZES)
+def query_slack_mentions(size: int) -> Workload:
+    """Find unread mentions of the simulated user across every channel."""
+    state = _slack_state(size)
+    query_params = {"mentions_of": "user", "unread_only": True, "limit": 50}
+
+    def run() -> None:
+        for _ in range(QUERIES):
+            state.query(query_params)
+
+    return Workload(run, operations=QUERIES)
+
+
+@benchmark("apply.screen.interact", sizes=SIZES)
+def apply_screen_interact(size: int) -> Workload:
+    """Record a scripted session of size interactions on a 500-element screen."""
+    state = ScreenState(last_updated=BASE_TIME)
+    inputs = screen_inputs(size)
+
+    def run() -> None:
+        for input_data in inputs:
+            state.apply_input(input_data)
+
+    return Workload(run, operations=size)
+
+
+@benchmark("query.screen.at", sizes=SIZES)
+def query_screen_at(size: int) -> Workload:
+    """Rebuild the screen at times spread over a session of size steps."""
+    state = ScreenState(last_updated=BASE_TIME)
+    inputs = screen_inputs(size)
+    for input_data in inputs:
+        state.apply_input(input_data)
+    times = [inputs[i * size // QUERIES].timestamp for i in range(QUERIES)]
+
+    def run() -> None:
+        for at in times:
+            state.query({"at": at, "role": "textbox"})
+
+    return Workload(run, operations=QUERIES)
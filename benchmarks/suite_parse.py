@@ -0,0 +1,41 @@
+"""Parsing benchmarks: modality inputs and scenario event lines from JSON."""
+
+from itertools import chain
+
+from pydantic_core import to_json
+
+from benchmarks.harness import SIZES, Workload, benchmark
+from benchmarks.workloads import MODALITY_INPUTS, simulator_events
+from models.inputs import MODALITY_INPUT_ADAPTER
+from scenarios.ndjson import dump_event, load_event
+
+
+def _input_payloads(size: int) -> list[bytes]:
+    """Create size JSON-encoded inputs, spread evenly over the modalities."""
+    per_modality = -(-size // len(MODALITY_INPUTS))
+    inputs = chain.from_iterable(build(per_modality) for build in MODALITY_INPUTS.values())
+    return [to_json(input_data) for input_data in inputs][:size]
+
+
+@benchmark("parse.input_json", sizes=SIZES)
+def parse_input_json(size: int) -> Workload:
+    """Parse size JSON-encoded inputs of mixed modalities into typed inputs."""
+    payloads = _input_payloads(size)
+
+    def run() -> None:
+        for payload in payloads:
+            MODALITY_INPUT_ADAPTER.validate_json(payload)
+
+    return Workload(run, operations=size)
+
+
+@benchmark("parse.event_line", sizes=SIZES)
+def parse_event_line(size: int) -> Workload:
+    """Decode size scenario file lines into events."""
+    lines = [dump_event(event) for event in simulator_events(size)]
+
+    def run() -> None:
+        for line in lines:
+            load_event(line)
+
+    return Workload(run, operations=size)
@@ -0,0 +1,76 @@
+"""EventQueue benchmarks: inserting events and finding the next ones to run."""
+
+from benchmarks.harness import SIZES, Workload, benchmark
+from benchmarks.workloads import BASE_TIME, simulator_events
+from models.event import EventStatus
+from models.queue import EventQueue
+
+# Calls per repetition for benchmarks that time a single operation
+CALLS = 100
+
+
+def _queue(size: int) -> EventQueue:
+    """Create a queue holding size pending events."""
+    queue = EventQueue()
+    queue.add_events(simulator_events(size))
+    return queue
+
+
+@benchmark("queue.add_event", sizes=SIZES)
+def queue_add_event(size: int) -> Workload:
+    """Insert events one at a time at the front of a queue of size events."""
+    queue = _queue(size)
+    new_events = simulator_events(CALLS)
+
+    def run() -> None:
+        for event in new_events:
+            queue.add_event(event)
+
+    return Workload(run, operations=CALLS)
+
+
+@benchmark("queue.add_events", sizes=SIZES)
+def queue_add_events(size: int) -> Workload:
+    """Bulk-insert size events into an empty queue."""
+    queue = EventQueue()
+    events = simulator_events(size)
+    return Workload(lambda: queue.add_events(events), operations=size)
+
+
+@benchmark("queue.peek_next", sizes=SIZES)
+def queue_peek_next(size: int) -> Workload:
+    """Find the next pending event when the first half has already run."""
+    queue = _queue(size)
+    for event in queue.events[: size // 2]:
+        event.status = EventStatus.EXECUTED
+
+    def run() -> None:
+        for _ in range(CALLS):
+            queue.peek_next()
+
+    return Workload(run, operations=CALLS)
+
+
+@benchmark("queue.get_due_events", sizes=SIZES)
+def queue_get_due_events(size: int) -> Workload:
+    """Collect the due events when 1% of a queue of size events is due."""
+    queue = _queue(size)
+    current_time = queue.events[size // 100].scheduled_time
+
+    def run() -> None:
+        for _ in range(CALLS):
+            queue.get_due_events(current_time)
+
+    return Workload(run, operations=CALLS)
+
+
+@benchmark("queue.get_due_events_none_due", sizes=SIZES)
+def queue_get_due_events_none_due(size: int) -> Workload:
+    """Check for due events when nothing is due, as every tick does."""
+    queue = _queue(size)
+
+    def run() -> None:
+        for _ in range(CALLS):
+            queue.get_due_events(BASE_TIME)
+
+    return Workload(run, operations=CALLS)
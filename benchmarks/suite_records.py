@@ -0,0 +1,56 @@
+"""Entity record benchmarks: construction and serialization.
+
+Modality states hold their high-volume entities as slotted records (see
+models/records.py). Each benchmark takes the records a state holds after
+size inputs and rebuilds or dumps every one of them, reporting records per
+second. bench_records.py compares the same operations, and memory, against
+the Pydantic models the records mirror.
+"""
+
+from functools import partial
+from itertools import cycle, islice
+
+from benchmarks.harness import Workload, benchmark
+from benchmarks.workloads import stored_records
+
+# Populating SMS and chat states slows down as they grow (see suite_modalities)
+SIZES = (1_000, 10_000)
+
+MODALITIES = ("email", "sms", "chat", "calendar", "location", "weather")
+
+
+def _records(modality: str, size: int) -> list:
+    """Return size stored records, repeated if the state caps its history."""
+    return list(islice(cycle(stored_records(modality, size)), size))
+
+
+def _build(modality: str, size: int) -> Workload:
+    """Prepare a workload constructing every stored record from its fields."""
+    records = _records(modality, size)
+    record_type = type(records[0])
+    fields = [
+        {name: getattr(record, name) for name in record_type.__slots__}
+        for record in records
+    ]
+
+    def run() -> None:
+        for values in fields:
+            record_type(**values)
+
+    return Workload(run, operations=len(fields))
+
+
+def _dump(modality: str, size: int) -> Workload:
+    """Prepare a workload dumping every stored record."""
+    records = _records(modality, size)
+
+    def run() -> None:
+        for record in records:
+            record.model_dump()
+
+    return Workload(run, operations=len(records))
+
+
+for _modality in MODALITIES:
+    benchmark(f"records.build.{_modality}", sizes=SIZES)(partial(_build, _modality))
+    benchmark(f"records.dump.{_modality}", sizes=SIZES)(partial(_dump, _modality))
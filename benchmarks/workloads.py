@@ -0,0 +1,658 @@
+"""Deterministic inputs, states, and engines for the benchmark suite.
+
+Everything here is built from fixed timestamps and counters rather than
+random data or the wall clock, so two runs of a benchmark at the same size
+do exactly the same work.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from models.environment import Environment
+from models.event import SimulatorEvent
+from models.modalities.calendar_input import CalendarInput
+from models.modalities.calendar_state import CalendarState
+from models.modalities.chat_input import ChatInput
+from models.modalities.chat_state import ChatState
+from models.modalities.email_input import EmailInput
+from models.modalities.email_state import EmailState
+from models.modalities.location_input import LocationInput
+from models.modalities.location_state import LocationState
+from models.modalities.screen_input import ScreenElement, ScreenInput
+from models.modalities.slack_input import SlackInput
+from models.modalities.sms_input import SMSInput
+from models.modalities.sms_state import SMSState
+from models.modalities.time_input import TimeInput
+from models.modalities.time_state import TimeState
+from models.modalities.weather_input import (
+    CurrentWeather,
+    DailyFeelsLike,
+    DailyForecast,
+    DailyTemperature,
+    HourlyForecast,
+    MinutelyForecast,
+    WeatherCondition,
+    WeatherInput,
+    WeatherReport,
+)
+from models.modalities.weather_state import WeatherState
+from models.queue import EventQueue
+from models.records import Record
+from models.simulation import SimulationEngine
+from models.time import SimulatorTime
+
+# Simulator time every benchmark starts from
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+USER_EMAIL = "user@example.com"
+USER_PHONE = "+15550000000"
+
+_BODY = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 10
+
+
+def _at(i: int) -> datetime:
+    """Timestamp of the i-th input, one second apart."""
+    return BASE_TIME + timedelta(seconds=i + 1)
+
+
+def email_inputs(count: int, operation: str = "receive") -> list[EmailInput]:
+    """Create received or sent emails.
+
+    Args:
+        count: Number of inputs.
+        operation: "receive" or "send".
+
+    Returns:
+        Email inputs spread over 50 correspondents and 20 subjects.
+    """
+    inputs = []
+    for i in range(count):
+        correspondent = f"contact{i % 50}@example.com"
+        inputs.append(
+            EmailInput(
+                timestamp=_at(i),
+                operation=operation,
+                from_address=correspondent if operation == "receive" else USER_EMAIL,
+                to_addresses=[USER_EMAIL if operation == "receive" else correspondent],
+                subject=f"Quarterly report {i % 20}",
+                body_text=_BODY,
+                labels=[f"project-{i % 5}"],
+            )
+        )
+    return inputs
+
+
+def email_mark_read_inputs(message_ids: list[str]) -> list[EmailInput]:
+    """Create one mark_read input per message.
+
+    Args:
+        message_ids: Messages to mark as read.
+
+    Returns:
+        Email inputs.
+    """
+    return [
+        EmailInput(timestamp=_at(i), operation="mark_read", message_ids=[message_id])
+        for i, message_id in enumerate(message_ids)
+    ]
+
+
+def sms_inputs(count: int, action: str = "receive_message") -> list[SMSInput]:
+    """Create received or sent text messages.
+
+    Args:
+        count: Number of inputs.
+        action: "receive_message" or "send_message".
+
+    Returns:
+        SMS inputs spread over 50 conversations.
+    """
+    inputs = []
+    for i in range(count):
+        contact = f"+1555100{i % 50:04d}"
+        incoming = action == "receive_message"
+        inputs.append(
+            SMSInput(
+                timestamp=_at(i),
+                action=action,
+                message_data={
+                    "from_number": contact if incoming else USER_PHONE,
+                    "to_numbers": [USER_PHONE if incoming else contact],
+                    "body": f"Message {i}: are we still on for lunch?",
+                },
+            )
+        )
+    return inputs
+
+
+def chat_inputs(count: int) -> list[ChatInput]:
+    """Create alternating user and assistant chat messages.
+
+    Args:
+        count: Number of inputs.
+
+    Returns:
+        Chat inputs spread over 10 conversations.
+    """
+    return [
+        ChatInput(
+            timestamp=_at(i),
+            operation="send_message",
+            role="user" if i % 2 == 0 else "assistant",
+            content=f"Message {i} about the quarterly report",
+            conversation_id=f"conversation-{i % 10}",
+        )
+        for i in range(count)
+    ]
+
+
+def calendar_inputs(count: int) -> list[CalendarInput]:
+    """Create one-hour calendar events, one per hour.
+
+    Args:
+        count: Number of inputs.
+
+    Returns:
+        Calendar create inputs with fixed event IDs.
+    """
+    return [
+        CalendarInput(
+            timestamp=_at(i),
+            operation="create",
+            event_id=f"event-{i}",
+            title=f"Meeting {i % 20}",
+            start=BASE_TIME + timedelta(hours=i),
+            end=BASE_TIME + timedelta(hours=i + 1),
+            location=f"Room {i % 10}",
+        )
+        for i in range(count)
+    ]
+
+
+def calendar_update_inputs(event_ids: list[str]) -> list[CalendarInput]:
+    """Create one title update per calendar event.
+
+    Args:
+        event_ids: Events to update.
+
+    Returns:
+        Calendar update inputs.
+    """
+    return [
+        CalendarInput(
+            timestamp=_at(i), operation="update", event_id=event_id, title="Moved"
+        )
+        for i, event_id in enumerate(event_ids)
+    ]
+
+
+def location_inputs(count: int) -> list[LocationInput]:
+    """Create a GPS trace heading north-east.
+
+    Args:
+        count: Number of inputs.
+
+    Returns:
+        Location inputs.
+    """
+    return [
+        LocationInput(
+            timestamp=_at(i),
+            latitude=40.0 + i * 1e-5,
+            longitude=-74.0 + i * 1e-5,
+            named_location="Office" if i % 100 == 0 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def weather_inputs(count: int) -> list[WeatherInput]:
+    """Create current-weather reports for 10 locations.
+
+    Args:
+        count: Number of inputs.
+
+    Returns:
+        Weather inputs.
+    """
+    inputs = []
+    for i in range(count):
+        lat, lon = 37.0 + i % 10, -122.0
+        dt = int(_at(i).timestamp())
+        report = WeatherReport(
+            lat=lat,
+            lon=lon,
+            timezone="America/Los_Angeles",
+            timezone_offset=-28800,
+            current=CurrentWeather(
+                dt=dt,
+                sunrise=dt - 3600,
+                sunset=dt + 36000,
+                temp=288.15 + i % 10,
+                feels_like=288.15,
+                pressure=1013,
+                humidity=60,
+                dew_point=280.15,
+                uvi=3.0,
+                clouds=20,
+                visibility=10000,
+                wind_speed=3.5,
+                wind_deg=180,
+                weather=[
+                    WeatherCondition(
+                        id=800, main="Clear", description="clear sky", icon="01d"
+                    )
+                ],
+            ),
+        )
+        inputs.append(
+            WeatherInput(timestamp=_at(i), latitude=lat, longitude=lon, report=report)
+        )
+    return inputs
+
+
+def forecast_report(i: int, lat: float = 37.0, lon: float = -122.0) -> WeatherReport:
+    """Create a full One Call report: current, 60 minutes, 48 hours, 8 days.
+
+    Args:
+        i: Report number, used to vary the values.
+        lat: Location latitude.
+        lon: Location longitude.
+
+    Returns:
+        A weather report in standard units.
+    """
+    dt = int(_at(i).timestamp())
+    clear = [WeatherCondition(id=800, main="Clear", description="clear sky", icon="01d")]
+    rain = [WeatherCondition(id=500, main="Rain", description="light rain", icon="10d")]
+    return WeatherReport(
+        lat=lat,
+        lon=lon,
+        timezone="America/Los_Angeles",
+        timezone_offset=-28800,
+        current=CurrentWeather(
+            dt=dt,
+            sunrise=dt - 3600,
+            sunset=dt + 36000,
+            temp=288.15 + i % 10,
+            feels_like=287.15,
+            pressure=1013,
+            humidity=60,
+            dew_point=280.15,
+            uvi=3.0,
+            clouds=20,
+            visibility=10000,
+            wind_speed=3.5,
+            wind_deg=180,
+            wind_gust=6.1,
+            weather=clear,
+        ),
+        minutely=[
+            MinutelyForecast(dt=dt + 60 * m, precipitation=(m % 7) * 0.1)
+            for m in range(60)
+        ],
+        hourly=[
+            HourlyForecast(
+                dt=dt + 3600 * h,
+                temp=285.0 + (h % 24) * 0.5,
+                feels_like=284.0 + (h % 24) * 0.5,
+                pressure=1010 + h % 5,
+                humidity=50 + h % 30,
+                dew_point=279.0 + h % 3,
+                uvi=(h % 12) * 0.5,
+                clouds=(h * 7) % 100,
+                visibility=10000,
+                wind_speed=2.0 + (h % 6) * 0.7,
+                wind_deg=(h * 15) % 360,
+                wind_gust=4.0 + h % 4 if h % 3 else None,
+                weather=rain if h % 5 == 0 else clear,
+                pop=(h % 10) / 10,
+                rain={"1h": 0.4} if h % 5 == 0 else None,
+            )
+            for h in range(48)
+        ],
+        daily=[
+            DailyForecast(
+                dt=dt + 86400 * d,
+                sunrise=dt + 86400 * d - 3600,
+                sunset=dt + 86400 * d + 36000,
+                moonrise=dt + 86400 * d + 7200,
+                moonset=dt + 86400 * d + 50000,
+                moon_phase=d / 8,
+                summary="Expect a day of partly cloudy with rain",
+                temp=DailyTemperature(
+                    day=290.0 + d,
+                    min=282.0 + d,
+                    max=293.0 + d,
+                    night=284.0,
+                    eve=288.0,
+                    morn=283.0,
+                ),
+                feels_like=DailyFeelsLike(day=289.0 + d, night=283.0, eve=287.0, morn=282.0),
+                pressure=1012,
+                humidity=55,
+                dew_point=281.0,
+                wind_speed=4.2,
+                wind_deg=200,
+                wind_gust=7.5,
+                weather=rain if d % 3 == 0 else clear,
+                clouds=40,
+                pop=0.3,
+                rain=1.2 if d % 3 == 0 else None,
+                uvi=5.5,
+            )
+            for d in range(8)
+        ],
+    )
+
+
+def forecast_inputs(count: int) -> list[WeatherInput]:
+    """Create full forecast reports for 10 locations.
+
+    Args:
+        count: Number of inputs.
+
+    Returns:
+        Weather inputs whose reports include every forecast section.
+    """
+    inputs = []
+    for i in range(count):
+        lat, lon = 37.0 + i % 10, -122.0
+        inputs.append(
+            WeatherInput(
+                timestamp=_at(i),
+                latitude=lat,
+                longitude=lon,
+                report=forecast_report(i, lat, lon),
+            )
+        )
+    return inputs
+
+
+def time_inputs(count: int) -> list[TimeInput]:
+    """Create alternating time preference changes.
+
+    Args:
+        count: Number of inputs.
+
+    Returns:
+        Time inputs.
+    """
+    zones = ("UTC", "America/New_York", "Europe/London", "Asia/Tokyo")
+    return [
+        TimeInput(
+            timestamp=_at(i),
+            timezone=zones[i % len(zones)],
+            format_preference="24h" if i % 2 else "12h",
+        )
+        for i in range(count)
+    ]
+
+
+def slack_channel_inputs(channels: int) -> list[SlackInput]:
+    """Create the channels slack_post_inputs() posts to.
+
+    Args:
+        channels: Number of channels.
+
+    Returns:
+        create_channel inputs for channels C00000 onwards.
+    """
+    return [
+        SlackInput(
+            timestamp=BASE_TIME,
+            operation="create_channel",
+            channel_id=f"C{number:05d}",
+            workspace_id="T1",
+        )
+        for number in range(channels)
+    ]
+
+
+def slack_post_inputs(count: int, channels: int = 100) -> list[SlackInput]:
+    """Create Slack posts spread unevenly over channels.
+
+    Half the posts go to C00000 and the rest round-robin over the others.
+    Every tenth post to C00000 replies to a recent message there, one post
+    in twenty mentions another user and one in fifty mentions the
+    simulated user.
+
+    Args:
+        count: Number of inputs.
+        channels: Number of channels, as created by slack_channel_inputs().
+
+    Returns:
+        post_message inputs.
+    """
+    inputs = []
+    for i in range(count):
+        hot = i % 2 == 0 or channels == 1
+        text = f"Message {i} about the deploy after lunch"
+        if i % 20 == 0:
+            text = f"<@U{i % 50}> {text}"
+        if i % 50 == 0:
+            text = f"<@user> {text}"
+        inputs.append(
+            SlackInput(
+                timestamp=_at(i),
+                operation="post_message",
+                channel_id="C00000" if hot else f"C{1 + i // 2 % (channels - 1):05d}",
+                author=f"U{i % 50}",
+                text=text,
+                thread_seq=max(i // 2 - 5, 0) if hot and i % 10 == 0 and i >= 10 else None,
+            )
+        )
+    return inputs
+
+
+def screen_elements(app: str, elements: int) -> dict[str, ScreenElement]:
+    """Build a UI tree: a form of textboxes, a list of rows and a page body.
+
+    Args:
+        app: Application name, used for the window.
+        elements: Total number of elements.
+
+    Returns:
+        Elements by ID.
+    """
+    tree = {
+        "root": ScreenElement(role="window", name=app),
+        "form": ScreenElement(role="form", parent_id="root"),
+        "list": ScreenElement(role="list", parent_id="root"),
+        "page": ScreenElement(role="document", parent_id="root"),
+    }
+    for number in range(10):
+        tree[f"field{number}"] = ScreenElement(role="textbox", value="", parent_id="form")
+    for number in range(200):
+        tree[f"row{number}"] = ScreenElement(
+            role="listitem", name=f"Item {number}", parent_id="list"
+        )
+    for number in range(max(elements - len(tree), 0)):
+        tree[f"node{number}"] = ScreenElement(
+            role="text", name=f"Text {number}", parent_id="page"
+        )
+    return tree
+
+
+def screen_inputs(count: int, elements: int = 500) -> list[ScreenInput]:
+    """Create a scripted screen session.
+
+    The session renders a screen of elements, then repeats a cycle of
+    twelve keystrokes, four hovers, three scrolls (each replacing 20 list
+    rows) and a click on another textbox. Every 5,000 steps it switches to
+    another app, rendering a new screen.
+
+    Args:
+        count: Number of inputs.
+        elements: Elements per rendered screen.
+
+    Returns:
+        Screen inputs, one 50 ms apart.
+    """
+    inputs = []
+    field = "field0"
+    text = ""
+    for i in range(count):
+        timestamp = BASE_TIME + timedelta(milliseconds=50 * (i + 1))
+        step = i % 20
+        if i % 5_000 == 0:
+            app = f"App{i // 5_000 % 5}"
+            fields = {
+                "interaction_type": "render",
+                "app": app,
+                "window": "main",
+                "elements": screen_elements(app, elements),
+            }
+            text = ""
+        elif step < 12:
+            text = text[-200:] + "abcdefghij "[i % 11]
+            fields = {
+                "interaction_type": "type",
+                "target_element": field,
+                "interaction_data": {"text": text[-1]},
+                "elements": {
+                    field: ScreenElement(role="textbox", value=text, parent_id="form")
+                },
+            }
+        elif step < 16:
+            target = f"row{i % 200}"
+            fields = {
+                "interaction_type": "hover",
+                "target_element": target,
+                "elements": {
+                    target: ScreenElement(
+                        role="listitem", parent_id="list", properties={"hovered": True}
+                    )
+                },
+            }
+        elif step < 19:
+            first = i % 180
+            fields = {
+                "interaction_type": "scroll",
+                "interaction_data": {"first_row": first},
+                "elements": {
+                    f"row{row}": ScreenElement(
+                        role="listitem",
+                        name=f"Item {row}",
+                        parent_id="list",
+                        properties={"visible": True},
+                    )
+                    for row in range(first, first + 20)
+                },
+            }
+        else:
+            field = f"field{i // 20 % 10}"
+            text = ""
+            fields = {"interaction_type": "click", "target_element": field}
+        inputs.append(ScreenInput(timestamp=timestamp, **fields))
+    return inputs
+
+
+def create_states() -> dict:
+    """Create an empty state for every modality the server registers.
+
+    Returns:
+        Mapping of modality name to a fresh state.
+    """
+    return {
+        "weather": WeatherState(last_updated=BASE_TIME),
+        "email": EmailState(last_updated=BASE_TIME),
+        "sms": SMSState(last_updated=BASE_TIME, user_phone_number=USER_PHONE),
+        "chat": ChatState(last_updated=BASE_TIME),
+        "calendar": CalendarState(last_updated=BASE_TIME),
+        "location": LocationState(last_updated=BASE_TIME),
+        "time": TimeState(last_updated=BASE_TIME),
+    }
+
+
+def populated_state(modality: str, size: int):
+    """Create a modality state holding size items.
+
+    Args:
+        modality: One of the modalities from create_states().
+        size: Number of inputs to apply.
+
+    Returns:
+        The populated state.
+    """
+    state = create_states()[modality]
+    for input_data in MODALITY_INPUTS[modality](size):
+        state.apply_input(input_data)
+    return state
+
+
+def stored_records(modality: str, size: int) -> list[Record]:
+    """Populate a modality state and return the entity records it holds.
+
+    Args:
+        modality: Any modality from create_states() except time.
+        size: Number of records to return.
+
+    Returns:
+        The state's emails, messages, events or history entries.
+    """
+    # Location and weather keep each place's latest report out of history
+    extra = {"location": 1, "weather": 10}.get(modality, 0)
+    state = populated_state(modality, size + extra)
+    if modality == "email":
+        return list(state.emails.values())
+    if modality == "sms":
+        return list(state.messages.values())
+    if modality == "chat":
+        return list(state.messages)
+    if modality == "calendar":
+        return list(state.events.values())
+    if modality == "location":
+        return list(state.location_history)
+    return [
+        entry for location in state.locations.values() for entry in location.report_history
+    ]
+
+
+def create_engine() -> SimulationEngine:
+    """Create an engine like the server's, starting at BASE_TIME.
+
+    Returns:
+        A stopped engine with empty states and queue.
+    """
+    environment = Environment(
+        modality_states=create_states(),
+        time_state=SimulatorTime(current_time=BASE_TIME, last_wall_time_update=BASE_TIME),
+    )
+    return SimulationEngine(environment=environment, event_queue=EventQueue())
+
+
+def simulator_events(count: int) -> list[SimulatorEvent]:
+    """Create events alternating between email and location, one second apart.
+
+    Args:
+        count: Number of events.
+
+    Returns:
+        Pending events, in schedule order.
+    """
+    emails = email_inputs((count + 1) // 2)
+    locations = location_inputs(count // 2)
+    events = []
+    for i in range(count):
+        data = locations[i // 2] if i % 2 else emails[i // 2]
+        events.append(
+            SimulatorEvent(
+                scheduled_time=_at(i),
+                modality=data.modality_type,
+                data=data,
+                created_at=BASE_TIME,
+            )
+        )
+    return events
+
+
+# Input builders used to populate each modality
+MODALITY_INPUTS = {
+    "weather": weather_inputs,
+    "email": email_inputs,
+    "sms": sms_inputs,
+    "chat": chat_inputs,
+    "calendar": calendar_inputs,
+    "location": location_inputs,
+    "time": time_inputs,
+}
@@ -30,6 +30,9 @@ Example:
 Exports:
     UESClient: Synchronous client for the UES REST API.
     AsyncUESClient: Asynchronous client for the UES REST API.
+    Batch, AsyncBatch: Calls collected by client.batch() and sent as one
+        request.
+    BatchFuture: The result of a batched call.
     
     Exceptions:
         UESClientError: Base exception for all client errors.
@@ -115,11 +118,16 @@ from client.models import (
     SimulationStatusResponse,
 )
 from client.client import AsyncUESClient, UESClient
+from client._batch import AsyncBatch, Batch, BatchFuture
 
 __all__ = [
     # Main clients
     "UESClient",
     "AsyncUESClient",
+    # Request batching
+    "Batch",
+    "AsyncBatch",
+    "BatchFuture",
     # Sub-clients (for direct use or Phase 4 integration)
     "EmailClient",
     "AsyncEmailClient",
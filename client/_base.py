@@ -7,12 +7,32 @@ and accessing the shared HTTP client.
 This is an internal module and should not be imported directly by users.
 """
 
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from client._http import AsyncHTTPClient, HTTPClient
 
 
+def _build_request_data(values: dict[str, Any]) -> dict[str, Any]:
+    """Build a request body or query dict from keyword arguments.
+    
+    Drops None values and converts datetimes to ISO 8601 strings.
+    
+    Args:
+        values: Raw parameter values.
+    
+    Returns:
+        Dictionary ready to send as JSON or query parameters.
+    """
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in values.items()
+        if value is not None
+    }
+
+
 class BaseClient:
     """Base class for synchronous sub-clients.
     
@@ -91,6 +111,26 @@ class BaseClient:
             The parsed JSON response.
         """
         return self._http.delete(path, params=params)
+    
+    def _stream(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> Iterator[Any]:
+        """Make a request and iterate over its NDJSON response.
+        
+        Args:
+            method: The HTTP method.
+            path: The URL path.
+            json: JSON body to send.
+            params: Query parameters.
+        
+        Yields:
+            Each parsed JSON document from the response body.
+        """
+        return self._http.iter_ndjson(method, path, params=params, json=json)
 
 
 class AsyncBaseClient:
@@ -171,3 +211,23 @@ class AsyncBaseClient:
             The parsed JSON response.
         """
         return await self._http.delete(path, params=params)
+    
+    def _stream(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Make an async request and iterate over its NDJSON response.
+        
+        Args:
+            method: The HTTP method.
+            path: The URL path.
+            json: JSON body to send.
+            params: Query parameters.
+        
+        Yields:
+            Each parsed JSON document from the response body.
+        """
+        return self._http.iter_ndjson(method, path, params=params, json=json)
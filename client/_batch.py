@@ -0,0 +1,421 @@
+"""Request batching for the UES client.
+
+Batch and AsyncBatch collect the sub-client calls made inside a
+``with client.batch() as batch:`` block and send them to the server as one
+POST /batch when the block exits, so a burst of small calls costs one
+round-trip and one engine lock acquisition instead of one each. The server
+runs them in order.
+
+Calls inside the block return a BatchFuture right away, without a request
+(and without await, for the async client). To record a call, the sub-client
+method runs against a stand-in HTTP client that captures the request it
+builds. Once the batch's responses arrive, the method runs again against a
+stand-in that answers with its response, so futures resolve to the same
+models, and failed calls raise the same exceptions, as unbatched calls.
+
+Only methods that make exactly one request can be batched; streaming
+methods cannot.
+
+This is an internal module and should not be imported directly by users.
+"""
+
+import functools
+import inspect
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from client._embedded import _drop_none
+from client._http import HttpMethod, _parse_error_body, _raise_for_error
+
+if TYPE_CHECKING:
+    from client.client import AsyncUESClient, UESClient
+
+T = TypeVar("T")
+
+# Sub-requests per POST /batch, the server's limit (api/routes/batch.py)
+MAX_BATCH_REQUESTS = 1000
+
+# Sub-client attributes of UESClient and AsyncUESClient that can be batched
+SUB_CLIENTS = frozenset(
+    {
+        "time",
+        "simulation",
+        "events",
+        "environment",
+        "email",
+        "sms",
+        "chat",
+        "calendar",
+        "location",
+        "weather",
+    }
+)
+
+
+class BatchFuture(Generic[T]):
+    """The result of a call made inside a batch, available once it is sent."""
+
+    def __init__(self) -> None:
+        """Initialize an unresolved future."""
+        self._done = False
+        self._result: T | None = None
+        self._exception: BaseException | None = None
+
+    def done(self) -> bool:
+        """Return whether the batch has been sent and the call resolved."""
+        return self._done
+
+    def result(self) -> T:
+        """Return the call's result.
+
+        Returns:
+            What the sub-client method would have returned unbatched.
+
+        Raises:
+            RuntimeError: If the batch has not been sent yet.
+            APIError: The exception the call would have raised unbatched.
+        """
+        if self.exception() is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self) -> BaseException | None:
+        """Return the exception the call raised, or None if it succeeded.
+
+        Raises:
+            RuntimeError: If the batch has not been sent yet.
+        """
+        if not self._done:
+            raise RuntimeError("The batch has not been sent yet")
+        return self._exception
+
+    def _set_result(self, result: T) -> None:
+        self._result = result
+        self._done = True
+
+    def _set_exception(self, exception: BaseException) -> None:
+        self._exception = exception
+        self._done = True
+
+
+class _Captured(BaseException):
+    """Carries a request out of the sub-client method that built it.
+
+    A BaseException, so that methods catching Exception do not swallow it.
+    """
+
+    def __init__(self, request: dict[str, Any]) -> None:
+        self.request = request
+
+
+class _Recorder:
+    """HTTP client stand-in that captures the first request made through it."""
+
+    def request(
+        self,
+        method: HttpMethod,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> Any:
+        raise _Captured(
+            {"method": method, "path": path, "params": _drop_none(params), "body": json}
+        )
+
+    def iter_ndjson(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("Streaming requests cannot be batched")
+
+    def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        return self.request("GET", path, params=params)
+
+    def post(self, path: str, json: Any = None, params: dict[str, Any] | None = None) -> Any:
+        return self.request("POST", path, params=params, json=json)
+
+    def put(self, path: str, json: Any = None, params: dict[str, Any] | None = None) -> Any:
+        return self.request("PUT", path, params=params, json=json)
+
+    def delete(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        return self.request("DELETE", path, params=params)
+
+
+class _Replay:
+    """HTTP client stand-in that answers a call's request with its batch response."""
+
+    def __init__(self, response: dict[str, Any]) -> None:
+        """Initialize the stand-in.
+
+        Args:
+            response: The call's entry of the batch response.
+        """
+        self._response: dict[str, Any] | None = response
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        """Return the response body, or raise the exception for an error.
+
+        Raises:
+            APIError: If the response has an error status.
+            TypeError: If the method makes a second request.
+        """
+        response, self._response = self._response, None
+        if response is None:
+            raise TypeError("Methods that make more than one request cannot be batched")
+        status_code, body = response["status_code"], response.get("body")
+        if status_code >= 400:
+            message, error_type, details = _parse_error_body(body)
+            _raise_for_error(status_code, message, error_type, details, body)
+        return body
+
+    def iter_ndjson(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("Streaming requests cannot be batched")
+
+    def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        return self.request()
+
+    def post(self, path: str, json: Any = None, params: dict[str, Any] | None = None) -> Any:
+        return self.request()
+
+    def put(self, path: str, json: Any = None, params: dict[str, Any] | None = None) -> Any:
+        return self.request()
+
+    def delete(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        return self.request()
+
+
+class _AsyncReplay(_Replay):
+    """Awaitable version of _Replay for the async sub-clients."""
+
+    async def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        return self.request()
+
+    async def post(
+        self, path: str, json: Any = None, params: dict[str, Any] | None = None
+    ) -> Any:
+        return self.request()
+
+    async def put(
+        self, path: str, json: Any = None, params: dict[str, Any] | None = None
+    ) -> Any:
+        return self.request()
+
+    async def delete(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        return self.request()
+
+
+def _capture(call: Callable[[], Any], name: str) -> dict[str, Any]:
+    """Run a sub-client method against a _Recorder and return its request.
+
+    Async methods are driven up to their first await, which is where the
+    request is made.
+
+    Raises:
+        TypeError: If the method does not make a request right away.
+    """
+    try:
+        result = call()
+        if inspect.iscoroutine(result):
+            try:
+                result.send(None)
+            except StopIteration:
+                pass
+            finally:
+                result.close()
+    except _Captured as captured:
+        return captured.request
+    raise TypeError(f"{name}() does not make a single request and cannot be batched")
+
+
+@dataclass
+class _Call:
+    """A call recorded in a batch."""
+
+    sub_client_class: type
+    name: str
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    request: dict[str, Any]
+    future: BatchFuture
+
+
+class _BatchedSubClient:
+    """Sub-client whose method calls are recorded in a batch."""
+
+    def __init__(self, batch: "_BatchBase", sub_client_class: type) -> None:
+        self._batch = batch
+        self._sub_client_class = sub_client_class
+        self._recording = sub_client_class(_Recorder())
+
+    def __getattr__(self, name: str) -> Callable[..., BatchFuture]:
+        method = getattr(self._recording, name)
+
+        @functools.wraps(method)
+        def record(*args: Any, **kwargs: Any) -> BatchFuture:
+            return self._batch._record(
+                self._sub_client_class, name, lambda: method(*args, **kwargs), args, kwargs
+            )
+
+        return record
+
+
+class _BatchBase:
+    """Recording shared by Batch and AsyncBatch."""
+
+    def __init__(self, client: "UESClient | AsyncUESClient") -> None:
+        """Initialize an empty batch.
+
+        Args:
+            client: The client the batch is sent through.
+        """
+        self._client = client
+        self._calls: list[_Call] = []
+        self._sent = False
+
+    def __len__(self) -> int:
+        """Return the number of calls recorded so far."""
+        return len(self._calls)
+
+    def __getattr__(self, name: str) -> _BatchedSubClient:
+        """Access a sub-client whose calls are recorded (batch.email, ...)."""
+        if name not in SUB_CLIENTS:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        sub_client = _BatchedSubClient(self, type(getattr(self._client, name)))
+        setattr(self, name, sub_client)
+        return sub_client
+
+    def _record(
+        self,
+        sub_client_class: type,
+        name: str,
+        call: Callable[[], Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> BatchFuture:
+        """Record a call and return its future."""
+        if self._sent:
+            raise RuntimeError("The batch has already been sent")
+        future: BatchFuture = BatchFuture()
+        self._calls.append(
+            _Call(sub_client_class, name, args, kwargs, _capture(call, name), future)
+        )
+        return future
+
+    def _chunks(self) -> list[list[_Call]]:
+        """Mark the batch sent and split its calls into POST /batch requests."""
+        if self._sent:
+            raise RuntimeError("The batch has already been sent")
+        self._sent = True
+        return [
+            self._calls[start : start + MAX_BATCH_REQUESTS]
+            for start in range(0, len(self._calls), MAX_BATCH_REQUESTS)
+        ]
+
+    def _fail(self, exception: BaseException) -> None:
+        """Resolve every unresolved future with exception."""
+        for call in self._calls:
+            if not call.future.done():
+                call.future._set_exception(exception)
+
+
+class Batch(_BatchBase):
+    """Calls collected by UESClient.batch(), sent together as one request.
+
+    Sub-client attributes (batch.email, batch.time, ...) take the same
+    methods as the client's; each call returns a BatchFuture. The batch is
+    sent when the with block exits without an exception, or by send().
+
+    Example::
+
+        with client.batch() as batch:
+            batch.email.read(email_ids)
+            batch.email.star(starred_ids)
+            sms = batch.sms.get_state()
+        print(sms.result().message_count)
+    """
+
+    def __enter__(self) -> "Batch":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: Any) -> None:
+        """Send the batch, unless the block raised."""
+        if exc_type is None:
+            self.send()
+
+    def send(self) -> None:
+        """Send the recorded calls and resolve their futures.
+
+        Calls that fail resolve to their exception; use BatchFuture.result()
+        to raise it.
+
+        Raises:
+            RuntimeError: If the batch has already been sent.
+            UESClientError: If the batch request itself fails; every
+                unresolved future then holds the same exception.
+        """
+        try:
+            for calls in self._chunks():
+                data = self._client._http.post(
+                    "/batch", json={"requests": [call.request for call in calls]}
+                )
+                for call, response in zip(calls, data["responses"]):
+                    sub_client = call.sub_client_class(_Replay(response))
+                    try:
+                        result = getattr(sub_client, call.name)(*call.args, **call.kwargs)
+                    except Exception as e:
+                        call.future._set_exception(e)
+                    else:
+                        call.future._set_result(result)
+        except Exception as e:
+            self._fail(e)
+            raise
+
+
+class AsyncBatch(_BatchBase):
+    """Calls collected by AsyncUESClient.batch(), sent together as one request.
+
+    Like Batch, but entered with async with. Calls inside the block are not
+    awaited; they return a BatchFuture right away.
+
+    Example::
+
+        async with client.batch() as batch:
+            batch.email.read(email_ids)
+            sms = batch.sms.get_state()
+        print(sms.result().message_count)
+    """
+
+    async def __aenter__(self) -> "AsyncBatch":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, *args: Any) -> None:
+        """Send the batch, unless the block raised."""
+        if exc_type is None:
+            await self.send()
+
+    async def send(self) -> None:
+        """Send the recorded calls and resolve their futures.
+
+        Raises:
+            RuntimeError: If the batch has already been sent.
+            UESClientError: If the batch request itself fails; every
+                unresolved future then holds the same exception.
+        """
+        try:
+            for calls in self._chunks():
+                data = await self._client._http.post(
+                    "/batch", json={"requests": [call.request for call in calls]}
+                )
+                for call, response in zip(calls, data["responses"]):
+                    sub_client = call.sub_client_class(_AsyncReplay(response))
+                    try:
+                        result = await getattr(sub_client, call.name)(
+                            *call.args, **call.kwargs
+                        )
+                    except Exception as e:
+                        call.future._set_exception(e)
+                    else:
+                        call.future._set_result(result)
+        except Exception as e:
+            self._fail(e)
+            raise
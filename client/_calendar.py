@@ -190,15 +190,19 @@ class CalendarQueryResponse(BaseModel):
     
     Attributes:
         modality_type: Always "calendar".
-        events: List of CalendarEvent objects matching query.
+        events: List of CalendarEvent objects matching query. Partial dicts containing
+            only the requested fields when the query used a projection.
         count: Number of events returned.
-        total_count: Total matching events.
+        total_count: Total matching events. None for pages fetched with a cursor.
+        next_cursor: Cursor for the next page, or None if there are no more
+            results.
     """
 
     modality_type: str = "calendar"
-    events: list[CalendarEvent]
+    events: list[CalendarEvent] | list[dict[str, Any]] = Field(union_mode="left_to_right")
     count: int
-    total_count: int
+    total_count: int | None
+    next_cursor: str | None = None
 
 
 # Synchronous CalendarClient
@@ -263,6 +267,8 @@ class CalendarClient(BaseClient):
         offset: int = 0,
         sort_by: str = "start",
         sort_order: Literal["asc", "desc"] = "asc",
+        fields: list[str] | None = None,
+        cursor: str | None = None,
     ) -> CalendarQueryResponse:
         """Query calendar events with filters.
         
@@ -282,6 +288,10 @@ class CalendarClient(BaseClient):
             offset: Number of results to skip (for pagination).
             sort_by: Field to sort by (default: "start").
             sort_order: Sort direction ("asc" or "desc").
+            fields: Only return these CalendarEvent fields for each result. Results
+                are then plain dicts rather than CalendarEvent objects.
+            cursor: next_cursor from a previous response, to fetch the page
+                that follows it (cannot be combined with offset).
         
         Returns:
             Matching events with pagination info.
@@ -317,6 +327,10 @@ class CalendarClient(BaseClient):
             request_data["sort_by"] = sort_by
         if sort_order != "asc":
             request_data["sort_order"] = sort_order
+        if fields is not None:
+            request_data["fields"] = fields
+        if cursor is not None:
+            request_data["cursor"] = cursor
         
         data = self._post(f"{self._BASE_PATH}/query", json=request_data)
         return CalendarQueryResponse(**data)
@@ -624,6 +638,8 @@ class AsyncCalendarClient(AsyncBaseClient):
         offset: int = 0,
         sort_by: str = "start",
         sort_order: Literal["asc", "desc"] = "asc",
+        fields: list[str] | None = None,
+        cursor: str | None = None,
     ) -> CalendarQueryResponse:
         """Query calendar events with filters.
         
@@ -643,6 +659,10 @@ class AsyncCalendarClient(AsyncBaseClient):
             offset: Number of results to skip (for pagination).
             sort_by: Field to sort by (default: "start").
             sort_order: Sort direction ("asc" or "desc").
+            fields: Only return these CalendarEvent fields for each result. Results
+                are then plain dicts rather than CalendarEvent objects.
+            cursor: next_cursor from a previous response, to fetch the page
+                that follows it (cannot be combined with offset).
         
         Returns:
             Matching events with pagination info.
@@ -678,6 +698,10 @@ class AsyncCalendarClient(AsyncBaseClient):
             request_data["sort_by"] = sort_by
         if sort_order != "asc":
             request_data["sort_order"] = sort_order
+        if fields is not None:
+            request_data["fields"] = fields
+        if cursor is not None:
+            request_data["cursor"] = cursor
         
         data = await self._post(f"{self._BASE_PATH}/query", json=request_data)
         return CalendarQueryResponse(**data)
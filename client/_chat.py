@@ -88,14 +88,15 @@ class ChatQueryResponse(BaseModel):
     
     Attributes:
         modality_type: Always "chat".
-        messages: Query results (matching messages).
+        messages: Query results (matching messages). Partial dicts containing
+            only the requested fields when the query used a projection.
         total_count: Total number of results matching query.
         returned_count: Number of results returned (after pagination).
         query: Echo of query parameters for debugging.
     """
 
     modality_type: str = "chat"
-    messages: list[ChatMessage]
+    messages: list[ChatMessage] | list[dict[str, Any]] = Field(union_mode="left_to_right")
     total_count: int
     returned_count: int
     query: dict[str, Any]
@@ -160,6 +161,7 @@ class ChatClient(BaseClient):
         offset: int = 0,
         sort_by: Literal["timestamp", "role", "conversation_id"] = "timestamp",
         sort_order: Literal["asc", "desc"] = "asc",
+        fields: list[str] | None = None,
     ) -> ChatQueryResponse:
         """Query chat messages with filters.
         
@@ -176,6 +178,8 @@ class ChatClient(BaseClient):
             offset: Number of results to skip (for pagination).
             sort_by: Field to sort by ("timestamp", "role", "conversation_id").
             sort_order: Sort direction ("asc" or "desc").
+            fields: Only return these ChatMessage fields for each result. Results
+                are then plain dicts rather than ChatMessage objects.
         
         Returns:
             Filtered message results with counts.
@@ -205,6 +209,8 @@ class ChatClient(BaseClient):
             request_data["sort_by"] = sort_by
         if sort_order != "asc":
             request_data["sort_order"] = sort_order
+        if fields is not None:
+            request_data["fields"] = fields
         
         data = self._post(f"{self._BASE_PATH}/query", json=request_data)
         return ChatQueryResponse(**data)
@@ -351,6 +357,7 @@ class AsyncChatClient(AsyncBaseClient):
         offset: int = 0,
         sort_by: Literal["timestamp", "role", "conversation_id"] = "timestamp",
         sort_order: Literal["asc", "desc"] = "asc",
+        fields: list[str] | None = None,
     ) -> ChatQueryResponse:
         """Query chat messages with filters.
         
@@ -367,6 +374,8 @@ class AsyncChatClient(AsyncBaseClient):
             offset: Number of results to skip (for pagination).
             sort_by: Field to sort by ("timestamp", "role", "conversation_id").
             sort_order: Sort direction ("asc" or "desc").
+            fields: Only return these ChatMessage fields for each result. Results
+                are then plain dicts rather than ChatMessage objects.
         
         Returns:
             Filtered message results with counts.
@@ -396,6 +405,8 @@ class AsyncChatClient(AsyncBaseClient):
             request_data["sort_by"] = sort_by
         if sort_order != "asc":
             request_data["sort_order"] = sort_order
+        if fields is not None:
+            request_data["fields"] = fields
         
         data = await self._post(f"{self._BASE_PATH}/query", json=request_data)
         return ChatQueryResponse(**data)
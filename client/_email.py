@@ -6,12 +6,13 @@ the email modality endpoints (/email/*).
 This is an internal module. Import from `client` instead.
 """
 
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, Field
 
-from client._base import AsyncBaseClient, BaseClient
+from client._base import AsyncBaseClient, BaseClient, _build_request_data
 from client.models import ModalityActionResponse
 
 if TYPE_CHECKING:
@@ -204,16 +205,21 @@ class EmailQueryResponse(BaseModel):
     
     Attributes:
         modality_type: Always "email".
-        emails: Query results (matching emails).
-        total_count: Total number of results matching query.
+        emails: Query results (matching emails). Partial dicts containing
+            only the requested fields when the query used a projection.
+        total_count: Total number of results matching query. None for pages
+            fetched with a cursor.
         returned_count: Number of results returned (after pagination).
+        next_cursor: Cursor for the next page, or None if there are no more
+            results.
         query: Echo of query parameters for debugging.
     """
 
     modality_type: str = "email"
-    emails: list[Email]
-    total_count: int
+    emails: list[Email] | list[dict[str, Any]] = Field(union_mode="left_to_right")
+    total_count: int | None
     returned_count: int
+    next_cursor: str | None = None
     query: dict[str, Any]
 
 
@@ -295,6 +301,8 @@ class EmailClient(BaseClient):
         offset: int = 0,
         sort_by: str | None = None,
         sort_order: Literal["asc", "desc"] = "desc",
+        fields: list[str] | None = None,
+        cursor: str | None = None,
     ) -> EmailQueryResponse:
         """Query emails with filters.
         
@@ -321,6 +329,10 @@ class EmailClient(BaseClient):
             offset: Number of results to skip (for pagination).
             sort_by: Field to sort by (e.g., 'sent_at', 'received_at', 'subject').
             sort_order: Sort direction ("asc" or "desc").
+            fields: Only return these Email fields for each result. Results
+                are then plain dicts rather than Email objects.
+            cursor: next_cursor from a previous response, to fetch the page
+                that follows it (cannot be combined with offset).
         
         Returns:
             Filtered email results with counts.
@@ -370,10 +382,71 @@ class EmailClient(BaseClient):
             request_data["sort_by"] = sort_by
         if sort_order != "desc":
             request_data["sort_order"] = sort_order
+        if fields is not None:
+            request_data["fields"] = fields
+        if cursor is not None:
+            request_data["cursor"] = cursor
         
         data = self._post(f"{self._BASE_PATH}/query", json=request_data)
         return EmailQueryResponse(**data)
 
+    def stream_query(
+        self, **filters: Any
+    ) -> Iterator[Email | dict[str, Any]]:
+        """Query emails and stream the matches one at a time.
+        
+        Requests the NDJSON variant of /email/query, which the server encodes
+        incrementally, and yields each email as soon as its line arrives.
+        Memory use stays flat no matter how many emails match.
+        
+        Args:
+            **filters: The same filter, sort, and pagination arguments
+                accepted by query().
+        
+        Yields:
+            Each matching email, in result order. If a fields projection
+            was given, each email is a dict of just those fields.
+        
+        Raises:
+            ValidationError: If query parameters are invalid.
+            APIError: If the request fails.
+        """
+        request_data = _build_request_data(filters)
+        projected = request_data.get("fields") is not None
+        for item in self._stream("POST", f"{self._BASE_PATH}/query", json=request_data):
+            yield item if projected else Email(**item)
+
+    def iter_query(
+        self, page_size: int = 100, **filters: Any
+    ) -> Iterator[Email | dict[str, Any]]:
+        """Iterate over every matching email, fetching pages lazily.
+        
+        Pages are requested one at a time as iteration proceeds. The first
+        page is a regular query; each following page resumes from the
+        previous page's next_cursor, so the server reads it from a sorted
+        index instead of re-filtering and re-sorting the whole mailbox.
+        
+        Args:
+            page_size: Number of emails requested per page.
+            **filters: The same filter, sort, and projection arguments
+                accepted by query(), except limit, offset, and cursor.
+        
+        Yields:
+            Each matching email, in result order (dicts if a fields
+            projection was given).
+        
+        Raises:
+            ValidationError: If query parameters are invalid.
+            APIError: If a request fails.
+        """
+        cursor = None
+        while True:
+            page = self.query(limit=page_size, cursor=cursor, **filters)
+            yield from page.emails
+            cursor = page.next_cursor
+            if cursor is None:
+                return
+
     def send(
         self,
         from_address: str,
@@ -793,6 +866,8 @@ class AsyncEmailClient(AsyncBaseClient):
         offset: int = 0,
         sort_by: str | None = None,
         sort_order: Literal["asc", "desc"] = "desc",
+        fields: list[str] | None = None,
+        cursor: str | None = None,
     ) -> EmailQueryResponse:
         """Query emails with filters.
         
@@ -819,6 +894,10 @@ class AsyncEmailClient(AsyncBaseClient):
             offset: Number of results to skip (for pagination).
             sort_by: Field to sort by (e.g., 'sent_at', 'received_at', 'subject').
             sort_order: Sort direction ("asc" or "desc").
+            fields: Only return these Email fields for each result. Results
+                are then plain dicts rather than Email objects.
+            cursor: next_cursor from a previous response, to fetch the page
+                that follows it (cannot be combined with offset).
         
         Returns:
             Filtered email results with counts.
@@ -868,10 +947,74 @@ class AsyncEmailClient(AsyncBaseClient):
             request_data["sort_by"] = sort_by
         if sort_order != "desc":
             request_data["sort_order"] = sort_order
+        if fields is not None:
+            request_data["fields"] = fields
+        if cursor is not None:
+            request_data["cursor"] = cursor
         
         data = await self._post(f"{self._BASE_PATH}/query", json=request_data)
         return EmailQueryResponse(**data)
 
+    async def stream_query(
+        self, **filters: Any
+    ) -> AsyncIterator[Email | dict[str, Any]]:
+        """Query emails and stream the matches one at a time.
+        
+        Requests the NDJSON variant of /email/query, which the server encodes
+        incrementally, and yields each email as soon as its line arrives.
+        Memory use stays flat no matter how many emails match.
+        
+        Args:
+            **filters: The same filter, sort, and pagination arguments
+                accepted by query().
+        
+        Yields:
+            Each matching email, in result order. If a fields projection
+            was given, each email is a dict of just those fields.
+        
+        Raises:
+            ValidationError: If query parameters are invalid.
+            APIError: If the request fails.
+        """
+        request_data = _build_request_data(filters)
+        projected = request_data.get("fields") is not None
+        async for item in self._stream(
+            "POST", f"{self._BASE_PATH}/query", json=request_data
+        ):
+            yield item if projected else Email(**item)
+
+    async def iter_query(
+        self, page_size: int = 100, **filters: Any
+    ) -> AsyncIterator[Email | dict[str, Any]]:
+        """Iterate over every matching email, fetching pages lazily.
+        
+        Pages are requested one at a time as iteration proceeds. The first
+        page is a regular query; each following page resumes from the
+        previous page's next_cursor, so the server reads it from a sorted
+        index instead of re-filtering and re-sorting the whole mailbox.
+        
+        Args:
+            page_size: Number of emails requested per page.
+            **filters: The same filter, sort, and projection arguments
+                accepted by query(), except limit, offset, and cursor.
+        
+        Yields:
+            Each matching email, in result order (dicts if a fields
+            projection was given).
+        
+        Raises:
+            ValidationError: If query parameters are invalid.
+            APIError: If a request fails.
+        """
+        cursor = None
+        while True:
+            page = await self.query(limit=page_size, cursor=cursor, **filters)
+            for email in page.emails:
+                yield email
+            cursor = page.next_cursor
+            if cursor is None:
+                return
+
     async def send(
         self,
         from_address: str,
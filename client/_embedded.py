@@ -0,0 +1,358 @@
+"""In-process transports for agents running alongside the simulator.
+
+EmbeddedTransport and AsyncEmbeddedTransport stand in for HTTPClient and
+AsyncHTTPClient when the client shares a process with a SimulationEngine.
+Requests are handed to api.embedded.EmbeddedAPI as Python data and answered
+by the route endpoints directly, so there is no HTTP framing and no JSON
+encoding or decoding of request and response bodies; the sub-clients only
+convert the returned data into their models. Error responses are mapped to
+the same exceptions as over HTTP.
+
+Use them through UESClient.embedded(engine) and
+AsyncUESClient.embedded(engine). They need the server package (api/) to be
+importable.
+
+This is an internal module and should not be imported directly by users.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from typing import TYPE_CHECKING, Any
+
+from client._http import HttpMethod, _parse_error_body, _raise_for_error
+
+if TYPE_CHECKING:
+    from api.embedded import ErrorResponse
+    from models.simulation import SimulationEngine
+
+# Base URL reported by embedded clients
+EMBEDDED_BASE_URL = "embedded://"
+
+
+def _raise_for_error_response(error: "ErrorResponse") -> None:
+    """Raise the client exception for an embedded error response.
+
+    Args:
+        error: The error response produced by the endpoint.
+
+    Raises:
+        APIError: The same exception the HTTP client raises for the response.
+    """
+    message, error_type, details = _parse_error_body(error.body)
+    _raise_for_error(error.status_code, message, error_type, details, error.body)
+
+
+def _drop_none(params: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Filter out None query parameters, as the HTTP clients do."""
+    if params:
+        return {k: v for k, v in params.items() if v is not None}
+    return params
+
+
+class EmbeddedTransport:
+    """Synchronous in-process replacement for HTTPClient.
+
+    Runs endpoints on a private event loop, so it must not be used from a
+    thread that is already running an event loop; use AsyncEmbeddedTransport
+    there.
+
+    Attributes:
+        base_url: Always EMBEDDED_BASE_URL.
+        engine: The engine requests are served against.
+    """
+
+    def __init__(self, engine: "SimulationEngine") -> None:
+        """Initialize the transport.
+
+        Args:
+            engine: The engine to serve requests against.
+        """
+        from api.embedded import EmbeddedAPI, ErrorResponse
+
+        self.base_url = EMBEDDED_BASE_URL
+        self.engine = engine
+        self._api = EmbeddedAPI(engine)
+        self._error_response = ErrorResponse
+        self._loop = asyncio.new_event_loop()
+
+    def close(self) -> None:
+        """Close the transport's event loop."""
+        self._loop.close()
+
+    def __enter__(self) -> "EmbeddedTransport":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit context manager and close the transport."""
+        self.close()
+
+    def request(
+        self,
+        method: HttpMethod,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> Any:
+        """Handle a request and return the response body.
+
+        Args:
+            method: The HTTP method (GET, POST, etc.).
+            path: The URL path.
+            params: Query parameters.
+            json: Request body.
+
+        Returns:
+            The response body as Python data, or None for empty responses.
+
+        Raises:
+            APIError: If the endpoint returns an error response.
+        """
+        try:
+            return self._loop.run_until_complete(
+                self._api.request(method, path, _drop_none(params), json)
+            )
+        except self._error_response as e:
+            _raise_for_error_response(e)
+
+    def iter_ndjson(
+        self,
+        method: HttpMethod,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> Iterator[Any]:
+        """Handle a request for NDJSON and iterate over the documents.
+
+        Args:
+            method: The HTTP method (GET, POST, etc.).
+            path: The URL path.
+            params: Query parameters.
+            json: Request body.
+
+        Yields:
+            Each document of the response.
+
+        Raises:
+            APIError: If the endpoint returns an error response.
+        """
+        documents = self._api.stream(method, path, _drop_none(params), json)
+        try:
+            while True:
+                try:
+                    document = self._loop.run_until_complete(anext(documents))
+                except StopAsyncIteration:
+                    return
+                yield document
+        except self._error_response as e:
+            _raise_for_error_response(e)
+        finally:
+            self._loop.run_until_complete(documents.aclose())
+
+    def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Make a GET request.
+
+        Args:
+            path: The URL path.
+            params: Query parameters.
+
+        Returns:
+            The response body.
+        """
+        return self.request("GET", path, params=params)
+
+    def post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Make a POST request.
+
+        Args:
+            path: The URL path.
+            json: Request body.
+            params: Query parameters.
+
+        Returns:
+            The response body.
+        """
+        return self.request("POST", path, params=params, json=json)
+
+    def put(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Make a PUT request.
+
+        Args:
+            path: The URL path.
+            json: Request body.
+            params: Query parameters.
+
+        Returns:
+            The response body.
+        """
+        return self.request("PUT", path, params=params, json=json)
+
+    def delete(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Make a DELETE request.
+
+        Args:
+            path: The URL path.
+            params: Query parameters.
+
+        Returns:
+            The response body.
+        """
+        return self.request("DELETE", path, params=params)
+
+
+class AsyncEmbeddedTransport:
+    """Asynchronous in-process replacement for AsyncHTTPClient.
+
+    Endpoints run on the caller's event loop.
+
+    Attributes:
+        base_url: Always EMBEDDED_BASE_URL.
+        engine: The engine requests are served against.
+    """
+
+    def __init__(self, engine: "SimulationEngine") -> None:
+        """Initialize the transport.
+
+        Args:
+            engine: The engine to serve requests against.
+        """
+        from api.embedded import EmbeddedAPI, ErrorResponse
+
+        self.base_url = EMBEDDED_BASE_URL
+        self.engine = engine
+        self._api = EmbeddedAPI(engine)
+        self._error_response = ErrorResponse
+
+    async def close(self) -> None:
+        """Close the transport (nothing to release)."""
+
+    async def __aenter__(self) -> "AsyncEmbeddedTransport":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Exit async context manager and close the transport."""
+        await self.close()
+
+    async def request(
+        self,
+        method: HttpMethod,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> Any:
+        """Handle a request and return the response body.
+
+        Args:
+            method: The HTTP method (GET, POST, etc.).
+            path: The URL path.
+            params: Query parameters.
+            json: Request body.
+
+        Returns:
+            The response body as Python data, or None for empty responses.
+
+        Raises:
+            APIError: If the endpoint returns an error response.
+        """
+        try:
+            return await self._api.request(method, path, _drop_none(params), json)
+        except self._error_response as e:
+            _raise_for_error_response(e)
+
+    async def iter_ndjson(
+        self,
+        method: HttpMethod,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Handle a request for NDJSON and iterate over the documents.
+
+        Args:
+            method: The HTTP method (GET, POST, etc.).
+            path: The URL path.
+            params: Query parameters.
+            json: Request body.
+
+        Yields:
+            Each document of the response.
+
+        Raises:
+            APIError: If the endpoint returns an error response.
+        """
+        try:
+            async for document in self._api.stream(method, path, _drop_none(params), json):
+                yield document
+        except self._error_response as e:
+            _raise_for_error_response(e)
+
+    async def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Make an async GET request.
+
+        Args:
+            path: The URL path.
+            params: Query parameters.
+
+        Returns:
+            The response body.
+        """
+        return await self.request("GET", path, params=params)
+
+    async def post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Make an async POST request.
+
+        Args:
+            path: The URL path.
+            json: Request body.
+            params: Query parameters.
+
+        Returns:
+            The response body.
+        """
+        return await self.request("POST", path, params=params, json=json)
+
+    async def put(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Make an async PUT request.
+
+        Args:
+            path: The URL path.
+            json: Request body.
+            params: Query parameters.
+
+        Returns:
+            The response body.
+        """
+        return await self.request("PUT", path, params=params, json=json)
+
+    async def delete(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Make an async DELETE request.
+
+        Args:
+            path: The URL path.
+            params: Query parameters.
+
+        Returns:
+            The response body.
+        """
+        return await self.request("DELETE", path, params=params)
@@ -6,6 +6,7 @@ with the event management endpoints (/events/*).
 This is an internal module. Import from `client` instead.
 """
 
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -50,20 +51,25 @@ class EventListResponse(BaseModel):
     """Response model for event listing.
     
     Attributes:
-        events: List of event summaries.
+        events: List of event summaries. Partial dicts containing only the
+            requested fields when the listing used a projection.
         total: Total number of events matching filters (before pagination).
+            None for pages fetched with a cursor.
         pending: Count of pending events in queue.
         executed: Count of executed events in queue.
         failed: Count of failed events in queue.
         skipped: Count of skipped events in queue.
+        next_cursor: Cursor for the next page, or None if there are no more
+            events.
     """
 
-    events: list[EventResponse]
-    total: int
+    events: list[EventResponse] | list[dict[str, Any]] = Field(union_mode="left_to_right")
+    total: int | None
     pending: int
     executed: int
     failed: int
     skipped: int
+    next_cursor: str | None = None
 
 
 class EventSummaryResponse(BaseModel):
@@ -142,6 +148,8 @@ class EventsClient(BaseClient):
         end_time: datetime | None = None,
         limit: int | None = None,
         offset: int = 0,
+        fields: list[str] | None = None,
+        cursor: str | None = None,
     ) -> EventListResponse:
         """List events with optional filters.
         
@@ -155,6 +163,10 @@ class EventsClient(BaseClient):
             end_time: Filter by scheduled_time <= end_time.
             limit: Maximum number of events to return.
             offset: Number of events to skip (for pagination).
+            fields: Only return these EventResponse fields for each event.
+                Events are then plain dicts rather than EventResponse objects.
+            cursor: next_cursor from a previous response, to fetch the page
+                that follows it (cannot be combined with offset).
         
         Returns:
             List of events matching the filters with status counts.
@@ -170,10 +182,104 @@ class EventsClient(BaseClient):
             end_time=end_time.isoformat() if end_time else None,
             limit=limit,
             offset=offset if offset != 0 else None,
+            fields=",".join(fields) if fields is not None else None,
+            cursor=cursor,
         )
         data = self._get(self._BASE_PATH, params=params)
         return EventListResponse(**data)
 
+    def iter(
+        self,
+        page_size: int = 100,
+        status: str | None = None,
+        modality: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        fields: list[str] | None = None,
+    ) -> Iterator[EventResponse | dict[str, Any]]:
+        """Iterate over every matching event, fetching pages lazily.
+        
+        Pages are requested one at a time as iteration proceeds, each
+        resuming from the previous page's next_cursor so the server walks
+        the event queue from that position instead of re-filtering it.
+        
+        Args:
+            page_size: Number of events requested per page.
+            status: Filter by event status ("pending", "executed", "failed", 
+                "skipped", "cancelled").
+            modality: Filter by modality type (e.g., "email", "sms").
+            start_time: Filter by scheduled_time >= start_time.
+            end_time: Filter by scheduled_time <= end_time.
+            fields: Only return these EventResponse fields for each event.
+        
+        Yields:
+            Each matching event, in queue order (dicts if a fields projection
+            was given).
+        
+        Raises:
+            ValidationError: If status value is invalid.
+            APIError: If a request fails.
+        """
+        cursor = None
+        while True:
+            page = self.list_events(
+                status=status,
+                modality=modality,
+                start_time=start_time,
+                end_time=end_time,
+                limit=page_size,
+                fields=fields,
+                cursor=cursor,
+            )
+            yield from page.events
+            cursor = page.next_cursor
+            if cursor is None:
+                return
+
+    def stream_events(
+        self,
+        status: str | None = None,
+        modality: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        fields: list[str] | None = None,
+    ) -> Iterator[EventResponse | dict[str, Any]]:
+        """List events and stream them one at a time.
+        
+        Requests the NDJSON variant of GET /events and yields each event as
+        soon as its line arrives, without building the full listing.
+        
+        Args:
+            status: Filter by event status ("pending", "executed", "failed", 
+                "skipped", "cancelled").
+            modality: Filter by modality type (e.g., "email", "sms").
+            start_time: Filter by scheduled_time >= start_time.
+            end_time: Filter by scheduled_time <= end_time.
+            limit: Maximum number of events to return.
+            offset: Number of events to skip (for pagination).
+            fields: Only return these EventResponse fields for each event.
+        
+        Yields:
+            Each matching event, in queue order. If a fields projection was
+            given, each event is a dict of just those fields.
+        
+        Raises:
+            APIError: If the request fails.
+        """
+        params = _filter_none_params(
+            status=status,
+            modality=modality,
+            start_time=start_time.isoformat() if start_time else None,
+            end_time=end_time.isoformat() if end_time else None,
+            limit=limit,
+            offset=offset if offset != 0 else None,
+            fields=",".join(fields) if fields is not None else None,
+        )
+        for item in self._stream("GET", self._BASE_PATH, params=params):
+            yield item if fields is not None else EventResponse(**item)
+
     def create(
         self,
         scheduled_time: datetime,
@@ -355,6 +461,8 @@ class AsyncEventsClient(AsyncBaseClient):
         end_time: datetime | None = None,
         limit: int | None = None,
         offset: int = 0,
+        fields: list[str] | None = None,
+        cursor: str | None = None,
     ) -> EventListResponse:
         """List events with optional filters.
         
@@ -368,6 +476,10 @@ class AsyncEventsClient(AsyncBaseClient):
             end_time: Filter by scheduled_time <= end_time.
             limit: Maximum number of events to return.
             offset: Number of events to skip (for pagination).
+            fields: Only return these EventResponse fields for each event.
+                Events are then plain dicts rather than EventResponse objects.
+            cursor: next_cursor from a previous response, to fetch the page
+                that follows it (cannot be combined with offset).
         
         Returns:
             List of events matching the filters with status counts.
@@ -383,10 +495,105 @@ class AsyncEventsClient(AsyncBaseClient):
             end_time=end_time.isoformat() if end_time else None,
             limit=limit,
             offset=offset if offset != 0 else None,
+            fields=",".join(fields) if fields is not None else None,
+            cursor=cursor,
         )
         data = await self._get(self._BASE_PATH, params=params)
         return EventListResponse(**data)
 
+    async def iter(
+        self,
+        page_size: int = 100,
+        status: str | None = None,
+        modality: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        fields: list[str] | None = None,
+    ) -> AsyncIterator[EventResponse | dict[str, Any]]:
+        """Iterate over every matching event, fetching pages lazily.
+        
+        Pages are requested one at a time as iteration proceeds, each
+        resuming from the previous page's next_cursor so the server walks
+        the event queue from that position instead of re-filtering it.
+        
+        Args:
+            page_size: Number of events requested per page.
+            status: Filter by event status ("pending", "executed", "failed", 
+                "skipped", "cancelled").
+            modality: Filter by modality type (e.g., "email", "sms").
+            start_time: Filter by scheduled_time >= start_time.
+            end_time: Filter by scheduled_time <= end_time.
+            fields: Only return these EventResponse fields for each event.
+        
+        Yields:
+            Each matching event, in queue order (dicts if a fields projection
+            was given).
+        
+        Raises:
+            ValidationError: If status value is invalid.
+            APIError: If a request fails.
+        """
+        cursor = None
+        while True:
+            page = await self.list_events(
+                status=status,
+                modality=modality,
+                start_time=start_time,
+                end_time=end_time,
+                limit=page_size,
+                fields=fields,
+                cursor=cursor,
+            )
+            for event in page.events:
+                yield event
+            cursor = page.next_cursor
+            if cursor is None:
+                return
+
+    async def stream_events(
+        self,
+        status: str | None = None,
+        modality: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        fields: list[str] | None = None,
+    ) -> AsyncIterator[EventResponse | dict[str, Any]]:
+        """List events and stream them one at a time.
+        
+        Requests the NDJSON variant of GET /events and yields each event as
+        soon as its line arrives, without building the full listing.
+        
+        Args:
+            status: Filter by event status ("pending", "executed", "failed", 
+                "skipped", "cancelled").
+            modality: Filter by modality type (e.g., "email", "sms").
+            start_time: Filter by scheduled_time >= start_time.
+            end_time: Filter by scheduled_time <= end_time.
+            limit: Maximum number of events to return.
+            offset: Number of events to skip (for pagination).
+            fields: Only return these EventResponse fields for each event.
+        
+        Yields:
+            Each matching event, in queue order. If a fields projection was
+            given, each event is a dict of just those fields.
+        
+        Raises:
+            APIError: If the request fails.
+        """
+        params = _filter_none_params(
+            status=status,
+            modality=modality,
+            start_time=start_time.isoformat() if start_time else None,
+            end_time=end_time.isoformat() if end_time else None,
+            limit=limit,
+            offset=offset if offset != 0 else None,
+            fields=",".join(fields) if fields is not None else None,
+        )
+        async for item in self._stream("GET", self._BASE_PATH, params=params):
+            yield item if fields is not None else EventResponse(**item)
+
     async def create(
         self,
         scheduled_time: datetime,
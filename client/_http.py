@@ -4,16 +4,21 @@ This module provides the low-level HTTP communication layer used by all
 sub-clients. It handles:
 - Making HTTP requests (sync and async)
 - Response parsing and error handling
-- Retry logic with exponential backoff
-- Connection management
+- Retry logic with jittered exponential backoff
+- Connection management (pool limits, keep-alive, optional HTTP/2)
 
 This is an internal module and should not be imported directly by users.
 """
 
+import random
 import time
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
 from typing import Any, Literal
 
 import httpx
+import msgpack
+from pydantic_core import from_json, to_jsonable_python
 
 from client.exceptions import (
     APIError,
@@ -29,13 +34,120 @@ from client.exceptions import (
 # HTTP methods supported by the client
 HttpMethod = Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
 
+# Encodings the client can use for request and response bodies
+WireFormat = Literal["json", "msgpack"]
+
 # Status codes that trigger automatic retry (when retry is enabled)
 RETRYABLE_STATUS_CODES = {502, 503, 504}
 
+# Media type requested for streamed (newline-delimited JSON) responses
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Media type for MessagePack request and response bodies
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
 # Default backoff settings for retry logic
 DEFAULT_RETRY_BACKOFF_BASE = 0.5  # seconds
 DEFAULT_RETRY_BACKOFF_MAX = 30.0  # seconds
 
+# Default connection pool settings. httpx keeps at most 20 idle connections
+# by default, so a client shared by more concurrent agents than that closes
+# and reopens connections all the time; keep alive as many as may be open.
+# Idle connections expire before uvicorn's 5-second keep-alive timeout, so
+# the client never reuses a connection the server is closing.
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 100
+DEFAULT_KEEPALIVE_EXPIRY = 4.0  # seconds
+
+
+def _msgpack_default(value: Any) -> Any:
+    """Convert values MessagePack cannot pack natively.
+    
+    Args:
+        value: The value to convert.
+    
+    Returns:
+        An ISO string for naive datetimes (the timestamp type requires a
+        timezone), otherwise the value's JSON-compatible form.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return to_jsonable_python(value)
+
+
+def _encode_body(json: dict[str, Any] | None, wire_format: WireFormat) -> dict[str, Any]:
+    """Build the httpx arguments that carry a request body.
+    
+    Args:
+        json: The request body, if any.
+        wire_format: The encoding to use.
+    
+    Returns:
+        Keyword arguments for httpx's request methods.
+    """
+    if json is None or wire_format == "json":
+        return {"json": json}
+    return {
+        "content": msgpack.packb(json, datetime=True, default=_msgpack_default),
+        "headers": {"Content-Type": MSGPACK_MEDIA_TYPE},
+    }
+
+
+def _decode_body(response: httpx.Response) -> Any:
+    """Decode a response body according to its Content-Type.
+    
+    MessagePack bodies are unpacked with timestamps restored as timezone-aware
+    datetimes, which the client models accept without parsing strings.
+    Everything else is parsed as JSON.
+    
+    Args:
+        response: The HTTP response to decode.
+    
+    Returns:
+        The decoded body.
+    """
+    content_type = response.headers.get("content-type", "")
+    if content_type.split(";")[0].strip().lower() == MSGPACK_MEDIA_TYPE:
+        return msgpack.unpackb(response.content, timestamp=3)
+    return response.json()
+
+
+def _parse_error_body(body: Any) -> tuple[str, str | None, dict | None]:
+    """Extract message, type, and details from a decoded error body.
+    
+    Args:
+        body: The decoded response body.
+    
+    Returns:
+        A tuple of (message, error_type, details).
+    """
+    # Handle FastAPI's standard error format
+    if isinstance(body, dict):
+        # Check for "detail" key (FastAPI's default)
+        detail = body.get("detail")
+        if isinstance(detail, str):
+            return detail, body.get("type"), body.get("details")
+        elif isinstance(detail, list):
+            # Validation errors come as a list
+            messages = [
+                f"{err.get('loc', ['unknown'])[-1]}: {err.get('msg', 'invalid')}"
+                for err in detail
+            ]
+            return "; ".join(messages), "validation_error", {"errors": detail}
+        elif isinstance(detail, dict):
+            return detail.get("message", str(detail)), detail.get("type"), detail
+        
+        # Check for "message" key
+        if "message" in body:
+            return body["message"], body.get("type"), body.get("details")
+        
+        # Check for "error" key
+        if "error" in body:
+            return body["error"], body.get("type"), body.get("details")
+    
+    # Fallback to string representation
+    return str(body), None, None
+
 
 def _parse_error_response(response: httpx.Response) -> tuple[str, str | None, dict | None]:
     """Parse an error response to extract message, type, and details.
@@ -50,35 +162,7 @@ def _parse_error_response(response: httpx.Response) -> tuple[str, str | None, di
         A tuple of (message, error_type, details).
     """
     try:
-        body = response.json()
-        
-        # Handle FastAPI's standard error format
-        if isinstance(body, dict):
-            # Check for "detail" key (FastAPI's default)
-            detail = body.get("detail")
-            if isinstance(detail, str):
-                return detail, body.get("type"), body.get("details")
-            elif isinstance(detail, list):
-                # Validation errors come as a list
-                messages = [
-                    f"{err.get('loc', ['unknown'])[-1]}: {err.get('msg', 'invalid')}"
-                    for err in detail
-                ]
-                return "; ".join(messages), "validation_error", {"errors": detail}
-            elif isinstance(detail, dict):
-                return detail.get("message", str(detail)), detail.get("type"), detail
-            
-            # Check for "message" key
-            if "message" in body:
-                return body["message"], body.get("type"), body.get("details")
-            
-            # Check for "error" key
-            if "error" in body:
-                return body["error"], body.get("type"), body.get("details")
-        
-        # Fallback to string representation
-        return str(body), None, None
-        
+        return _parse_error_body(_decode_body(response))
     except Exception:
         # If JSON parsing fails, use the response text
         text = response.text.strip()
@@ -107,14 +191,39 @@ def _raise_for_status(response: httpx.Response) -> None:
         return
     
     message, error_type, details = _parse_error_response(response)
-    status_code = response.status_code
     
     # Try to get raw body for debugging
     try:
-        response_body = response.json()
+        response_body = _decode_body(response)
     except Exception:
         response_body = response.text
     
+    _raise_for_error(response.status_code, message, error_type, details, response_body)
+
+
+def _raise_for_error(
+    status_code: int,
+    message: str,
+    error_type: str | None,
+    details: dict | None,
+    response_body: Any,
+) -> None:
+    """Raise the exception that corresponds to an error status code.
+    
+    Args:
+        status_code: The HTTP status code of the error response.
+        message: The error message.
+        error_type: The error type reported by the server, if any.
+        details: Structured error details, if any.
+        response_body: The raw response body, for debugging.
+    
+    Raises:
+        ValidationError: For HTTP 422 responses.
+        NotFoundError: For HTTP 404 responses.
+        ConflictError: For HTTP 409 responses.
+        ServerError: For HTTP 5xx responses.
+        APIError: For other HTTP 4xx responses.
+    """
     # Map status codes to exception types
     if status_code == 422:
         raise ValidationError(
@@ -151,21 +260,54 @@ def _raise_for_status(response: httpx.Response) -> None:
         )
 
 
-def _calculate_backoff(attempt: int, base: float = DEFAULT_RETRY_BACKOFF_BASE) -> float:
+def _calculate_backoff(
+    attempt: int,
+    base: float = DEFAULT_RETRY_BACKOFF_BASE,
+    jitter: bool = True,
+) -> float:
     """Calculate exponential backoff delay for retry attempts.
     
-    Uses exponential backoff with jitter: base * 2^attempt
-    Capped at DEFAULT_RETRY_BACKOFF_MAX seconds.
+    The delay is base * 2^attempt, capped at DEFAULT_RETRY_BACKOFF_MAX
+    seconds. With jitter, a random delay between half of that and all of it
+    is returned instead, so that clients that failed together (say, 100
+    agents hitting a restarting server) do not all retry at the same moment.
     
     Args:
         attempt: The retry attempt number (0-indexed).
         base: Base delay in seconds.
+        jitter: Whether to randomize the delay.
     
     Returns:
         The delay in seconds before the next retry.
     """
-    delay = base * (2 ** attempt)
-    return min(delay, DEFAULT_RETRY_BACKOFF_MAX)
+    delay = min(base * (2 ** attempt), DEFAULT_RETRY_BACKOFF_MAX)
+    if jitter:
+        return random.uniform(delay / 2, delay)
+    return delay
+
+
+def _pool_limits(
+    max_connections: int | None,
+    max_keepalive_connections: int | None,
+    keepalive_expiry: float | None,
+) -> httpx.Limits:
+    """Build the connection pool limits for an httpx client.
+    
+    Args:
+        max_connections: Most connections open at once (None for no limit).
+        max_keepalive_connections: Most idle connections kept open for reuse
+            (None for no limit).
+        keepalive_expiry: Seconds an idle connection is kept open (None to
+            keep it until the server closes it).
+    
+    Returns:
+        The limits.
+    """
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
 
 
 class HTTPClient:
@@ -179,6 +321,7 @@ class HTTPClient:
         timeout: Request timeout in seconds.
         retry_enabled: Whether to retry on transient failures.
         max_retries: Maximum number of retry attempts.
+        wire_format: Encoding used for request and response bodies.
     """
     
     def __init__(
@@ -188,6 +331,11 @@ class HTTPClient:
         retry_enabled: bool = False,
         max_retries: int = 3,
         transport: httpx.BaseTransport | None = None,
+        wire_format: WireFormat = "json",
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
     ) -> None:
         """Initialize the HTTP client.
         
@@ -197,16 +345,38 @@ class HTTPClient:
             retry_enabled: Whether to retry on transient failures.
             max_retries: Maximum number of retry attempts.
             transport: Custom transport (e.g., ASGITransport for testing).
+            wire_format: Encoding used for request and response bodies.
+                "msgpack" sends MessagePack bodies and asks the server for
+                MessagePack responses, which are cheaper to encode and decode
+                than JSON and carry datetimes as native timestamps.
+            max_connections: Most connections open at once (None for no
+                limit). Requests beyond it wait for a free connection.
+            max_keepalive_connections: Most idle connections kept open for
+                reuse (None for no limit).
+            keepalive_expiry: Seconds an idle connection is kept open (None
+                to keep it until the server closes it).
+            http2: Whether to use HTTP/2 with servers that support it, which
+                multiplexes concurrent requests over one connection. Needs
+                the h2 package (pip install httpx[http2]).
+        
+        The pool settings and http2 apply to httpx's own transport, not to a
+        custom transport.
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.retry_enabled = retry_enabled
         self.max_retries = max_retries
+        self.wire_format = wire_format
         
         self._client = httpx.Client(
             base_url=self.base_url,
             timeout=timeout,
             transport=transport,
+            limits=_pool_limits(
+                max_connections, max_keepalive_connections, keepalive_expiry
+            ),
+            http2=http2,
+            headers={"Accept": MSGPACK_MEDIA_TYPE} if wire_format == "msgpack" else None,
         )
     
     def close(self) -> None:
@@ -228,7 +398,7 @@ class HTTPClient:
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
     ) -> Any:
-        """Make an HTTP request and return the parsed JSON response.
+        """Make an HTTP request and return the decoded response body.
         
         Handles error responses by raising appropriate exceptions.
         Supports automatic retry on transient failures if enabled.
@@ -240,7 +410,8 @@ class HTTPClient:
             json: JSON body to send with the request.
         
         Returns:
-            The parsed JSON response body, or None for empty responses.
+            The decoded response body (JSON or MessagePack), or None for empty
+            responses.
         
         Raises:
             ConnectionError: If the connection fails.
@@ -262,7 +433,7 @@ class HTTPClient:
                     method=method,
                     url=path,
                     params=params,
-                    json=json,
+                    **_encode_body(json, self.wire_format),
                 )
                 
                 # Check if we should retry on this status code
@@ -279,7 +450,7 @@ class HTTPClient:
                 
                 # Return parsed JSON or None for empty responses
                 if response.content:
-                    return response.json()
+                    return _decode_body(response)
                 return None
                 
             except httpx.ConnectError as e:
@@ -309,6 +480,70 @@ class HTTPClient:
             raise last_exception
         raise RuntimeError("Unexpected error in request retry loop")
     
+    def iter_ndjson(
+        self,
+        method: HttpMethod,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> Iterator[Any]:
+        """Make a request and iterate over an NDJSON response as it arrives.
+        
+        Asks the server for application/x-ndjson and parses one JSON document
+        per line while the body is still streaming, so memory use does not
+        grow with the size of the result set. Streamed requests are not
+        retried.
+        
+        Args:
+            method: The HTTP method (GET, POST, etc.).
+            path: The URL path (will be appended to base_url).
+            params: Query parameters to include in the URL.
+            json: JSON body to send with the request.
+        
+        Yields:
+            Each parsed JSON document from the response body.
+        
+        Raises:
+            ConnectionError: If the connection fails.
+            TimeoutError: If the request times out.
+            APIError: If the server returns an error response.
+        """
+        url = f"{self.base_url}{path}"
+        
+        # Filter out None values from params
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+        
+        body = _encode_body(json, self.wire_format)
+        body_headers = body.pop("headers", {})
+        
+        try:
+            with self._client.stream(
+                method=method,
+                url=path,
+                params=params,
+                **body,
+                headers={"Accept": NDJSON_MEDIA_TYPE, **body_headers},
+            ) as response:
+                if not response.is_success:
+                    response.read()
+                    _raise_for_status(response)
+                for line in response.iter_lines():
+                    if line:
+                        yield from_json(line)
+        except httpx.ConnectError as e:
+            raise ConnectionError(
+                message=f"Failed to connect to {url}",
+                url=url,
+                cause=e,
+            ) from e
+        except httpx.TimeoutException as e:
+            raise TimeoutError(
+                message=f"Request to {url} timed out",
+                timeout=self.timeout,
+                url=url,
+            ) from e
+    
     def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
         """Make a GET request.
         
@@ -381,6 +616,7 @@ class AsyncHTTPClient:
         timeout: Request timeout in seconds.
         retry_enabled: Whether to retry on transient failures.
         max_retries: Maximum number of retry attempts.
+        wire_format: Encoding used for request and response bodies.
     """
     
     def __init__(
@@ -390,6 +626,11 @@ class AsyncHTTPClient:
         retry_enabled: bool = False,
         max_retries: int = 3,
         transport: httpx.AsyncBaseTransport | None = None,
+        wire_format: WireFormat = "json",
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
     ) -> None:
         """Initialize the async HTTP client.
         
@@ -399,16 +640,38 @@ class AsyncHTTPClient:
             retry_enabled: Whether to retry on transient failures.
             max_retries: Maximum number of retry attempts.
             transport: Custom transport (e.g., ASGITransport for testing).
+            wire_format: Encoding used for request and response bodies.
+                "msgpack" sends MessagePack bodies and asks the server for
+                MessagePack responses, which are cheaper to encode and decode
+                than JSON and carry datetimes as native timestamps.
+            max_connections: Most connections open at once (None for no
+                limit). Requests beyond it wait for a free connection.
+            max_keepalive_connections: Most idle connections kept open for
+                reuse (None for no limit).
+            keepalive_expiry: Seconds an idle connection is kept open (None
+                to keep it until the server closes it).
+            http2: Whether to use HTTP/2 with servers that support it, which
+                multiplexes concurrent requests over one connection. Needs
+                the h2 package (pip install httpx[http2]).
+        
+        The pool settings and http2 apply to httpx's own transport, not to a
+        custom transport.
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.retry_enabled = retry_enabled
         self.max_retries = max_retries
+        self.wire_format = wire_format
         
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=timeout,
             transport=transport,
+            limits=_pool_limits(
+                max_connections, max_keepalive_connections, keepalive_expiry
+            ),
+            http2=http2,
+            headers={"Accept": MSGPACK_MEDIA_TYPE} if wire_format == "msgpack" else None,
         )
     
     async def close(self) -> None:
@@ -442,7 +705,8 @@ class AsyncHTTPClient:
             json: JSON body to send with the request.
         
         Returns:
-            The parsed JSON response body, or None for empty responses.
+            The decoded response body (JSON or MessagePack), or None for empty
+            responses.
         
         Raises:
             ConnectionError: If the connection fails.
@@ -466,7 +730,7 @@ class AsyncHTTPClient:
                     method=method,
                     url=path,
                     params=params,
-                    json=json,
+                    **_encode_body(json, self.wire_format),
                 )
                 
                 # Check if we should retry on this status code
@@ -483,7 +747,7 @@ class AsyncHTTPClient:
                 
                 # Return parsed JSON or None for empty responses
                 if response.content:
-                    return response.json()
+                    return _decode_body(response)
                 return None
                 
             except httpx.ConnectError as e:
@@ -513,6 +777,70 @@ class AsyncHTTPClient:
             raise last_exception
         raise RuntimeError("Unexpected error in request retry loop")
     
+    async def iter_ndjson(
+        self,
+        method: HttpMethod,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Make an async request and iterate over an NDJSON response as it arrives.
+        
+        Asks the server for application/x-ndjson and parses one JSON document
+        per line while the body is still streaming, so memory use does not
+        grow with the size of the result set. Streamed requests are not
+        retried.
+        
+        Args:
+            method: The HTTP method (GET, POST, etc.).
+            path: The URL path (will be appended to base_url).
+            params: Query parameters to include in the URL.
+            json: JSON body to send with the request.
+        
+        Yields:
+            Each parsed JSON document from the response body.
+        
+        Raises:
+            ConnectionError: If the connection fails.
+            TimeoutError: If the request times out.
+            APIError: If the server returns an error response.
+        """
+        url = f"{self.base_url}{path}"
+        
+        # Filter out None values from params
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+        
+        body = _encode_body(json, self.wire_format)
+        body_headers = body.pop("headers", {})
+        
+        try:
+            async with self._client.stream(
+                method=method,
+                url=path,
+                params=params,
+                **body,
+                headers={"Accept": NDJSON_MEDIA_TYPE, **body_headers},
+            ) as response:
+                if not response.is_success:
+                    await response.aread()
+                    _raise_for_status(response)
+                async for line in response.aiter_lines():
+                    if line:
+                        yield from_json(line)
+        except httpx.ConnectError as e:
+            raise ConnectionError(
+                message=f"Failed to connect to {url}",
+                url=url,
+                cause=e,
+            ) from e
+        except httpx.TimeoutException as e:
+            raise TimeoutError(
+                message=f"Request to {url} timed out",
+                timeout=self.timeout,
+                url=url,
+            ) from e
+    
     async def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
         """Make an async GET request.
         
@@ -6,12 +6,13 @@ the SMS/RCS modality endpoints (/sms/*).
 This is an internal module. Import from `client` instead.
 """
 
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, Field
 
-from client._base import AsyncBaseClient, BaseClient
+from client._base import AsyncBaseClient, BaseClient, _build_request_data
 from client.models import ModalityActionResponse
 
 if TYPE_CHECKING:
@@ -182,16 +183,21 @@ class SMSQueryResponse(BaseModel):
     
     Attributes:
         modality_type: Always "sms".
-        messages: Query results (matching messages).
-        total_count: Total number of results matching query.
+        messages: Query results (matching messages). Partial dicts containing
+            only the requested fields when the query used a projection.
+        total_count: Total number of results matching query. None for pages
+            fetched with a cursor.
         returned_count: Number of results returned (after pagination).
+        next_cursor: Cursor for the next page, or None if there are no more
+            results.
         query: Echo of query parameters for debugging.
     """
 
     modality_type: str = "sms"
-    messages: list[SMSMessage]
-    total_count: int
+    messages: list[SMSMessage] | list[dict[str, Any]] = Field(union_mode="left_to_right")
+    total_count: int | None
     returned_count: int
+    next_cursor: str | None = None
     query: dict[str, Any]
 
 
@@ -259,6 +265,8 @@ class SMSClient(BaseClient):
         offset: int = 0,
         sort_by: str | None = None,
         sort_order: Literal["asc", "desc"] = "desc",
+        fields: list[str] | None = None,
+        cursor: str | None = None,
     ) -> SMSQueryResponse:
         """Query SMS messages with filters.
         
@@ -283,6 +291,10 @@ class SMSClient(BaseClient):
             offset: Number of results to skip (for pagination).
             sort_by: Field to sort by (e.g., 'sent_at', 'from_number').
             sort_order: Sort direction ("asc" or "desc").
+            fields: Only return these SMSMessage fields for each result. Results
+                are then plain dicts rather than SMSMessage objects.
+            cursor: next_cursor from a previous response, to fetch the page
+                that follows it (cannot be combined with offset).
         
         Returns:
             Filtered message results with counts.
@@ -328,10 +340,40 @@ class SMSClient(BaseClient):
             request_data["sort_by"] = sort_by
         if sort_order != "desc":
             request_data["sort_order"] = sort_order
+        if fields is not None:
+            request_data["fields"] = fields
+        if cursor is not None:
+            request_data["cursor"] = cursor
         
         data = self._post(f"{self._BASE_PATH}/query", json=request_data)
         return SMSQueryResponse(**data)
 
+    def stream_query(
+        self, **filters: Any
+    ) -> Iterator[SMSMessage | dict[str, Any]]:
+        """Query messages and stream the matches one at a time.
+        
+        Requests the NDJSON variant of /sms/query, which the server encodes
+        incrementally, and yields each message as soon as its line arrives.
+        Memory use stays flat no matter how many messages match.
+        
+        Args:
+            **filters: The same filter, sort, and pagination arguments
+                accepted by query().
+        
+        Yields:
+            Each matching message, in result order. If a fields projection
+            was given, each message is a dict of just those fields.
+        
+        Raises:
+            ValidationError: If query parameters are invalid.
+            APIError: If the request fails.
+        """
+        request_data = _build_request_data(filters)
+        projected = request_data.get("fields") is not None
+        for item in self._stream("POST", f"{self._BASE_PATH}/query", json=request_data):
+            yield item if projected else SMSMessage(**item)
+
     def send(
         self,
         from_number: str,
@@ -589,6 +631,8 @@ class AsyncSMSClient(AsyncBaseClient):
         offset: int = 0,
         sort_by: str | None = None,
         sort_order: Literal["asc", "desc"] = "desc",
+        fields: list[str] | None = None,
+        cursor: str | None = None,
     ) -> SMSQueryResponse:
         """Query SMS messages with filters.
         
@@ -613,6 +657,10 @@ class AsyncSMSClient(AsyncBaseClient):
             offset: Number of results to skip (for pagination).
             sort_by: Field to sort by (e.g., 'sent_at', 'from_number').
             sort_order: Sort direction ("asc" or "desc").
+            fields: Only return these SMSMessage fields for each result. Results
+                are then plain dicts rather than SMSMessage objects.
+            cursor: next_cursor from a previous response, to fetch the page
+                that follows it (cannot be combined with offset).
         
         Returns:
             Filtered message results with counts.
@@ -658,10 +706,42 @@ class AsyncSMSClient(AsyncBaseClient):
             request_data["sort_by"] = sort_by
         if sort_order != "desc":
             request_data["sort_order"] = sort_order
+        if fields is not None:
+            request_data["fields"] = fields
+        if cursor is not None:
+            request_data["cursor"] = cursor
         
         data = await self._post(f"{self._BASE_PATH}/query", json=request_data)
         return SMSQueryResponse(**data)
 
+    async def stream_query(
+        self, **filters: Any
+    ) -> AsyncIterator[SMSMessage | dict[str, Any]]:
+        """Query messages and stream the matches one at a time.
+        
+        Requests the NDJSON variant of /sms/query, which the server encodes
+        incrementally, and yields each message as soon as its line arrives.
+        Memory use stays flat no matter how many messages match.
+        
+        Args:
+            **filters: The same filter, sort, and pagination arguments
+                accepted by query().
+        
+        Yields:
+            Each matching message, in result order. If a fields projection
+            was given, each message is a dict of just those fields.
+        
+        Raises:
+            ValidationError: If query parameters are invalid.
+            APIError: If the request fails.
+        """
+        request_data = _build_request_data(filters)
+        projected = request_data.get("fields") is not None
+        async for item in self._stream(
+            "POST", f"{self._BASE_PATH}/query", json=request_data
+        ):
+            yield item if projected else SMSMessage(**item)
+
     async def send(
         self,
         from_number: str,
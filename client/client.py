@@ -31,20 +31,40 @@ Example:
             await client.email.send(...)
 """
 
-from typing import Any
+import asyncio
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
+from client._batch import AsyncBatch, Batch
 from client._calendar import AsyncCalendarClient, CalendarClient
 from client._chat import AsyncChatClient, ChatClient
 from client._email import AsyncEmailClient, EmailClient
+from client._embedded import EMBEDDED_BASE_URL, AsyncEmbeddedTransport, EmbeddedTransport
 from client._environment import AsyncEnvironmentClient, EnvironmentClient
 from client._events import AsyncEventsClient, EventsClient
-from client._http import AsyncHTTPClient, HTTPClient
+from client._http import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    AsyncHTTPClient,
+    HTTPClient,
+    WireFormat,
+)
 from client._location import AsyncLocationClient, LocationClient
 from client._simulation import AsyncSimulationClient, SimulationClient
 from client._sms import AsyncSMSClient, SMSClient
 from client._time import AsyncTimeClient, TimeClient
 from client._weather import AsyncWeatherClient, WeatherClient
 
+if TYPE_CHECKING:
+    from models.simulation import SimulationEngine
+
+# Modalities whose state AsyncUESClient.gather_states() can fetch
+STATE_MODALITIES = ("email", "sms", "chat", "calendar", "location", "weather")
+
+# Requests AsyncUESClient.gather_states() has in flight at once by default
+DEFAULT_GATHER_CONCURRENCY = 4
+
 
 class UESClient:
     """Synchronous client for the UES REST API.
@@ -98,6 +118,11 @@ class UESClient:
         retry_enabled: bool = False,
         max_retries: int = 3,
         transport: Any = None,
+        wire_format: WireFormat = "json",
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
     ) -> None:
         """Initialize the UES client.
         
@@ -109,21 +134,42 @@ class UESClient:
                 Uses exponential backoff (default: False).
             max_retries: Maximum number of retry attempts when retry is enabled
                 (default: 3).
-            transport: Custom HTTP transport (e.g., ASGITransport for testing).
+            transport: Custom HTTP transport (e.g., ASGITransport for testing),
+                or an EmbeddedTransport to bypass HTTP (see embedded()).
+            wire_format: Body encoding, "json" or "msgpack" (default: "json").
+                MessagePack is cheaper to encode and decode for large states.
+            max_connections: Most connections open at once (default: 100,
+                None for no limit).
+            max_keepalive_connections: Most idle connections kept open for
+                reuse (default: 100, None for no limit).
+            keepalive_expiry: Seconds an idle connection is kept open
+                (default: 4.0, under the server's keep-alive timeout).
+            http2: Whether to use HTTP/2 with servers that support it
+                (default: False). Needs the h2 package
+                (pip install httpx[http2]).
         """
         self._base_url = base_url
         self._timeout = timeout
         self._retry_enabled = retry_enabled
         self._max_retries = max_retries
         
-        # Create the shared HTTP client
-        self._http = HTTPClient(
-            base_url=base_url,
-            timeout=timeout,
-            retry_enabled=retry_enabled,
-            max_retries=max_retries,
-            transport=transport,
-        )
+        # Create the shared HTTP client, unless requests stay in-process
+        self._http: HTTPClient | EmbeddedTransport
+        if isinstance(transport, EmbeddedTransport):
+            self._http = transport
+        else:
+            self._http = HTTPClient(
+                base_url=base_url,
+                timeout=timeout,
+                retry_enabled=retry_enabled,
+                max_retries=max_retries,
+                transport=transport,
+                wire_format=wire_format,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                http2=http2,
+            )
         
         # Initialize sub-clients (lazy initialization via properties)
         self._time: TimeClient | None = None
@@ -137,6 +183,29 @@ class UESClient:
         self._location: LocationClient | None = None
         self._weather: WeatherClient | None = None
     
+    @classmethod
+    def embedded(cls, engine: "SimulationEngine") -> "UESClient":
+        """Create a client that calls an in-process engine without HTTP.
+        
+        Requests go straight to the API's endpoints with the given engine, so
+        there is no HTTP framing or JSON encoding; responses are the same
+        models and errors raise the same exceptions as over HTTP. Requires
+        the server package to be importable. Do not use it from a thread
+        that is running an event loop; use AsyncUESClient.embedded() there.
+        
+        Args:
+            engine: The simulation engine to operate on.
+        
+        Returns:
+            A client bound to the engine.
+        
+        Example::
+        
+            with UESClient.embedded(engine) as client:
+                client.email.query(is_read=False)
+        """
+        return cls(base_url=EMBEDDED_BASE_URL, transport=EmbeddedTransport(engine))
+    
     def __enter__(self) -> "UESClient":
         """Enter context manager.
         
@@ -157,6 +226,31 @@ class UESClient:
         """
         self._http.close()
     
+    def batch(self) -> Batch:
+        """Collect calls and send them to the server as one request.
+        
+        Sub-client calls made through the returned batch (batch.email,
+        batch.sms, ...) return a BatchFuture instead of a result. When the
+        with block exits, the calls are sent as a single POST /batch and run
+        in order under one engine lock acquisition, then each future
+        resolves to the model, or the exception, the call would have
+        produced on its own. Only calls that make a single request can be
+        batched; streaming calls cannot.
+        
+        Returns:
+            An empty batch, to be used as a context manager.
+        
+        Example::
+        
+            with client.batch() as batch:
+                batch.email.read(unread_ids)
+                batch.email.star(important_ids)
+                sms = batch.sms.get_state()
+                calendar = batch.calendar.query(start=now, end=tomorrow)
+            print(sms.result().message_count)
+        """
+        return Batch(self)
+    
     # Sub-client properties (lazy initialization)
     
     @property
@@ -398,6 +492,11 @@ class AsyncUESClient:
         retry_enabled: bool = False,
         max_retries: int = 3,
         transport: Any = None,
+        wire_format: WireFormat = "json",
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
     ) -> None:
         """Initialize the async UES client.
         
@@ -409,21 +508,42 @@ class AsyncUESClient:
                 Uses exponential backoff (default: False).
             max_retries: Maximum number of retry attempts when retry is enabled
                 (default: 3).
-            transport: Custom HTTP transport (e.g., ASGITransport for testing).
+            transport: Custom HTTP transport (e.g., ASGITransport for testing),
+                or an AsyncEmbeddedTransport to bypass HTTP (see embedded()).
+            wire_format: Body encoding, "json" or "msgpack" (default: "json").
+                MessagePack is cheaper to encode and decode for large states.
+            max_connections: Most connections open at once (default: 100,
+                None for no limit).
+            max_keepalive_connections: Most idle connections kept open for
+                reuse (default: 100, None for no limit).
+            keepalive_expiry: Seconds an idle connection is kept open
+                (default: 4.0, under the server's keep-alive timeout).
+            http2: Whether to use HTTP/2 with servers that support it
+                (default: False). Needs the h2 package
+                (pip install httpx[http2]).
         """
         self._base_url = base_url
         self._timeout = timeout
         self._retry_enabled = retry_enabled
         self._max_retries = max_retries
         
-        # Create the shared async HTTP client
-        self._http = AsyncHTTPClient(
-            base_url=base_url,
-            timeout=timeout,
-            retry_enabled=retry_enabled,
-            max_retries=max_retries,
-            transport=transport,
-        )
+        # Create the shared async HTTP client, unless requests stay in-process
+        self._http: AsyncHTTPClient | AsyncEmbeddedTransport
+        if isinstance(transport, AsyncEmbeddedTransport):
+            self._http = transport
+        else:
+            self._http = AsyncHTTPClient(
+                base_url=base_url,
+                timeout=timeout,
+                retry_enabled=retry_enabled,
+                max_retries=max_retries,
+                transport=transport,
+                wire_format=wire_format,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                http2=http2,
+            )
         
         # Initialize sub-clients (lazy initialization via properties)
         self._time: AsyncTimeClient | None = None
@@ -437,6 +557,24 @@ class AsyncUESClient:
         self._location: AsyncLocationClient | None = None
         self._weather: AsyncWeatherClient | None = None
     
+    @classmethod
+    def embedded(cls, engine: "SimulationEngine") -> "AsyncUESClient":
+        """Create a client that calls an in-process engine without HTTP.
+        
+        Requests go straight to the API's endpoints with the given engine,
+        running on the caller's event loop, so there is no HTTP framing or
+        JSON encoding; responses are the same models and errors raise the
+        same exceptions as over HTTP. Requires the server package to be
+        importable.
+        
+        Args:
+            engine: The simulation engine to operate on.
+        
+        Returns:
+            A client bound to the engine.
+        """
+        return cls(base_url=EMBEDDED_BASE_URL, transport=AsyncEmbeddedTransport(engine))
+    
     async def __aenter__(self) -> "AsyncUESClient":
         """Enter async context manager.
         
@@ -457,6 +595,71 @@ class AsyncUESClient:
         """
         await self._http.close()
     
+    def batch(self) -> AsyncBatch:
+        """Collect calls and send them to the server as one request.
+        
+        Like UESClient.batch(), entered with async with. Calls made through
+        the batch are not awaited; they return a BatchFuture right away.
+        
+        Returns:
+            An empty batch, to be used as an async context manager.
+        
+        Example::
+        
+            async with client.batch() as batch:
+                batch.email.read(unread_ids)
+                sms = batch.sms.get_state()
+            print(sms.result().message_count)
+        """
+        return AsyncBatch(self)
+    
+    async def gather_states(
+        self,
+        modalities: Iterable[str] = STATE_MODALITIES,
+        concurrency: int = DEFAULT_GATHER_CONCURRENCY,
+    ) -> dict[str, Any]:
+        """Fetch the states of several modalities concurrently.
+        
+        Issues each modality's get_state() request, with at most concurrency
+        of them in flight at once, so that many agents fanning out over one
+        client stay within its connection pool instead of queueing on it.
+        
+        Args:
+            modalities: Modalities to fetch, from STATE_MODALITIES (default:
+                all of them).
+            concurrency: Most requests in flight at once (default: 4).
+        
+        Returns:
+            Each modality's state response, keyed by modality name, in the
+            order requested.
+        
+        Raises:
+            ValueError: If a modality is unknown or concurrency is below 1.
+            APIError: If any of the requests fails.
+        
+        Example::
+        
+            states = await client.gather_states(["email", "sms", "calendar"])
+            unread = states["email"].unread_count
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        names = list(dict.fromkeys(modalities))
+        unknown = [name for name in names if name not in STATE_MODALITIES]
+        if unknown:
+            raise ValueError(
+                f"Unknown modalities {unknown}; expected some of {list(STATE_MODALITIES)}"
+            )
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(name: str) -> Any:
+            async with semaphore:
+                return await getattr(self, name).get_state()
+        
+        states = await asyncio.gather(*(fetch(name) for name in names))
+        return dict(zip(names, states))
+    
     # Sub-client properties (lazy initialization)
     
     @property
@@ -13,31 +13,13 @@ To run in production:
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from fastapi.exceptions import RequestValidationError
-from pydantic import ValidationError
 
 from api.dependencies import initialize_simulation_engine, shutdown_simulation_engine
-from api.exceptions import (
-    ModalityNotFoundError,
-    SimulationNotRunningError,
-    generic_exception_handler,
-    modality_not_found_handler,
-    request_validation_exception_handler,
-    runtime_error_handler,
-    simulation_not_running_handler,
-    validation_exception_handler,
-    value_error_handler,
-)
-from api.routes import calendar as calendar_routes
-from api.routes import chat as chat_routes
-from api.routes import email as email_routes
-from api.routes import environment as environment_routes
-from api.routes import events as events_routes
-from api.routes import location as location_routes
-from api.routes import simulation as simulation_routes
-from api.routes import sms as sms_routes
-from api.routes import time as time_routes
-from api.routes import weather as weather_routes
+from api.executor import initialize_engine_executor, shutdown_engine_executor
+from api.middleware import RequestMetricsMiddleware
+from api.exceptions import EXCEPTION_HANDLERS
+from api.routes import ROUTERS
+from api.wire_format import MessagePackRoute
 
 
 @asynccontextmanager
@@ -56,6 +38,7 @@ async def lifespan(app: FastAPI):
     # Startup: Initialize the simulation engine
     print("🚀 Starting UES - Initializing SimulationEngine...")
     initialize_simulation_engine()
+    initialize_engine_executor()
     print("✅ SimulationEngine initialized")
     
     yield  # App runs and handles requests here
@@ -63,6 +46,7 @@ async def lifespan(app: FastAPI):
     # Shutdown: Clean up resources
     print("🛑 Shutting down UES - Cleaning up SimulationEngine...")
     shutdown_simulation_engine()
+    shutdown_engine_executor()
     print("✅ Shutdown complete")
 
 
@@ -74,29 +58,22 @@ app = FastAPI(
     lifespan=lifespan,  # Register the lifespan handler
 )
 
+# Negotiate MessagePack bodies on the routes defined directly on the app too
+app.router.route_class = MessagePackRoute
+
 # Register exception handlers
 # These convert Python exceptions into clean JSON responses
 # Order matters: specific exceptions before general ones
-app.add_exception_handler(RequestValidationError, request_validation_exception_handler)
-app.add_exception_handler(ModalityNotFoundError, modality_not_found_handler)
-app.add_exception_handler(SimulationNotRunningError, simulation_not_running_handler)
-app.add_exception_handler(ValidationError, validation_exception_handler)
-app.add_exception_handler(ValueError, value_error_handler)
-app.add_exception_handler(RuntimeError, runtime_error_handler)
-app.add_exception_handler(Exception, generic_exception_handler)
+for exception_class, handler in EXCEPTION_HANDLERS.items():
+    app.add_exception_handler(exception_class, handler)
+
+# Record per-route latency and payload sizes for /metrics and the slow-request log
+app.add_middleware(RequestMetricsMiddleware)
 
 # Register route modules
 # Each router groups related endpoints together
-app.include_router(time_routes.router)
-app.include_router(environment_routes.router)
-app.include_router(events_routes.router)
-app.include_router(simulation_routes.router)
-app.include_router(weather_routes.router)
-app.include_router(email_routes.router)
-app.include_router(sms_routes.router)
-app.include_router(chat_routes.router)
-app.include_router(calendar_routes.router)
-app.include_router(location_routes.router)
+for router in ROUTERS:
+    app.include_router(router)
 
 
 @app.get("/")
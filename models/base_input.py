@@ -2,10 +2,10 @@
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional, Self
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ModalityInput(BaseModel):
@@ -17,6 +17,12 @@ class ModalityInput(BaseModel):
     Inputs represent what changes when an event occurs. They are immutable value objects
     that describe state mutations.
 
+    An input is checked with validate_input() at most once: ensure_valid() runs it the
+    first time and marks the input as validated, so the event, undo capture and state
+    update of one execution (and later redos or re-queues) do not repeat the check.
+    Like Pydantic field validation, the mark is not revisited when a field is assigned
+    to; copies made with model_copy(update=...) are unmarked.
+
     Args:
         modality_type: Identifies which modality this input affects (e.g., "email", "location").
         timestamp: When this input logically occurred (simulator time).
@@ -34,6 +40,53 @@ class ModalityInput(BaseModel):
         description="Unique identifier for this specific input",
     )
 
+    _validated: bool = PrivateAttr(default=False)
+
+    def model_copy(self, *, update: Optional[dict[str, Any]] = None, deep: bool = False) -> Self:
+        """Copy this input, clearing the validated mark if fields are updated.
+
+        Args:
+            update: Field values to change in the copy.
+            deep: Whether to deep-copy field values.
+
+        Returns:
+            The copied input.
+        """
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            copy.__pydantic_private__["_validated"] = False
+        return copy
+
+    @property
+    def is_validated(self) -> bool:
+        """Whether validate_input() has passed (or the input is trusted)."""
+        return self.__pydantic_private__["_validated"]
+
+    def ensure_valid(self) -> None:
+        """Run validate_input() unless this input has already passed it.
+
+        Raises:
+            ValueError: If validation fails with descriptive message.
+        """
+        # The private-attribute dict is read directly: attribute access to
+        # pydantic private attributes costs more than the check it guards
+        private = self.__pydantic_private__
+        if not private["_validated"]:
+            self.validate_input()
+            private["_validated"] = True
+
+    def mark_validated(self) -> Self:
+        """Mark this input as valid without running validate_input().
+
+        Only for trusted inputs, such as those read back from files this
+        simulator wrote from validated inputs.
+
+        Returns:
+            This input.
+        """
+        self.__pydantic_private__["_validated"] = True
+        return self
+
     @abstractmethod
     def validate_input(self) -> None:
         """Perform modality-specific validation beyond Pydantic field validation.
@@ -1,15 +1,50 @@
 """Base class for all modality state models."""
 
+import functools
+import time
 from abc import abstractmethod
+from collections.abc import Callable
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
+from models.metrics import (
+    MODALITY_APPLY_SECONDS,
+    MODALITY_QUERY_SECONDS,
+    REGISTRY,
+    Histogram,
+)
+
 if TYPE_CHECKING:
     from models.base_input import ModalityInput
 
 
+def _timed(method: Callable, histogram: Histogram) -> Callable:
+    """Wrap a state method so each call is observed on a histogram.
+
+    Args:
+        method: The apply_input or query implementation to wrap.
+        histogram: Histogram labelled by modality to record durations on.
+
+    Returns:
+        The wrapped method.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not REGISTRY.enabled:
+            return method(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            histogram.labels(self.modality_type).observe(time.perf_counter() - start)
+
+    wrapper.__ues_timed__ = True
+    return wrapper
+
+
 class ModalityState(BaseModel):
     """Base class for current state of each modality.
 
@@ -36,6 +71,23 @@ class ModalityState(BaseModel):
         default=0, description="Number of times this state has been modified"
     )
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Time apply_input and query on every concrete state class.
+
+        Each subclass's own implementations are wrapped once, so modality
+        apply and query latency is recorded without each modality having to
+        instrument itself.
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+        for name, histogram in (
+            ("apply_input", MODALITY_APPLY_SECONDS),
+            ("query", MODALITY_QUERY_SECONDS),
+        ):
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "__ues_timed__", False):
+                setattr(cls, name, _timed(method, histogram))
+
     @abstractmethod
     def apply_input(self, input_data: "ModalityInput") -> None:
         """Apply a ModalityInput to modify this state.
@@ -0,0 +1,143 @@
+"""Concurrency primitives for sharing simulation state between threads.
+
+The simulation engine is touched from several threads at once: the
+auto-advance loop ticks in its own thread, and API requests run engine work on
+a worker pool. Reads (queries, state snapshots) vastly outnumber writes (ticks,
+time control, event execution), so state is guarded by a reader/writer lock
+rather than a mutex: any number of readers proceed together, while a writer
+runs alone.
+"""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """Reader/writer lock that prefers writers.
+
+    Many threads may hold the lock for reading at the same time; a writer
+    holds it exclusively. New readers wait while a writer is waiting, so a
+    steady stream of queries cannot starve the tick thread.
+
+    The lock is reentrant per thread: a writer may write or read again, and a
+    reader may read again. A reader may not upgrade to writing, because two
+    readers doing so would deadlock each other; this raises RuntimeError.
+
+    Example:
+        lock = ReadWriteLock()
+        with lock.read():
+            ...  # runs alongside other readers
+        with lock.write():
+            ...  # runs alone
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: int | None = None
+        self._write_depth = 0
+        self._writers_waiting = 0
+        self._local = threading.local()
+
+    @property
+    def readers(self) -> int:
+        """Number of threads currently holding the lock for reading."""
+        return self._readers
+
+    @property
+    def write_locked(self) -> bool:
+        """Whether a writer currently holds the lock."""
+        return self._writer is not None
+
+    @property
+    def write_owned(self) -> bool:
+        """Whether the current thread holds the lock for writing."""
+        return self._writer == threading.get_ident()
+
+    def _read_depth(self) -> int:
+        """Return how many times the current thread holds the read lock."""
+        return getattr(self._local, "depth", 0)
+
+    def acquire_read(self) -> None:
+        """Acquire the lock for reading, blocking while a writer holds or awaits it."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            if self._read_depth() == 0:
+                while self._writer is not None or self._writers_waiting:
+                    self._condition.wait()
+                self._readers += 1
+        self._local.depth = self._read_depth() + 1
+
+    def release_read(self) -> None:
+        """Release a read acquisition made by the current thread."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._write_depth -= 1
+                return
+            depth = self._read_depth()
+            if depth == 0:
+                raise RuntimeError("Cannot release a read lock that is not held")
+            self._local.depth = depth - 1
+            if depth == 1:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """Acquire the lock for writing, blocking until no one else holds it.
+
+        Raises:
+            RuntimeError: If the current thread holds the lock for reading.
+        """
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            if self._read_depth():
+                raise RuntimeError("Cannot upgrade a read lock to a write lock")
+            self._writers_waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self) -> None:
+        """Release a write acquisition made by the current thread.
+
+        Raises:
+            RuntimeError: If the current thread does not hold the write lock.
+        """
+        with self._condition:
+            if self._writer != threading.get_ident():
+                raise RuntimeError("Cannot release a write lock that is not held")
+            self._write_depth -= 1
+            if self._write_depth == 0:
+                self._writer = None
+                self._condition.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock for reading for the duration of a with block."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock for writing for the duration of a with block."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
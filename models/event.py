@@ -1,5 +1,6 @@
 """Simulator event model."""
 
+import time
 from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Optional
@@ -7,6 +8,8 @@ from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from models.metrics import EVENT_EXECUTION_SECONDS, REGISTRY
+
 if TYPE_CHECKING:
     from models.base_input import ModalityInput
     from models.environment import Environment
@@ -37,7 +40,9 @@ class SimulatorEvent(BaseModel):
         event_id: Unique identifier for this event.
         scheduled_time: When this event should execute (simulator time).
         modality: Which modality this event affects (e.g., "email", "location").
-        data: The ModalityInput payload for this event.
+        data: The ModalityInput payload for this event. A dict (such as a
+            dumped input) is accepted too, and parsed on first use; see
+            get_input().
         status: Current execution state of the event.
         created_at: When this event was created (simulator time).
         executed_at: When this event was actually executed (simulator time).
@@ -118,10 +123,12 @@ class SimulatorEvent(BaseModel):
 
         self.status = EventStatus.EXECUTING
         undo_entry: Optional[UndoEntry] = None
+        start = time.perf_counter() if REGISTRY.enabled else None
 
         try:
             # Validate input
-            self.data.validate_input()
+            input_data = self.get_input()
+            input_data.ensure_valid()
 
             # Get state
             state = environment.get_state(self.modality)
@@ -129,10 +136,10 @@ class SimulatorEvent(BaseModel):
             # Capture undo data BEFORE applying input
             undo_data: Optional[dict[str, Any]] = None
             if capture_undo:
-                undo_data = state.create_undo_data(self.data)
+                undo_data = state.create_undo_data(input_data)
 
             # Apply input
-            state.apply_input(self.data)
+            state.apply_input(input_data)
 
             # Success
             self.status = EventStatus.EXECUTED
@@ -153,8 +160,53 @@ class SimulatorEvent(BaseModel):
             self.error_message = f"{type(e).__name__}: {str(e)}"
             self.executed_at = environment.time_state.current_time
 
+        if start is not None:
+            self._record_execution(time.perf_counter() - start)
+
         return undo_entry
 
+    def get_input(self) -> "ModalityInput":
+        """Return this event's input, parsing a dict payload on first use.
+
+        Events may carry their input as a dict, such as a dumped input in a
+        fixture or snapshot. It is parsed into the input class of the
+        event's modality the first time it is needed and stored back in
+        data, so later calls return the typed input directly. The event's
+        scheduled_time is used if the dict has no timestamp.
+
+        Returns:
+            The typed modality input.
+
+        Raises:
+            ValueError: If the dict is not a valid input for the modality.
+        """
+        if isinstance(self.data, dict):
+            # Import here to avoid circular import
+            from models.inputs import MODALITY_INPUT_ADAPTER
+
+            self.data = MODALITY_INPUT_ADAPTER.validate_python(
+                {
+                    "timestamp": self.scheduled_time,
+                    **self.data,
+                    "modality_type": self.modality,
+                }
+            )
+        return self.data
+
+    def _record_execution(self, duration: float) -> None:
+        """Record execution latency and outcome in the metrics registry.
+
+        Args:
+            duration: Wall time spent executing, in seconds.
+        """
+        # Read fields directly: a getattr miss on a pydantic model raises
+        # internally, which costs more than the rest of the recording
+        fields = getattr(self.data, "__dict__", None) or {}
+        operation = fields.get("operation") or fields.get("action") or "apply"
+        EVENT_EXECUTION_SECONDS.labels(self.modality, operation, self.status).observe(
+            duration
+        )
+
     def can_execute(self, current_time: datetime) -> bool:
         """Check if this event is eligible for execution.
 
@@ -177,7 +229,7 @@ class SimulatorEvent(BaseModel):
 
         # Check if input is valid
         try:
-            self.data.validate_input()
+            self.get_input().ensure_valid()
             return True
         except Exception:
             return False
@@ -214,7 +266,7 @@ class SimulatorEvent(BaseModel):
 
         # Validate input data
         try:
-            self.data.validate_input()
+            self.get_input().ensure_valid()
         except Exception as e:
             errors.append(f"Invalid input data: {e}")
 
@@ -238,7 +290,7 @@ class SimulatorEvent(BaseModel):
             Brief description for logging and UI display.
         """
         time_str = self.scheduled_time.strftime("%Y-%m-%d %H:%M:%S")
-        data_summary = self.data.get_summary()
+        data_summary = self.get_input().get_summary()
         return f"[{time_str}] {self.modality}: {data_summary}"
 
     def skip(self, reason: str) -> None:
@@ -297,4 +349,4 @@ class SimulatorEvent(BaseModel):
         Returns:
             List of entity IDs this event affects.
         """
-        return self.data.get_affected_entities()
\ No newline at end of file
+        return self.get_input().get_affected_entities()
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""Parsing modality inputs of any modality.
+
+MODALITY_INPUT_CLASSES maps each modality name to its input class.
+AnyModalityInput is the union of all input classes, discriminated by the
+literal modality_type each of them declares, and MODALITY_INPUT_ADAPTER is
+its TypeAdapter. The adapter is built once, at import, so parsing an input
+of any modality is a single call into Pydantic's compiled validator: dicts
+go through validate_python(), and JSON text goes straight through
+validate_json() without being decoded into Python objects first.
+
+Example:
+    >>> MODALITY_INPUT_ADAPTER.validate_json(
+    ...     b'{"modality_type": "location", "timestamp": "2025-01-01T12:00:00Z",'
+    ...     b' "latitude": 40.7, "longitude": -74.0}'
+    ... )
+    LocationInput(...)
+"""
+
+from typing import Annotated, Union
+
+from pydantic import Field, TypeAdapter
+
+from models.base_input import ModalityInput
+from models.modalities.calendar_input import CalendarInput
+from models.modalities.chat_input import ChatInput
+from models.modalities.discord_input import DiscordInput
+from models.modalities.email_input import EmailInput
+from models.modalities.filesystem_input import FileSystemInput
+from models.modalities.location_input import LocationInput
+from models.modalities.screen_input import ScreenInput
+from models.modalities.slack_input import SlackInput
+from models.modalities.sms_input import SMSInput
+from models.modalities.social_input import SocialMediaInput
+from models.modalities.time_input import TimeInput
+from models.modalities.weather_input import WeatherInput
+
+# Mapping of modality names to their input classes
+MODALITY_INPUT_CLASSES: dict[str, type[ModalityInput]] = {
+    "email": EmailInput,
+    "sms": SMSInput,
+    "chat": ChatInput,
+    "calendar": CalendarInput,
+    "location": LocationInput,
+    "weather": WeatherInput,
+    "time": TimeInput,
+    "filesystem": FileSystemInput,
+    "slack": SlackInput,
+    "discord": DiscordInput,
+    "social": SocialMediaInput,
+    "screen": ScreenInput,
+}
+
+
+# An input of any modality, validated as the class its modality_type names
+AnyModalityInput = Annotated[
+    Union[tuple(MODALITY_INPUT_CLASSES.values())],
+    Field(discriminator="modality_type"),
+]
+
+MODALITY_INPUT_ADAPTER: TypeAdapter[ModalityInput] = TypeAdapter(AnyModalityInput)
@@ -0,0 +1,461 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+A small, dependency-free implementation of counters, gauges, and histograms.
+The simulation core updates these from its hot paths (event execution,
+ticks, queue operations, modality apply/query), so each update is a couple
+of dict lookups and a bisect, with no locking. The API serves the
+registry at GET /metrics in the Prometheus text format (version 0.0.4).
+
+Metrics used by UES are defined at the bottom of this module so every
+instrumented module shares one set of names.
+
+Example:
+    with EVENT_EXECUTION_SECONDS.labels("email", "receive").time():
+        state.apply_input(data)
+
+    print(REGISTRY.render())
+"""
+
+import math
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from threading import get_ident
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any
+
+# Seconds; spans fast in-memory operations up to slow full-state work
+LATENCY_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# Bytes; powers of four from 64 B to 16 MiB
+SIZE_BUCKETS = tuple(float(64 * 4**i) for i in range(10))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the text exposition format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    """Format a label set, or return "" if there are no labels."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def approx_size(value: Any, _depth: int = 0) -> int:
+    """Estimate the memory footprint of a value in bytes.
+
+    Sums sys.getsizeof over nested dicts, lists, tuples, and sets. Shared
+    references are counted each time they appear, and nesting deeper than
+    eight levels is not followed; the result is an estimate for monitoring,
+    not an exact accounting.
+
+    Args:
+        value: The value to measure.
+
+    Returns:
+        Estimated size in bytes.
+    """
+    size = sys.getsizeof(value)
+    if _depth >= 8:
+        return size
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += approx_size(key, _depth + 1) + approx_size(item, _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += approx_size(item, _depth + 1)
+    return size
+
+
+class _Metric(ABC):
+    """Base class for a named metric family with optional labels."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """Create the series for a new set of label values."""
+        pass
+
+    def labels(self, *values: Any) -> Any:
+        """Return the child metric for a set of label values.
+
+        Args:
+            *values: One value per label name, in order. Enum members are
+                labelled by their value.
+
+        Returns:
+            The child metric, created on first use.
+
+        Raises:
+            ValueError: If the number of values does not match the labels.
+        """
+        # Strings and str-based enums (which hash and compare equal to their
+        # values) find existing children without any conversion
+        child = self._children.get(values)
+        if child is None:
+            key = tuple(v.value if isinstance(v, Enum) else str(v) for v in values)
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {values}"
+                )
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def clear(self) -> None:
+        """Remove all children, resetting every series."""
+        with self._lock:
+            self._children.clear()
+
+    @abstractmethod
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        """Yield (sample name, formatted labels, value) for every series."""
+        pass
+
+    def render(self) -> str:
+        """Render the family in the Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(
+            f"{name}{labels} {_format_value(value)}"
+            for name, labels, value in self.samples()
+        )
+        return "\n".join(lines)
+
+
+class _CounterChild:
+    """A single counter series.
+
+    Like histograms, counters keep one shard per thread (see
+    _HistogramChild) so increments need no lock.
+    """
+
+    def __init__(self) -> None:
+        self._shards: dict[int, list[float]] = {}
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter by a non-negative amount."""
+        shard = self._shards.get(get_ident())
+        if shard is None:
+            shard = self._shards.setdefault(get_ident(), [0.0])
+        shard[0] += amount
+
+    @property
+    def value(self) -> float:
+        """Current total across all threads."""
+        return sum(shard[0] for shard in list(self._shards.values()))
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, such as events executed."""
+
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the unlabelled counter."""
+        self.labels().inc(amount)
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        for key, child in list(self._children.items()):
+            yield f"{self.name}_total", _format_labels(self.labelnames, key), child.value
+
+
+class _GaugeChild:
+    """A single gauge series."""
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        """Set the gauge to a value."""
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge."""
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge."""
+        with self._lock:
+            self.value -= amount
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, such as queue depth.
+
+    Gauges describing engine state are set when the registry is scraped
+    rather than on every change, which keeps them off the hot paths.
+    """
+
+    type_name = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled gauge."""
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the unlabelled gauge."""
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the unlabelled gauge."""
+        self.labels().dec(amount)
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        for key, child in list(self._children.items()):
+            yield self.name, _format_labels(self.labelnames, key), child.value
+
+
+class _HistogramChild:
+    """A single histogram series.
+
+    Observations are recorded into a per-thread shard of bucket counts, so
+    the hot path never takes a lock: each thread only ever writes its own
+    shard. Readers sum the shards, and may miss an observation that is in
+    progress at that moment, which is acceptable for monitoring.
+    """
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        # Bucket counts followed by the sum of observed values
+        self._shards: dict[int, list[float]] = {}
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        shard = self._shards.get(get_ident())
+        if shard is None:
+            shard = self._shards.setdefault(
+                get_ident(), [0] * (len(self.buckets) + 1) + [0.0]
+            )
+        shard[bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def snapshot(self) -> tuple[list[int], float]:
+        """Return per-bucket counts (the last one for +Inf) and the sum.
+
+        Returns:
+            Tuple of (non-cumulative bucket counts, sum of observed values).
+        """
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0.0
+        for shard in list(self._shards.values()):
+            for i in range(len(counts)):
+                counts[i] += shard[i]
+            total += shard[-1]
+        return counts, total
+
+    @property
+    def count(self) -> int:
+        """Number of observations across all threads."""
+        return sum(self.snapshot()[0])
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall time spent in a with block, in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Histogram(_Metric):
+    """Distribution of observations, such as latencies, in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record one observation on the unlabelled histogram."""
+        self.labels().observe(value)
+
+    def time(self):
+        """Time a with block on the unlabelled histogram."""
+        return self.labels().time()
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for key, child in list(self._children.items()):
+            counts, total = child.snapshot()
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames + ("le",), key + (bound,))
+                yield f"{self.name}_bucket", labels, cumulative
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together.
+
+    Attributes:
+        enabled: Whether instrumented code should record observations.
+            Instrumentation checks this flag before timing anything, so
+            turning it off removes nearly all overhead.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self.enabled = True
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric family to the registry.
+
+        Args:
+            metric: The metric to add.
+
+        Returns:
+            The metric, for use as a module-level constant.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Create and register a counter."""
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Create and register a gauge."""
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> _Metric | None:
+        """Look up a registered metric family by name."""
+        return self._metrics.get(name)
+
+    def clear(self) -> None:
+        """Reset every series of every registered metric."""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+    def render(self) -> str:
+        """Render all metric families in the Prometheus text format.
+
+        Returns:
+            The exposition text, ending with a newline.
+        """
+        return "\n".join(m.render() for m in list(self._metrics.values())) + "\n"
+
+
+# Media type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Shared registry served at GET /metrics
+REGISTRY = MetricsRegistry()
+
+# ===== Engine Metrics =====
+
+EVENT_EXECUTION_SECONDS = REGISTRY.histogram(
+    "ues_event_execution_seconds",
+    "Time to execute a simulator event, including undo capture, by outcome.",
+    ("modality", "operation", "status"),
+)
+TICK_DURATION_SECONDS = REGISTRY.histogram(
+    "ues_tick_duration_seconds",
+    "Wall time of one auto-advance tick, including waiting for the engine lock.",
+)
+TICK_LAG_SECONDS = REGISTRY.histogram(
+    "ues_tick_lag_seconds",
+    "How late an auto-advance tick started relative to its scheduled wall time.",
+)
+QUEUE_OPERATIONS = REGISTRY.counter(
+    "ues_event_queue_operations",
+    "Event queue operations performed.",
+    ("operation",),
+)
+QUEUE_EVENTS = REGISTRY.gauge(
+    "ues_event_queue_events",
+    "Events in the queue, by status.",
+    ("status",),
+)
+UNDO_STACK_ENTRIES = REGISTRY.gauge(
+    "ues_undo_stack_entries",
+    "Entries on the undo and redo stacks.",
+    ("stack",),
+)
+UNDO_STACK_BYTES = REGISTRY.gauge(
+    "ues_undo_stack_bytes",
+    "Estimated size of the undo data held on the undo and redo stacks.",
+    ("stack",),
+)
+MODALITY_APPLY_SECONDS = REGISTRY.histogram(
+    "ues_modality_apply_seconds",
+    "Time for a modality state to apply one input.",
+    ("modality",),
+)
+MODALITY_QUERY_SECONDS = REGISTRY.histogram(
+    "ues_modality_query_seconds",
+    "Time for a modality state to answer one query.",
+    ("modality",),
+)
+SIMULATION_RUNNING = REGISTRY.gauge(
+    "ues_simulation_running",
+    "Whether the simulation is running (1) or stopped (0).",
+)
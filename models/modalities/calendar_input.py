@@ -256,7 +256,7 @@ class CalendarInput(ModalityInput):
         conference_link: Video conference URL.
     """
 
-    modality_type: str = Field(default="calendar", frozen=True)
+    modality_type: Literal["calendar"] = Field(default="calendar", frozen=True)
     operation: CalendarOperation = Field(description="Calendar operation type")
     event_id: Optional[str] = Field(
         default=None, description="Event ID (auto-generated for create)"
@@ -1,13 +1,24 @@
 """Calendar state model."""
 
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Optional
+from operator import attrgetter
+from typing import Any, ClassVar, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer
 
 from models.base_input import ModalityInput
 from models.base_state import ModalityState
+from models.pagination import (
+    SortedIndexCache,
+    collect_page,
+    decode_cursor,
+    encode_cursor,
+    unsorted_key,
+)
+from models.projection import project
+from models.records import Record
 from models.modalities.calendar_input import (
     Attachment,
     Attendee,
@@ -212,6 +223,58 @@ class CalendarEvent(BaseModel):
         return len(self.attachments) > 0
 
 
+@dataclass(slots=True, kw_only=True)
+class CalendarEventRecord(Record):
+    """Compact form of CalendarEvent held in CalendarState.events."""
+
+    model: ClassVar[type[BaseModel]] = CalendarEvent
+
+    event_id: str
+    calendar_id: str
+    title: str
+    start: datetime
+    end: datetime
+    all_day: bool = False
+    timezone: str = "UTC"
+    description: Optional[str] = None
+    location: Optional[str] = None
+    status: str = "confirmed"
+    organizer: Optional[str] = None
+    attendees: list[Attendee] = field(default_factory=list)
+    recurrence: Optional[RecurrenceRule] = None
+    recurrence_exceptions: set[str] = field(default_factory=set)
+    recurrence_id: Optional[str] = None
+    parent_event_id: Optional[str] = None
+    reminders: list[Reminder] = field(default_factory=list)
+    color: Optional[str] = None
+    visibility: str = "default"
+    transparency: str = "opaque"
+    attachments: list[Attachment] = field(default_factory=list)
+    conference_link: Optional[str] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    deleted_at: Optional[datetime] = None
+
+    is_recurring = CalendarEvent.is_recurring
+    is_modified_occurrence = CalendarEvent.is_modified_occurrence
+    has_attendees = CalendarEvent.has_attendees
+    has_attachments = CalendarEvent.has_attachments
+
+
+# Event fields CalendarState.query() can sort by
+_CALENDAR_SORT_FIELDS = ("start", "end", "status")
+
+# Undo actions that put back an existing event's previous fields
+_CALENDAR_RESTORING_UNDO_ACTIONS = frozenset(
+    {
+        "restore_event",
+        "restore_event_remove_split",
+        "restore_event_remove_occurrence",
+        "remove_exception",
+    }
+)
+
+
 class CalendarState(ModalityState):
     """Current calendar state tracking all calendars and events.
 
@@ -220,7 +283,7 @@ class CalendarState(ModalityState):
         last_updated: When state was last modified.
         update_count: Number of operations applied.
         calendars: Dict mapping calendar_id to Calendar objects.
-        events: Dict mapping event_id to CalendarEvent objects.
+        events: Dict mapping event_id to CalendarEventRecord objects.
         default_calendar_id: ID of default calendar.
         user_timezone: User's default time zone.
     """
@@ -235,13 +298,14 @@ class CalendarState(ModalityState):
     calendars: dict[str, Calendar] = Field(
         default_factory=dict, description="Calendar objects by ID"
     )
-    events: dict[str, CalendarEvent] = Field(
+    events: dict[str, CalendarEventRecord] = Field(
         default_factory=dict, description="Event objects by ID"
     )
     default_calendar_id: str = Field(
         default="primary", description="Default calendar ID"
     )
     user_timezone: str = Field(default="UTC", description="User's time zone")
+    _sort_indexes: SortedIndexCache = PrivateAttr(default_factory=SortedIndexCache)
 
     def model_post_init(self, __context: Any) -> None:
         """Initialize state with default primary calendar if empty.
@@ -269,6 +333,10 @@ class CalendarState(ModalityState):
         if not isinstance(input_data, CalendarInput):
             raise TypeError(f"Expected CalendarInput, got {type(input_data)}")
 
+        # Creating under an existing ID replaces the event and its sort keys
+        if input_data.operation == "create" and input_data.event_id in self.events:
+            self._sort_indexes.invalidate()
+
         if input_data.operation == "create":
             self._handle_create(input_data)
         elif input_data.operation == "update":
@@ -332,7 +400,7 @@ class CalendarState(ModalityState):
         if input_data.conference_link is not None:
             event_kwargs["conference_link"] = input_data.conference_link
 
-        event = CalendarEvent(**event_kwargs)
+        event = CalendarEventRecord(**event_kwargs)
 
         self.events[event.event_id] = event
         self.calendars[input_data.calendar_id].event_ids.add(event.event_id)
@@ -360,7 +428,7 @@ class CalendarState(ModalityState):
         event.updated_at = input_data.timestamp
 
     def _handle_recurring_update(
-        self, event: CalendarEvent, input_data: CalendarInput
+        self, event: CalendarEventRecord, input_data: CalendarInput
     ) -> None:
         """Handle update to recurring event with scope.
 
@@ -376,7 +444,7 @@ class CalendarState(ModalityState):
             self._create_modified_occurrence(event, input_data)
 
     def _apply_updates_to_event(
-        self, event: CalendarEvent, input_data: CalendarInput
+        self, event: CalendarEventRecord, input_data: CalendarInput
     ) -> None:
         """Apply field updates to an event.
 
@@ -388,6 +456,13 @@ class CalendarState(ModalityState):
             event.title = input_data.title
         if input_data.description is not None:
             event.description = input_data.description
+        # Start, end and status are sort keys
+        if (
+            input_data.start is not None
+            or input_data.end is not None
+            or input_data.status is not None
+        ):
+            self._sort_indexes.invalidate()
         if input_data.start is not None:
             event.start = input_data.start
         if input_data.end is not None:
@@ -416,7 +491,7 @@ class CalendarState(ModalityState):
             event.recurrence_exceptions.update(input_data.recurrence_exceptions)
 
     def _split_recurring_event(
-        self, event: CalendarEvent, input_data: CalendarInput
+        self, event: CalendarEventRecord, input_data: CalendarInput
     ) -> None:
         """Split recurring event at a date (this_and_future).
 
@@ -434,7 +509,7 @@ class CalendarState(ModalityState):
             event.recurrence.end_date = split_date - timedelta(days=1)
 
         new_event_id = str(uuid4())
-        new_event = CalendarEvent(
+        new_event = CalendarEventRecord(
             event_id=new_event_id,
             calendar_id=event.calendar_id,
             title=input_data.title or event.title,
@@ -462,7 +537,7 @@ class CalendarState(ModalityState):
         self.calendars[event.calendar_id].event_ids.add(new_event_id)
 
     def _create_modified_occurrence(
-        self, parent_event: CalendarEvent, input_data: CalendarInput
+        self, parent_event: CalendarEventRecord, input_data: CalendarInput
     ) -> None:
         """Create a modified occurrence of a recurring event.
 
@@ -476,7 +551,7 @@ class CalendarState(ModalityState):
         parent_event.recurrence_exceptions.add(input_data.recurrence_id)
 
         modified_event_id = str(uuid4())
-        modified_event = CalendarEvent(
+        modified_event = CalendarEventRecord(
             event_id=modified_event_id,
             calendar_id=parent_event.calendar_id,
             title=input_data.title or parent_event.title,
@@ -598,12 +673,22 @@ class CalendarState(ModalityState):
                 - offset: Number of results to skip (for pagination).
                 - sort_by: Field to sort by ("start", "end", "status").
                 - sort_order: Sort order ("asc" or "desc").
+                - fields: Only include these CalendarEvent fields in each
+                  result (results become dicts instead of records).
+                - cursor: next_cursor from a previous page, to resume after
+                  it (not supported together with expand_recurring).
 
         Returns:
             Dictionary with matching events containing:
-                - events: List of CalendarEvent objects matching the query.
+                - events: List of CalendarEventRecord objects matching the query.
                 - count: Number of events returned (after pagination).
-                - total_count: Total number of events matching query (before pagination).
+                - total_count: Total number of events matching query (before pagination),
+                  or None for cursor pages.
+                - next_cursor: Cursor for the next page, or None on the last page.
+
+        Raises:
+            ValueError: If the cursor is invalid or combined with offset or
+                expand_recurring.
         """
         calendar_ids = query_params.get("calendar_ids")
         start_date = query_params.get("start")
@@ -618,51 +703,107 @@ class CalendarState(ModalityState):
         sort_by = query_params.get("sort_by", "start")
         sort_order = query_params.get("sort_order", "asc")
 
-        matching_events = []
-
-        for event in self.events.values():
-            if not self._event_matches_filters(
-                event,
-                calendar_ids,
-                status_filter,
-                has_attendees_filter,
-                recurring_filter,
-                search_text,
-            ):
-                continue
-
-            if expand_recurring and event.is_recurring() and start_date and end_date:
-                occurrences = self._expand_recurrence(event, start_date, end_date)
-                matching_events.extend(occurrences)
-            else:
-                if self._event_in_date_range(event, start_date, end_date):
-                    matching_events.append(event)
-
-        # Sort events
-        if sort_by in ["start", "end", "status"]:
-            matching_events.sort(
-                key=lambda e: getattr(e, sort_by),
-                reverse=(sort_order == "desc")
+        cursor = query_params.get("cursor")
+        expanding = bool(expand_recurring and start_date and end_date)
+
+        if sort_by in _CALENDAR_SORT_FIELDS:
+            sort_key = attrgetter(sort_by)
+            descending = sort_order == "desc"
+            sort = f"{sort_by}:{sort_order}"
+        else:
+            sort_key = unsorted_key
+            descending = False
+            sort = "none"
+
+        if cursor is not None:
+            # Expanded occurrences are generated per query and are not indexed
+            if expanding:
+                raise ValueError("cursor cannot be combined with expand_recurring")
+            if offset:
+                raise ValueError("offset cannot be combined with cursor")
+            after = decode_cursor(cursor, sort)
+            index = self._sort_indexes.get(sort, descending, self.events, sort_key)
+            candidates = (
+                self.events[event_id]
+                for event_id in index.iter_ids(after)
+                if event_id in self.events
+            )
+            matching_events, has_more = collect_page(
+                candidates,
+                lambda batch: [
+                    event
+                    for event in batch
+                    if self._event_matches_filters(
+                        event,
+                        calendar_ids,
+                        status_filter,
+                        has_attendees_filter,
+                        recurring_filter,
+                        search_text,
+                    )
+                    and self._event_in_date_range(event, start_date, end_date)
+                ],
+                limit or None,
+            )
+            total_count = None
+        else:
+            matching_events = []
+
+            for event in self.events.values():
+                if not self._event_matches_filters(
+                    event,
+                    calendar_ids,
+                    status_filter,
+                    has_attendees_filter,
+                    recurring_filter,
+                    search_text,
+                ):
+                    continue
+
+                if expand_recurring and event.is_recurring() and start_date and end_date:
+                    occurrences = self._expand_recurrence(event, start_date, end_date)
+                    matching_events.extend(occurrences)
+                else:
+                    if self._event_in_date_range(event, start_date, end_date):
+                        matching_events.append(event)
+
+            # Sort events
+            if sort_by in _CALENDAR_SORT_FIELDS:
+                matching_events.sort(key=sort_key, reverse=descending)
+
+            # Store total count before pagination
+            total_count = len(matching_events)
+
+            # Apply pagination
+            if offset:
+                matching_events = matching_events[offset:]
+            if limit:
+                matching_events = matching_events[:limit]
+            has_more = (
+                not expanding
+                and bool(limit)
+                and offset + len(matching_events) < total_count
             )
 
-        # Store total count before pagination
-        total_count = len(matching_events)
+        next_cursor = None
+        if has_more and matching_events:
+            last = matching_events[-1]
+            next_cursor = encode_cursor(sort_key(last), last.event_id, sort)
 
-        # Apply pagination
-        if offset:
-            matching_events = matching_events[offset:]
-        if limit:
-            matching_events = matching_events[:limit]
+        fields = query_params.get("fields")
+        if fields is not None:
+            matching_events = [project(event, fields) for event in matching_events]
 
         return {
             "events": matching_events,
             "count": len(matching_events),
             "total_count": total_count,
+            "next_cursor": next_cursor,
         }
 
     def _event_matches_filters(
         self,
-        event: CalendarEvent,
+        event: CalendarEventRecord,
         calendar_ids: Optional[list[str]],
         status_filter: Optional[str],
         has_attendees_filter: Optional[bool],
@@ -711,7 +852,7 @@ class CalendarState(ModalityState):
 
     def _event_in_date_range(
         self,
-        event: CalendarEvent,
+        event: CalendarEventRecord,
         start_date: Optional[datetime],
         end_date: Optional[datetime],
     ) -> bool:
@@ -732,8 +873,8 @@ class CalendarState(ModalityState):
         return True
 
     def _expand_recurrence(
-        self, event: CalendarEvent, start_date: datetime, end_date: datetime
-    ) -> list[CalendarEvent]:
+        self, event: CalendarEventRecord, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEventRecord]:
         """Expand recurring event into individual occurrences.
 
         Args:
@@ -742,7 +883,7 @@ class CalendarState(ModalityState):
             end_date: End of range.
 
         Returns:
-            List of CalendarEvent objects representing occurrences.
+            List of CalendarEventRecord objects representing occurrences.
         """
         if not event.recurrence:
             return []
@@ -772,10 +913,7 @@ class CalendarState(ModalityState):
                 )
 
                 # Create a copy of the event with updated times
-                occurrence = event.model_copy(update={
-                    "start": occurrence_start,
-                    "end": occurrence_end,
-                })
+                occurrence = replace(event, start=occurrence_start, end=occurrence_end)
 
                 occurrences.append(occurrence)
                 count += 1
@@ -788,7 +926,7 @@ class CalendarState(ModalityState):
         return occurrences
 
     def _get_next_occurrence_date(
-        self, event: CalendarEvent, current_date: date
+        self, event: CalendarEventRecord, current_date: date
     ) -> date:
         """Calculate next occurrence date for recurring event.
 
@@ -831,14 +969,14 @@ class CalendarState(ModalityState):
         """
         return self.calendars.get(calendar_id)
 
-    def get_event(self, event_id: str) -> Optional[CalendarEvent]:
+    def get_event(self, event_id: str) -> Optional[CalendarEventRecord]:
         """Get event by ID.
 
         Args:
             event_id: Event identifier.
 
         Returns:
-            CalendarEvent object or None if not found.
+            CalendarEventRecord object or None if not found.
         """
         return self.events.get(event_id)
 
@@ -920,7 +1058,7 @@ class CalendarState(ModalityState):
             )
 
         # Validate input to ensure event_id is set for create operations
-        input_data.validate_input()
+        input_data.ensure_valid()
 
         base_undo: dict[str, Any] = {
             "state_previous_update_count": self.update_count,
@@ -1091,6 +1229,9 @@ class CalendarState(ModalityState):
         if not action:
             raise ValueError("Undo data missing 'action' field")
 
+        if action in _CALENDAR_RESTORING_UNDO_ACTIONS:
+            self._sort_indexes.invalidate()
+
         if action == "noop":
             # Restore state-level metadata only
             self.update_count = undo_data["state_previous_update_count"]
@@ -1135,7 +1276,7 @@ class CalendarState(ModalityState):
                 raise RuntimeError(f"Cannot undo: event '{event_id}' not found")
 
             # Restore the event to its previous state
-            self.events[event_id] = CalendarEvent(**previous_event_data)
+            self.events[event_id] = CalendarEventRecord.model_validate(previous_event_data)
 
             # Restore calendar updated_at
             calendar_id = undo_data.get("calendar_id")
@@ -1160,7 +1301,7 @@ class CalendarState(ModalityState):
                 raise ValueError("Undo data missing 'calendar_id' field")
 
             # Restore the original event
-            self.events[event_id] = CalendarEvent(**previous_event_data)
+            self.events[event_id] = CalendarEventRecord.model_validate(previous_event_data)
 
             # Find and remove the newly created split event
             previous_event_ids = set(undo_data.get("previous_event_ids", []))
@@ -1194,7 +1335,7 @@ class CalendarState(ModalityState):
                 raise ValueError("Undo data missing 'calendar_id' field")
 
             # Restore the parent event (removes the exception date)
-            self.events[event_id] = CalendarEvent(**previous_event_data)
+            self.events[event_id] = CalendarEventRecord.model_validate(previous_event_data)
 
             # Find and remove the modified occurrence
             previous_event_ids = set(undo_data.get("previous_event_ids", []))
@@ -1232,7 +1373,7 @@ class CalendarState(ModalityState):
             # Restore event's previous state
             previous_event_data = undo_data.get("previous_event")
             if previous_event_data:
-                self.events[event_id] = CalendarEvent(**previous_event_data)
+                self.events[event_id] = CalendarEventRecord.model_validate(previous_event_data)
 
             # Restore calendar updated_at
             calendar_id = undo_data.get("calendar_id")
@@ -1257,7 +1398,7 @@ class CalendarState(ModalityState):
                 raise ValueError("Undo data missing 'calendar_id' field")
 
             # Restore the deleted event
-            self.events[event_id] = CalendarEvent(**deleted_event_data)
+            self.events[event_id] = CalendarEventRecord.model_validate(deleted_event_data)
 
             # Add event back to calendar's event_ids
             if calendar_id in self.calendars:
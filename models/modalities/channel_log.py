@@ -0,0 +1,577 @@
+"""Append-only, segmented message log for one team chat channel.
+
+Slack and Discord simulations hold thousands of channels and millions of
+messages, far more than the per-message Pydantic models other messaging
+modalities keep. A ChannelLog stores a channel's messages in columns instead:
+- Messages are numbered by their position in the channel (their sequence
+  number, or seq) and appended in time order.
+- Columns are split into segments of SEGMENT_SIZE messages. A segment holds
+  NumPy arrays of timestamps, author numbers, thread roots and flags, and the
+  UTF-8 text of its messages concatenated in one buffer. Segments grow by
+  doubling, so a quiet channel costs a few hundred bytes.
+- Finding the first message at a time bisects the segments' last timestamps
+  and then searches one segment, so time windows cost O(log n).
+- Filters over a range of messages are evaluated a segment at a time on the
+  columns, not message by message.
+- The rare changes to posted messages (edits, reactions, deletions) are kept
+  beside the columns rather than rewriting them.
+
+Indexes kept as messages are appended:
+- Thread index: root seq -> seqs of its replies.
+- Mention index: user ID -> seqs of the messages mentioning them.
+- Deleted seqs, so counts after a read cursor skip deleted messages.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+import numpy as np
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+# Messages per segment, and the capacity a new segment starts with
+SEGMENT_SIZE = 4096
+_INITIAL_CAPACITY = 16
+
+# Flag bits
+_DELETED = 1
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_micros(timestamp: datetime) -> int:
+    """Convert a datetime to microseconds since the epoch (naive means UTC)."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(micros: int) -> datetime:
+    """Convert microseconds since the epoch to a UTC datetime."""
+    return _EPOCH + timedelta(microseconds=int(micros))
+
+
+class _Segment:
+    """Columns for up to SEGMENT_SIZE consecutive messages."""
+
+    __slots__ = ("length", "times", "authors", "threads", "flags", "text", "text_ends")
+
+    def __init__(self) -> None:
+        self.length = 0
+        self.times = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+        self.authors = np.empty(_INITIAL_CAPACITY, dtype=np.int32)
+        self.threads = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+        self.flags = np.zeros(_INITIAL_CAPACITY, dtype=np.uint8)
+        self.text = bytearray()
+        self.text_ends = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+
+    def grow(self) -> None:
+        """Double the capacity of every column."""
+        capacity = min(len(self.times) * 2, SEGMENT_SIZE)
+        for name in ("times", "authors", "threads", "flags", "text_ends"):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[: self.length] = column[: self.length]
+            setattr(self, name, grown)
+
+    def text_of(self, index: int) -> str:
+        """Return the original text of the message at index."""
+        start = int(self.text_ends[index - 1]) if index else 0
+        return self.text[start : int(self.text_ends[index])].decode("utf-8")
+
+    def __deepcopy__(self, memo: dict) -> "_Segment":
+        copy = _Segment.__new__(_Segment)
+        copy.length = self.length
+        for name in ("times", "authors", "threads", "flags", "text_ends"):
+            setattr(copy, name, getattr(self, name).copy())
+        copy.text = bytearray(self.text)
+        return copy
+
+
+class ChannelLog:
+    """Append-only, segmented, indexed log of one channel's messages.
+
+    Authors and mentioned users are given as string IDs. Messages are
+    addressed by seq, their 0-based position in the log.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty log."""
+        self._segments: list[_Segment] = []
+        # Last timestamp in each segment, for time lookups
+        self._last_times: list[int] = []
+        self._length = 0
+        self._authors: list[str] = []
+        self._author_numbers: dict[str, int] = {}
+        self._threads: dict[int, list[int]] = {}
+        self._mentions: dict[str, list[int]] = {}
+        self._deleted: list[int] = []
+        self._edits: dict[int, tuple[str, datetime]] = {}
+        self._reactions: dict[int, dict[str, list[str]]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of messages, including deleted ones."""
+        return self._length
+
+    @property
+    def last_time(self) -> Optional[datetime]:
+        """Timestamp of the latest message, or None if the log is empty."""
+        return _from_micros(self._last_times[-1]) if self._last_times else None
+
+    def _locate(self, seq: int) -> tuple[_Segment, int]:
+        """Return the segment holding seq and seq's index in it.
+
+        Raises:
+            ValueError: If no message has this seq.
+        """
+        if not 0 <= seq < self._length:
+            raise ValueError(f"Message {seq} not found")
+        return self._segments[seq // SEGMENT_SIZE], seq % SEGMENT_SIZE
+
+    def append(
+        self,
+        author: str,
+        text: str,
+        timestamp: datetime,
+        thread: Optional[int] = None,
+        mentions: Iterable[str] = (),
+    ) -> int:
+        """Append a message.
+
+        Args:
+            author: Author's user ID.
+            text: Message text.
+            timestamp: When the message was posted. Must not be earlier than
+                the latest message.
+            thread: Seq of the thread root, if the message is a reply. A reply
+                to a reply joins the same thread.
+            mentions: IDs of the users the message mentions.
+
+        Returns:
+            The new message's seq.
+
+        Raises:
+            ValueError: If the timestamp is out of order or the thread root
+                does not exist.
+        """
+        micros = _to_micros(timestamp)
+        if self._last_times and micros < self._last_times[-1]:
+            raise ValueError(
+                f"Messages must be appended in time order; {timestamp.isoformat()} "
+                f"is before the latest message at {self.last_time.isoformat()}"
+            )
+        if thread is not None:
+            thread = self.thread_root(thread)
+
+        seq = self._length
+        index = seq % SEGMENT_SIZE
+        if index == 0:
+            self._segments.append(_Segment())
+            self._last_times.append(micros)
+        segment = self._segments[-1]
+        if index == len(segment.times):
+            segment.grow()
+
+        number = self._author_numbers.get(author)
+        if number is None:
+            number = self._author_numbers[author] = len(self._authors)
+            self._authors.append(author)
+
+        segment.times[index] = micros
+        segment.authors[index] = number
+        segment.threads[index] = -1 if thread is None else thread
+        segment.flags[index] = 0
+        segment.text += text.encode("utf-8")
+        segment.text_ends[index] = len(segment.text)
+        segment.length += 1
+        self._last_times[-1] = micros
+        self._length += 1
+
+        if thread is not None:
+            self._threads.setdefault(thread, []).append(seq)
+        for user in set(mentions):
+            self._mentions.setdefault(user, []).append(seq)
+        return seq
+
+    def pop(self, mentions: Iterable[str] = ()) -> None:
+        """Remove the latest message, to undo appending it.
+
+        Args:
+            mentions: The users the message mentions, as given to append().
+
+        Raises:
+            ValueError: If the log is empty.
+        """
+        if not self._length:
+            raise ValueError("Cannot pop from an empty log")
+        seq = self._length - 1
+        segment, index = self._locate(seq)
+
+        thread = int(segment.threads[index])
+        if thread >= 0:
+            replies = self._threads[thread]
+            replies.pop()
+            if not replies:
+                del self._threads[thread]
+        for user in set(mentions):
+            seqs = self._mentions.get(user)
+            if seqs and seqs[-1] == seq:
+                seqs.pop()
+                if not seqs:
+                    del self._mentions[user]
+        if self._deleted and self._deleted[-1] == seq:
+            self._deleted.pop()
+        self._edits.pop(seq, None)
+        self._reactions.pop(seq, None)
+
+        start = int(segment.text_ends[index - 1]) if index else 0
+        del segment.text[start:]
+        segment.length -= 1
+        self._length -= 1
+        if segment.length:
+            self._last_times[-1] = int(segment.times[segment.length - 1])
+        else:
+            self._segments.pop()
+            self._last_times.pop()
+
+    def thread_root(self, seq: int) -> int:
+        """Return the seq of the thread root of a message (itself if a root).
+
+        Raises:
+            ValueError: If no message has this seq.
+        """
+        segment, index = self._locate(seq)
+        root = int(segment.threads[index])
+        return seq if root < 0 else root
+
+    def is_deleted(self, seq: int) -> bool:
+        """Return whether a message is deleted."""
+        segment, index = self._locate(seq)
+        return bool(segment.flags[index] & _DELETED)
+
+    def text(self, seq: int) -> str:
+        """Return the current (possibly edited) text of a message."""
+        edit = self._edits.get(seq)
+        if edit is not None:
+            return edit[0]
+        segment, index = self._locate(seq)
+        return segment.text_of(index)
+
+    def edit(self, seq: int, text: Optional[str], timestamp: Optional[datetime]) -> None:
+        """Replace the text of a message.
+
+        The mention index is not changed; see update_mentions().
+
+        Args:
+            seq: Message to edit.
+            text: New text, or None to restore the text it was posted with.
+            timestamp: When the message was edited (None with text=None).
+        """
+        self._locate(seq)
+        if text is None:
+            self._edits.pop(seq, None)
+        else:
+            self._edits[seq] = (text, timestamp)
+
+    def update_mentions(self, seq: int, old: Iterable[str], new: Iterable[str]) -> None:
+        """Move a message's entries in the mention index after an edit.
+
+        Deleted messages are not in the mention index and are left out.
+
+        Args:
+            seq: Edited message.
+            old: Users the previous text mentions.
+            new: Users the new text mentions.
+        """
+        if not self.is_deleted(seq):
+            self._unindex_mentions(seq, old)
+            self._index_mentions(seq, new)
+
+    def edited_at(self, seq: int) -> Optional[datetime]:
+        """Return when a message was last edited, or None."""
+        edit = self._edits.get(seq)
+        return edit[1] if edit is not None else None
+
+    def set_deleted(self, seq: int, deleted: bool, mentions: Iterable[str] = ()) -> None:
+        """Delete or restore a message.
+
+        Deleted messages keep their seq and thread replies, but leave the
+        mention index and are skipped by default when selecting messages.
+
+        Args:
+            seq: Message to delete or restore.
+            deleted: True to delete, False to restore.
+            mentions: Users the message's current text mentions.
+        """
+        segment, index = self._locate(seq)
+        if bool(segment.flags[index] & _DELETED) == deleted:
+            return
+        if deleted:
+            segment.flags[index] |= _DELETED
+            insort(self._deleted, seq)
+            self._unindex_mentions(seq, mentions)
+        else:
+            segment.flags[index] &= ~np.uint8(_DELETED)
+            self._deleted.pop(bisect_left(self._deleted, seq))
+            self._index_mentions(seq, mentions)
+
+    def _index_mentions(self, seq: int, mentions: Iterable[str]) -> None:
+        """Add seq to the mention index of each user."""
+        for user in set(mentions):
+            insort(self._mentions.setdefault(user, []), seq)
+
+    def _unindex_mentions(self, seq: int, mentions: Iterable[str]) -> None:
+        """Remove seq from the mention index of each user."""
+        for user in set(mentions):
+            seqs = self._mentions.get(user, [])
+            position = bisect_left(seqs, seq)
+            if position < len(seqs) and seqs[position] == seq:
+                seqs.pop(position)
+                if not seqs:
+                    del self._mentions[user]
+
+    def reactions(self, seq: int) -> dict[str, list[str]]:
+        """Return a copy of a message's reactions: emoji -> user IDs."""
+        self._locate(seq)
+        return {emoji: list(users) for emoji, users in self._reactions.get(seq, {}).items()}
+
+    def set_reactions(self, seq: int, reactions: dict[str, list[str]]) -> None:
+        """Replace a message's reactions (emoji -> user IDs)."""
+        self._locate(seq)
+        reactions = {emoji: list(users) for emoji, users in reactions.items() if users}
+        if reactions:
+            self._reactions[seq] = reactions
+        else:
+            self._reactions.pop(seq, None)
+
+    def replies(self, root: int) -> list[int]:
+        """Return the seqs of a thread's replies, oldest first."""
+        return list(self._threads.get(root, ()))
+
+    def mentions(self, user: str, after: int = -1) -> list[int]:
+        """Return the seqs of messages mentioning a user, after a seq.
+
+        Deleted messages are not included.
+        """
+        seqs = self._mentions.get(user, [])
+        return seqs[bisect_right(seqs, after) :]
+
+    def count_after(self, seq: int) -> int:
+        """Return the number of messages after seq, not counting deleted ones."""
+        after = max(self._length - seq - 1, 0)
+        return after - (len(self._deleted) - bisect_right(self._deleted, seq))
+
+    def seq_at(self, timestamp: datetime) -> int:
+        """Return the seq of the first message at or after a time.
+
+        Returns:
+            The seq, or len(self) if every message is earlier.
+        """
+        micros = _to_micros(timestamp)
+        position = bisect_left(self._last_times, micros)
+        if position == len(self._segments):
+            return self._length
+        segment = self._segments[position]
+        index = np.searchsorted(segment.times[: segment.length], micros, side="left")
+        return position * SEGMENT_SIZE + int(index)
+
+    def select(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None,
+        reverse: bool = False,
+        limit: Optional[int] = None,
+        author: Optional[str] = None,
+        top_level: bool = False,
+        include_deleted: bool = False,
+        search: Optional[str] = None,
+    ) -> list[int]:
+        """Select messages in a seq range that match filters.
+
+        Column filters are evaluated a segment at a time, and scanning stops
+        as soon as limit messages are found.
+
+        Args:
+            start: First seq of the range.
+            stop: Seq after the last of the range (default: end of the log).
+            reverse: Whether to return the newest messages first.
+            limit: Maximum number of seqs to return.
+            author: Only messages by this user ID.
+            top_level: Only messages that are not thread replies.
+            include_deleted: Whether to include deleted messages.
+            search: Only messages whose text contains this (case-insensitive).
+
+        Returns:
+            Matching seqs, in the requested order.
+        """
+        stop = self._length if stop is None else min(stop, self._length)
+        start = max(start, 0)
+        if start >= stop or limit == 0:
+            return []
+        number = None
+        if author is not None:
+            number = self._author_numbers.get(author)
+            if number is None:
+                return []
+        needle = search.casefold() if search else None
+
+        first, last = start // SEGMENT_SIZE, (stop - 1) // SEGMENT_SIZE
+        positions = range(last, first - 1, -1) if reverse else range(first, last + 1)
+        selected: list[int] = []
+        for position in positions:
+            segment = self._segments[position]
+            base = position * SEGMENT_SIZE
+            low = max(start - base, 0)
+            high = min(stop - base, segment.length)
+            mask = np.ones(high - low, dtype=bool)
+            if number is not None:
+                mask &= segment.authors[low:high] == number
+            if top_level:
+                mask &= segment.threads[low:high] < 0
+            if not include_deleted:
+                mask &= (segment.flags[low:high] & _DELETED) == 0
+            seqs = (np.flatnonzero(mask) + (base + low)).tolist()
+            if reverse:
+                seqs.reverse()
+            if needle is not None:
+                seqs = [seq for seq in seqs if needle in self.text(seq).casefold()]
+            selected.extend(seqs)
+            if limit is not None and len(selected) >= limit:
+                return selected[:limit]
+        return selected
+
+    def message(self, seq: int) -> dict[str, Any]:
+        """Return a message as a dictionary.
+
+        Returns:
+            Dictionary with seq, author, text, timestamp, thread_seq (the
+            root, for replies), reply_count and latest_reply (for roots with
+            replies), edited_at, deleted and reactions.
+        """
+        segment, index = self._locate(seq)
+        thread = int(segment.threads[index])
+        result: dict[str, Any] = {
+            "seq": seq,
+            "author": self._authors[int(segment.authors[index])],
+            "text": self.text(seq),
+            "timestamp": _from_micros(int(segment.times[index])).isoformat(),
+            "thread_seq": thread if thread >= 0 else None,
+        }
+        replies = self._threads.get(seq)
+        if replies:
+            result["reply_count"] = len(replies)
+            result["latest_reply"] = self.timestamp(replies[-1]).isoformat()
+        edited_at = self.edited_at(seq)
+        result["edited_at"] = edited_at.isoformat() if edited_at else None
+        result["deleted"] = bool(segment.flags[index] & _DELETED)
+        result["reactions"] = self.reactions(seq)
+        return result
+
+    def timestamp(self, seq: int) -> datetime:
+        """Return when a message was posted."""
+        segment, index = self._locate(seq)
+        return _from_micros(int(segment.times[index]))
+
+    def author(self, seq: int) -> str:
+        """Return the user ID of a message's author."""
+        segment, index = self._locate(seq)
+        return self._authors[int(segment.authors[index])]
+
+    def validate(self) -> list[str]:
+        """Check that columns and indexes agree.
+
+        Returns:
+            List of problems found (empty if consistent).
+        """
+        errors = []
+        if sum(segment.length for segment in self._segments) != self._length:
+            errors.append("Segment lengths do not add up to the log length")
+        previous = None
+        for position, segment in enumerate(self._segments):
+            times = segment.times[: segment.length]
+            if len(times) and (np.any(np.diff(times) < 0) or (
+                previous is not None and times[0] < previous
+            )):
+                errors.append(f"Segment {position} is not in time order")
+            if len(times):
+                previous = times[-1]
+        for root, replies in self._threads.items():
+            if any(self.thread_root(reply) != root for reply in replies):
+                errors.append(f"Thread index of message {root} is inconsistent")
+        return errors
+
+    def to_list(self, mentions: Optional[dict[int, list[str]]] = None) -> list[dict[str, Any]]:
+        """Return every message as a dictionary, oldest first.
+
+        Messages also carry their original text and mentioned users, so
+        from_list() can rebuild the log including its indexes.
+        """
+        if mentions is None:
+            mentions = {}
+            for user, seqs in self._mentions.items():
+                for seq in seqs:
+                    mentions.setdefault(seq, []).append(user)
+        messages = []
+        for seq in range(self._length):
+            message = self.message(seq)
+            segment, index = self._locate(seq)
+            message["original_text"] = segment.text_of(index)
+            message["mentions"] = sorted(mentions.get(seq, []))
+            messages.append(message)
+        return messages
+
+    @classmethod
+    def from_list(cls, messages: list[dict[str, Any]]) -> "ChannelLog":
+        """Rebuild a log from the dictionaries to_list() returns."""
+        log = cls()
+        for message in messages:
+            seq = log.append(
+                author=message["author"],
+                text=message.get("original_text", message["text"]),
+                timestamp=datetime.fromisoformat(message["timestamp"]),
+                thread=message.get("thread_seq"),
+            )
+            mentions = message.get("mentions", [])
+            if message.get("edited_at"):
+                log._edits[seq] = (
+                    message["text"],
+                    datetime.fromisoformat(message["edited_at"]),
+                )
+            log.set_reactions(seq, message.get("reactions") or {})
+            if message.get("deleted"):
+                log.set_deleted(seq, True)
+            else:
+                log._index_mentions(seq, mentions)
+        return log
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ChannelLog) and other.to_list() == self.to_list()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ChannelLog(messages={self._length}, segments={len(self._segments)})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Let models hold ChannelLog fields.
+
+        The field accepts a ChannelLog or the list of message dictionaries
+        to_list() returns, and dumps as that list.
+        """
+        from_list = core_schema.chain_schema(
+            [
+                core_schema.list_schema(core_schema.dict_schema()),
+                core_schema.no_info_plain_validator_function(cls.from_list),
+            ]
+        )
+        return core_schema.union_schema(
+            [core_schema.is_instance_schema(cls), from_list],
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda log: log.to_list()
+            ),
+        )
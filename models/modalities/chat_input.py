@@ -33,7 +33,7 @@ class ChatInput(ModalityInput):
         metadata: Optional dictionary for additional data (token count, model info, etc.).
     """
 
-    modality_type: str = Field(default="chat", frozen=True)
+    modality_type: Literal["chat"] = Field(default="chat", frozen=True)
     operation: ChatOperation = Field(
         default="send_message",
         description="Type of chat operation to perform",
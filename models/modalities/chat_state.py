@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union
 
 from pydantic import BaseModel, Field
 
 from models.base_input import ModalityInput
 from models.base_state import ModalityState
+from models.projection import project
+from models.records import Record
 
 if TYPE_CHECKING:
     from models.modalities.chat_input import ChatInput
@@ -53,6 +56,22 @@ class ChatMessage(BaseModel):
         return result
 
 
+@dataclass(slots=True, kw_only=True)
+class ChatMessageRecord(Record):
+    """Compact form of ChatMessage held in ChatState.messages."""
+
+    model: ClassVar[type[BaseModel]] = ChatMessage
+
+    message_id: str
+    conversation_id: str
+    role: str
+    content: Union[str, list[dict]]
+    timestamp: datetime
+    metadata: dict = field(default_factory=dict)
+
+    to_dict = ChatMessage.to_dict
+
+
 class ConversationMetadata(BaseModel):
     """Metadata for a conversation.
 
@@ -97,14 +116,14 @@ class ChatState(ModalityState):
         modality_type: Always "chat" for this state type.
         last_updated: When state was last modified.
         update_count: Number of messages added.
-        messages: List of ChatMessage objects (ordered by timestamp).
+        messages: List of ChatMessageRecord objects (ordered by timestamp).
         conversations: Dict mapping conversation_id to ConversationMetadata.
         max_history_size: Maximum messages to retain per conversation.
         default_conversation_id: ID for default conversation.
     """
 
     modality_type: str = Field(default="chat", frozen=True)
-    messages: list[ChatMessage] = Field(
+    messages: list[ChatMessageRecord] = Field(
         default_factory=list, description="List of all messages (ordered by timestamp)"
     )
     conversations: dict[str, ConversationMetadata] = Field(
@@ -140,7 +159,7 @@ class ChatState(ModalityState):
                 f"ChatState can only apply ChatInput, got {type(input_data)}"
             )
 
-        input_data.validate_input()
+        input_data.ensure_valid()
 
         operation_handlers = {
             "send_message": self._handle_send_message,
@@ -173,7 +192,7 @@ class ChatState(ModalityState):
                 participant_roles=set(),
             )
 
-        message = ChatMessage(
+        message = ChatMessageRecord(
             message_id=input_data.message_id,
             conversation_id=conversation_id,
             role=input_data.role,
@@ -329,6 +348,7 @@ class ChatState(ModalityState):
             - search: str - Search for text in message content
             - sort_by: str - Field to sort by ("timestamp", "role", "conversation_id")
             - sort_order: str - Sort order ("asc" or "desc")
+            - fields: list[str] - Only include these ChatMessage fields in each result
 
         Args:
             query_params: Dictionary of query parameters.
@@ -391,13 +411,19 @@ class ChatState(ModalityState):
         if limit:
             filtered_messages = filtered_messages[:limit]
 
+        fields = query_params.get("fields")
+        if fields is not None:
+            messages = [project(msg, fields) for msg in filtered_messages]
+        else:
+            messages = [msg.to_dict() for msg in filtered_messages]
+
         return {
-            "messages": [msg.to_dict() for msg in filtered_messages],
+            "messages": messages,
             "count": len(filtered_messages),
             "total_count": total_count,
         }
 
-    def _message_contains_text(self, message: ChatMessage, search_text: str) -> bool:
+    def _message_contains_text(self, message: ChatMessageRecord, search_text: str) -> bool:
         """Check if a message contains the search text.
 
         Args:
@@ -489,7 +515,7 @@ class ChatState(ModalityState):
             )
 
         # Ensure input is validated (auto-generates message_id for send_message)
-        input_data.validate_input()
+        input_data.ensure_valid()
 
         base_undo: dict[str, Any] = {
             "state_previous_update_count": self.update_count,
@@ -673,7 +699,7 @@ class ChatState(ModalityState):
             # Restore any message that was removed due to capacity limit
             if "removed_message" in undo_data:
                 removed = undo_data["removed_message"]
-                restored_message = ChatMessage(
+                restored_message = ChatMessageRecord(
                     message_id=removed["message_id"],
                     conversation_id=removed["conversation_id"],
                     role=removed["role"],
@@ -690,7 +716,7 @@ class ChatState(ModalityState):
             if not message_data:
                 raise ValueError("Undo data missing 'message' field")
 
-            restored_message = ChatMessage(
+            restored_message = ChatMessageRecord(
                 message_id=message_data["message_id"],
                 conversation_id=message_data["conversation_id"],
                 role=message_data["role"],
@@ -720,7 +746,7 @@ class ChatState(ModalityState):
             # Restore all cleared messages
             cleared_messages = undo_data.get("cleared_messages", [])
             for msg_data in cleared_messages:
-                restored_message = ChatMessage(
+                restored_message = ChatMessageRecord(
                     message_id=msg_data["message_id"],
                     conversation_id=msg_data["conversation_id"],
                     role=msg_data["role"],
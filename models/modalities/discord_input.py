@@ -1,17 +1,30 @@
 """Discord input model."""
 
-from models.base_input import ModalityInput
+from typing import Literal, Optional
 
+from pydantic import Field
 
-class DiscordInput(ModalityInput):
+from models.modalities.team_chat import TeamChatInput
+
+
+class DiscordInput(TeamChatInput):
     """Input for Discord events.
 
+    See TeamChatInput for the operations and their fields. Mentions are
+    written "<@123>" or "<@!123>" (or "@name") in message text; @everyone and
+    @here are not user mentions.
+
     Args:
-        server_id: Discord server ID.
-        channel_id: Discord channel ID.
-        message_content: Message content (for new messages).
-        author: Message author information.
-        event_type: Type of event (message, reaction, etc.).
+        modality_type: Always "discord" for this input type.
+        timestamp: When the event occurred (simulator time).
+        input_id: Unique input identifier (auto-generated).
+        server_id: Discord server ID of a channel being created.
     """
 
-    pass
+    modality_type: Literal["discord"] = Field(default="discord", frozen=True)
+    server_id: Optional[str] = Field(default=None, description="Discord server ID")
+
+    @property
+    def space_id(self) -> Optional[str]:
+        """ID of the server a created channel belongs to."""
+        return self.server_id
@@ -1,16 +1,29 @@
 """Discord state model."""
 
-from models.base_state import ModalityState
+from typing import ClassVar
 
+from pydantic import Field
 
-class DiscordState(ModalityState):
+from models.modalities.discord_input import DiscordInput
+from models.modalities.team_chat import TeamChatState
+
+
+class DiscordState(TeamChatState):
     """Current Discord state.
 
+    Channels keep their messages in append-only ChannelLogs with thread and
+    mention indexes; see TeamChatState for queries and read tracking.
+
     Args:
-        servers: Dictionary mapping server IDs to server information.
-        channels: Dictionary mapping channel IDs to channel information.
-        message_history: Dictionary mapping channel IDs to message lists.
+        modality_type: Always "discord" for this state type.
+        last_updated: When state was last modified.
+        update_count: Number of operations applied.
+        user_id: Discord user ID of the simulated user.
+        channels: Dictionary mapping channel IDs to channels and their logs.
         users: Dictionary mapping user IDs to user information.
     """
 
-    pass
+    space_label: ClassVar[str] = "server"
+    input_class: ClassVar[type[DiscordInput]] = DiscordInput
+
+    modality_type: str = Field(default="discord", frozen=True)
@@ -110,7 +110,7 @@ class EmailInput(ModalityInput):
         is_draft: Whether this is a draft email.
     """
 
-    modality_type: str = Field(default="email", frozen=True)
+    modality_type: Literal["email"] = Field(default="email", frozen=True)
     operation: EmailOperation = Field(description="Type of email operation")
     message_id: Optional[str] = Field(
         default=None, description="Message ID (auto-generated if new)"
@@ -1,13 +1,25 @@
 """Email state model."""
 
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
+from operator import attrgetter
+from typing import Any, ClassVar, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from models.base_input import ModalityInput
 from models.base_state import ModalityState
+from models.pagination import (
+    SortedIndexCache,
+    collect_page,
+    decode_cursor,
+    encode_cursor,
+    unsorted_key,
+)
+from models.projection import project
+from models.records import Record
 
 
 class Email(BaseModel):
@@ -96,6 +108,41 @@ class Email(BaseModel):
         self.folder = folder
 
 
+@dataclass(slots=True, kw_only=True)
+class EmailRecord(Record):
+    """Compact form of Email held in EmailState.emails and EmailState.drafts."""
+
+    model: ClassVar[type[BaseModel]] = Email
+
+    message_id: str
+    thread_id: str
+    from_address: str
+    to_addresses: list[str]
+    cc_addresses: list[str] = field(default_factory=list)
+    bcc_addresses: list[str] = field(default_factory=list)
+    reply_to_address: Optional[str] = None
+    subject: str
+    body_text: str
+    body_html: Optional[str] = None
+    attachments: list = field(default_factory=list)
+    in_reply_to: Optional[str] = None
+    references: list[str] = field(default_factory=list)
+    sent_at: datetime
+    received_at: datetime
+    is_read: bool = False
+    is_starred: bool = False
+    priority: str = "normal"
+    folder: str = "inbox"
+    labels: list[str] = field(default_factory=list)
+
+    mark_read = Email.mark_read
+    mark_unread = Email.mark_unread
+    toggle_star = Email.toggle_star
+    add_label = Email.add_label
+    remove_label = Email.remove_label
+    move_to_folder = Email.move_to_folder
+
+
 class EmailThread(BaseModel):
     """Represents a conversation thread grouping related emails.
 
@@ -177,11 +224,13 @@ class EmailSummary(BaseModel):
     body_preview: str = Field(description="First ~100 chars of body text")
 
     @classmethod
-    def from_email(cls, email: "Email", preview_length: int = 100) -> "EmailSummary":
+    def from_email(
+        cls, email: "Email | EmailRecord", preview_length: int = 100
+    ) -> "EmailSummary":
         """Create an EmailSummary from a full Email object.
 
         Args:
-            email: The full Email object to summarize.
+            email: The full Email object (or its record) to summarize.
             preview_length: Maximum length of body preview (default 100).
 
         Returns:
@@ -208,6 +257,19 @@ class EmailSummary(BaseModel):
         )
 
 
+# Sort keys supported by EmailState.query(), by sort_by name
+_EMAIL_SORT_KEYS: dict[str, Callable[[EmailRecord], Any]] = {
+    "date": attrgetter("received_at"),
+    "from": attrgetter("from_address"),
+    "subject": attrgetter("subject"),
+}
+
+# Operations that store a new email under input_data.message_id if it is set
+_EMAIL_CREATING_OPERATIONS = frozenset(
+    {"receive", "send", "reply", "reply_all", "forward", "save_draft"}
+)
+
+
 class EmailState(ModalityState):
     """Current email system state.
 
@@ -226,7 +288,7 @@ class EmailState(ModalityState):
     """
 
     modality_type: str = Field(default="email", frozen=True)
-    emails: dict[str, Email] = Field(
+    emails: dict[str, EmailRecord] = Field(
         default_factory=dict, description="All emails indexed by message_id"
     )
     threads: dict[str, EmailThread] = Field(
@@ -238,12 +300,13 @@ class EmailState(ModalityState):
     labels: dict[str, list[str]] = Field(
         default_factory=dict, description="Label to message_ids mapping"
     )
-    drafts: dict[str, Email] = Field(
+    drafts: dict[str, EmailRecord] = Field(
         default_factory=dict, description="Draft emails indexed by message_id"
     )
     user_email_address: str = Field(
         default="user@example.com", description="User's email address"
     )
+    _sort_indexes: SortedIndexCache = PrivateAttr(default_factory=SortedIndexCache)
 
     class Config:
         """Pydantic configuration."""
@@ -279,7 +342,13 @@ class EmailState(ModalityState):
                 f"EmailState can only apply EmailInput, got {type(input_data)}"
             )
 
-        input_data.validate_input()
+        input_data.ensure_valid()
+        # Sort keys never change otherwise; re-using an ID replaces the email
+        if (
+            input_data.operation in _EMAIL_CREATING_OPERATIONS
+            and input_data.message_id in self.emails
+        ):
+            self._sort_indexes.invalidate()
 
         operation_handlers = {
             "receive": self._handle_receive,
@@ -319,7 +388,7 @@ class EmailState(ModalityState):
         message_id = input_data.message_id or str(uuid4())
         thread_id = input_data.thread_id or f"thread-{message_id}"
 
-        email = Email(
+        email = EmailRecord(
             message_id=message_id,
             thread_id=thread_id,
             from_address=input_data.from_address,
@@ -357,7 +426,7 @@ class EmailState(ModalityState):
         message_id = input_data.message_id or str(uuid4())
         thread_id = input_data.thread_id or f"thread-{message_id}"
 
-        email = Email(
+        email = EmailRecord(
             message_id=message_id,
             thread_id=thread_id,
             from_address=input_data.from_address,
@@ -401,7 +470,7 @@ class EmailState(ModalityState):
 
         message_id = input_data.message_id or str(uuid4())
 
-        email = Email(
+        email = EmailRecord(
             message_id=message_id,
             thread_id=thread_id,
             from_address=input_data.from_address,
@@ -447,7 +516,7 @@ class EmailState(ModalityState):
         message_id = input_data.message_id or str(uuid4())
         thread_id = f"thread-{message_id}"
 
-        email = Email(
+        email = EmailRecord(
             message_id=message_id,
             thread_id=thread_id,
             from_address=input_data.from_address,
@@ -481,7 +550,7 @@ class EmailState(ModalityState):
         message_id = input_data.message_id or str(uuid4())
         thread_id = input_data.thread_id or f"thread-{message_id}"
 
-        email = Email(
+        email = EmailRecord(
             message_id=message_id,
             thread_id=thread_id,
             from_address=input_data.from_address,
@@ -709,7 +778,7 @@ class EmailState(ModalityState):
             return [input_data.message_id]
         return []
 
-    def _create_thread(self, email: Email) -> None:
+    def _create_thread(self, email: EmailRecord) -> None:
         """Create a new thread from an email.
 
         Args:
@@ -730,7 +799,7 @@ class EmailState(ModalityState):
 
         self.threads[email.thread_id] = thread
 
-    def _add_to_thread(self, email: Email, thread_id: str) -> None:
+    def _add_to_thread(self, email: EmailRecord, thread_id: str) -> None:
         """Add an email to an existing thread.
 
         Args:
@@ -926,14 +995,110 @@ class EmailState(ModalityState):
     def query(self, query_params: dict[str, Any]) -> dict[str, Any]:
         """Execute a query against email state.
 
+        If query_params contains "fields", each result only includes those
+        Email fields; the rest are never serialized.
+
+        Pass a previous result's "next_cursor" as query_params["cursor"] to
+        fetch the following page without re-sorting every email.
+
         Args:
             query_params: Dictionary of query parameters.
 
         Returns:
             Dictionary containing query results.
         """
-        results = list(self.emails.values())
+        results, total_count, next_cursor = self.select_emails(query_params)
+        fields = query_params.get("fields")
+
+        return {
+            "emails": [project(e, fields) for e in results],
+            "total_count": total_count,
+            "returned_count": len(results),
+            "next_cursor": next_cursor,
+            "query": query_params,
+        }
+
+    def select_emails(
+        self, query_params: dict[str, Any]
+    ) -> tuple[list[EmailRecord], int | None, str | None]:
+        """Filter, sort, and paginate emails without serializing them.
+
+        This is the selection step behind query(). Streaming endpoints use it
+        directly so matching emails can be encoded one at a time instead of
+        being dumped into a list of dicts first.
+
+        If query_params contains a "cursor" (a previous page's next_cursor),
+        the page is read from a sorted index starting right after the cursor
+        position instead of filtering and sorting every email, and the total
+        match count is not computed.
+
+        Args:
+            query_params: Dictionary of query parameters (see query()).
+
+        Returns:
+            Tuple of (page of matching EmailRecord objects, total match count or
+            None for cursor pages, cursor for the next page or None if there
+            are no more matches).
+
+        Raises:
+            ValueError: If the cursor is invalid or combined with an offset.
+        """
+        sort_by = query_params.get("sort_by", "date")
+        sort_order = query_params.get("sort_order", "desc")
+        sort_key = _EMAIL_SORT_KEYS.get(sort_by, unsorted_key)
+        descending = sort_by in _EMAIL_SORT_KEYS and sort_order == "desc"
+        sort = f"{sort_by}:{sort_order}" if sort_by in _EMAIL_SORT_KEYS else "none"
+
+        offset = query_params.get("offset", 0)
+        limit = query_params.get("limit")
+        cursor = query_params.get("cursor")
+
+        if cursor is not None:
+            if offset:
+                raise ValueError("offset cannot be combined with cursor")
+            after = decode_cursor(cursor, sort)
+            index = self._sort_indexes.get(sort, descending, self.emails, sort_key)
+            candidates = (
+                self.emails[message_id]
+                for message_id in index.iter_ids(after)
+                if message_id in self.emails
+            )
+            results, has_more = collect_page(
+                candidates, lambda batch: self._filter_emails(batch, query_params), limit
+            )
+            total_count = None
+        else:
+            results = self._filter_emails(list(self.emails.values()), query_params)
+            if sort_by in _EMAIL_SORT_KEYS:
+                results.sort(key=sort_key, reverse=descending)
+
+            total_count = len(results)
+
+            if limit is not None:
+                results = results[offset : offset + limit]
+            elif offset > 0:
+                results = results[offset:]
+            has_more = limit is not None and offset + len(results) < total_count
+
+        next_cursor = None
+        if has_more and results:
+            last = results[-1]
+            next_cursor = encode_cursor(sort_key(last), last.message_id, sort)
 
+        return results, total_count, next_cursor
+
+    def _filter_emails(
+        self, results: list[EmailRecord], query_params: dict[str, Any]
+    ) -> list[EmailRecord]:
+        """Apply query filters to a list of emails, preserving its order.
+
+        Args:
+            results: Emails to filter.
+            query_params: Dictionary of query parameters (see query()).
+
+        Returns:
+            The emails that match every filter.
+        """
         if query_params.get("folder") is not None:
             folder = query_params["folder"]
             if folder in self.folders:
@@ -1021,32 +1186,7 @@ class EmailState(ModalityState):
             thread_id = query_params["thread_id"]
             results = [e for e in results if e.thread_id == thread_id]
 
-        sort_by = query_params.get("sort_by", "date")
-        sort_order = query_params.get("sort_order", "desc")
-
-        if sort_by == "date":
-            results.sort(key=lambda e: e.received_at, reverse=(sort_order == "desc"))
-        elif sort_by == "from":
-            results.sort(key=lambda e: e.from_address, reverse=(sort_order == "desc"))
-        elif sort_by == "subject":
-            results.sort(key=lambda e: e.subject, reverse=(sort_order == "desc"))
-
-        total_count = len(results)
-
-        offset = query_params.get("offset", 0)
-        limit = query_params.get("limit")
-
-        if limit is not None:
-            results = results[offset : offset + limit]
-        elif offset > 0:
-            results = results[offset:]
-
-        return {
-            "emails": [e.model_dump() for e in results],
-            "total_count": total_count,
-            "returned_count": len(results),
-            "query": query_params,
-        }
+        return results
 
     def clear(self) -> None:
         """Reset email state to empty defaults.
@@ -1087,7 +1227,7 @@ class EmailState(ModalityState):
             )
 
         # Ensure input is validated (auto-generates message_id for add operations)
-        input_data.validate_input()
+        input_data.ensure_valid()
 
         # Common state-level metadata
         base_undo = {
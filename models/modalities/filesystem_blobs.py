@@ -0,0 +1,306 @@
+"""Content-addressed blob storage for file contents.
+
+File contents never live in the filesystem state itself. Each file is split
+into chunks at content-defined boundaries, and every chunk is stored once in
+a BlobStore, keyed by its SHA-256 digest. A file is then just its list of
+chunk digests (its manifest), so:
+- Identical files, copies, and unchanged parts of an edited file share their
+  chunks instead of being stored again.
+- Boundaries depend only on the bytes around them, so inserting into a file
+  shifts its boundaries for a chunk or two and the rest of the file still
+  produces the same chunks. Overwriting a range or appending re-chunks only
+  the chunks that range touches.
+- States, snapshots and undo data hold manifests, not contents.
+
+Chunks are appended to a single pack file and read back through a read-only
+memory map, so reading a range of a file copies just that range out of the
+page cache. The store is append-only: chunks are never removed, which keeps
+every manifest captured for undo readable.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from bisect import bisect_right
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+# Chunk size bounds in bytes; boundaries are found about every CHUNK_AVG bytes
+CHUNK_MIN = 2 * 1024
+CHUNK_AVG = 8 * 1024
+CHUNK_MAX = 64 * 1024
+
+# Pack file name and record header: raw SHA-256 digest, chunk length
+PACK_NAME = "blobs.pack"
+_HEADER = struct.Struct(">32sI")
+
+# Bytes hashed for each boundary decision, and bytes scanned per NumPy pass
+_WINDOW = 32
+_BLOCK = 1024 * 1024
+_MASK = CHUNK_AVG - 1
+
+# Random value per byte value, summed over the window to find boundaries
+_GEAR = np.random.default_rng(0x5EED).integers(0, 2**32, size=256, dtype=np.uint32)
+
+
+def _candidates(data: memoryview) -> np.ndarray:
+    """Return the offsets right after every window whose hash marks a boundary.
+
+    The hash of a window is the sum of _GEAR over its bytes, so the hashes of
+    all windows come from one cumulative sum. Data is scanned in blocks to
+    bound the temporary arrays.
+
+    Args:
+        data: Bytes to scan.
+
+    Returns:
+        Sorted candidate boundary offsets.
+    """
+    view = np.frombuffer(data, dtype=np.uint8)
+    found = []
+    for start in range(0, len(view), _BLOCK):
+        # Overlap the previous block so windows spanning blocks are hashed
+        low = max(start - _WINDOW + 1, 0)
+        sums = np.cumsum(_GEAR[view[low : start + _BLOCK]], dtype=np.uint32)
+        hashes = sums[_WINDOW - 1 :].copy()
+        hashes[1:] -= sums[:-_WINDOW]
+        found.append(np.flatnonzero((hashes & _MASK) == 0) + (low + _WINDOW))
+    return np.concatenate(found) if found else np.empty(0, dtype=np.intp)
+
+
+def chunk_boundaries(data: bytes | memoryview) -> list[int]:
+    """Split data into content-defined chunks.
+
+    Args:
+        data: Bytes to split.
+
+    Returns:
+        End offset of each chunk; the last is len(data). Empty for no data.
+    """
+    size = len(data)
+    if size <= CHUNK_MIN:
+        return [size] if size else []
+
+    ends = []
+    start = 0
+    for end in _candidates(memoryview(data)).tolist():
+        if end - start < CHUNK_MIN:
+            continue
+        while end - start > CHUNK_MAX:
+            start += CHUNK_MAX
+            ends.append(start)
+        ends.append(end)
+        start = end
+    while size - start > CHUNK_MAX:
+        start += CHUNK_MAX
+        ends.append(start)
+    if start < size:
+        ends.append(size)
+    return ends
+
+
+class BlobStore:
+    """Append-only, deduplicating store of content-addressed chunks.
+
+    Thread safety: writes must not run concurrently with each other (the
+    engine serializes them); reads may run concurrently with anything.
+
+    Copies of a BlobStore are the store itself. Stored chunks never change
+    or disappear, so states copied for snapshots or undo can share it.
+    Pickling records only the directory, so it is refused for a store in a
+    temporary directory, which is removed with the original store.
+
+    Args:
+        directory: Directory holding the pack file. It is created if needed,
+            and an existing pack file is reopened. Without one, the store
+            lives in a temporary directory removed with the store.
+    """
+
+    def __init__(self, directory: Optional[str | Path] = None) -> None:
+        """Open or create the pack file and index its chunks."""
+        self._temporary = None
+        if directory is None:
+            self._temporary = tempfile.TemporaryDirectory(prefix="ues-blobs-")
+            directory = self._temporary.name
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.directory / PACK_NAME, "a+b")
+        self._index: dict[str, tuple[int, int]] = {}
+        self._size = self._load_index()
+        self._map: Optional[mmap.mmap] = None
+        self._map_lock = threading.Lock()
+
+    def _load_index(self) -> int:
+        """Index the chunks already in the pack file.
+
+        A record cut short by an interrupted write is truncated away.
+
+        Returns:
+            Size of the pack file in bytes.
+        """
+        size = os.fstat(self._file.fileno()).st_size
+        position = 0
+        self._file.seek(0)
+        while position + _HEADER.size <= size:
+            digest, length = _HEADER.unpack(self._file.read(_HEADER.size))
+            if position + _HEADER.size + length > size:
+                break
+            self._index[digest.hex()] = (position + _HEADER.size, length)
+            position += _HEADER.size + length
+            self._file.seek(position)
+        if position < size:
+            self._file.truncate(position)
+        return position
+
+    def __len__(self) -> int:
+        """Return the number of distinct chunks stored."""
+        return len(self._index)
+
+    def __contains__(self, digest: object) -> bool:
+        """Return whether a chunk with this hex digest is stored."""
+        return digest in self._index
+
+    @property
+    def stored_bytes(self) -> int:
+        """Bytes of chunk data in the store, after deduplication."""
+        return self._size - len(self._index) * _HEADER.size
+
+    def put(self, chunk: bytes | memoryview) -> str:
+        """Store a chunk unless an identical one is already stored.
+
+        Args:
+            chunk: Chunk contents.
+
+        Returns:
+            Hex SHA-256 digest of the chunk.
+        """
+        digest = hashlib.sha256(chunk)
+        key = digest.hexdigest()
+        if key not in self._index:
+            self._file.write(_HEADER.pack(digest.digest(), len(chunk)))
+            self._file.write(chunk)
+            self._index[key] = (self._size + _HEADER.size, len(chunk))
+            self._size += _HEADER.size + len(chunk)
+        return key
+
+    def write(self, data: bytes | memoryview) -> tuple[list[str], list[int]]:
+        """Chunk data and store every chunk.
+
+        Args:
+            data: Contents to store.
+
+        Returns:
+            Tuple of (chunk digests, chunk end offsets within data).
+        """
+        view = memoryview(data)
+        ends = chunk_boundaries(view)
+        digests = []
+        start = 0
+        for end in ends:
+            digests.append(self.put(view[start:end]))
+            start = end
+        self._file.flush()
+        return digests, ends
+
+    def _mapping(self, end: int) -> mmap.mmap:
+        """Return a memory map of the pack file covering at least end bytes."""
+        current = self._map
+        if current is not None and len(current) >= end:
+            return current
+        with self._map_lock:
+            if self._map is None or len(self._map) < end:
+                # Replaced maps are left to be closed when no reader holds them
+                self._file.flush()
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            return self._map
+
+    def get(self, digest: str) -> bytes:
+        """Read a whole chunk.
+
+        Args:
+            digest: Hex digest of the chunk.
+
+        Returns:
+            Chunk contents.
+
+        Raises:
+            KeyError: If no chunk has this digest.
+        """
+        position, length = self._index[digest]
+        return self._mapping(position + length)[position : position + length]
+
+    def read(
+        self,
+        digests: Sequence[str],
+        ends: Sequence[int],
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> bytes:
+        """Read a byte range of the contents a manifest describes.
+
+        Only the chunks overlapping the range are touched.
+
+        Args:
+            digests: Chunk digests, in order.
+            ends: Chunk end offsets, as returned by write().
+            start: First byte to read.
+            stop: Byte after the last to read; None reads to the end.
+
+        Returns:
+            The bytes in [start, stop), clipped to the contents.
+
+        Raises:
+            KeyError: If a chunk in the range is missing from the store.
+        """
+        size = ends[-1] if ends else 0
+        stop = size if stop is None else min(stop, size)
+        if start >= stop:
+            return b""
+
+        parts = []
+        index = bisect_right(ends, start)
+        chunk_start = ends[index - 1] if index else 0
+        while index < len(ends) and chunk_start < stop:
+            position, length = self._index[digests[index]]
+            low = position + max(start - chunk_start, 0)
+            high = position + min(stop, ends[index]) - chunk_start
+            parts.append(self._mapping(high)[low:high])
+            chunk_start = ends[index]
+            index += 1
+        return b"".join(parts)
+
+    def close(self) -> None:
+        """Close the pack file and memory map."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, BlobStore) and other.directory == self.directory
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __copy__(self) -> "BlobStore":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "BlobStore":
+        return self
+
+    def __reduce__(self) -> tuple:
+        if self._temporary is not None:
+            raise TypeError(
+                "Cannot pickle a BlobStore in a temporary directory; "
+                "give it a directory to keep its chunks"
+            )
+        self._file.flush()
+        return (BlobStore, (str(self.directory),))
+
+    def __repr__(self) -> str:
+        return f"BlobStore({str(self.directory)!r}, chunks={len(self)})"
@@ -1,16 +1,239 @@
 """File system input model."""
 
+import base64
+import binascii
+import posixpath
+import re
+from typing import Literal, Optional
+
+from pydantic import Field, field_validator
+
 from models.base_input import ModalityInput
 
 
+FileSystemOperation = Literal[
+    "write",
+    "append",
+    "mkdir",
+    "delete",
+    "move",
+    "copy",
+    "chmod",
+]
+
+# Operations whose content field is required
+CONTENT_OPERATIONS = frozenset({"write", "append"})
+
+
+def normalize_path(path: str) -> str:
+    """Normalize an absolute file system path.
+
+    Repeated and trailing slashes and "." components are removed and ".."
+    components resolved; nothing resolves above the root.
+
+    Args:
+        path: Path to normalize.
+
+    Returns:
+        The normalized path, e.g. "/docs/report.pdf".
+
+    Raises:
+        ValueError: If path is not absolute.
+    """
+    if not path.startswith("/"):
+        raise ValueError(f"Path must be absolute, got '{path}'")
+    normalized = posixpath.normpath(path)
+    # POSIX keeps a leading "//" as is
+    return "/" + normalized.lstrip("/")
+
+
 class FileSystemInput(ModalityInput):
     """Input for file system changes.
 
+    Uses an operation-based design where different attributes are required
+    depending on the operation type. Missing parent directories are created
+    by write, append, mkdir, move and copy.
+
     Args:
-        path: File or directory path.
-        content: File content (for create/modify operations).
-        operation: Operation type (create, modify, delete).
-        permissions: Optional file permissions.
+        modality_type: Always "filesystem" for this input type.
+        timestamp: When the change occurred (simulator time).
+        input_id: Unique input identifier (auto-generated).
+        operation: Type of file system operation to perform.
+        path: File or directory path the operation applies to.
+        content: File content for write and append, in the given encoding.
+        encoding: How content is encoded: "utf-8" text or "base64" binary.
+        offset: For write, the byte offset to overwrite from. Without it
+            the whole file is replaced.
+        destination: Target path for move and copy.
+        recursive: For delete, whether a non-empty directory may be deleted.
+        permissions: Octal permissions (e.g., "644") for chmod, or for a
+            file or directory being created.
+        mime_type: MIME type for a file being created (guessed from the
+            file name if not given).
     """
 
-    pass
+    modality_type: Literal["filesystem"] = Field(default="filesystem", frozen=True)
+    operation: FileSystemOperation = Field(description="Type of file system operation")
+    path: str = Field(description="File or directory path")
+    content: Optional[str] = Field(default=None, description="File content")
+    encoding: Literal["utf-8", "base64"] = Field(
+        default="utf-8", description="Content encoding (utf-8 or base64)"
+    )
+    offset: Optional[int] = Field(
+        default=None, description="Byte offset to write from", ge=0
+    )
+    destination: Optional[str] = Field(
+        default=None, description="Target path for move and copy"
+    )
+    recursive: bool = Field(
+        default=False, description="Allow deleting non-empty directories"
+    )
+    permissions: Optional[str] = Field(
+        default=None, description="Octal permissions (e.g., '644')"
+    )
+    mime_type: Optional[str] = Field(default=None, description="MIME type of a new file")
+
+    @field_validator("path", "destination")
+    @classmethod
+    def validate_path(cls, value: Optional[str]) -> Optional[str]:
+        """Validate and normalize a path.
+
+        Args:
+            value: Path to validate.
+
+        Returns:
+            The normalized path.
+
+        Raises:
+            ValueError: If the path is not absolute.
+        """
+        if value is None:
+            return value
+        return normalize_path(value)
+
+    @field_validator("permissions")
+    @classmethod
+    def validate_permissions(cls, value: Optional[str]) -> Optional[str]:
+        """Validate permissions are three octal digits.
+
+        Args:
+            value: Permissions to validate.
+
+        Returns:
+            The validated permissions.
+
+        Raises:
+            ValueError: If permissions are not three octal digits.
+        """
+        if value is not None and not re.fullmatch(r"[0-7]{3}", value):
+            raise ValueError(f"Permissions must be three octal digits, got '{value}'")
+        return value
+
+    def content_bytes(self) -> bytes:
+        """Decode content to bytes.
+
+        Returns:
+            The decoded content, or b"" if there is none.
+
+        Raises:
+            ValueError: If base64 content is malformed.
+        """
+        if self.content is None:
+            return b""
+        if self.encoding == "base64":
+            try:
+                return base64.b64decode(self.content, validate=True)
+            except binascii.Error as e:
+                raise ValueError(f"Invalid base64 content: {e}")
+        return self.content.encode("utf-8")
+
+    def validate_input(self) -> None:
+        """Perform modality-specific validation beyond Pydantic field validation.
+
+        Validates that required fields are present for each operation type
+        and that the root directory is not written, moved or deleted.
+
+        Raises:
+            ValueError: If validation fails with descriptive message.
+        """
+        op = self.operation
+
+        if op in CONTENT_OPERATIONS and self.content is None:
+            raise ValueError(f"Operation '{op}' requires content")
+
+        if self.offset is not None and op != "write":
+            raise ValueError(f"Operation '{op}' does not take an offset")
+
+        if op in ("move", "copy"):
+            if not self.destination:
+                raise ValueError(f"Operation '{op}' requires destination")
+            if self.destination == self.path or self.destination.startswith(
+                self.path.rstrip("/") + "/"
+            ):
+                raise ValueError(
+                    f"Cannot {op} '{self.path}' to itself or into itself: '{self.destination}'"
+                )
+
+        if op == "chmod" and not self.permissions:
+            raise ValueError(f"Operation '{op}' requires permissions")
+
+        if self.path == "/" and op != "chmod":
+            raise ValueError(f"Operation '{op}' cannot be applied to the root directory")
+
+        if self.content is not None:
+            self.content_bytes()
+
+    def get_affected_entities(self) -> list[str]:
+        """Return list of entity IDs affected by this input.
+
+        Returns:
+            List containing the affected path and, for move and copy, the
+            destination path.
+        """
+        entities = [f"path:{self.path}"]
+        if self.destination:
+            entities.append(f"path:{self.destination}")
+        return entities
+
+    def get_summary(self) -> str:
+        """Return human-readable one-line summary of this input.
+
+        Returns:
+            Brief description of the operation for logging/UI display.
+        """
+        op = self.operation
+
+        if op in CONTENT_OPERATIONS:
+            size = len(self.content_bytes())
+            if op == "append":
+                return f"Append {size} bytes to {self.path}"
+            if self.offset is not None:
+                return f"Write {size} bytes to {self.path} at offset {self.offset}"
+            return f"Write {size} bytes to {self.path}"
+
+        if op == "mkdir":
+            return f"Create directory {self.path}"
+
+        if op == "delete":
+            return f"Delete {self.path}"
+
+        if op in ("move", "copy"):
+            return f"{op.capitalize()} {self.path} to {self.destination}"
+
+        if op == "chmod":
+            return f"Set permissions of {self.path} to {self.permissions}"
+
+        return f"File system operation: {op}"
+
+    def should_merge_with(self, other: ModalityInput) -> bool:
+        """Determine if this input should be merged with another input.
+
+        File system operations are not merged; each changes the tree.
+
+        Args:
+            other: Another input to compare against.
+
+        Returns:
+            Always False for file system operations.
+        """
+        return False
@@ -1,15 +1,747 @@
-"""File system state model."""
+"""File system state model.
 
+The directory tree is a path trie: each directory maps child names to file
+and directory nodes, so looking up, creating or listing a path walks one node
+per path component, and moving or deleting a directory detaches a single
+subtree. Files hold manifests (chunk digests and end offsets) rather than
+contents; the contents are in a content-addressed BlobStore (see
+models/modalities/filesystem_blobs.py) shared by copies of the state.
+"""
+
+import mimetypes
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from datetime import datetime
+from fnmatch import fnmatchcase
+from typing import Annotated, Any, Literal, Optional, Union
+
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter
+
+from models.base_input import ModalityInput
 from models.base_state import ModalityState
+from models.modalities.filesystem_blobs import BlobStore
+from models.modalities.filesystem_input import normalize_path
+
+DEFAULT_FILE_PERMISSIONS = "644"
+DEFAULT_DIRECTORY_PERMISSIONS = "755"
+DEFAULT_MIME_TYPE = "application/octet-stream"
+
+
+class FileNode(BaseModel):
+    """A file in the directory tree.
+
+    Args:
+        kind: Always "file".
+        size: File size in bytes.
+        chunks: Digests of the content chunks in the blob store, in order.
+        chunk_ends: End offset of each chunk within the file.
+        mime_type: MIME type of the content.
+        permissions: Octal permissions (e.g., "644").
+        created_at: When the file was created (simulator time).
+        modified_at: When the content last changed (simulator time).
+    """
+
+    kind: Literal["file"] = Field(default="file", description="Node kind")
+    size: int = Field(default=0, description="File size in bytes")
+    chunks: list[str] = Field(
+        default_factory=list, description="Digests of the content chunks"
+    )
+    chunk_ends: list[int] = Field(
+        default_factory=list, description="End offset of each chunk"
+    )
+    mime_type: str = Field(default=DEFAULT_MIME_TYPE, description="MIME type")
+    permissions: str = Field(
+        default=DEFAULT_FILE_PERMISSIONS, description="Octal permissions"
+    )
+    created_at: datetime = Field(description="When the file was created")
+    modified_at: datetime = Field(description="When the content last changed")
+
+
+class DirectoryNode(BaseModel):
+    """A directory in the directory tree.
+
+    Args:
+        kind: Always "directory".
+        permissions: Octal permissions (e.g., "755").
+        created_at: When the directory was created (None for the root).
+        children: Files and directories in this directory, by name.
+    """
+
+    kind: Literal["directory"] = Field(default="directory", description="Node kind")
+    permissions: str = Field(
+        default=DEFAULT_DIRECTORY_PERMISSIONS, description="Octal permissions"
+    )
+    created_at: Optional[datetime] = Field(
+        default=None, description="When the directory was created"
+    )
+    children: dict[
+        str, Annotated[Union[FileNode, "DirectoryNode"], Field(discriminator="kind")]
+    ] = Field(default_factory=dict, description="Child nodes by name")
+
+
+Node = Union[FileNode, DirectoryNode]
+
+# Validates a dumped node of either kind, for undo
+_NODE_ADAPTER = TypeAdapter(Annotated[Node, Field(discriminator="kind")])
+
+
+def _split(path: str) -> list[str]:
+    """Return the components of a normalized path ([] for the root)."""
+    return [name for name in path.split("/") if name]
+
+
+def _name(path: str) -> str:
+    """Return the last component of a normalized path."""
+    return path.rsplit("/", 1)[-1]
+
+
+def _join(parent: str, name: str) -> str:
+    """Join a directory path and a child name."""
+    return f"{parent.rstrip('/')}/{name}"
+
+
+def _parent(path: str) -> str:
+    """Return the parent directory of a normalized path."""
+    return path.rsplit("/", 1)[0] or "/"
+
+
+# Sort keys for listed entries: (path, node) -> value
+_SORT_KEYS = {
+    "path": lambda item: item[0],
+    "name": lambda item: _name(item[0]),
+    "size": lambda item: item[1].size if item[1].kind == "file" else 0,
+    # Directories sort by creation; listings never include the root
+    "modified_at": lambda item: (
+        item[1].modified_at if item[1].kind == "file" else item[1].created_at
+    ),
+}
 
 
 class FileSystemState(ModalityState):
     """Current file system state.
 
     Args:
-        directory_tree: Nested structure representing the directory tree.
-        file_contents: Dictionary mapping file paths to their contents.
-        file_metadata: Dictionary mapping file paths to metadata (size, permissions, etc.).
+        modality_type: Always "filesystem" for this state type.
+        last_updated: When state was last modified.
+        update_count: Number of operations applied.
+        root: The root directory of the tree.
+        blob_directory: Directory of the blob store holding file contents.
+            A temporary directory is used if not set.
     """
 
-    pass
+    modality_type: str = Field(default="filesystem", frozen=True)
+    root: DirectoryNode = Field(
+        default_factory=DirectoryNode, description="Root directory of the tree"
+    )
+    blob_directory: Optional[str] = Field(
+        default=None, description="Directory of the blob store holding file contents"
+    )
+    _blobs: BlobStore = PrivateAttr()
+
+    class Config:
+        """Pydantic configuration."""
+
+        arbitrary_types_allowed = True
+
+    def model_post_init(self, __context: Any) -> None:
+        """Open the blob store after model creation.
+
+        Args:
+            __context: Pydantic context (unused).
+        """
+        self._blobs = BlobStore(self.blob_directory)
+        self.blob_directory = str(self._blobs.directory)
+
+    @property
+    def blobs(self) -> BlobStore:
+        """The blob store holding file contents."""
+        return self._blobs
+
+    def _lookup(self, path: str) -> Node:
+        """Find the node at a path.
+
+        Args:
+            path: Absolute path.
+
+        Returns:
+            The file or directory node.
+
+        Raises:
+            ValueError: If nothing exists at the path.
+        """
+        node: Node = self.root
+        for name in _split(normalize_path(path)):
+            if node.kind != "directory" or name not in node.children:
+                raise ValueError(f"No such file or directory: '{path}'")
+            node = node.children[name]
+        return node
+
+    def _exists(self, path: str) -> bool:
+        """Return whether a file or directory exists at a path."""
+        try:
+            self._lookup(path)
+        except ValueError:
+            return False
+        return True
+
+    def _first_missing(self, path: str) -> Optional[str]:
+        """Return the shallowest path from the root to path that is missing.
+
+        Removing it undoes creating path along with any missing parents.
+
+        Args:
+            path: Normalized absolute path.
+
+        Returns:
+            The first missing path, or None if path exists.
+        """
+        node: Node = self.root
+        current = ""
+        for name in _split(path):
+            current = f"{current}/{name}"
+            if node.kind != "directory" or name not in node.children:
+                return current
+            node = node.children[name]
+        return None
+
+    def _directory(self, path: str, create_at: Optional[datetime] = None) -> DirectoryNode:
+        """Find a directory, optionally creating it and its missing parents.
+
+        Args:
+            path: Normalized absolute path.
+            create_at: Creation time for missing directories; None to not
+                create them.
+
+        Returns:
+            The directory node.
+
+        Raises:
+            ValueError: If the directory does not exist and is not created,
+                or a component of the path is a file.
+        """
+        node = self.root
+        for name in _split(path):
+            child = node.children.get(name)
+            if child is None:
+                if create_at is None:
+                    raise ValueError(f"No such file or directory: '{path}'")
+                child = node.children[name] = DirectoryNode(created_at=create_at)
+            elif child.kind != "directory":
+                raise ValueError(f"Not a directory: '{path}'")
+            node = child
+        return node
+
+    def _detach(self, path: str) -> Node:
+        """Remove the node at an existing path from its parent and return it."""
+        return self._directory(_parent(path)).children.pop(_name(path))
+
+    def _walk(self, path: str, directory: DirectoryNode) -> Iterator[tuple[str, Node]]:
+        """Yield the path and node of everything below a directory."""
+        stack = [(path, directory)]
+        while stack:
+            parent_path, parent = stack.pop()
+            for name, child in parent.children.items():
+                child_path = _join(parent_path, name)
+                yield child_path, child
+                if child.kind == "directory":
+                    stack.append((child_path, child))
+
+    def read_file(self, path: str, offset: int = 0, length: Optional[int] = None) -> bytes:
+        """Read a file's content, or a byte range of it.
+
+        Only the chunks overlapping the range are read from the blob store.
+
+        Args:
+            path: Absolute file path.
+            offset: First byte to read.
+            length: Most bytes to read; None reads to the end of the file.
+
+        Returns:
+            The bytes read, clipped to the end of the file.
+
+        Raises:
+            ValueError: If the path does not exist or is a directory, or the
+                range is negative.
+        """
+        if offset < 0 or (length is not None and length < 0):
+            raise ValueError("Read offset and length must not be negative")
+        node = self._lookup(path)
+        if node.kind != "file":
+            raise ValueError(f"Is a directory: '{path}'")
+        stop = None if length is None else offset + length
+        return self._blobs.read(node.chunks, node.chunk_ends, offset, stop)
+
+    def stat(self, path: str) -> dict[str, Any]:
+        """Return the metadata of a file or directory.
+
+        Args:
+            path: Absolute path.
+
+        Returns:
+            Entry dictionary, as in query results.
+
+        Raises:
+            ValueError: If the path does not exist.
+        """
+        path = normalize_path(path)
+        return self._entry(path, self._lookup(path))
+
+    def apply_input(self, input_data: ModalityInput) -> None:
+        """Apply a FileSystemInput to modify this state.
+
+        Dispatches to operation-specific handlers based on operation type.
+
+        Args:
+            input_data: The FileSystemInput to apply to this state.
+
+        Raises:
+            ValueError: If input_data is not a FileSystemInput or the
+                operation is invalid for the current tree.
+        """
+        from models.modalities.filesystem_input import FileSystemInput
+
+        if not isinstance(input_data, FileSystemInput):
+            raise ValueError(
+                f"FileSystemState can only apply FileSystemInput, got {type(input_data)}"
+            )
+
+        input_data.ensure_valid()
+
+        operation_handlers = {
+            "write": self._handle_write,
+            "append": self._handle_write,
+            "mkdir": self._handle_mkdir,
+            "delete": self._handle_delete,
+            "move": self._handle_move,
+            "copy": self._handle_copy,
+            "chmod": self._handle_chmod,
+        }
+
+        handler = operation_handlers.get(input_data.operation)
+        if handler:
+            handler(input_data)
+            self.last_updated = input_data.timestamp
+            self.update_count += 1
+        else:
+            raise ValueError(f"Unknown operation: {input_data.operation}")
+
+    def _handle_write(self, input_data: "FileSystemInput") -> None:
+        """Handle writing or appending to a file, creating it if needed.
+
+        Replacing a whole file stores only the chunks not already in the blob
+        store. Writing at an offset or appending re-chunks just the chunks
+        the new bytes overlap; writing past the end fills the gap with zeros.
+        """
+        path = input_data.path
+        data = input_data.content_bytes()
+        directory = self._directory(_parent(path), create_at=input_data.timestamp)
+        name = _name(path)
+        node = directory.children.get(name)
+        if node is not None and node.kind != "file":
+            raise ValueError(f"Is a directory: '{path}'")
+        if node is None:
+            node = directory.children[name] = FileNode(
+                mime_type=input_data.mime_type
+                or mimetypes.guess_type(name)[0]
+                or DEFAULT_MIME_TYPE,
+                permissions=input_data.permissions or DEFAULT_FILE_PERMISSIONS,
+                created_at=input_data.timestamp,
+                modified_at=input_data.timestamp,
+            )
+
+        if input_data.operation == "append":
+            self._splice(node, node.size, data)
+        elif input_data.offset is not None:
+            self._splice(node, input_data.offset, data)
+        else:
+            node.chunks, node.chunk_ends = self._blobs.write(data)
+            node.size = len(data)
+        node.modified_at = input_data.timestamp
+
+    def _splice(self, node: FileNode, offset: int, data: bytes) -> None:
+        """Overwrite a file's bytes from offset, re-chunking only what changes.
+
+        The region re-chunked runs from the start of the chunk holding offset
+        (the last chunk when writing at or past the end, so small appends do
+        not leave a trail of tiny chunks) to the end of the chunk holding the
+        last byte written. Chunks outside it are kept as they are.
+        """
+        ends = node.chunk_ends
+        end = offset + len(data)
+        first = min(bisect_right(ends, offset), max(len(ends) - 1, 0))
+        last = bisect_left(ends, end)
+        region_start = ends[first - 1] if first else 0
+        region_stop = ends[last] if last < len(ends) else node.size
+
+        region = bytearray(self._blobs.read(node.chunks, ends, region_start, region_stop))
+        relative = offset - region_start
+        if relative > len(region):
+            region.extend(bytes(relative - len(region)))
+        region[relative : relative + len(data)] = data
+
+        digests, region_ends = self._blobs.write(region)
+        growth = len(region) - (region_stop - region_start)
+        node.chunks = node.chunks[:first] + digests + node.chunks[last + 1 :]
+        node.chunk_ends = (
+            ends[:first]
+            + [region_start + region_end for region_end in region_ends]
+            + [chunk_end + growth for chunk_end in ends[last + 1 :]]
+        )
+        node.size += growth
+
+    def _handle_mkdir(self, input_data: "FileSystemInput") -> None:
+        """Handle creating a directory and its missing parents.
+
+        Creating a directory that already exists changes nothing.
+        """
+        created = self._first_missing(input_data.path) is not None
+        directory = self._directory(input_data.path, create_at=input_data.timestamp)
+        if created and input_data.permissions:
+            directory.permissions = input_data.permissions
+
+    def _handle_delete(self, input_data: "FileSystemInput") -> None:
+        """Handle deleting a file or directory.
+
+        Raises:
+            ValueError: If a non-empty directory is deleted without recursive.
+        """
+        path = input_data.path
+        node = self._lookup(path)
+        if node.kind == "directory" and node.children and not input_data.recursive:
+            raise ValueError(f"Directory not empty: '{path}'")
+        self._detach(path)
+
+    def _handle_move(self, input_data: "FileSystemInput") -> None:
+        """Handle moving or renaming a file or directory.
+
+        Raises:
+            ValueError: If the destination already exists.
+        """
+        source, destination = input_data.path, input_data.destination
+        self._lookup(source)
+        if self._exists(destination):
+            raise ValueError(f"Destination already exists: '{destination}'")
+        node = self._detach(source)
+        target = self._directory(_parent(destination), create_at=input_data.timestamp)
+        target.children[_name(destination)] = node
+
+    def _handle_copy(self, input_data: "FileSystemInput") -> None:
+        """Handle copying a file or directory.
+
+        Copies share their content chunks with the original, so copying
+        costs no content storage however large the files are.
+
+        Raises:
+            ValueError: If the destination already exists.
+        """
+        destination = input_data.destination
+        node = self._lookup(input_data.path)
+        if self._exists(destination):
+            raise ValueError(f"Destination already exists: '{destination}'")
+        copy = node.model_copy(deep=True)
+        copy.created_at = input_data.timestamp
+        if copy.kind == "file":
+            copy.modified_at = input_data.timestamp
+        target = self._directory(_parent(destination), create_at=input_data.timestamp)
+        target.children[_name(destination)] = copy
+
+    def _handle_chmod(self, input_data: "FileSystemInput") -> None:
+        """Handle setting the permissions of a file or directory."""
+        self._lookup(input_data.path).permissions = input_data.permissions
+
+    def _entry(self, path: str, node: Node) -> dict[str, Any]:
+        """Build the query result entry for a node (without content)."""
+        entry: dict[str, Any] = {
+            "path": path,
+            "name": _name(path) or "/",
+            "kind": node.kind,
+            "permissions": node.permissions,
+            "created_at": node.created_at.isoformat() if node.created_at else None,
+        }
+        if node.kind == "file":
+            entry["size"] = node.size
+            entry["mime_type"] = node.mime_type
+            entry["modified_at"] = node.modified_at.isoformat()
+        else:
+            entry["child_count"] = len(node.children)
+        return entry
+
+    def _statistics(self) -> dict[str, int]:
+        """Count files and directories and their logical size."""
+        files = directories = total_bytes = 0
+        for _, node in self._walk("/", self.root):
+            if node.kind == "file":
+                files += 1
+                total_bytes += node.size
+            else:
+                directories += 1
+        return {
+            "file_count": files,
+            "directory_count": directories,
+            "total_bytes": total_bytes,
+        }
+
+    def get_snapshot(self) -> dict[str, Any]:
+        """Return a complete snapshot of current state for API responses.
+
+        File contents are not included; list files with query() and read
+        them with read_file().
+
+        Returns:
+            Dictionary representation of file system state.
+        """
+        return {
+            "modality_type": self.modality_type,
+            "last_updated": self.last_updated.isoformat(),
+            "update_count": self.update_count,
+            **self._statistics(),
+            "stored_bytes": self._blobs.stored_bytes,
+            "chunk_count": len(self._blobs),
+            "root": [
+                self._entry(_join("/", name), child)
+                for name, child in sorted(self.root.children.items())
+            ],
+        }
+
+    @property
+    def summary(self) -> str:
+        """Return a brief human-readable summary of the file system."""
+        stats = self._statistics()
+        return (
+            f"{stats['file_count']} files in {stats['directory_count']} directories "
+            f"({stats['total_bytes']} bytes)"
+        )
+
+    def validate_state(self) -> list[str]:
+        """Validate internal state consistency and return any issues.
+
+        Checks that every file's manifest is well formed and that all of its
+        chunks are in the blob store.
+
+        Returns:
+            List of validation error messages (empty list if valid).
+        """
+        issues = []
+
+        for path, node in self._walk("/", self.root):
+            if node.kind != "file":
+                continue
+            if len(node.chunks) != len(node.chunk_ends):
+                issues.append(
+                    f"File '{path}' has {len(node.chunks)} chunks but "
+                    f"{len(node.chunk_ends)} chunk ends"
+                )
+            if (node.chunk_ends[-1] if node.chunk_ends else 0) != node.size:
+                issues.append(f"File '{path}' chunks do not add up to its size {node.size}")
+            if any(a >= b for a, b in zip(node.chunk_ends, node.chunk_ends[1:])):
+                issues.append(f"File '{path}' chunk ends are not increasing")
+            missing = [digest for digest in node.chunks if digest not in self._blobs]
+            if missing:
+                issues.append(f"File '{path}' references {len(missing)} missing chunks")
+
+        return issues
+
+    def query(self, query_params: dict[str, Any]) -> dict[str, Any]:
+        """Execute a query against this state.
+
+        Lists a directory or searches below it. Results hold metadata only;
+        read contents with read_file().
+
+        Supported query parameters:
+            - path: str - Directory to list, or a file to stat (default: "/")
+            - recursive: bool - Include everything below path, not just its
+              children (default: False)
+            - pattern: str - Glob pattern matched against entry names
+            - kind: str - Only "file" or "directory" entries
+            - limit: int - Maximum number of results to return
+            - offset: int - Number of results to skip (for pagination)
+            - sort_by: str - "path" (default), "name", "size" or "modified_at"
+            - sort_order: str - Sort order ("asc" or "desc", default "asc")
+
+        Args:
+            query_params: Dictionary of query parameters.
+
+        Returns:
+            Dictionary containing query results:
+                - path: The normalized path queried.
+                - entries: Entries matching the query.
+                - count: Number of entries returned (after pagination).
+                - total_count: Total matching entries (before pagination).
+
+        Raises:
+            ValueError: If the path does not exist or sort_by is unknown.
+        """
+        path = normalize_path(query_params.get("path") or "/")
+        pattern = query_params.get("pattern")
+        kind = query_params.get("kind")
+        limit = query_params.get("limit")
+        offset = query_params.get("offset") or 0
+        sort_by = query_params.get("sort_by") or "path"
+        if sort_by not in _SORT_KEYS:
+            raise ValueError(f"Cannot sort by '{sort_by}'; use one of {sorted(_SORT_KEYS)}")
+
+        node = self._lookup(path)
+        if node.kind == "file":
+            matches = [(path, node)]
+        elif query_params.get("recursive"):
+            matches = list(self._walk(path, node))
+        else:
+            matches = [(_join(path, name), child) for name, child in node.children.items()]
+
+        if pattern:
+            matches = [
+                item for item in matches if fnmatchcase(_name(item[0]), pattern)
+            ]
+        if kind:
+            matches = [item for item in matches if item[1].kind == kind]
+
+        matches.sort(
+            key=_SORT_KEYS[sort_by], reverse=query_params.get("sort_order") == "desc"
+        )
+        total_count = len(matches)
+        page = matches[offset : offset + limit if limit is not None else None]
+
+        return {
+            "path": path,
+            "entries": [self._entry(entry_path, entry) for entry_path, entry in page],
+            "count": len(page),
+            "total_count": total_count,
+        }
+
+    def clear(self) -> None:
+        """Reset file system state to an empty root directory.
+
+        The blob store keeps its chunks; it is append-only.
+        """
+        self.root = DirectoryNode()
+        self.update_count = 0
+
+    def create_undo_data(self, input_data: "ModalityInput") -> dict[str, Any]:
+        """Capture minimal data needed to undo applying a FileSystemInput.
+
+        Undo data holds manifests, never contents: the chunks they reference
+        stay in the append-only blob store.
+
+        Args:
+            input_data: The FileSystemInput that will be applied.
+
+        Returns:
+            Dictionary containing minimal data needed to undo the operation.
+        """
+        from models.modalities.filesystem_input import FileSystemInput
+
+        if not isinstance(input_data, FileSystemInput):
+            raise ValueError(
+                f"FileSystemState can only create undo data for FileSystemInput, "
+                f"got {type(input_data)}"
+            )
+
+        base_undo = {
+            "state_previous_update_count": self.update_count,
+            "state_previous_last_updated": self.last_updated.isoformat(),
+        }
+
+        operation = input_data.operation
+        path = input_data.path
+
+        try:
+            if operation in ("write", "append", "mkdir"):
+                missing = self._first_missing(path)
+                if missing is not None:
+                    return {**base_undo, "action": "remove_path", "path": missing}
+                node = self._lookup(path)
+                if operation == "mkdir" or node.kind != "file":
+                    # Nothing changes, or the operation will fail
+                    return {**base_undo, "action": "noop"}
+                return {
+                    **base_undo,
+                    "action": "restore_node",
+                    "path": path,
+                    "node": node.model_dump(mode="json"),
+                }
+
+            if operation == "delete":
+                return {
+                    **base_undo,
+                    "action": "restore_node",
+                    "path": path,
+                    "node": self._lookup(path).model_dump(mode="json"),
+                }
+
+            if operation == "move":
+                self._lookup(path)
+                return {
+                    **base_undo,
+                    "action": "move_back",
+                    "path": input_data.destination,
+                    "destination": path,
+                    "remove": self._first_missing(_parent(input_data.destination)),
+                }
+
+            if operation == "copy":
+                return {
+                    **base_undo,
+                    "action": "remove_path",
+                    "path": self._first_missing(input_data.destination),
+                }
+
+            if operation == "chmod":
+                return {
+                    **base_undo,
+                    "action": "restore_permissions",
+                    "path": path,
+                    "permissions": self._lookup(path).permissions,
+                }
+        except ValueError:
+            # The operation will fail and change nothing
+            pass
+
+        return {**base_undo, "action": "noop"}
+
+    def apply_undo(self, undo_data: dict[str, Any]) -> None:
+        """Apply undo data to reverse a previous file system input application.
+
+        Args:
+            undo_data: Dictionary returned by create_undo_data().
+
+        Raises:
+            ValueError: If undo_data is invalid.
+        """
+        action = undo_data.get("action")
+        if not action:
+            raise ValueError("Undo data missing 'action' field")
+
+        path = undo_data.get("path")
+        if action != "noop" and action != "remove_path" and not path:
+            raise ValueError(f"Undo data for '{action}' missing 'path'")
+
+        if action == "remove_path":
+            if path and self._exists(path):
+                self._detach(path)
+
+        elif action == "restore_node":
+            node_data = undo_data.get("node")
+            if not node_data:
+                raise ValueError("Undo data missing 'node'")
+            self._directory(_parent(path)).children[_name(path)] = (
+                _NODE_ADAPTER.validate_python(node_data)
+            )
+
+        elif action == "move_back":
+            destination = undo_data.get("destination")
+            if not destination:
+                raise ValueError("Undo data missing 'destination'")
+            node = self._detach(path)
+            self._directory(_parent(destination)).children[_name(destination)] = node
+            remove = undo_data.get("remove")
+            if remove and self._exists(remove):
+                self._detach(remove)
+
+        elif action == "restore_permissions":
+            self._lookup(path).permissions = undo_data["permissions"]
+
+        elif action != "noop":
+            raise ValueError(f"Unknown undo action: {action}")
+
+        self.update_count = undo_data["state_previous_update_count"]
+        self.last_updated = datetime.fromisoformat(undo_data["state_previous_last_updated"])
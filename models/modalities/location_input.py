@@ -1,7 +1,7 @@
 """Location input model."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field, field_validator
 
@@ -28,7 +28,7 @@ class LocationInput(ModalityInput):
         bearing: Optional bearing/heading in degrees (0-360, where 0 is North).
     """
 
-    modality_type: str = Field(default="location", frozen=True)
+    modality_type: Literal["location"] = Field(default="location", frozen=True)
     latitude: float = Field(
         description="Latitude coordinate in decimal degrees (-90 to 90)"
     )
@@ -1,12 +1,14 @@
 """Location state model."""
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 from pydantic import BaseModel, Field
 
 from models.base_input import ModalityInput
 from models.base_state import ModalityState
+from models.records import Record
 
 
 class LocationHistoryEntry(BaseModel):
@@ -62,6 +64,25 @@ class LocationHistoryEntry(BaseModel):
         return result
 
 
+@dataclass(slots=True, kw_only=True)
+class LocationHistoryRecord(Record):
+    """Compact form of LocationHistoryEntry held in LocationState.location_history."""
+
+    model: ClassVar[type[BaseModel]] = LocationHistoryEntry
+
+    timestamp: datetime
+    latitude: float
+    longitude: float
+    address: Optional[str] = None
+    named_location: Optional[str] = None
+    altitude: Optional[float] = None
+    accuracy: Optional[float] = None
+    speed: Optional[float] = None
+    bearing: Optional[float] = None
+
+    to_dict = LocationHistoryEntry.to_dict
+
+
 class LocationState(ModalityState):
     """Current user location state.
 
@@ -109,7 +130,7 @@ class LocationState(ModalityState):
     current_bearing: Optional[float] = Field(
         default=None, description="Current bearing in degrees"
     )
-    location_history: list[LocationHistoryEntry] = Field(
+    location_history: list[LocationHistoryRecord] = Field(
         default_factory=list, description="List of recent location updates"
     )
     max_history_size: int = Field(
@@ -141,7 +162,7 @@ class LocationState(ModalityState):
             )
 
         if self.current_latitude is not None and self.current_longitude is not None:
-            previous_entry = LocationHistoryEntry(
+            previous_entry = LocationHistoryRecord(
                 timestamp=self.last_updated,
                 latitude=self.current_latitude,
                 longitude=self.current_longitude,
@@ -455,7 +476,7 @@ class LocationState(ModalityState):
             # Restore the oldest history entry if it was trimmed due to capacity
             if "removed_history_entry" in undo_data:
                 entry_data = undo_data["removed_history_entry"]
-                restored_entry = LocationHistoryEntry(
+                restored_entry = LocationHistoryRecord(
                     timestamp=datetime.fromisoformat(entry_data["timestamp"]),
                     latitude=entry_data["latitude"],
                     longitude=entry_data["longitude"],
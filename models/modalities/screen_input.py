@@ -1,17 +1,159 @@
 """Screen simulation input model."""
 
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, Field
+
 from models.base_input import ModalityInput
 
 
+ScreenInteraction = Literal[
+    "render",
+    "update",
+    "click",
+    "type",
+    "scroll",
+    "hover",
+    "focus",
+    "key",
+]
+
+# Interactions aimed at a single element
+TARGETED_INTERACTIONS = frozenset({"click", "type", "hover", "focus"})
+
+
+class ScreenElement(BaseModel):
+    """One element of a UI tree.
+
+    Elements are never modified in place: a changed element is replaced by
+    a new one, so the screen timeline can share unchanged elements between
+    frames.
+
+    Args:
+        role: Accessibility role (button, textbox, list, window, ...).
+        name: Accessible name or label.
+        value: Current value, e.g. the text of a textbox.
+        parent_id: ID of the parent element (None for roots).
+        properties: Other state such as enabled, checked or bounds.
+    """
+
+    role: str = Field(description="Accessibility role")
+    name: Optional[str] = Field(default=None, description="Accessible name or label")
+    value: Optional[str] = Field(default=None, description="Current value")
+    parent_id: Optional[str] = Field(default=None, description="Parent element ID")
+    properties: dict[str, Any] = Field(default_factory=dict, description="Other element state")
+
+
 class ScreenInput(ModalityInput):
     """Input for screen/UI interactions.
 
+    Every input is one step of the screen's timeline. A render replaces the
+    whole screen, as when switching apps or opening a new page; every other
+    interaction changes it by a structural delta: the elements it adds or
+    replaces and the elements it removes. A click that opens a menu, for
+    example, carries the menu's elements; a keystroke in a textbox carries
+    the textbox with its new value.
+
     Args:
-        app: Application name.
-        window: Window identifier.
-        interaction_type: Type of interaction (click, type, scroll, etc.).
+        modality_type: Always "screen" for this input type.
+        timestamp: When the event occurred (simulator time).
+        input_id: Unique input identifier (auto-generated).
+        interaction_type: Type of interaction (render, update, click, type,
+            scroll, hover, focus, key).
+        app: Application name; required for render, and switches the
+            active app for other interactions.
+        window: Window identifier; switches the active window if given.
         target_element: Target UI element identifier.
-        interaction_data: Additional interaction-specific data.
+        interaction_data: Additional interaction-specific data, e.g. the
+            typed text or the scroll offset.
+        elements: For render, the whole UI tree; otherwise the elements
+            added or replaced, by ID.
+        removed: IDs of elements removed from the screen.
     """
 
-    pass
+    modality_type: Literal["screen"] = Field(default="screen", frozen=True)
+    interaction_type: ScreenInteraction = Field(description="Type of interaction")
+    app: Optional[str] = Field(default=None, description="Application name")
+    window: Optional[str] = Field(default=None, description="Window identifier")
+    target_element: Optional[str] = Field(default=None, description="Target element ID")
+    interaction_data: dict[str, Any] = Field(
+        default_factory=dict, description="Interaction-specific data"
+    )
+    elements: dict[str, ScreenElement] = Field(
+        default_factory=dict, description="Elements added or replaced, by ID"
+    )
+    removed: list[str] = Field(default_factory=list, description="IDs of removed elements")
+
+    def validate_input(self) -> None:
+        """Perform modality-specific validation beyond Pydantic field validation.
+
+        Validates that required fields are present for each interaction type
+        and that the delta is consistent.
+
+        Raises:
+            ValueError: If validation fails with descriptive message.
+        """
+        interaction = self.interaction_type
+
+        if interaction == "render":
+            if not self.app:
+                raise ValueError("Interaction 'render' requires app")
+            if self.removed:
+                raise ValueError("Interaction 'render' replaces the screen; omit removed")
+
+        if interaction in TARGETED_INTERACTIONS and not self.target_element:
+            raise ValueError(f"Interaction '{interaction}' requires target_element")
+
+        both = set(self.elements).intersection(self.removed)
+        if both:
+            raise ValueError(f"Elements both changed and removed: {sorted(both)}")
+
+        for element_id, element in self.elements.items():
+            if element.parent_id == element_id:
+                raise ValueError(f"Element '{element_id}' cannot be its own parent")
+
+    def get_affected_entities(self) -> list[str]:
+        """Return list of entity IDs affected by this input.
+
+        Returns:
+            List containing the app and the target element, if any.
+        """
+        entities = [f"app:{self.app}"] if self.app else []
+        if self.target_element:
+            entities.append(f"element:{self.target_element}")
+        return entities
+
+    def get_summary(self) -> str:
+        """Return human-readable one-line summary of this input.
+
+        Returns:
+            Brief description of the interaction for logging/UI display.
+        """
+        interaction = self.interaction_type
+        if interaction == "render":
+            where = f"{self.app}/{self.window}" if self.window else self.app
+            return f"Rendered {where} ({len(self.elements)} elements)"
+
+        summary = interaction.capitalize()
+        if self.target_element:
+            summary += f" on {self.target_element}"
+        if interaction == "type" and "text" in self.interaction_data:
+            text = str(self.interaction_data["text"])
+            summary += f": {text[:30]}{'...' if len(text) > 30 else ''}"
+        changes = len(self.elements) + len(self.removed)
+        if changes:
+            summary += f" ({changes} elements changed)"
+        return summary
+
+    def should_merge_with(self, other: ModalityInput) -> bool:
+        """Determine if this input should be merged with another input.
+
+        Screen interactions are not merged; each is a step of the timeline.
+
+        Args:
+            other: Another input to compare against.
+
+        Returns:
+            Always False for screen interactions.
+        """
+        return False
@@ -1,16 +1,288 @@
 """Screen simulation state model."""
 
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import Field
+
+from models.base_input import ModalityInput
 from models.base_state import ModalityState
+from models.modalities.screen_input import ScreenElement, ScreenInput
+from models.modalities.screen_timeline import ScreenFrame, ScreenStep, ScreenTimeline
 
 
 class ScreenState(ModalityState):
-    """Current screen/UI state.
+    """Current screen/UI state and its history.
+
+    Every interaction is a step of a ScreenTimeline (see
+    screen_timeline.py): a render replacing the screen, or a delta of the
+    elements it adds, replaces and removes. The current screen is kept
+    materialized, and the screen at any earlier time is rebuilt from the
+    nearest keyframe before it, so reconstruction takes bounded work and
+    history costs memory in proportion to how much the screen changed.
 
     Args:
-        current_app: Currently active application.
-        current_window: Currently active window.
-        ui_elements: Dictionary of visible UI elements and their states.
-        interaction_history: List of recent interactions.
+        modality_type: Always "screen" for this state type.
+        last_updated: When state was last modified.
+        update_count: Number of interactions applied.
+        timeline: Every interaction and the change it made to the screen.
     """
 
-    pass
+    modality_type: str = Field(default="screen", frozen=True)
+    timeline: ScreenTimeline = Field(
+        default_factory=ScreenTimeline, description="Screen history"
+    )
+
+    @property
+    def current_app(self) -> Optional[str]:
+        """Currently active application."""
+        return self.timeline.current.app
+
+    @property
+    def current_window(self) -> Optional[str]:
+        """Currently active window."""
+        return self.timeline.current.window
+
+    @property
+    def ui_elements(self) -> dict[str, ScreenElement]:
+        """Visible UI elements by ID. Do not modify."""
+        return self.timeline.current.elements
+
+    def apply_input(self, input_data: ModalityInput) -> None:
+        """Apply a screen interaction to modify this state.
+
+        Args:
+            input_data: The ScreenInput to apply to this state.
+
+        Raises:
+            ValueError: If input_data is not a ScreenInput, targets or
+                removes an element that is not on screen, or is earlier
+                than the last interaction.
+        """
+        if not isinstance(input_data, ScreenInput):
+            raise ValueError(f"ScreenState can only apply ScreenInput, got {type(input_data)}")
+
+        input_data.ensure_valid()
+
+        elements = self.ui_elements
+        if input_data.interaction_type != "render":
+            missing = [element_id for element_id in input_data.removed if element_id not in elements]
+            if missing:
+                raise ValueError(f"Cannot remove elements not on screen: {missing}")
+        target = input_data.target_element
+        if target is not None and target not in input_data.elements and (
+            input_data.interaction_type == "render" or target not in elements
+        ):
+            raise ValueError(f"Element '{target}' is not on screen")
+
+        self.timeline.record(
+            ScreenStep(
+                timestamp=input_data.timestamp,
+                interaction_type=input_data.interaction_type,
+                target_element=target,
+                interaction_data=dict(input_data.interaction_data),
+                app=input_data.app,
+                window=input_data.window,
+                elements=dict(input_data.elements),
+                removed=tuple(input_data.removed),
+            )
+        )
+        self.last_updated = input_data.timestamp
+        self.update_count += 1
+
+    def _render_frame(
+        self,
+        frame: ScreenFrame,
+        role: Optional[str] = None,
+        root: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Return a frame's app, window and elements as dictionaries.
+
+        Args:
+            frame: The frame to render.
+            role: Only include elements with this role.
+            root: Only include this element and its descendants.
+        """
+        elements = frame.elements
+        if root is not None:
+            if root not in elements:
+                raise ValueError(f"Element '{root}' is not on screen")
+            children: dict[str, list[str]] = {}
+            for element_id, element in elements.items():
+                if element.parent_id is not None:
+                    children.setdefault(element.parent_id, []).append(element_id)
+            subtree, pending = {}, [root]
+            while pending:
+                element_id = pending.pop()
+                subtree[element_id] = elements[element_id]
+                pending.extend(children.get(element_id, ()))
+            elements = subtree
+        return {
+            "app": frame.app,
+            "window": frame.window,
+            "elements": {
+                element_id: element.model_dump(mode="json")
+                for element_id, element in elements.items()
+                if role is None or element.role == role
+            },
+        }
+
+    def get_snapshot(self) -> dict[str, Any]:
+        """Return a complete snapshot of current state for API responses.
+
+        Includes the current screen but not its history.
+
+        Returns:
+            Dictionary representation of current state.
+        """
+        return {
+            "modality_type": self.modality_type,
+            "last_updated": self.last_updated.isoformat(),
+            "update_count": self.update_count,
+            "current_app": self.current_app,
+            "current_window": self.current_window,
+            "ui_elements": self._render_frame(self.timeline.current)["elements"],
+            "element_count": len(self.ui_elements),
+            "history_length": len(self.timeline),
+            "keyframe_count": self.timeline.keyframe_count,
+        }
+
+    def validate_state(self) -> list[str]:
+        """Validate internal state consistency and return any issues.
+
+        Returns:
+            List of validation error messages (empty list if valid).
+        """
+        errors = self.timeline.validate()
+        for element_id, element in self.ui_elements.items():
+            if element.parent_id is not None and element.parent_id not in self.ui_elements:
+                errors.append(
+                    f"Element '{element_id}' has parent '{element.parent_id}' not on screen"
+                )
+        return errors
+
+    def query(self, query_params: dict[str, Any]) -> dict[str, Any]:
+        """Execute a query against this state.
+
+        Returns the screen at a point in time or, with history, the
+        interactions in a time range.
+
+        Supported query parameters:
+            - at: datetime - Rebuild the screen as it was at this time
+              (default: the current screen)
+            - role: str - Only include elements with this role
+            - root: str - Only include this element and its descendants
+            - history: bool - List interactions instead of the screen
+            - since: datetime - Interactions at or after this time
+            - until: datetime - Interactions before this time
+            - interaction_type: str - Filter interactions by type
+            - limit: int - Maximum number of interactions (default: 100)
+            - offset: int - Interactions to skip, newest first
+
+        Args:
+            query_params: Dictionary of query parameters.
+
+        Returns:
+            Dictionary containing query results:
+                - app: Active application (None for history queries).
+                - window: Active window (None for history queries).
+                - elements: Elements by ID (empty for history queries).
+                - interactions: Interactions, newest first (history only).
+                - count: Number of elements or interactions returned.
+
+        Raises:
+            ValueError: If root is not on the screen.
+        """
+        if query_params.get("history"):
+            steps = self.timeline.steps(query_params.get("since"), query_params.get("until"))
+            interaction_type = query_params.get("interaction_type")
+            limit = query_params.get("limit") or 100
+            offset = query_params.get("offset") or 0
+            interactions = []
+            for step in reversed(steps):
+                if interaction_type is not None and step.interaction_type != interaction_type:
+                    continue
+                if offset:
+                    offset -= 1
+                    continue
+                interactions.append(
+                    {
+                        "timestamp": step.timestamp.isoformat(),
+                        "interaction_type": step.interaction_type,
+                        "target_element": step.target_element,
+                        "interaction_data": step.interaction_data,
+                        "app": step.app,
+                        "window": step.window,
+                        "changed": sorted(step.elements),
+                        "removed": list(step.removed),
+                    }
+                )
+                if len(interactions) >= limit:
+                    break
+            return {
+                "app": None,
+                "window": None,
+                "elements": {},
+                "interactions": interactions,
+                "count": len(interactions),
+            }
+
+        at = query_params.get("at")
+        frame = self.timeline.current if at is None else self.timeline.frame_at(at)
+        result = self._render_frame(frame, query_params.get("role"), query_params.get("root"))
+        result["interactions"] = []
+        result["count"] = len(result["elements"])
+        return result
+
+    def clear(self) -> None:
+        """Reset screen state to empty defaults."""
+        self.timeline = ScreenTimeline()
+        self.update_count = 0
+
+    def create_undo_data(self, input_data: ModalityInput) -> dict[str, Any]:
+        """Capture minimal data needed to undo applying an input.
+
+        Every interaction appends one step to the timeline, so undoing it
+        truncates the timeline back to its current length.
+
+        Args:
+            input_data: The ScreenInput that will be applied.
+
+        Returns:
+            Dictionary containing minimal data needed to undo the operation.
+        """
+        if not isinstance(input_data, ScreenInput):
+            raise ValueError(
+                f"ScreenState can only create undo data for ScreenInput, got {type(input_data)}"
+            )
+
+        return {
+            "action": "truncate",
+            "length": len(self.timeline),
+            "state_previous_update_count": self.update_count,
+            "state_previous_last_updated": self.last_updated.isoformat(),
+        }
+
+    def apply_undo(self, undo_data: dict[str, Any]) -> None:
+        """Apply undo data to reverse a previous input application.
+
+        Rebuilds the current screen from the nearest keyframe, so undo
+        costs the same bounded work as reading an earlier screen.
+
+        Args:
+            undo_data: Dictionary returned by create_undo_data().
+
+        Raises:
+            ValueError: If undo_data is invalid.
+        """
+        action = undo_data.get("action")
+        if not action:
+            raise ValueError("Undo data missing 'action' field")
+
+        if action == "truncate":
+            self.timeline.truncate(undo_data["length"])
+        elif action != "noop":
+            raise ValueError(f"Unknown undo action: {action}")
+
+        self.update_count = undo_data["state_previous_update_count"]
+        self.last_updated = datetime.fromisoformat(undo_data["state_previous_last_updated"])
@@ -0,0 +1,365 @@
+"""Keyframe and delta timeline of screen states.
+
+A simulated screen changes a little on every interaction: a keystroke
+changes one textbox, a click opens a menu of a few items. Storing the whole
+UI tree after every step would cost the tree's size per interaction, so a
+ScreenTimeline stores each step as a structural delta (the elements added
+or replaced and the elements removed) and keeps a keyframe, a full copy of
+the screen, only now and then:
+- Renders, which replace the whole screen, are keyframes themselves.
+- Otherwise a keyframe is taken once the steps since the last one have
+  changed as many elements as the screen holds (counting each step as at
+  least one change, and at least KEYFRAME_MIN_CHANGES in all).
+
+Keyframes therefore cost no more memory than the deltas they follow, so
+the timeline's memory is proportional to the volume of change. The screen
+at any time is rebuilt from the nearest keyframe before it plus the deltas
+since, which costs at most about twice the size of the screen however long
+the timeline is. Elements are never modified in place, so keyframes and
+deltas share them rather than copying them.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+from models.modalities.screen_input import ScreenElement
+
+# Fewest element changes between keyframes
+KEYFRAME_MIN_CHANGES = 64
+
+
+class ScreenFrame:
+    """The screen at one point in time.
+
+    Args:
+        app: Active application.
+        window: Active window.
+        elements: Visible elements by ID.
+    """
+
+    __slots__ = ("app", "window", "elements")
+
+    def __init__(
+        self,
+        app: Optional[str] = None,
+        window: Optional[str] = None,
+        elements: Optional[dict[str, ScreenElement]] = None,
+    ) -> None:
+        self.app = app
+        self.window = window
+        self.elements = elements if elements is not None else {}
+
+    def copy(self) -> "ScreenFrame":
+        """Return a copy that shares elements but not the element dictionary."""
+        return ScreenFrame(self.app, self.window, dict(self.elements))
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ScreenFrame)
+            and (self.app, self.window, self.elements)
+            == (other.app, other.window, other.elements)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ScreenFrame(app={self.app!r}, window={self.window!r}, elements={len(self.elements)})"
+
+
+class ScreenStep:
+    """One interaction and the delta it applied to the screen.
+
+    Args:
+        timestamp: When the interaction happened.
+        interaction_type: Type of interaction.
+        target_element: Target element ID, if any.
+        interaction_data: Interaction-specific data.
+        app: Application switched to (None to keep the current one).
+        window: Window switched to (None to keep the current one).
+        elements: For renders the whole screen, otherwise the elements
+            added or replaced.
+        removed: IDs of removed elements.
+    """
+
+    __slots__ = (
+        "timestamp",
+        "interaction_type",
+        "target_element",
+        "interaction_data",
+        "app",
+        "window",
+        "elements",
+        "removed",
+    )
+
+    def __init__(
+        self,
+        timestamp: datetime,
+        interaction_type: str,
+        target_element: Optional[str] = None,
+        interaction_data: Optional[dict[str, Any]] = None,
+        app: Optional[str] = None,
+        window: Optional[str] = None,
+        elements: Optional[dict[str, ScreenElement]] = None,
+        removed: tuple[str, ...] = (),
+    ) -> None:
+        self.timestamp = timestamp
+        self.interaction_type = interaction_type
+        self.target_element = target_element
+        self.interaction_data = interaction_data or {}
+        self.app = app
+        self.window = window
+        self.elements = elements or {}
+        self.removed = tuple(removed)
+
+    @property
+    def is_render(self) -> bool:
+        """Whether the step replaces the whole screen."""
+        return self.interaction_type == "render"
+
+    @property
+    def size(self) -> int:
+        """Number of element changes, counting the step itself as at least one."""
+        return max(len(self.elements) + len(self.removed), 1)
+
+    def apply(self, frame: ScreenFrame) -> None:
+        """Apply the step to a frame in place (renders replace its contents)."""
+        if self.is_render:
+            frame.app, frame.window = self.app, self.window
+            frame.elements = dict(self.elements)
+            return
+        if self.app is not None:
+            frame.app = self.app
+        if self.window is not None:
+            frame.window = self.window
+        frame.elements.update(self.elements)
+        for element_id in self.removed:
+            frame.elements.pop(element_id, None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the step as a JSON-compatible dictionary."""
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "interaction_type": self.interaction_type,
+            "target_element": self.target_element,
+            "interaction_data": self.interaction_data,
+            "app": self.app,
+            "window": self.window,
+            "elements": {
+                element_id: element.model_dump(mode="json")
+                for element_id, element in self.elements.items()
+            },
+            "removed": list(self.removed),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScreenStep":
+        """Rebuild a step from the dictionary to_dict() returns."""
+        timestamp = data["timestamp"]
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        return cls(
+            timestamp=timestamp,
+            interaction_type=data["interaction_type"],
+            target_element=data.get("target_element"),
+            interaction_data=data.get("interaction_data"),
+            app=data.get("app"),
+            window=data.get("window"),
+            elements={
+                element_id: ScreenElement.model_validate(element)
+                for element_id, element in (data.get("elements") or {}).items()
+            },
+            removed=tuple(data.get("removed") or ()),
+        )
+
+
+class ScreenTimeline:
+    """Every step of a screen's history, with periodic keyframes.
+
+    Steps are appended in time order. The current screen is kept
+    materialized; earlier screens are rebuilt on demand by frame_at().
+    """
+
+    def __init__(self) -> None:
+        self._steps: list[ScreenStep] = []
+        self._times: list[datetime] = []
+        # Keyframe step indexes (ascending) and the frames after those steps
+        self._keyframe_indexes: list[int] = []
+        self._keyframes: list[ScreenFrame] = []
+        self._current = ScreenFrame()
+        self._changes = 0
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    @property
+    def current(self) -> ScreenFrame:
+        """The screen after the last step. Do not modify it."""
+        return self._current
+
+    @property
+    def keyframe_count(self) -> int:
+        """Number of keyframes kept."""
+        return len(self._keyframes)
+
+    def record(self, step: ScreenStep) -> int:
+        """Append a step and apply it to the current screen.
+
+        Args:
+            step: The step to append. Its elements must not be modified
+                afterwards.
+
+        Returns:
+            The step's index.
+
+        Raises:
+            ValueError: If the step is earlier than the last step.
+        """
+        if self._times and step.timestamp < self._times[-1]:
+            raise ValueError(
+                f"Screen step at {step.timestamp.isoformat()} is earlier than the "
+                f"last step at {self._times[-1].isoformat()}"
+            )
+        index = len(self._steps)
+        self._steps.append(step)
+        self._times.append(step.timestamp)
+        step.apply(self._current)
+        if step.is_render:
+            # The step already holds the whole screen; share its elements
+            self._add_keyframe(index, ScreenFrame(step.app, step.window, step.elements))
+        else:
+            self._changes += step.size
+            if not self._keyframes or self._changes >= max(
+                len(self._current.elements), KEYFRAME_MIN_CHANGES
+            ):
+                self._add_keyframe(index, self._current.copy())
+        return index
+
+    def _add_keyframe(self, index: int, frame: ScreenFrame) -> None:
+        """Store the frame after a step as a keyframe."""
+        self._keyframe_indexes.append(index)
+        self._keyframes.append(frame)
+        self._changes = 0
+
+    def truncate(self, length: int) -> None:
+        """Drop every step from index length on, as if never recorded.
+
+        Used to undo steps; costs the same as one frame_at() call.
+        """
+        if length >= len(self._steps):
+            return
+        del self._steps[length:]
+        del self._times[length:]
+        keep = bisect_right(self._keyframe_indexes, length - 1)
+        del self._keyframe_indexes[keep:]
+        del self._keyframes[keep:]
+        self._current = self._frame_after(length - 1)
+        first = self._keyframe_indexes[-1] + 1 if self._keyframe_indexes else 0
+        self._changes = sum(step.size for step in self._steps[first:])
+
+    def _frame_after(self, index: int) -> ScreenFrame:
+        """Rebuild the screen after a step from the keyframe before it."""
+        if index < 0:
+            return ScreenFrame()
+        position = bisect_right(self._keyframe_indexes, index) - 1
+        if position < 0:
+            frame, start = ScreenFrame(), 0
+        else:
+            frame = self._keyframes[position].copy()
+            start = self._keyframe_indexes[position] + 1
+        for step in self._steps[start : index + 1]:
+            step.apply(frame)
+        return frame
+
+    def frame_at(self, timestamp: datetime) -> ScreenFrame:
+        """Return the screen at a time, after every step at or before it.
+
+        Returns:
+            A new frame (empty before the first step), safe to modify.
+        """
+        index = bisect_right(self._times, timestamp) - 1
+        if index == len(self._steps) - 1:
+            return self._current.copy()
+        return self._frame_after(index)
+
+    def steps(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> list[ScreenStep]:
+        """Return the steps at or after since and before until, oldest first."""
+        start = 0 if since is None else bisect_left(self._times, since)
+        stop = len(self._times) if until is None else bisect_left(self._times, until)
+        return self._steps[start:stop]
+
+    def validate(self) -> list[str]:
+        """Check that keyframes and the current screen agree with the steps.
+
+        Returns:
+            List of problems found (empty if consistent).
+        """
+        errors = []
+        if any(later < earlier for earlier, later in zip(self._times, self._times[1:])):
+            errors.append("Screen steps are not in time order")
+        if self._keyframe_indexes and self._keyframe_indexes[-1] >= len(self._steps):
+            errors.append("Keyframe after the last screen step")
+        if self._current != self._frame_after(len(self._steps) - 1):
+            errors.append("Current screen does not match the screen steps")
+        return errors
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Return every step as a dictionary, oldest first."""
+        return [step.to_dict() for step in self._steps]
+
+    @classmethod
+    def from_list(cls, steps: list[dict[str, Any]]) -> "ScreenTimeline":
+        """Rebuild a timeline, including its keyframes, from to_list() output."""
+        timeline = cls()
+        for step in steps:
+            timeline.record(ScreenStep.from_dict(step))
+        return timeline
+
+    def __deepcopy__(self, memo: dict) -> "ScreenTimeline":
+        # Steps, keyframes and elements are never modified once recorded
+        copied = ScreenTimeline()
+        copied._steps = list(self._steps)
+        copied._times = list(self._times)
+        copied._keyframe_indexes = list(self._keyframe_indexes)
+        copied._keyframes = list(self._keyframes)
+        copied._current = self._current.copy()
+        copied._changes = self._changes
+        return copied
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ScreenTimeline) and other.to_list() == self.to_list()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ScreenTimeline(steps={len(self._steps)}, keyframes={len(self._keyframes)})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Let models hold ScreenTimeline fields.
+
+        The field accepts a ScreenTimeline or the list of step dictionaries
+        to_list() returns, and dumps as that list.
+        """
+        from_list = core_schema.chain_schema(
+            [
+                core_schema.list_schema(core_schema.dict_schema()),
+                core_schema.no_info_plain_validator_function(cls.from_list),
+            ]
+        )
+        return core_schema.union_schema(
+            [core_schema.is_instance_schema(cls), from_list],
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda timeline: timeline.to_list()
+            ),
+        )
@@ -1,18 +1,29 @@
 """Slack input model."""
 
-from models.base_input import ModalityInput
+from typing import Literal, Optional
 
+from pydantic import Field
 
-class SlackInput(ModalityInput):
+from models.modalities.team_chat import TeamChatInput
+
+
+class SlackInput(TeamChatInput):
     """Input for Slack events.
 
+    See TeamChatInput for the operations and their fields. Mentions are
+    written "<@U123>" (or "@U123") in message text.
+
     Args:
-        workspace_id: Slack workspace ID.
-        channel_id: Slack channel ID.
-        message_content: Message content (for new messages).
-        author: Message author information.
-        thread_ts: Optional thread timestamp for threaded messages.
-        event_type: Type of event (message, reaction, etc.).
+        modality_type: Always "slack" for this input type.
+        timestamp: When the event occurred (simulator time).
+        input_id: Unique input identifier (auto-generated).
+        workspace_id: Slack workspace ID of a channel being created.
     """
 
-    pass
+    modality_type: Literal["slack"] = Field(default="slack", frozen=True)
+    workspace_id: Optional[str] = Field(default=None, description="Slack workspace ID")
+
+    @property
+    def space_id(self) -> Optional[str]:
+        """ID of the workspace a created channel belongs to."""
+        return self.workspace_id
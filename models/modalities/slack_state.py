@@ -1,17 +1,29 @@
 """Slack state model."""
 
-from models.base_state import ModalityState
+from typing import ClassVar
 
+from pydantic import Field
 
-class SlackState(ModalityState):
+from models.modalities.slack_input import SlackInput
+from models.modalities.team_chat import TeamChatState
+
+
+class SlackState(TeamChatState):
     """Current Slack state.
 
+    Channels keep their messages in append-only ChannelLogs with thread and
+    mention indexes; see TeamChatState for queries and read tracking.
+
     Args:
-        workspaces: Dictionary mapping workspace IDs to workspace information.
-        channels: Dictionary mapping channel IDs to channel information.
-        message_history: Dictionary mapping channel IDs to message lists.
-        threads: Dictionary mapping thread timestamps to message lists.
+        modality_type: Always "slack" for this state type.
+        last_updated: When state was last modified.
+        update_count: Number of operations applied.
+        user_id: Slack user ID of the simulated user.
+        channels: Dictionary mapping channel IDs to channels and their logs.
         users: Dictionary mapping user IDs to user information.
     """
 
-    pass
+    space_label: ClassVar[str] = "workspace"
+    input_class: ClassVar[type[SlackInput]] = SlackInput
+
+    modality_type: str = Field(default="slack", frozen=True)
@@ -1,13 +1,24 @@
 """SMS/RCS state model for text messaging."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
+from operator import attrgetter
+from typing import Any, ClassVar, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from models.base_input import ModalityInput
 from models.base_state import ModalityState
+from models.pagination import (
+    SortedIndexCache,
+    collect_page,
+    decode_cursor,
+    encode_cursor,
+    unsorted_key,
+)
+from models.projection import project
+from models.records import Record
 from models.modalities.sms_input import SMSInput
 
 
@@ -331,6 +342,42 @@ class SMSMessage(BaseModel):
         self.is_deleted = True
 
 
+@dataclass(slots=True, kw_only=True)
+class SMSMessageRecord(Record):
+    """Compact form of SMSMessage held in SMSState.messages."""
+
+    model: ClassVar[type[BaseModel]] = SMSMessage
+
+    message_id: str = field(default_factory=lambda: str(uuid4()))
+    thread_id: str
+    from_number: str
+    to_numbers: list[str]
+    body: str
+    attachments: list[MessageAttachment] = field(default_factory=list)
+    reactions: list[MessageReaction] = field(default_factory=list)
+    message_type: str = "sms"
+    direction: str
+    sent_at: datetime
+    delivered_at: Optional[datetime] = None
+    read_at: Optional[datetime] = None
+    is_read: bool = False
+    delivery_status: str = "sent"
+    edited_at: Optional[datetime] = None
+    is_deleted: bool = False
+    replied_to_message_id: Optional[str] = None
+    is_spam: bool = False
+
+    to_dict = SMSMessage.to_dict
+    mark_read = SMSMessage.mark_read
+    mark_unread = SMSMessage.mark_unread
+    mark_delivered = SMSMessage.mark_delivered
+    mark_failed = SMSMessage.mark_failed
+    add_reaction = SMSMessage.add_reaction
+    remove_reaction = SMSMessage.remove_reaction
+    edit_body = SMSMessage.edit_body
+    soft_delete = SMSMessage.soft_delete
+
+
 class SMSConversation(BaseModel):
     """Represents a conversation thread (one-on-one or group).
 
@@ -548,6 +595,10 @@ class SMSConversation(BaseModel):
         self.draft_message = None
 
 
+# Message fields SMSState.query() can sort by
+_SMS_SORT_FIELDS = ("sent_at", "from_number", "direction")
+
+
 class SMSState(ModalityState):
     """Tracks all SMS/RCS conversations, messages, and related state.
 
@@ -562,7 +613,7 @@ class SMSState(ModalityState):
     """
 
     modality_type: str = Field(default="sms", description="Always 'sms'")
-    messages: dict[str, SMSMessage] = Field(
+    messages: dict[str, SMSMessageRecord] = Field(
         default_factory=dict,
         description="All messages keyed by message_id",
     )
@@ -577,6 +628,7 @@ class SMSState(ModalityState):
     user_phone_number: str = Field(
         description="The simulated user's phone number"
     )
+    _sort_indexes: SortedIndexCache = PrivateAttr(default_factory=SortedIndexCache)
 
     def apply_input(self, input_data: SMSInput) -> None:
         """Process SMS action and update state accordingly.
@@ -590,7 +642,7 @@ class SMSState(ModalityState):
         if not isinstance(input_data, SMSInput):
             raise ValueError(f"Expected SMSInput, got {type(input_data)}")
 
-        input_data.validate_input()
+        input_data.ensure_valid()
 
         if input_data.action in ["send_message", "receive_message"]:
             self._handle_message(input_data)
@@ -652,7 +704,7 @@ class SMSState(ModalityState):
             attachment = MessageAttachment(**att_data)
             attachments.append(attachment)
 
-        message = SMSMessage(
+        message = SMSMessageRecord(
             thread_id=thread_id,
             from_number=from_number,
             to_numbers=to_numbers,
@@ -1059,6 +1111,8 @@ class SMSState(ModalityState):
             - offset: Number of messages to skip (for pagination)
             - sort_by: Field to sort by ("sent_at", "from_number", "direction")
             - sort_order: Sort order ("asc" or "desc")
+            - fields: Only include these SMSMessage fields in each result
+            - cursor: next_cursor from a previous page, to resume after it
 
         Args:
             query_params: Query filters (thread_id, phone_number, direction, etc.).
@@ -1067,11 +1121,117 @@ class SMSState(ModalityState):
             Dictionary containing matching messages and metadata with:
                 - messages: List of message dictionaries matching the query.
                 - count: Number of messages returned (after pagination).
-                - total_count: Total number of messages matching query (before pagination).
+                - total_count: Total number of messages matching query (before pagination),
+                  or None for cursor pages.
+                - next_cursor: Cursor for the next page, or None on the last page.
                 - query_params: Echo of query parameters.
         """
-        results = list(self.messages.values())
+        results, total_count, next_cursor = self.select_messages(query_params)
+        fields = query_params.get("fields")
+
+        if fields is not None:
+            messages = [project(msg, fields) for msg in results]
+        else:
+            messages = [msg.to_dict() for msg in results]
+
+        return {
+            "messages": messages,
+            "count": len(results),
+            "total_count": total_count,
+            "next_cursor": next_cursor,
+            "query_params": query_params,
+        }
+
+    def select_messages(
+        self, query_params: dict[str, Any]
+    ) -> tuple[list[SMSMessageRecord], int | None, str | None]:
+        """Filter, sort, and paginate messages without serializing them.
+
+        This is the selection step behind query(). Streaming endpoints use it
+        directly so matching messages can be encoded one at a time.
+
+        If query_params contains a "cursor" (a previous page's next_cursor),
+        the page is read from a sorted index starting right after the cursor
+        position, and the total match count is not computed.
+
+        Args:
+            query_params: Query filters (see query() for supported parameters).
+
+        Returns:
+            Tuple of (page of matching SMSMessageRecord objects, total match count or
+            None for cursor pages, cursor for the next page or None if there
+            are no more matches).
+
+        Raises:
+            ValueError: If the cursor is invalid or combined with an offset.
+        """
+        sort_by = query_params.get("sort_by", "sent_at")
+        sort_order = query_params.get("sort_order", "desc")
+        if sort_by in _SMS_SORT_FIELDS:
+            sort_key = attrgetter(sort_by)
+            descending = sort_order == "desc"
+            sort = f"{sort_by}:{sort_order}"
+        else:
+            sort_key = unsorted_key
+            descending = False
+            sort = "none"
 
+        offset = query_params.get("offset", 0)
+        limit = query_params.get("limit")
+        cursor = query_params.get("cursor")
+
+        if cursor is not None:
+            if offset:
+                raise ValueError("offset cannot be combined with cursor")
+            after = decode_cursor(cursor, sort)
+            index = self._sort_indexes.get(sort, descending, self.messages, sort_key)
+            candidates = (
+                self.messages[message_id]
+                for message_id in index.iter_ids(after)
+                if message_id in self.messages
+            )
+            results, has_more = collect_page(
+                candidates,
+                lambda batch: self._filter_messages(batch, query_params),
+                limit or None,
+            )
+            total_count = None
+        else:
+            results = self._filter_messages(list(self.messages.values()), query_params)
+
+            # Sort messages
+            if sort_by in _SMS_SORT_FIELDS:
+                results.sort(key=sort_key, reverse=descending)
+
+            # Store total count before pagination
+            total_count = len(results)
+
+            # Apply pagination
+            if offset:
+                results = results[offset:]
+            if limit:
+                results = results[:limit]
+            has_more = bool(limit) and offset + len(results) < total_count
+
+        next_cursor = None
+        if has_more and results:
+            last = results[-1]
+            next_cursor = encode_cursor(sort_key(last), last.message_id, sort)
+
+        return results, total_count, next_cursor
+
+    def _filter_messages(
+        self, results: list[SMSMessageRecord], query_params: dict[str, Any]
+    ) -> list[SMSMessageRecord]:
+        """Apply query filters to a list of messages, preserving its order.
+
+        Args:
+            results: Messages to filter.
+            query_params: Query filters (see query() for supported parameters).
+
+        Returns:
+            The messages that match every filter.
+        """
         # Filter by thread_id
         if query_params.get("thread_id"):
             thread_id = query_params["thread_id"]
@@ -1140,32 +1300,7 @@ class SMSState(ModalityState):
         if until:
             results = [msg for msg in results if msg.sent_at <= until]
 
-        # Sort messages
-        sort_by = query_params.get("sort_by", "sent_at")
-        sort_order = query_params.get("sort_order", "desc")
-        if sort_by in ["sent_at", "from_number", "direction"]:
-            results.sort(
-                key=lambda m: getattr(m, sort_by),
-                reverse=(sort_order == "desc")
-            )
-
-        # Store total count before pagination
-        total_count = len(results)
-
-        # Apply pagination
-        offset = query_params.get("offset", 0)
-        if offset:
-            results = results[offset:]
-        limit = query_params.get("limit")
-        if limit:
-            results = results[:limit]
-
-        return {
-            "messages": [msg.to_dict() for msg in results],
-            "count": len(results),
-            "total_count": total_count,
-            "query_params": query_params,
-        }
+        return results
 
     def get_conversation(self, thread_id: str) -> Optional[SMSConversation]:
         """Retrieve specific conversation.
@@ -1182,7 +1317,7 @@ class SMSState(ModalityState):
         self,
         thread_id: str,
         limit: Optional[int] = None,
-    ) -> list[SMSMessage]:
+    ) -> list[SMSMessageRecord]:
         """Get messages in conversation, ordered by timestamp.
 
         Args:
@@ -1202,7 +1337,7 @@ class SMSState(ModalityState):
 
         return messages
 
-    def get_message(self, message_id: str) -> Optional[SMSMessage]:
+    def get_message(self, message_id: str) -> Optional[SMSMessageRecord]:
         """Retrieve specific message.
 
         Args:
@@ -1304,7 +1439,7 @@ class SMSState(ModalityState):
             )
 
         # Ensure input is validated (auto-generates message_id, etc.)
-        input_data.validate_input()
+        input_data.ensure_valid()
 
         # Common state-level metadata
         base_undo = {
@@ -1699,7 +1834,7 @@ class SMSState(ModalityState):
 
             # Restore removed message due to capacity
             if removed_message:
-                restored_msg = SMSMessage.model_validate(removed_message)
+                restored_msg = SMSMessageRecord.model_validate(removed_message)
                 self.messages[restored_msg.message_id] = restored_msg
 
         # Restore delivery status
@@ -1,17 +1,151 @@
 """Social media input model."""
 
+from typing import Literal, Optional
+
+from pydantic import Field
+
 from models.base_input import ModalityInput
 
 
+SocialMediaOperation = Literal[
+    "post",
+    "reply",
+    "repost",
+    "like",
+    "unlike",
+    "delete",
+    "follow",
+    "unfollow",
+]
+
+# Operations that create a post
+CREATE_OPERATIONS = frozenset({"post", "reply", "repost"})
+
+# Operations that address an existing post by post_id
+POST_OPERATIONS = frozenset({"like", "unlike", "delete"})
+
+
 class SocialMediaInput(ModalityInput):
     """Input for social media events.
 
+    Uses an operation-based design where different attributes are required
+    depending on the operation type. Every operation is performed by
+    user_id: the author of a post, reply or repost, the user liking or
+    deleting a post, or the user following another.
+
     Args:
-        platform: Social media platform (twitter, instagram, facebook, etc.).
-        content: Content of the post/interaction.
-        interaction_type: Type of interaction (post, comment, like, follow, etc.).
-        author: Author information.
-        target_id: Optional target post/user ID for interactions.
+        modality_type: Always "social" for this input type.
+        timestamp: When the event occurred (simulator time).
+        input_id: Unique input identifier (auto-generated).
+        operation: Type of social media operation to perform.
+        user_id: User performing the operation.
+        content: Text of a post or reply, or the comment on a repost.
+        post_id: For post, reply and repost, the new post's ID (defaults to
+            input_id); for like, unlike and delete, the post acted on.
+        reply_to: Post being replied to.
+        repost_of: Post being reposted.
+        target_user_id: User to follow or unfollow.
     """
 
-    pass
+    modality_type: Literal["social"] = Field(default="social", frozen=True)
+    operation: SocialMediaOperation = Field(description="Type of social media operation")
+    user_id: str = Field(description="User performing the operation")
+    content: Optional[str] = Field(default=None, description="Post text")
+    post_id: Optional[str] = Field(default=None, description="Post ID")
+    reply_to: Optional[str] = Field(default=None, description="Post being replied to")
+    repost_of: Optional[str] = Field(default=None, description="Post being reposted")
+    target_user_id: Optional[str] = Field(
+        default=None, description="User to follow or unfollow"
+    )
+
+    @property
+    def new_post_id(self) -> str:
+        """ID of the post a post, reply or repost creates."""
+        return self.post_id or self.input_id
+
+    def validate_input(self) -> None:
+        """Perform modality-specific validation beyond Pydantic field validation.
+
+        Validates that required fields are present for each operation type.
+
+        Raises:
+            ValueError: If validation fails with descriptive message.
+        """
+        op = self.operation
+
+        if op in ("post", "reply") and not self.content:
+            raise ValueError(f"Operation '{op}' requires content")
+
+        if op == "reply" and not self.reply_to:
+            raise ValueError(f"Operation '{op}' requires reply_to")
+
+        if op == "repost" and not self.repost_of:
+            raise ValueError(f"Operation '{op}' requires repost_of")
+
+        if op in POST_OPERATIONS and not self.post_id:
+            raise ValueError(f"Operation '{op}' requires post_id")
+
+        if op in ("follow", "unfollow"):
+            if not self.target_user_id:
+                raise ValueError(f"Operation '{op}' requires target_user_id")
+            if self.target_user_id == self.user_id:
+                raise ValueError(f"User '{self.user_id}' cannot {op} themselves")
+
+    def get_affected_entities(self) -> list[str]:
+        """Return list of entity IDs affected by this input.
+
+        Returns:
+            List containing the post or user affected.
+        """
+        if self.operation in ("follow", "unfollow"):
+            return [f"user:{self.user_id}", f"user:{self.target_user_id}"]
+        if self.operation in CREATE_OPERATIONS:
+            entities = [f"post:{self.new_post_id}"]
+            parent = self.reply_to or self.repost_of
+            if parent:
+                entities.append(f"post:{parent}")
+            return entities
+        return [f"post:{self.post_id}"]
+
+    def get_summary(self) -> str:
+        """Return human-readable one-line summary of this input.
+
+        Returns:
+            Brief description of the operation for logging/UI display.
+        """
+        op = self.operation
+        user = f"@{self.user_id}"
+        preview = ""
+        if self.content:
+            preview = self.content[:50] + ("..." if len(self.content) > 50 else "")
+
+        if op == "post":
+            return f"{user} posted: {preview}"
+        if op == "reply":
+            return f"{user} replied to {self.reply_to}: {preview}"
+        if op == "repost":
+            return f"{user} reposted {self.repost_of}"
+        if op == "like":
+            return f"{user} liked {self.post_id}"
+        if op == "unlike":
+            return f"{user} unliked {self.post_id}"
+        if op == "delete":
+            return f"{user} deleted {self.post_id}"
+        if op == "follow":
+            return f"{user} followed @{self.target_user_id}"
+        if op == "unfollow":
+            return f"{user} unfollowed @{self.target_user_id}"
+        return f"Social media operation: {op}"
+
+    def should_merge_with(self, other: ModalityInput) -> bool:
+        """Determine if this input should be merged with another input.
+
+        Social media events are not merged; each is a distinct change.
+
+        Args:
+            other: Another input to compare against.
+
+        Returns:
+            Always False for social media events.
+        """
+        return False
@@ -1,16 +1,626 @@
 """Social media state model."""
 
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from models.base_input import ModalityInput
 from models.base_state import ModalityState
+from models.modalities.social_input import CREATE_OPERATIONS, SocialMediaInput
+from models.modalities.social_timeline import (
+    TIMELINE_LIMIT,
+    Timeline,
+    decayed_score,
+    rank_key,
+)
+from models.pagination import decode_cursor, encode_cursor
+
+
+class SocialPost(BaseModel):
+    """A post, reply or repost.
+
+    Args:
+        post_id: Unique post identifier.
+        author: User ID of the author.
+        content: Text of the post, or the comment on a repost.
+        created_at: When the post was created.
+        reply_to: Post this replies to, for replies.
+        repost_of: Post this reposts, for reposts.
+        liked_by: Users who liked the post.
+        reply_count: Number of replies.
+        repost_count: Number of reposts.
+    """
+
+    post_id: str = Field(description="Unique post identifier")
+    author: str = Field(description="Author user ID")
+    content: Optional[str] = Field(default=None, description="Post text")
+    created_at: datetime = Field(description="When the post was created")
+    reply_to: Optional[str] = Field(default=None, description="Post replied to")
+    repost_of: Optional[str] = Field(default=None, description="Post reposted")
+    liked_by: set[str] = Field(default_factory=set, description="Users who liked the post")
+    reply_count: int = Field(default=0, description="Number of replies", ge=0)
+    repost_count: int = Field(default=0, description="Number of reposts", ge=0)
+
+    @property
+    def rank_key(self) -> float:
+        """Time-independent rank key; see models/modalities/social_timeline.py."""
+        return rank_key(self.created_at, len(self.liked_by), self.reply_count, self.repost_count)
 
 
 class SocialMediaState(ModalityState):
     """Current social media state.
 
+    Posts, replies and reposts are stored by ID with their engagement, and
+    the follower graph as each user's set of followed accounts. Feeds are
+    served from per-user Timelines (see social_timeline.py): ranked buffers
+    of the best posts by a user and the accounts they follow. A timeline is
+    built the first time its user's feed is read (the simulated user's when
+    the state is created) and from then on kept up to date as posts are
+    written, liked, replied to, reposted or deleted and as the user follows
+    and unfollows, so reading a feed page costs O(page).
+
     Args:
-        feeds: Dictionary mapping platform names to feed content.
-        posts: Dictionary mapping post IDs to post data.
-        follows: Dictionary mapping platform names to list of followed accounts.
-        notifications: List of social media notifications.
+        modality_type: Always "social" for this state type.
+        last_updated: When state was last modified.
+        update_count: Number of operations applied.
+        user_id: ID of the simulated user.
+        posts: Dictionary mapping post IDs to posts.
+        following: Dictionary mapping user IDs to the users they follow.
+        timeline_limit: Maximum number of posts kept in each timeline.
     """
 
-    pass
+    modality_type: str = Field(default="social", frozen=True)
+    user_id: str = Field(default="user", description="ID of the simulated user")
+    posts: dict[str, SocialPost] = Field(default_factory=dict, description="Posts by ID")
+    following: dict[str, set[str]] = Field(
+        default_factory=dict, description="Users each user follows"
+    )
+    timeline_limit: int = Field(
+        default=TIMELINE_LIMIT, description="Maximum posts per timeline", ge=1
+    )
+    # Indexes derived from posts and following
+    _followers: dict[str, set[str]] = PrivateAttr(default_factory=dict)
+    _authored: dict[str, list[str]] = PrivateAttr(default_factory=dict)
+    _replies: dict[str, list[str]] = PrivateAttr(default_factory=dict)
+    _timelines: dict[str, Timeline] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the follower, author and reply indexes.
+
+        Args:
+            __context: Pydantic context (unused).
+        """
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Rebuild every derived index from posts and following."""
+        self._followers = {}
+        for user, followees in self.following.items():
+            for followee in followees:
+                self._followers.setdefault(followee, set()).add(user)
+        self._authored = {}
+        self._replies = {}
+        for post in sorted(self.posts.values(), key=self._order_key):
+            if post.reply_to is not None:
+                self._replies.setdefault(post.reply_to, []).append(post.post_id)
+            else:
+                self._authored.setdefault(post.author, []).append(post.post_id)
+        self._timelines = {}
+        self._timeline(self.user_id)
+
+    def _order_key(self, post: SocialPost | str) -> tuple[datetime, str]:
+        """Return the chronological sort key of a post or post ID."""
+        if isinstance(post, str):
+            post = self.posts[post]
+        return post.created_at, post.post_id
+
+    def _timeline(self, user: str) -> Timeline:
+        """Return a user's timeline, building it on first use."""
+        timeline = self._timelines.get(user)
+        if timeline is None:
+            timeline = self._timelines[user] = self._build_timeline(user)
+        return timeline
+
+    def _build_timeline(self, user: str) -> Timeline:
+        """Build a user's timeline from their own and their followees' posts."""
+        candidates = []
+        for author in (user, *self.following.get(user, ())):
+            for post_id in self._authored.get(author, ()):
+                candidates.append((post_id, self.posts[post_id].rank_key))
+        return Timeline.build(candidates, self.timeline_limit)
+
+    def _audience(self, author: str) -> list[str]:
+        """Return the users whose feeds include an author's posts."""
+        return [author, *self._followers.get(author, ())]
+
+    def apply_input(self, input_data: ModalityInput) -> None:
+        """Apply a social media input to modify this state.
+
+        Dispatches to operation-specific handlers based on operation type.
+
+        Args:
+            input_data: The SocialMediaInput to apply to this state.
+
+        Raises:
+            ValueError: If input_data is not a SocialMediaInput or the
+                operation is invalid for the current state.
+        """
+        if not isinstance(input_data, SocialMediaInput):
+            raise ValueError(
+                f"SocialMediaState can only apply SocialMediaInput, got {type(input_data)}"
+            )
+
+        input_data.ensure_valid()
+
+        operation_handlers = {
+            "post": self._handle_create,
+            "reply": self._handle_create,
+            "repost": self._handle_create,
+            "like": self._handle_like,
+            "unlike": self._handle_unlike,
+            "delete": self._handle_delete,
+            "follow": self._handle_follow,
+            "unfollow": self._handle_unfollow,
+        }
+
+        handler = operation_handlers.get(input_data.operation)
+        if handler:
+            handler(input_data)
+            self.last_updated = input_data.timestamp
+            self.update_count += 1
+        else:
+            raise ValueError(f"Unknown operation: {input_data.operation}")
+
+    def get_post(self, post_id: str) -> SocialPost:
+        """Return a post.
+
+        Raises:
+            ValueError: If the post does not exist.
+        """
+        post = self.posts.get(post_id)
+        if post is None:
+            raise ValueError(f"Post '{post_id}' not found")
+        return post
+
+    def _handle_create(self, input_data: SocialMediaInput) -> None:
+        """Handle creating a post, reply or repost.
+
+        Reposting a repost reposts the original post.
+
+        Raises:
+            ValueError: If the post ID is taken or the post replied to or
+                reposted does not exist.
+        """
+        post_id = input_data.new_post_id
+        if post_id in self.posts:
+            raise ValueError(f"Post '{post_id}' already exists")
+        reply_to = repost_of = None
+        if input_data.operation == "reply":
+            reply_to = self.get_post(input_data.reply_to).post_id
+        elif input_data.operation == "repost":
+            original = self.get_post(input_data.repost_of)
+            repost_of = original.repost_of or original.post_id
+            self.get_post(repost_of)
+        self._add_post(
+            SocialPost(
+                post_id=post_id,
+                author=input_data.user_id,
+                content=input_data.content,
+                created_at=input_data.timestamp,
+                reply_to=reply_to,
+                repost_of=repost_of,
+            )
+        )
+
+    def _handle_like(self, input_data: SocialMediaInput) -> None:
+        """Handle liking a post.
+
+        Raises:
+            ValueError: If the post does not exist or is already liked.
+        """
+        post = self.get_post(input_data.post_id)
+        if input_data.user_id in post.liked_by:
+            raise ValueError(f"User '{input_data.user_id}' already likes post '{post.post_id}'")
+        old_key = post.rank_key
+        post.liked_by.add(input_data.user_id)
+        self._rerank(post, old_key)
+
+    def _handle_unlike(self, input_data: SocialMediaInput) -> None:
+        """Handle removing a like from a post.
+
+        Raises:
+            ValueError: If the post does not exist or is not liked.
+        """
+        post = self.get_post(input_data.post_id)
+        if input_data.user_id not in post.liked_by:
+            raise ValueError(f"User '{input_data.user_id}' does not like post '{post.post_id}'")
+        old_key = post.rank_key
+        post.liked_by.discard(input_data.user_id)
+        self._rerank(post, old_key)
+
+    def _handle_delete(self, input_data: SocialMediaInput) -> None:
+        """Handle deleting a post.
+
+        Replies to and reposts of the deleted post are kept.
+
+        Raises:
+            ValueError: If the post does not exist or belongs to another user.
+        """
+        post = self.get_post(input_data.post_id)
+        if post.author != input_data.user_id:
+            raise ValueError(
+                f"User '{input_data.user_id}' cannot delete post '{post.post_id}' "
+                f"by '{post.author}'"
+            )
+        self._remove_post(post)
+
+    def _handle_follow(self, input_data: SocialMediaInput) -> None:
+        """Handle following a user.
+
+        Raises:
+            ValueError: If the user already follows the target.
+        """
+        if input_data.target_user_id in self.following.get(input_data.user_id, ()):
+            raise ValueError(
+                f"User '{input_data.user_id}' already follows '{input_data.target_user_id}'"
+            )
+        self._follow(input_data.user_id, input_data.target_user_id)
+
+    def _handle_unfollow(self, input_data: SocialMediaInput) -> None:
+        """Handle unfollowing a user.
+
+        Raises:
+            ValueError: If the user does not follow the target.
+        """
+        if input_data.target_user_id not in self.following.get(input_data.user_id, ()):
+            raise ValueError(
+                f"User '{input_data.user_id}' does not follow '{input_data.target_user_id}'"
+            )
+        self._unfollow(input_data.user_id, input_data.target_user_id)
+
+    def _add_post(self, post: SocialPost) -> None:
+        """Store a post, count it on its parent, and fan it out to timelines."""
+        self.posts[post.post_id] = post
+        if post.reply_to is not None:
+            insort(self._replies.setdefault(post.reply_to, []), post.post_id, key=self._order_key)
+            parent = self.posts.get(post.reply_to)
+            if parent is not None:
+                old_key = parent.rank_key
+                parent.reply_count += 1
+                self._rerank(parent, old_key)
+            return
+
+        insort(self._authored.setdefault(post.author, []), post.post_id, key=self._order_key)
+        key = post.rank_key
+        for user in self._audience(post.author):
+            timeline = self._timelines.get(user)
+            if timeline is not None:
+                timeline.offer(post.post_id, key)
+        original = self.posts.get(post.repost_of) if post.repost_of else None
+        if original is not None:
+            old_key = original.rank_key
+            original.repost_count += 1
+            self._rerank(original, old_key)
+
+    def _remove_post(self, post: SocialPost) -> None:
+        """Remove a post, uncount it on its parent, and retract it from timelines."""
+        del self.posts[post.post_id]
+        if post.reply_to is not None:
+            self._unlist(self._replies, post.reply_to, post)
+            parent = self.posts.get(post.reply_to)
+            if parent is not None:
+                old_key = parent.rank_key
+                parent.reply_count -= 1
+                self._rerank(parent, old_key)
+            return
+
+        self._unlist(self._authored, post.author, post)
+        for user in self._audience(post.author):
+            timeline = self._timelines.get(user)
+            if timeline is not None and timeline.remove(post.post_id) and timeline.truncated:
+                self._timelines[user] = self._build_timeline(user)
+        original = self.posts.get(post.repost_of) if post.repost_of else None
+        if original is not None:
+            old_key = original.rank_key
+            original.repost_count -= 1
+            self._rerank(original, old_key)
+
+    def _unlist(self, index: dict[str, list[str]], owner: str, post: SocialPost) -> None:
+        """Remove a post (no longer in self.posts) from a chronological index."""
+        post_ids = index[owner]
+        order = self._order_key(post)
+        position = bisect_left(
+            post_ids,
+            order,
+            key=lambda post_id: order if post_id == post.post_id else self._order_key(post_id),
+        )
+        del post_ids[position]
+        if not post_ids:
+            del index[owner]
+
+    def _rerank(self, post: SocialPost, old_key: float) -> None:
+        """Move a post whose engagement changed within the timelines holding it.
+
+        A post that rises may enter a full timeline it was evicted from; a
+        post that falls in a truncated timeline may now rank below a post
+        that was evicted, so that timeline is rebuilt.
+        """
+        if post.reply_to is not None:
+            return
+        key = post.rank_key
+        for user in self._audience(post.author):
+            timeline = self._timelines.get(user)
+            if timeline is None:
+                continue
+            if timeline.remove(post.post_id):
+                if key < old_key and timeline.truncated:
+                    self._timelines[user] = self._build_timeline(user)
+                else:
+                    timeline.offer(post.post_id, key)
+            elif key > old_key:
+                timeline.offer(post.post_id, key)
+
+    def _follow(self, user: str, target: str) -> None:
+        """Add a follow and merge the target's posts into the user's timeline."""
+        self.following.setdefault(user, set()).add(target)
+        self._followers.setdefault(target, set()).add(user)
+        timeline = self._timelines.get(user)
+        if timeline is not None:
+            for post_id in self._authored.get(target, ()):
+                timeline.offer(post_id, self.posts[post_id].rank_key)
+
+    def _unfollow(self, user: str, target: str) -> None:
+        """Remove a follow and the target's posts from the user's timeline."""
+        followees = self.following[user]
+        followees.discard(target)
+        if not followees:
+            del self.following[user]
+        followers = self._followers[target]
+        followers.discard(user)
+        if not followers:
+            del self._followers[target]
+        timeline = self._timelines.get(user)
+        if timeline is not None:
+            removed = [timeline.remove(post_id) for post_id in self._authored.get(target, ())]
+            if any(removed) and timeline.truncated:
+                self._timelines[user] = self._build_timeline(user)
+
+    def _render(self, post: SocialPost, now: datetime, nested: bool = True) -> dict[str, Any]:
+        """Return a post dictionary for query results.
+
+        Adds like_count, whether the simulated user liked the post, its
+        current decayed score, and for reposts the original post.
+        """
+        result = post.model_dump(mode="json", exclude={"liked_by"})
+        result["like_count"] = len(post.liked_by)
+        result["liked"] = self.user_id in post.liked_by
+        result["score"] = decayed_score(post.rank_key, now)
+        if nested and post.repost_of is not None:
+            original = self.posts.get(post.repost_of)
+            result["repost"] = self._render(original, now, nested=False) if original else None
+        return result
+
+    def get_snapshot(self) -> dict[str, Any]:
+        """Return a complete snapshot of current state for API responses.
+
+        Includes the first page of the simulated user's feed rather than
+        every post.
+
+        Returns:
+            Dictionary representation of current state.
+        """
+        feed = self.query({"limit": 20})
+        return {
+            "modality_type": self.modality_type,
+            "last_updated": self.last_updated.isoformat(),
+            "update_count": self.update_count,
+            "user_id": self.user_id,
+            "post_count": len(self.posts),
+            "following": sorted(self.following.get(self.user_id, ())),
+            "follower_count": len(self._followers.get(self.user_id, ())),
+            "feed": feed["posts"],
+            "next_cursor": feed["next_cursor"],
+        }
+
+    def validate_state(self) -> list[str]:
+        """Validate internal state consistency and return any issues.
+
+        Returns:
+            List of validation error messages (empty list if valid).
+        """
+        errors = []
+        for post_id, post in self.posts.items():
+            if post.post_id != post_id:
+                errors.append(f"Post key '{post_id}' does not match its ID")
+            if post.reply_to is not None and post.repost_of is not None:
+                errors.append(f"Post '{post_id}' is both a reply and a repost")
+        for user, followees in self.following.items():
+            if user in followees:
+                errors.append(f"User '{user}' follows themselves")
+        for user, timeline in self._timelines.items():
+            if len(timeline) > self.timeline_limit:
+                errors.append(f"Timeline of '{user}' exceeds the timeline limit")
+        return errors
+
+    def query(self, query_params: dict[str, Any]) -> dict[str, Any]:
+        """Execute a query against this state.
+
+        What is returned depends on the parameters given:
+        - replies_to: replies to a post, oldest first.
+        - author: a user's posts and reposts, newest first.
+        - followers_of / following_of: a user's followers or followees.
+        - Otherwise: a page of a user's ranked feed, best first.
+
+        Supported query parameters:
+            - feed_of: str - User whose feed to read (default: the simulated
+              user)
+            - cursor: str - Continue a feed after a previous page's
+              next_cursor
+            - as_of: datetime - Time to compute scores at (default:
+              last_updated)
+            - replies_to: str - Post whose replies to list
+            - author: str - User whose posts to list
+            - followers_of: str - User whose followers to list
+            - following_of: str - User whose followees to list
+            - limit: int - Maximum number of results (default: 20)
+            - offset: int - Results to skip (except feeds, which use cursor)
+
+        Args:
+            query_params: Dictionary of query parameters.
+
+        Returns:
+            Dictionary containing query results:
+                - posts: Matching posts, with like_count, liked and score.
+                - users: Matching user IDs, for follower queries.
+                - count: Number of results returned.
+                - next_cursor: Cursor for the next feed page, or None.
+
+        Raises:
+            ValueError: If the post replied to does not exist or the cursor
+                is invalid.
+        """
+        now = query_params.get("as_of") or self.last_updated
+        limit = query_params.get("limit") or 20
+        offset = query_params.get("offset") or 0
+        posts: list[dict[str, Any]] = []
+        users: list[str] = []
+        next_cursor = None
+
+        if query_params.get("replies_to"):
+            post_id = query_params["replies_to"]
+            self.get_post(post_id)
+            reply_ids = self._replies.get(post_id, [])[offset : offset + limit]
+            posts = [self._render(self.posts[reply_id], now) for reply_id in reply_ids]
+        elif query_params.get("author"):
+            authored = self._authored.get(query_params["author"], [])
+            stop = len(authored) - offset
+            post_ids = authored[max(stop - limit, 0) : max(stop, 0)][::-1]
+            posts = [self._render(self.posts[post_id], now) for post_id in post_ids]
+        elif query_params.get("followers_of"):
+            followers = sorted(self._followers.get(query_params["followers_of"], ()))
+            users = followers[offset : offset + limit]
+        elif query_params.get("following_of"):
+            followees = sorted(self.following.get(query_params["following_of"], ()))
+            users = followees[offset : offset + limit]
+        else:
+            user = query_params.get("feed_of") or self.user_id
+            sort = f"feed:{user}"
+            after = None
+            if query_params.get("cursor"):
+                after = decode_cursor(query_params["cursor"], sort)
+            page, has_more = self._timeline(user).page(after, limit)
+            posts = [self._render(self.posts[post_id], now) for post_id, _ in page]
+            if has_more:
+                post_id, key = page[-1]
+                next_cursor = encode_cursor(key, post_id, sort)
+
+        return {
+            "posts": posts,
+            "users": users,
+            "count": len(posts) + len(users),
+            "next_cursor": next_cursor,
+        }
+
+    def clear(self) -> None:
+        """Reset social media state to empty defaults."""
+        self.posts.clear()
+        self.following.clear()
+        self.update_count = 0
+        self._reindex()
+
+    def create_undo_data(self, input_data: ModalityInput) -> dict[str, Any]:
+        """Capture minimal data needed to undo applying an input.
+
+        Args:
+            input_data: The SocialMediaInput that will be applied.
+
+        Returns:
+            Dictionary containing minimal data needed to undo the operation.
+        """
+        if not isinstance(input_data, SocialMediaInput):
+            raise ValueError(
+                "SocialMediaState can only create undo data for SocialMediaInput, "
+                f"got {type(input_data)}"
+            )
+
+        base_undo = {
+            "state_previous_update_count": self.update_count,
+            "state_previous_last_updated": self.last_updated.isoformat(),
+        }
+
+        operation = input_data.operation
+        user = input_data.user_id
+
+        if operation in CREATE_OPERATIONS:
+            if input_data.new_post_id in self.posts:
+                return {**base_undo, "action": "noop"}
+            return {**base_undo, "action": "remove_post", "post_id": input_data.new_post_id}
+
+        if operation in ("follow", "unfollow"):
+            follows = input_data.target_user_id in self.following.get(user, ())
+            if follows == (operation == "follow"):
+                return {**base_undo, "action": "noop"}
+            return {
+                **base_undo,
+                "action": operation,
+                "user_id": user,
+                "target_user_id": input_data.target_user_id,
+            }
+
+        post = self.posts.get(input_data.post_id)
+        if post is None:
+            return {**base_undo, "action": "noop"}
+
+        if operation == "delete":
+            return {**base_undo, "action": "restore_post", "post": post.model_dump(mode="json")}
+
+        return {
+            **base_undo,
+            "action": "set_like",
+            "post_id": post.post_id,
+            "user_id": user,
+            "liked": user in post.liked_by,
+        }
+
+    def apply_undo(self, undo_data: dict[str, Any]) -> None:
+        """Apply undo data to reverse a previous input application.
+
+        Args:
+            undo_data: Dictionary returned by create_undo_data().
+
+        Raises:
+            ValueError: If undo_data is invalid.
+        """
+        action = undo_data.get("action")
+        if not action:
+            raise ValueError("Undo data missing 'action' field")
+
+        if action == "remove_post":
+            self._remove_post(self.get_post(undo_data["post_id"]))
+
+        elif action == "restore_post":
+            self._add_post(SocialPost.model_validate(undo_data["post"]))
+
+        elif action in ("follow", "unfollow"):
+            user, target = undo_data["user_id"], undo_data["target_user_id"]
+            if action == "follow":
+                self._unfollow(user, target)
+            else:
+                self._follow(user, target)
+
+        elif action == "set_like":
+            post = self.get_post(undo_data["post_id"])
+            old_key = post.rank_key
+            if undo_data["liked"]:
+                post.liked_by.add(undo_data["user_id"])
+            else:
+                post.liked_by.discard(undo_data["user_id"])
+            self._rerank(post, old_key)
+
+        elif action != "noop":
+            raise ValueError(f"Unknown undo action: {action}")
+
+        self.update_count = undo_data["state_previous_update_count"]
+        self.last_updated = datetime.fromisoformat(undo_data["state_previous_last_updated"])
@@ -0,0 +1,183 @@
+"""Rank scores and per-user timeline buffers for the social modality.
+
+A feed shows the posts of the accounts a user follows, best first, where a
+post's score is its engagement decayed by age:
+
+    score(t) = (1 + likes * LIKE_WEIGHT + replies * REPLY_WEIGHT
+                + reposts * REPOST_WEIGHT) * 2 ** (-(t - created_at) / HALF_LIFE)
+
+Every post decays by the same factor as simulator time advances, so the
+order of two posts never depends on the current time. Comparing the
+logarithm of the score with the time term factored out,
+
+    rank_key = log(engagement) + created_at / HALF_LIFE * log(2),
+
+gives the same order at every t. A post's rank key only changes when its
+engagement does, so ranks are updated incrementally on likes, replies and
+reposts and never recomputed as time passes; score(t) is recovered from the
+key for display.
+
+Each user's Timeline holds the keys of the best TIMELINE_LIMIT posts among
+their own and their followees' posts, kept sorted. New posts are pushed to
+the timelines of the author's followers when they are written (fan-out on
+write), so reading a page of a feed is a slice of a sorted list.
+"""
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+# Engagement weights of the rank score
+LIKE_WEIGHT = 1.0
+REPLY_WEIGHT = 2.0
+REPOST_WEIGHT = 3.0
+
+# Age at which a post's score has halved
+HALF_LIFE = timedelta(hours=6)
+
+# Posts kept per timeline
+TIMELINE_LIMIT = 800
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_DECAY_PER_SECOND = math.log(2) / HALF_LIFE.total_seconds()
+
+
+def _seconds(timestamp: datetime) -> float:
+    """Return seconds since the epoch, treating naive datetimes as UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - _EPOCH).total_seconds()
+
+
+def engagement(likes: int, replies: int, reposts: int) -> float:
+    """Return the undecayed rank score of a post."""
+    return 1.0 + likes * LIKE_WEIGHT + replies * REPLY_WEIGHT + reposts * REPOST_WEIGHT
+
+
+def rank_key(created_at: datetime, likes: int, replies: int, reposts: int) -> float:
+    """Return a post's time-independent rank key (higher ranks first).
+
+    Args:
+        created_at: When the post was created.
+        likes: Number of likes.
+        replies: Number of replies.
+        reposts: Number of reposts.
+
+    Returns:
+        log(engagement) plus the post's creation time in decay units.
+    """
+    return math.log(engagement(likes, replies, reposts)) + _seconds(created_at) * _DECAY_PER_SECOND
+
+
+def decayed_score(key: float, now: datetime) -> float:
+    """Return the score at a time of a post with a given rank key."""
+    return math.exp(key - _seconds(now) * _DECAY_PER_SECOND)
+
+
+class Timeline:
+    """The best posts for one user's feed, sorted by rank key.
+
+    Entries are (-key, post_id) pairs in ascending order, so the best post
+    comes first and ties are broken by post ID. Once the timeline holds
+    limit posts, offering a post that ranks below all of them is a no-op,
+    and adding a better one evicts the worst. A timeline that has evicted
+    posts is marked truncated: if one of its posts later drops in rank or
+    leaves, an evicted post may now belong in it, so the owner rebuilds it.
+
+    Args:
+        limit: Maximum number of posts kept.
+    """
+
+    __slots__ = ("limit", "truncated", "_entries", "_keys")
+
+    def __init__(self, limit: int = TIMELINE_LIMIT) -> None:
+        self.limit = limit
+        self.truncated = False
+        self._entries: list[tuple[float, str]] = []
+        self._keys: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, post_id: object) -> bool:
+        return post_id in self._keys
+
+    def key(self, post_id: str) -> Optional[float]:
+        """Return the rank key a post is held at, or None."""
+        return self._keys.get(post_id)
+
+    def offer(self, post_id: str, key: float) -> bool:
+        """Add a post if it ranks among the best limit posts.
+
+        Args:
+            post_id: Post to add. Must not already be in the timeline.
+            key: The post's rank key.
+
+        Returns:
+            Whether the post was added.
+        """
+        entry = (-key, post_id)
+        if len(self._entries) >= self.limit:
+            if entry >= self._entries[-1]:
+                self.truncated = True
+                return False
+            _, evicted = self._entries.pop()
+            del self._keys[evicted]
+            self.truncated = True
+        insort(self._entries, entry)
+        self._keys[post_id] = key
+        return True
+
+    def remove(self, post_id: str) -> bool:
+        """Remove a post.
+
+        Returns:
+            Whether the post was in the timeline.
+        """
+        key = self._keys.pop(post_id, None)
+        if key is None:
+            return False
+        del self._entries[bisect_left(self._entries, (-key, post_id))]
+        return True
+
+    def page(
+        self, after: Optional[tuple[float, str]] = None, limit: int = 20
+    ) -> tuple[list[tuple[str, float]], bool]:
+        """Return a page of posts, best first.
+
+        Args:
+            after: (key, post_id) of the last post of the previous page, or
+                None for the first page.
+            limit: Page size.
+
+        Returns:
+            Tuple of ((post_id, key) pairs, whether more posts follow).
+        """
+        start = 0 if after is None else bisect_right(self._entries, (-after[0], after[1]))
+        entries = self._entries[start : start + limit + 1]
+        return [(post_id, -key) for key, post_id in entries[:limit]], len(entries) > limit
+
+    def post_ids(self) -> list[str]:
+        """Return every post ID, best first."""
+        return [post_id for _, post_id in self._entries]
+
+    @classmethod
+    def build(cls, candidates: list[tuple[str, float]], limit: int = TIMELINE_LIMIT) -> "Timeline":
+        """Build a timeline from every candidate (post_id, key) pair."""
+        timeline = cls(limit)
+        entries = sorted((-key, post_id) for post_id, key in candidates)
+        timeline.truncated = len(entries) > limit
+        timeline._entries = entries[:limit]
+        timeline._keys = {post_id: -key for key, post_id in timeline._entries}
+        return timeline
+
+    def __deepcopy__(self, memo: dict) -> "Timeline":
+        copied = Timeline(self.limit)
+        copied.truncated = self.truncated
+        copied._entries = list(self._entries)
+        copied._keys = dict(self._keys)
+        return copied
+
+    def __repr__(self) -> str:
+        return f"Timeline(posts={len(self._entries)}, limit={self.limit})"
@@ -0,0 +1,872 @@
+"""Shared input and state models for team chat modalities (Slack, Discord).
+
+Slack and Discord have the same shape: channels grouped into a workspace or
+server, messages with threads, mentions and reactions, and per-channel read
+positions. TeamChatInput and TeamChatState implement that shape once; the
+Slack and Discord modules subclass them with their own naming.
+
+Channel messages live in a ChannelLog (models/modalities/channel_log.py), an
+append-only columnar log with thread and mention indexes, rather than in one
+Pydantic model per message.
+"""
+
+import heapq
+import re
+from collections.abc import Iterator
+from datetime import datetime
+from itertools import islice
+from typing import Any, ClassVar, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from models.base_input import ModalityInput
+from models.base_state import ModalityState
+from models.modalities.channel_log import ChannelLog
+
+TeamChatOperation = Literal[
+    "create_channel",
+    "add_user",
+    "post_message",
+    "edit_message",
+    "delete_message",
+    "add_reaction",
+    "remove_reaction",
+    "mark_read",
+]
+
+# Operations that address an existing message by seq
+MESSAGE_OPERATIONS = frozenset(
+    {"edit_message", "delete_message", "add_reaction", "remove_reaction"}
+)
+
+# "<@U123>", "<@!123>" (Discord nicknames) or a bare "@name"
+MENTION_PATTERN = re.compile(r"<@!?([\w.-]+)>|(?<![\w<])@([\w.-]+)")
+
+# Mentions that notify a whole channel rather than one user
+BROADCAST_MENTIONS = frozenset({"here", "channel", "everyone"})
+
+
+def extract_mentions(text: str) -> list[str]:
+    """Return the IDs of the users a message mentions, in order, once each.
+
+    Args:
+        text: Message text.
+
+    Returns:
+        Mentioned user IDs; channel-wide mentions such as @here are skipped.
+    """
+    found = {}
+    for match in MENTION_PATTERN.finditer(text):
+        user = match.group(1) or match.group(2)
+        if user not in BROADCAST_MENTIONS:
+            found[user] = None
+    return list(found)
+
+
+class TeamChatInput(ModalityInput):
+    """Input for team chat events.
+
+    Uses an operation-based design where different attributes are required
+    depending on the operation type. Messages are addressed by channel_id and
+    message_seq, their position in the channel (0 for the first message).
+
+    Args:
+        operation: Type of team chat operation to perform.
+        channel_id: Channel the operation applies to.
+        channel_name: Display name for create_channel (defaults to the ID).
+        topic: Channel topic for create_channel.
+        is_private: Whether a channel created by create_channel is private.
+        user_id: User for add_user, add_reaction and remove_reaction.
+        display_name: Display name for add_user.
+        author: Author of a posted message.
+        text: Message text for post_message and edit_message.
+        thread_seq: For post_message, the message being replied to in a
+            thread.
+        message_seq: Message for edit, delete and reactions; for mark_read,
+            the last message read (default: the latest).
+        emoji: Emoji name for add_reaction and remove_reaction.
+    """
+
+    operation: TeamChatOperation = Field(description="Type of team chat operation")
+    channel_id: Optional[str] = Field(default=None, description="Channel ID")
+    channel_name: Optional[str] = Field(default=None, description="Channel display name")
+    topic: Optional[str] = Field(default=None, description="Channel topic")
+    is_private: bool = Field(default=False, description="Whether the channel is private")
+    user_id: Optional[str] = Field(default=None, description="User ID")
+    display_name: Optional[str] = Field(default=None, description="User display name")
+    author: Optional[str] = Field(default=None, description="Message author user ID")
+    text: Optional[str] = Field(default=None, description="Message text")
+    thread_seq: Optional[int] = Field(
+        default=None, description="Message being replied to in a thread", ge=0
+    )
+    message_seq: Optional[int] = Field(
+        default=None, description="Message sequence number in the channel", ge=0
+    )
+    emoji: Optional[str] = Field(default=None, description="Reaction emoji name")
+
+    @property
+    def space_id(self) -> Optional[str]:
+        """ID of the workspace or server a created channel belongs to."""
+        return None
+
+    def validate_input(self) -> None:
+        """Perform modality-specific validation beyond Pydantic field validation.
+
+        Validates that required fields are present for each operation type.
+
+        Raises:
+            ValueError: If validation fails with descriptive message.
+        """
+        op = self.operation
+
+        if op == "add_user":
+            if not self.user_id:
+                raise ValueError(f"Operation '{op}' requires user_id")
+            return
+
+        if not self.channel_id:
+            raise ValueError(f"Operation '{op}' requires channel_id")
+
+        if op == "post_message":
+            if not self.author:
+                raise ValueError(f"Operation '{op}' requires author")
+            if self.text is None:
+                raise ValueError(f"Operation '{op}' requires text")
+
+        if op in MESSAGE_OPERATIONS and self.message_seq is None:
+            raise ValueError(f"Operation '{op}' requires message_seq")
+
+        if op == "edit_message" and self.text is None:
+            raise ValueError(f"Operation '{op}' requires text")
+
+        if op in ("add_reaction", "remove_reaction"):
+            if not self.emoji:
+                raise ValueError(f"Operation '{op}' requires emoji")
+            if not self.user_id:
+                raise ValueError(f"Operation '{op}' requires user_id")
+
+    def get_affected_entities(self) -> list[str]:
+        """Return list of entity IDs affected by this input.
+
+        Returns:
+            List containing the channel, message or user affected.
+        """
+        if self.operation == "add_user":
+            return [f"user:{self.user_id}"]
+        if self.message_seq is not None and self.operation != "mark_read":
+            return [f"message:{self.channel_id}/{self.message_seq}"]
+        return [f"channel:{self.channel_id}"]
+
+    def get_summary(self) -> str:
+        """Return human-readable one-line summary of this input.
+
+        Returns:
+            Brief description of the operation for logging/UI display.
+        """
+        op = self.operation
+        channel = f"#{self.channel_id}"
+
+        if op == "create_channel":
+            return f"Create channel {channel}"
+        if op == "add_user":
+            return f"Add user {self.display_name or self.user_id}"
+        if op == "post_message":
+            preview = self.text[:50] + ("..." if len(self.text) > 50 else "")
+            where = f"thread {self.thread_seq} in {channel}" if self.thread_seq is not None else channel
+            return f"{self.author} in {where}: {preview}"
+        if op == "edit_message":
+            return f"Edit message {self.message_seq} in {channel}"
+        if op == "delete_message":
+            return f"Delete message {self.message_seq} in {channel}"
+        if op == "add_reaction":
+            return f"{self.user_id} reacted :{self.emoji}: to message {self.message_seq} in {channel}"
+        if op == "remove_reaction":
+            return f"{self.user_id} removed :{self.emoji}: from message {self.message_seq} in {channel}"
+        if op == "mark_read":
+            return f"Mark {channel} read"
+        return f"Team chat operation: {op}"
+
+    def should_merge_with(self, other: ModalityInput) -> bool:
+        """Determine if this input should be merged with another input.
+
+        Team chat events are not merged; each is a distinct change.
+
+        Args:
+            other: Another input to compare against.
+
+        Returns:
+            Always False for team chat events.
+        """
+        return False
+
+
+class TeamChatUser(BaseModel):
+    """A user known to a team chat.
+
+    Args:
+        user_id: User ID.
+        display_name: Name shown for the user.
+        added_at: When the user was added.
+    """
+
+    user_id: str = Field(description="User ID")
+    display_name: str = Field(description="Name shown for the user")
+    added_at: datetime = Field(description="When the user was added")
+
+
+class TeamChannel(BaseModel):
+    """A channel and its message log.
+
+    Args:
+        channel_id: Channel ID.
+        name: Display name.
+        space_id: Workspace (Slack) or server (Discord) ID, if any.
+        topic: Channel topic.
+        is_private: Whether the channel is private.
+        created_at: When the channel was created.
+        last_read_seq: Seq of the last message the simulated user has read
+            (-1 if none).
+        log: The channel's messages.
+    """
+
+    channel_id: str = Field(description="Channel ID")
+    name: str = Field(description="Display name")
+    space_id: Optional[str] = Field(default=None, description="Workspace or server ID")
+    topic: Optional[str] = Field(default=None, description="Channel topic")
+    is_private: bool = Field(default=False, description="Whether the channel is private")
+    created_at: datetime = Field(description="When the channel was created")
+    last_read_seq: int = Field(default=-1, description="Last message read")
+    log: ChannelLog = Field(default_factory=ChannelLog, description="Channel messages")
+
+    class Config:
+        """Pydantic configuration."""
+
+        arbitrary_types_allowed = True
+
+
+class TeamChatState(ModalityState):
+    """Current team chat state.
+
+    State is kept from the point of view of one simulated user (user_id):
+    read positions, unread counts and unread mentions are theirs. Posting a
+    message as that user marks its channel read up to the message.
+
+    Args:
+        user_id: ID of the simulated user.
+        channels: Dictionary mapping channel IDs to channels and their logs.
+        users: Dictionary mapping user IDs to user information.
+    """
+
+    # Name of the grouping channels belong to, used in snapshots and queries
+    space_label: ClassVar[str] = "space"
+
+    user_id: str = Field(default="user", description="ID of the simulated user")
+    channels: dict[str, TeamChannel] = Field(
+        default_factory=dict, description="Channels by ID"
+    )
+    users: dict[str, TeamChatUser] = Field(default_factory=dict, description="Users by ID")
+
+    class Config:
+        """Pydantic configuration."""
+
+        arbitrary_types_allowed = True
+
+    input_class: ClassVar[type[TeamChatInput]] = TeamChatInput
+
+    def apply_input(self, input_data: ModalityInput) -> None:
+        """Apply a team chat input to modify this state.
+
+        Dispatches to operation-specific handlers based on operation type.
+
+        Args:
+            input_data: The input to apply to this state.
+
+        Raises:
+            ValueError: If input_data is of the wrong type or the operation
+                is invalid for the current state.
+        """
+        if not isinstance(input_data, self.input_class):
+            raise ValueError(
+                f"{type(self).__name__} can only apply {self.input_class.__name__}, "
+                f"got {type(input_data)}"
+            )
+
+        input_data.ensure_valid()
+
+        operation_handlers = {
+            "create_channel": self._handle_create_channel,
+            "add_user": self._handle_add_user,
+            "post_message": self._handle_post_message,
+            "edit_message": self._handle_edit_message,
+            "delete_message": self._handle_delete_message,
+            "add_reaction": self._handle_reaction,
+            "remove_reaction": self._handle_reaction,
+            "mark_read": self._handle_mark_read,
+        }
+
+        handler = operation_handlers.get(input_data.operation)
+        if handler:
+            handler(input_data)
+            self.last_updated = input_data.timestamp
+            self.update_count += 1
+        else:
+            raise ValueError(f"Unknown operation: {input_data.operation}")
+
+    def get_channel(self, channel_id: str) -> TeamChannel:
+        """Return a channel.
+
+        Raises:
+            ValueError: If the channel does not exist.
+        """
+        channel = self.channels.get(channel_id)
+        if channel is None:
+            raise ValueError(f"Channel '{channel_id}' not found")
+        return channel
+
+    def _message_log(self, input_data: TeamChatInput) -> ChannelLog:
+        """Return the log holding the message an input addresses.
+
+        Raises:
+            ValueError: If the channel or message does not exist.
+        """
+        log = self.get_channel(input_data.channel_id).log
+        if input_data.message_seq >= len(log):
+            raise ValueError(
+                f"Message {input_data.message_seq} not found in channel "
+                f"'{input_data.channel_id}'"
+            )
+        return log
+
+    def _handle_create_channel(self, input_data: TeamChatInput) -> None:
+        """Handle creating a channel.
+
+        Raises:
+            ValueError: If the channel already exists.
+        """
+        if input_data.channel_id in self.channels:
+            raise ValueError(f"Channel '{input_data.channel_id}' already exists")
+        self._create_channel(input_data)
+
+    def _create_channel(self, input_data: TeamChatInput) -> TeamChannel:
+        """Create and register a channel from an input."""
+        channel = TeamChannel(
+            channel_id=input_data.channel_id,
+            name=input_data.channel_name or input_data.channel_id,
+            space_id=input_data.space_id,
+            topic=input_data.topic,
+            is_private=input_data.is_private,
+            created_at=input_data.timestamp,
+        )
+        self.channels[channel.channel_id] = channel
+        return channel
+
+    def _handle_add_user(self, input_data: TeamChatInput) -> None:
+        """Handle adding a user, or renaming an existing one."""
+        existing = self.users.get(input_data.user_id)
+        self.users[input_data.user_id] = TeamChatUser(
+            user_id=input_data.user_id,
+            display_name=input_data.display_name or input_data.user_id,
+            added_at=existing.added_at if existing else input_data.timestamp,
+        )
+
+    def _handle_post_message(self, input_data: TeamChatInput) -> None:
+        """Handle posting a message, creating its channel if needed.
+
+        Raises:
+            ValueError: If the thread root does not exist or the message is
+                earlier than the channel's latest message.
+        """
+        channel = self.channels.get(input_data.channel_id)
+        if channel is None:
+            channel = self._create_channel(input_data)
+        log = channel.log
+        if input_data.thread_seq is not None and input_data.thread_seq >= len(log):
+            raise ValueError(
+                f"Message {input_data.thread_seq} not found in channel "
+                f"'{input_data.channel_id}'"
+            )
+        seq = log.append(
+            author=input_data.author,
+            text=input_data.text,
+            timestamp=input_data.timestamp,
+            thread=input_data.thread_seq,
+            mentions=extract_mentions(input_data.text),
+        )
+        if input_data.author == self.user_id:
+            channel.last_read_seq = seq
+
+    def _handle_edit_message(self, input_data: TeamChatInput) -> None:
+        """Handle editing a message's text.
+
+        Raises:
+            ValueError: If the message does not exist or is deleted.
+        """
+        log = self._message_log(input_data)
+        seq = input_data.message_seq
+        if log.is_deleted(seq):
+            raise ValueError(f"Message {seq} is deleted")
+        old_mentions = extract_mentions(log.text(seq))
+        log.edit(seq, input_data.text, input_data.timestamp)
+        log.update_mentions(seq, old_mentions, extract_mentions(input_data.text))
+
+    def _handle_delete_message(self, input_data: TeamChatInput) -> None:
+        """Handle deleting a message.
+
+        Raises:
+            ValueError: If the message does not exist or is already deleted.
+        """
+        log = self._message_log(input_data)
+        seq = input_data.message_seq
+        if log.is_deleted(seq):
+            raise ValueError(f"Message {seq} is already deleted")
+        log.set_deleted(seq, True, extract_mentions(log.text(seq)))
+
+    def _handle_reaction(self, input_data: TeamChatInput) -> None:
+        """Handle adding or removing a user's reaction to a message.
+
+        Raises:
+            ValueError: If the message does not exist, or the reaction to
+                remove is not present.
+        """
+        log = self._message_log(input_data)
+        seq = input_data.message_seq
+        reactions = log.reactions(seq)
+        users = reactions.setdefault(input_data.emoji, [])
+        if input_data.operation == "add_reaction":
+            if input_data.user_id not in users:
+                users.append(input_data.user_id)
+        elif input_data.user_id in users:
+            users.remove(input_data.user_id)
+        else:
+            raise ValueError(
+                f"User '{input_data.user_id}' has not reacted with "
+                f":{input_data.emoji}: to message {seq}"
+            )
+        log.set_reactions(seq, reactions)
+
+    def _handle_mark_read(self, input_data: TeamChatInput) -> None:
+        """Handle marking a channel read up to a message (default: latest).
+
+        Raises:
+            ValueError: If the channel or message does not exist.
+        """
+        channel = self.get_channel(input_data.channel_id)
+        if input_data.message_seq is None:
+            channel.last_read_seq = len(channel.log) - 1
+        else:
+            self._message_log(input_data)
+            channel.last_read_seq = input_data.message_seq
+
+    def _render(self, channel: TeamChannel, seq: int) -> dict[str, Any]:
+        """Return a message dictionary for query results."""
+        message = channel.log.message(seq)
+        message["channel_id"] = channel.channel_id
+        message["mentions"] = extract_mentions(message["text"])
+        return message
+
+    def _channel_summary(self, channel: TeamChannel) -> dict[str, Any]:
+        """Return a channel's metadata and counts, without messages."""
+        log = channel.log
+        last_time = log.last_time
+        return {
+            "channel_id": channel.channel_id,
+            "name": channel.name,
+            f"{self.space_label}_id": channel.space_id,
+            "topic": channel.topic,
+            "is_private": channel.is_private,
+            "created_at": channel.created_at.isoformat(),
+            "message_count": len(log),
+            "last_message_at": last_time.isoformat() if last_time else None,
+            "last_read_seq": channel.last_read_seq,
+            "unread_count": log.count_after(channel.last_read_seq),
+            "unread_mention_count": len(
+                log.mentions(self.user_id, after=channel.last_read_seq)
+            ),
+        }
+
+    def get_snapshot(self) -> dict[str, Any]:
+        """Return a complete snapshot of current state for API responses.
+
+        Messages are not included; query a channel to page through them.
+
+        Returns:
+            Dictionary representation of current state.
+        """
+        channels = [self._channel_summary(channel) for channel in self.channels.values()]
+        return {
+            "modality_type": self.modality_type,
+            "last_updated": self.last_updated.isoformat(),
+            "update_count": self.update_count,
+            "user_id": self.user_id,
+            "channel_count": len(channels),
+            "message_count": sum(channel["message_count"] for channel in channels),
+            "unread_count": sum(channel["unread_count"] for channel in channels),
+            "unread_mention_count": sum(
+                channel["unread_mention_count"] for channel in channels
+            ),
+            "channels": channels,
+            "users": [
+                {
+                    "user_id": user.user_id,
+                    "display_name": user.display_name,
+                    "added_at": user.added_at.isoformat(),
+                }
+                for user in self.users.values()
+            ],
+        }
+
+    @property
+    def summary(self) -> str:
+        """Return a brief human-readable summary of this state."""
+        messages = sum(len(channel.log) for channel in self.channels.values())
+        unread = sum(
+            channel.log.count_after(channel.last_read_seq)
+            for channel in self.channels.values()
+        )
+        return f"{len(self.channels)} channels, {messages} messages ({unread} unread)"
+
+    def validate_state(self) -> list[str]:
+        """Validate internal state consistency and return any issues.
+
+        Returns:
+            List of validation error messages (empty list if valid).
+        """
+        errors = []
+        for channel_id, channel in self.channels.items():
+            if channel.channel_id != channel_id:
+                errors.append(f"Channel key '{channel_id}' does not match its ID")
+            if not -1 <= channel.last_read_seq < max(len(channel.log), 1):
+                errors.append(f"Channel '{channel_id}' read position is out of range")
+            errors.extend(f"Channel '{channel_id}': {error}" for error in channel.log.validate())
+        for user_id, user in self.users.items():
+            if user.user_id != user_id:
+                errors.append(f"User key '{user_id}' does not match its ID")
+        return errors
+
+    def query(self, query_params: dict[str, Any]) -> dict[str, Any]:
+        """Execute a query against this state.
+
+        What is returned depends on the parameters given:
+        - thread_seq (with channel_id): a thread, root first, then replies.
+        - mentions_of: messages mentioning a user, across channels (or in
+          channel_id), newest first.
+        - channel_id: a page of the channel's history.
+        - Otherwise: channels and their unread counts.
+
+        Supported query parameters:
+            - channel_id: str - Channel to read
+            - thread_seq: int - Thread root (or any reply) to read
+            - mentions_of: str - User whose mentions to find
+            - unread_only: bool - Only unread messages or mentions, or only
+              channels with unread messages
+            - since: datetime - Only messages at or after this time
+            - until: datetime - Only messages before this time
+            - cursor: int - Continue after this seq (from next_cursor)
+            - order: str - "desc" (newest first, default) or "asc"
+            - author: str - Only messages by this user
+            - search: str - Only messages containing this text
+            - include_replies: bool - Include thread replies in channel
+              history (default: False)
+            - include_deleted: bool - Include deleted messages (default: False)
+            - space_id: str - Only channels in this workspace or server
+            - limit: int - Maximum number of results (default: 100)
+            - offset: int - Channels to skip, when listing channels
+
+        Args:
+            query_params: Dictionary of query parameters.
+
+        Returns:
+            Dictionary containing query results:
+                - channels: Matching channels (when listing channels).
+                - messages: Matching messages, each with its channel_id.
+                - count: Number of results returned.
+                - next_cursor: Seq to pass as cursor for the next page of
+                  history, or None if there are no more.
+
+        Raises:
+            ValueError: If a channel or thread does not exist.
+        """
+        if query_params.get("mentions_of"):
+            messages = self._query_mentions(query_params)
+            return {"channels": [], "messages": messages, "count": len(messages), "next_cursor": None}
+        if query_params.get("channel_id"):
+            if query_params.get("thread_seq") is not None:
+                messages = self._query_thread(query_params)
+                return {"channels": [], "messages": messages, "count": len(messages), "next_cursor": None}
+            return self._query_history(query_params)
+        channels = self._query_channels(query_params)
+        return {"channels": channels, "messages": [], "count": len(channels), "next_cursor": None}
+
+    def _query_channels(self, query_params: dict[str, Any]) -> list[dict[str, Any]]:
+        """List channels, most recently active first."""
+        space_id = query_params.get("space_id")
+        channels = [
+            channel
+            for channel in self.channels.values()
+            if space_id is None or channel.space_id == space_id
+        ]
+        channels.sort(
+            key=lambda channel: channel.log.last_time or channel.created_at, reverse=True
+        )
+        summaries = (self._channel_summary(channel) for channel in channels)
+        if query_params.get("unread_only"):
+            summaries = (summary for summary in summaries if summary["unread_count"])
+        offset = query_params.get("offset") or 0
+        limit = query_params.get("limit") or 100
+        return list(islice(summaries, offset, offset + limit))
+
+    def _query_history(self, query_params: dict[str, Any]) -> dict[str, Any]:
+        """Return a page of one channel's messages.
+
+        The time window and cursor become a seq range, so a page costs the
+        messages it scans rather than the size of the channel.
+        """
+        channel = self.get_channel(query_params["channel_id"])
+        log = channel.log
+        reverse = query_params.get("order", "desc") != "asc"
+        limit = query_params.get("limit") or 100
+
+        start, stop = 0, len(log)
+        if query_params.get("since") is not None:
+            start = log.seq_at(query_params["since"])
+        if query_params.get("until") is not None:
+            stop = log.seq_at(query_params["until"])
+        if query_params.get("unread_only"):
+            start = max(start, channel.last_read_seq + 1)
+        cursor = query_params.get("cursor")
+        if cursor is not None:
+            if reverse:
+                stop = min(stop, cursor)
+            else:
+                start = max(start, cursor + 1)
+
+        seqs = log.select(
+            start,
+            stop,
+            reverse=reverse,
+            limit=limit + 1,
+            author=query_params.get("author"),
+            top_level=not query_params.get("include_replies", False),
+            include_deleted=query_params.get("include_deleted", False),
+            search=query_params.get("search"),
+        )
+        has_more = len(seqs) > limit
+        seqs = seqs[:limit]
+        messages = [self._render(channel, seq) for seq in seqs]
+        return {
+            "channels": [],
+            "messages": messages,
+            "count": len(messages),
+            "next_cursor": seqs[-1] if has_more else None,
+        }
+
+    def _query_thread(self, query_params: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return a thread: its root followed by its replies, oldest first."""
+        channel = self.get_channel(query_params["channel_id"])
+        seq = query_params["thread_seq"]
+        if not 0 <= seq < len(channel.log):
+            raise ValueError(f"Message {seq} not found in channel '{channel.channel_id}'")
+        root = channel.log.thread_root(seq)
+        include_deleted = query_params.get("include_deleted", False)
+        seqs = [root] + channel.log.replies(root)
+        limit = query_params.get("limit") or 100
+        return [
+            self._render(channel, seq)
+            for seq in seqs
+            if include_deleted or not channel.log.is_deleted(seq)
+        ][:limit]
+
+    def _query_mentions(self, query_params: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return messages mentioning a user across channels, newest first.
+
+        Each channel's mention index is already in seq (and so time) order,
+        so the newest mentions are merged lazily across channels.
+        """
+        user = query_params["mentions_of"]
+        limit = query_params.get("limit") or 100
+        since = query_params.get("since")
+        until = query_params.get("until")
+        channel_id = query_params.get("channel_id")
+        channels = [self.get_channel(channel_id)] if channel_id else self.channels.values()
+
+        streams = []
+        for channel in channels:
+            log = channel.log
+            after = channel.last_read_seq if query_params.get("unread_only") else -1
+            if since is not None:
+                after = max(after, log.seq_at(since) - 1)
+            seqs = log.mentions(user, after=after)
+            if until is not None:
+                stop = log.seq_at(until)
+                seqs = [seq for seq in seqs if seq < stop]
+            if seqs:
+                streams.append(self._mention_stream(channel, seqs))
+
+        merged = heapq.merge(*streams, reverse=True)
+        results = []
+        for _, channel_id, seq in merged:
+            results.append(self._render(self.channels[channel_id], seq))
+            if len(results) >= limit:
+                break
+        return results
+
+    @staticmethod
+    def _mention_stream(
+        channel: TeamChannel, seqs: list[int]
+    ) -> Iterator[tuple[datetime, str, int]]:
+        """Yield (timestamp, channel_id, seq) for mentions, newest first."""
+        log = channel.log
+        for seq in reversed(seqs):
+            yield log.timestamp(seq), channel.channel_id, seq
+
+    def clear(self) -> None:
+        """Reset team chat state to empty defaults."""
+        self.channels.clear()
+        self.users.clear()
+        self.update_count = 0
+
+    def create_undo_data(self, input_data: ModalityInput) -> dict[str, Any]:
+        """Capture minimal data needed to undo applying an input.
+
+        Args:
+            input_data: The input that will be applied.
+
+        Returns:
+            Dictionary containing minimal data needed to undo the operation.
+        """
+        if not isinstance(input_data, self.input_class):
+            raise ValueError(
+                f"{type(self).__name__} can only create undo data for "
+                f"{self.input_class.__name__}, got {type(input_data)}"
+            )
+
+        base_undo = {
+            "state_previous_update_count": self.update_count,
+            "state_previous_last_updated": self.last_updated.isoformat(),
+        }
+
+        operation = input_data.operation
+        channel_id = input_data.channel_id
+        channel = self.channels.get(channel_id) if channel_id else None
+
+        if operation == "add_user":
+            existing = self.users.get(input_data.user_id)
+            return {
+                **base_undo,
+                "action": "restore_user",
+                "user_id": input_data.user_id,
+                "previous": existing.model_dump(mode="json") if existing else None,
+            }
+
+        if operation == "create_channel":
+            if channel is not None:
+                return {**base_undo, "action": "noop"}
+            return {**base_undo, "action": "remove_channel", "channel_id": channel_id}
+
+        if operation == "post_message":
+            return {
+                **base_undo,
+                "action": "pop_message",
+                "channel_id": channel_id,
+                "mentions": extract_mentions(input_data.text or ""),
+                "remove_channel": channel is None,
+                "previous_read_seq": channel.last_read_seq if channel else -1,
+            }
+
+        if channel is None:
+            return {**base_undo, "action": "noop"}
+
+        if operation == "mark_read":
+            return {
+                **base_undo,
+                "action": "restore_read",
+                "channel_id": channel_id,
+                "last_read_seq": channel.last_read_seq,
+            }
+
+        seq = input_data.message_seq
+        if seq is None or seq >= len(channel.log):
+            return {**base_undo, "action": "noop"}
+        log = channel.log
+
+        if operation == "edit_message":
+            edited_at = log.edited_at(seq)
+            return {
+                **base_undo,
+                "action": "restore_text",
+                "channel_id": channel_id,
+                "seq": seq,
+                "text": log.text(seq) if edited_at else None,
+                "edited_at": edited_at.isoformat() if edited_at else None,
+            }
+
+        if operation == "delete_message":
+            return {**base_undo, "action": "undelete", "channel_id": channel_id, "seq": seq}
+
+        return {
+            **base_undo,
+            "action": "restore_reactions",
+            "channel_id": channel_id,
+            "seq": seq,
+            "reactions": log.reactions(seq),
+        }
+
+    def apply_undo(self, undo_data: dict[str, Any]) -> None:
+        """Apply undo data to reverse a previous input application.
+
+        Args:
+            undo_data: Dictionary returned by create_undo_data().
+
+        Raises:
+            ValueError: If undo_data is invalid.
+        """
+        action = undo_data.get("action")
+        if not action:
+            raise ValueError("Undo data missing 'action' field")
+
+        if action == "restore_user":
+            previous = undo_data.get("previous")
+            if previous:
+                self.users[undo_data["user_id"]] = TeamChatUser.model_validate(previous)
+            else:
+                self.users.pop(undo_data["user_id"], None)
+
+        elif action == "remove_channel":
+            self.channels.pop(undo_data["channel_id"], None)
+
+        elif action == "pop_message":
+            channel = self.get_channel(undo_data["channel_id"])
+            channel.log.pop(undo_data.get("mentions", []))
+            channel.last_read_seq = undo_data.get("previous_read_seq", -1)
+            if undo_data.get("remove_channel"):
+                del self.channels[undo_data["channel_id"]]
+
+        elif action == "restore_read":
+            self.get_channel(undo_data["channel_id"]).last_read_seq = undo_data["last_read_seq"]
+
+        elif action == "restore_text":
+            log = self.get_channel(undo_data["channel_id"]).log
+            seq = undo_data["seq"]
+            edited_at = undo_data.get("edited_at")
+            old_mentions = extract_mentions(log.text(seq))
+            log.edit(
+                seq,
+                undo_data.get("text"),
+                datetime.fromisoformat(edited_at) if edited_at else None,
+            )
+            log.update_mentions(seq, old_mentions, extract_mentions(log.text(seq)))
+
+        elif action == "undelete":
+            log = self.get_channel(undo_data["channel_id"]).log
+            seq = undo_data["seq"]
+            log.set_deleted(seq, False, extract_mentions(log.text(seq)))
+
+        elif action == "restore_reactions":
+            log = self.get_channel(undo_data["channel_id"]).log
+            log.set_reactions(undo_data["seq"], undo_data.get("reactions") or {})
+
+        elif action != "noop":
+            raise ValueError(f"Unknown undo action: {action}")
+
+        self.update_count = undo_data["state_previous_update_count"]
+        self.last_updated = datetime.fromisoformat(undo_data["state_previous_last_updated"])
@@ -26,7 +26,7 @@ class TimeInput(ModalityInput):
         week_start: Optional day of week to start on ("sunday" or "monday").
     """
 
-    modality_type: str = Field(default="time", frozen=True)
+    modality_type: Literal["time"] = Field(default="time", frozen=True)
     timezone: str = Field(
         description="Timezone identifier in IANA format (e.g., 'America/New_York', 'UTC')"
     )
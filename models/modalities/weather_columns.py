@@ -0,0 +1,450 @@
+"""Columnar storage for weather reports.
+
+A WeatherReport holds up to 60 MinutelyForecast, 48 HourlyForecast and 8
+DailyForecast objects, each a Pydantic model with its own field storage, and
+weather keeps up to 100 reports per location. ReportColumns stores each
+forecast section as a struct of arrays instead: one NumPy array per numeric
+field (nested fields such as temp.day get their own), plus a tuple per field
+that is not a number (weather conditions, rain, summary). Unit conversion is
+a few vectorized array operations, and converting or excluding sections
+returns a new ReportColumns that shares every array it did not change, so
+nothing is deep-copied.
+
+The arrays are read-only. Reports are turned back into dicts or WeatherReport
+objects only where they leave the weather state, with to_dict() and
+to_report().
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field as dataclass_field
+from operator import attrgetter
+from types import NoneType, UnionType
+from typing import Any, Literal, Optional, Union, get_args, get_origin
+
+import numpy as np
+from pydantic import BaseModel, GetCoreSchemaHandler, TypeAdapter
+from pydantic_core import core_schema
+
+from models.modalities.weather_input import (
+    DailyForecast,
+    HourlyForecast,
+    MinutelyForecast,
+    WeatherReport,
+)
+
+# Report sections that can be excluded from a query
+SECTIONS = ("current", "minutely", "hourly", "daily", "alerts")
+
+# Fields holding temperatures (Kelvin) and speeds (m/s), converted on query
+TEMPERATURE_FIELDS = frozenset({"temp", "feels_like", "dew_point"})
+SPEED_FIELDS = frozenset({"wind_speed", "wind_gust"})
+
+# A forecast section: column key -> array, or tuple for non-numeric fields
+Section = dict[str, Any]
+
+
+@dataclass(frozen=True)
+class _Field:
+    """A forecast model field and how its column is stored.
+
+    Attributes:
+        name: Field name within its model.
+        key: Column key, the dotted path from the forecast model.
+        kind: "int" or "float" for numeric columns, "object" for tuples of
+            values, "model" for nested models whose fields are columns.
+        optional: Whether the field can be None. Optional numeric columns
+            are float arrays with NaN for None.
+        fields: The fields of a nested model.
+        get: Reads the field from a forecast model.
+        dump: Dumps a list of the field's values, for "object" fields.
+    """
+
+    name: str
+    key: str
+    kind: Literal["int", "float", "object", "model"]
+    optional: bool
+    fields: tuple["_Field", ...] = ()
+    get: Any = dataclass_field(default=None, compare=False)
+    dump: Any = dataclass_field(default=None, compare=False)
+
+
+def _fields(model: type[BaseModel], prefix: str = "") -> tuple[_Field, ...]:
+    """Derive the column layout of a forecast model from its fields."""
+    fields = []
+    for name, info in model.model_fields.items():
+        annotation = info.annotation
+        optional = get_origin(annotation) in (Union, UnionType) and NoneType in get_args(
+            annotation
+        )
+        if optional:
+            (annotation,) = [arg for arg in get_args(annotation) if arg is not NoneType]
+        key = prefix + name
+        get = attrgetter(key)
+        if annotation is int or annotation is float:
+            fields.append(_Field(name, key, annotation.__name__, optional, get=get))
+        elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            fields.append(
+                _Field(name, key, "model", optional, _fields(annotation, f"{key}."))
+            )
+        else:
+            dump = TypeAdapter(list[info.annotation]).dump_python
+            fields.append(_Field(name, key, "object", optional, get=get, dump=dump))
+    return tuple(fields)
+
+
+def _leaves(fields: Iterable[_Field]) -> list[_Field]:
+    """Return the fields that have a column, flattening nested models."""
+    leaves = []
+    for field in fields:
+        leaves.extend(_leaves(field.fields) if field.kind == "model" else [field])
+    return leaves
+
+
+# Column layout of each forecast section
+LAYOUTS = {
+    "minutely": _fields(MinutelyForecast),
+    "hourly": _fields(HourlyForecast),
+    "daily": _fields(DailyForecast),
+}
+_COLUMNS = {section: _leaves(fields) for section, fields in LAYOUTS.items()}
+
+
+def _converted_keys(section: str, names: frozenset[str]) -> list[str]:
+    """Return the column keys of a section whose top-level field is in names."""
+    return [
+        field.key
+        for field in _COLUMNS[section]
+        if field.key.split(".")[0] in names and field.kind == "float"
+    ]
+
+
+_TEMPERATURE_KEYS = {
+    section: _converted_keys(section, TEMPERATURE_FIELDS) for section in LAYOUTS
+}
+_SPEED_KEYS = {section: _converted_keys(section, SPEED_FIELDS) for section in LAYOUTS}
+
+
+def convert_temperature(kelvin: Any, units: str) -> Any:
+    """Convert a temperature, or an array of them, from Kelvin.
+
+    Args:
+        kelvin: Temperature in Kelvin, a float or a NumPy array.
+        units: "metric" for Celsius; any other value gives Fahrenheit.
+
+    Returns:
+        The converted temperature, of the same type as kelvin.
+    """
+    if units == "metric":
+        return kelvin - 273.15
+    return (kelvin - 273.15) * 9 / 5 + 32
+
+
+def convert_speed(speed: Any, units: str) -> Any:
+    """Convert a speed, or an array of them, from m/s.
+
+    Args:
+        speed: Speed in m/s, a float or a NumPy array.
+        units: "imperial" for miles per hour; other values leave it in m/s.
+
+    Returns:
+        The converted speed, of the same type as speed.
+    """
+    if units == "imperial":
+        return speed * 2.23694
+    return speed
+
+
+def _copy(value: Any) -> Any:
+    """Copy the lists and dicts of a stored value, so callers cannot change it."""
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    return value
+
+
+def _column(field: _Field, rows: list[BaseModel], shared: dict[str, Any]) -> Any:
+    """Build a column from the forecast models of a section.
+
+    Equal non-numeric values (most rows repeat the same weather conditions)
+    are stored once: shared maps each value's repr to the first copy seen.
+    """
+    values = list(map(field.get, rows))
+    if field.kind == "object":
+        return tuple(
+            value if value is None else shared.setdefault(repr(value), value)
+            for value in field.dump(values)
+        )
+    if field.optional:
+        column = np.array(
+            [np.nan if value is None else value for value in values], dtype=np.float64
+        )
+    else:
+        column = np.array(values, dtype=np.float64 if field.kind == "float" else np.int64)
+    column.flags.writeable = False
+    return column
+
+
+def _values(field: _Field, column: Any) -> list[Any]:
+    """Return a column's values as the Python values a model dump holds."""
+    if field.kind == "object":
+        return [_copy(value) for value in column]
+    values = column.tolist()
+    if not field.optional:
+        return values
+    if field.kind == "int":
+        return [None if value != value else int(value) for value in values]
+    return [None if value != value else value for value in values]
+
+
+def _rows(
+    fields: tuple[_Field, ...], values: dict[str, list[Any]], index: int
+) -> dict[str, Any]:
+    """Rebuild one row of a forecast section, nested models included."""
+    return {
+        field.name: (
+            _rows(field.fields, values, index)
+            if field.kind == "model"
+            else values[field.key][index]
+        )
+        for field in fields
+    }
+
+
+def _section_to_list(section: str, columns: Section) -> list[dict[str, Any]]:
+    """Rebuild the dumped rows of a forecast section from its columns."""
+    values = {field.key: _values(field, columns[field.key]) for field in _COLUMNS[section]}
+    return [_rows(LAYOUTS[section], values, index) for index in range(len(columns["dt"]))]
+
+
+class ReportColumns:
+    """A weather report stored as one struct of arrays per forecast section.
+
+    Holds the same data as a WeatherReport. The minutely, hourly and daily
+    sections are dicts mapping column keys ("temp", "temp.day", ...) to
+    read-only NumPy arrays, or to tuples for fields that are not numbers.
+    current and alerts are kept as dumped dicts. A section is None when the
+    report does not include it.
+
+    ReportColumns are treated as immutable: convert() and exclude() return
+    new instances that share the unchanged columns.
+
+    Attributes:
+        lat: Location latitude.
+        lon: Location longitude.
+        timezone: Timezone identifier.
+        timezone_offset: Timezone offset in seconds from UTC.
+        current: Current weather conditions, as a dumped CurrentWeather.
+        minutely: Minute-by-minute forecast columns.
+        hourly: Hourly forecast columns.
+        daily: Daily forecast columns.
+        alerts: Weather alerts, as dumped WeatherAlerts.
+    """
+
+    __slots__ = (
+        "lat",
+        "lon",
+        "timezone",
+        "timezone_offset",
+        "current",
+        "minutely",
+        "hourly",
+        "daily",
+        "alerts",
+    )
+
+    def __init__(
+        self,
+        lat: float,
+        lon: float,
+        timezone: str,
+        timezone_offset: int,
+        current: Optional[dict[str, Any]] = None,
+        minutely: Optional[Section] = None,
+        hourly: Optional[Section] = None,
+        daily: Optional[Section] = None,
+        alerts: Optional[tuple[dict[str, Any], ...]] = None,
+    ) -> None:
+        """Initialize a report from already built sections.
+
+        Use from_report() to build one from a WeatherReport.
+        """
+        self.lat = lat
+        self.lon = lon
+        self.timezone = timezone
+        self.timezone_offset = timezone_offset
+        self.current = current
+        self.minutely = minutely
+        self.hourly = hourly
+        self.daily = daily
+        self.alerts = alerts
+
+    @classmethod
+    def from_report(cls, report: WeatherReport) -> "ReportColumns":
+        """Store a weather report in columns.
+
+        Args:
+            report: The report to store.
+
+        Returns:
+            The report's columns.
+        """
+        shared: dict[str, Any] = {}
+        sections = {}
+        for section in LAYOUTS:
+            rows = getattr(report, section)
+            sections[section] = (
+                None
+                if rows is None
+                else {
+                    field.key: _column(field, rows, shared)
+                    for field in _COLUMNS[section]
+                }
+            )
+        return cls(
+            lat=report.lat,
+            lon=report.lon,
+            timezone=report.timezone,
+            timezone_offset=report.timezone_offset,
+            current=None if report.current is None else report.current.model_dump(),
+            alerts=(
+                None
+                if report.alerts is None
+                else tuple(alert.model_dump() for alert in report.alerts)
+            ),
+            **sections,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert this report to a dictionary.
+
+        Returns:
+            The same dictionary WeatherReport.model_dump() gives for the report.
+        """
+        sections = {
+            section: (
+                None if columns is None else _section_to_list(section, columns)
+            )
+            for section, columns in (
+                ("minutely", self.minutely),
+                ("hourly", self.hourly),
+                ("daily", self.daily),
+            )
+        }
+        return {
+            "lat": self.lat,
+            "lon": self.lon,
+            "timezone": self.timezone,
+            "timezone_offset": self.timezone_offset,
+            "current": _copy(self.current),
+            "minutely": sections["minutely"],
+            "hourly": sections["hourly"],
+            "daily": sections["daily"],
+            "alerts": None if self.alerts is None else [_copy(a) for a in self.alerts],
+        }
+
+    def to_report(self) -> WeatherReport:
+        """Materialize this report as a WeatherReport.
+
+        Returns:
+            A new WeatherReport with this report's data.
+        """
+        return WeatherReport.model_validate(self.to_dict())
+
+    def _replace(self, **sections: Any) -> "ReportColumns":
+        """Return a copy of this report with some sections replaced."""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(sections)
+        return ReportColumns(**values)
+
+    def exclude(self, sections: Optional[Iterable[str]]) -> "ReportColumns":
+        """Return this report without some of its sections.
+
+        Args:
+            sections: Sections to leave out (current, minutely, hourly, daily,
+                alerts). Unknown names are ignored.
+
+        Returns:
+            A report sharing this one's data, with the sections set to None.
+        """
+        excluded = {section: None for section in sections or () if section in SECTIONS}
+        return self._replace(**excluded) if excluded else self
+
+    def convert(
+        self, units: Literal["standard", "metric", "imperial"]
+    ) -> "ReportColumns":
+        """Return this report with temperatures and speeds in other units.
+
+        Reports are stored in standard units (Kelvin, m/s). Each converted
+        column is one vectorized operation; the other columns are shared.
+
+        Args:
+            units: Target unit system (standard, metric, imperial).
+
+        Returns:
+            The converted report, or this report for standard units.
+        """
+        if units == "standard":
+            return self
+
+        converted: dict[str, Any] = {}
+        if self.current is not None:
+            current = dict(self.current)
+            for name in TEMPERATURE_FIELDS:
+                current[name] = convert_temperature(current[name], units)
+            for name in SPEED_FIELDS:
+                if current[name] is not None:
+                    current[name] = convert_speed(current[name], units)
+            converted["current"] = current
+
+        for section in LAYOUTS:
+            columns = getattr(self, section)
+            if columns is None or not (_TEMPERATURE_KEYS[section] or _SPEED_KEYS[section]):
+                continue
+            columns = dict(columns)
+            for key in _TEMPERATURE_KEYS[section]:
+                columns[key] = convert_temperature(columns[key], units)
+            for key in _SPEED_KEYS[section]:
+                columns[key] = convert_speed(columns[key], units)
+            converted[section] = columns
+
+        return self._replace(**converted)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare reports by their data."""
+        if not isinstance(other, ReportColumns):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a short description of the report."""
+        sections = [name for name in SECTIONS if getattr(self, name) is not None]
+        return (
+            f"ReportColumns(lat={self.lat}, lon={self.lon}, "
+            f"sections={sections})"
+        )
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Let models hold ReportColumns fields.
+
+        The field accepts a ReportColumns, a WeatherReport, or anything a
+        WeatherReport can be validated from, and dumps as a WeatherReport
+        would, so stored states keep their format.
+        """
+        from_report = core_schema.chain_schema(
+            [
+                handler.generate_schema(WeatherReport),
+                core_schema.no_info_plain_validator_function(cls.from_report),
+            ]
+        )
+        return core_schema.union_schema(
+            [core_schema.is_instance_schema(cls), from_report],
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls.to_dict
+            ),
+        )
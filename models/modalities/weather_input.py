@@ -1,7 +1,7 @@
 """Weather input model."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -279,7 +279,7 @@ class WeatherInput(ModalityInput):
         report: Complete weather report conforming to OpenWeather API format.
     """
 
-    modality_type: str = Field(default="weather", frozen=True)
+    modality_type: Literal["weather"] = Field(default="weather", frozen=True)
     latitude: float = Field(
         description="Location latitude in decimal degrees (-90 to 90)"
     )
@@ -375,13 +375,20 @@ class WeatherInput(ModalityInput):
     def should_merge_with(self, other: "ModalityInput") -> bool:
         """Determine if this input should be merged with another input.
 
-        Weather updates should not be merged as each represents a distinct
-        weather state change that should be tracked separately.
+        Weather updates for the same location within 5 minutes of each other
+        are redundant: the later report supersedes the earlier one, so they
+        can be merged.
 
         Args:
             other: Another input to compare against.
 
         Returns:
-            Always False for weather inputs.
+            True if inputs should be merged (same location within 5 minutes).
         """
-        return False
\ No newline at end of file
+        if not isinstance(other, WeatherInput):
+            return False
+
+        time_diff = abs((self.timestamp - other.timestamp).total_seconds())
+        same_location = self.get_affected_entities() == other.get_affected_entities()
+
+        return time_diff <= 300.0 and same_location
\ No newline at end of file
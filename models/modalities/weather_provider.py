@@ -0,0 +1,238 @@
+"""Real weather from the OpenWeather One Call API.
+
+WeatherState.query() with real=true fetches a report through a
+WeatherProvider instead of a bare requests.get() per call:
+- Requests share one pooled requests.Session, so repeated fetches reuse
+  their connections instead of paying for a TCP and TLS handshake each.
+- Reports are cached for a while (OpenWeather refreshes its data about every
+  ten minutes), keyed on coordinates rounded like WeatherState's location
+  keys, the excluded sections and the API key. The cache is bounded and
+  drops the least recently used report first.
+- Concurrent fetches of the same key are coalesced: the first one makes
+  the request and the others wait for its result.
+
+The provider is shared by every WeatherState in the process. It is
+configured from the environment:
+- OPENWEATHER_BASE_URL: One Call endpoint to fetch from (default the real
+  API). Point it at the local stand-in (scenarios/openweather.py) to work
+  offline.
+- OPENWEATHER_CACHE_TTL: Seconds a report stays cached (default 600). 0
+  disables the cache; concurrent identical fetches are still coalesced.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from models.modalities.weather_input import WeatherReport
+
+DEFAULT_BASE_URL = "https://api.openweathermap.org/data/3.0/onecall"
+DEFAULT_CACHE_TTL = 600.0
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 10.0
+
+# Cache key: rounded latitude and longitude, excluded sections, API key
+CacheKey = tuple[float, float, tuple[str, ...], str]
+
+# Shared provider, created lazily on first use
+_provider: Optional["WeatherProvider"] = None
+_provider_lock = threading.Lock()
+
+
+@dataclass
+class WeatherProviderStats:
+    """Counters for a WeatherProvider.
+
+    Attributes:
+        requests: HTTP requests made.
+        hits: Fetches answered from the cache.
+        coalesced: Fetches that waited for an identical fetch in flight.
+    """
+
+    requests: int = 0
+    hits: int = 0
+    coalesced: int = 0
+
+
+class WeatherProvider:
+    """Fetches One Call reports with a pooled session, a cache and coalescing.
+
+    Safe to use from several threads. Reports returned from the cache are
+    shared between callers and must not be modified.
+
+    Args:
+        base_url: One Call endpoint URL.
+        cache_ttl: Seconds a report stays cached. 0 disables the cache.
+        cache_size: Most reports kept in the cache.
+        pool_size: Most connections kept open to the endpoint.
+        timeout: Seconds to wait for a response.
+        clock: Monotonic clock used for cache expiry.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a provider with an empty cache."""
+        if cache_ttl < 0:
+            raise ValueError(f"cache_ttl must not be negative, got {cache_ttl}")
+        if cache_size < 1:
+            raise ValueError(f"cache_size must be at least 1, got {cache_size}")
+        self.base_url = base_url
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.timeout = timeout
+        self.stats = WeatherProviderStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[CacheKey, tuple[float, WeatherReport]] = OrderedDict()
+        self._in_flight: dict[CacheKey, Future] = {}
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    @staticmethod
+    def cache_key(
+        lat: float, lon: float, api_key: str, exclude: Optional[list[str]] = None
+    ) -> CacheKey:
+        """Return the cache key for a fetch.
+
+        Coordinates are rounded to 0.01 degrees (~1km), like WeatherState's
+        location keys, so nearby queries share a report.
+        """
+        return (round(lat, 2), round(lon, 2), tuple(sorted(exclude or ())), api_key)
+
+    def fetch(
+        self, lat: float, lon: float, api_key: str, exclude: Optional[list[str]] = None
+    ) -> WeatherReport:
+        """Fetch the One Call report for a location, in standard units.
+
+        Args:
+            lat: Latitude to query.
+            lon: Longitude to query.
+            api_key: OpenWeather API key.
+            exclude: Sections to leave out of the report.
+
+        Returns:
+            The weather report, possibly from the cache.
+
+        Raises:
+            RuntimeError: If the API responds with an error status.
+            requests.RequestException: If the request fails.
+        """
+        key = self.cache_key(lat, lon, api_key, exclude)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > self._clock():
+                self._cache.move_to_end(key)
+                self.stats.hits += 1
+                return cached[1]
+            future = self._in_flight.get(key)
+            waiting = future is not None
+            if waiting:
+                self.stats.coalesced += 1
+            else:
+                future = self._in_flight[key] = Future()
+                self.stats.requests += 1
+        if waiting:
+            return future.result()
+
+        try:
+            report = self._request(lat, lon, api_key, exclude)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            if self.cache_ttl:
+                self._cache[key] = (self._clock() + self.cache_ttl, report)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            del self._in_flight[key]
+        future.set_result(report)
+        return report
+
+    def _request(
+        self, lat: float, lon: float, api_key: str, exclude: Optional[list[str]]
+    ) -> WeatherReport:
+        """Request a report from the endpoint."""
+        params = {"lat": lat, "lon": lon, "appid": api_key, "units": "standard"}
+        if exclude:
+            params["exclude"] = ",".join(exclude)
+
+        response = self._session.get(self.base_url, params=params, timeout=self.timeout)
+
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"OpenWeather API request failed: {response.status_code} {response.text}"
+            )
+
+        return WeatherReport(**response.json())
+
+    def clear_cache(self) -> None:
+        """Drop every cached report."""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Close the provider's pooled connections."""
+        self._session.close()
+
+
+def get_weather_provider() -> WeatherProvider:
+    """Get the shared provider, creating it from the environment if needed.
+
+    Returns:
+        The shared WeatherProvider.
+
+    Raises:
+        ValueError: If OPENWEATHER_CACHE_TTL is not a non-negative number.
+    """
+    global _provider
+
+    with _provider_lock:
+        if _provider is None:
+            raw_ttl = os.environ.get("OPENWEATHER_CACHE_TTL", "").strip()
+            try:
+                cache_ttl = float(raw_ttl) if raw_ttl else DEFAULT_CACHE_TTL
+            except ValueError:
+                raise ValueError(f"OPENWEATHER_CACHE_TTL must be a number, got {raw_ttl!r}")
+            _provider = WeatherProvider(
+                base_url=os.environ.get("OPENWEATHER_BASE_URL") or DEFAULT_BASE_URL,
+                cache_ttl=cache_ttl,
+            )
+        return _provider
+
+
+def set_weather_provider(provider: Optional[WeatherProvider]) -> None:
+    """Replace the shared provider.
+
+    The previous provider is closed. With None, the next call to
+    get_weather_provider() creates a fresh one from the environment.
+
+    Args:
+        provider: The provider to share, or None.
+    """
+    global _provider
+
+    with _provider_lock:
+        previous, _provider = _provider, provider
+    if previous is not None and previous is not provider:
+        previous.close()
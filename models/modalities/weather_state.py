@@ -1,16 +1,19 @@
 """Weather state model."""
 
 import os
-from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 from pydantic import BaseModel, Field
 
 from models.base_input import ModalityInput
 from models.base_state import ModalityState
+from models.modalities.weather_columns import ReportColumns
 from models.modalities.weather_input import WeatherReport
 from models.modalities.weather_input import WeatherInput
+from models.modalities.weather_provider import get_weather_provider
+from models.records import Record
 
 
 class WeatherReportHistoryEntry(BaseModel):
@@ -20,11 +23,12 @@ class WeatherReportHistoryEntry(BaseModel):
 
     Args:
         timestamp: When this weather report was recorded (simulator time).
-        report: The complete weather report.
+        report: The complete weather report, stored in columns. Accepts a
+            WeatherReport.
     """
 
     timestamp: datetime = Field(description="When this weather report was recorded")
-    report: WeatherReport = Field(description="The complete weather report")
+    report: ReportColumns = Field(description="The complete weather report")
 
     def to_dict(self) -> dict[str, Any]:
         """Convert this entry to a dictionary.
@@ -34,20 +38,35 @@ class WeatherReportHistoryEntry(BaseModel):
         """
         return {
             "timestamp": self.timestamp.isoformat(),
-            "report": self.report.model_dump(),
+            "report": self.report.to_dict(),
         }
 
 
+@dataclass(slots=True, kw_only=True)
+class WeatherReportHistoryRecord(Record):
+    """Compact form of WeatherReportHistoryEntry held in report histories."""
+
+    model: ClassVar[type[BaseModel]] = WeatherReportHistoryEntry
+
+    timestamp: datetime
+    report: ReportColumns
+
+    to_dict = WeatherReportHistoryEntry.to_dict
+
+
 class WeatherLocationState(BaseModel):
     """State for a single weather location.
 
     Tracks weather data for one geographic location including current conditions
-    and historical reports.
+    and historical reports. Reports are stored as ReportColumns; assigning a
+    WeatherReport to current_report directly bypasses the conversion, so use
+    ReportColumns.from_report().
 
     Args:
         latitude: Location latitude.
         longitude: Location longitude.
-        current_report: Current weather report.
+        current_report: Current weather report, stored in columns. Accepts a
+            WeatherReport.
         first_seen: When this location was first added.
         last_updated: When this location was last updated.
         update_count: Number of updates for this location.
@@ -56,11 +75,11 @@ class WeatherLocationState(BaseModel):
 
     latitude: float = Field(description="Location latitude")
     longitude: float = Field(description="Location longitude")
-    current_report: WeatherReport = Field(description="Current weather report")
+    current_report: ReportColumns = Field(description="Current weather report")
     first_seen: datetime = Field(description="When this location was first added")
     last_updated: datetime = Field(description="When this location was last updated")
     update_count: int = Field(default=1, description="Number of updates for this location")
-    report_history: list[WeatherReportHistoryEntry] = Field(
+    report_history: list[WeatherReportHistoryRecord] = Field(
         default_factory=list, description="List of historical reports"
     )
 
@@ -73,7 +92,7 @@ class WeatherLocationState(BaseModel):
         return {
             "latitude": self.latitude,
             "longitude": self.longitude,
-            "current_report": self.current_report.model_dump(),
+            "current_report": self.current_report.to_dict(),
             "first_seen": self.first_seen.isoformat(),
             "last_updated": self.last_updated.isoformat(),
             "update_count": self.update_count,
@@ -164,7 +183,7 @@ class WeatherState(ModalityState):
         if location_key in self.locations:
             location = self.locations[location_key]
 
-            history_entry = WeatherReportHistoryEntry(
+            history_entry = WeatherReportHistoryRecord(
                 timestamp=location.last_updated,
                 report=location.current_report,
             )
@@ -173,7 +192,7 @@ class WeatherState(ModalityState):
             if len(location.report_history) > self.max_history_per_location:
                 location.report_history.pop(0)
 
-            location.current_report = input_data.report
+            location.current_report = ReportColumns.from_report(input_data.report)
             location.last_updated = input_data.timestamp
             location.update_count += 1
         else:
@@ -245,8 +264,8 @@ class WeatherState(ModalityState):
         return issues
 
     def _filter_report(
-        self, report: WeatherReport, exclude: Optional[list[str]]
-    ) -> WeatherReport:
+        self, report: ReportColumns, exclude: Optional[list[str]]
+    ) -> ReportColumns:
         """Filter out excluded sections from a weather report.
 
         Args:
@@ -254,33 +273,19 @@ class WeatherState(ModalityState):
             exclude: List of sections to exclude (current, minutely, hourly, daily, alerts).
 
         Returns:
-            Filtered weather report with excluded sections set to None.
+            Filtered weather report with excluded sections set to None. It
+            shares the remaining sections with report.
         """
-        if not exclude:
-            return report
-
-        filtered_report = deepcopy(report)
-
-        if "current" in exclude:
-            filtered_report.current = None
-        if "minutely" in exclude:
-            filtered_report.minutely = None
-        if "hourly" in exclude:
-            filtered_report.hourly = None
-        if "daily" in exclude:
-            filtered_report.daily = None
-        if "alerts" in exclude:
-            filtered_report.alerts = None
-
-        return filtered_report
+        return report.exclude(exclude)
 
     def _convert_units(
-        self, report: WeatherReport, units: Literal["standard", "metric", "imperial"]
-    ) -> WeatherReport:
+        self, report: ReportColumns, units: Literal["standard", "metric", "imperial"]
+    ) -> ReportColumns:
         """Convert weather report units.
 
         Weather is stored internally in standard units (Kelvin, m/s).
-        This converts to requested units on query.
+        This converts to requested units on query, one array operation per
+        converted column.
 
         Args:
             report: The weather report to convert.
@@ -289,65 +294,34 @@ class WeatherState(ModalityState):
         Returns:
             Weather report with converted units.
         """
-        if units == "standard":
-            return report
-
-        converted_report = deepcopy(report)
-
-        def convert_temp(temp_k: float) -> float:
-            if units == "metric":
-                return temp_k - 273.15
-            else:
-                return (temp_k - 273.15) * 9 / 5 + 32
-
-        def convert_speed(speed_ms: float) -> float:
-            if units == "imperial":
-                return speed_ms * 2.23694
-            return speed_ms
-
-        if converted_report.current:
-            converted_report.current.temp = convert_temp(converted_report.current.temp)
-            converted_report.current.feels_like = convert_temp(
-                converted_report.current.feels_like
-            )
-            converted_report.current.dew_point = convert_temp(
-                converted_report.current.dew_point
-            )
-            converted_report.current.wind_speed = convert_speed(
-                converted_report.current.wind_speed
+        return report.convert(units)
+
+    def fetch_openweather_report(
+        self, lat: float, lon: float, exclude: Optional[list[str]] = None
+    ) -> WeatherReport:
+        """Fetch real weather from the OpenWeather API without applying it.
+
+        Goes through the shared WeatherProvider, so repeated and concurrent
+        fetches for the same location are answered from its cache.
+
+        Args:
+            lat: Latitude to query.
+            lon: Longitude to query.
+            exclude: Sections to exclude from API query.
+
+        Returns:
+            Weather report from OpenWeather API, in standard units.
+
+        Raises:
+            ValueError: If API key is not configured.
+            RuntimeError: If API request fails.
+        """
+        if not self.openweather_api_key:
+            raise ValueError(
+                "OpenWeather API key not configured. Set OPENWEATHER_API_KEY environment variable."
             )
-            if converted_report.current.wind_gust:
-                converted_report.current.wind_gust = convert_speed(
-                    converted_report.current.wind_gust
-                )
 
-        if converted_report.hourly:
-            for hour in converted_report.hourly:
-                hour.temp = convert_temp(hour.temp)
-                hour.feels_like = convert_temp(hour.feels_like)
-                hour.dew_point = convert_temp(hour.dew_point)
-                hour.wind_speed = convert_speed(hour.wind_speed)
-                if hour.wind_gust:
-                    hour.wind_gust = convert_speed(hour.wind_gust)
-
-        if converted_report.daily:
-            for day in converted_report.daily:
-                day.temp.day = convert_temp(day.temp.day)
-                day.temp.min = convert_temp(day.temp.min)
-                day.temp.max = convert_temp(day.temp.max)
-                day.temp.night = convert_temp(day.temp.night)
-                day.temp.eve = convert_temp(day.temp.eve)
-                day.temp.morn = convert_temp(day.temp.morn)
-                day.feels_like.day = convert_temp(day.feels_like.day)
-                day.feels_like.night = convert_temp(day.feels_like.night)
-                day.feels_like.eve = convert_temp(day.feels_like.eve)
-                day.feels_like.morn = convert_temp(day.feels_like.morn)
-                day.dew_point = convert_temp(day.dew_point)
-                day.wind_speed = convert_speed(day.wind_speed)
-                if day.wind_gust:
-                    day.wind_gust = convert_speed(day.wind_gust)
-
-        return converted_report
+        return get_weather_provider().fetch(lat, lon, self.openweather_api_key, exclude)
 
     def query_openweather_api(
         self,
@@ -358,14 +332,15 @@ class WeatherState(ModalityState):
     ) -> WeatherReport:
         """Query OpenWeather API for real weather data.
 
-        Makes HTTP request to OpenWeather One Call API, parses response,
-        creates WeatherInput, and applies it to state.
+        Fetches a report with fetch_openweather_report() and applies it to
+        state with record_openweather_report().
 
         Args:
             lat: Latitude to query.
             lon: Longitude to query.
             exclude: Sections to exclude from API query.
-            units: Unit system to use (API returns data in these units).
+            units: Unit system requested by the caller. Reports are always
+                fetched and stored in standard units and converted on query.
 
         Returns:
             Weather report from OpenWeather API.
@@ -374,36 +349,22 @@ class WeatherState(ModalityState):
             ValueError: If API key is not configured.
             RuntimeError: If API request fails.
         """
-        import requests
-
-        from models.modalities.weather_input import WeatherInput
-
-        if not self.openweather_api_key:
-            raise ValueError(
-                "OpenWeather API key not configured. Set OPENWEATHER_API_KEY environment variable."
-            )
-
-        url = "https://api.openweathermap.org/data/3.0/onecall"
-        params = {
-            "lat": lat,
-            "lon": lon,
-            "appid": self.openweather_api_key,
-            "units": "standard",
-        }
-
-        if exclude:
-            params["exclude"] = ",".join(exclude)
-
-        response = requests.get(url, params=params, timeout=10)
+        report = self.fetch_openweather_report(lat, lon, exclude)
+        self.record_openweather_report(lat, lon, report)
+        return report
 
-        if response.status_code != 200:
-            raise RuntimeError(
-                f"OpenWeather API request failed: {response.status_code} {response.text}"
-            )
+    def record_openweather_report(self, lat: float, lon: float, report: WeatherReport) -> None:
+        """Apply a report fetched from the OpenWeather API to state.
 
-        data = response.json()
-        report = WeatherReport(**data)
+        Callers that must not wait on the network while holding the engine
+        lock fetch with fetch_openweather_report() first and record the
+        report under the lock.
 
+        Args:
+            lat: Latitude the report was fetched for.
+            lon: Longitude the report was fetched for.
+            report: Report from fetch_openweather_report().
+        """
         weather_input = WeatherInput(
             timestamp=datetime.now(),
             input_id=f"openweather_{lat}_{lon}_{datetime.now().timestamp()}",
@@ -414,7 +375,58 @@ class WeatherState(ModalityState):
 
         self.apply_input(weather_input)
 
-        return report
+    def query_fetched_report(
+        self, query_params: dict[str, Any], report: WeatherReport
+    ) -> dict[str, Any]:
+        """Run a real=true query with a report that was already fetched.
+
+        Records the report like query() does, but never calls the API, so it
+        is safe to run under the engine lock.
+
+        Args:
+            query_params: Query parameters, as for query().
+            report: Report from fetch_openweather_report() for the queried
+                location.
+
+        Returns:
+            Dictionary with the report, as query() returns for real=true.
+
+        Raises:
+            ValueError: If required parameters are missing or invalid.
+        """
+        lat, lon, exclude, units = self._real_query_params(query_params)
+        self.record_openweather_report(lat, lon, report)
+        return self._real_query_result(report, exclude, units)
+
+    def _real_query_params(
+        self, query_params: dict[str, Any]
+    ) -> tuple[float, float, Optional[list[str]], str]:
+        """Read the parameters a real=true query uses.
+
+        Args:
+            query_params: Query parameters, as for query().
+
+        Returns:
+            Tuple of (lat, lon, exclude, units).
+
+        Raises:
+            ValueError: If lat or lon is missing.
+        """
+        if "lat" not in query_params or "lon" not in query_params:
+            raise ValueError("Query must include 'lat' and 'lon' parameters")
+        exclude = query_params.get("exclude")
+        if exclude and isinstance(exclude, str):
+            exclude = [s.strip() for s in exclude.split(",")]
+        units = query_params.get("units", "standard")
+        return float(query_params["lat"]), float(query_params["lon"]), exclude, units
+
+    def _real_query_result(
+        self, report: WeatherReport, exclude: Optional[list[str]], units: str
+    ) -> dict[str, Any]:
+        """Format a fetched report as the result of a real=true query."""
+        filtered_report = self._filter_report(ReportColumns.from_report(report), exclude)
+        converted_report = self._convert_units(filtered_report, units)
+        return {"reports": [converted_report.to_dict()], "count": 1}
 
     def query(self, query_params: dict[str, Any]) -> dict[str, Any]:
         """Execute a query against this state.
@@ -446,24 +458,14 @@ class WeatherState(ModalityState):
         Raises:
             ValueError: If required parameters are missing or invalid.
         """
-        if "lat" not in query_params or "lon" not in query_params:
-            raise ValueError("Query must include 'lat' and 'lon' parameters")
-
-        lat = float(query_params["lat"])
-        lon = float(query_params["lon"])
-        exclude = query_params.get("exclude")
-        if exclude and isinstance(exclude, str):
-            exclude = [s.strip() for s in exclude.split(",")]
-        units = query_params.get("units", "standard")
+        lat, lon, exclude, units = self._real_query_params(query_params)
         from_time = query_params.get("from")
         to_time = query_params.get("to")
         real = query_params.get("real", False)
 
         if real:
             report = self.query_openweather_api(lat, lon, exclude, units)
-            filtered_report = self._filter_report(report, exclude)
-            converted_report = self._convert_units(filtered_report, units)
-            return {"reports": [converted_report.model_dump()], "count": 1}
+            return self._real_query_result(report, exclude, units)
 
         location_key = self._get_location_key(lat, lon)
 
@@ -471,42 +473,40 @@ class WeatherState(ModalityState):
             return {"reports": [], "count": 0, "error": "No weather data for this location"}
 
         location = self.locations[location_key]
-        reports = []
+        matched: list[ReportColumns] = []
 
         if from_time:
             from_dt = datetime.fromtimestamp(from_time) if isinstance(from_time, (int, float)) else from_time
+            if to_time:
+                to_dt = datetime.fromtimestamp(to_time) if isinstance(to_time, (int, float)) else to_time
 
             for entry in location.report_history:
                 if to_time:
-                    to_dt = datetime.fromtimestamp(to_time) if isinstance(to_time, (int, float)) else to_time
                     if from_dt <= entry.timestamp <= to_dt:
-                        filtered_report = self._filter_report(entry.report, exclude)
-                        converted_report = self._convert_units(filtered_report, units)
-                        reports.append(converted_report.model_dump())
+                        matched.append(entry.report)
                 elif entry.timestamp >= from_dt:
-                    filtered_report = self._filter_report(entry.report, exclude)
-                    converted_report = self._convert_units(filtered_report, units)
-                    reports.append(converted_report.model_dump())
+                    matched.append(entry.report)
 
             if (to_time is None or location.last_updated <= to_dt) and location.last_updated >= from_dt:
-                filtered_report = self._filter_report(location.current_report, exclude)
-                converted_report = self._convert_units(filtered_report, units)
-                reports.append(converted_report.model_dump())
+                matched.append(location.current_report)
         else:
-            filtered_report = self._filter_report(location.current_report, exclude)
-            converted_report = self._convert_units(filtered_report, units)
-            reports.append(converted_report.model_dump())
+            matched.append(location.current_report)
 
         # Store total count before pagination
-        total_count = len(reports)
+        total_count = len(matched)
 
-        # Apply pagination
+        # Apply pagination before converting, so only returned reports are built
         offset = query_params.get("offset", 0)
         limit = query_params.get("limit")
         if offset:
-            reports = reports[offset:]
+            matched = matched[offset:]
         if limit:
-            reports = reports[:limit]
+            matched = matched[:limit]
+
+        reports = [
+            self._convert_units(self._filter_report(report, exclude), units).to_dict()
+            for report in matched
+        ]
 
         return {"reports": reports, "count": len(reports), "total_count": total_count}
 
@@ -546,7 +546,7 @@ class WeatherState(ModalityState):
             undo_data: dict[str, Any] = {
                 "action": "restore_previous",
                 "location_key": location_key,
-                "previous_report": location.current_report.model_dump(),
+                "previous_report": location.current_report.to_dict(),
                 "previous_last_updated": location.last_updated.isoformat(),
                 "previous_update_count": location.update_count,
                 "state_previous_update_count": self.update_count,
@@ -558,7 +558,7 @@ class WeatherState(ModalityState):
                 oldest = location.report_history[0]
                 undo_data["removed_history_entry"] = {
                     "timestamp": oldest.timestamp.isoformat(),
-                    "report": oldest.report.model_dump(),
+                    "report": oldest.report.to_dict(),
                 }
 
             return undo_data
@@ -617,14 +617,16 @@ class WeatherState(ModalityState):
             # If we removed an old history entry due to max capacity, restore it
             if "removed_history_entry" in undo_data:
                 removed = undo_data["removed_history_entry"]
-                restored_entry = WeatherReportHistoryEntry(
+                restored_entry = WeatherReportHistoryRecord(
                     timestamp=datetime.fromisoformat(removed["timestamp"]),
-                    report=WeatherReport(**removed["report"]),
+                    report=ReportColumns.from_report(WeatherReport(**removed["report"])),
                 )
                 location.report_history.insert(0, restored_entry)
 
             # Restore the previous current report
-            location.current_report = WeatherReport(**undo_data["previous_report"])
+            location.current_report = ReportColumns.from_report(
+                WeatherReport(**undo_data["previous_report"])
+            )
             location.last_updated = datetime.fromisoformat(
                 undo_data["previous_last_updated"]
             )
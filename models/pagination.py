@@ -0,0 +1,349 @@
+"""Keyset (cursor) pagination helpers.
+
+Offset pagination filters and sorts the whole collection for every page, so
+walking a large collection page by page costs O(n) per page and O(n²)
+overall. Keyset pagination instead hands out an opaque cursor encoding the
+(sort key, id) of the last item returned, and the next page resumes right
+after that position in a sorted index: O(log n) to find the position plus
+the cost of reading one page.
+
+Indexes are ordered by sort key with ties broken by the item's position in
+the source collection, which is exactly the order Python's stable sort
+produces. Cursor pages therefore line up with offset pages for the same sort.
+"""
+
+import base64
+import binascii
+import json
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Number of candidates filtered at a time when collecting a cursor page
+DEFAULT_BATCH_SIZE = 64
+
+
+def unsorted_key(item: Any) -> int:
+    """Sort key for collections paginated in source order.
+
+    Args:
+        item: The item (unused).
+
+    Returns:
+        The same key for every item, so ties keep source order.
+    """
+    return 0
+
+
+def _encode_key(value: Any) -> Any:
+    """Convert a sort key into a JSON-compatible value.
+
+    Args:
+        value: The sort key. Tuples, datetimes and dates are tagged so that
+            they can be restored to comparable values.
+
+    Returns:
+        A JSON-compatible representation of the key.
+    """
+    if isinstance(value, tuple):
+        return {"t": [_encode_key(item) for item in value]}
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_key(value: Any) -> Any:
+    """Restore a sort key encoded by _encode_key.
+
+    Args:
+        value: The JSON-compatible representation.
+
+    Returns:
+        The original sort key.
+    """
+    if isinstance(value, dict):
+        if "t" in value:
+            return tuple(_decode_key(item) for item in value["t"])
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+    return value
+
+
+def encode_cursor(sort_key: Any, item_id: str, sort: str) -> str:
+    """Encode a pagination position as an opaque cursor.
+
+    Args:
+        sort_key: Sort key of the last item on the page.
+        item_id: ID of the last item on the page.
+        sort: Identifier of the sort order the position belongs to
+            (e.g. "date:desc"). Cursors are only valid for the same sort.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    payload = json.dumps(
+        {"k": _encode_key(sort_key), "id": item_id, "s": sort},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple[Any, str]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: The cursor string.
+        sort: Identifier of the sort order being paginated.
+
+    Returns:
+        Tuple of (sort key, item ID) of the last item on the previous page.
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to a different sort.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        sort_key = _decode_key(payload["k"])
+        item_id = payload["id"]
+        cursor_sort = payload["s"]
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(item_id, str) or cursor_sort != sort:
+        raise ValueError(
+            f"Cursor does not match the requested sort order ({sort})"
+        )
+    return sort_key, item_id
+
+
+class SortedIndex:
+    """Sorted (sort key, id) index over a collection, for keyset pagination.
+
+    Args:
+        items: (item ID, sort key) pairs in source collection order.
+        descending: Whether the index is walked in descending key order.
+            Ties keep source order in both directions, as a stable sort does.
+    """
+
+    def __init__(self, items: Iterable[tuple[str, Any]], descending: bool = False):
+        self.descending = descending
+        self.last_id: str | None = None
+        self._ranks: dict[str, int] = {}
+        entries = []
+        for rank, (item_id, sort_key) in enumerate(items):
+            self.last_id = item_id
+            # Negating the rank makes a backwards walk keep source order on ties
+            tiebreak = -rank if descending else rank
+            self._ranks[item_id] = tiebreak
+            entries.append((sort_key, tiebreak, item_id))
+        entries.sort(key=_entry_position)
+        self._entries = entries
+        self._next_rank = len(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def extend(self, items: Iterable[tuple[str, Any]]) -> None:
+        """Add items appended to the source collection after it was indexed.
+
+        Each item is inserted at its sorted position, ranked after every item
+        already indexed, so the index matches one rebuilt from scratch.
+
+        Args:
+            items: (item ID, sort key) pairs in source collection order.
+        """
+        for item_id, sort_key in items:
+            rank = self._next_rank
+            self._next_rank += 1
+            tiebreak = -rank if self.descending else rank
+            self.last_id = item_id
+            self._ranks[item_id] = tiebreak
+            insort(self._entries, (sort_key, tiebreak, item_id), key=_entry_position)
+
+    def iter_ids(self, after: tuple[Any, str] | None = None) -> Iterator[str]:
+        """Iterate over item IDs in index order.
+
+        Args:
+            after: (sort key, item ID) of the last item already seen, or None
+                to start from the beginning. If that item is no longer in the
+                index, iteration resumes at the first item sharing its key.
+
+        Yields:
+            Item IDs following the given position.
+        """
+        entries = self._entries
+        if not self.descending:
+            if after is None:
+                start = 0
+            elif after[1] in self._ranks:
+                start = bisect_right(
+                    entries, (after[0], self._ranks[after[1]]), key=_entry_position
+                )
+            else:
+                start = bisect_left(entries, after[0], key=_entry_key)
+            for i in range(start, len(entries)):
+                yield entries[i][2]
+        else:
+            if after is None:
+                start = len(entries) - 1
+            elif after[1] in self._ranks:
+                start = bisect_left(
+                    entries, (after[0], self._ranks[after[1]]), key=_entry_position
+                ) - 1
+            else:
+                start = bisect_right(entries, after[0], key=_entry_key) - 1
+            for i in range(start, -1, -1):
+                yield entries[i][2]
+
+
+def _entry_position(entry: tuple[Any, int, str]) -> tuple[Any, int]:
+    """Return the ordering position of an index entry."""
+    return entry[0], entry[1]
+
+
+def _entry_key(entry: tuple[Any, int, str]) -> Any:
+    """Return the sort key of an index entry."""
+    return entry[0]
+
+
+class SortedIndexCache:
+    """Lazily built sorted indexes for a modality state.
+
+    Indexes are built on first use and kept until invalidate() is called.
+    Changes to which items the collection holds are detected on get(): items
+    appended since an index was built are inserted into it, and an index is
+    rebuilt if any item it holds was removed. States therefore only call
+    invalidate() when an item's sort key changes. The cache is derived data:
+    it never affects model equality and is not carried over when a state is
+    copied or pickled.
+    """
+
+    def __init__(self) -> None:
+        self._indexes: dict[tuple[str, bool], SortedIndex] = {}
+
+    def get(
+        self,
+        name: str,
+        descending: bool,
+        source: dict[str, T],
+        key: Callable[[T], Any],
+    ) -> SortedIndex:
+        """Return an up-to-date index, building it if necessary.
+
+        Args:
+            name: Name of the sort the index is for.
+            descending: Whether the index is walked in descending order.
+            source: The collection to index, mapping item ID to item, in
+                insertion order (a dict).
+            key: Function returning an item's sort key.
+
+        Returns:
+            The sorted index.
+        """
+        index = self._indexes.get((name, descending))
+        if index is not None and not self._catch_up(index, source, key):
+            index = None
+        if index is None:
+            index = SortedIndex(
+                ((item_id, key(item)) for item_id, item in source.items()),
+                descending,
+            )
+            self._indexes[(name, descending)] = index
+        return index
+
+    @staticmethod
+    def _catch_up(
+        index: SortedIndex, source: dict[str, T], key: Callable[[T], Any]
+    ) -> bool:
+        """Add items appended to source since index was last updated.
+
+        Dicts keep insertion order, and removing a key moves every later key
+        one position back. So none of the indexed items was removed exactly
+        when the last indexed item is still at position len(index) - 1, and
+        every item after it was appended.
+
+        Args:
+            index: The index to update.
+            source: The indexed collection.
+            key: Function returning an item's sort key.
+
+        Returns:
+            True if the index now covers source, False if items it holds were
+            removed and it must be rebuilt.
+        """
+        added = len(source) - len(index)
+        if added < 0:
+            return False
+        # The newest added + 1 entries: the indexed last item, then the new ones
+        tail = list(islice(reversed(source.items()), added + 1))
+        if len(index) == 0:
+            tail.append((None, None))
+        if tail[-1][0] != index.last_id:
+            return False
+        if added:
+            index.extend((item_id, key(item)) for item_id, item in reversed(tail[:-1]))
+        return True
+
+    def invalidate(self) -> None:
+        """Discard all indexes after items were removed or re-keyed."""
+        self._indexes.clear()
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SortedIndexCache)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __copy__(self) -> "SortedIndexCache":
+        return SortedIndexCache()
+
+    def __deepcopy__(self, memo: dict) -> "SortedIndexCache":
+        return SortedIndexCache()
+
+    def __reduce__(self) -> tuple:
+        return (SortedIndexCache, ())
+
+
+def collect_page(
+    candidates: Iterable[T],
+    select: Callable[[list[T]], list[T]],
+    limit: int | None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> tuple[list[T], bool]:
+    """Collect one page of matching items from an ordered candidate stream.
+
+    Candidates are read in batches and passed through select, which filters
+    a batch while preserving its order. Reading stops as soon as the page is
+    full, so the cost is proportional to the number of candidates examined
+    rather than to the size of the collection.
+
+    Args:
+        candidates: Items in page order.
+        select: Function filtering a batch of items.
+        limit: Page size, or None to collect every remaining match.
+        batch_size: Minimum number of candidates filtered at a time.
+
+    Returns:
+        Tuple of (page items, whether more matching items follow).
+    """
+    page: list[T] = []
+    iterator = iter(candidates)
+    size = batch_size if limit is None else max(batch_size, limit + 1)
+    while True:
+        batch = []
+        for item in iterator:
+            batch.append(item)
+            if len(batch) >= size:
+                break
+        if not batch:
+            return page, False
+        page.extend(select(batch))
+        if limit is not None and len(page) > limit:
+            return page[:limit], True
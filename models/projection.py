@@ -0,0 +1,61 @@
+"""Sparse fieldset (projection) helpers for modality queries.
+
+Query results are usually consumed by agents that only need a handful of
+fields (ids, subjects, senders, timestamps). Projection lets a query name the
+fields it wants so that everything else is skipped during serialization
+rather than dumped and then thrown away.
+"""
+
+from collections.abc import Collection
+from typing import Any
+
+from pydantic import BaseModel
+
+from models.records import Record
+
+
+def validate_fields(
+    fields: Collection[str] | None, model_cls: type[BaseModel]
+) -> list[str] | None:
+    """Validate a requested field list against a model's fields.
+
+    Args:
+        fields: Requested field names, or None for no projection.
+        model_cls: The model class the fields must belong to.
+
+    Returns:
+        The field names as a de-duplicated list (in request order), or None
+        if no projection was requested.
+
+    Raises:
+        ValueError: If the list is empty or names unknown fields.
+    """
+    if fields is None:
+        return None
+    if len(fields) == 0:
+        raise ValueError("fields must name at least one field")
+    unknown = [name for name in fields if name not in model_cls.model_fields]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields for {model_cls.__name__}: {', '.join(unknown)}. "
+            f"Valid fields: {', '.join(model_cls.model_fields)}"
+        )
+    return list(dict.fromkeys(fields))
+
+
+def project(model: BaseModel | Record, fields: Collection[str] | None) -> dict[str, Any]:
+    """Dump a model or record, restricted to the requested fields.
+
+    Unrequested fields are never serialized, so large values such as email
+    bodies and attachment lists cost nothing when they are not asked for.
+
+    Args:
+        model: The model or record instance to dump.
+        fields: Field names to include, or None for all fields.
+
+    Returns:
+        Dictionary containing only the requested fields.
+    """
+    if fields is None:
+        return model.model_dump()
+    return model.model_dump(include=set(fields))
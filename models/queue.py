@@ -1,12 +1,19 @@
 """Event queue model."""
 
 import bisect
+import heapq
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from models.event import EventStatus, SimulatorEvent
+from models.metrics import QUEUE_OPERATIONS, REGISTRY
+from models.pagination import decode_cursor, encode_cursor
+
+# Sort identifier bound into event queue cursors
+QUEUE_CURSOR_SORT = "queue"
 
 
 class EventQueue(BaseModel):
@@ -19,18 +26,31 @@ class EventQueue(BaseModel):
     event log. Executed events remain in the queue for debugging and
     analysis unless explicitly cleared.
 
+    The IDs of queued events are kept in a set so duplicate checks do not
+    scan the queue. Code that edits events directly instead of through the
+    queue's methods is tolerated: the set is rebuilt whenever its size no
+    longer matches the number of events.
+
     Args:
         events: All events in the queue (pending, executed, failed, etc.).
+        coalesce: Whether the engine coalesces mergeable due events before
+            executing them (see coalesce_events()).
     """
 
     events: list[SimulatorEvent] = Field(
         default_factory=list,
         description="All events in the queue, sorted by scheduled_time",
     )
+    coalesce: bool = Field(
+        default=False,
+        description="Whether mergeable due events are coalesced before execution",
+    )
 
     class Config:
         arbitrary_types_allowed = True
 
+    _event_ids: set[str] = PrivateAttr(default_factory=set)
+
     @property
     def next_event_time(self) -> Optional[datetime]:
         """Timestamp of the next pending event, or None if queue is empty.
@@ -72,7 +92,8 @@ class EventQueue(BaseModel):
             ValueError: If event with same event_id already exists.
         """
         # Check for duplicate ID
-        if any(e.event_id == event.event_id for e in self.events):
+        event_ids = self._ids()
+        if event.event_id in event_ids:
             raise ValueError(f"Event {event.event_id} already exists in queue")
 
         # Validate event
@@ -85,12 +106,19 @@ class EventQueue(BaseModel):
 
         # Insert at correct position
         self.events.insert(insert_index, event)
+        event_ids.add(event.event_id)
+
+        if REGISTRY.enabled:
+            QUEUE_OPERATIONS.labels("add").inc()
 
     def add_events(self, events: list[SimulatorEvent]) -> None:
         """Add multiple events to the queue efficiently.
 
-        Merges new events with existing ones and sorts once in O(n log n).
-        More efficient than calling add_event() repeatedly.
+        Sorts only the new events and merges them into the queue in
+        O(n + k log k) for k new events; if they all sort after the queue's
+        last event (the usual case when streaming a scenario in time order),
+        they are simply appended. More efficient than calling add_event()
+        repeatedly.
 
         Args:
             events: List of events to add.
@@ -99,13 +127,13 @@ class EventQueue(BaseModel):
             ValueError: If any event_id conflicts with existing events.
         """
         # Check for duplicates within new events
-        new_ids = [e.event_id for e in events]
-        if len(new_ids) != len(set(new_ids)):
+        new_ids = {e.event_id for e in events}
+        if len(new_ids) != len(events):
             raise ValueError("Duplicate event_ids in new events")
 
         # Check for conflicts with existing events
-        existing_ids = {e.event_id for e in self.events}
-        conflicts = existing_ids.intersection(new_ids)
+        event_ids = self._ids()
+        conflicts = event_ids & new_ids
         if conflicts:
             raise ValueError(f"Event IDs already exist in queue: {conflicts}")
 
@@ -115,9 +143,17 @@ class EventQueue(BaseModel):
             if errors:
                 raise ValueError(f"Invalid event {event.event_id}: {errors}")
 
-        # Add and sort all at once
-        self.events.extend(events)
-        self._sort_events()
+        # Ties keep existing events first, as a stable sort of both would
+        batch = sorted(events, key=self.sort_key)
+        queued = self.events
+        if not queued or not batch or self.sort_key(batch[0]) >= self.sort_key(queued[-1]):
+            queued.extend(batch)
+        else:
+            queued[:] = heapq.merge(queued, batch, key=self.sort_key)
+        event_ids.update(new_ids)
+
+        if REGISTRY.enabled:
+            QUEUE_OPERATIONS.labels("add").inc(len(events))
 
     def get_due_events(self, current_time: datetime) -> list[SimulatorEvent]:
         """Get all pending events with scheduled_time <= current_time.
@@ -136,8 +172,58 @@ class EventQueue(BaseModel):
             for e in self.events
             if e.status == EventStatus.PENDING and e.scheduled_time <= current_time
         ]
+
+        if REGISTRY.enabled:
+            QUEUE_OPERATIONS.labels("get_due").inc()
+
         return due_events
 
+    def coalesce_events(self, events: list[SimulatorEvent]) -> list[SimulatorEvent]:
+        """Collapse runs of mergeable events into their latest event.
+
+        Events are grouped into streams by modality and affected entities.
+        Within a stream, an event whose input says it should merge with the
+        next event's input (ModalityInput.should_merge_with()) is skipped in
+        favour of that next event, and its metadata records the event it was
+        merged into under "merged_into". Chains of mergeable events collapse
+        into the last one, so only that event's input is applied.
+
+        Args:
+            events: Pending events in execution order, as returned by
+                get_due_events().
+
+        Returns:
+            The events that were not merged away, in execution order.
+        """
+        latest: dict[tuple, SimulatorEvent] = {}
+        merged = 0
+
+        for event in events:
+            try:
+                event.get_input()
+            except ValueError:
+                # Events whose input cannot be parsed are left to fail on execute
+                continue
+            stream = (event.modality, tuple(event.get_dependencies()))
+
+            previous = latest.get(stream)
+            latest[stream] = event
+            if previous is None or not previous.get_input().should_merge_with(
+                event.get_input()
+            ):
+                continue
+
+            previous.skip(f"Merged into event {event.event_id}")
+            previous.metadata["merged_into"] = event.event_id
+            merged += 1
+
+        if REGISTRY.enabled and merged:
+            QUEUE_OPERATIONS.labels("coalesce").inc(merged)
+
+        if not merged:
+            return events
+        return [e for e in events if e.status == EventStatus.PENDING]
+
     def peek_next(self) -> Optional[SimulatorEvent]:
         """Get the next pending event without removing it.
 
@@ -160,6 +246,62 @@ class EventQueue(BaseModel):
         """
         return [e for e in self.events if e.status == status]
 
+    def iter_events(self, cursor: Optional[str] = None) -> Iterator[SimulatorEvent]:
+        """Iterate over events in queue order, optionally resuming at a cursor.
+
+        The queue is already sorted, so it doubles as the index for keyset
+        pagination: the resume position is found by binary search on the
+        cursor's sort key, then by event ID among events sharing that key.
+
+        Args:
+            cursor: A cursor from cursor_for(), or None to start at the
+                beginning. If the cursor's event has since been removed,
+                iteration resumes at the first event sharing its sort key.
+
+        Yields:
+            Events after the cursor position, in queue order.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        events = self.events
+        index = 0
+        if cursor is not None:
+            sort_key, event_id = decode_cursor(cursor, QUEUE_CURSOR_SORT)
+            index = bisect.bisect_left(events, sort_key, key=self.sort_key)
+            end = bisect.bisect_right(events, sort_key, key=self.sort_key)
+            for i in range(index, end):
+                if events[i].event_id == event_id:
+                    index = i + 1
+                    break
+
+        while index < len(events):
+            yield events[index]
+            index += 1
+
+    def cursor_for(self, event: SimulatorEvent) -> str:
+        """Create a cursor that resumes iteration right after an event.
+
+        Args:
+            event: The last event of a page.
+
+        Returns:
+            Opaque cursor string for iter_events().
+        """
+        return encode_cursor(self.sort_key(event), event.event_id, QUEUE_CURSOR_SORT)
+
+    @staticmethod
+    def sort_key(event: SimulatorEvent) -> tuple[datetime, int, datetime]:
+        """Return the key the queue is ordered by.
+
+        Args:
+            event: Event to compute the key for.
+
+        Returns:
+            Tuple of (scheduled_time, -priority, created_at).
+        """
+        return (event.scheduled_time, -event.priority, event.created_at)
+
     def get_events_in_range(
         self,
         start: datetime,
@@ -212,8 +354,12 @@ class EventQueue(BaseModel):
         Raises:
             KeyError: If event_id not found.
         """
+        event_ids = self._ids()
         for i, event in enumerate(self.events):
             if event.event_id == event_id:
+                if REGISTRY.enabled:
+                    QUEUE_OPERATIONS.labels("remove").inc()
+                event_ids.discard(event_id)
                 return self.events.pop(i)
 
         raise KeyError(f"Event {event_id} not found in queue")
@@ -248,6 +394,12 @@ class EventQueue(BaseModel):
                 )
             ]
 
+        # Rebuilt from the remaining events on next use
+        self._event_ids = set()
+
+        if REGISTRY.enabled:
+            QUEUE_OPERATIONS.labels("clear_executed").inc()
+
         return initial_count - len(self.events)
 
     def validate(self) -> list[str]:
@@ -297,15 +449,24 @@ class EventQueue(BaseModel):
 
         return errors
 
+    def _ids(self) -> set[str]:
+        """Return the set of queued event IDs, rebuilding it if out of date.
+
+        Returns:
+            The IDs of all events in the queue.
+        """
+        event_ids = self._event_ids
+        if len(event_ids) != len(self.events):
+            event_ids = self._event_ids = {e.event_id for e in self.events}
+        return event_ids
+
     def _sort_events(self) -> None:
         """Sort events by (scheduled_time, -priority, created_at).
 
-        Called after bulk insertions or modifications.
+        Restores order after events are edited directly.
         Negative priority so higher priority executes first.
         """
-        self.events.sort(
-            key=lambda e: (e.scheduled_time, -e.priority, e.created_at)
-        )
+        self.events.sort(key=self.sort_key)
 
     def _find_insert_index(self, event: SimulatorEvent) -> int:
         """Find correct insertion index using binary search.
@@ -318,23 +479,6 @@ class EventQueue(BaseModel):
         Returns:
             Index where event should be inserted.
         """
-        # Custom comparison key matching _sort_events
-        class EventKey:
-            def __init__(self, scheduled_time: datetime, priority: int, created_at: datetime):
-                self.scheduled_time = scheduled_time
-                self.priority = priority
-                self.created_at = created_at
-
-            def __lt__(self, other):
-                if self.scheduled_time != other.scheduled_time:
-                    return self.scheduled_time < other.scheduled_time
-                if self.priority != other.priority:
-                    return self.priority > other.priority  # Higher priority first
-                return self.created_at < other.created_at
-
-        event_key = EventKey(event.scheduled_time, event.priority, event.created_at)
-        existing_keys = [
-            EventKey(e.scheduled_time, e.priority, e.created_at) for e in self.events
-        ]
-
-        return bisect.bisect_right(existing_keys, event_key)
+        return bisect.bisect_right(
+            self.events, self.sort_key(event), key=self.sort_key
+        )
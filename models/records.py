@@ -0,0 +1,129 @@
+"""Compact record types for entities modality states hold in bulk.
+
+States keep their high-volume entities (emails, messages, calendar events,
+history entries) as records rather than Pydantic models. A record is a
+slotted dataclass with the same fields as the Pydantic model it mirrors: it
+has no per-instance __dict__ or fields-set bookkeeping, and building one
+runs no validation, so it takes a fraction of the memory and construction
+time of the model. The model stays the public, validated shape of the
+entity and is built from the record only at the API boundary.
+
+Records validate and dump with the model's own field schemas, so a dumped
+record is identical to the dumped model, and state fields holding records
+dump and load like fields holding models.
+
+Records are declared as::
+
+    @dataclass(slots=True, kw_only=True)
+    class EmailRecord(Record):
+        model: ClassVar[type[BaseModel]] = Email
+
+        message_id: str
+        ...
+
+Fields must match the model's fields in name and order. Methods that only
+read and assign fields can be shared with the model by assignment (e.g.
+``mark_read = Email.mark_read``).
+"""
+
+from functools import cache
+from typing import Any, ClassVar, Self
+
+from pydantic import BaseModel, GetCoreSchemaHandler, TypeAdapter
+from pydantic_core import core_schema
+
+
+class Record:
+    """Base class for slotted records mirroring a Pydantic model.
+
+    Attributes:
+        model: The Pydantic model class this record mirrors.
+    """
+
+    __slots__ = ()
+
+    model: ClassVar[type[BaseModel]]
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> Self:
+        """Create a record from an instance of its model.
+
+        The record takes over the model's field values without copying them.
+
+        Args:
+            model: The model instance to convert.
+
+        Returns:
+            The equivalent record.
+        """
+        return cls(**model.__dict__)
+
+    @classmethod
+    def model_validate(cls, data: Any) -> Self:
+        """Validate data as the model would, producing a record.
+
+        Args:
+            data: A record, a model instance, or anything the model validates
+                (such as a dumped dictionary).
+
+        Returns:
+            The validated record.
+        """
+        return _adapter(cls).validate_python(data)
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        """Dump this record exactly as its model would be dumped.
+
+        Args:
+            **kwargs: Arguments for TypeAdapter.dump_python(), such as mode
+                and include.
+
+        Returns:
+            Dictionary representation of this record.
+        """
+        return _adapter(type(self)).dump_python(self, **kwargs)
+
+    def to_model(self) -> BaseModel:
+        """Build the Pydantic model for this record.
+
+        Returns:
+            The equivalent model instance, with its own copies of mutable
+            field values.
+        """
+        return self.model.model_validate(self, from_attributes=True)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Let models hold record fields.
+
+        The field accepts a record, a model instance or anything the model
+        validates, and dumps as the model would. Validation and dumping use
+        the model's field schemas, applied to the record's slots.
+        """
+        model_fields = cls.model.__pydantic_core_schema__["schema"]["fields"]
+        record_schema = core_schema.dataclass_schema(
+            cls,
+            core_schema.dataclass_args_schema(
+                cls.__name__,
+                [
+                    core_schema.dataclass_field(
+                        name, model_fields[name]["schema"], kw_only=True
+                    )
+                    for name in cls.__slots__
+                ],
+            ),
+            list(cls.__slots__),
+            slots=True,
+        )
+        from_model = core_schema.no_info_after_validator_function(
+            cls.from_model, core_schema.is_instance_schema(cls.model)
+        )
+        return core_schema.union_schema([record_schema, from_model])
+
+
+@cache
+def _adapter(record_type: type[Record]) -> TypeAdapter:
+    """Return the (cached) TypeAdapter for a record type."""
+    return TypeAdapter(record_type)
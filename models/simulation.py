@@ -15,8 +15,11 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import BaseModel, Field
 
+from models.concurrency import ReadWriteLock
 from models.environment import Environment
 from models.event import EventStatus, SimulatorEvent
+from models.metrics import REGISTRY, TICK_DURATION_SECONDS, TICK_LAG_SECONDS
+from models.pagination import collect_page
 from models.queue import EventQueue
 from models.undo import UndoEntry, UndoStack
 
@@ -25,6 +28,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Name of the auto-advance thread, so diagnostics can find it
+SIMULATION_LOOP_THREAD_NAME = "ues-simulation-loop"
+
 
 class SimulationEngine(BaseModel):
     """Main orchestrator for UES simulation.
@@ -66,7 +72,18 @@ class SimulationEngine(BaseModel):
         super().__init__(**data)
         # Initialize private attributes after Pydantic initialization
         self._loop: Optional[SimulationLoop] = None
-        self._operation_lock = threading.Lock()
+        self._operation_lock = ReadWriteLock()
+
+    @property
+    def operation_lock(self) -> ReadWriteLock:
+        """Reader/writer lock guarding simulation state.
+
+        Every mutation (ticks, time control, event execution, undo/redo,
+        reset, clear, pause/resume) holds it for writing, so writers are
+        serialized. Callers reading state from other threads hold it for
+        reading, which lets many readers proceed together between writes.
+        """
+        return self._operation_lock
 
     # ===== Lifecycle Methods =====
 
@@ -86,28 +103,29 @@ class SimulationEngine(BaseModel):
         Raises:
             RuntimeError: If simulation is already running.
         """
-        if self.is_running:
-            raise RuntimeError("Simulation is already running")
+        with self._operation_lock.write():
+            if self.is_running:
+                raise RuntimeError("Simulation is already running")
 
-        # Validate before starting
-        errors = self.validate()
-        if errors:
-            raise ValueError(f"Cannot start simulation with validation errors: {errors}")
+            # Validate before starting
+            errors = self.validate()
+            if errors:
+                raise ValueError(f"Cannot start simulation with validation errors: {errors}")
 
-        self.is_running = True
-        
-        if auto_advance:
-            # Configure time scale
-            self.environment.time_state.time_scale = time_scale
-            self.environment.time_state.auto_advance = True
-            
-            # Create and start loop
-            self._loop = SimulationLoop(engine=self)
-            self._loop.start()
+            self.is_running = True
             
-            mode = "auto_advance"
-        else:
-            mode = "manual"
+            if auto_advance:
+                # Configure time scale
+                self.environment.time_state.time_scale = time_scale
+                self.environment.time_state.auto_advance = True
+                
+                # Create and start loop; its first tick waits for this write
+                self._loop = SimulationLoop(engine=self)
+                self._loop.start()
+                
+                mode = "auto_advance"
+            else:
+                mode = "manual"
 
         logger.info(
             f"Simulation {self.simulation_id} started in {mode} mode "
@@ -203,37 +221,39 @@ class SimulationEngine(BaseModel):
         if self.is_running:
             self.stop()
 
-        # Undo all events in the undo stack
-        events_undone = 0
-        undo_errors = []
-
-        while self.undo_stack.can_undo:
-            entries = self.undo_stack.pop_for_undo(count=1)
-            for entry in entries:
-                try:
-                    # Get the modality state
-                    state = self.environment.get_state(entry.modality)
-                    # Apply undo
-                    state.apply_undo(entry.undo_data)
-                    events_undone += 1
-                    logger.debug(
-                        f"Reset: undid event {entry.event_id} ({entry.modality})"
-                    )
-                except Exception as e:
-                    error_msg = f"Failed to undo event {entry.event_id}: {e}"
-                    undo_errors.append(error_msg)
-                    logger.warning(error_msg)
-                    # Continue with remaining undos
-
-        # Reset all events to pending status
-        events_reset = len(self.event_queue.events)
-        for event in self.event_queue.events:
-            event.status = EventStatus.PENDING
-            event.executed_at = None
-            event.error_message = None
+        with self._operation_lock.write():
+            # Undo all events in the undo stack
+            events_undone = 0
+            undo_errors = []
 
-        # Clear both stacks (undo stack should already be empty, but clear redo too)
-        self.undo_stack.clear()
+            while self.undo_stack.can_undo:
+                entries = self.undo_stack.pop_for_undo(count=1)
+                for entry in entries:
+                    try:
+                        # Get the modality state
+                        state = self.environment.get_state(entry.modality)
+                        # Apply undo
+                        state.apply_undo(entry.undo_data)
+                        events_undone += 1
+                        logger.debug(
+                            f"Reset: undid event {entry.event_id} ({entry.modality})"
+                        )
+                    except Exception as e:
+                        error_msg = f"Failed to undo event {entry.event_id}: {e}"
+                        undo_errors.append(error_msg)
+                        logger.warning(error_msg)
+                        # Continue with remaining undos
+
+            # Reset all events to pending status
+            events_reset = len(self.event_queue.events)
+            for event in self.event_queue.events:
+                event.status = EventStatus.PENDING
+                event.executed_at = None
+                event.error_message = None
+                event.metadata.pop("merged_into", None)
+
+            # Clear both stacks (undo stack should already be empty, but clear redo too)
+            self.undo_stack.clear()
 
         logger.info(
             f"Simulation {self.simulation_id} reset: "
@@ -271,25 +291,26 @@ class SimulationEngine(BaseModel):
         if self.is_running:
             self.stop()
 
-        # Clear undo/redo stacks since all state is being cleared
-        self.undo_stack.clear()
-
-        # Count and remove all events
-        events_removed = len(self.event_queue.events)
-        self.event_queue.events.clear()
-
-        # Determine the timestamp to use for cleared states
-        if reset_time_to is not None:
-            # Directly set current_time to allow backwards time travel during clear
-            # (unlike set_time(), which doesn't allow backwards jumps)
-            self.environment.time_state.current_time = reset_time_to
-            self.environment.time_state.last_wall_time_update = datetime.now(timezone.utc)
-            new_timestamp = reset_time_to
-        else:
-            new_timestamp = self.environment.time_state.current_time
+        with self._operation_lock.write():
+            # Clear undo/redo stacks since all state is being cleared
+            self.undo_stack.clear()
+
+            # Count and remove all events
+            events_removed = len(self.event_queue.events)
+            self.event_queue.events.clear()
+
+            # Determine the timestamp to use for cleared states
+            if reset_time_to is not None:
+                # Directly set current_time to allow backwards time travel during clear
+                # (unlike set_time(), which doesn't allow backwards jumps)
+                self.environment.time_state.current_time = reset_time_to
+                self.environment.time_state.last_wall_time_update = datetime.now(timezone.utc)
+                new_timestamp = reset_time_to
+            else:
+                new_timestamp = self.environment.time_state.current_time
 
-        # Clear all modality states
-        modalities_cleared = self.environment.clear_all_states(new_timestamp)
+            # Clear all modality states
+            modalities_cleared = self.environment.clear_all_states(new_timestamp)
 
         logger.info(
             f"Simulation {self.simulation_id} cleared: "
@@ -331,7 +352,7 @@ class SimulationEngine(BaseModel):
         if delta <= timedelta(0):
             raise ValueError(f"Time delta must be positive, got {delta}")
 
-        with self._operation_lock:
+        with self._operation_lock.write():
             # Advance time
             self.environment.time_state.advance(delta)
 
@@ -386,7 +407,7 @@ class SimulationEngine(BaseModel):
                 f"current={current_time}, target={new_time}"
             )
 
-        with self._operation_lock:
+        with self._operation_lock.write():
             # Find events in skipped range
             skipped_events = [
                 e
@@ -448,7 +469,7 @@ class SimulationEngine(BaseModel):
         if not self.is_running:
             raise ValueError("Cannot skip to next event: simulation is not running")
 
-        with self._operation_lock:
+        with self._operation_lock.write():
             # Peek at next event
             next_event = self.event_queue.peek_next()
 
@@ -486,7 +507,8 @@ class SimulationEngine(BaseModel):
         Freezes time advancement (sets environment.time_state.is_paused = True).
         If SimulationLoop is running, it will idle but remain active.
         """
-        self.environment.time_state.pause()
+        with self._operation_lock.write():
+            self.environment.time_state.pause()
         logger.info(f"Simulation {self.simulation_id} paused")
 
     def resume(self) -> None:
@@ -495,9 +517,25 @@ class SimulationEngine(BaseModel):
         Unfreezes time (sets is_paused = False).
         Resets wall_time_anchor to prevent time jump.
         """
-        self.environment.time_state.resume()
+        with self._operation_lock.write():
+            self.environment.time_state.resume()
         logger.info(f"Simulation {self.simulation_id} resumed")
 
+    def set_time_scale(self, scale: float) -> None:
+        """Change the time multiplier used by auto-advance mode.
+
+        Args:
+            scale: New time scale (must be > 0).
+
+        Raises:
+            ValueError: If scale is not positive.
+        """
+        if not scale > 0:
+            raise ValueError(f"Time scale must be positive, got {scale}")
+        with self._operation_lock.write():
+            self.environment.time_state.time_scale = scale
+        logger.info(f"Simulation {self.simulation_id} time scale set to {scale}")
+
     # ===== Event Management Methods =====
 
     def add_event(self, event: SimulatorEvent) -> None:
@@ -518,13 +556,70 @@ class SimulationEngine(BaseModel):
             raise ValueError(f"Invalid event: {errors}")
 
         # Add to queue
-        self.event_queue.add_event(event)
+        with self._operation_lock.write():
+            self.event_queue.add_event(event)
 
         logger.debug(
             f"Added event {event.event_id} for {event.modality} "
             f"at {event.scheduled_time}"
         )
 
+    def execute_immediate_event(self, event: SimulatorEvent) -> SimulatorEvent:
+        """Add an event and execute it right away, as a single write.
+
+        Used by modality action endpoints. Adding, executing, and recording
+        undo data happen under one write lock so that no tick or other
+        writer interleaves with them.
+
+        Args:
+            event: Event to add, normally scheduled at the current time.
+
+        Returns:
+            The event, after execution.
+
+        Raises:
+            ValueError: If event validation fails.
+        """
+        with self._operation_lock.write():
+            self.add_event(event)
+
+            undo_entry = event.execute(self.environment, capture_undo=True)
+
+            # Push undo entry to stack if execution captured one
+            if undo_entry is not None:
+                self.undo_stack.push(undo_entry)
+
+        return event
+
+    def cancel_event(self, event_id: str) -> SimulatorEvent:
+        """Cancel a pending event so it never executes.
+
+        Args:
+            event_id: ID of the event to cancel.
+
+        Returns:
+            The cancelled event.
+
+        Raises:
+            KeyError: If no event has this ID.
+            ValueError: If the event is not pending.
+        """
+        with self._operation_lock.write():
+            event = next(
+                (e for e in self.event_queue.events if e.event_id == event_id), None
+            )
+            if event is None:
+                raise KeyError(event_id)
+            if event.status != EventStatus.PENDING:
+                raise ValueError(
+                    f"Cannot cancel event with status {event.status.value}. "
+                    "Only pending events can be cancelled."
+                )
+            event.status = EventStatus.CANCELLED
+
+        logger.debug(f"Cancelled event {event_id}")
+        return event
+
     def execute_due_events(self) -> list[SimulatorEvent]:
         """Execute all events that are currently due.
         
@@ -535,12 +630,18 @@ class SimulationEngine(BaseModel):
         
         Captures undo data for each successfully executed event and pushes
         it to the undo stack.
+
+        If the event queue has coalescing enabled, mergeable due events are
+        first collapsed into their latest event; the merged-away events are
+        marked SKIPPED and are not returned.
         
         Returns:
             List of executed events (both successful and failed).
         """
         current_time = self.environment.time_state.current_time
         due_events = self.event_queue.get_due_events(current_time)
+        if self.event_queue.coalesce:
+            due_events = self.event_queue.coalesce_events(due_events)
 
         executed = []
         for event in due_events:
@@ -586,8 +687,70 @@ class SimulationEngine(BaseModel):
         Returns:
             List of matching events.
         """
-        results = self.event_queue.events
+        return self._filter_events(
+            self.event_queue.events, status, start_time, end_time, modality
+        )
 
+    def page_events(
+        self,
+        status: Optional[EventStatus] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        modality: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> tuple[list[SimulatorEvent], Optional[str]]:
+        """Get one page of matching events using keyset pagination.
+        
+        Unlike query_events(), this walks the queue from the cursor position
+        and stops as soon as the page is full, so each page costs
+        O(log n + page) instead of a scan of the whole queue.
+        
+        Args:
+            status: Filter by event status.
+            start_time: Filter by scheduled_time >= start_time.
+            end_time: Filter by scheduled_time <= end_time.
+            modality: Filter by modality name.
+            limit: Maximum number of events to return (None = all remaining).
+            cursor: next_cursor from a previous page, or None for the first page.
+        
+        Returns:
+            Tuple of (matching events, cursor for the next page or None if
+            there are no more matches).
+        
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        page, has_more = collect_page(
+            self.event_queue.iter_events(cursor),
+            lambda batch: self._filter_events(
+                batch, status, start_time, end_time, modality
+            ),
+            limit,
+        )
+        next_cursor = self.event_queue.cursor_for(page[-1]) if has_more else None
+        return page, next_cursor
+
+    def _filter_events(
+        self,
+        results: list[SimulatorEvent],
+        status: Optional[EventStatus],
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        modality: Optional[str],
+    ) -> list[SimulatorEvent]:
+        """Apply event filters to a list of events, preserving its order.
+        
+        Args:
+            results: Events to filter.
+            status: Filter by event status.
+            start_time: Filter by scheduled_time >= start_time.
+            end_time: Filter by scheduled_time <= end_time.
+            modality: Filter by modality name.
+        
+        Returns:
+            The events that match every filter.
+        """
         if status is not None:
             results = [e for e in results if e.status == status]
 
@@ -643,7 +806,7 @@ class SimulationEngine(BaseModel):
                 "message": "Nothing to undo",
             }
 
-        with self._operation_lock:
+        with self._operation_lock.write():
             # Pop entries from undo stack
             entries = self.undo_stack.pop_for_undo(count)
             undone_events = []
@@ -727,7 +890,7 @@ class SimulationEngine(BaseModel):
                 "message": "Nothing to redo",
             }
 
-        with self._operation_lock:
+        with self._operation_lock.write():
             # Pop entries from redo stack
             entries = self.undo_stack.pop_for_redo(count)
             redone_events = []
@@ -750,10 +913,11 @@ class SimulationEngine(BaseModel):
                     state = self.environment.get_state(entry.modality)
 
                     # Capture new undo data before re-applying
-                    new_undo_data = state.create_undo_data(original_event.data)
+                    input_data = original_event.get_input()
+                    new_undo_data = state.create_undo_data(input_data)
 
                     # Re-apply the original input
-                    state.apply_input(original_event.data)
+                    state.apply_input(input_data)
 
                     # Create new undo entry and add to undo stack
                     # Note: We append directly instead of using push() to preserve
@@ -909,7 +1073,7 @@ class SimulationEngine(BaseModel):
         Called repeatedly by SimulationLoop in auto-advance mode.
         Should not be called directly by external code.
         """
-        with self._operation_lock:
+        with self._operation_lock.write():
             # Calculate time advancement
             current_wall_time = datetime.now(timezone.utc)
             wall_elapsed = (
@@ -983,22 +1147,43 @@ class SimulationLoop:
 
         self.is_running = True
         self._stop_event.clear()
-        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread = threading.Thread(
+            target=self._run_loop, name=SIMULATION_LOOP_THREAD_NAME, daemon=True
+        )
         self._thread.start()
 
         logger.info("SimulationLoop started")
 
-    def stop(self) -> None:
+    def stop(self, timeout: float = 1.0) -> None:
         """Stop the simulation loop gracefully.
         
         Sets stop event, waits for thread to finish current tick.
+
+        Args:
+            timeout: Seconds to wait for the loop thread to exit.
+
+        Raises:
+            RuntimeError: If the calling thread holds the engine's write lock;
+                the loop thread may be waiting on it to finish its tick, so
+                joining would only time out.
+            TimeoutError: If the loop thread does not exit within timeout.
+                The loop stays running and stop() may be called again.
         """
         if not self.is_running:
             return
 
+        if self.engine.operation_lock.write_owned:
+            raise RuntimeError(
+                "Cannot stop the simulation loop while holding the engine's write lock"
+            )
+
         self._stop_event.set()
         if self._thread:
-            self._thread.join(timeout=1.0)
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                raise TimeoutError(
+                    f"Simulation loop did not stop within {timeout} seconds"
+                )
 
         self.is_running = False
         self._thread = None
@@ -1011,15 +1196,22 @@ class SimulationLoop:
         Continuously:
         1. Check stop event
         2. Check if paused
-        3. Call engine.tick()
+        3. Call engine.tick(), recording tick duration and lag
         4. Sleep for tick_interval
+
+        Tick lag is how long after its scheduled start (the previous tick's
+        end plus tick_interval) a tick actually began; it grows when the
+        loop thread is starved of CPU or the GIL.
         """
+        due_at: Optional[float] = None
         while not self._stop_event.is_set():
             # Skip tick if paused, but keep loop running
             if self.engine.environment.time_state.is_paused:
+                due_at = None
                 time.sleep(self.tick_interval)
                 continue
 
+            started_at = time.perf_counter()
             try:
                 # Let engine handle all simulation logic
                 self.engine.tick()
@@ -1028,5 +1220,12 @@ class SimulationLoop:
                 logger.error(f"Error during simulation tick: {e}", exc_info=True)
                 # Could add circuit breaker here if errors persist
 
+            finished_at = time.perf_counter()
+            if REGISTRY.enabled:
+                TICK_DURATION_SECONDS.observe(finished_at - started_at)
+                if due_at is not None:
+                    TICK_LAG_SECONDS.observe(max(0.0, started_at - due_at))
+            due_at = finished_at + self.tick_interval
+
             # Brief sleep to avoid busy loop
             time.sleep(self.tick_interval)
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""Synthetic scenarios for load and soak testing.
+
+ScenarioGenerator produces seeded, deterministic multi-week event streams,
+which can be streamed into an EventQueue or written to NDJSON scenario
+files. Run python -m scenarios to generate a file from the command line,
+and python -m scenarios.runner to run scenario files headless
+across a pool of worker processes.
+"""
+
+from scenarios.engine import create_engine
+from scenarios.generator import ScenarioConfig, ScenarioGenerator
+from scenarios.ndjson import read_ndjson, stream_into_queue, write_ndjson
+
+__all__ = [
+    "ScenarioConfig",
+    "ScenarioGenerator",
+    "create_engine",
+    "read_ndjson",
+    "stream_into_queue",
+    "write_ndjson",
+]
@@ -0,0 +1,60 @@
+"""Generate a scenario file.
+
+Run from the repository root:
+
+    python -m scenarios --days 28 --seed 7 --output scenario.ndjson
+
+Every ScenarioConfig field has a matching option (--email-rate,
+--location-interval, and so on). With --output - the events are written to
+standard output. For example, a four-week soak test with a GPS fix every
+second (about 2.4 million events):
+
+    python -m scenarios --days 28 --location-interval 1 --output soak.ndjson
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import fields
+from datetime import datetime
+
+from scenarios.generator import ScenarioConfig, ScenarioGenerator
+from scenarios.ndjson import write_ndjson
+
+
+def main() -> None:
+    """Generate a scenario and write it as NDJSON."""
+    parser = argparse.ArgumentParser(
+        prog="python -m scenarios", description="Generate a synthetic UES scenario."
+    )
+    parser.add_argument(
+        "--output", required=True, help="File to write, or - for standard output"
+    )
+    defaults = ScenarioConfig()
+    for field in fields(ScenarioConfig):
+        default = getattr(defaults, field.name)
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}",
+            type=datetime.fromisoformat if field.name == "start" else type(default),
+            default=default,
+            help=f"default: {default.isoformat() if field.name == 'start' else default}",
+        )
+    args = parser.parse_args()
+
+    config = ScenarioConfig(**{f.name: getattr(args, f.name) for f in fields(ScenarioConfig)})
+    events = ScenarioGenerator(config).events()
+
+    started = time.perf_counter()
+    if args.output == "-":
+        count = write_ndjson(events, sys.stdout, config)
+    else:
+        with open(args.output, "w") as file:
+            count = write_ndjson(events, file, config)
+    print(
+        f"wrote {count:,} events in {time.perf_counter() - started:.1f}s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
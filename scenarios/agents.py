@@ -0,0 +1,46 @@
+"""Example agent callbacks for the headless scenario runner.
+
+An agent is called after every step with the engine and the step's result
+(the dictionary returned by SimulationEngine.advance_time()). It acts by
+executing immediate events on the engine, the same way modality action
+endpoints do. Pass one to the runner as, for example,
+--agent scenarios.agents:inbox_triage.
+"""
+
+from models.event import SimulatorEvent
+from models.modalities.email_input import EmailInput
+from models.simulation import SimulationEngine
+
+
+def idle(engine: SimulationEngine, step: dict) -> None:
+    """Do nothing; measures the runner's own per-step overhead.
+
+    Args:
+        engine: The scenario's engine.
+        step: Result of the step just taken.
+    """
+
+
+def inbox_triage(engine: SimulationEngine, step: dict) -> None:
+    """Mark every unread email read whenever new events arrived.
+
+    Args:
+        engine: The scenario's engine.
+        step: Result of the step just taken.
+    """
+    if not step["events_executed"]:
+        return
+    emails, _, _ = engine.environment.get_state("email").select_emails({"is_read": False})
+    if not emails:
+        return
+    now = engine.environment.time_state.current_time
+    data = EmailInput(
+        timestamp=now,
+        operation="mark_read",
+        message_ids=[email.message_id for email in emails],
+    )
+    engine.execute_immediate_event(
+        SimulatorEvent(
+            scheduled_time=now, modality="email", data=data, priority=100, created_at=now
+        )
+    )
@@ -0,0 +1,54 @@
+"""Building simulation engines for generated scenarios."""
+
+from models.environment import Environment
+from models.modalities.calendar_state import CalendarState
+from models.modalities.chat_state import ChatState
+from models.modalities.discord_state import DiscordState
+from models.modalities.email_state import EmailState
+from models.modalities.filesystem_state import FileSystemState
+from models.modalities.location_state import LocationState
+from models.modalities.screen_state import ScreenState
+from models.modalities.slack_state import SlackState
+from models.modalities.sms_state import SMSState
+from models.modalities.social_state import SocialMediaState
+from models.modalities.time_state import TimeState
+from models.modalities.weather_state import WeatherState
+from models.queue import EventQueue
+from models.simulation import SimulationEngine
+from models.time import SimulatorTime
+from scenarios.generator import USER_PHONE, ScenarioConfig
+
+
+def create_engine(config: ScenarioConfig) -> SimulationEngine:
+    """Create an empty engine for a scenario.
+
+    The engine has the same modalities as the server's, an SMS state for the
+    scenario user's phone number, and simulator time set to the scenario
+    start. Its queue is empty; add the scenario's events with
+    stream_into_queue().
+
+    Args:
+        config: The scenario to build an engine for.
+
+    Returns:
+        A stopped engine.
+    """
+    start = config.start
+    environment = Environment(
+        modality_states={
+            "weather": WeatherState(last_updated=start),
+            "email": EmailState(last_updated=start),
+            "sms": SMSState(last_updated=start, user_phone_number=USER_PHONE),
+            "chat": ChatState(last_updated=start),
+            "calendar": CalendarState(last_updated=start),
+            "location": LocationState(last_updated=start),
+            "time": TimeState(last_updated=start),
+            "filesystem": FileSystemState(last_updated=start),
+            "slack": SlackState(last_updated=start),
+            "discord": DiscordState(last_updated=start),
+            "social": SocialMediaState(last_updated=start),
+            "screen": ScreenState(last_updated=start),
+        },
+        time_state=SimulatorTime(current_time=start, last_wall_time_update=start),
+    )
+    return SimulationEngine(environment=environment, event_queue=EventQueue())
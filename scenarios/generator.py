@@ -0,0 +1,619 @@
+"""Seeded generator for large synthetic scenarios.
+
+ScenarioGenerator produces a realistic multi-week stream of SimulatorEvents
+for load and soak testing:
+- email: Poisson arrivals during waking hours, busier on weekday working
+  hours. Some get a reply from the user, and some replies get a response,
+  so threads grow into reply chains.
+- sms: Poisson arrivals from a pool of contacts, with user replies in the
+  same conversation.
+- calendar: a handful of recurring series created at the start, plus one-off
+  meetings booked a few days ahead, some of which are later rescheduled.
+- location: a GPS fix at a fixed interval, following a home/commute/office
+  routine on weekdays and staying near home at weekends.
+- weather: periodic reports for the user's home, with a daily temperature
+  cycle and day-to-day drift.
+
+Each modality is generated by its own lazy stream with its own random
+generator seeded from the scenario seed and the modality name, and the
+streams are merged by scheduled time. The same configuration therefore
+always yields exactly the same events, and memory use does not depend on
+how long the scenario is: only pending replies and the next event of each
+stream are held at once.
+
+Example:
+    >>> generator = ScenarioGenerator(ScenarioConfig(seed=7, days=28))
+    >>> for event in generator.events():
+    ...     engine.add_event(event)
+"""
+
+import heapq
+import math
+import random
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from models.event import SimulatorEvent
+from models.modalities.calendar_input import CalendarInput, RecurrenceRule
+from models.modalities.email_input import EmailInput
+from models.modalities.location_input import LocationInput
+from models.modalities.sms_input import SMSInput
+from models.modalities.weather_input import (
+    CurrentWeather,
+    WeatherCondition,
+    WeatherInput,
+    WeatherReport,
+)
+
+USER_EMAIL = "user@example.com"
+USER_PHONE = "+15550000000"
+
+HOME = (37.7749, -122.4194)
+OFFICE = (37.7897, -122.3972)
+
+_TOPICS = (
+    "Quarterly report",
+    "Project kickoff",
+    "Invoice",
+    "Team offsite",
+    "Code review",
+    "Budget approval",
+    "Customer feedback",
+    "Hiring update",
+    "Travel plans",
+    "Weekly newsletter",
+)
+_SENTENCES = (
+    "Let me know what you think.",
+    "I have attached the latest numbers.",
+    "Can we move this to later in the week?",
+    "Thanks for the quick turnaround.",
+    "The deadline is end of day Friday.",
+    "Looping in the rest of the team.",
+    "Happy to discuss on a call.",
+    "See the notes from last time below.",
+)
+_TEXTS = (
+    "Running 10 min late",
+    "Are we still on for tonight?",
+    "Can you pick up milk?",
+    "Call me when you get a chance",
+    "Sounds good!",
+    "On my way",
+    "Did you see the game?",
+    "Happy birthday!",
+)
+_REPLIES = ("Ok", "Sure, see you then", "Thanks!", "Will do", "Haha yes", "No worries")
+_DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday")
+_CONDITIONS = (
+    (800, "Clear", "clear sky", "01d"),
+    (802, "Clouds", "scattered clouds", "03d"),
+    (500, "Rain", "light rain", "10d"),
+)
+
+
+@dataclass(frozen=True)
+class ScenarioConfig:
+    """Parameters of a generated scenario.
+
+    Arrival rates are per hour at peak activity (weekday working hours);
+    they are scaled down in the evening and at weekends, and no messages
+    arrive between 23:00 and 07:00.
+
+    Attributes:
+        seed: Seed for all random choices.
+        start: Simulator time the scenario starts at.
+        days: Length of the scenario in days.
+        contacts: Number of distinct email and SMS correspondents.
+        email_rate: Incoming emails per hour.
+        email_reply_probability: Chance the user replies to an email, and
+            that a reply gets a response in turn.
+        sms_rate: Incoming text messages per hour.
+        sms_reply_probability: Chance the user replies to a text.
+        meetings_per_day: One-off meetings booked per weekday, roughly.
+        recurring_meetings: Recurring series created at the start.
+        reschedule_probability: Chance a one-off meeting is later moved.
+        location_interval: Seconds between GPS fixes. 0 disables location.
+        weather_interval: Seconds between weather reports. 0 disables weather.
+    """
+
+    seed: int = 0
+    start: datetime = datetime(2025, 1, 6, tzinfo=timezone.utc)
+    days: int = 28
+    contacts: int = 100
+    email_rate: float = 6.0
+    email_reply_probability: float = 0.3
+    sms_rate: float = 4.0
+    sms_reply_probability: float = 0.5
+    meetings_per_day: float = 2.0
+    recurring_meetings: int = 4
+    reschedule_probability: float = 0.1
+    location_interval: float = 60.0
+    weather_interval: float = 3600.0
+
+    def __post_init__(self) -> None:
+        if self.start.tzinfo is None:
+            raise ValueError("start must be timezone-aware")
+        if self.days <= 0:
+            raise ValueError("days must be positive")
+        if self.contacts <= 0:
+            raise ValueError("contacts must be positive")
+        for name in (
+            "email_rate",
+            "sms_rate",
+            "meetings_per_day",
+            "recurring_meetings",
+            "location_interval",
+            "weather_interval",
+        ):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must not be negative")
+        for name in (
+            "email_reply_probability",
+            "sms_reply_probability",
+            "reschedule_probability",
+        ):
+            if not 0 <= getattr(self, name) <= 1:
+                raise ValueError(f"{name} must be between 0 and 1")
+
+    @property
+    def end(self) -> datetime:
+        """Simulator time the scenario ends at."""
+        return self.start + timedelta(days=self.days)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-compatible dictionary."""
+        data = asdict(self)
+        data["start"] = self.start.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScenarioConfig":
+        """Create a config from a dictionary produced by to_dict().
+
+        Unknown keys are ignored, so files written by newer versions still
+        load.
+        """
+        known = {f.name for f in fields(cls)}
+        values = {key: value for key, value in data.items() if key in known}
+        if isinstance(values.get("start"), str):
+            values["start"] = datetime.fromisoformat(values["start"])
+        return cls(**values)
+
+
+def activity(when: datetime) -> float:
+    """Relative messaging activity at a point in time, from 0 to 1.
+
+    Args:
+        when: Simulator time.
+
+    Returns:
+        1 during weekday working hours, lower in the evening and at
+        weekends, and 0 overnight.
+    """
+    hour = when.hour
+    if hour < 7 or hour >= 23:
+        return 0.0
+    if when.weekday() >= 5:
+        return 0.3
+    if 9 <= hour < 18:
+        return 1.0
+    return 0.4
+
+
+class ScenarioGenerator:
+    """Generates the events of a synthetic scenario.
+
+    Args:
+        config: Scenario parameters.
+    """
+
+    def __init__(self, config: ScenarioConfig | None = None) -> None:
+        self.config = config or ScenarioConfig()
+
+    def events(self) -> Iterator[SimulatorEvent]:
+        """Generate all events in scheduled order.
+
+        Returns:
+            Lazy iterator of pending events. Events with equal times are
+            ordered by modality, so the order is fully deterministic.
+        """
+        streams = [
+            self._calendar_events(),
+            self._email_events(),
+            self._sms_events(),
+            self._location_events(),
+            self._weather_events(),
+        ]
+        return heapq.merge(*streams, key=lambda event: event.scheduled_time)
+
+    # Helpers
+
+    def _rng(self, stream: str) -> random.Random:
+        """Create the random generator for one stream."""
+        return random.Random(f"{self.config.seed}:{stream}")
+
+    def _event(self, modality: str, index: int, data: Any) -> SimulatorEvent:
+        """Wrap an input in a pending event with a deterministic ID."""
+        return SimulatorEvent(
+            event_id=_event_id(modality, index),
+            scheduled_time=data.timestamp,
+            modality=modality,
+            data=data,
+            created_at=self.config.start,
+        )
+
+    def _arrivals(self, rng: random.Random, rate: float) -> Iterator[datetime]:
+        """Poisson arrival times modulated by activity().
+
+        Generates candidates at the peak rate and keeps each with
+        probability activity(t) (thinning).
+        """
+        if rate <= 0:
+            return
+        start = self.config.start
+        horizon = self.config.days * 86400.0
+        offset = 0.0
+        while True:
+            offset += rng.expovariate(rate / 3600.0)
+            if offset >= horizon:
+                return
+            when = start + timedelta(seconds=offset)
+            if rng.random() < activity(when):
+                yield when
+
+    def _with_followups(
+        self,
+        arrivals: Iterator[datetime],
+        on_arrival: Callable[[datetime], list[tuple[datetime, Any]]],
+    ) -> Iterator[Any]:
+        """Interleave arrivals with the follow-ups they schedule.
+
+        Args:
+            arrivals: Times of new conversations.
+            on_arrival: Called with a time (of an arrival or a follow-up)
+                and its payload; returns the item to emit followed by any
+                (time, payload) follow-ups to schedule.
+
+        Yields:
+            Items in time order. Follow-ups past the end of the scenario are
+            dropped.
+        """
+        end = self.config.end
+        pending: list[tuple[datetime, int, Any]] = []
+        counter = 0
+
+        def emit(when: datetime, payload: Any) -> Iterator[Any]:
+            nonlocal counter
+            item, *followups = on_arrival(when, payload)
+            yield item
+            for followup_time, followup in followups:
+                if followup_time < end:
+                    counter += 1
+                    heapq.heappush(pending, (followup_time, counter, followup))
+
+        for when in arrivals:
+            while pending and pending[0][0] <= when:
+                followup_time, _, followup = heapq.heappop(pending)
+                yield from emit(followup_time, followup)
+            yield from emit(when, None)
+        while pending:
+            followup_time, _, followup = heapq.heappop(pending)
+            yield from emit(followup_time, followup)
+
+    # Streams
+
+    def _email_events(self) -> Iterator[SimulatorEvent]:
+        """Incoming emails, user replies, and responses to those replies."""
+        config = self.config
+        rng = self._rng("email")
+        index = 0
+
+        def body() -> str:
+            return " ".join(rng.choices(_SENTENCES, k=rng.randint(2, 6)))
+
+        def handle(when: datetime, previous: dict | None) -> list:
+            nonlocal index
+            index += 1
+            message_id = f"email-{index}"
+            if previous is None:
+                # A new thread from a random contact
+                thread = {
+                    "thread_id": f"thread-{index}",
+                    "contact": f"contact{rng.randrange(config.contacts)}@example.com",
+                    "subject": f"{rng.choice(_TOPICS)} #{index}",
+                }
+                data = EmailInput(
+                    input_id=_event_id("email", index),
+                    timestamp=when,
+                    operation="receive",
+                    message_id=message_id,
+                    thread_id=thread["thread_id"],
+                    from_address=thread["contact"],
+                    to_addresses=[USER_EMAIL],
+                    subject=thread["subject"],
+                    body_text=body(),
+                )
+                incoming = True
+            elif previous["incoming"]:
+                # The user replies to the contact's last message
+                thread = previous["thread"]
+                data = EmailInput(
+                    input_id=_event_id("email", index),
+                    timestamp=when,
+                    operation="reply",
+                    message_id=message_id,
+                    in_reply_to=previous["message_id"],
+                    from_address=USER_EMAIL,
+                    to_addresses=[thread["contact"]],
+                    subject=f"Re: {thread['subject']}",
+                    body_text=body(),
+                )
+                incoming = False
+            else:
+                # The contact responds to the user's reply
+                thread = previous["thread"]
+                data = EmailInput(
+                    input_id=_event_id("email", index),
+                    timestamp=when,
+                    operation="receive",
+                    message_id=message_id,
+                    thread_id=thread["thread_id"],
+                    in_reply_to=previous["message_id"],
+                    from_address=thread["contact"],
+                    to_addresses=[USER_EMAIL],
+                    subject=f"Re: {thread['subject']}",
+                    body_text=body(),
+                )
+                incoming = True
+
+            result: list = [self._event("email", index, data)]
+            if rng.random() < config.email_reply_probability:
+                # Users reply within the hour; contacts take a few hours
+                mean_delay = 1800.0 if incoming else 3 * 3600.0
+                delay = timedelta(seconds=60 + rng.expovariate(1 / mean_delay))
+                followup = {"thread": thread, "message_id": message_id, "incoming": incoming}
+                result.append((when + delay, followup))
+            return result
+
+        yield from self._with_followups(self._arrivals(rng, config.email_rate), handle)
+
+    def _sms_events(self) -> Iterator[SimulatorEvent]:
+        """Incoming texts and user replies in the same conversation."""
+        config = self.config
+        rng = self._rng("sms")
+        index = 0
+
+        def handle(when: datetime, contact: str | None) -> list:
+            nonlocal index
+            index += 1
+            if contact is None:
+                number = f"+1555{rng.randrange(config.contacts):07d}"
+                message_data = {
+                    "from_number": number,
+                    "to_numbers": [USER_PHONE],
+                    "body": rng.choice(_TEXTS),
+                }
+                action = "receive_message"
+            else:
+                number = contact
+                message_data = {
+                    "from_number": USER_PHONE,
+                    "to_numbers": [number],
+                    "body": rng.choice(_REPLIES),
+                }
+                action = "send_message"
+            data = SMSInput(
+                input_id=_event_id("sms", index),
+                timestamp=when,
+                action=action,
+                message_data=message_data,
+            )
+
+            result: list = [self._event("sms", index, data)]
+            if contact is None and rng.random() < config.sms_reply_probability:
+                delay = timedelta(seconds=10 + rng.expovariate(1 / 300.0))
+                result.append((when + delay, number))
+            return result
+
+        yield from self._with_followups(self._arrivals(rng, config.sms_rate), handle)
+
+    def _calendar_events(self) -> Iterator[SimulatorEvent]:
+        """Recurring series at the start, then one-off meetings and moves."""
+        config = self.config
+        rng = self._rng("calendar")
+        index = 0
+
+        for series in range(config.recurring_meetings):
+            index += 1
+            first_day = config.start.replace(hour=0, minute=0, second=0, microsecond=0)
+            start = first_day + timedelta(hours=9 + series % 8, minutes=30 * (series % 2))
+            weekly = series % 2 == 1
+            yield self._event(
+                "calendar",
+                index,
+                CalendarInput(
+                    input_id=_event_id("calendar", index),
+                    timestamp=config.start,
+                    operation="create",
+                    event_id=f"series-{series}",
+                    title=f"{'Weekly sync' if weekly else 'Daily standup'} {series}",
+                    start=start,
+                    end=start + timedelta(minutes=30 if weekly else 15),
+                    organizer=f"contact{series % config.contacts}@example.com",
+                    recurrence=RecurrenceRule(
+                        frequency="weekly",
+                        days_of_week=[_DAYS[series % 5]] if weekly else list(_DAYS),
+                    ),
+                ),
+            )
+
+        def handle(when: datetime, meeting: dict | None) -> list:
+            nonlocal index
+            index += 1
+            if meeting is None:
+                # Book a meeting one to five days out, during working hours
+                day = when.replace(hour=0, minute=0, second=0, microsecond=0)
+                start = day + timedelta(
+                    days=rng.randint(1, 5), hours=rng.randint(9, 16), minutes=rng.choice((0, 30))
+                )
+                meeting = {
+                    "event_id": f"meeting-{index}",
+                    "start": start,
+                    "duration": timedelta(minutes=rng.choice((30, 45, 60))),
+                }
+                data = CalendarInput(
+                    input_id=_event_id("calendar", index),
+                    timestamp=when,
+                    operation="create",
+                    event_id=meeting["event_id"],
+                    title=f"{rng.choice(_TOPICS)} meeting",
+                    start=start,
+                    end=start + meeting["duration"],
+                    location=f"Room {rng.randint(1, 12)}",
+                    organizer=f"contact{rng.randrange(config.contacts)}@example.com",
+                )
+                result: list = [self._event("calendar", index, data)]
+                if rng.random() < config.reschedule_probability:
+                    lead = (start - when).total_seconds()
+                    result.append((when + timedelta(seconds=rng.uniform(0, lead)), meeting))
+                return result
+
+            # Push a booked meeting back by an hour
+            start = meeting["start"] + timedelta(hours=1)
+            data = CalendarInput(
+                input_id=_event_id("calendar", index),
+                timestamp=when,
+                operation="update",
+                event_id=meeting["event_id"],
+                start=start,
+                end=start + meeting["duration"],
+            )
+            return [self._event("calendar", index, data)]
+
+        arrivals = self._arrivals(rng, config.meetings_per_day / 9)
+        yield from self._with_followups(arrivals, handle)
+
+    def _location_events(self) -> Iterator[SimulatorEvent]:
+        """GPS fixes following a home/commute/office routine."""
+        config = self.config
+        if config.location_interval <= 0:
+            return
+        rng = self._rng("location")
+        step = timedelta(seconds=config.location_interval)
+        end = config.end
+        when = config.start
+        index = 0
+        while when < end:
+            index += 1
+            (lat, lon), named, speed = _position(when)
+            yield self._event(
+                "location",
+                index,
+                LocationInput(
+                    input_id=_event_id("location", index),
+                    timestamp=when,
+                    latitude=lat + rng.gauss(0, 5e-5),
+                    longitude=lon + rng.gauss(0, 5e-5),
+                    named_location=named,
+                    accuracy=round(rng.uniform(3, 20), 1),
+                    speed=speed,
+                ),
+            )
+            when += step
+
+    def _weather_events(self) -> Iterator[SimulatorEvent]:
+        """Hourly-style reports for home with daily cycles and drift."""
+        config = self.config
+        if config.weather_interval <= 0:
+            return
+        rng = self._rng("weather")
+        step = timedelta(seconds=config.weather_interval)
+        end = config.end
+        when = config.start
+        index = 0
+        daily_offset = 0.0
+        day = None
+        while when < end:
+            index += 1
+            if when.date() != day:
+                day = when.date()
+                daily_offset = max(-8.0, min(8.0, daily_offset + rng.gauss(0, 1.5)))
+            # Coldest at 05:00 UTC, warmest twelve hours later
+            cycle = -math.cos((when.hour + when.minute / 60 - 5) / 24 * 2 * math.pi)
+            temp = 285.0 + daily_offset + 5.0 * cycle
+            dt = int(when.timestamp())
+            condition = _CONDITIONS[rng.choices((0, 1, 2), weights=(6, 3, 1))[0]]
+            report = WeatherReport(
+                lat=HOME[0],
+                lon=HOME[1],
+                timezone="America/Los_Angeles",
+                timezone_offset=-28800,
+                current=CurrentWeather(
+                    dt=dt,
+                    sunrise=dt - 3600,
+                    sunset=dt + 36000,
+                    temp=round(temp, 2),
+                    feels_like=round(temp - rng.uniform(0, 2), 2),
+                    pressure=rng.randint(1005, 1025),
+                    humidity=rng.randint(40, 90),
+                    dew_point=round(temp - 8, 2),
+                    uvi=round(max(0.0, 6 * cycle), 1),
+                    clouds=rng.randint(0, 100),
+                    visibility=10000,
+                    wind_speed=round(rng.uniform(0, 10), 1),
+                    wind_deg=rng.randrange(360),
+                    weather=[
+                        WeatherCondition(
+                            id=condition[0],
+                            main=condition[1],
+                            description=condition[2],
+                            icon=condition[3],
+                        )
+                    ],
+                ),
+            )
+            yield self._event(
+                "weather",
+                index,
+                WeatherInput(
+                    input_id=_event_id("weather", index),
+                    timestamp=when,
+                    latitude=HOME[0],
+                    longitude=HOME[1],
+                    report=report,
+                ),
+            )
+            when += step
+
+
+def _event_id(modality: str, index: int) -> str:
+    """Deterministic ID shared by the index-th event of a stream and its input.
+
+    Inputs get the same ID as their event instead of a random default, so
+    identical configs give identical files.
+    """
+    return f"{modality}-{index:09d}"
+
+
+def _position(when: datetime) -> tuple[tuple[float, float], str | None, float]:
+    """Where the user is at a point in time.
+
+    Returns:
+        Tuple of ((latitude, longitude), named location or None while
+        travelling, speed in meters per second).
+    """
+    minutes = when.hour * 60 + when.minute + when.second / 60
+    if when.weekday() >= 5 or minutes < 8 * 60 + 30 or minutes >= 18 * 60:
+        return HOME, "Home", 0.0
+    if minutes < 9 * 60:
+        progress = (minutes - (8 * 60 + 30)) / 30
+    elif minutes < 17 * 60 + 30:
+        return OFFICE, "Office", 0.0
+    else:
+        progress = 1 - (minutes - (17 * 60 + 30)) / 30
+    lat = HOME[0] + (OFFICE[0] - HOME[0]) * progress
+    lon = HOME[1] + (OFFICE[1] - HOME[1]) * progress
+    return (lat, lon), None, 1.5
@@ -0,0 +1,220 @@
+"""Streaming scenario events to and from NDJSON files and into queues.
+
+A scenario file is newline-delimited JSON. The first line may be a header,
+{"scenario": {...}, "validated": true}, holding the ScenarioConfig the
+events were generated from (if known) and marking the file as written by
+write_ndjson(); every other line is one event:
+
+    {"event_id": "email-000000001", "scheduled_time": "2025-01-06T09:12:03+00:00",
+     "modality": "email", "priority": 0, "data": {...}}
+
+where data is the modality input as JSON. Files are written and read one
+line at a time, so neither side holds the whole scenario in memory.
+
+Inputs are checked with validate_input() before they are written, so a
+file written by write_ndjson() can be read back with trusted=True: its
+inputs are still parsed by Pydantic, but marked as validated instead of
+being checked again when they are queued and executed. Trust depends on the
+header: files without one, such as bare event files from other tools, are
+always validated.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import Any, NotRequired, TextIO, TypedDict
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from models.event import SimulatorEvent
+from models.inputs import AnyModalityInput
+from models.queue import EventQueue
+from scenarios.generator import ScenarioConfig
+
+# Events added to a queue per add_events() call
+DEFAULT_BATCH_SIZE = 100_000
+
+
+class _EventLine(TypedDict):
+    """The fields of one event line, as written by dump_event()."""
+
+    event_id: str
+    scheduled_time: datetime
+    modality: str
+    priority: NotRequired[int]
+    data: AnyModalityInput
+
+
+# Parses a whole event line, typed input included, in one pass over the JSON
+_EVENT_LINE_ADAPTER = TypeAdapter(_EventLine)
+
+# Priority for lines without one, the same as for events built directly
+_DEFAULT_PRIORITY = SimulatorEvent.model_fields["priority"].default
+
+
+def dump_event(event: SimulatorEvent) -> str:
+    """Encode an event as one NDJSON line, without the trailing newline.
+
+    Args:
+        event: The event to encode. A dict payload is parsed first.
+
+    Returns:
+        JSON text.
+
+    Raises:
+        ValueError: If the event's input fails validation.
+    """
+    input_data = event.get_input()
+    input_data.ensure_valid()
+    return to_json(
+        {
+            "event_id": event.event_id,
+            "scheduled_time": event.scheduled_time,
+            "modality": event.modality,
+            "priority": event.priority,
+            "data": input_data.model_dump(mode="json"),
+        }
+    ).decode()
+
+
+def load_event(
+    line: str, created_at: datetime | None = None, trusted: bool = False
+) -> SimulatorEvent:
+    """Decode an event written by dump_event().
+
+    Args:
+        line: One NDJSON line.
+        created_at: Creation time for the event; defaults to its
+            scheduled time.
+        trusted: Whether the line was written by dump_event(), whose
+            input was validated before it was written. The input's fields
+            are still parsed, but it is marked as validated.
+
+    Returns:
+        A pending event with a typed modality input.
+
+    Raises:
+        ValueError: If the modality is unknown or the data is invalid.
+    """
+    record = _EVENT_LINE_ADAPTER.validate_json(line)
+    data = record["data"]
+    if trusted:
+        data.mark_validated()
+    return SimulatorEvent(
+        event_id=record["event_id"],
+        scheduled_time=record["scheduled_time"],
+        modality=record["modality"],
+        priority=record.get("priority", _DEFAULT_PRIORITY),
+        data=data,
+        created_at=created_at or record["scheduled_time"],
+    )
+
+
+def write_ndjson(
+    events: Iterable[SimulatorEvent],
+    file: TextIO,
+    config: ScenarioConfig | None = None,
+) -> int:
+    """Write events to a scenario file.
+
+    The header line marks the file's inputs as validated, and holds the
+    config if one is given.
+
+    Args:
+        events: Events to write, typically ScenarioGenerator.events().
+        file: Text file to write to.
+        config: If given, written in the header line.
+
+    Returns:
+        Number of events written.
+
+    Raises:
+        ValueError: If an event's input fails validation.
+    """
+    header: dict[str, Any] = {} if config is None else {"scenario": config.to_dict()}
+    header["validated"] = True
+    file.write(json.dumps(header) + "\n")
+    count = 0
+    for event in events:
+        file.write(dump_event(event))
+        file.write("\n")
+        count += 1
+    return count
+
+
+def read_ndjson(
+    file: TextIO, trusted: bool = False
+) -> tuple[ScenarioConfig | None, Iterator[SimulatorEvent]]:
+    """Read a scenario file.
+
+    The header is read immediately; events are decoded lazily as the
+    returned iterator is consumed, so the file must stay open until then.
+
+    Args:
+        file: Text file to read from.
+        trusted: Whether to trust inputs the header marks as validated by
+            write_ndjson(); see load_event(). Files without such a header
+            are validated regardless.
+
+    Returns:
+        Tuple of (config from the header, or None if there is no header or
+        it holds none, iterator of events).
+    """
+    first = file.readline()
+    config = None
+    header: dict[str, Any] = json.loads(first) if first.strip() else {}
+    if "scenario" in header or "validated" in header:
+        if header.get("scenario") is not None:
+            config = ScenarioConfig.from_dict(header["scenario"])
+        trusted = trusted and header.get("validated") is True
+        first = ""
+    else:
+        trusted = False
+    created_at = config.start if config is not None else None
+
+    def events() -> Iterator[SimulatorEvent]:
+        if first.strip():
+            yield load_event(first, created_at, trusted)
+        for line in file:
+            if line.strip():
+                yield load_event(line, created_at, trusted)
+
+    return config, events()
+
+
+def stream_into_queue(
+    events: Iterable[SimulatorEvent],
+    queue: EventQueue,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Add events to a queue in batches as they are produced.
+
+    Only one batch of events is buffered outside the queue at a time.
+
+    Args:
+        events: Events to add.
+        queue: The queue to add them to.
+        batch_size: Events per add_events() call.
+
+    Returns:
+        Number of events added.
+
+    Raises:
+        ValueError: If batch_size is not positive, or an event ID is already
+            in the queue.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    count = 0
+    batch: list[SimulatorEvent] = []
+    for event in events:
+        batch.append(event)
+        if len(batch) >= batch_size:
+            queue.add_events(batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        queue.add_events(batch)
+        count += len(batch)
+    return count
@@ -0,0 +1,299 @@
+"""Local stand-in for the OpenWeather One Call API.
+
+Serves GET /data/3.0/onecall in the One Call 3.0 format, so the real-weather
+path (POST /weather/query with real=true) can be tested and benchmarked
+offline and without an API key. Start it and point UES at it:
+
+    python -m scenarios.openweather --port 8081 [--recordings DIR]
+        [--latency 0.05] [--api-key KEY]
+    OPENWEATHER_BASE_URL=http://127.0.0.1:8081/data/3.0/onecall \\
+        OPENWEATHER_API_KEY=any uvicorn main:app
+
+A location is answered from a recording when one matches it: a One Call
+response saved from the real API as a JSON file in the recordings
+directory, matched on its coordinates rounded to 0.01 degrees. Other
+locations get a generated report with current conditions and minutely,
+hourly and daily forecasts, following a daily temperature cycle. Generated
+reports are deterministic for a location and hour.
+
+Like the real API, exclude and units are honoured and a missing appid gets
+401. Any appid is accepted unless --api-key is given.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
+
+from fastapi import FastAPI, Query
+from fastapi.responses import JSONResponse
+
+from models.modalities.weather_columns import ReportColumns
+from models.modalities.weather_input import (
+    CurrentWeather,
+    DailyFeelsLike,
+    DailyForecast,
+    DailyTemperature,
+    HourlyForecast,
+    MinutelyForecast,
+    WeatherCondition,
+    WeatherReport,
+)
+
+ONECALL_PATH = "/data/3.0/onecall"
+
+# (id, main, description, icon) of the conditions generated reports use
+_CONDITIONS = (
+    (800, "Clear", "clear sky", "01d"),
+    (803, "Clouds", "broken clouds", "04d"),
+    (500, "Rain", "light rain", "10d"),
+)
+
+Recordings = dict[tuple[float, float], dict[str, Any]]
+
+
+def _location_key(lat: float, lon: float) -> tuple[float, float]:
+    """Round coordinates to 0.01 degrees, like WeatherState's location keys."""
+    return (round(lat, 2), round(lon, 2))
+
+
+def _error(status_code: int, message: str) -> JSONResponse:
+    """Build an error response in OpenWeather's format."""
+    return JSONResponse({"cod": status_code, "message": message}, status_code=status_code)
+
+
+def generate_report(lat: float, lon: float, now: int) -> WeatherReport:
+    """Generate a full One Call report in standard units.
+
+    Temperatures fall with latitude and follow a daily cycle in local solar
+    time (coldest around 05:00, warmest twelve hours later). The random
+    parts are seeded from the rounded coordinates and the hour, so the same
+    location gets the same report throughout an hour.
+
+    Args:
+        lat: Location latitude.
+        lon: Location longitude.
+        now: Current time, Unix timestamp.
+
+    Returns:
+        A report with current, minutely, hourly and daily sections.
+    """
+    key_lat, key_lon = _location_key(lat, lon)
+    hour_start = now - now % 3600
+    rng = random.Random(f"{key_lat},{key_lon},{hour_start}")
+    offset = round(lon / 15) * 3600
+    base = 300.0 - 0.4 * abs(lat) + rng.gauss(0, 2)
+
+    def temperature(dt: int) -> float:
+        local_hours = (dt + offset) % 86400 / 3600
+        return round(base - 5.0 * math.cos((local_hours - 5) / 24 * 2 * math.pi), 2)
+
+    def conditions() -> list[WeatherCondition]:
+        condition = _CONDITIONS[rng.choices((0, 1, 2), weights=(6, 3, 1))[0]]
+        return [
+            WeatherCondition(
+                id=condition[0], main=condition[1], description=condition[2], icon=condition[3]
+            )
+        ]
+
+    sunrise = now - (now + offset) % 86400 + 6 * 3600
+    temp = temperature(now)
+    return WeatherReport(
+        lat=lat,
+        lon=lon,
+        timezone=f"Etc/GMT{-offset // 3600:+d}" if offset else "Etc/GMT",
+        timezone_offset=offset,
+        current=CurrentWeather(
+            dt=now,
+            sunrise=sunrise,
+            sunset=sunrise + 12 * 3600,
+            temp=temp,
+            feels_like=round(temp - rng.uniform(0, 2), 2),
+            pressure=rng.randint(1005, 1025),
+            humidity=rng.randint(40, 90),
+            dew_point=round(temp - 8, 2),
+            uvi=round(rng.uniform(0, 8), 1),
+            clouds=rng.randint(0, 100),
+            visibility=10000,
+            wind_speed=round(rng.uniform(0, 10), 1),
+            wind_deg=rng.randrange(360),
+            wind_gust=round(rng.uniform(5, 15), 1),
+            weather=conditions(),
+        ),
+        minutely=[
+            MinutelyForecast(
+                dt=hour_start + 60 * minute, precipitation=round(rng.uniform(0, 0.5), 2)
+            )
+            for minute in range(60)
+        ],
+        hourly=[
+            HourlyForecast(
+                dt=hour_start + 3600 * hour,
+                temp=temperature(hour_start + 3600 * hour),
+                feels_like=round(temperature(hour_start + 3600 * hour) - 1, 2),
+                pressure=rng.randint(1005, 1025),
+                humidity=rng.randint(40, 90),
+                dew_point=round(temperature(hour_start + 3600 * hour) - 8, 2),
+                uvi=round(rng.uniform(0, 8), 1),
+                clouds=rng.randint(0, 100),
+                visibility=10000,
+                wind_speed=round(rng.uniform(0, 10), 1),
+                wind_deg=rng.randrange(360),
+                wind_gust=round(rng.uniform(5, 15), 1),
+                weather=conditions(),
+                pop=round(rng.random(), 2),
+            )
+            for hour in range(48)
+        ],
+        daily=[
+            DailyForecast(
+                dt=sunrise + 86400 * day + 6 * 3600,
+                sunrise=sunrise + 86400 * day,
+                sunset=sunrise + 86400 * day + 12 * 3600,
+                moonrise=sunrise + 86400 * day + 9 * 3600,
+                moonset=sunrise + 86400 * day + 20 * 3600,
+                moon_phase=round((now / 86400 / 29.53 + day / 29.53) % 1, 2),
+                temp=DailyTemperature(
+                    day=round(base + 3, 2),
+                    min=round(base - 5, 2),
+                    max=round(base + 5, 2),
+                    night=round(base - 3, 2),
+                    eve=round(base + 1, 2),
+                    morn=round(base - 4, 2),
+                ),
+                feels_like=DailyFeelsLike(
+                    day=round(base + 2, 2),
+                    night=round(base - 4, 2),
+                    eve=round(base, 2),
+                    morn=round(base - 5, 2),
+                ),
+                pressure=rng.randint(1005, 1025),
+                humidity=rng.randint(40, 90),
+                dew_point=round(base - 8, 2),
+                wind_speed=round(rng.uniform(0, 10), 1),
+                wind_deg=rng.randrange(360),
+                wind_gust=round(rng.uniform(5, 15), 1),
+                weather=conditions(),
+                clouds=rng.randint(0, 100),
+                pop=round(rng.random(), 2),
+                uvi=round(rng.uniform(0, 8), 1),
+            )
+            for day in range(8)
+        ],
+    )
+
+
+def load_recordings(directory: Path) -> Recordings:
+    """Load recorded One Call responses from a directory of JSON files.
+
+    Args:
+        directory: Directory holding one response per *.json file.
+
+    Returns:
+        The responses, keyed by their rounded coordinates.
+
+    Raises:
+        ValueError: If a file is not a valid One Call response.
+    """
+    recordings = {}
+    for path in sorted(directory.glob("*.json")):
+        data = json.loads(path.read_text())
+        try:
+            WeatherReport.model_validate(data)
+        except ValueError as e:
+            raise ValueError(f"{path} is not a One Call response: {e}")
+        recordings[_location_key(data["lat"], data["lon"])] = data
+    return recordings
+
+
+def create_app(
+    recordings: Optional[Recordings] = None,
+    api_key: Optional[str] = None,
+    latency: float = 0.0,
+    clock: Callable[[], float] = time.time,
+) -> FastAPI:
+    """Create the stand-in application.
+
+    Args:
+        recordings: Recorded responses by rounded coordinates, in standard
+            units.
+        api_key: The only appid accepted; None accepts any.
+        latency: Seconds to wait before answering, to mimic the network.
+        clock: Wall clock used for generated reports.
+
+    Returns:
+        The FastAPI application.
+    """
+    recordings = recordings or {}
+    app = FastAPI(title="OpenWeather One Call stand-in")
+    # Requests served so far; latency can be changed while running
+    app.state.requests = 0
+    app.state.latency = latency
+
+    @app.get(ONECALL_PATH)
+    async def onecall(
+        lat: Optional[float] = None,
+        lon: Optional[float] = None,
+        appid: Optional[str] = None,
+        exclude: Optional[str] = None,
+        units: str = Query(default="standard"),
+    ):
+        app.state.requests += 1
+        if app.state.latency:
+            await asyncio.sleep(app.state.latency)
+        if not appid or (api_key is not None and appid != api_key):
+            return _error(
+                401,
+                "Invalid API key. Please see https://openweathermap.org/faq#error401 "
+                "for more info.",
+            )
+        if lat is None or lon is None:
+            return _error(400, "Nothing to geocode")
+        if not -90 <= lat <= 90 or not -180 <= lon <= 180:
+            return _error(400, "wrong latitude or longitude")
+
+        recording = recordings.get(_location_key(lat, lon))
+        if recording is not None:
+            report = WeatherReport.model_validate(recording)
+        else:
+            report = generate_report(lat, lon, int(clock()))
+        columns = ReportColumns.from_report(report)
+        if exclude:
+            columns = columns.exclude([section.strip() for section in exclude.split(",")])
+        if units in ("metric", "imperial"):
+            columns = columns.convert(units)
+        return columns.to_dict()
+
+    return app
+
+
+def main() -> None:
+    """Run the stand-in server."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(
+        prog="python -m scenarios.openweather", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8081, help="Port to listen on")
+    parser.add_argument(
+        "--recordings", type=Path, help="Directory of recorded One Call responses"
+    )
+    parser.add_argument("--api-key", help="Only accept this appid")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds to wait before answering"
+    )
+    args = parser.parse_args()
+
+    recordings = load_recordings(args.recordings) if args.recordings else None
+    app = create_app(recordings, api_key=args.api_key, latency=args.latency)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
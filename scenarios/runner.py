@@ -0,0 +1,326 @@
+"""Headless parallel scenario runner.
+
+Runs scenario files without a server: every scenario gets its own
+SimulationEngine in a worker process, so a batch of scenarios uses all
+cores instead of queueing behind one server's engine lock. Each engine is
+advanced through its scenario in fixed steps of simulator time, and an
+optional agent callback is called after every step with the engine and the
+step's result. The agent runs in-process, so it reads state and acts through
+the engine directly (for example with execute_immediate_event()).
+
+Agents are given as "module:function" import paths, so worker processes can
+import them:
+
+    def my_agent(engine: SimulationEngine, step: dict) -> None:
+        unread = engine.environment.get_state("email").query({"is_read": False})
+        ...
+
+Run from the repository root:
+
+    python -m scenarios.runner soak-*.ndjson --repeat 4 --workers 8 \\
+        --agent scenarios.agents:inbox_triage --report report.json
+
+The report holds, per run, the final snapshot and execution metrics
+(events executed and failed by modality, wall and CPU time, agent time),
+plus totals for the batch.
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from pathlib import Path
+from typing import Any
+
+from pydantic_core import to_json
+
+from models.event import EventStatus
+from models.simulation import SimulationEngine
+from scenarios.engine import create_engine
+from scenarios.generator import ScenarioConfig
+from scenarios.ndjson import read_ndjson, stream_into_queue
+
+# Simulator time advanced between agent calls
+DEFAULT_STEP = timedelta(hours=1)
+
+Agent = Callable[[SimulationEngine, dict], None]
+
+
+@dataclass
+class RunResult:
+    """Outcome of running one scenario.
+
+    Attributes:
+        scenario: Path of the scenario file.
+        run: Index of this run among repeats of the same scenario.
+        events: Events in the scenario.
+        executed: Events executed successfully, by modality, including
+            the agent's own immediate events.
+        failed: Events that failed, by modality.
+        merged: Events merged into a later event by coalescing, by modality.
+        steps: Number of steps (agent calls) taken.
+        wall_seconds: Wall time to load and run the scenario.
+        cpu_seconds: CPU time of the worker for this run.
+        agent_seconds: Wall time spent in the agent callback.
+        snapshot: Final engine snapshot, or None if not requested.
+    """
+
+    scenario: str
+    run: int
+    events: int
+    executed: dict[str, int] = field(default_factory=dict)
+    failed: dict[str, int] = field(default_factory=dict)
+    merged: dict[str, int] = field(default_factory=dict)
+    steps: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    agent_seconds: float = 0.0
+    snapshot: dict[str, Any] | None = None
+
+    @property
+    def events_per_second(self) -> float:
+        """Scenario events processed per wall-clock second."""
+        return self.events / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-compatible dictionary."""
+        data = asdict(self)
+        data["events_per_second"] = self.events_per_second
+        return data
+
+
+def load_agent(path: str | None) -> Agent | None:
+    """Import an agent callback from a "module:function" path.
+
+    Args:
+        path: Import path, or None for no agent.
+
+    Returns:
+        The callback, or None.
+
+    Raises:
+        ValueError: If the path is malformed or does not name a callable.
+    """
+    if path is None:
+        return None
+    module_name, _, attribute = path.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"Agent must be given as module:function, got {path!r}")
+    agent = getattr(importlib.import_module(module_name), attribute, None)
+    if not callable(agent):
+        raise ValueError(f"Agent {path!r} is not a callable")
+    return agent
+
+
+def run_scenario(
+    scenario: str,
+    run: int = 0,
+    agent_path: str | None = None,
+    step: timedelta = DEFAULT_STEP,
+    include_snapshot: bool = True,
+    coalesce: bool = False,
+) -> RunResult:
+    """Run one scenario file to completion on a fresh engine.
+
+    This is the unit of work sent to worker processes, so it takes only
+    picklable arguments.
+
+    Args:
+        scenario: Path of an NDJSON scenario file.
+        run: Index of this run, recorded in the result.
+        agent_path: "module:function" path of the agent callback, if any.
+        step: Simulator time to advance between agent calls.
+        include_snapshot: Whether to include the final snapshot.
+        coalesce: Whether to coalesce mergeable due events, such as bursts
+            of location fixes, into one execution.
+
+    Returns:
+        The run's metrics and final snapshot.
+    """
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    agent = load_agent(agent_path)
+
+    with open(scenario) as file:
+        # Only files whose header says write_ndjson() validated them are trusted
+        config, events = read_ndjson(file, trusted=True)
+        if config is None:
+            # Bare event files start the clock at their first event
+            first = next(events, None)
+            start = first.scheduled_time if first else ScenarioConfig().start
+            config = replace(ScenarioConfig(), start=start)
+            events = chain([first] if first else [], events)
+        engine = create_engine(config)
+        engine.event_queue.coalesce = coalesce
+        count = stream_into_queue(events, engine.event_queue)
+
+    result = RunResult(scenario=scenario, run=run, events=count)
+    queue = engine.event_queue
+    end = config.end
+    if queue.events:
+        end = max(end, queue.events[-1].scheduled_time)
+
+    engine.start()
+    while engine.environment.time_state.current_time < end:
+        step_result = engine.advance_time(step)
+        result.steps += 1
+        if agent is not None:
+            agent_started = time.perf_counter()
+            agent(engine, step_result)
+            result.agent_seconds += time.perf_counter() - agent_started
+    engine.stop()
+
+    executed = Counter()
+    failed = Counter()
+    merged = Counter()
+    for event in queue.events:
+        if event.status == EventStatus.EXECUTED:
+            executed[event.modality] += 1
+        elif event.status == EventStatus.FAILED:
+            failed[event.modality] += 1
+        elif "merged_into" in event.metadata:
+            merged[event.modality] += 1
+    result.executed = dict(executed)
+    result.failed = dict(failed)
+    result.merged = dict(merged)
+    if include_snapshot:
+        result.snapshot = engine.get_snapshot()
+    result.wall_seconds = time.perf_counter() - started
+    result.cpu_seconds = time.process_time() - cpu_started
+    return result
+
+
+def run_scenarios(
+    scenarios: Iterable[str],
+    repeat: int = 1,
+    workers: int | None = None,
+    agent_path: str | None = None,
+    step: timedelta = DEFAULT_STEP,
+    include_snapshot: bool = True,
+    coalesce: bool = False,
+) -> list[RunResult]:
+    """Run scenarios in parallel, each on its own engine.
+
+    Args:
+        scenarios: Paths of NDJSON scenario files.
+        repeat: Number of times to run each scenario.
+        workers: Worker processes. None uses one per CPU; 0 runs everything
+            in this process, one scenario at a time.
+        agent_path: "module:function" path of the agent callback, if any.
+        step: Simulator time to advance between agent calls.
+        include_snapshot: Whether to include final snapshots.
+        coalesce: Whether to coalesce mergeable due events.
+
+    Returns:
+        Results in the order the runs were submitted (each scenario's
+        repeats together).
+    """
+    load_agent(agent_path)  # Fail fast on a bad path before starting workers
+    jobs = [(scenario, run) for scenario in scenarios for run in range(repeat)]
+    if workers == 0:
+        return [
+            run_scenario(scenario, run, agent_path, step, include_snapshot, coalesce)
+            for scenario, run in jobs
+        ]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                run_scenario, scenario, run, agent_path, step, include_snapshot, coalesce
+            )
+            for scenario, run in jobs
+        ]
+        return [future.result() for future in futures]
+
+
+def build_report(results: list[RunResult], workers: int, wall_seconds: float) -> dict:
+    """Combine run results into one report.
+
+    Args:
+        results: Results of all runs.
+        workers: Number of worker processes used.
+        wall_seconds: Wall time for the whole batch.
+
+    Returns:
+        Report with batch totals and every run's result.
+    """
+    events = sum(result.events for result in results)
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "workers": workers,
+        "runs": len(results),
+        "wall_seconds": wall_seconds,
+        "events": events,
+        "events_per_second": events / wall_seconds if wall_seconds > 0 else 0.0,
+        "failed": sum(sum(result.failed.values()) for result in results),
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def main() -> None:
+    """Run scenario files from the command line and write a report."""
+    parser = argparse.ArgumentParser(
+        prog="python -m scenarios.runner", description="Run UES scenarios in parallel without a server."
+    )
+    parser.add_argument("scenarios", nargs="+", help="NDJSON scenario files")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per scenario")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Worker processes (default: one per CPU; 0 runs in-process)",
+    )
+    parser.add_argument("--agent", help="Agent callback as module:function")
+    parser.add_argument(
+        "--step",
+        type=float,
+        default=DEFAULT_STEP.total_seconds(),
+        help="Simulator seconds between agent calls (default: 3600)",
+    )
+    parser.add_argument(
+        "--no-snapshots", action="store_true", help="Leave final snapshots out"
+    )
+    parser.add_argument(
+        "--coalesce",
+        action="store_true",
+        help="Collapse mergeable due events (e.g. location bursts) into one execution",
+    )
+    parser.add_argument("--report", type=Path, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    results = run_scenarios(
+        args.scenarios,
+        repeat=args.repeat,
+        workers=args.workers,
+        agent_path=args.agent,
+        step=timedelta(seconds=args.step),
+        include_snapshot=not args.no_snapshots,
+        coalesce=args.coalesce,
+    )
+    report = build_report(results, args.workers, time.perf_counter() - started)
+
+    for result in results:
+        print(
+            f"{result.scenario} #{result.run}: {result.events:,} events, "
+            f"{sum(result.failed.values())} failed, {result.wall_seconds:.1f}s"
+        )
+    print(
+        f"{report['runs']} runs, {report['events']:,} events in "
+        f"{report['wall_seconds']:.1f}s ({report['events_per_second']:,.0f} events/s)"
+    )
+    if args.report is not None:
+        args.report.write_bytes(to_json(report, indent=2))
+        print(f"wrote report to {args.report}")
+    if report["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Integration tests for POST /batch."""
+
+import pytest
+
+from api.executor import initialize_engine_executor, shutdown_engine_executor
+from api.routes.batch import MAX_BATCH_REQUESTS
+
+
+def _receive(subject: str) -> dict:
+    """Build a batch sub-request that receives an email."""
+    return {
+        "method": "POST",
+        "path": "/email/receive",
+        "body": {
+            "from_address": "alice@example.com",
+            "to_addresses": ["user@example.com"],
+            "subject": subject,
+            "body_text": "Hello",
+        },
+    }
+
+
+class TestBatchEndpoint:
+    """Tests for running sub-requests in one batch."""
+
+    def test_runs_requests_in_order(self, client_with_engine):
+        """Test that later sub-requests see the effects of earlier ones."""
+        client, engine = client_with_engine
+
+        response = client.post(
+            "/batch",
+            json={
+                "requests": [
+                    _receive("First"),
+                    _receive("Second"),
+                    {
+                        "method": "POST",
+                        "path": "/email/query",
+                        "body": {"sort_order": "asc"},
+                    },
+                    {"method": "GET", "path": "/simulator/time"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["responses"]
+        assert [result["status_code"] for result in results] == [200, 200, 200, 200]
+        assert results[0]["body"]["status"] == "executed"
+        assert [email["subject"] for email in results[2]["body"]["emails"]] == [
+            "First",
+            "Second",
+        ]
+        current_time = client.get("/simulator/time").json()["current_time"]
+        assert results[3]["body"]["current_time"] == current_time
+        assert len(engine.environment.get_state("email").emails) == 2
+
+    def test_failures_do_not_stop_the_batch(self, client_with_engine):
+        """Test that each sub-request gets its own error response."""
+        client, _ = client_with_engine
+        individual = [
+            client.get("/nowhere"),
+            client.post("/email/receive", json={"subject": "Missing fields"}),
+            client.get("/environment/modalities/nothing"),
+        ]
+
+        response = client.post(
+            "/batch",
+            json={
+                "requests": [
+                    {"method": "GET", "path": "/nowhere"},
+                    {
+                        "method": "POST",
+                        "path": "/email/receive",
+                        "body": {"subject": "Missing fields"},
+                    },
+                    {"method": "GET", "path": "/environment/modalities/nothing"},
+                    _receive("Still received"),
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["responses"]
+        for result, expected in zip(results, individual):
+            assert result == {"status_code": expected.status_code, "body": expected.json()}
+        assert results[3]["status_code"] == 200
+
+    def test_streamed_requests_are_rejected(self, client_with_engine):
+        """Test that sub-requests that stream their response get 400."""
+        client, _ = client_with_engine
+
+        response = client.post(
+            "/batch",
+            json={
+                "requests": [
+                    {"method": "GET", "path": "/email/state", "params": {"stream": True}}
+                ]
+            },
+        )
+
+        result = response.json()["responses"][0]
+        assert result["status_code"] == 400
+        assert "cannot be batched" in result["body"]["detail"]
+
+    def test_stopping_auto_advance_loop_is_refused(self, client_with_engine):
+        """Test that a batch cannot stop the loop it is holding the lock against."""
+        client, engine = client_with_engine
+        client.post("/simulation/stop")
+        client.post("/simulation/start", json={"auto_advance": True})
+
+        response = client.post(
+            "/batch", json={"requests": [{"method": "POST", "path": "/simulation/stop"}]}
+        )
+
+        result = response.json()["responses"][0]
+        assert result["status_code"] == 409
+        assert "write lock" in result["body"]["detail"]
+        assert engine.is_running
+        assert client.post("/simulation/stop").status_code == 200
+        assert not engine.is_running
+
+    def test_batch_size_is_limited(self, client_with_engine):
+        """Test that oversized batches are rejected as a whole."""
+        client, _ = client_with_engine
+        requests = [{"method": "GET", "path": "/simulator/time"}] * (MAX_BATCH_REQUESTS + 1)
+
+        response = client.post("/batch", json={"requests": requests})
+
+        assert response.status_code == 422
+
+    @pytest.mark.parametrize("workers", [0, 1])
+    def test_runs_with_any_pool_size(self, client_with_engine, workers):
+        """Test that nested engine calls work inline and on a single worker."""
+        client, engine = client_with_engine
+        initialize_engine_executor(max_workers=workers)
+        try:
+            response = client.post(
+                "/batch",
+                json={
+                    "requests": [
+                        {
+                            "method": "POST",
+                            "path": "/location/update",
+                            "body": {"latitude": 40.0, "longitude": -74.0},
+                        },
+                        {"method": "GET", "path": "/location/state"},
+                        {
+                            "method": "POST",
+                            "path": "/simulator/time/advance",
+                            "body": {"seconds": 60},
+                        },
+                    ]
+                },
+            )
+        finally:
+            shutdown_engine_executor()
+
+        results = response.json()["responses"]
+        assert [result["status_code"] for result in results] == [200, 200, 200]
+        assert results[1]["body"]["current"]["latitude"] == 40.0
@@ -728,3 +728,91 @@ class TestResourceContention:
         
         # All should succeed
         assert all(code == 200 for code in results)
+
+
+# =============================================================================
+# Stress: Readers and Writers Against Auto-Advance
+# =============================================================================
+
+
+class TestAutoAdvanceStress:
+    """Stress tests mixing many readers and writers with the tick thread."""
+
+    def test_concurrent_readers_and_writers_during_auto_advance(
+        self, client_with_engine
+    ):
+        """Readers and writers racing the tick thread should all succeed consistently."""
+        client, engine = client_with_engine
+        client.post("/simulation/stop")
+        response = client.post(
+            "/simulation/start", json={"auto_advance": True, "time_scale": 3600.0}
+        )
+        assert response.status_code == 200
+
+        # Scheduled emails that the tick thread executes while requests run
+        current_time = engine.environment.time_state.current_time
+        for i in range(20):
+            response = client.post(
+                "/events",
+                json=make_event_request(
+                    current_time + timedelta(seconds=30 * (i + 1)),
+                    "email",
+                    email_event_data(subject=f"Scheduled {i}"),
+                ),
+            )
+            assert response.status_code == 200
+
+        def receive_email(i):
+            return lambda: client.post(
+                "/email/receive",
+                json={
+                    "from_address": f"sender{i}@example.com",
+                    "to_addresses": ["user@example.com"],
+                    "subject": f"Immediate {i}",
+                    "body_text": "Body",
+                },
+            )
+
+        def receive_sms(i):
+            return lambda: client.post(
+                "/sms/receive",
+                json={
+                    "from_number": f"+1555000{i:04d}",
+                    "to_numbers": ["+15550000000"],
+                    "body": f"Message {i}",
+                },
+            )
+
+        readers = [
+            lambda: client.post("/email/query", json={"limit": 5}),
+            lambda: client.get("/email/state"),
+            lambda: client.get("/sms/state"),
+            lambda: client.get("/environment/state"),
+            lambda: client.get("/events"),
+            lambda: client.get("/simulator/time"),
+        ]
+        writers = [receive_email(i) for i in range(40)] + [
+            receive_sms(i) for i in range(40)
+        ]
+        tasks = writers + readers * 20
+
+        results = run_concurrent(tasks, max_workers=24)
+
+        assert [r.status_code for r in results] == [200] * len(tasks)
+
+        # Let the remaining scheduled emails execute, then stop ticking
+        deadline = datetime.now() + timedelta(seconds=5)
+        while engine.event_queue.pending_count and datetime.now() < deadline:
+            client.get("/simulator/time")
+        client.post("/simulation/stop")
+
+        email_state = engine.environment.get_state("email")
+        sms_state = engine.environment.get_state("sms")
+        subjects = [email.subject for email in email_state.emails.values()]
+        assert sorted(s for s in subjects if s.startswith("Immediate")) == sorted(
+            f"Immediate {i}" for i in range(40)
+        )
+        assert len([s for s in subjects if s.startswith("Scheduled")]) == 20
+        assert len(sms_state.messages) == 40
+        assert engine.validate() == []
+        assert engine.undo_stack.undo_count == 100
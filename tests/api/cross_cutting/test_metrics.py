@@ -0,0 +1,54 @@
+"""Integration tests for GET /metrics."""
+
+from api.middleware import get_slow_request_log
+from models.metrics import REGISTRY
+
+
+class TestMetricsEndpoint:
+    """Tests for the Prometheus metrics endpoint."""
+
+    def test_returns_prometheus_text(self, client_with_engine):
+        """Test that /metrics serves the text exposition format."""
+        client, _ = client_with_engine
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE ues_event_execution_seconds histogram" in response.text
+
+    def test_reports_engine_state_gauges(self, client_with_engine):
+        """Test that queue depth and undo stack gauges reflect the engine."""
+        client, engine = client_with_engine
+        REGISTRY.clear()
+
+        client.post("/location/update", json={"latitude": 40.0, "longitude": -74.0})
+        text = client.get("/metrics").text
+
+        assert 'ues_event_queue_events{status="executed"} 1' in text
+        assert 'ues_undo_stack_entries{stack="undo"} 1' in text
+        assert "ues_simulation_running 1" in text
+        assert (
+            'ues_event_execution_seconds_count{modality="location",'
+            'operation="apply",status="executed"} 1'
+        ) in text
+
+
+class TestSlowRequestsEndpoint:
+    """Tests for GET /debug/slow-requests."""
+
+    def test_lists_slowest_requests(self, client_with_engine):
+        """Test that handled requests appear with their timing breakdown."""
+        client, _ = client_with_engine
+        get_slow_request_log().clear()
+
+        client.post("/email/query?source=test", json={"limit": 5})
+        response = client.get("/debug/slow-requests", params={"limit": 10})
+
+        assert response.status_code == 200
+        data = response.json()
+        entry = next(e for e in data["requests"] if e["route"] == "/email/query")
+        assert entry["query_params"] == {"source": "test"}
+        assert entry["status_code"] == 200
+        assert entry["engine_seconds"] > 0
+        assert entry["serialization_seconds"] is not None
@@ -51,7 +51,7 @@ class TestGetEnvironmentState:
         assert isinstance(data["modalities"], dict)
         
         # Verify all implemented modalities are present
-        expected_modalities = {"location", "time", "weather", "chat", "email", "calendar", "sms"}
+        expected_modalities = {"location", "time", "weather", "chat", "email", "calendar", "sms", "filesystem", "slack", "discord", "social", "screen"}
         assert set(data["modalities"].keys()) == expected_modalities
         
         # Verify summary is a list
@@ -128,7 +128,7 @@ class TestGetEnvironmentState:
         data = response.json()
         
         # fresh_engine creates environment with all implemented modalities
-        expected_modalities = {"location", "time", "weather", "chat", "email", "calendar", "sms"}
+        expected_modalities = {"location", "time", "weather", "chat", "email", "calendar", "sms", "filesystem", "slack", "discord", "social", "screen"}
         
         # Verify all expected modalities are present
         for modality in expected_modalities:
@@ -240,3 +240,29 @@ class TestGetEnvironmentState:
             
             # Verify state_summary is non-empty
             assert len(summary["state_summary"]) > 0
+
+
+class TestGetEnvironmentStateStreaming:
+    """Tests for GET /environment/state?stream=true."""
+    
+    def test_streamed_snapshot_matches_regular_snapshot(self, client_with_engine):
+        """Test that the chunked JSON document equals the regular response."""
+        client, engine = client_with_engine
+        
+        client.post(
+            "/email/receive",
+            json={
+                "from_address": "sender@example.com",
+                "to_addresses": ["user@example.com"],
+                "subject": "Hello",
+                "body_text": "Body",
+            },
+        )
+        client.post("/chat/send", json={"role": "user", "content": "Hi"})
+        
+        regular = client.get("/environment/state")
+        streamed = client.get("/environment/state", params={"stream": True})
+        
+        assert streamed.status_code == 200
+        assert streamed.headers["content-type"].startswith("application/json")
+        assert streamed.json() == regular.json()
@@ -75,7 +75,7 @@ class TestGetModalityState:
         modalities = modalities_response.json()["modalities"]
         
         # Expected modalities
-        expected_modalities = {"location", "time", "weather", "chat", "email", "calendar", "sms"}
+        expected_modalities = {"location", "time", "weather", "chat", "email", "calendar", "sms", "filesystem", "slack", "discord", "social", "screen"}
         assert set(modalities) == expected_modalities
         
         # For each modality, get its state
@@ -223,7 +223,7 @@ class TestGetModalityState:
         assert email_state_single["labels"] == email_state_full["labels"]
         assert email_state_single["folders"] == email_state_full["folders"]
         
-        # Verify full state has all 7 modalities while single has just one
-        assert len(full_data["modalities"]) == 7
+        # Verify full state has all 12 modalities while single has just one
+        assert len(full_data["modalities"]) == 12
         assert single_data["modality_type"] == "email"
         assert single_data["state"]["modality_type"] == "email"
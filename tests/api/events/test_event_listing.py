@@ -7,6 +7,7 @@ This module tests the GET /events endpoint, which allows clients to:
 - Combine multiple filters
 """
 
+import json
 from datetime import datetime, timedelta
 
 from tests.api.helpers import (
@@ -391,3 +392,202 @@ class TestGetEvents:
         # Should return 400 Bad Request
         assert response.status_code == 400
         assert "Invalid status" in response.json()["detail"]
+
+
+class TestGetEventsNdjson:
+    """Tests for the NDJSON variant of GET /events."""
+    
+    def test_ndjson_streams_same_events_as_json(self, client_with_engine):
+        """Test that NDJSON output contains one line per matching event."""
+        client, engine = client_with_engine
+        current_time = engine.environment.time_state.current_time
+        
+        for i in range(3):
+            client.post(
+                "/events",
+                json=make_event_request(
+                    current_time + timedelta(hours=i + 1),
+                    "email",
+                    email_event_data(subject=f"Email {i}"),
+                ),
+            )
+        
+        response = client.get(
+            "/events",
+            params={"limit": 2},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == client.get("/events", params={"limit": 2}).json()["events"]
+        assert len(lines) == 2
+    
+    def test_ndjson_invalid_status_still_returns_400(self, client_with_engine):
+        """Test that validation errors are reported before streaming starts."""
+        client, engine = client_with_engine
+        
+        response = client.get(
+            "/events",
+            params={"status": "invalid_status"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        
+        assert response.status_code == 400
+
+
+class TestGetEventsProjection:
+    """Tests for the fields projection of GET /events."""
+    
+    def test_fields_limits_returned_keys(self, client_with_engine):
+        """Test that only the requested fields are returned for each event."""
+        client, engine = client_with_engine
+        current_time = engine.environment.time_state.current_time
+        
+        client.post(
+            "/events",
+            json=make_event_request(
+                current_time + timedelta(hours=1),
+                "email",
+                email_event_data(subject="Projected"),
+            ),
+        )
+        
+        response = client.get("/events", params={"fields": "event_id,status"})
+        
+        assert response.status_code == 200
+        events = response.json()["events"]
+        assert len(events) == 1
+        assert events[0] == {
+            "event_id": client.get("/events").json()["events"][0]["event_id"],
+            "status": "pending",
+        }
+    
+    def test_required_fields_only_returns_those_fields(self, client_with_engine):
+        """Test that naming every required field does not add the optional ones."""
+        client, engine = client_with_engine
+        current_time = engine.environment.time_state.current_time
+        required = ["event_id", "scheduled_time", "modality", "status", "priority", "created_at"]
+        
+        client.post(
+            "/events",
+            json=make_event_request(
+                current_time + timedelta(hours=1),
+                "email",
+                email_event_data(subject="Projected"),
+            ),
+        )
+        
+        response = client.get("/events", params={"fields": ",".join(required)})
+        
+        assert response.status_code == 200
+        events = response.json()["events"]
+        assert len(events) == 1
+        assert list(events[0]) == required
+    
+    def test_unknown_field_returns_400(self, client_with_engine):
+        """Test that unknown field names are rejected."""
+        client, engine = client_with_engine
+        
+        response = client.get("/events", params={"fields": "event_id,bogus"})
+        
+        assert response.status_code == 400
+        assert "bogus" in response.json()["detail"]
+    
+    def test_ndjson_respects_fields(self, client_with_engine):
+        """Test that streamed lines are projected too."""
+        client, engine = client_with_engine
+        current_time = engine.environment.time_state.current_time
+        
+        client.post(
+            "/events",
+            json=make_event_request(
+                current_time + timedelta(hours=1),
+                "email",
+                email_event_data(subject="Projected"),
+            ),
+        )
+        
+        response = client.get(
+            "/events",
+            params={"fields": "modality"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {"modality": "email"}
+        ]
+
+
+class TestGetEventsCursor:
+    """Tests for cursor pagination of GET /events."""
+    
+    def test_cursor_walk_matches_full_listing(self, client_with_engine):
+        """Test that walking with cursors returns every event in queue order."""
+        client, engine = client_with_engine
+        current_time = engine.environment.time_state.current_time
+        
+        for i in range(5):
+            client.post(
+                "/events",
+                json=make_event_request(
+                    current_time + timedelta(hours=1 + i % 2),
+                    "email",
+                    email_event_data(subject=f"Email {i}"),
+                ),
+            )
+        
+        expected = [e["event_id"] for e in client.get("/events").json()["events"]]
+        
+        first = client.get("/events", params={"limit": 2}).json()
+        assert first["total"] == 5
+        ids = [e["event_id"] for e in first["events"]]
+        cursor = first["next_cursor"]
+        while cursor is not None:
+            data = client.get("/events", params={"limit": 2, "cursor": cursor}).json()
+            assert data["total"] is None
+            ids.extend(e["event_id"] for e in data["events"])
+            cursor = data["next_cursor"]
+        
+        assert ids == expected
+    
+    def test_cursor_respects_filters(self, client_with_engine):
+        """Test that cursor pages only contain events matching the filters."""
+        client, engine = client_with_engine
+        current_time = engine.environment.time_state.current_time
+        
+        for i in range(4):
+            client.post(
+                "/events",
+                json=make_event_request(
+                    current_time + timedelta(hours=1 + i),
+                    "email" if i % 2 == 0 else "sms",
+                    email_event_data() if i % 2 == 0 else sms_event_data(),
+                ),
+            )
+        
+        first = client.get("/events", params={"limit": 1, "modality": "sms"}).json()
+        second = client.get(
+            "/events",
+            params={"limit": 1, "modality": "sms", "cursor": first["next_cursor"]},
+        ).json()
+        
+        assert [e["modality"] for e in first["events"] + second["events"]] == ["sms", "sms"]
+        assert second["next_cursor"] is None
+    
+    def test_invalid_cursor_returns_400(self, client_with_engine):
+        """Test that a malformed cursor is rejected."""
+        client, engine = client_with_engine
+        
+        response = client.get("/events", params={"cursor": "garbage"})
+        
+        assert response.status_code == 400
+    
+    def test_cursor_with_offset_returns_400(self, client_with_engine):
+        """Test that cursor and offset cannot be combined."""
+        client, engine = client_with_engine
+        
+        response = client.get("/events", params={"cursor": "garbage", "offset": 1})
+        
+        assert response.status_code == 400
@@ -442,3 +442,87 @@ class TestPostCalendarQuery:
         assert data["events"] == []
         assert data["count"] == 0
         assert data["total_count"] == 0
+
+
+class TestPostCalendarQueryProjection:
+    """Tests for the fields projection of POST /calendar/query."""
+
+    def test_fields_limits_returned_keys(self, client_with_engine):
+        """Test that only the requested fields are returned for each event."""
+        client, engine = client_with_engine
+
+        time_response = client.get("/simulator/time")
+        current_time = datetime.fromisoformat(time_response.json()["current_time"])
+        start = current_time + timedelta(hours=1)
+        client.post(
+            "/calendar/create",
+            json={
+                "title": "Projected",
+                "start": start.isoformat(),
+                "end": (start + timedelta(hours=1)).isoformat(),
+            },
+        )
+
+        response = client.post("/calendar/query", json={"fields": ["event_id", "title"]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 1
+        assert set(data["events"][0]) == {"event_id", "title"}
+        assert data["events"][0]["title"] == "Projected"
+
+    def test_unknown_field_returns_400(self, client_with_engine):
+        """Test that unknown field names are rejected."""
+        client, engine = client_with_engine
+
+        response = client.post("/calendar/query", json={"fields": ["bogus"]})
+
+        assert response.status_code == 400
+
+
+class TestPostCalendarQueryCursor:
+    """Tests for cursor pagination of POST /calendar/query."""
+
+    def test_cursor_walk_matches_offset_results(self, client_with_engine):
+        """Test that walking with cursors returns the same events as one big query."""
+        client, engine = client_with_engine
+
+        time_response = client.get("/simulator/time")
+        current_time = datetime.fromisoformat(time_response.json()["current_time"])
+        for i in range(5):
+            start = current_time + timedelta(hours=5 - i)
+            client.post(
+                "/calendar/create",
+                json={
+                    "title": f"Event {i}",
+                    "start": start.isoformat(),
+                    "end": (start + timedelta(hours=1)).isoformat(),
+                },
+            )
+
+        query = {"sort_by": "start", "sort_order": "asc"}
+        expected = [
+            event["event_id"]
+            for event in client.post("/calendar/query", json=query).json()["events"]
+        ]
+
+        ids = []
+        cursor = None
+        while True:
+            data = client.post(
+                "/calendar/query", json={**query, "limit": 2, "cursor": cursor}
+            ).json()
+            ids.extend(event["event_id"] for event in data["events"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert ids == expected
+
+    def test_invalid_cursor_returns_400(self, client_with_engine):
+        """Test that a malformed cursor is rejected."""
+        client, engine = client_with_engine
+
+        response = client.post("/calendar/query", json={"cursor": "garbage"})
+
+        assert response.status_code == 400
@@ -217,3 +217,32 @@ class TestPostChatQuery:
         assert data["returned_count"] == 0
         assert data["total_count"] == 0
         assert data["messages"] == []
+
+
+class TestPostChatQueryProjection:
+    """Tests for the fields projection of POST /chat/query."""
+
+    def test_fields_limits_returned_keys(self, client_with_engine):
+        """Test that only the requested fields are returned for each message."""
+        client, engine = client_with_engine
+
+        client.post("/chat/send", json={"role": "user", "content": "Message 1"})
+        client.post("/chat/send", json={"role": "assistant", "content": "Response 1"})
+
+        response = client.post("/chat/query", json={"fields": ["role", "content"]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["returned_count"] == 2
+        assert sorted(data["messages"], key=lambda m: m["content"]) == [
+            {"role": "user", "content": "Message 1"},
+            {"role": "assistant", "content": "Response 1"},
+        ]
+
+    def test_unknown_field_returns_400(self, client_with_engine):
+        """Test that unknown field names are rejected."""
+        client, engine = client_with_engine
+
+        response = client.post("/chat/query", json={"fields": ["bogus"]})
+
+        assert response.status_code == 400
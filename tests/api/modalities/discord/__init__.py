@@ -0,0 +1 @@
+"""Integration tests for Discord modality routes."""
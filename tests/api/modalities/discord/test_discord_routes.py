@@ -0,0 +1,66 @@
+"""Integration tests for Discord endpoints.
+
+The Discord routes are the team chat routes shared with Slack, which the
+Slack tests cover in depth; these tests check they are wired to Discord.
+"""
+
+
+class TestDiscordRoutes:
+    """Tests for the /discord endpoints."""
+
+    def test_create_channel_in_server(self, client_with_engine):
+        """Test creating a channel in a server."""
+        client, engine = client_with_engine
+
+        response = client.post(
+            "/discord/channels", json={"channel_id": "111", "server_id": "999"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["modality"] == "discord"
+        assert engine.environment.get_state("discord").channels["111"].space_id == "999"
+        assert "111" not in engine.environment.get_state("slack").channels
+
+    def test_post_and_query(self, client_with_engine):
+        """Test posting and reading back a message."""
+        client, _ = client_with_engine
+        client.post(
+            "/discord/post", json={"channel_id": "111", "author": "222", "text": "<@!user> gg"}
+        )
+
+        state = client.get("/discord/state").json()
+        data = client.post("/discord/query", json={"channel_id": "111"}).json()
+
+        assert state["modality_type"] == "discord"
+        assert state["unread_mention_count"] == 1
+        assert state["channels"][0]["server_id"] is None
+        assert data["messages"][0]["text"] == "<@!user> gg"
+
+    def test_failed_action_returns_400(self, client_with_engine):
+        """Test actions that fail against the state return 400."""
+        client, _ = client_with_engine
+
+        response = client.post("/discord/read", json={"channel_id": "missing"})
+
+        assert response.status_code == 400
+        assert "not found" in response.json()["detail"]
+
+    def test_submit_event_through_events_api(self, client_with_engine):
+        """Test Discord inputs can be scheduled through POST /events."""
+        client, _ = client_with_engine
+
+        response = client.post(
+            "/events",
+            json={
+                "scheduled_time": "2025-01-01T12:00:00+00:00",
+                "modality": "discord",
+                "data": {
+                    "operation": "post_message",
+                    "channel_id": "111",
+                    "author": "222",
+                    "text": "later",
+                },
+            },
+        )
+
+        assert response.status_code == 200
@@ -1,7 +1,11 @@
 """Integration tests for POST /email/query endpoint."""
 
+import json
 from datetime import timedelta
 
+from api.routes.email import EmailQueryRequest, query_emails
+from models.modalities.email_input import EmailInput
+
 
 class TestPostEmailQuery:
     """Tests for POST /email/query endpoint."""
@@ -526,3 +530,322 @@ class TestPostEmailQuery:
         assert data["returned_count"] == 0
         assert data["total_count"] == 0
         assert data["emails"] == []
+
+
+class TestPostEmailQueryNdjson:
+    """Tests for the NDJSON variant of POST /email/query."""
+
+    def test_ndjson_streams_same_emails_as_json(self, client_with_engine):
+        """Test that NDJSON output contains one line per matching email."""
+        client, engine = client_with_engine
+
+        for i in range(3):
+            client.post(
+                "/email/receive",
+                json={
+                    "from_address": f"sender{i}@example.com",
+                    "to_addresses": ["user@example.com"],
+                    "subject": f"Email {i}",
+                    "body_text": "Body",
+                },
+            )
+
+        response = client.post(
+            "/email/query",
+            json={"sort_by": "date", "sort_order": "asc"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        expected = client.post(
+            "/email/query", json={"sort_by": "date", "sort_order": "asc"}
+        ).json()["emails"]
+        assert lines == expected
+        assert [line["subject"] for line in lines] == ["Email 0", "Email 1", "Email 2"]
+
+    def test_ndjson_respects_filters_and_pagination(self, client_with_engine):
+        """Test that filters, limit, and offset apply to streamed output."""
+        client, engine = client_with_engine
+
+        for i in range(4):
+            client.post(
+                "/email/receive",
+                json={
+                    "from_address": "sender@example.com",
+                    "to_addresses": ["user@example.com"],
+                    "subject": f"Email {i}",
+                    "body_text": "Body",
+                },
+            )
+
+        response = client.post(
+            "/email/query",
+            json={"sort_by": "date", "sort_order": "asc", "limit": 2, "offset": 1},
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        subjects = [json.loads(line)["subject"] for line in response.text.splitlines()]
+        assert subjects == ["Email 1", "Email 2"]
+
+    def test_ndjson_with_no_matches_returns_empty_body(self, client_with_engine):
+        """Test that an empty result produces an empty NDJSON body."""
+        client, engine = client_with_engine
+
+        response = client.post(
+            "/email/query",
+            json={"folder": "inbox"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.text == ""
+
+    async def test_state_changes_while_streaming_leave_valid_lines(self, fresh_engine):
+        """Test that emails changed mid-stream are sent as whole, current rows."""
+        engine = fresh_engine
+        email_state = engine.environment.get_state("email")
+        with engine.operation_lock.write():
+            for i in range(600):
+                email_state.apply_input(
+                    EmailInput(
+                        timestamp=email_state.last_updated,
+                        operation="receive",
+                        from_address=f"sender{i}@example.com",
+                        to_addresses=["user@example.com"],
+                        subject=f"Email {i}",
+                        body_text="Body " * 50,
+                    )
+                )
+
+        response = await query_emails(
+            EmailQueryRequest(sort_by="date", sort_order="asc"),
+            engine,
+            accept="application/x-ndjson",
+        )
+        chunks = response.body_iterator
+        body = [await anext(chunks)]
+
+        with engine.operation_lock.write():
+            email_state.apply_input(
+                EmailInput(
+                    timestamp=email_state.last_updated,
+                    operation="mark_read",
+                    message_ids=list(email_state.emails),
+                )
+            )
+        body.extend([chunk async for chunk in chunks])
+
+        lines = [json.loads(line) for line in b"".join(body).splitlines()]
+        assert [line["subject"] for line in lines] == [f"Email {i}" for i in range(600)]
+        assert not lines[0]["is_read"]
+        assert lines[-1]["is_read"]
+
+
+class TestPostEmailQueryProjection:
+    """Tests for the fields projection of POST /email/query."""
+
+    def test_fields_limits_returned_keys(self, client_with_engine):
+        """Test that only the requested fields are returned for each email."""
+        client, engine = client_with_engine
+
+        for i in range(2):
+            client.post(
+                "/email/receive",
+                json={
+                    "from_address": "sender@example.com",
+                    "to_addresses": ["user@example.com"],
+                    "subject": f"Email {i}",
+                    "body_text": "Body",
+                },
+            )
+
+        response = client.post(
+            "/email/query",
+            json={"fields": ["message_id", "subject"], "sort_by": "date", "sort_order": "asc"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        full = client.post(
+            "/email/query", json={"sort_by": "date", "sort_order": "asc"}
+        ).json()["emails"]
+        assert data["emails"] == [
+            {"message_id": e["message_id"], "subject": e["subject"]} for e in full
+        ]
+        assert data["total_count"] == 2
+
+    def test_required_fields_only_returns_those_fields(self, client_with_engine):
+        """Test that naming every required field does not add the optional ones."""
+        client, engine = client_with_engine
+        required = [
+            "message_id",
+            "thread_id",
+            "from_address",
+            "to_addresses",
+            "subject",
+            "body_text",
+            "sent_at",
+            "received_at",
+        ]
+
+        client.post(
+            "/email/receive",
+            json={
+                "from_address": "sender@example.com",
+                "to_addresses": ["user@example.com"],
+                "subject": "Projected",
+                "body_text": "Body",
+            },
+        )
+
+        response = client.post("/email/query", json={"fields": required})
+
+        assert response.status_code == 200
+        emails = response.json()["emails"]
+        assert len(emails) == 1
+        assert sorted(emails[0]) == sorted(required)
+
+    def test_unknown_field_returns_400(self, client_with_engine):
+        """Test that unknown field names are rejected."""
+        client, engine = client_with_engine
+
+        response = client.post("/email/query", json={"fields": ["subject", "bogus"]})
+
+        assert response.status_code == 400
+        assert "bogus" in response.json()["detail"]
+
+    def test_empty_fields_returns_400(self, client_with_engine):
+        """Test that an empty projection is rejected."""
+        client, engine = client_with_engine
+
+        response = client.post("/email/query", json={"fields": []})
+
+        assert response.status_code == 400
+
+    def test_ndjson_respects_fields(self, client_with_engine):
+        """Test that streamed lines are projected too."""
+        client, engine = client_with_engine
+
+        client.post(
+            "/email/receive",
+            json={
+                "from_address": "sender@example.com",
+                "to_addresses": ["user@example.com"],
+                "subject": "Projected",
+                "body_text": "Body",
+            },
+        )
+
+        response = client.post(
+            "/email/query",
+            json={"fields": ["subject"]},
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {"subject": "Projected"}
+        ]
+
+
+class TestPostEmailQueryCursor:
+    """Tests for cursor pagination of POST /email/query."""
+
+    def _receive_emails(self, client, count):
+        for i in range(count):
+            client.post(
+                "/email/receive",
+                json={
+                    "from_address": f"sender{i % 3}@example.com",
+                    "to_addresses": ["user@example.com"],
+                    "subject": f"Email {i}",
+                    "body_text": "Body",
+                },
+            )
+
+    def _walk(self, client, query, page_size):
+        ids = []
+        cursor = None
+        while True:
+            data = client.post(
+                "/email/query", json={**query, "limit": page_size, "cursor": cursor}
+            ).json()
+            ids.extend(email["message_id"] for email in data["emails"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                return ids
+
+    def test_cursor_walk_matches_offset_results(self, client_with_engine):
+        """Test that walking with cursors returns the same emails as one big query."""
+        client, engine = client_with_engine
+        self._receive_emails(client, 7)
+
+        for query in (
+            {},
+            {"sort_by": "date", "sort_order": "desc"},
+            {"sort_by": "from", "sort_order": "asc"},
+            {"sort_by": "subject", "sort_order": "desc"},
+        ):
+            expected = [
+                email["message_id"]
+                for email in client.post("/email/query", json=query).json()["emails"]
+            ]
+            assert self._walk(client, query, page_size=3) == expected
+
+    def test_cursor_walk_respects_filters(self, client_with_engine):
+        """Test that cursor pages only contain emails matching the filters."""
+        client, engine = client_with_engine
+        self._receive_emails(client, 7)
+
+        ids = self._walk(client, {"from_address": "sender0@example.com"}, page_size=1)
+
+        assert len(ids) == 3
+
+    def test_cursor_page_has_no_total_count(self, client_with_engine):
+        """Test that cursor pages skip counting the full result set."""
+        client, engine = client_with_engine
+        self._receive_emails(client, 3)
+
+        first = client.post("/email/query", json={"limit": 2}).json()
+        second = client.post(
+            "/email/query", json={"limit": 2, "cursor": first["next_cursor"]}
+        ).json()
+
+        assert first["total_count"] == 3
+        assert first["next_cursor"] is not None
+        assert second["total_count"] is None
+        assert second["returned_count"] == 1
+        assert second["next_cursor"] is None
+
+    def test_invalid_cursor_returns_400(self, client_with_engine):
+        """Test that a malformed cursor is rejected."""
+        client, engine = client_with_engine
+
+        response = client.post("/email/query", json={"cursor": "garbage"})
+
+        assert response.status_code == 400
+
+    def test_cursor_for_other_sort_returns_400(self, client_with_engine):
+        """Test that a cursor cannot be reused with a different sort order."""
+        client, engine = client_with_engine
+        self._receive_emails(client, 3)
+
+        cursor = client.post(
+            "/email/query", json={"limit": 1, "sort_by": "date"}
+        ).json()["next_cursor"]
+        response = client.post(
+            "/email/query", json={"cursor": cursor, "sort_by": "subject"}
+        )
+
+        assert response.status_code == 400
+
+    def test_cursor_with_offset_returns_400(self, client_with_engine):
+        """Test that cursor and offset cannot be combined."""
+        client, engine = client_with_engine
+        self._receive_emails(client, 3)
+
+        cursor = client.post("/email/query", json={"limit": 1}).json()["next_cursor"]
+        response = client.post("/email/query", json={"cursor": cursor, "offset": 1})
+
+        assert response.status_code == 400
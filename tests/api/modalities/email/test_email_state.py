@@ -1,7 +1,28 @@
 """Integration tests for GET /email/state endpoint."""
 
+import json
 from datetime import datetime, timezone
 
+from api.routes.email import get_email_state
+from models.modalities.email_input import EmailInput
+
+
+def _receive(engine, count: int, prefix: str) -> None:
+    """Receive emails directly into the engine's email state, as a tick would."""
+    email_state = engine.environment.get_state("email")
+    with engine.operation_lock.write():
+        for i in range(count):
+            email_state.apply_input(
+                EmailInput(
+                    timestamp=email_state.last_updated,
+                    operation="receive",
+                    from_address=f"{prefix}{i}@example.com",
+                    to_addresses=["user@example.com"],
+                    subject=f"{prefix} {i}",
+                    body_text="Body " * 50,
+                )
+            )
+
 
 class TestGetEmailState:
     """Tests for GET /email/state endpoint."""
@@ -167,3 +188,70 @@ class TestGetEmailState:
 
         # Times should be very close (within 1 second)
         assert abs((state_time - initial_time).total_seconds()) < 1
+
+
+class TestGetEmailStateStreaming:
+    """Tests for GET /email/state?stream=true."""
+
+    def test_streamed_state_matches_regular_state(self, client_with_engine):
+        """Test that the chunked JSON document equals the regular response."""
+        client, engine = client_with_engine
+
+        for i in range(3):
+            client.post(
+                "/email/receive",
+                json={
+                    "from_address": f"sender{i}@example.com",
+                    "to_addresses": ["user@example.com"],
+                    "subject": f"Email {i}",
+                    "body_text": "Body",
+                },
+            )
+
+        regular = client.get("/email/state")
+        streamed = client.get("/email/state", params={"stream": True})
+
+        assert streamed.status_code == 200
+        assert streamed.headers["content-type"].startswith("application/json")
+        assert streamed.json() == regular.json()
+        assert streamed.json()["total_email_count"] == 3
+
+    async def test_state_changes_while_streaming_leave_a_valid_document(
+        self, fresh_engine
+    ):
+        """Test that emails received and read mid-stream do not tear the response."""
+        engine = fresh_engine
+        email_state = engine.environment.get_state("email")
+        _receive(engine, 600, "before")
+        snapshot_ids = set(email_state.emails)
+
+        response = await get_email_state(engine, stream=True)
+        chunks = response.body_iterator
+        body = [await anext(chunks)]
+
+        _receive(engine, 300, "during")
+        with engine.operation_lock.write():
+            email_state.apply_input(
+                EmailInput(
+                    timestamp=email_state.last_updated,
+                    operation="mark_read",
+                    message_ids=list(snapshot_ids),
+                )
+            )
+        body.extend([chunk async for chunk in chunks])
+
+        document = json.loads(b"".join(body))
+        assert set(document["emails"]) == snapshot_ids
+        assert document["total_email_count"] == 600
+        assert document["unread_count"] == 600
+        assert any(email["is_read"] for email in document["emails"].values())
+        assert len(document["threads"]) == 600
+
+    def test_summary_takes_precedence_over_stream(self, client_with_engine):
+        """Test that summary=true still returns the summary response."""
+        client, engine = client_with_engine
+
+        response = client.get("/email/state", params={"summary": True, "stream": True})
+
+        assert response.status_code == 200
+        assert "statistics" in response.json()
@@ -0,0 +1 @@
+"""Integration tests for file system modality routes."""
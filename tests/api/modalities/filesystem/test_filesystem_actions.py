@@ -0,0 +1,150 @@
+"""Integration tests for file system action endpoints."""
+
+import base64
+
+
+class TestPostFileSystemWrite:
+    """Tests for POST /filesystem/write and /filesystem/append."""
+
+    def test_write_succeeds(self, client_with_engine):
+        """Test writing a file returns a ModalityActionResponse."""
+        client, engine = client_with_engine
+
+        response = client.post(
+            "/filesystem/write", json={"path": "/docs/notes.txt", "content": "hi"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["modality"] == "filesystem"
+        assert data["status"] == "executed"
+        assert "event_id" in data
+
+        state = engine.environment.get_state("filesystem")
+        assert state.read_file("/docs/notes.txt") == b"hi"
+
+    def test_write_at_offset_and_append(self, client_with_engine):
+        """Test partial writes and appends."""
+        client, engine = client_with_engine
+
+        client.post("/filesystem/write", json={"path": "/a.txt", "content": "hello"})
+        client.post(
+            "/filesystem/write", json={"path": "/a.txt", "content": "J", "offset": 0}
+        )
+        client.post("/filesystem/append", json={"path": "/a.txt", "content": "!"})
+
+        state = engine.environment.get_state("filesystem")
+        assert state.read_file("/a.txt") == b"Jello!"
+
+    def test_write_base64(self, client_with_engine):
+        """Test writing binary content."""
+        client, engine = client_with_engine
+
+        response = client.post(
+            "/filesystem/write",
+            json={
+                "path": "/a.bin",
+                "content": base64.b64encode(b"\x00\x01").decode("ascii"),
+                "encoding": "base64",
+            },
+        )
+
+        assert response.status_code == 200
+        assert engine.environment.get_state("filesystem").read_file("/a.bin") == b"\x00\x01"
+
+    def test_relative_path_rejected(self, client_with_engine):
+        """Test relative paths fail validation with 422."""
+        client, _ = client_with_engine
+
+        response = client.post(
+            "/filesystem/write", json={"path": "a.txt", "content": "x"}
+        )
+
+        assert response.status_code == 422
+
+    def test_invalid_base64_rejected(self, client_with_engine):
+        """Test malformed base64 content is rejected with 400."""
+        client, _ = client_with_engine
+
+        response = client.post(
+            "/filesystem/write",
+            json={"path": "/a.bin", "content": "!!", "encoding": "base64"},
+        )
+
+        assert response.status_code == 400
+
+
+class TestPostFileSystemTreeOperations:
+    """Tests for mkdir, delete, move, copy and chmod endpoints."""
+
+    def test_mkdir_move_copy_delete(self, client_with_engine):
+        """Test a sequence of tree operations."""
+        client, engine = client_with_engine
+
+        assert client.post("/filesystem/mkdir", json={"path": "/a/b"}).status_code == 200
+        client.post("/filesystem/write", json={"path": "/a/b/f.txt", "content": "f"})
+        assert client.post(
+            "/filesystem/move", json={"path": "/a/b", "destination": "/c"}
+        ).status_code == 200
+        assert client.post(
+            "/filesystem/copy", json={"path": "/c", "destination": "/d"}
+        ).status_code == 200
+        assert client.post("/filesystem/delete", json={"path": "/a"}).status_code == 200
+
+        state = engine.environment.get_state("filesystem")
+        assert state.read_file("/c/f.txt") == b"f"
+        assert state.read_file("/d/f.txt") == b"f"
+        assert sorted(state.root.children) == ["c", "d"]
+
+    def test_chmod(self, client_with_engine):
+        """Test changing permissions."""
+        client, engine = client_with_engine
+        client.post("/filesystem/write", json={"path": "/a.txt", "content": "a"})
+
+        response = client.post(
+            "/filesystem/chmod", json={"path": "/a.txt", "permissions": "600"}
+        )
+
+        assert response.status_code == 200
+        assert engine.environment.get_state("filesystem").stat("/a.txt")["permissions"] == "600"
+
+    def test_delete_missing_path_returns_400(self, client_with_engine):
+        """Test a failing operation is reported as 400 with the reason."""
+        client, _ = client_with_engine
+
+        response = client.post("/filesystem/delete", json={"path": "/missing"})
+
+        assert response.status_code == 400
+        assert "No such file or directory" in response.json()["detail"]
+
+    def test_delete_non_empty_directory_requires_recursive(self, client_with_engine):
+        """Test non-empty directories are only deleted with recursive."""
+        client, _ = client_with_engine
+        client.post("/filesystem/write", json={"path": "/a/f.txt", "content": "f"})
+
+        assert client.post("/filesystem/delete", json={"path": "/a"}).status_code == 400
+        assert client.post(
+            "/filesystem/delete", json={"path": "/a", "recursive": True}
+        ).status_code == 200
+
+    def test_move_into_itself_rejected(self, client_with_engine):
+        """Test a directory cannot be moved into itself."""
+        client, _ = client_with_engine
+        client.post("/filesystem/mkdir", json={"path": "/a"})
+
+        response = client.post(
+            "/filesystem/move", json={"path": "/a", "destination": "/a/b"}
+        )
+
+        assert response.status_code == 400
+
+    def test_action_can_be_undone(self, client_with_engine):
+        """Test file system actions are undoable through the simulator."""
+        client, engine = client_with_engine
+        client.post("/filesystem/write", json={"path": "/a.txt", "content": "one"})
+        client.post("/filesystem/write", json={"path": "/a.txt", "content": "two"})
+
+        response = client.post("/simulation/undo", json={"count": 1})
+
+        assert response.status_code == 200
+        assert engine.environment.get_state("filesystem").read_file("/a.txt") == b"one"
@@ -0,0 +1,225 @@
+"""Integration tests for file system state, query and read endpoints."""
+
+import base64
+import random
+
+import pytest
+
+
+@pytest.fixture
+def populated_client(client_with_engine):
+    """Provide a client whose file system holds a few files."""
+    client, engine = client_with_engine
+    for path, content in {
+        "/docs/a.txt": "0123456789",
+        "/docs/b.md": "# b",
+        "/docs/sub/c.txt": "c",
+    }.items():
+        client.post("/filesystem/write", json={"path": path, "content": content})
+    return client, engine
+
+
+class TestGetFileSystemState:
+    """Tests for GET /filesystem/state."""
+
+    def test_empty_state(self, client_with_engine):
+        """Test the initial state is an empty tree."""
+        client, _ = client_with_engine
+
+        response = client.get("/filesystem/state")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["modality_type"] == "filesystem"
+        assert data["file_count"] == 0
+        assert data["root"] == []
+
+    def test_state_after_writes(self, populated_client):
+        """Test the state counts files and bytes."""
+        client, _ = populated_client
+
+        data = client.get("/filesystem/state").json()
+
+        assert data["file_count"] == 3
+        assert data["directory_count"] == 2
+        assert data["total_bytes"] == 14
+        assert [entry["name"] for entry in data["root"]] == ["docs"]
+
+
+class TestPostFileSystemQuery:
+    """Tests for POST /filesystem/query."""
+
+    def test_list_directory(self, populated_client):
+        """Test listing a directory's children."""
+        client, _ = populated_client
+
+        data = client.post("/filesystem/query", json={"path": "/docs"}).json()
+
+        assert data["path"] == "/docs"
+        assert [entry["name"] for entry in data["entries"]] == ["a.txt", "b.md", "sub"]
+
+    def test_recursive_search(self, populated_client):
+        """Test searching recursively by pattern and kind."""
+        client, _ = populated_client
+
+        data = client.post(
+            "/filesystem/query",
+            json={"recursive": True, "pattern": "*.txt", "kind": "file"},
+        ).json()
+
+        assert [entry["path"] for entry in data["entries"]] == [
+            "/docs/a.txt",
+            "/docs/sub/c.txt",
+        ]
+
+    def test_missing_directory_returns_400(self, client_with_engine):
+        """Test querying a missing path returns 400."""
+        client, _ = client_with_engine
+
+        response = client.post("/filesystem/query", json={"path": "/missing"})
+
+        assert response.status_code == 400
+
+    def test_unknown_sort_field_returns_400(self, client_with_engine):
+        """Test an unknown sort field returns 400."""
+        client, _ = client_with_engine
+
+        response = client.post("/filesystem/query", json={"sort_by": "color"})
+
+        assert response.status_code == 400
+
+
+class TestPostFileSystemRead:
+    """Tests for POST /filesystem/read."""
+
+    def test_read_text(self, populated_client):
+        """Test reading a whole file as text."""
+        client, _ = populated_client
+
+        data = client.post("/filesystem/read", json={"path": "/docs/a.txt"}).json()
+
+        assert data["content"] == "0123456789"
+        assert data["size"] == 10
+
+    def test_read_range_base64(self, populated_client):
+        """Test reading a byte range as base64."""
+        client, _ = populated_client
+
+        data = client.post(
+            "/filesystem/read",
+            json={"path": "/docs/a.txt", "offset": 2, "length": 3, "encoding": "base64"},
+        ).json()
+
+        assert base64.b64decode(data["content"]) == b"234"
+        assert data["length"] == 3
+
+    def test_read_binary_as_text_returns_400(self, client_with_engine):
+        """Test binary content must be read as base64."""
+        client, _ = client_with_engine
+        client.post(
+            "/filesystem/write",
+            json={"path": "/a.bin", "content": base64.b64encode(b"\xff").decode(), "encoding": "base64"},
+        )
+
+        response = client.post("/filesystem/read", json={"path": "/a.bin"})
+
+        assert response.status_code == 400
+
+    def test_read_missing_and_directory(self, populated_client):
+        """Test missing files return 404 and directories 400."""
+        client, _ = populated_client
+
+        assert client.post("/filesystem/read", json={"path": "/nope"}).status_code == 404
+        assert client.post("/filesystem/read", json={"path": "/docs"}).status_code == 400
+
+
+class TestGetFileContent:
+    """Tests for GET /filesystem/content, including byte ranges."""
+
+    def test_full_content(self, populated_client):
+        """Test downloading a whole file."""
+        client, _ = populated_client
+
+        response = client.get("/filesystem/content", params={"path": "/docs/a.txt"})
+
+        assert response.status_code == 200
+        assert response.content == b"0123456789"
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.headers["accept-ranges"] == "bytes"
+
+    @pytest.mark.parametrize(
+        "header,expected,content_range",
+        [
+            ("bytes=2-4", b"234", "bytes 2-4/10"),
+            ("bytes=7-", b"789", "bytes 7-9/10"),
+            ("bytes=-2", b"89", "bytes 8-9/10"),
+            ("bytes=8-100", b"89", "bytes 8-9/10"),
+        ],
+    )
+    def test_range(self, populated_client, header, expected, content_range):
+        """Test single byte ranges return 206 Partial Content."""
+        client, _ = populated_client
+
+        response = client.get(
+            "/filesystem/content",
+            params={"path": "/docs/a.txt"},
+            headers={"Range": header},
+        )
+
+        assert response.status_code == 206
+        assert response.content == expected
+        assert response.headers["content-range"] == content_range
+
+    @pytest.mark.parametrize("header", ["bytes=0-1,4-5", "items=0-1", "bytes=5-2"])
+    def test_unsupported_range_serves_whole_file(self, populated_client, header):
+        """Test multiple, unknown or malformed ranges are ignored."""
+        client, _ = populated_client
+
+        response = client.get(
+            "/filesystem/content",
+            params={"path": "/docs/a.txt"},
+            headers={"Range": header},
+        )
+
+        assert response.status_code == 200
+        assert response.content == b"0123456789"
+
+    def test_unsatisfiable_range_returns_416(self, populated_client):
+        """Test a range starting past the end returns 416."""
+        client, _ = populated_client
+
+        response = client.get(
+            "/filesystem/content",
+            params={"path": "/docs/a.txt"},
+            headers={"Range": "bytes=10-"},
+        )
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */10"
+
+    def test_range_across_chunks(self, client_with_engine):
+        """Test a range spanning chunk boundaries of a large file."""
+        client, _ = client_with_engine
+        data = random.Random(0).randbytes(300_000)
+        client.post(
+            "/filesystem/write",
+            json={"path": "/big.bin", "content": base64.b64encode(data).decode(), "encoding": "base64"},
+        )
+
+        response = client.get(
+            "/filesystem/content",
+            params={"path": "/big.bin"},
+            headers={"Range": "bytes=100000-199999"},
+        )
+
+        assert response.status_code == 206
+        assert response.content == data[100_000:200_000]
+        assert response.headers["content-type"] == "application/octet-stream"
+
+    def test_missing_file_returns_404(self, client_with_engine):
+        """Test downloading a missing file returns 404."""
+        client, _ = client_with_engine
+
+        response = client.get("/filesystem/content", params={"path": "/nope"})
+
+        assert response.status_code == 404
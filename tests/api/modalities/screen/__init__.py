@@ -0,0 +1 @@
+"""Integration tests for screen modality routes."""
@@ -0,0 +1,97 @@
+"""Integration tests for screen action endpoints."""
+
+LOGIN_FORM = {
+    "form": {"role": "form", "name": "Sign in"},
+    "username": {"role": "textbox", "name": "Username", "value": "", "parent_id": "form"},
+    "submit": {"role": "button", "name": "Sign in", "parent_id": "form"},
+}
+
+
+class TestPostScreenRender:
+    """Tests for POST /screen/render."""
+
+    def test_render(self, client_with_engine):
+        """Test rendering a screen."""
+        client, engine = client_with_engine
+
+        response = client.post(
+            "/screen/render", json={"app": "Browser", "window": "login", "elements": LOGIN_FORM}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["modality"] == "screen"
+        assert data["status"] == "executed"
+        state = engine.environment.get_state("screen")
+        assert state.current_app == "Browser"
+        assert state.ui_elements["username"].parent_id == "form"
+
+    def test_render_requires_app(self, client_with_engine):
+        """Test a render without app fails request validation."""
+        client, _ = client_with_engine
+
+        response = client.post("/screen/render", json={"elements": LOGIN_FORM})
+
+        assert response.status_code == 422
+
+
+class TestPostScreenInteract:
+    """Tests for POST /screen/interact and /screen/update."""
+
+    def test_type(self, client_with_engine):
+        """Test typing into a textbox replaces its value."""
+        client, engine = client_with_engine
+        client.post("/screen/render", json={"app": "Browser", "elements": LOGIN_FORM})
+
+        response = client.post(
+            "/screen/interact",
+            json={
+                "interaction_type": "type",
+                "target_element": "username",
+                "interaction_data": {"text": "alice"},
+                "elements": {"username": {**LOGIN_FORM["username"], "value": "alice"}},
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["message"] == "Applied type on username"
+        assert engine.environment.get_state("screen").ui_elements["username"].value == "alice"
+
+    def test_click_missing_element_rejected(self, client_with_engine):
+        """Test clicking an element not on screen returns 400 with the reason."""
+        client, _ = client_with_engine
+        client.post("/screen/render", json={"app": "Browser", "elements": LOGIN_FORM})
+
+        response = client.post(
+            "/screen/interact", json={"interaction_type": "click", "target_element": "logout"}
+        )
+
+        assert response.status_code == 400
+        assert "not on screen" in response.json()["detail"]
+
+    def test_click_without_target_rejected(self, client_with_engine):
+        """Test a click needs a target element."""
+        client, _ = client_with_engine
+
+        response = client.post("/screen/interact", json={"interaction_type": "click"})
+
+        assert response.status_code == 400
+        assert "target_element" in response.json()["detail"]
+
+    def test_render_is_not_an_interaction(self, client_with_engine):
+        """Test /interact only accepts user interactions."""
+        client, _ = client_with_engine
+
+        response = client.post("/screen/interact", json={"interaction_type": "render"})
+
+        assert response.status_code == 422
+
+    def test_update_removes_elements(self, client_with_engine):
+        """Test an update removes elements."""
+        client, engine = client_with_engine
+        client.post("/screen/render", json={"app": "Browser", "elements": LOGIN_FORM})
+
+        response = client.post("/screen/update", json={"removed": ["submit"]})
+
+        assert response.status_code == 200
+        assert "submit" not in engine.environment.get_state("screen").ui_elements
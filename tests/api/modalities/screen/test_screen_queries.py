@@ -0,0 +1,102 @@
+"""Integration tests for screen state and query endpoints."""
+
+from datetime import timedelta
+
+import pytest
+
+
+@pytest.fixture
+def typed_client(client_with_engine):
+    """Provide a client that rendered a search box and typed into it, a second apart."""
+    client, engine = client_with_engine
+    client.post(
+        "/screen/render",
+        json={
+            "app": "Browser",
+            "window": "search",
+            "elements": {
+                "box": {"role": "textbox", "value": ""},
+                "go": {"role": "button", "name": "Search"},
+            },
+        },
+    )
+    for text in ("c", "ca", "cat"):
+        client.post("/simulator/time/advance", json={"seconds": 1})
+        client.post(
+            "/screen/interact",
+            json={
+                "interaction_type": "type",
+                "target_element": "box",
+                "interaction_data": {"text": text[-1]},
+                "elements": {"box": {"role": "textbox", "value": text}},
+            },
+        )
+    return client, engine
+
+
+class TestGetScreenState:
+    """Tests for GET /screen/state."""
+
+    def test_empty_state(self, client_with_engine):
+        """Test the initial state shows an empty screen."""
+        client, _ = client_with_engine
+
+        response = client.get("/screen/state")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["modality_type"] == "screen"
+        assert data["current_app"] is None
+        assert data["ui_elements"] == {}
+        assert data["history_length"] == 0
+
+    def test_current_screen(self, typed_client):
+        """Test the state shows the current screen."""
+        client, _ = typed_client
+
+        data = client.get("/screen/state").json()
+
+        assert data["current_app"] == "Browser"
+        assert data["ui_elements"]["box"]["value"] == "cat"
+        assert data["history_length"] == 4
+
+
+class TestPostScreenQuery:
+    """Tests for POST /screen/query."""
+
+    def test_screen_at_earlier_time(self, typed_client):
+        """Test reading the screen as it was a second after rendering."""
+        client, engine = typed_client
+        at = engine.environment.time_state.current_time - timedelta(seconds=2)
+
+        data = client.post("/screen/query", json={"at": at.isoformat()}).json()
+
+        assert data["elements"]["box"]["value"] == "c"
+
+    def test_role_filter(self, typed_client):
+        """Test filtering elements by role."""
+        client, _ = typed_client
+
+        data = client.post("/screen/query", json={"role": "button"}).json()
+
+        assert list(data["elements"]) == ["go"]
+        assert data["count"] == 1
+
+    def test_history(self, typed_client):
+        """Test listing interactions newest first."""
+        client, _ = typed_client
+
+        data = client.post("/screen/query", json={"history": True, "limit": 2}).json()
+
+        assert [item["interaction_data"] for item in data["interactions"]] == [
+            {"text": "t"},
+            {"text": "a"},
+        ]
+
+    def test_missing_root_returns_400(self, typed_client):
+        """Test a root not on screen returns 400."""
+        client, _ = typed_client
+
+        response = client.post("/screen/query", json={"root": "missing"})
+
+        assert response.status_code == 400
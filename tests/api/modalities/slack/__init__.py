@@ -0,0 +1 @@
+"""Integration tests for Slack modality routes."""
@@ -0,0 +1,125 @@
+"""Integration tests for Slack action endpoints."""
+
+
+class TestPostSlackChannels:
+    """Tests for POST /slack/channels and /slack/users."""
+
+    def test_create_channel(self, client_with_engine):
+        """Test creating a channel in a workspace."""
+        client, engine = client_with_engine
+
+        response = client.post(
+            "/slack/channels",
+            json={"channel_id": "C1", "channel_name": "eng", "workspace_id": "T1"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["modality"] == "slack"
+        assert data["status"] == "executed"
+        channel = engine.environment.get_state("slack").channels["C1"]
+        assert channel.name == "eng"
+        assert channel.space_id == "T1"
+
+    def test_create_existing_channel_rejected(self, client_with_engine):
+        """Test creating a channel twice returns 400 with the reason."""
+        client, _ = client_with_engine
+        client.post("/slack/channels", json={"channel_id": "C1"})
+
+        response = client.post("/slack/channels", json={"channel_id": "C1"})
+
+        assert response.status_code == 400
+        assert "already exists" in response.json()["detail"]
+
+    def test_add_user(self, client_with_engine):
+        """Test adding a user."""
+        client, engine = client_with_engine
+
+        response = client.post("/slack/users", json={"user_id": "U1", "display_name": "Ann"})
+
+        assert response.status_code == 200
+        assert engine.environment.get_state("slack").users["U1"].display_name == "Ann"
+
+
+class TestPostSlackMessages:
+    """Tests for posting, editing, deleting and reacting to messages."""
+
+    def test_post_and_reply(self, client_with_engine):
+        """Test posting a message and a thread reply."""
+        client, engine = client_with_engine
+
+        client.post("/slack/post", json={"channel_id": "C1", "author": "U1", "text": "hi"})
+        response = client.post(
+            "/slack/post",
+            json={"channel_id": "C1", "author": "U2", "text": "yo", "thread_seq": 0},
+        )
+
+        assert response.status_code == 200
+        log = engine.environment.get_state("slack").channels["C1"].log
+        assert log.replies(0) == [1]
+
+    def test_post_missing_fields_rejected(self, client_with_engine):
+        """Test posts without text fail validation."""
+        client, _ = client_with_engine
+
+        response = client.post("/slack/post", json={"channel_id": "C1", "author": "U1"})
+
+        assert response.status_code == 422
+
+    def test_edit_delete_and_react(self, client_with_engine):
+        """Test editing, reacting to and deleting a message."""
+        client, engine = client_with_engine
+        client.post("/slack/post", json={"channel_id": "C1", "author": "U1", "text": "hi"})
+
+        edit = client.post(
+            "/slack/edit", json={"channel_id": "C1", "message_seq": 0, "text": "hello"}
+        )
+        react = client.post(
+            "/slack/react",
+            json={"channel_id": "C1", "message_seq": 0, "emoji": "wave", "user_id": "U2"},
+        )
+        log = engine.environment.get_state("slack").channels["C1"].log
+        assert edit.status_code == react.status_code == 200
+        assert log.text(0) == "hello"
+        assert log.reactions(0) == {"wave": ["U2"]}
+
+        unreact = client.post(
+            "/slack/unreact",
+            json={"channel_id": "C1", "message_seq": 0, "emoji": "wave", "user_id": "U2"},
+        )
+        delete = client.post("/slack/delete", json={"channel_id": "C1", "message_seq": 0})
+        assert unreact.status_code == delete.status_code == 200
+        assert log.reactions(0) == {}
+        assert log.is_deleted(0)
+
+    def test_missing_message_rejected(self, client_with_engine):
+        """Test actions on a missing message return 400."""
+        client, _ = client_with_engine
+        client.post("/slack/post", json={"channel_id": "C1", "author": "U1", "text": "hi"})
+
+        response = client.post("/slack/delete", json={"channel_id": "C1", "message_seq": 7})
+
+        assert response.status_code == 400
+        assert "not found" in response.json()["detail"]
+
+    def test_mark_read(self, client_with_engine):
+        """Test marking a channel read."""
+        client, engine = client_with_engine
+        for text in ("a", "b", "c"):
+            client.post("/slack/post", json={"channel_id": "C1", "author": "U1", "text": text})
+
+        response = client.post("/slack/read", json={"channel_id": "C1", "message_seq": 1})
+
+        assert response.status_code == 200
+        assert engine.environment.get_state("slack").channels["C1"].last_read_seq == 1
+
+    def test_action_can_be_undone(self, client_with_engine):
+        """Test Slack actions are undoable through the simulator."""
+        client, engine = client_with_engine
+        client.post("/slack/post", json={"channel_id": "C1", "author": "U1", "text": "hi"})
+        client.post("/slack/post", json={"channel_id": "C1", "author": "U2", "text": "yo"})
+
+        response = client.post("/simulation/undo", json={"count": 1})
+
+        assert response.status_code == 200
+        assert len(engine.environment.get_state("slack").channels["C1"].log) == 1
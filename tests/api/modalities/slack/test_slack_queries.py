@@ -0,0 +1,110 @@
+"""Integration tests for Slack state and query endpoints."""
+
+import pytest
+
+
+@pytest.fixture
+def populated_client(client_with_engine):
+    """Provide a client whose Slack state holds two channels and a thread."""
+    client, engine = client_with_engine
+    for seq in range(12):
+        client.post(
+            "/slack/post",
+            json={"channel_id": "general", "author": f"U{seq % 2}", "text": f"message {seq}"},
+        )
+    client.post(
+        "/slack/post",
+        json={"channel_id": "general", "author": "U2", "text": "<@user> see", "thread_seq": 4},
+    )
+    client.post("/slack/post", json={"channel_id": "random", "author": "U3", "text": "hi @user"})
+    return client, engine
+
+
+class TestGetSlackState:
+    """Tests for GET /slack/state."""
+
+    def test_empty_state(self, client_with_engine):
+        """Test the initial state has no channels."""
+        client, _ = client_with_engine
+
+        response = client.get("/slack/state")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["modality_type"] == "slack"
+        assert data["channel_count"] == 0
+        assert data["channels"] == []
+
+    def test_unread_counts(self, populated_client):
+        """Test the state reports unread messages and mentions."""
+        client, _ = populated_client
+
+        data = client.get("/slack/state").json()
+
+        assert data["channel_count"] == 2
+        assert data["message_count"] == 14
+        assert data["unread_count"] == 14
+        assert data["unread_mention_count"] == 2
+        assert "workspace_id" in data["channels"][0]
+
+
+class TestPostSlackQuery:
+    """Tests for POST /slack/query."""
+
+    def test_list_channels(self, populated_client):
+        """Test listing channels."""
+        client, _ = populated_client
+
+        data = client.post("/slack/query", json={}).json()
+
+        assert data["count"] == 2
+        assert {channel["channel_id"] for channel in data["channels"]} == {"general", "random"}
+
+    def test_history_pages(self, populated_client):
+        """Test paging through a channel's history with cursors."""
+        client, _ = populated_client
+
+        first = client.post("/slack/query", json={"channel_id": "general", "limit": 5}).json()
+        second = client.post(
+            "/slack/query",
+            json={"channel_id": "general", "limit": 5, "cursor": first["next_cursor"]},
+        ).json()
+
+        assert [m["seq"] for m in first["messages"]] == [11, 10, 9, 8, 7]
+        assert [m["seq"] for m in second["messages"]] == [6, 5, 4, 3, 2]
+        assert second["messages"][2]["reply_count"] == 1
+
+    def test_thread(self, populated_client):
+        """Test reading a thread."""
+        client, _ = populated_client
+
+        data = client.post("/slack/query", json={"channel_id": "general", "thread_seq": 4}).json()
+
+        assert [m["seq"] for m in data["messages"]] == [4, 12]
+
+    def test_mentions(self, populated_client):
+        """Test finding mentions across channels."""
+        client, _ = populated_client
+
+        data = client.post("/slack/query", json={"mentions_of": "user"}).json()
+
+        assert [(m["channel_id"], m["seq"]) for m in data["messages"]] == [
+            ("random", 0),
+            ("general", 12),
+        ]
+
+    def test_missing_channel_returns_400(self, client_with_engine):
+        """Test querying an unknown channel returns 400."""
+        client, _ = client_with_engine
+
+        response = client.post("/slack/query", json={"channel_id": "nope"})
+
+        assert response.status_code == 400
+
+    def test_invalid_limit_returns_422(self, client_with_engine):
+        """Test limits outside 1-1000 fail validation."""
+        client, _ = client_with_engine
+
+        response = client.post("/slack/query", json={"limit": 0})
+
+        assert response.status_code == 422
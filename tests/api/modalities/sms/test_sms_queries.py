@@ -1,5 +1,6 @@
 """Integration tests for POST /sms/query endpoint."""
 
+import json
 from datetime import timedelta
 
 
@@ -427,3 +428,110 @@ class TestPostSMSQuery:
         assert data["returned_count"] == 0
         assert data["messages"] == []
 
+
+
+class TestPostSMSQueryNdjson:
+    """Tests for the NDJSON variant of POST /sms/query."""
+
+    def test_ndjson_streams_same_messages_as_json(self, client_with_engine):
+        """Test that NDJSON output contains one line per matching message."""
+        client, engine = client_with_engine
+
+        for i in range(3):
+            client.post(
+                "/sms/receive",
+                json={
+                    "from_number": "+15551234567",
+                    "to_numbers": ["+15559876543"],
+                    "body": f"Message {i}",
+                },
+            )
+
+        response = client.post(
+            "/sms/query", json={}, headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == client.post("/sms/query", json={}).json()["messages"]
+        assert len(lines) == 3
+
+
+class TestPostSMSQueryProjection:
+    """Tests for the fields projection of POST /sms/query."""
+
+    def test_fields_limits_returned_keys(self, client_with_engine):
+        """Test that only the requested fields are returned for each message."""
+        client, engine = client_with_engine
+
+        client.post(
+            "/sms/receive",
+            json={
+                "from_number": "+15551234567",
+                "to_numbers": ["+15559876543"],
+                "body": "Hello",
+            },
+        )
+
+        response = client.post("/sms/query", json={"fields": ["message_id", "body"]})
+
+        assert response.status_code == 200
+        messages = response.json()["messages"]
+        assert len(messages) == 1
+        assert set(messages[0]) == {"message_id", "body"}
+        assert messages[0]["body"] == "Hello"
+
+    def test_unknown_field_returns_400(self, client_with_engine):
+        """Test that unknown field names are rejected."""
+        client, engine = client_with_engine
+
+        response = client.post("/sms/query", json={"fields": ["subject"]})
+
+        assert response.status_code == 400
+        assert "subject" in response.json()["detail"]
+
+
+class TestPostSMSQueryCursor:
+    """Tests for cursor pagination of POST /sms/query."""
+
+    def test_cursor_walk_matches_offset_results(self, client_with_engine):
+        """Test that walking with cursors returns the same messages as one big query."""
+        client, engine = client_with_engine
+
+        for i in range(5):
+            client.post(
+                "/sms/receive",
+                json={
+                    "from_number": f"+1555123456{i % 2}",
+                    "to_numbers": ["+15559876543"],
+                    "body": f"Message {i}",
+                },
+            )
+
+        query = {"sort_by": "from_number", "sort_order": "desc"}
+        expected = [
+            message["message_id"]
+            for message in client.post("/sms/query", json=query).json()["messages"]
+        ]
+
+        ids = []
+        cursor = None
+        while True:
+            data = client.post(
+                "/sms/query", json={**query, "limit": 2, "cursor": cursor}
+            ).json()
+            ids.extend(message["message_id"] for message in data["messages"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert ids == expected
+
+    def test_invalid_cursor_returns_400(self, client_with_engine):
+        """Test that a malformed cursor is rejected."""
+        client, engine = client_with_engine
+
+        response = client.post("/sms/query", json={"cursor": "garbage"})
+
+        assert response.status_code == 400
@@ -0,0 +1 @@
+"""Integration tests for social media modality routes."""
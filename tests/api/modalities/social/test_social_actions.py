@@ -0,0 +1,152 @@
+"""Integration tests for social media action endpoints."""
+
+
+class TestPostSocialPosts:
+    """Tests for POST /social/post, /reply and /repost."""
+
+    def test_create_post(self, client_with_engine):
+        """Test creating a post with a chosen ID."""
+        client, engine = client_with_engine
+
+        response = client.post(
+            "/social/post", json={"user_id": "alice", "content": "hi", "post_id": "p1"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["modality"] == "social"
+        assert data["status"] == "executed"
+        assert "p1" in data["message"]
+        assert engine.environment.get_state("social").posts["p1"].author == "alice"
+
+    def test_create_post_generates_id(self, client_with_engine):
+        """Test the generated post ID is reported in the message."""
+        client, engine = client_with_engine
+
+        response = client.post("/social/post", json={"user_id": "alice", "content": "hi"})
+
+        assert response.status_code == 200
+        post_id = response.json()["message"].rsplit(" ", 1)[-1]
+        assert post_id in engine.environment.get_state("social").posts
+
+    def test_reply_and_repost(self, client_with_engine):
+        """Test replying to and reposting a post updates its counts."""
+        client, engine = client_with_engine
+        client.post("/social/post", json={"user_id": "alice", "content": "hi", "post_id": "p1"})
+
+        reply = client.post(
+            "/social/reply",
+            json={"user_id": "bob", "reply_to": "p1", "content": "hey", "post_id": "r1"},
+        )
+        repost = client.post("/social/repost", json={"user_id": "carol", "repost_of": "p1"})
+
+        assert reply.status_code == 200
+        assert repost.status_code == 200
+        post = engine.environment.get_state("social").posts["p1"]
+        assert post.reply_count == 1
+        assert post.repost_count == 1
+
+    def test_reply_to_missing_post_rejected(self, client_with_engine):
+        """Test replying to a missing post returns 400 with the reason."""
+        client, _ = client_with_engine
+
+        response = client.post(
+            "/social/reply", json={"user_id": "bob", "reply_to": "nope", "content": "hey"}
+        )
+
+        assert response.status_code == 400
+        assert "not found" in response.json()["detail"]
+
+    def test_empty_post_rejected(self, client_with_engine):
+        """Test a post without content returns 400."""
+        client, _ = client_with_engine
+
+        response = client.post("/social/post", json={"user_id": "alice", "content": ""})
+
+        assert response.status_code == 400
+        assert "requires content" in response.json()["detail"]
+
+    def test_missing_field_returns_422(self, client_with_engine):
+        """Test a request without user_id fails request validation."""
+        client, _ = client_with_engine
+
+        response = client.post("/social/post", json={"content": "hi"})
+
+        assert response.status_code == 422
+
+
+class TestPostSocialEngagement:
+    """Tests for POST /social/like, /unlike and /delete."""
+
+    def test_like_and_unlike(self, client_with_engine):
+        """Test liking and unliking a post."""
+        client, engine = client_with_engine
+        client.post("/social/post", json={"user_id": "alice", "content": "hi", "post_id": "p1"})
+
+        liked = client.post("/social/like", json={"user_id": "user", "post_id": "p1"})
+        assert liked.status_code == 200
+        assert engine.environment.get_state("social").posts["p1"].liked_by == {"user"}
+
+        unliked = client.post("/social/unlike", json={"user_id": "user", "post_id": "p1"})
+        assert unliked.status_code == 200
+        assert engine.environment.get_state("social").posts["p1"].liked_by == set()
+
+    def test_double_like_rejected(self, client_with_engine):
+        """Test liking a post twice returns 400."""
+        client, _ = client_with_engine
+        client.post("/social/post", json={"user_id": "alice", "content": "hi", "post_id": "p1"})
+        client.post("/social/like", json={"user_id": "user", "post_id": "p1"})
+
+        response = client.post("/social/like", json={"user_id": "user", "post_id": "p1"})
+
+        assert response.status_code == 400
+        assert "already likes" in response.json()["detail"]
+
+    def test_delete_own_post(self, client_with_engine):
+        """Test authors can delete their posts."""
+        client, engine = client_with_engine
+        client.post("/social/post", json={"user_id": "alice", "content": "hi", "post_id": "p1"})
+
+        response = client.post("/social/delete", json={"user_id": "alice", "post_id": "p1"})
+
+        assert response.status_code == 200
+        assert "p1" not in engine.environment.get_state("social").posts
+
+    def test_delete_other_users_post_rejected(self, client_with_engine):
+        """Test deleting another user's post returns 400."""
+        client, _ = client_with_engine
+        client.post("/social/post", json={"user_id": "alice", "content": "hi", "post_id": "p1"})
+
+        response = client.post("/social/delete", json={"user_id": "bob", "post_id": "p1"})
+
+        assert response.status_code == 400
+        assert "cannot delete" in response.json()["detail"]
+
+
+class TestPostSocialFollows:
+    """Tests for POST /social/follow and /unfollow."""
+
+    def test_follow_and_unfollow(self, client_with_engine):
+        """Test following and unfollowing a user."""
+        client, engine = client_with_engine
+
+        followed = client.post(
+            "/social/follow", json={"user_id": "user", "target_user_id": "alice"}
+        )
+        assert followed.status_code == 200
+        assert engine.environment.get_state("social").following == {"user": {"alice"}}
+
+        unfollowed = client.post(
+            "/social/unfollow", json={"user_id": "user", "target_user_id": "alice"}
+        )
+        assert unfollowed.status_code == 200
+        assert engine.environment.get_state("social").following == {}
+
+    def test_follow_self_rejected(self, client_with_engine):
+        """Test following yourself returns 400."""
+        client, _ = client_with_engine
+
+        response = client.post("/social/follow", json={"user_id": "user", "target_user_id": "user"})
+
+        assert response.status_code == 400
+        assert "themselves" in response.json()["detail"]
@@ -0,0 +1,109 @@
+"""Integration tests for social media state and query endpoints."""
+
+import pytest
+
+
+@pytest.fixture
+def populated_client(client_with_engine):
+    """Provide a client where the simulated user follows alice, who posted 25 times."""
+    client, engine = client_with_engine
+    client.post("/social/follow", json={"user_id": "user", "target_user_id": "alice"})
+    for number in range(25):
+        client.post(
+            "/social/post",
+            json={"user_id": "alice", "content": f"post {number}", "post_id": f"a{number:02d}"},
+        )
+    client.post("/social/post", json={"user_id": "bob", "content": "unfollowed", "post_id": "b1"})
+    return client, engine
+
+
+class TestGetSocialState:
+    """Tests for GET /social/state."""
+
+    def test_empty_state(self, client_with_engine):
+        """Test the initial state has no posts."""
+        client, _ = client_with_engine
+
+        response = client.get("/social/state")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["modality_type"] == "social"
+        assert data["post_count"] == 0
+        assert data["feed"] == []
+        assert data["next_cursor"] is None
+
+    def test_first_feed_page(self, populated_client):
+        """Test the state includes the first feed page and a cursor."""
+        client, _ = populated_client
+
+        data = client.get("/social/state").json()
+
+        assert data["post_count"] == 26
+        assert data["following"] == ["alice"]
+        assert len(data["feed"]) == 20
+        assert data["next_cursor"] is not None
+
+
+class TestPostSocialQuery:
+    """Tests for POST /social/query."""
+
+    def test_feed_pages(self, populated_client):
+        """Test paging through the feed with next_cursor."""
+        client, _ = populated_client
+
+        first = client.post("/social/query", json={"limit": 10}).json()
+        second = client.post(
+            "/social/query", json={"limit": 20, "cursor": first["next_cursor"]}
+        ).json()
+
+        # Every post has the same simulator time and score, so ties break by ID
+        post_ids = [post["post_id"] for post in first["posts"] + second["posts"]]
+        assert post_ids == [f"a{number:02d}" for number in range(25)]
+        assert second["next_cursor"] is None
+
+    def test_like_reorders_feed(self, populated_client):
+        """Test a liked post moves to the top of the feed."""
+        client, _ = populated_client
+        client.post("/social/like", json={"user_id": "bob", "post_id": "a20"})
+
+        data = client.post("/social/query", json={"limit": 1}).json()
+
+        assert data["posts"][0]["post_id"] == "a20"
+        assert data["posts"][0]["like_count"] == 1
+
+    def test_author_and_replies(self, populated_client):
+        """Test listing a user's posts and a post's replies."""
+        client, _ = populated_client
+        client.post(
+            "/social/reply", json={"user_id": "bob", "reply_to": "a00", "content": "re"}
+        )
+
+        authored = client.post("/social/query", json={"author": "bob"}).json()
+        replies = client.post("/social/query", json={"replies_to": "a00"}).json()
+
+        assert [post["post_id"] for post in authored["posts"]] == ["b1"]
+        assert replies["count"] == 1
+
+    def test_followers(self, populated_client):
+        """Test listing followers."""
+        client, _ = populated_client
+
+        data = client.post("/social/query", json={"followers_of": "alice"}).json()
+
+        assert data["users"] == ["user"]
+
+    def test_invalid_cursor_returns_400(self, populated_client):
+        """Test a malformed cursor returns 400."""
+        client, _ = populated_client
+
+        response = client.post("/social/query", json={"cursor": "nonsense"})
+
+        assert response.status_code == 400
+
+    def test_limit_bounds(self, client_with_engine):
+        """Test limits outside 1-500 fail request validation."""
+        client, _ = client_with_engine
+
+        assert client.post("/social/query", json={"limit": 0}).status_code == 422
+        assert client.post("/social/query", json={"limit": 501}).status_code == 422
@@ -3,6 +3,8 @@
 import os
 import time
 
+import pytest
+
 
 class TestPostWeatherQuery:
     """Tests for POST /weather/query endpoint."""
@@ -705,6 +707,54 @@ class TestPostWeatherQuery:
             f"should differ due to unit conversion"
         )
 
+    def test_query_real_weather_from_standin(self, client_with_engine, openweather_standin):
+        """Test real weather queries against the local OpenWeather stand-in.
+
+        Repeated queries for a location are answered from the weather
+        provider's cache, while each one is still stored in the state.
+        """
+        client, engine = client_with_engine
+        app, provider = openweather_standin
+        engine.environment.get_state("weather").openweather_api_key = "test_key"
+
+        responses = [
+            client.post(
+                "/weather/query",
+                json={"lat": 40.7128, "lon": -74.0060, "real": True, "units": units},
+            )
+            for units in ("standard", "metric")
+        ]
+
+        assert [response.status_code for response in responses] == [200, 200]
+        standard, metric = (response.json()["reports"][0] for response in responses)
+        assert metric["current"]["temp"] == pytest.approx(standard["current"]["temp"] - 273.15)
+        assert app.state.requests == 1
+
+        state = client.get("/weather/state").json()
+        assert state["location_count"] == 1
+
+    def test_query_real_weather_fetches_once_without_cache(
+        self, client_with_engine, openweather_standin
+    ):
+        """Test that the prefetched report is used even when nothing is cached.
+
+        With the provider's cache disabled, the query under the engine lock
+        must record the report fetched beforehand rather than fetch again.
+        """
+        client, engine = client_with_engine
+        app, provider = openweather_standin
+        provider.cache_ttl = 0
+        engine.environment.get_state("weather").openweather_api_key = "test_key"
+
+        response = client.post(
+            "/weather/query", json={"lat": 40.7128, "lon": -74.0060, "real": True}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 1
+        assert app.state.requests == 1
+        assert client.get("/weather/state").json()["location_count"] == 1
+
     def test_query_nearby_coordinates_uses_same_location_key(self, client_with_engine):
         """Test that nearby coordinates within rounding precision map to the same location.
         
@@ -28,7 +28,7 @@ from api.models import ErrorResponse
 # Helper to run async functions synchronously
 def run_async(coro):
     """Run an async coroutine synchronously."""
-    return asyncio.get_event_loop().run_until_complete(coro)
+    return asyncio.run(coro)
 
 
 # =============================================================================
@@ -0,0 +1,143 @@
+"""Unit tests for the engine worker pool in api/executor.py."""
+
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import api.executor as executor
+from api.exceptions import EngineTimeoutError, engine_timeout_handler
+from api.executor import (
+    engine_calls_inline,
+    get_engine_executor,
+    initialize_engine_executor,
+    run_in_engine,
+    shutdown_engine_executor,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_engine_executor():
+    """Start and end every test without a configured pool."""
+    shutdown_engine_executor()
+    yield
+    shutdown_engine_executor()
+
+
+class TestConfiguration:
+    """Tests for pool creation and environment configuration."""
+
+    def test_pool_is_created_lazily_from_environment(self, monkeypatch):
+        """Test that the first use reads UES_ENGINE_WORKERS and UES_ENGINE_TIMEOUT."""
+        monkeypatch.setenv("UES_ENGINE_WORKERS", "2")
+        monkeypatch.setenv("UES_ENGINE_TIMEOUT", "5")
+
+        pool = get_engine_executor()
+
+        assert pool._max_workers == 2
+        assert executor._engine_timeout == 5
+        assert get_engine_executor() is pool
+
+    def test_zero_workers_runs_inline(self):
+        """Test that max_workers=0 disables the pool."""
+        assert initialize_engine_executor(max_workers=0) is None
+        assert get_engine_executor() is None
+
+    def test_zero_timeout_disables_timeout(self):
+        """Test that timeout=0 waits indefinitely."""
+        initialize_engine_executor(max_workers=1, timeout=0)
+
+        assert executor._engine_timeout is None
+
+    @pytest.mark.parametrize("value", ["many", "-1"])
+    def test_invalid_environment_is_rejected(self, monkeypatch, value):
+        """Test that malformed settings fail loudly."""
+        monkeypatch.setenv("UES_ENGINE_WORKERS", value)
+
+        with pytest.raises(ValueError, match="UES_ENGINE_WORKERS"):
+            initialize_engine_executor()
+
+
+class TestRunInEngine:
+    """Tests for run_in_engine."""
+
+    async def test_runs_on_worker_thread(self):
+        """Test that work runs on a pool thread, not the event loop thread."""
+        initialize_engine_executor(max_workers=1)
+
+        name = await run_in_engine(lambda: threading.current_thread().name)
+
+        assert name.startswith("ues-engine")
+
+    async def test_runs_inline_without_pool(self):
+        """Test that work runs on the calling thread when the pool is disabled."""
+        initialize_engine_executor(max_workers=0)
+
+        thread = await run_in_engine(threading.current_thread)
+
+        assert thread is threading.current_thread()
+
+    async def test_passes_arguments_and_holds_lock(self):
+        """Test that arguments are forwarded and the lock is held during the call."""
+        initialize_engine_executor(max_workers=1)
+        lock = threading.Lock()
+
+        def work(a, b=0):
+            return a + b, lock.locked()
+
+        assert await run_in_engine(work, 1, b=2, lock=lock) == (3, True)
+        assert not lock.locked()
+
+    async def test_nested_calls_run_inline_on_worker(self):
+        """Test that engine_calls_inline() keeps nested calls on the worker thread."""
+        initialize_engine_executor(max_workers=1)
+
+        def outer():
+            with engine_calls_inline():
+                nested = run_in_engine(threading.current_thread)
+                try:
+                    nested.send(None)
+                except StopIteration as done:
+                    return threading.current_thread(), done.value
+
+        outer_thread, nested_thread = await run_in_engine(outer)
+
+        assert nested_thread is outer_thread
+        assert nested_thread is not threading.current_thread()
+
+    async def test_timeout_raises_engine_timeout_error(self):
+        """Test that slow work fails the request after the timeout."""
+        initialize_engine_executor(max_workers=1, timeout=0.05)
+        release = threading.Event()
+
+        def slow():
+            release.wait(5)
+
+        try:
+            with pytest.raises(EngineTimeoutError) as exc_info:
+                await run_in_engine(slow)
+        finally:
+            release.set()
+
+        assert exc_info.value.operation == "slow"
+        assert exc_info.value.timeout == 0.05
+
+    def test_timeout_is_returned_as_504(self):
+        """Test that the exception handler turns a timeout into 504 Gateway Timeout."""
+        initialize_engine_executor(max_workers=1, timeout=0.05)
+        release = threading.Event()
+        app = FastAPI()
+        app.add_exception_handler(EngineTimeoutError, engine_timeout_handler)
+
+        @app.get("/slow")
+        async def slow_endpoint():
+            return await run_in_engine(release.wait, 5)
+
+        try:
+            response = TestClient(app).get("/slow")
+        finally:
+            release.set()
+
+        assert response.status_code == 504
+        assert response.json()["operation"] == "wait"
@@ -0,0 +1,139 @@
+"""Unit tests for the request metrics middleware in api/middleware.py."""
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import api.middleware as middleware
+from api.executor import initialize_engine_executor, run_in_engine, shutdown_engine_executor
+from api.middleware import (
+    HTTP_REQUEST_SECONDS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    RequestMetricsMiddleware,
+    SlowRequest,
+    SlowRequestLog,
+    get_slow_request_log,
+)
+from api.wire_format import MessagePackRoute
+from models.metrics import REGISTRY
+
+
+@pytest.fixture(autouse=True)
+def reset_request_metrics():
+    """Start every test with empty metrics and a fresh slow-request log."""
+    REGISTRY.clear()
+    middleware._slow_request_log = None
+    yield
+    REGISTRY.clear()
+    middleware._slow_request_log = None
+    shutdown_engine_executor()
+
+
+def _create_app(sample_rate: float = 1.0) -> FastAPI:
+    """Create an app with the middleware and a few instrumented routes."""
+    app = FastAPI()
+    app.router.route_class = MessagePackRoute
+    app.add_middleware(RequestMetricsMiddleware, sample_rate=sample_rate)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    @app.post("/work")
+    async def work():
+        return await run_in_engine(time.sleep, 0.02)
+
+    return app
+
+
+def _slow_request(duration: float) -> SlowRequest:
+    """Create a slow-request entry with the given duration."""
+    return SlowRequest(
+        method="GET",
+        path="/",
+        route="/",
+        query_params={},
+        status_code=200,
+        duration_seconds=duration,
+        engine_seconds=0.0,
+        serialization_seconds=None,
+        request_bytes=0,
+        response_bytes=0,
+        started_at=datetime.now(timezone.utc),
+    )
+
+
+class TestSlowRequestLog:
+    """Tests for keeping the N slowest requests."""
+
+    def test_keeps_slowest_requests_in_order(self):
+        """Test that only the slowest entries are kept, slowest first."""
+        log = SlowRequestLog(capacity=3)
+        for duration in (0.5, 0.1, 0.9, 0.3, 0.7):
+            log.record(_slow_request(duration))
+
+        assert [e.duration_seconds for e in log.entries()] == [0.9, 0.7, 0.5]
+        assert not log.would_keep(0.4)
+
+    def test_zero_capacity_keeps_nothing(self):
+        """Test that a log with capacity 0 never records."""
+        log = SlowRequestLog(capacity=0)
+        log.record(_slow_request(1.0))
+
+        assert log.entries() == []
+
+    def test_capacity_is_read_from_environment(self, monkeypatch):
+        """Test that UES_SLOW_REQUEST_COUNT sets the capacity."""
+        monkeypatch.setenv("UES_SLOW_REQUEST_COUNT", "7")
+
+        assert get_slow_request_log().capacity == 7
+
+
+class TestRequestMetricsMiddleware:
+    """Tests for recording requests."""
+
+    def test_records_latency_by_route_template(self):
+        """Test that requests are labelled by route template, not raw path."""
+        client = TestClient(_create_app())
+
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/missing")
+
+        assert HTTP_REQUEST_SECONDS.labels("GET", "/items/{item_id}", "200").count == 2
+        assert HTTP_REQUEST_SECONDS.labels("GET", "<unmatched>", "404").count == 1
+        assert HTTP_REQUESTS_IN_FLIGHT.labels().value == 0
+
+    def test_slow_request_log_splits_engine_and_serialization_time(self):
+        """Test that slow-request entries carry query params and a time breakdown."""
+        initialize_engine_executor(max_workers=1)
+        client = TestClient(_create_app())
+
+        client.post("/work?reason=test", content=b"{}")
+
+        [entry] = get_slow_request_log().entries()
+        assert entry.route == "/work"
+        assert entry.query_params == {"reason": "test"}
+        assert entry.request_bytes == 2
+        assert entry.engine_seconds >= 0.02
+        assert entry.serialization_seconds is not None
+        assert entry.duration_seconds >= entry.engine_seconds
+
+    def test_unsampled_requests_are_not_recorded(self):
+        """Test that sample_rate=0 skips metrics and the slow-request log."""
+        client = TestClient(_create_app(sample_rate=0.0))
+
+        assert client.get("/items/1").status_code == 200
+
+        assert HTTP_REQUEST_SECONDS.labels("GET", "/items/{item_id}", "200").count == 0
+        assert get_slow_request_log().entries() == []
+
+    def test_invalid_sample_rate_is_rejected(self, monkeypatch):
+        """Test that a sample rate outside 0..1 fails loudly."""
+        monkeypatch.setenv("UES_REQUEST_SAMPLE_RATE", "2")
+
+        with pytest.raises(ValueError, match="UES_REQUEST_SAMPLE_RATE"):
+            RequestMetricsMiddleware(FastAPI())
@@ -0,0 +1,102 @@
+"""Unit tests for the sampling profiler in api/profiler.py."""
+
+import sys
+import threading
+from collections import Counter
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.profiler as profiler
+from api.profiler import StackSampler, collapse_stack, format_collapsed, profiler_enabled
+from main import app
+from models.concurrency import ReadWriteLock
+from models.simulation import SIMULATION_LOOP_THREAD_NAME
+
+
+@pytest.fixture
+def blocked_writer():
+    """Run a thread named like the simulation loop, blocked in ReadWriteLock."""
+    lock = ReadWriteLock()
+    lock.acquire_read()
+    thread = threading.Thread(
+        target=lock.acquire_write, name=SIMULATION_LOOP_THREAD_NAME, daemon=True
+    )
+    thread.start()
+    while not lock._writers_waiting:
+        pass
+    yield thread
+    lock.release_read()
+    thread.join(timeout=5)
+
+
+class TestCollapsing:
+    """Tests for reducing stacks to collapsed-stack lines."""
+
+    def test_keeps_project_frames_and_names_library_leaf(self, blocked_writer):
+        """Test that UES frames are kept and library time gets a [package] frame."""
+        frame = sys._current_frames()[blocked_writer.ident]
+
+        stack = collapse_stack("simulation-loop", frame)
+
+        assert stack == (
+            "simulation-loop;models.concurrency:ReadWriteLock.acquire_write;[threading]"
+        )
+
+    def test_format_orders_by_count(self):
+        """Test that the most frequent stacks come first."""
+        text = format_collapsed(Counter({"a;b": 1, "a;c": 3}))
+
+        assert text == "a;c 3\na;b 1\n"
+
+
+class TestStackSampler:
+    """Tests for sampling threads."""
+
+    def test_samples_labelled_threads_only(self, blocked_writer):
+        """Test that UES threads are sampled and other threads are ignored."""
+        sampler = StackSampler(event_loop_thread=-1, interval=0.001)
+
+        counts = sampler.run(0.05)
+
+        assert sampler.samples > 0
+        assert set(counts) == {
+            "simulation-loop;models.concurrency:ReadWriteLock.acquire_write;[threading]"
+        }
+        assert sum(counts.values()) == sampler.samples
+
+
+class TestProfileEndpoint:
+    """Tests for POST /debug/profile."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test that the profiler refuses to run unless enabled."""
+        monkeypatch.delenv("UES_ENABLE_PROFILER", raising=False)
+
+        response = TestClient(app).post("/debug/profile", params={"seconds": 0.01})
+
+        assert not profiler_enabled()
+        assert response.status_code == 403
+
+    def test_returns_collapsed_stacks(self, monkeypatch):
+        """Test that an enabled profile returns event-loop stacks as text."""
+        monkeypatch.setenv("UES_ENABLE_PROFILER", "1")
+
+        response = TestClient(app).post(
+            "/debug/profile", params={"seconds": 0.05, "interval": 0.005}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        lines = response.text.splitlines()
+        assert any(line.startswith("event-loop;") for line in lines)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    def test_one_profile_at_a_time(self, monkeypatch):
+        """Test that a second profile is rejected while one is running."""
+        monkeypatch.setenv("UES_ENABLE_PROFILER", "1")
+
+        with profiler._profile_lock:
+            response = TestClient(app).post("/debug/profile", params={"seconds": 0.01})
+
+        assert response.status_code == 409
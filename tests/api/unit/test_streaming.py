@@ -0,0 +1,165 @@
+"""Unit tests for the streaming JSON/NDJSON encoders in api/streaming.py."""
+
+import json
+from datetime import datetime, timezone
+
+from pydantic import BaseModel
+
+from api.streaming import (
+    JSONObjectStream,
+    LockedRows,
+    accepts_ndjson,
+    iter_json,
+    iter_ndjson,
+    locked_mapping_items,
+    locked_model_fields,
+)
+from models.concurrency import ReadWriteLock
+from models.modalities.screen_input import ScreenInput
+from models.modalities.screen_state import ScreenState
+
+
+class Item(BaseModel):
+    """Small model used to exercise leaf serialization."""
+
+    name: str
+    created_at: datetime
+
+
+class Container(BaseModel):
+    """Model with a mapping field to exercise lazy field walking."""
+
+    label: str
+    items: dict[str, Item]
+
+
+async def _collect(chunks) -> list:
+    """Consume an async iterator into a list."""
+    return [chunk async for chunk in chunks]
+
+
+async def _body(chunks) -> bytes:
+    """Join streamed chunks into a single body."""
+    return b"".join(await _collect(chunks))
+
+
+async def _decode(chunks) -> object:
+    """Join streamed chunks and parse them as a single JSON document."""
+    return json.loads(await _body(chunks))
+
+
+class TestIterJson:
+    """Tests for iter_json."""
+
+    async def test_matches_json_dumps_for_plain_values(self):
+        """Test that nested dicts and lists round-trip unchanged."""
+        value = {"a": [1, 2, {"b": None}], "c": "text", "d": True, "e": {}}
+        assert await _decode(iter_json(value)) == value
+
+    async def test_models_serialize_like_model_dump_json(self):
+        """Test that Pydantic models are encoded with their own serializer."""
+        item = Item(name="x", created_at=datetime(2025, 1, 1, tzinfo=timezone.utc))
+        assert await _decode(iter_json({"item": item})) == {
+            "item": json.loads(item.model_dump_json())
+        }
+
+    async def test_object_stream_and_generators_are_consumed_lazily(self):
+        """Test that JSONObjectStream and generators encode as object and array."""
+        value = {
+            "obj": JSONObjectStream((str(i), i) for i in range(3)),
+            "arr": (i * i for i in range(3)),
+        }
+        assert await _decode(iter_json(value)) == {
+            "obj": {"0": 0, "1": 1, "2": 2},
+            "arr": [0, 1, 4],
+        }
+
+    async def test_output_is_chunked(self):
+        """Test that output is split into chunks near the requested size."""
+        value = [str(i) * 10 for i in range(1000)]
+        chunks = await _collect(iter_json(value, chunk_size=256))
+        assert len(chunks) > 1
+        assert all(len(chunk) < 256 * 2 for chunk in chunks)
+        assert json.loads(b"".join(chunks)) == value
+
+
+class TestIterNdjson:
+    """Tests for iter_ndjson."""
+
+    async def test_one_document_per_line(self):
+        """Test that each item is encoded on its own line."""
+        body = await _body(iter_ndjson([{"a": 1}, {"b": 2}]))
+        lines = body.decode().splitlines()
+        assert [json.loads(line) for line in lines] == [{"a": 1}, {"b": 2}]
+        assert body.endswith(b"\n")
+
+    async def test_empty_input_produces_empty_body(self):
+        """Test that no items produce no output."""
+        assert await _body(iter_ndjson([])) == b""
+
+
+class TestLockedRows:
+    """Tests for LockedRows and locked_mapping_items."""
+
+    async def test_builds_each_batch_under_the_lock(self):
+        """Test that rows are built in batches while the lock is held."""
+        lock = ReadWriteLock()
+        held = []
+
+        def build(source):
+            held.append(lock.readers)
+            return source * 2
+
+        rows = LockedRows(list(range(5)), build, lock.read, batch_size=2)
+
+        assert await _collect(rows) == [0, 2, 4, 6, 8]
+        assert held == [1, 1, 1, 1, 1]
+        assert lock.readers == 0
+
+    async def test_lock_is_released_between_batches(self):
+        """Test that a writer can change the state between two batches."""
+        lock = ReadWriteLock()
+        mapping = {"a": 1, "b": 2, "c": 3}
+        rows = locked_mapping_items(mapping, lock.read)
+        rows.batch_size = 1
+
+        seen = []
+        async for key, value in rows:
+            seen.append((key, value))
+            with lock.write():
+                mapping.pop("b", None)
+                mapping["d"] = 4
+
+        assert seen == [("a", 1), ("c", 3)]
+
+    async def test_mapping_values_are_copied(self):
+        """Test that rows do not share mutable values with the mapping."""
+        mapping = {"a": [1]}
+        rows = await _collect(locked_mapping_items(mapping, ReadWriteLock().read))
+        mapping["a"].append(2)
+        assert rows == [("a", [1])]
+
+    async def test_keeps_none_values(self):
+        """Test that entries whose value is None are still produced."""
+        rows = locked_mapping_items({"a": None}, ReadWriteLock().read)
+        assert await _collect(rows) == [("a", None)]
+
+    async def test_encodes_as_array(self):
+        """Test that LockedRows encode as a JSON array."""
+        rows = LockedRows([1, 2], str, ReadWriteLock().read)
+        assert await _decode(iter_json({"rows": rows})) == {"rows": ["1", "2"]}
+
+
+class TestAcceptsNdjson:
+    """Tests for accepts_ndjson."""
+
+    def test_detects_ndjson_media_type(self):
+        """Test that NDJSON is detected among other media types and parameters."""
+        assert accepts_ndjson("application/x-ndjson")
+        assert accepts_ndjson("application/json, application/x-ndjson;q=0.9")
+
+    def test_rejects_missing_or_other_types(self):
+        """Test that absent or unrelated Accept headers are not NDJSON."""
+        assert not accepts_ndjson(None)
+        assert not accepts_ndjson("")
+        assert not accepts_ndjson("application/json")
@@ -0,0 +1,170 @@
+"""Unit tests for MessagePack content negotiation in api/wire_format.py."""
+
+from datetime import datetime, timezone
+
+import msgpack
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from api.wire_format import (
+    MSGPACK_MEDIA_TYPE,
+    MessagePackRoute,
+    accepts_msgpack,
+    is_msgpack,
+    packb,
+    unpackb,
+    unvalidated_response,
+)
+
+
+class Item(BaseModel):
+    """Small model used as request and response body."""
+
+    name: str
+    created_at: datetime
+
+
+class PartialItem(BaseModel):
+    """Model that would fail validation as an Item."""
+
+    name: str
+
+
+def _make_client() -> TestClient:
+    """Create a test app with async and sync routes using MessagePackRoute."""
+    router = APIRouter(route_class=MessagePackRoute)
+
+    @router.post("/items", response_model=Item)
+    async def echo(item: Item):
+        return item
+
+    @router.get("/sync", response_model=Item)
+    def sync_item():
+        return {"name": "sync", "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc)}
+
+    @router.get("/unvalidated", response_model=Item)
+    async def unvalidated():
+        return unvalidated_response(PartialItem(name="partial"))
+
+    @router.get("/plain")
+    async def plain():
+        return {"ok": True}
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+class TestNegotiationHelpers:
+    """Tests for accepts_msgpack and is_msgpack."""
+
+    def test_accepts_msgpack_when_preferred(self):
+        """Test that MessagePack is chosen when ranked at least as high as JSON."""
+        assert accepts_msgpack("application/msgpack")
+        assert accepts_msgpack("application/x-msgpack, application/json")
+        assert accepts_msgpack("application/json;q=0.5, application/msgpack")
+
+    def test_rejects_when_json_preferred_or_absent(self):
+        """Test that JSON stays the default otherwise."""
+        assert not accepts_msgpack(None)
+        assert not accepts_msgpack("*/*")
+        assert not accepts_msgpack("application/json, application/msgpack;q=0.5")
+        assert not accepts_msgpack("application/msgpack;q=0")
+
+    def test_is_msgpack_ignores_parameters(self):
+        """Test Content-Type detection with parameters and other types."""
+        assert is_msgpack("application/msgpack; charset=binary")
+        assert not is_msgpack("application/json")
+        assert not is_msgpack(None)
+
+
+class TestPackb:
+    """Tests for packb and unpackb."""
+
+    def test_aware_datetimes_round_trip_as_timestamps(self):
+        """Test that aware datetimes survive as native timestamps."""
+        value = {"at": datetime(2025, 1, 1, 9, 30, tzinfo=timezone.utc)}
+        assert unpackb(packb(value)) == value
+
+    def test_naive_datetimes_and_models_are_converted(self):
+        """Test the fallbacks for values MessagePack cannot pack natively."""
+        naive = datetime(2025, 1, 1, 9, 30)
+        item = Item(name="a", created_at=datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+        decoded = unpackb(packb({"naive": naive, "item": item}))
+
+        assert decoded["naive"] == naive.isoformat()
+        assert decoded["item"] == item.model_dump()
+
+
+class TestMessagePackRoute:
+    """Tests for request and response negotiation on MessagePackRoute."""
+
+    def test_json_is_unchanged(self):
+        """Test that JSON clients see the usual JSON behavior."""
+        client = _make_client()
+
+        response = client.post(
+            "/items", json={"name": "a", "created_at": "2025-01-01T00:00:00Z"}
+        )
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["name"] == "a"
+
+    def test_msgpack_request_and_response(self):
+        """Test that MessagePack bodies are validated and answered in kind."""
+        client = _make_client()
+        created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        response = client.post(
+            "/items",
+            content=packb({"name": "a", "created_at": created_at}),
+            headers={"Content-Type": MSGPACK_MEDIA_TYPE, "Accept": MSGPACK_MEDIA_TYPE},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+        assert unpackb(response.content) == {"name": "a", "created_at": created_at}
+
+    def test_sync_endpoints_and_routes_without_response_model(self):
+        """Test negotiation for sync endpoints and untyped responses."""
+        client = _make_client()
+        headers = {"Accept": MSGPACK_MEDIA_TYPE}
+
+        assert unpackb(client.get("/sync", headers=headers).content)["name"] == "sync"
+        assert unpackb(client.get("/plain", headers=headers).content) == {"ok": True}
+
+    def test_invalid_msgpack_body_is_rejected(self):
+        """Test that an undecodable body is a 400 rather than a server error."""
+        client = _make_client()
+
+        response = client.post(
+            "/items", content=b"\xc1", headers={"Content-Type": MSGPACK_MEDIA_TYPE}
+        )
+
+        assert response.status_code == 400
+
+    def test_msgpack_body_is_validated(self):
+        """Test that MessagePack bodies go through normal request validation."""
+        client = _make_client()
+
+        response = client.post(
+            "/items",
+            content=msgpack.packb({"name": "a"}),
+            headers={"Content-Type": MSGPACK_MEDIA_TYPE},
+        )
+
+        assert response.status_code == 422
+
+    def test_unvalidated_response_skips_response_model(self):
+        """Test that unvalidated responses are sent as given, in either format."""
+        client = _make_client()
+
+        json_response = client.get("/unvalidated")
+        msgpack_response = client.get("/unvalidated", headers={"Accept": MSGPACK_MEDIA_TYPE})
+
+        assert json_response.status_code == 200
+        assert json_response.json() == {"name": "partial"}
+        assert msgpack_response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+        assert unpackb(msgpack_response.content) == {"name": "partial"}
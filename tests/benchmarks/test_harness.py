@@ -0,0 +1,124 @@
+"""Unit tests for the benchmark suite in benchmarks/."""
+
+import pytest
+
+import benchmarks.harness as harness
+from api.executor import shutdown_engine_executor
+from benchmarks import (  # noqa: F401
+    suite_api,
+    suite_client,
+    suite_engine,
+    suite_modalities,
+    suite_parse,
+    suite_queue,
+    suite_records,
+)
+from benchmarks.harness import (
+    BenchmarkResult,
+    Workload,
+    benchmark,
+    compare,
+    get_benchmarks,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+from main import app
+
+
+@pytest.fixture
+def restore_app():
+    """Undo the engine override and worker pool the API benchmarks set up."""
+    yield
+    app.dependency_overrides.clear()
+    shutdown_engine_executor()
+
+
+@pytest.fixture
+def scratch_registry(monkeypatch):
+    """Give each test an empty benchmark registry."""
+    monkeypatch.setattr(harness, "_benchmarks", {})
+
+
+def _result(name: str, size: int, seconds: float) -> BenchmarkResult:
+    """Create a result with the given median time."""
+    return BenchmarkResult(
+        name=name,
+        size=size,
+        operations=size,
+        repeat=1,
+        median_seconds=seconds,
+        min_seconds=seconds,
+        ops_per_second=size / seconds,
+    )
+
+
+class TestRunner:
+    """Tests for registering and running benchmarks."""
+
+    def test_setup_runs_before_every_repetition(self, scratch_registry):
+        """Test that each repetition gets a fresh workload at each size."""
+        setups = []
+
+        @benchmark("demo.append", sizes=(10, 100, 1000))
+        def demo(size: int) -> Workload:
+            items = []
+            setups.append(items)
+            return Workload(lambda: items.extend(range(size)), operations=size)
+
+        results = run_benchmarks(get_benchmarks(["demo.*"]), max_size=100, repeat=3)
+
+        assert [(r.name, r.size, r.repeat) for r in results] == [
+            ("demo.append", 10, 3),
+            ("demo.append", 100, 3),
+        ]
+        assert [len(items) for items in setups] == [10] * 3 + [100] * 3
+
+    def test_duplicate_names_are_rejected(self, scratch_registry):
+        """Test that two benchmarks cannot share a name."""
+        benchmark("demo.twice")(lambda size: Workload(lambda: None, 1))
+
+        with pytest.raises(ValueError, match="demo.twice"):
+            benchmark("demo.twice")(lambda size: Workload(lambda: None, 1))
+
+
+class TestBaselineComparison:
+    """Tests for storing results and comparing against a baseline."""
+
+    def test_results_round_trip_through_json(self, tmp_path):
+        """Test that written results load back unchanged."""
+        results = [_result("queue.add_events", 1000, 0.01)]
+        path = tmp_path / "results.json"
+
+        write_results(path, results)
+
+        assert load_results(path) == results
+
+    def test_flags_slowdowns_above_threshold(self):
+        """Test that only results slower than the threshold regress."""
+        baseline = [_result("a", 1000, 1.0), _result("b", 1000, 1.0)]
+        results = [
+            _result("a", 1000, 1.1),
+            _result("b", 1000, 1.5),
+            _result("new", 1000, 9.0),
+        ]
+
+        comparisons = compare(results, baseline, threshold=0.2)
+
+        assert [(c.name, c.regressed) for c in comparisons] == [
+            ("a", False),
+            ("b", True),
+        ]
+        assert comparisons[1].change == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize(
+    "bench", get_benchmarks(), ids=lambda bench: bench.name
+)
+def test_suite_benchmarks_run(bench, restore_app):
+    """Test that every benchmark in the suite runs at a tiny size."""
+    workload = bench.setup(10)
+
+    workload.run()
+
+    assert workload.operations > 0
@@ -0,0 +1,167 @@
+"""Tests for client request batching (client.batch()).
+
+Calls made inside a batch are sent as one POST /batch. These tests check
+that the futures resolve to the same models and exceptions as unbatched
+calls, over both the embedded transport and ASGI.
+"""
+
+import httpx
+import pytest
+
+import client._batch as batch_module
+from api.dependencies import (
+    get_simulation_engine,
+    initialize_simulation_engine,
+    shutdown_simulation_engine,
+)
+from client import (
+    APIError,
+    AsyncUESClient,
+    BatchFuture,
+    ConflictError,
+    NotFoundError,
+    UESClient,
+    ValidationError,
+)
+from client.models import ModalityActionResponse
+from main import app
+
+
+@pytest.fixture(autouse=True)
+def engine():
+    """Provide a fresh shared engine for each test."""
+    engine = initialize_simulation_engine()
+    engine.start()
+    yield engine
+    shutdown_simulation_engine()
+
+
+@pytest.fixture
+def client(engine):
+    """Create a synchronous embedded client that counts its requests."""
+    with UESClient.embedded(engine) as client:
+        client.requests = []
+        request = client._http.request
+
+        def counting_request(method, path, params=None, json=None):
+            client.requests.append(path)
+            return request(method, path, params=params, json=json)
+
+        client._http.request = counting_request
+        yield client
+
+
+def _receive(client, subject: str):
+    """Receive an email through a client or batch."""
+    return client.email.receive(
+        from_address="alice@example.com",
+        to_addresses=["user@example.com"],
+        subject=subject,
+        body_text="Hello",
+    )
+
+
+class TestBatch:
+    """Tests for UESClient.batch()."""
+
+    def test_calls_are_sent_in_one_request(self, client, engine):
+        """Test that futures resolve to models after a single round-trip."""
+        with client.batch() as batch:
+            first = _receive(batch, "First")
+            _receive(batch, "Second")
+            query = batch.email.query(sort_order="asc")
+            location = batch.location.update(latitude=40.0, longitude=-74.0)
+
+            assert len(batch) == 4
+            assert not query.done()
+
+        assert client.requests == ["/batch"]
+        assert isinstance(first, BatchFuture)
+        assert isinstance(first.result(), ModalityActionResponse)
+        assert [email.subject for email in query.result().emails] == ["First", "Second"]
+        assert location.result().status == "executed"
+        assert engine.environment.get_state("location").current_latitude == 40.0
+
+    def test_failed_calls_raise_from_their_future(self, client):
+        """Test that one failing call does not affect the others."""
+        with client.batch() as batch:
+            missing = batch.events.get("missing")
+            conflict = batch.simulation.start()
+            invalid = batch.email.query(limit=0)
+            state = batch.sms.get_state()
+
+        with pytest.raises(NotFoundError):
+            missing.result()
+        assert isinstance(conflict.exception(), ConflictError)
+        assert isinstance(invalid.exception(), ValidationError)
+        assert state.exception() is None
+        assert state.result().modality_type == "sms"
+
+    def test_unsupported_calls_are_rejected_when_recorded(self, client):
+        """Test that streaming calls cannot be added to a batch."""
+        with client.batch() as batch:
+            with pytest.raises(TypeError, match="cannot be batched"):
+                batch.email.stream_query()
+            with pytest.raises(AttributeError):
+                batch.nothing
+
+        assert len(batch) == 0
+
+    def test_batch_is_not_sent_if_the_block_raises(self, client):
+        """Test that an exception inside the block discards the batch."""
+        with pytest.raises(KeyError):
+            with client.batch() as batch:
+                future = _receive(batch, "Never sent")
+                raise KeyError
+
+        assert client.requests == []
+        with pytest.raises(RuntimeError, match="not been sent"):
+            future.result()
+        with pytest.raises(RuntimeError, match="already been sent"):
+            batch.send()
+            batch.send()
+
+    def test_large_batches_are_split(self, client, monkeypatch):
+        """Test that batches over the server's limit use several requests."""
+        monkeypatch.setattr(batch_module, "MAX_BATCH_REQUESTS", 2)
+
+        with client.batch() as batch:
+            futures = [_receive(batch, f"Message {i}") for i in range(5)]
+
+        assert client.requests == ["/batch"] * 3
+        assert all(future.result().status == "executed" for future in futures)
+
+
+class TestAsyncBatch:
+    """Tests for AsyncUESClient.batch()."""
+
+    async def test_batch_over_asgi(self, engine):
+        """Test that batched calls give the same results as unbatched ones."""
+        app.dependency_overrides[get_simulation_engine] = lambda: engine
+        transport = httpx.ASGITransport(app=app)
+        try:
+            async with AsyncUESClient(base_url="http://test", transport=transport) as client:
+                async with client.batch() as batch:
+                    _receive(batch, "Async")
+                    query = batch.email.query()
+                    missing = batch.events.get("missing")
+
+                unbatched = await client.email.query()
+                with pytest.raises(APIError) as unbatched_error:
+                    await client.events.get("missing")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert query.result() == unbatched
+        assert type(missing.exception()) is type(unbatched_error.value)
+        assert missing.exception().response_body == unbatched_error.value.response_body
+
+    async def test_embedded_batch(self, engine):
+        """Test that the async embedded client can send batches."""
+        async with AsyncUESClient.embedded(engine) as client:
+            async with client.batch() as batch:
+                update = batch.location.update(latitude=1.0, longitude=2.0)
+                state = batch.location.get_state()
+
+        assert update.result().status == "executed"
+        assert state.result().current["latitude"] == 1.0
@@ -235,6 +235,24 @@ class TestCalendarClientQuery:
         mock_http.post.assert_called_once_with("/calendar/query", json={}, params=None)
         assert isinstance(result, CalendarQueryResponse)
 
+    def test_query_with_fields(self):
+        """Test that a fields projection is sent and partial results returned."""
+        mock_http = MagicMock()
+        mock_http.post.return_value = {
+            "modality_type": "calendar",
+            "events": [{"event_id": "evt-1", "title": "Meeting"}],
+            "count": 1,
+            "total_count": 1,
+        }
+
+        client = CalendarClient(mock_http)
+        result = client.query(fields=["event_id", "title"])
+
+        mock_http.post.assert_called_once_with(
+            "/calendar/query", json={"fields": ["event_id", "title"]}, params=None
+        )
+        assert result.events == [{"event_id": "evt-1", "title": "Meeting"}]
+
     def test_query_with_date_range(self):
         """Test querying events with date range."""
         mock_http = MagicMock()
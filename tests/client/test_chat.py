@@ -201,6 +201,25 @@ class TestChatClientQuery:
         mock_http.post.assert_called_once_with("/chat/query", json={}, params=None)
         assert isinstance(result, ChatQueryResponse)
 
+    def test_query_with_fields(self):
+        """Test that a fields projection is sent and partial results returned."""
+        mock_http = MagicMock()
+        mock_http.post.return_value = {
+            "modality_type": "chat",
+            "messages": [{"role": "user", "content": "Hello"}],
+            "total_count": 1,
+            "returned_count": 1,
+            "query": {"fields": ["role", "content"]},
+        }
+
+        client = ChatClient(mock_http)
+        result = client.query(fields=["role", "content"])
+
+        mock_http.post.assert_called_once_with(
+            "/chat/query", json={"fields": ["role", "content"]}, params=None
+        )
+        assert result.messages == [{"role": "user", "content": "Hello"}]
+
     def test_query_with_filters(self):
         """Test querying messages with various filters."""
         mock_http = MagicMock()
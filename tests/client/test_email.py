@@ -165,6 +165,37 @@ class TestEmailQueryResponse:
         assert response.total_count == 10
         assert response.returned_count == 5
 
+    def test_full_emails_parse_as_models(self):
+        """Test that unprojected results are parsed as Email models."""
+        response = EmailQueryResponse(
+            emails=[
+                {
+                    "message_id": "msg-1",
+                    "thread_id": "thread-1",
+                    "from_address": "sender@example.com",
+                    "to_addresses": ["user@example.com"],
+                    "subject": "Subject",
+                    "body_text": "Body",
+                    "sent_at": "2025-01-15T10:00:00Z",
+                    "received_at": "2025-01-15T10:00:00Z",
+                }
+            ],
+            total_count=1,
+            returned_count=1,
+            query={},
+        )
+        assert isinstance(response.emails[0], Email)
+
+    def test_projected_emails_stay_dicts(self):
+        """Test that projected results are kept as partial dicts."""
+        response = EmailQueryResponse(
+            emails=[{"message_id": "msg-1", "subject": "Subject"}],
+            total_count=1,
+            returned_count=1,
+            query={"fields": ["message_id", "subject"]},
+        )
+        assert response.emails == [{"message_id": "msg-1", "subject": "Subject"}]
+
 
 # =============================================================================
 # EmailClient Tests
@@ -285,6 +316,126 @@ class TestEmailClientQuery:
         assert "sent_after" in call_args[1]["json"]
         assert "sent_before" in call_args[1]["json"]
 
+    def test_query_with_fields(self):
+        """Test that a fields projection is sent and partial results returned."""
+        mock_http = MagicMock()
+        mock_http.post.return_value = {
+            "modality_type": "email",
+            "emails": [{"message_id": "msg-1", "subject": "Subject"}],
+            "total_count": 1,
+            "returned_count": 1,
+            "query": {"fields": ["message_id", "subject"]},
+        }
+
+        client = EmailClient(mock_http)
+        result = client.query(fields=["message_id", "subject"])
+
+        mock_http.post.assert_called_once_with(
+            "/email/query", json={"fields": ["message_id", "subject"]}, params=None
+        )
+        assert result.emails == [{"message_id": "msg-1", "subject": "Subject"}]
+
+
+class TestEmailClientIterQuery:
+    """Tests for EmailClient.iter_query() method."""
+
+    def test_iter_query_follows_cursors(self):
+        """Test that pages are fetched until next_cursor is None."""
+        mock_http = MagicMock()
+        mock_http.post.side_effect = [
+            {
+                "modality_type": "email",
+                "emails": [{"message_id": "msg-1"}, {"message_id": "msg-2"}],
+                "total_count": 3,
+                "returned_count": 2,
+                "query": {},
+                "next_cursor": "cursor-1",
+            },
+            {
+                "modality_type": "email",
+                "emails": [{"message_id": "msg-3"}],
+                "total_count": None,
+                "returned_count": 1,
+                "query": {},
+                "next_cursor": None,
+            },
+        ]
+
+        client = EmailClient(mock_http)
+        emails = list(client.iter_query(page_size=2, fields=["message_id"]))
+
+        assert [email["message_id"] for email in emails] == ["msg-1", "msg-2", "msg-3"]
+        assert mock_http.post.call_args_list[0][1]["json"] == {
+            "limit": 2,
+            "fields": ["message_id"],
+        }
+        assert mock_http.post.call_args_list[1][1]["json"] == {
+            "limit": 2,
+            "fields": ["message_id"],
+            "cursor": "cursor-1",
+        }
+
+
+class TestEmailClientStreamQuery:
+    """Tests for EmailClient.stream_query() method."""
+
+    def test_stream_query_yields_emails(self):
+        """Test that NDJSON items are converted to Email models lazily."""
+        mock_http = MagicMock()
+        mock_http.iter_ndjson.return_value = iter(
+            [
+                {
+                    "message_id": f"msg-{i}",
+                    "thread_id": "thread-1",
+                    "from_address": "sender@example.com",
+                    "to_addresses": ["user@example.com"],
+                    "subject": f"Subject {i}",
+                    "body_text": "Body",
+                    "sent_at": "2025-01-15T10:00:00Z",
+                    "received_at": "2025-01-15T10:00:00Z",
+                }
+                for i in range(2)
+            ]
+        )
+
+        client = EmailClient(mock_http)
+        sent_after = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+        emails = list(client.stream_query(folder="inbox", sent_after=sent_after, limit=None))
+
+        mock_http.iter_ndjson.assert_called_once_with(
+            "POST",
+            "/email/query",
+            params=None,
+            json={"folder": "inbox", "sent_after": sent_after.isoformat()},
+        )
+        assert [email.message_id for email in emails] == ["msg-0", "msg-1"]
+        assert all(isinstance(email, Email) for email in emails)
+
+    def test_stream_query_is_lazy(self):
+        """Test that no request is made until the iterator is consumed."""
+        mock_http = MagicMock()
+        mock_http.iter_ndjson.return_value = iter([])
+
+        client = EmailClient(mock_http)
+        iterator = client.stream_query()
+
+        mock_http.iter_ndjson.assert_not_called()
+        assert list(iterator) == []
+        mock_http.iter_ndjson.assert_called_once()
+
+    def test_stream_query_with_fields_yields_dicts(self):
+        """Test that projected streams yield partial dicts."""
+        mock_http = MagicMock()
+        mock_http.iter_ndjson.return_value = iter([{"subject": "A"}, {"subject": "B"}])
+
+        client = EmailClient(mock_http)
+        emails = list(client.stream_query(fields=["subject"]))
+
+        mock_http.iter_ndjson.assert_called_once_with(
+            "POST", "/email/query", params=None, json={"fields": ["subject"]}
+        )
+        assert emails == [{"subject": "A"}, {"subject": "B"}]
+
 
 class TestEmailClientSend:
     """Tests for EmailClient.send() method."""
@@ -639,6 +790,69 @@ class TestAsyncEmailClientQuery:
         assert isinstance(result, EmailQueryResponse)
 
 
+class TestAsyncEmailClientIterQuery:
+    """Tests for AsyncEmailClient.iter_query() method."""
+
+    async def test_iter_query_follows_cursors(self):
+        """Test that pages are fetched until next_cursor is None."""
+        mock_http = AsyncMock()
+        mock_http.post.side_effect = [
+            {
+                "modality_type": "email",
+                "emails": [{"message_id": "msg-1"}],
+                "total_count": 2,
+                "returned_count": 1,
+                "query": {},
+                "next_cursor": "cursor-1",
+            },
+            {
+                "modality_type": "email",
+                "emails": [{"message_id": "msg-2"}],
+                "total_count": None,
+                "returned_count": 1,
+                "query": {},
+                "next_cursor": None,
+            },
+        ]
+
+        client = AsyncEmailClient(mock_http)
+        emails = [email async for email in client.iter_query(page_size=1, fields=["message_id"])]
+
+        assert [email["message_id"] for email in emails] == ["msg-1", "msg-2"]
+        assert mock_http.post.call_count == 2
+
+
+class TestAsyncEmailClientStreamQuery:
+    """Tests for AsyncEmailClient.stream_query() method."""
+
+    async def test_stream_query_yields_emails(self):
+        """Test streaming emails asynchronously."""
+
+        async def lines():
+            yield {
+                "message_id": "msg-1",
+                "thread_id": "thread-1",
+                "from_address": "sender@example.com",
+                "to_addresses": ["user@example.com"],
+                "subject": "Subject",
+                "body_text": "Body",
+                "sent_at": "2025-01-15T10:00:00Z",
+                "received_at": "2025-01-15T10:00:00Z",
+            }
+
+        mock_http = MagicMock()
+        mock_http.iter_ndjson.return_value = lines()
+
+        client = AsyncEmailClient(mock_http)
+        emails = [email async for email in client.stream_query(is_read=False)]
+
+        mock_http.iter_ndjson.assert_called_once_with(
+            "POST", "/email/query", params=None, json={"is_read": False}
+        )
+        assert len(emails) == 1
+        assert isinstance(emails[0], Email)
+
+
 class TestAsyncEmailClientSend:
     """Tests for AsyncEmailClient.send() method."""
 
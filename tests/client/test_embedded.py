@@ -0,0 +1,180 @@
+"""Tests for the embedded (in-process) client transports.
+
+The embedded clients call the API's endpoints directly instead of going
+through HTTP. These tests check that they return the same models and raise
+the same exceptions as a client talking to the app over ASGI.
+"""
+
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from api.dependencies import (
+    get_simulation_engine,
+    initialize_simulation_engine,
+    shutdown_simulation_engine,
+)
+from client import (
+    APIError,
+    AsyncUESClient,
+    ConflictError,
+    NotFoundError,
+    UESClient,
+    ValidationError,
+)
+from client._embedded import EmbeddedTransport
+from main import app
+
+
+@pytest.fixture(autouse=True)
+def engine():
+    """Provide a fresh shared engine for each test."""
+    yield initialize_simulation_engine()
+    shutdown_simulation_engine()
+
+
+@pytest.fixture
+def client(engine):
+    """Create a synchronous embedded client."""
+    with UESClient.embedded(engine) as client:
+        yield client
+
+
+@pytest.fixture
+async def asgi_client():
+    """Create an async client that talks to the app over ASGI."""
+    transport = httpx.ASGITransport(app=app)
+    async with AsyncUESClient(base_url="http://test", transport=transport) as client:
+        yield client
+
+
+def _receive(client: UESClient, subject: str) -> None:
+    """Receive an email through the client."""
+    client.email.receive(
+        from_address="alice@example.com",
+        to_addresses=["user@example.com"],
+        subject=subject,
+        body_text="Hello",
+    )
+
+
+class TestEmbeddedClient:
+    """Tests for UESClient.embedded()."""
+
+    def test_calls_operate_on_the_engine(self, client, engine):
+        """Test that actions change the engine and return client models."""
+        client.simulation.start()
+        _receive(client, "First")
+        _receive(client, "Second")
+
+        result = client.email.query(sort_order="asc")
+
+        assert [email.subject for email in result.emails] == ["First", "Second"]
+        assert isinstance(result.emails[0].received_at, datetime)
+        assert len(engine.environment.get_state("email").emails) == 2
+        assert client._http.base_url == "embedded://"
+
+    def test_stream_query(self, client):
+        """Test that NDJSON queries stream models one at a time."""
+        client.simulation.start()
+        for i in range(3):
+            _receive(client, f"Message {i}")
+
+        emails = list(client.email.stream_query(sort_order="asc"))
+        projected = list(client.email.stream_query(fields=["subject"], limit=1))
+
+        assert [email.subject for email in emails] == [
+            "Message 0",
+            "Message 1",
+            "Message 2",
+        ]
+        assert projected == [{"subject": "Message 0"}]
+
+    def test_time_advance_executes_events(self, client):
+        """Test that query parameters and datetimes pass through unencoded."""
+        client.simulation.start()
+        now = client.time.get_state().current_time
+        client.events.create(
+            scheduled_time=now + timedelta(seconds=30),
+            modality="location",
+            data={"latitude": 1.0, "longitude": 2.0},
+        )
+
+        result = client.time.advance(seconds=60)
+
+        assert result.events_executed == 1
+        assert client.location.get_state().current["latitude"] == 1.0
+
+    def test_unknown_paths(self, engine):
+        """Test that unknown paths and methods map to the HTTP errors."""
+        with EmbeddedTransport(engine) as transport:
+            with pytest.raises(NotFoundError, match="Not Found"):
+                transport.get("/nothing")
+            with pytest.raises(APIError, match="Method Not Allowed") as exc_info:
+                transport.delete("/email/query")
+
+        assert exc_info.value.status_code == 405
+
+
+class TestEmbeddedErrors:
+    """Tests that errors match the ones raised over HTTP."""
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda c: c.events.get("missing"),
+            lambda c: c.simulation.start(),
+            lambda c: c.email.query(limit=0),
+            lambda c: c.email.query(fields=["no_such_field"]),
+            lambda c: c.environment.get_modality("no_such_modality"),
+        ],
+        ids=["not_found", "conflict", "validation", "bad_request", "modality"],
+    )
+    async def test_same_exception_as_asgi(self, engine, asgi_client, call):
+        """Test that each error raises the same type, status, and message."""
+        engine.start()
+        app.dependency_overrides[get_simulation_engine] = lambda: engine
+        try:
+            with pytest.raises(APIError) as over_http:
+                await call(asgi_client)
+        finally:
+            app.dependency_overrides.clear()
+
+        async with AsyncUESClient.embedded(engine) as client:
+            with pytest.raises(APIError) as embedded:
+                await call(client)
+
+        assert type(embedded.value) is type(over_http.value)
+        assert embedded.value.status_code == over_http.value.status_code
+        assert embedded.value.message == over_http.value.message
+        assert embedded.value.response_body == over_http.value.response_body
+
+
+class TestAsyncEmbeddedClient:
+    """Tests for AsyncUESClient.embedded()."""
+
+    async def test_calls_and_streams(self, engine):
+        """Test actions, queries, and streaming on the caller's event loop."""
+        async with AsyncUESClient.embedded(engine) as client:
+            await client.simulation.start()
+            with pytest.raises(ConflictError):
+                await client.simulation.start()
+            await client.email.receive(
+                from_address="alice@example.com",
+                to_addresses=["user@example.com"],
+                subject="Async",
+                body_text="Hello",
+            )
+
+            result = await client.email.query()
+            streamed = [email async for email in client.email.stream_query()]
+
+        assert result.emails[0].subject == "Async"
+        assert [email.subject for email in streamed] == ["Async"]
+
+    async def test_validation_error(self, engine):
+        """Test that request validation errors raise ValidationError."""
+        async with AsyncUESClient.embedded(engine) as client:
+            with pytest.raises(ValidationError, match="limit"):
+                await client.email.query(limit=0)
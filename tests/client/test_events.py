@@ -370,6 +370,90 @@ class TestEventsClientListEvents:
             },
         )
 
+    def test_list_events_with_fields(self):
+        """Test that fields are sent comma-separated and results stay dicts."""
+        mock_http = MagicMock()
+        mock_http.get.return_value = {
+            "events": [{"event_id": "evt-1", "status": "pending"}],
+            "total": 1,
+            "pending": 1,
+            "executed": 0,
+            "failed": 0,
+            "skipped": 0,
+        }
+
+        client = EventsClient(mock_http)
+        result = client.list_events(fields=["event_id", "status"])
+
+        mock_http.get.assert_called_once_with(
+            "/events", params={"fields": "event_id,status"}
+        )
+        assert result.events == [{"event_id": "evt-1", "status": "pending"}]
+
+
+class TestEventsClientStreamEvents:
+    """Tests for EventsClient.stream_events() method."""
+
+    def test_stream_events_yields_events(self):
+        """Test that NDJSON items are converted to EventResponse models."""
+        mock_http = MagicMock()
+        mock_http.iter_ndjson.return_value = iter(
+            [
+                {
+                    "event_id": f"evt-{i}",
+                    "scheduled_time": "2025-01-15T10:00:00+00:00",
+                    "modality": "email",
+                    "status": "pending",
+                    "priority": 50,
+                    "created_at": "2025-01-15T09:00:00+00:00",
+                }
+                for i in range(3)
+            ]
+        )
+
+        client = EventsClient(mock_http)
+        events = list(client.stream_events(status="pending", limit=3))
+
+        mock_http.iter_ndjson.assert_called_once_with(
+            "GET", "/events", params={"status": "pending", "limit": 3}, json=None
+        )
+        assert [event.event_id for event in events] == ["evt-0", "evt-1", "evt-2"]
+        assert all(isinstance(event, EventResponse) for event in events)
+
+
+class TestEventsClientIter:
+    """Tests for EventsClient.iter() method."""
+
+    def test_iter_follows_cursors(self):
+        """Test that pages are fetched until next_cursor is None."""
+        mock_http = MagicMock()
+        counts = {"pending": 3, "executed": 0, "failed": 0, "skipped": 0}
+        mock_http.get.side_effect = [
+            {
+                "events": [{"event_id": "evt-1"}, {"event_id": "evt-2"}],
+                "total": 3,
+                "next_cursor": "cursor-1",
+                **counts,
+            },
+            {
+                "events": [{"event_id": "evt-3"}],
+                "total": None,
+                "next_cursor": None,
+                **counts,
+            },
+        ]
+
+        client = EventsClient(mock_http)
+        events = list(client.iter(page_size=2, status="pending", fields=["event_id"]))
+
+        assert [event["event_id"] for event in events] == ["evt-1", "evt-2", "evt-3"]
+        assert mock_http.get.call_args_list[1][1]["params"] == {
+            "status": "pending",
+            "limit": 2,
+            "fields": "event_id",
+            "cursor": "cursor-1",
+        }
+
 
 class TestEventsClientCreate:
     """Tests for EventsClient.create() method."""
@@ -740,6 +824,25 @@ class TestAsyncEventsClientListEvents:
         )
 
 
+class TestAsyncEventsClientIter:
+    """Tests for AsyncEventsClient.iter() method."""
+
+    async def test_iter_follows_cursors(self):
+        """Test that pages are fetched until next_cursor is None."""
+        mock_http = AsyncMock()
+        counts = {"pending": 2, "executed": 0, "failed": 0, "skipped": 0}
+        mock_http.get.side_effect = [
+            {"events": [{"event_id": "evt-1"}], "total": 2, "next_cursor": "c", **counts},
+            {"events": [{"event_id": "evt-2"}], "total": None, "next_cursor": None, **counts},
+        ]
+
+        client = AsyncEventsClient(mock_http)
+        events = [event async for event in client.iter(page_size=1, fields=["event_id"])]
+
+        assert [event["event_id"] for event in events] == ["evt-1", "evt-2"]
+        assert mock_http.get.call_count == 2
+
+
 class TestAsyncEventsClientCreate:
     """Tests for AsyncEventsClient.create() method."""
 
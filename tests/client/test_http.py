@@ -24,16 +24,23 @@ The tests verify:
 Note: These tests use httpx's mock transport to avoid real network calls.
 """
 
+from datetime import datetime, timezone
+
 import pytest
 import httpx
+import msgpack
 
 from client._http import (
     HTTPClient,
     AsyncHTTPClient,
+    MSGPACK_MEDIA_TYPE,
     _parse_error_response,
     _raise_for_status,
     _calculate_backoff,
     RETRYABLE_STATUS_CODES,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
     DEFAULT_RETRY_BACKOFF_BASE,
     DEFAULT_RETRY_BACKOFF_MAX,
 )
@@ -320,15 +327,15 @@ class TestCalculateBackoff:
     
     def test_first_attempt_uses_base(self) -> None:
         """First attempt (0) uses the base delay."""
-        delay = _calculate_backoff(0)
+        delay = _calculate_backoff(0, jitter=False)
         assert delay == DEFAULT_RETRY_BACKOFF_BASE
     
     def test_exponential_growth(self) -> None:
         """Delay grows exponentially with each attempt."""
-        delay_0 = _calculate_backoff(0)  # 0.5
-        delay_1 = _calculate_backoff(1)  # 1.0
-        delay_2 = _calculate_backoff(2)  # 2.0
-        delay_3 = _calculate_backoff(3)  # 4.0
+        delay_0 = _calculate_backoff(0, jitter=False)  # 0.5
+        delay_1 = _calculate_backoff(1, jitter=False)  # 1.0
+        delay_2 = _calculate_backoff(2, jitter=False)  # 2.0
+        delay_3 = _calculate_backoff(3, jitter=False)  # 4.0
         
         assert delay_1 == delay_0 * 2
         assert delay_2 == delay_1 * 2
@@ -337,26 +344,34 @@ class TestCalculateBackoff:
     def test_capped_at_max(self) -> None:
         """Delay is capped at the maximum value."""
         # Attempt 10 would be 0.5 * 2^10 = 512 seconds without cap
-        delay = _calculate_backoff(10)
+        delay = _calculate_backoff(10, jitter=False)
         assert delay == DEFAULT_RETRY_BACKOFF_MAX
+        assert _calculate_backoff(10) <= DEFAULT_RETRY_BACKOFF_MAX
     
     def test_custom_base(self) -> None:
         """Custom base value is used in calculation."""
-        delay = _calculate_backoff(0, base=1.0)
+        delay = _calculate_backoff(0, base=1.0, jitter=False)
         assert delay == 1.0
         
-        delay = _calculate_backoff(2, base=1.0)
+        delay = _calculate_backoff(2, base=1.0, jitter=False)
         assert delay == 4.0  # 1.0 * 2^2
     
     def test_specific_values(self) -> None:
         """Verify specific expected values."""
-        assert _calculate_backoff(0) == 0.5
-        assert _calculate_backoff(1) == 1.0
-        assert _calculate_backoff(2) == 2.0
-        assert _calculate_backoff(3) == 4.0
-        assert _calculate_backoff(4) == 8.0
-        assert _calculate_backoff(5) == 16.0
-        assert _calculate_backoff(6) == 30.0  # Capped
+        assert _calculate_backoff(0, jitter=False) == 0.5
+        assert _calculate_backoff(1, jitter=False) == 1.0
+        assert _calculate_backoff(2, jitter=False) == 2.0
+        assert _calculate_backoff(3, jitter=False) == 4.0
+        assert _calculate_backoff(4, jitter=False) == 8.0
+        assert _calculate_backoff(5, jitter=False) == 16.0
+        assert _calculate_backoff(6, jitter=False) == 30.0  # Capped
+    
+    def test_jitter_spreads_delays(self) -> None:
+        """Jittered delays fall between half and all of the exponential delay."""
+        delays = {_calculate_backoff(3) for _ in range(100)}
+        
+        assert all(2.0 <= delay <= 4.0 for delay in delays)
+        assert len(delays) > 1
 
 
 # =============================================================================
@@ -393,6 +408,28 @@ class TestHTTPClientInit:
         
         client.close()
     
+    def test_connection_pool_configuration(self) -> None:
+        """Pool limits and keep-alive expiry are passed to the connection pool."""
+        default = HTTPClient(base_url="http://localhost:8000")
+        custom = HTTPClient(
+            base_url="http://localhost:8000",
+            max_connections=10,
+            max_keepalive_connections=5,
+            keepalive_expiry=1.5,
+        )
+        
+        default_pool = default._client._transport._pool
+        custom_pool = custom._client._transport._pool
+        assert default_pool._max_connections == DEFAULT_MAX_CONNECTIONS
+        assert default_pool._max_keepalive_connections == DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        assert default_pool._keepalive_expiry == DEFAULT_KEEPALIVE_EXPIRY
+        assert custom_pool._max_connections == 10
+        assert custom_pool._max_keepalive_connections == 5
+        assert custom_pool._keepalive_expiry == 1.5
+        
+        default.close()
+        custom.close()
+    
     def test_base_url_trailing_slash_stripped(self) -> None:
         """Trailing slash is stripped from base_url."""
         client = HTTPClient(base_url="http://localhost:8000/")
@@ -1114,6 +1151,181 @@ class TestAsyncHTTPClientRetry:
         await client.close()
 
 
+# =============================================================================
+# NDJSON Streaming Tests
+# =============================================================================
+
+class TestHTTPClientIterNdjson:
+    """Tests for HTTPClient.iter_ndjson and AsyncHTTPClient.iter_ndjson."""
+    
+    def test_yields_one_item_per_line(self) -> None:
+        """Each non-empty line is parsed as a separate JSON document."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["accept"] == "application/x-ndjson"
+            return httpx.Response(
+                200,
+                content=b'{"a": 1}\n\n{"b": 2}\n',
+                headers={"content-type": "application/x-ndjson"},
+            )
+        
+        client = HTTPClient(base_url="http://localhost:8000")
+        client._client = httpx.Client(
+            base_url="http://localhost:8000",
+            transport=httpx.MockTransport(handler),
+        )
+        
+        assert list(client.iter_ndjson("POST", "/api/items", json={})) == [
+            {"a": 1},
+            {"b": 2},
+        ]
+        client.close()
+    
+    def test_error_status_raises_before_yielding(self) -> None:
+        """Error responses are mapped to exceptions like regular requests."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"detail": "Not found"})
+        
+        client = HTTPClient(base_url="http://localhost:8000")
+        client._client = httpx.Client(
+            base_url="http://localhost:8000",
+            transport=httpx.MockTransport(handler),
+        )
+        
+        with pytest.raises(NotFoundError):
+            list(client.iter_ndjson("GET", "/api/items"))
+        client.close()
+    
+    def test_connection_error_raised(self) -> None:
+        """Connection failures raise ConnectionError."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused")
+        
+        client = HTTPClient(base_url="http://localhost:8000")
+        client._client = httpx.Client(
+            base_url="http://localhost:8000",
+            transport=httpx.MockTransport(handler),
+        )
+        
+        with pytest.raises(ConnectionError):
+            list(client.iter_ndjson("GET", "/api/items"))
+        client.close()
+    
+    async def test_async_yields_one_item_per_line(self) -> None:
+        """The async client streams NDJSON the same way."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["accept"] == "application/x-ndjson"
+            return httpx.Response(200, content=b'{"a": 1}\n{"b": 2}\n')
+        
+        client = AsyncHTTPClient(base_url="http://localhost:8000")
+        client._client = httpx.AsyncClient(
+            base_url="http://localhost:8000",
+            transport=httpx.MockTransport(handler),
+        )
+        
+        items = [item async for item in client.iter_ndjson("GET", "/api/items")]
+        assert items == [{"a": 1}, {"b": 2}]
+        await client.close()
+    
+    async def test_async_error_status_raises(self) -> None:
+        """Async error responses are mapped to exceptions."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(422, json={"detail": "bad"})
+        
+        client = AsyncHTTPClient(base_url="http://localhost:8000")
+        client._client = httpx.AsyncClient(
+            base_url="http://localhost:8000",
+            transport=httpx.MockTransport(handler),
+        )
+        
+        with pytest.raises(ValidationError):
+            [item async for item in client.iter_ndjson("GET", "/api/items")]
+        await client.close()
+
+
+# =============================================================================
+# MessagePack Wire Format Tests
+# =============================================================================
+
+class TestHTTPClientMessagePack:
+    """Tests for the msgpack wire format."""
+    
+    def test_request_body_and_accept_are_msgpack(self) -> None:
+        """Bodies are packed and MessagePack responses are requested."""
+        received = {}
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            received["content_type"] = request.headers["content-type"]
+            received["accept"] = request.headers["accept"]
+            received["body"] = msgpack.unpackb(request.content)
+            return httpx.Response(
+                200,
+                content=msgpack.packb({"id": "new-123"}),
+                headers={"Content-Type": MSGPACK_MEDIA_TYPE},
+            )
+        
+        with HTTPClient(
+            base_url="http://localhost:8000",
+            transport=httpx.MockTransport(handler),
+            wire_format="msgpack",
+        ) as client:
+            result = client.post("/api/items", json={"name": "test"})
+        
+        assert result == {"id": "new-123"}
+        assert received == {
+            "content_type": MSGPACK_MEDIA_TYPE,
+            "accept": MSGPACK_MEDIA_TYPE,
+            "body": {"name": "test"},
+        }
+    
+    def test_timestamps_decode_as_aware_datetimes(self) -> None:
+        """MessagePack timestamps become timezone-aware datetimes."""
+        sent_at = datetime(2025, 1, 15, 10, 0, tzinfo=timezone.utc)
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                content=msgpack.packb({"sent_at": sent_at}, datetime=True),
+                headers={"Content-Type": MSGPACK_MEDIA_TYPE},
+            )
+        
+        with HTTPClient(
+            base_url="http://localhost:8000",
+            transport=httpx.MockTransport(handler),
+            wire_format="msgpack",
+        ) as client:
+            assert client.get("/api/test") == {"sent_at": sent_at}
+    
+    def test_json_responses_still_decoded(self) -> None:
+        """JSON responses (e.g. errors) are decoded in msgpack mode."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"detail": "Not found"})
+        
+        with HTTPClient(
+            base_url="http://localhost:8000",
+            transport=httpx.MockTransport(handler),
+            wire_format="msgpack",
+        ) as client:
+            with pytest.raises(NotFoundError, match="Not found"):
+                client.get("/api/missing")
+    
+    async def test_async_client_uses_msgpack(self) -> None:
+        """AsyncHTTPClient packs bodies and unpacks responses."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert msgpack.unpackb(request.content) == {"value": 1}
+            return httpx.Response(
+                200,
+                content=msgpack.packb({"value": 2}),
+                headers={"Content-Type": MSGPACK_MEDIA_TYPE},
+            )
+        
+        async with AsyncHTTPClient(
+            base_url="http://localhost:8000",
+            transport=httpx.MockTransport(handler),
+            wire_format="msgpack",
+        ) as client:
+            assert await client.post("/api/test", json={"value": 1}) == {"value": 2}
+
+
 # =============================================================================
 # Retryable Status Codes Constant Tests
 # =============================================================================
@@ -423,6 +423,28 @@ class TestEnvironmentIntegration:
         with pytest.raises(NotFoundError):
             sync_client.environment.get_modality("unknown_modality")
 
+    async def test_gather_states(self, async_client):
+        """Test fetching several modality states concurrently."""
+        await async_client.simulation.start()
+        await async_client.location.update(latitude=40.0, longitude=-74.0)
+        
+        states = await async_client.gather_states(
+            ["location", "email", "sms", "location"], concurrency=2
+        )
+        everything = await async_client.gather_states()
+        
+        assert list(states) == ["location", "email", "sms"]
+        assert states["location"].current["latitude"] == 40.0
+        assert states["email"].modality_type == "email"
+        assert set(everything) == {"email", "sms", "chat", "calendar", "location", "weather"}
+
+    async def test_gather_states_rejects_bad_arguments(self, async_client):
+        """Test that unknown modalities and concurrency below 1 are rejected."""
+        with pytest.raises(ValueError, match="Unknown modalities"):
+            await async_client.gather_states(["email", "fax"])
+        with pytest.raises(ValueError, match="concurrency"):
+            await async_client.gather_states(["email"], concurrency=0)
+
 
 # =============================================================================
 # Email Modality Tests
@@ -605,6 +627,85 @@ class TestEmailIntegration:
 # =============================================================================
 
 
+class TestStreamingIntegration:
+    """Integration tests for NDJSON streaming readers."""
+
+    def test_email_stream_query(self, sync_client):
+        """Test streaming email query results end to end."""
+        for i in range(3):
+            sync_client.email.receive(
+                from_address=f"sender{i}@example.com",
+                to_addresses=["user@example.com"],
+                subject=f"Streamed {i}",
+                body_text="Body",
+            )
+        
+        emails = list(sync_client.email.stream_query(sort_by="date", sort_order="asc"))
+        
+        assert [email.subject for email in emails] == ["Streamed 0", "Streamed 1", "Streamed 2"]
+
+    def test_events_stream_events(self, sync_client):
+        """Test streaming the event listing end to end."""
+        sync_client.sms.receive(
+            from_number="+15551234567",
+            to_numbers=["+15559876543"],
+            body="Hello",
+        )
+        
+        events = list(sync_client.events.stream_events(modality="sms"))
+        listing = sync_client.events.list_events(modality="sms")
+        
+        assert [event.event_id for event in events] == [e.event_id for e in listing.events]
+
+    async def test_async_sms_stream_query(self, async_client):
+        """Test streaming SMS query results asynchronously."""
+        await async_client.sms.receive(
+            from_number="+15551234567",
+            to_numbers=["+15559876543"],
+            body="Hello async",
+        )
+        
+        messages = [m async for m in async_client.sms.stream_query()]
+        
+        assert len(messages) == 1
+        assert messages[0].body == "Hello async"
+
+
+class TestMessagePackIntegration:
+    """Integration tests for the MessagePack wire format."""
+
+    async def test_async_msgpack_round_trip(self):
+        """Test that a msgpack client gets the same results as a JSON client."""
+        transport = ASGITransport(app=app)
+        async with AsyncUESClient(
+            base_url="http://test", transport=transport, wire_format="msgpack"
+        ) as client:
+            await client.simulation.start()
+            await client.email.receive(
+                from_address="sender@example.com",
+                to_addresses=["user@example.com"],
+                subject="Packed",
+                body_text="Body",
+            )
+            
+            result = await client.email.query(subject_contains="Packed")
+            state = await client.email.get_state()
+            
+            assert result.emails[0].subject == "Packed"
+            assert result.emails[0].received_at.tzinfo is not None
+            assert state.total_email_count == 1
+            await client.simulation.stop()
+
+    async def test_async_msgpack_errors_are_raised(self):
+        """Test that JSON error responses are still decoded in msgpack mode."""
+        transport = ASGITransport(app=app)
+        async with AsyncUESClient(
+            base_url="http://test", transport=transport, wire_format="msgpack"
+        ) as client:
+            with pytest.raises(NotFoundError):
+                await client.events.get("nonexistent-event")
+
+
 class TestSMSIntegration:
     """Integration tests for SMS modality."""
 
@@ -270,6 +270,25 @@ class TestSMSClientQuery:
         mock_http.post.assert_called_once_with("/sms/query", json={}, params=None)
         assert isinstance(result, SMSQueryResponse)
 
+    def test_query_with_fields(self):
+        """Test that a fields projection is sent and partial results returned."""
+        mock_http = MagicMock()
+        mock_http.post.return_value = {
+            "modality_type": "sms",
+            "messages": [{"message_id": "msg-1", "body": "Hello"}],
+            "total_count": 1,
+            "returned_count": 1,
+            "query": {"fields": ["message_id", "body"]},
+        }
+
+        client = SMSClient(mock_http)
+        result = client.query(fields=["message_id", "body"])
+
+        mock_http.post.assert_called_once_with(
+            "/sms/query", json={"fields": ["message_id", "body"]}, params=None
+        )
+        assert result.messages == [{"message_id": "msg-1", "body": "Hello"}]
+
     def test_query_with_filters(self):
         """Test querying messages with various filters."""
         mock_http = MagicMock()
@@ -320,6 +339,36 @@ class TestSMSClientQuery:
         assert "sent_before" in call_args[1]["json"]
 
 
+class TestSMSClientStreamQuery:
+    """Tests for SMSClient.stream_query() method."""
+
+    def test_stream_query_yields_messages(self):
+        """Test that NDJSON items are converted to SMSMessage models."""
+        mock_http = MagicMock()
+        mock_http.iter_ndjson.return_value = iter(
+            [
+                {
+                    "message_id": "sms-1",
+                    "thread_id": "thread-1",
+                    "from_number": "+1234567890",
+                    "to_numbers": ["+0987654321"],
+                    "body": "Hello!",
+                    "sent_at": "2025-01-15T10:00:00Z",
+                }
+            ]
+        )
+
+        client = SMSClient(mock_http)
+        messages = list(client.stream_query(thread_id="thread-1"))
+
+        mock_http.iter_ndjson.assert_called_once_with(
+            "POST", "/sms/query", params=None, json={"thread_id": "thread-1"}
+        )
+        assert len(messages) == 1
+        assert isinstance(messages[0], SMSMessage)
+        assert messages[0].body == "Hello!"
+
+
 class TestSMSClientSend:
     """Tests for SMSClient.send() method."""
 
@@ -16,6 +16,11 @@ pytest_plugins = [
     "tests.fixtures.modalities.email",
     "tests.fixtures.modalities.calendar",
     "tests.fixtures.modalities.sms",
+    "tests.fixtures.modalities.filesystem",
+    "tests.fixtures.modalities.slack",
+    "tests.fixtures.modalities.discord",
+    "tests.fixtures.modalities.social",
+    "tests.fixtures.modalities.screen",
     "tests.fixtures.core.events",
     "tests.fixtures.core.queues",
     "tests.fixtures.core.environments",
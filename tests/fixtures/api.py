@@ -37,7 +37,8 @@ def fresh_engine():
     ensuring tests don't interfere with each other.
     
     The engine includes all implemented modalities:
-    - location, time, weather, chat, email, calendar, sms
+    - location, time, weather, chat, email, calendar, sms, filesystem,
+      slack, discord, social, screen
     
     Returns:
         A newly initialized SimulationEngine.
@@ -49,7 +50,7 @@ def fresh_engine():
     time_state = create_simulator_time(current_time=initial_time)
     
     # Create environment with all implemented modality states
-    from tests.fixtures.modalities import location, time as time_mod, weather, chat, email, calendar, sms
+    from tests.fixtures.modalities import location, time as time_mod, weather, chat, email, calendar, sms, filesystem, slack, discord, social, screen
     
     environment = create_environment(
         modality_states={
@@ -60,6 +61,11 @@ def fresh_engine():
             "email": email.create_email_state(),
             "calendar": calendar.create_calendar_state(),
             "sms": sms.create_sms_state(),
+            "filesystem": filesystem.create_filesystem_state(),
+            "slack": slack.create_slack_state(),
+            "discord": discord.create_discord_state(),
+            "social": social.create_social_state(),
+            "screen": screen.create_screen_state(),
         },
         time_state=time_state,
     )
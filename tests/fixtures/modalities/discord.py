@@ -0,0 +1,71 @@
+"""Fixtures for Discord modality."""
+
+from datetime import datetime, timedelta, timezone
+
+from models.modalities.discord_input import DiscordInput
+from models.modalities.discord_state import DiscordState
+
+
+def create_discord_input(
+    operation: str = "post_message",
+    channel_id: str | None = "general",
+    author: str | None = "alice",
+    text: str | None = "Hello, team!",
+    timestamp: datetime | None = None,
+    **kwargs,
+) -> DiscordInput:
+    """Create a DiscordInput with sensible defaults.
+
+    Args:
+        operation: Discord operation (default: post_message).
+        channel_id: Channel the operation applies to.
+        author: Message author for post_message.
+        text: Message text for post_message and edit_message.
+        timestamp: When the event occurred (defaults to now).
+        **kwargs: Additional fields to override.
+
+    Returns:
+        DiscordInput instance ready for testing.
+    """
+    return DiscordInput(
+        operation=operation,
+        channel_id=channel_id,
+        author=author,
+        text=text,
+        timestamp=timestamp or datetime.now(timezone.utc),
+        **kwargs,
+    )
+
+
+def create_discord_state(
+    messages: dict[str, list[tuple[str, str]]] | None = None,
+    last_updated: datetime | None = None,
+    **kwargs,
+) -> DiscordState:
+    """Create a DiscordState, optionally populated with messages.
+
+    Messages are posted one second apart, starting at last_updated.
+
+    Args:
+        messages: Mapping of channel ID to (author, text) pairs to post.
+        last_updated: When state was last updated (defaults to now).
+        **kwargs: Additional fields to override.
+
+    Returns:
+        DiscordState instance ready for testing.
+    """
+    timestamp = last_updated or datetime.now(timezone.utc)
+    state = DiscordState(last_updated=timestamp, **kwargs)
+    for channel_id, posts in (messages or {}).items():
+        for author, text in posts:
+            state.apply_input(
+                DiscordInput(
+                    operation="post_message",
+                    channel_id=channel_id,
+                    author=author,
+                    text=text,
+                    timestamp=timestamp,
+                )
+            )
+            timestamp += timedelta(seconds=1)
+    return state
@@ -0,0 +1,70 @@
+"""Fixtures for File System modality."""
+
+import base64
+from datetime import datetime, timezone
+
+from models.modalities.filesystem_input import FileSystemInput
+from models.modalities.filesystem_state import FileSystemState
+
+
+def create_filesystem_input(
+    operation: str = "write",
+    path: str = "/docs/notes.txt",
+    content: str | None = "Hello, world!",
+    timestamp: datetime | None = None,
+    **kwargs,
+) -> FileSystemInput:
+    """Create a FileSystemInput with sensible defaults.
+
+    Args:
+        operation: File system operation (default: write).
+        path: Path the operation applies to.
+        content: File content for write and append.
+        timestamp: When the change occurred (defaults to now).
+        **kwargs: Additional fields to override.
+
+    Returns:
+        FileSystemInput instance ready for testing.
+    """
+    return FileSystemInput(
+        operation=operation,
+        path=path,
+        content=content,
+        timestamp=timestamp or datetime.now(timezone.utc),
+        **kwargs,
+    )
+
+
+def create_filesystem_state(
+    files: dict[str, str | bytes] | None = None,
+    last_updated: datetime | None = None,
+    **kwargs,
+) -> FileSystemState:
+    """Create a FileSystemState, optionally populated with files.
+
+    Args:
+        files: Mapping of absolute path to content to write.
+        last_updated: When state was last updated (defaults to now).
+        **kwargs: Additional fields to override.
+
+    Returns:
+        FileSystemState instance ready for testing.
+    """
+    timestamp = last_updated or datetime.now(timezone.utc)
+    state = FileSystemState(last_updated=timestamp, **kwargs)
+    for path, content in (files or {}).items():
+        if isinstance(content, bytes):
+            content = base64.b64encode(content).decode("ascii")
+            encoding = "base64"
+        else:
+            encoding = "utf-8"
+        state.apply_input(
+            FileSystemInput(
+                operation="write",
+                path=path,
+                content=content,
+                encoding=encoding,
+                timestamp=timestamp,
+            )
+        )
+    return state
@@ -0,0 +1,87 @@
+"""Fixtures for screen modality."""
+
+from datetime import datetime, timezone
+
+from models.modalities.screen_input import ScreenElement, ScreenInput
+from models.modalities.screen_state import ScreenState
+
+
+def create_screen_element(role: str = "button", **kwargs) -> ScreenElement:
+    """Create a ScreenElement with sensible defaults.
+
+    Args:
+        role: Accessibility role (default: button).
+        **kwargs: Additional fields to override.
+
+    Returns:
+        ScreenElement instance ready for testing.
+    """
+    return ScreenElement(role=role, **kwargs)
+
+
+def create_login_elements() -> dict[str, ScreenElement]:
+    """Return the UI tree of a simple login form."""
+    return {
+        "form": ScreenElement(role="form", name="Sign in"),
+        "username": ScreenElement(role="textbox", name="Username", value="", parent_id="form"),
+        "password": ScreenElement(role="textbox", name="Password", value="", parent_id="form"),
+        "submit": ScreenElement(role="button", name="Sign in", parent_id="form"),
+    }
+
+
+def create_screen_input(
+    interaction_type: str = "click",
+    target_element: str | None = "submit",
+    timestamp: datetime | None = None,
+    **kwargs,
+) -> ScreenInput:
+    """Create a ScreenInput with sensible defaults.
+
+    Args:
+        interaction_type: Interaction (default: click).
+        target_element: Element interacted with.
+        timestamp: When the event occurred (defaults to now).
+        **kwargs: Additional fields to override.
+
+    Returns:
+        ScreenInput instance ready for testing.
+    """
+    return ScreenInput(
+        interaction_type=interaction_type,
+        target_element=target_element,
+        timestamp=timestamp or datetime.now(timezone.utc),
+        **kwargs,
+    )
+
+
+def create_screen_state(
+    app: str | None = None,
+    elements: dict[str, ScreenElement] | None = None,
+    last_updated: datetime | None = None,
+    **kwargs,
+) -> ScreenState:
+    """Create a ScreenState, optionally showing a rendered screen.
+
+    Args:
+        app: Application to render at last_updated (leave None for an
+            empty screen).
+        elements: UI tree to render (defaults to a login form).
+        last_updated: When state was last updated (defaults to now).
+        **kwargs: Additional fields to override.
+
+    Returns:
+        ScreenState instance ready for testing.
+    """
+    timestamp = last_updated or datetime.now(timezone.utc)
+    state = ScreenState(last_updated=timestamp, **kwargs)
+    if app is not None:
+        state.apply_input(
+            ScreenInput(
+                interaction_type="render",
+                app=app,
+                window="main",
+                elements=elements if elements is not None else create_login_elements(),
+                timestamp=timestamp,
+            )
+        )
+    return state
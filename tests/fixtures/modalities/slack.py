@@ -0,0 +1,71 @@
+"""Fixtures for Slack modality."""
+
+from datetime import datetime, timedelta, timezone
+
+from models.modalities.slack_input import SlackInput
+from models.modalities.slack_state import SlackState
+
+
+def create_slack_input(
+    operation: str = "post_message",
+    channel_id: str | None = "general",
+    author: str | None = "alice",
+    text: str | None = "Hello, team!",
+    timestamp: datetime | None = None,
+    **kwargs,
+) -> SlackInput:
+    """Create a SlackInput with sensible defaults.
+
+    Args:
+        operation: Slack operation (default: post_message).
+        channel_id: Channel the operation applies to.
+        author: Message author for post_message.
+        text: Message text for post_message and edit_message.
+        timestamp: When the event occurred (defaults to now).
+        **kwargs: Additional fields to override.
+
+    Returns:
+        SlackInput instance ready for testing.
+    """
+    return SlackInput(
+        operation=operation,
+        channel_id=channel_id,
+        author=author,
+        text=text,
+        timestamp=timestamp or datetime.now(timezone.utc),
+        **kwargs,
+    )
+
+
+def create_slack_state(
+    messages: dict[str, list[tuple[str, str]]] | None = None,
+    last_updated: datetime | None = None,
+    **kwargs,
+) -> SlackState:
+    """Create a SlackState, optionally populated with messages.
+
+    Messages are posted one second apart, starting at last_updated.
+
+    Args:
+        messages: Mapping of channel ID to (author, text) pairs to post.
+        last_updated: When state was last updated (defaults to now).
+        **kwargs: Additional fields to override.
+
+    Returns:
+        SlackState instance ready for testing.
+    """
+    timestamp = last_updated or datetime.now(timezone.utc)
+    state = SlackState(last_updated=timestamp, **kwargs)
+    for channel_id, posts in (messages or {}).items():
+        for author, text in posts:
+            state.apply_input(
+                SlackInput(
+                    operation="post_message",
+                    channel_id=channel_id,
+                    author=author,
+                    text=text,
+                    timestamp=timestamp,
+                )
+            )
+            timestamp += timedelta(seconds=1)
+    return state
@@ -0,0 +1,80 @@
+"""Fixtures for social media modality."""
+
+from datetime import datetime, timedelta, timezone
+
+from models.modalities.social_input import SocialMediaInput
+from models.modalities.social_state import SocialMediaState
+
+
+def create_social_input(
+    operation: str = "post",
+    user_id: str = "alice",
+    content: str | None = "Hello, world!",
+    timestamp: datetime | None = None,
+    **kwargs,
+) -> SocialMediaInput:
+    """Create a SocialMediaInput with sensible defaults.
+
+    Args:
+        operation: Social media operation (default: post).
+        user_id: User performing the operation.
+        content: Post text for post, reply and repost.
+        timestamp: When the event occurred (defaults to now).
+        **kwargs: Additional fields to override.
+
+    Returns:
+        SocialMediaInput instance ready for testing.
+    """
+    return SocialMediaInput(
+        operation=operation,
+        user_id=user_id,
+        content=content,
+        timestamp=timestamp or datetime.now(timezone.utc),
+        **kwargs,
+    )
+
+
+def create_social_state(
+    posts: list[tuple[str, str, str]] | None = None,
+    following: dict[str, list[str]] | None = None,
+    last_updated: datetime | None = None,
+    **kwargs,
+) -> SocialMediaState:
+    """Create a SocialMediaState, optionally populated with follows and posts.
+
+    Follows are added first; posts are then written one minute apart,
+    starting at last_updated.
+
+    Args:
+        posts: (post_id, author, content) triples to post.
+        following: Mapping of user ID to the users they follow.
+        last_updated: When state was last updated (defaults to now).
+        **kwargs: Additional fields to override.
+
+    Returns:
+        SocialMediaState instance ready for testing.
+    """
+    timestamp = last_updated or datetime.now(timezone.utc)
+    state = SocialMediaState(last_updated=timestamp, **kwargs)
+    for user_id, targets in (following or {}).items():
+        for target in targets:
+            state.apply_input(
+                SocialMediaInput(
+                    operation="follow",
+                    user_id=user_id,
+                    target_user_id=target,
+                    timestamp=timestamp,
+                )
+            )
+    for post_id, author, content in posts or []:
+        state.apply_input(
+            SocialMediaInput(
+                operation="post",
+                user_id=author,
+                content=content,
+                post_id=post_id,
+                timestamp=timestamp,
+            )
+        )
+        timestamp += timedelta(minutes=1)
+    return state
@@ -1,14 +1,27 @@
 """Fixtures for Weather modality."""
 
+import threading
+import time
 from datetime import datetime, timezone
 
+import pytest
+import uvicorn
+
 from models.modalities.weather_input import (
     WeatherInput,
     WeatherReport,
     CurrentWeather,
+    DailyFeelsLike,
+    DailyForecast,
+    DailyTemperature,
+    HourlyForecast,
+    MinutelyForecast,
+    WeatherAlert,
     WeatherCondition,
 )
+from models.modalities.weather_provider import WeatherProvider, set_weather_provider
 from models.modalities.weather_state import WeatherState
+from scenarios.openweather import ONECALL_PATH, create_app
 
 
 def create_weather_input(
@@ -91,6 +104,111 @@ def create_weather_state(
     )
 
 
+def create_forecast_report(
+    latitude: float = 37.7749,
+    longitude: float = -122.4194,
+    dt: int = 1735732800,
+) -> WeatherReport:
+    """Create a WeatherReport with every section filled in.
+
+    Includes minutely, hourly and daily forecasts and an alert, with some
+    optional fields left as None, for tests of forecast handling.
+
+    Args:
+        latitude: Location latitude (default: San Francisco).
+        longitude: Location longitude (default: San Francisco).
+        dt: Unix timestamp of the report (default: 2025-01-01 12:00 UTC).
+
+    Returns:
+        WeatherReport in standard units.
+    """
+    clear = WeatherCondition(id=800, main="Clear", description="clear sky", icon="01d")
+    rain = WeatherCondition(id=500, main="Rain", description="light rain", icon="10d")
+    return WeatherReport(
+        lat=latitude,
+        lon=longitude,
+        timezone="America/Los_Angeles",
+        timezone_offset=-28800,
+        current=CurrentWeather(
+            dt=dt,
+            sunrise=dt - 3600,
+            sunset=dt + 36000,
+            temp=288.15,
+            feels_like=287.15,
+            pressure=1013,
+            humidity=60,
+            dew_point=280.15,
+            uvi=3.0,
+            clouds=20,
+            visibility=10000,
+            wind_speed=3.5,
+            wind_deg=180,
+            wind_gust=6.0,
+            weather=[clear],
+        ),
+        minutely=[
+            MinutelyForecast(dt=dt + 60 * minute, precipitation=0.1 * minute)
+            for minute in range(3)
+        ],
+        hourly=[
+            HourlyForecast(
+                dt=dt + 3600 * hour,
+                temp=285.0 + hour,
+                feels_like=284.0 + hour,
+                pressure=1010,
+                humidity=70,
+                dew_point=279.0,
+                uvi=1.5,
+                clouds=40,
+                visibility=None if hour == 1 else 9000,
+                wind_speed=4.0,
+                wind_deg=90,
+                wind_gust=None if hour == 1 else 7.0,
+                weather=[rain, clear] if hour == 2 else [clear],
+                pop=0.2,
+                rain={"1h": 0.5} if hour == 2 else None,
+            )
+            for hour in range(4)
+        ],
+        daily=[
+            DailyForecast(
+                dt=dt + 86400 * day,
+                sunrise=dt + 86400 * day - 3600,
+                sunset=dt + 86400 * day + 36000,
+                moonrise=dt + 86400 * day + 7200,
+                moonset=dt + 86400 * day + 50000,
+                moon_phase=0.25,
+                summary=None if day else "Rain in the afternoon",
+                temp=DailyTemperature(
+                    day=290.0, min=282.0, max=293.0, night=284.0, eve=288.0, morn=283.0
+                ),
+                feels_like=DailyFeelsLike(day=289.0, night=283.0, eve=287.0, morn=282.0),
+                pressure=1012,
+                humidity=55,
+                dew_point=281.0,
+                wind_speed=5.0,
+                wind_deg=200,
+                weather=[rain],
+                clouds=75,
+                pop=0.6,
+                rain=2.5 if day else None,
+                uvi=4.0,
+            )
+            for day in range(2)
+        ],
+        alerts=[
+            WeatherAlert(
+                sender_name="NWS San Francisco",
+                event="Wind Advisory",
+                start=dt,
+                end=dt + 21600,
+                description="Gusty winds expected.",
+                tags=["Wind"],
+            )
+        ],
+    )
+
+
 # Pre-built weather examples
 CLEAR_WEATHER = create_weather_input()
 
@@ -248,3 +366,37 @@ WEATHER_JSON_EXAMPLES = {
         },
     },
 }
+
+
+# Pytest fixtures for use in tests
+@pytest.fixture
+def openweather_standin():
+    """Serve the OpenWeather stand-in locally and fetch real weather from it.
+
+    Runs scenarios.openweather on a free port in a background thread and
+    makes a WeatherProvider for it the shared provider.
+
+    Yields:
+        Tuple of (stand-in app, provider). app.state.requests counts the
+        requests served and app.state.latency delays each response.
+    """
+    app = create_app()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("OpenWeather stand-in did not start")
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    provider = WeatherProvider(base_url=f"http://127.0.0.1:{port}{ONECALL_PATH}")
+    set_weather_provider(provider)
+    try:
+        yield app, provider
+    finally:
+        set_weather_provider(None)
+        server.should_exit = True
+        thread.join()
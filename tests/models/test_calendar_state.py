@@ -802,6 +802,46 @@ class TestCalendarStateQuery:
         assert result["count"] == 5
 
 
+class TestCalendarStateCursorIndex:
+    """Test the sorted index behind cursor queries.
+
+    MODALITY-SPECIFIC: Updates can change an event's sort keys.
+    """
+
+    def test_rescheduled_event_moves_in_cursor_order(self):
+        """MODALITY-SPECIFIC: Verify a changed start is seen by the next page."""
+        state = CalendarState(
+            last_updated=datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc),
+        )
+        for i in range(3):
+            state.apply_input(
+                CalendarInput(
+                    timestamp=datetime(2025, 1, 1, 13, 0, tzinfo=timezone.utc),
+                    operation="create",
+                    event_id=f"event-{i}",
+                    title=f"Event {i}",
+                    start=datetime(2025, 1, 15 + i, 14, 0, tzinfo=timezone.utc),
+                    end=datetime(2025, 1, 15 + i, 15, 0, tzinfo=timezone.utc),
+                )
+            )
+        query = {"sort_by": "start", "sort_order": "asc", "limit": 1}
+        cursor = state.query(query)["next_cursor"]
+        state.query({**query, "cursor": cursor})
+
+        state.apply_input(
+            CalendarInput(
+                timestamp=datetime(2025, 1, 1, 14, 0, tzinfo=timezone.utc),
+                operation="update",
+                event_id="event-2",
+                start=datetime(2025, 1, 14, 14, 0, tzinfo=timezone.utc),
+                end=datetime(2025, 1, 14, 15, 0, tzinfo=timezone.utc),
+            )
+        )
+        page = state.query({"sort_by": "start", "sort_order": "asc", "cursor": cursor})
+
+        assert [e.event_id for e in page["events"]] == ["event-1"]
+
+
 class TestCalendarStateHelperMethods:
     """Test CalendarState helper methods.
 
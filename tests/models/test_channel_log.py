@@ -0,0 +1,262 @@
+"""Unit tests for ChannelLog, the segmented message log of team chat channels."""
+
+import copy
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.modalities.channel_log import SEGMENT_SIZE, ChannelLog
+
+START = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _filled_log(count: int, step: timedelta = timedelta(seconds=1)) -> ChannelLog:
+    """Return a log of count messages by alternating authors, step apart."""
+    log = ChannelLog()
+    for seq in range(count):
+        log.append(("alice", "bob")[seq % 2], f"message {seq}", START + seq * step)
+    return log
+
+
+class TestAppend:
+    """Test appending messages and reading them back."""
+
+    def test_append_returns_consecutive_seqs(self):
+        """Test each message is numbered by its position."""
+        log = ChannelLog()
+
+        assert log.append("alice", "first", START) == 0
+        assert log.append("bob", "second", START) == 1
+        assert len(log) == 2
+
+    def test_message_round_trip(self):
+        """Test the fields of an appended message."""
+        log = ChannelLog()
+        log.append("alice", "héllo ✓", START)
+
+        message = log.message(0)
+        assert message["author"] == "alice"
+        assert message["text"] == "héllo ✓"
+        assert message["timestamp"] == START.isoformat()
+        assert message["thread_seq"] is None
+        assert message["deleted"] is False
+        assert message["reactions"] == {}
+
+    def test_out_of_order_timestamp_rejected(self):
+        """Test messages must be appended in time order."""
+        log = ChannelLog()
+        log.append("alice", "later", START)
+
+        with pytest.raises(ValueError, match="time order"):
+            log.append("bob", "earlier", START - timedelta(seconds=1))
+
+    def test_naive_timestamp_treated_as_utc(self):
+        """Test naive datetimes are read as UTC."""
+        log = ChannelLog()
+        log.append("alice", "hi", START.replace(tzinfo=None))
+
+        assert log.timestamp(0) == START
+
+    def test_spans_segments(self):
+        """Test messages past one segment are stored and read back."""
+        log = _filled_log(SEGMENT_SIZE * 2 + 3)
+
+        assert len(log) == SEGMENT_SIZE * 2 + 3
+        assert log.text(SEGMENT_SIZE) == f"message {SEGMENT_SIZE}"
+        assert log.author(SEGMENT_SIZE * 2 + 2) == "alice"
+        assert log.validate() == []
+
+    def test_missing_seq_raises(self):
+        """Test reading a seq outside the log raises ValueError."""
+        log = _filled_log(2)
+
+        with pytest.raises(ValueError, match="not found"):
+            log.message(2)
+        with pytest.raises(ValueError, match="not found"):
+            log.text(-1)
+
+
+class TestThreadsAndMentions:
+    """Test the thread and mention indexes."""
+
+    def test_replies_indexed_under_root(self):
+        """Test replies, including replies to replies, join the root's thread."""
+        log = ChannelLog()
+        root = log.append("alice", "root", START)
+        reply = log.append("bob", "reply", START, thread=root)
+        nested = log.append("carol", "reply to reply", START, thread=reply)
+
+        assert log.replies(root) == [reply, nested]
+        assert log.thread_root(nested) == root
+        assert log.message(root)["reply_count"] == 2
+
+    def test_mentions_after_cursor(self):
+        """Test mention lookups start after a seq."""
+        log = ChannelLog()
+        log.append("alice", "hi bob", START, mentions=["bob"])
+        log.append("alice", "hi carol", START, mentions=["carol"])
+        log.append("carol", "hi bob", START, mentions=["bob", "bob"])
+
+        assert log.mentions("bob") == [0, 2]
+        assert log.mentions("bob", after=0) == [2]
+        assert log.mentions("dave") == []
+
+    def test_deleted_message_leaves_mention_index(self):
+        """Test deleting and restoring a message updates mentions and counts."""
+        log = ChannelLog()
+        log.append("alice", "hi bob", START, mentions=["bob"])
+        log.append("alice", "again", START)
+
+        log.set_deleted(0, True, mentions=["bob"])
+        assert log.mentions("bob") == []
+        assert log.count_after(-1) == 1
+
+        log.set_deleted(0, False, mentions=["bob"])
+        assert log.mentions("bob") == [0]
+        assert log.count_after(-1) == 2
+
+    def test_update_mentions_after_edit(self):
+        """Test edits keep the original text and move mentions."""
+        log = ChannelLog()
+        log.append("alice", "hi bob", START, mentions=["bob"])
+
+        log.edit(0, "hi carol", START + timedelta(minutes=1))
+        log.update_mentions(0, ["bob"], ["carol"])
+
+        assert log.text(0) == "hi carol"
+        assert log.edited_at(0) == START + timedelta(minutes=1)
+        assert log.mentions("bob") == []
+        assert log.mentions("carol") == [0]
+        assert log.to_list()[0]["original_text"] == "hi bob"
+
+
+class TestLookups:
+    """Test time lookups, counts and selection."""
+
+    def test_seq_at_across_segments(self):
+        """Test finding the first message at or after a time."""
+        log = _filled_log(SEGMENT_SIZE + 10)
+
+        assert log.seq_at(START - timedelta(days=1)) == 0
+        assert log.seq_at(START + timedelta(seconds=5)) == 5
+        assert log.seq_at(START + timedelta(seconds=SEGMENT_SIZE + 2)) == SEGMENT_SIZE + 2
+        assert log.seq_at(START + timedelta(days=1)) == len(log)
+
+    def test_seq_at_with_equal_timestamps(self):
+        """Test the first of several messages at the same time is found."""
+        log = ChannelLog()
+        log.append("alice", "a", START)
+        log.append("alice", "b", START + timedelta(seconds=1))
+        log.append("alice", "c", START + timedelta(seconds=1))
+
+        assert log.seq_at(START + timedelta(seconds=1)) == 1
+
+    def test_count_after(self):
+        """Test counting messages after a read cursor."""
+        log = _filled_log(10)
+
+        assert log.count_after(-1) == 10
+        assert log.count_after(6) == 3
+        assert log.count_after(9) == 0
+
+    def test_select_range_and_order(self):
+        """Test selecting a seq range forwards and backwards."""
+        log = _filled_log(SEGMENT_SIZE + 5)
+
+        assert log.select(2, 5) == [2, 3, 4]
+        assert log.select(reverse=True, limit=3) == [
+            SEGMENT_SIZE + 4,
+            SEGMENT_SIZE + 3,
+            SEGMENT_SIZE + 2,
+        ]
+        assert log.select(SEGMENT_SIZE - 1, SEGMENT_SIZE + 1) == [
+            SEGMENT_SIZE - 1,
+            SEGMENT_SIZE,
+        ]
+
+    def test_select_filters(self):
+        """Test author, thread, deletion and text filters."""
+        log = ChannelLog()
+        log.append("alice", "Deploy done", START)
+        log.append("bob", "nice", START, thread=0)
+        log.append("bob", "deploy again?", START)
+        log.append("alice", "gone", START)
+        log.set_deleted(3, True)
+
+        assert log.select(author="bob") == [1, 2]
+        assert log.select(author="nobody") == []
+        assert log.select(top_level=True) == [0, 2]
+        assert log.select(search="DEPLOY") == [0, 2]
+        assert log.select(include_deleted=True) == [0, 1, 2, 3]
+
+    def test_select_limit_zero(self):
+        """Test a zero limit selects nothing."""
+        assert _filled_log(3).select(limit=0) == []
+
+
+class TestChanges:
+    """Test reactions, undoing appends and copies."""
+
+    def test_reactions_are_copied(self):
+        """Test reactions are set and returned as copies."""
+        log = _filled_log(1)
+        log.set_reactions(0, {"thumbsup": ["bob"], "eyes": []})
+
+        reactions = log.reactions(0)
+        reactions["thumbsup"].append("carol")
+        assert log.reactions(0) == {"thumbsup": ["bob"]}
+
+    def test_pop_removes_latest_and_indexes(self):
+        """Test pop undoes an append including its index entries."""
+        log = ChannelLog()
+        log.append("alice", "root", START)
+        log.append("bob", "hi alice", START, thread=0, mentions=["alice"])
+
+        log.pop(mentions=["alice"])
+
+        assert len(log) == 1
+        assert log.replies(0) == []
+        assert log.mentions("alice") == []
+        assert log.select() == [0]
+
+    def test_pop_across_segment_boundary(self):
+        """Test popping the first message of a segment drops the segment."""
+        log = _filled_log(SEGMENT_SIZE + 1)
+
+        log.pop()
+
+        assert log == _filled_log(SEGMENT_SIZE)
+        assert log.last_time == START + timedelta(seconds=SEGMENT_SIZE - 1)
+
+    def test_pop_empty_raises(self):
+        """Test popping an empty log raises ValueError."""
+        with pytest.raises(ValueError, match="empty"):
+            ChannelLog().pop()
+
+    def test_deepcopy_is_independent(self):
+        """Test copies do not share columns or indexes."""
+        log = _filled_log(3)
+        copied = copy.deepcopy(log)
+        copied.append("carol", "new", START + timedelta(minutes=1), thread=0)
+        copied.set_deleted(1, True)
+
+        assert len(log) == 3
+        assert log.replies(0) == []
+        assert not log.is_deleted(1)
+
+    def test_list_round_trip(self):
+        """Test to_list() and from_list() rebuild an equal log."""
+        log = ChannelLog()
+        log.append("alice", "hi <@bob>", START, mentions=["bob"])
+        log.append("bob", "reply", START, thread=0)
+        log.edit(1, "edited", START + timedelta(seconds=5))
+        log.set_reactions(0, {"tada": ["carol"]})
+        log.append("carol", "oops", START)
+        log.set_deleted(2, True)
+
+        restored = ChannelLog.from_list(log.to_list())
+
+        assert restored == log
+        assert restored.mentions("bob") == [0]
+        assert restored.is_deleted(2)
+        assert restored.validate() == []
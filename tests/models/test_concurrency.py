@@ -0,0 +1,226 @@
+"""Unit tests for the ReadWriteLock in models/concurrency.py."""
+
+import threading
+from datetime import timedelta
+
+import pytest
+
+from models.concurrency import ReadWriteLock
+from models.event import EventStatus
+from models.simulation import SimulationEngine
+from tests.fixtures.core.environments import create_environment
+from tests.fixtures.core.events import create_simulator_event
+from tests.fixtures.core.queues import create_event_queue
+from tests.fixtures.modalities import location
+
+
+def _create_engine() -> SimulationEngine:
+    """Create a SimulationEngine with a minimal environment and empty queue."""
+    return SimulationEngine(
+        environment=create_environment(), event_queue=create_event_queue()
+    )
+
+
+def _start(target) -> threading.Thread:
+    """Start a daemon thread running target."""
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestReadWriteLock:
+    """Test reader/writer semantics."""
+
+    def test_readers_share_the_lock(self):
+        """Verify several threads can hold the read lock at once."""
+        lock = ReadWriteLock()
+        inside = threading.Barrier(3, timeout=5)
+
+        def read():
+            with lock.read():
+                inside.wait()
+
+        threads = [_start(read) for _ in range(2)]
+        inside.wait()
+        assert lock.readers == 2
+
+        for thread in threads:
+            thread.join(timeout=5)
+        assert lock.readers == 0
+
+    def test_writer_excludes_readers(self):
+        """Verify readers wait until the writer releases the lock."""
+        lock = ReadWriteLock()
+        acquired = threading.Event()
+
+        def read():
+            with lock.read():
+                acquired.set()
+
+        with lock.write():
+            thread = _start(read)
+            assert not acquired.wait(0.05)
+
+        assert acquired.wait(5)
+        thread.join(timeout=5)
+
+    def test_writer_waits_for_readers(self):
+        """Verify a writer waits until active readers finish."""
+        lock = ReadWriteLock()
+        acquired = threading.Event()
+
+        def write():
+            with lock.write():
+                acquired.set()
+
+        with lock.read():
+            thread = _start(write)
+            assert not acquired.wait(0.05)
+
+        assert acquired.wait(5)
+        thread.join(timeout=5)
+
+    def test_waiting_writer_blocks_new_readers(self):
+        """Verify a queued writer goes before readers that arrive after it."""
+        lock = ReadWriteLock()
+        order = []
+
+        def write():
+            with lock.write():
+                order.append("write")
+
+        def read():
+            with lock.read():
+                order.append("read")
+
+        with lock.read():
+            writer = _start(write)
+            while not lock._writers_waiting:
+                pass
+            reader = _start(read)
+            reader.join(timeout=0.05)
+            assert order == []
+
+        writer.join(timeout=5)
+        reader.join(timeout=5)
+        assert order == ["write", "read"]
+
+    def test_lock_is_reentrant(self):
+        """Verify nested reads, nested writes, and reads inside writes."""
+        lock = ReadWriteLock()
+
+        with lock.read():
+            with lock.read():
+                assert lock.readers == 1
+        assert lock.readers == 0
+
+        with lock.write():
+            with lock.write():
+                with lock.read():
+                    assert lock.write_locked
+            assert lock.write_locked
+        assert not lock.write_locked
+
+    def test_write_owned_is_per_thread(self):
+        """Verify write_owned is only true on the writing thread."""
+        lock = ReadWriteLock()
+        seen = []
+
+        with lock.write():
+            assert lock.write_owned
+            thread = threading.Thread(target=lambda: seen.append(lock.write_owned))
+            thread.start()
+            thread.join()
+        assert seen == [False]
+        assert not lock.write_owned
+
+    def test_upgrade_is_rejected(self):
+        """Verify a reader cannot take the write lock."""
+        lock = ReadWriteLock()
+
+        with lock.read():
+            with pytest.raises(RuntimeError, match="upgrade"):
+                lock.acquire_write()
+
+        assert lock.readers == 0
+        assert not lock._writers_waiting
+
+    def test_release_without_acquire_is_rejected(self):
+        """Verify releasing an unheld lock raises."""
+        lock = ReadWriteLock()
+
+        with pytest.raises(RuntimeError):
+            lock.release_read()
+        with pytest.raises(RuntimeError):
+            lock.release_write()
+
+
+class TestEngineWriterPath:
+    """Test that engine mutations go through the write lock."""
+
+    def test_immediate_events_wait_for_readers(self):
+        """Verify execute_immediate_event does not run while state is being read."""
+        engine = _create_engine()
+        event = create_simulator_event(
+            scheduled_time=engine.environment.time_state.current_time,
+            modality="location",
+            data=location.create_location_input(),
+        )
+
+        with engine.operation_lock.read():
+            thread = _start(lambda: engine.execute_immediate_event(event))
+            thread.join(timeout=0.05)
+            assert thread.is_alive()
+            assert engine.undo_stack.undo_count == 0
+
+        thread.join(timeout=5)
+        assert engine.undo_stack.undo_count == 1
+
+    def test_readers_and_writers_against_auto_advance(self):
+        """Verify many threads reading and writing while ticking stay consistent."""
+        engine = _create_engine()
+        current_time = engine.environment.time_state.current_time
+        for i in range(50):
+            engine.add_event(
+                create_simulator_event(
+                    scheduled_time=current_time + timedelta(seconds=i + 1),
+                    modality="location",
+                    data=location.create_location_input(),
+                )
+            )
+        engine.start(auto_advance=True, time_scale=100.0)
+        errors = []
+
+        def write(i):
+            try:
+                for _ in range(20):
+                    engine.execute_immediate_event(
+                        create_simulator_event(
+                            scheduled_time=engine.environment.time_state.current_time,
+                            modality="location",
+                            data=location.create_location_input(),
+                        )
+                    )
+            except Exception as e:
+                errors.append(e)
+
+        def read():
+            try:
+                for _ in range(50):
+                    with engine.operation_lock.read():
+                        engine.environment.get_state("location").model_dump()
+                        engine.query_events()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [_start(lambda i=i: write(i)) for i in range(4)]
+        threads += [_start(read) for _ in range(8)]
+        for thread in threads:
+            thread.join(timeout=30)
+        engine.stop()
+
+        assert errors == []
+        assert len(engine.event_queue.events) == 130
+        executed = len(engine.event_queue.get_events_by_status(EventStatus.EXECUTED))
+        assert engine.undo_stack.undo_count == executed
+        assert executed >= 80
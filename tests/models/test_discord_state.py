@@ -0,0 +1,77 @@
+"""Unit tests for DiscordState.
+
+Discord shares its behavior with Slack through TeamChatState, which
+test_slack_state.py covers; these tests cover what differs.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.modalities.discord_input import DiscordInput
+from models.modalities.discord_state import DiscordState
+from tests.fixtures.modalities.discord import create_discord_input, create_discord_state
+from tests.fixtures.modalities.slack import create_slack_input
+
+START = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class TestDiscordState:
+    """Test Discord-specific state behavior."""
+
+    def test_instantiation(self):
+        """Test a new state is a Discord state."""
+        state = DiscordState(last_updated=START)
+
+        assert state.modality_type == "discord"
+        assert state.input_class is DiscordInput
+
+    def test_slack_input_rejected(self):
+        """Test Slack inputs are not applied to Discord state."""
+        state = DiscordState(last_updated=START)
+
+        with pytest.raises(ValueError, match="DiscordInput"):
+            state.apply_input(create_slack_input())
+        with pytest.raises(ValueError, match="DiscordInput"):
+            state.create_undo_data(create_slack_input())
+
+    def test_channels_belong_to_servers(self):
+        """Test channel summaries report their server."""
+        state = DiscordState(last_updated=START)
+        state.apply_input(
+            create_discord_input(
+                operation="create_channel",
+                channel_id="111",
+                channel_name="general",
+                server_id="999",
+                timestamp=START,
+            )
+        )
+
+        summary = state.get_snapshot()["channels"][0]
+        assert summary["server_id"] == "999"
+        assert "workspace_id" not in summary
+        assert state.query({"space_id": "999"})["count"] == 1
+        assert state.query({"space_id": "other"})["count"] == 0
+
+    def test_nickname_mentions(self):
+        """Test Discord's "<@!id>" nickname mentions count as mentions."""
+        state = create_discord_state(
+            messages={"111": [("222", "<@!user> ready?")]}, last_updated=START
+        )
+
+        assert state.get_snapshot()["unread_mention_count"] == 1
+
+    def test_undo_post(self):
+        """Test undoing a post that created its channel removes the channel."""
+        state = DiscordState(last_updated=START)
+        discord_input = create_discord_input(
+            channel_id="111", timestamp=START + timedelta(seconds=1)
+        )
+        undo_data = state.create_undo_data(discord_input)
+        state.apply_input(discord_input)
+
+        state.apply_undo(undo_data)
+
+        assert state.channels == {}
+        assert state.update_count == 0
@@ -633,6 +633,67 @@ class TestEmailStateQuery:
         assert len(result["emails"]) == 2
 
 
+class TestEmailStateCursorIndex:
+    """Test reuse of the sorted index behind cursor queries.
+
+    MODALITY-SPECIFIC: Email sort keys never change after an email is stored.
+    """
+
+    def _state_with_cursor(self):
+        state = EmailState(last_updated=datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc))
+        for i in range(3):
+            state.apply_input(
+                EmailInput(
+                    timestamp=datetime(2025, 1, 1, 12 + i, 0, tzinfo=timezone.utc),
+                    operation="receive",
+                    from_address="sender@example.com",
+                    to_addresses=["you@example.com"],
+                    subject=f"Email {i}",
+                    body_text="Test",
+                    message_id=f"msg-{i}",
+                )
+            )
+        cursor = state.query({"limit": 1})["next_cursor"]
+        state.query({"limit": 1, "cursor": cursor})
+        return state, cursor
+
+    def test_read_toggle_keeps_index(self):
+        """MODALITY-SPECIFIC: Verify marking read does not rebuild the index."""
+        state, cursor = self._state_with_cursor()
+        indexes = list(state._sort_indexes._indexes.values())
+
+        state.apply_input(
+            EmailInput(
+                timestamp=datetime(2025, 1, 1, 15, 0, tzinfo=timezone.utc),
+                operation="mark_read",
+                message_id="msg-1",
+            )
+        )
+        page = state.query({"limit": 1, "cursor": cursor})
+
+        assert list(state._sort_indexes._indexes.values()) == indexes
+        assert [e["message_id"] for e in page["emails"]] == ["msg-1"]
+
+    def test_new_email_joins_index(self):
+        """MODALITY-SPECIFIC: Verify emails received after indexing are paged."""
+        state, cursor = self._state_with_cursor()
+
+        state.apply_input(
+            EmailInput(
+                timestamp=datetime(2025, 1, 1, 11, 0, tzinfo=timezone.utc),
+                operation="receive",
+                from_address="sender@example.com",
+                to_addresses=["you@example.com"],
+                subject="Older",
+                body_text="Test",
+                message_id="msg-old",
+            )
+        )
+        page = state.query({"cursor": cursor})
+
+        assert [e["message_id"] for e in page["emails"]] == ["msg-1", "msg-0", "msg-old"]
+
+
 class TestEmailStateSerialization:
     """Test EmailState serialization and deserialization.
 
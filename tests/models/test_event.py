@@ -10,6 +10,7 @@ import pytest
 
 from models.event import SimulatorEvent, EventStatus
 from models.environment import Environment
+from models.modalities.email_input import EmailInput
 from tests.fixtures.modalities.email import create_email_input, create_email_state
 from tests.fixtures.modalities.location import (
     create_location_input,
@@ -848,6 +849,140 @@ class TestSimulatorEventFromFixtures:
         assert past_event.scheduled_time < now
 
 
+class TestSimulatorEventValidateOnce:
+    """Test that an event's input is validated at most once.
+
+    EVENT-SPECIFIC: Tests the validated mark that lets queueing, execution,
+    undo capture and state updates share a single validate_input() call.
+    """
+
+    def _count_validations(self, monkeypatch, input_data) -> list:
+        """Record each validate_input() call made on input_data's class."""
+        calls = []
+        original = type(input_data).validate_input
+
+        def counting(self):
+            calls.append(self)
+            return original(self)
+
+        monkeypatch.setattr(type(input_data), "validate_input", counting)
+        return calls
+
+    def test_validate_then_execute_validates_once(self, monkeypatch):
+        """Verify validate() and execute() share one validate_input() call."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        email_input = create_email_input(operation="receive", timestamp=now)
+        calls = self._count_validations(monkeypatch, email_input)
+        event = SimulatorEvent(
+            scheduled_time=now, modality="email", data=email_input, created_at=now
+        )
+        environment = create_environment(
+            modality_states={"email": create_email_state(last_updated=now)},
+            time_state=create_simulator_time(current_time=now),
+        )
+
+        assert event.validate() == []
+        assert event.validate() == []
+        event.execute(environment)
+
+        assert event.status == EventStatus.EXECUTED
+        assert len(calls) == 1
+
+    def test_failed_validation_is_not_marked(self):
+        """Verify an input that fails validation is checked again next time."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        email_input = EmailInput(operation="mark_read", timestamp=now)
+
+        with pytest.raises(ValueError, match="requires message_id"):
+            email_input.ensure_valid()
+        assert email_input.is_validated is False
+
+        email_input.message_id = "msg-1"
+        email_input.ensure_valid()
+        assert email_input.is_validated is True
+
+    def test_updated_copies_are_not_marked(self):
+        """Verify copies with changed fields must be validated again."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        email_input = EmailInput(operation="mark_read", message_id="msg-1", timestamp=now)
+        email_input.ensure_valid()
+
+        assert email_input.model_copy().is_validated is True
+        updated = email_input.model_copy(update={"message_id": None})
+        assert updated.is_validated is False
+        with pytest.raises(ValueError, match="requires message_id"):
+            updated.ensure_valid()
+
+    def test_mark_validated_skips_validation(self, monkeypatch):
+        """Verify trusted inputs marked as validated are not checked."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        location_input = create_location_input(timestamp=now)
+        calls = self._count_validations(monkeypatch, location_input)
+
+        location_input.mark_validated().ensure_valid()
+
+        assert calls == []
+
+
+class TestSimulatorEventDictData:
+    """Test events whose data is a dict payload.
+
+    EVENT-SPECIFIC: Tests that dict payloads are parsed into typed inputs
+    on first use.
+    """
+
+    def test_dict_data_parsed_on_first_use(self):
+        """Verify a dumped input is parsed when the event needs it."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        location_input = create_location_input(timestamp=now)
+        event = SimulatorEvent(
+            scheduled_time=now,
+            modality="location",
+            data=location_input.model_dump(),
+            created_at=now,
+        )
+
+        assert isinstance(event.data, dict)
+        assert event.get_input() == location_input
+        assert event.data == location_input
+
+    def test_dict_data_executes(self):
+        """Verify an event with dict data executes like a typed one."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        event = SimulatorEvent(
+            scheduled_time=now,
+            modality="location",
+            data={"latitude": 40.7128, "longitude": -74.0060},
+            created_at=now,
+        )
+        location_state = create_location_state(last_updated=now - timedelta(hours=1))
+        environment = create_environment(
+            modality_states={"location": location_state},
+            time_state=create_simulator_time(current_time=now),
+        )
+
+        event.execute(environment)
+
+        assert event.status == EventStatus.EXECUTED
+        assert event.data.timestamp == now
+        assert location_state.current_latitude == 40.7128
+
+    def test_invalid_dict_data_reported(self):
+        """Verify dict data that is not a valid input is a validation error."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        event = SimulatorEvent(
+            scheduled_time=now,
+            modality="location",
+            data={"latitude": 100.0, "longitude": 0.0},
+            created_at=now,
+        )
+
+        errors = event.validate()
+
+        assert len(errors) == 1
+        assert "Invalid input data" in errors[0]
+
+
 class TestSimulatorEventEdgeCases:
     """Test edge cases and boundary conditions.
 
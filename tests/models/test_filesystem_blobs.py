@@ -0,0 +1,177 @@
+"""Unit tests for the content-addressed blob store."""
+
+import copy
+import hashlib
+import os
+import pickle
+
+import pytest
+
+from models.modalities.filesystem_blobs import (
+    CHUNK_MAX,
+    CHUNK_MIN,
+    PACK_NAME,
+    BlobStore,
+    chunk_boundaries,
+)
+
+
+def _random_bytes(size: int, seed: int = 0) -> bytes:
+    """Return reproducible pseudo-random bytes."""
+    import random
+
+    return random.Random(seed).randbytes(size)
+
+
+class TestChunkBoundaries:
+    """Test content-defined chunking."""
+
+    def test_empty_data_has_no_chunks(self):
+        """Test empty data produces no chunks."""
+        assert chunk_boundaries(b"") == []
+
+    def test_small_data_is_one_chunk(self):
+        """Test data up to CHUNK_MIN is a single chunk."""
+        assert chunk_boundaries(b"x" * CHUNK_MIN) == [CHUNK_MIN]
+
+    def test_chunk_sizes_are_bounded(self):
+        """Test every chunk but the last lies within the size bounds."""
+        data = _random_bytes(1024 * 1024)
+        ends = chunk_boundaries(data)
+        sizes = [b - a for a, b in zip([0] + ends, ends)]
+
+        assert ends[-1] == len(data)
+        assert all(CHUNK_MIN <= size <= CHUNK_MAX for size in sizes[:-1])
+        assert 0 < sizes[-1] <= CHUNK_MAX
+
+    def test_uniform_data_is_split_at_max_size(self):
+        """Test data without boundaries is split every CHUNK_MAX bytes."""
+        ends = chunk_boundaries(b"\0" * (3 * CHUNK_MAX + 10))
+        assert ends == [CHUNK_MAX, 2 * CHUNK_MAX, 3 * CHUNK_MAX, 3 * CHUNK_MAX + 10]
+
+    def test_boundaries_resynchronize_after_insertion(self):
+        """Test inserting bytes only changes the chunks around the insertion."""
+        data = _random_bytes(512 * 1024)
+        edited = data[:100_000] + b"inserted" + data[100_000:]
+
+        before = chunk_boundaries(data)
+        after = chunk_boundaries(edited)
+        shifted = {end - len(b"inserted") for end in after if end > 100_000}
+
+        # Boundaries well past the insertion are the same, shifted by its size
+        assert {end for end in before if end > 200_000} <= shifted
+
+
+class TestBlobStore:
+    """Test BlobStore storage and reads."""
+
+    def test_put_and_get(self):
+        """Test a stored chunk is read back by its SHA-256 digest."""
+        store = BlobStore()
+        digest = store.put(b"hello")
+
+        assert digest == hashlib.sha256(b"hello").hexdigest()
+        assert digest in store
+        assert store.get(digest) == b"hello"
+
+    def test_identical_chunks_stored_once(self):
+        """Test storing the same content twice stores it once."""
+        store = BlobStore()
+        data = _random_bytes(200_000)
+        store.write(data)
+        stored = store.stored_bytes
+        chunks = len(store)
+
+        store.write(data)
+
+        assert store.stored_bytes == stored == len(data)
+        assert len(store) == chunks
+
+    def test_edit_stores_only_changed_chunks(self):
+        """Test an edited copy adds little more than the chunks it changes."""
+        store = BlobStore()
+        data = _random_bytes(1024 * 1024)
+        store.write(data)
+
+        store.write(data[:500_000] + b"edit" + data[500_000:])
+
+        assert store.stored_bytes - len(data) <= 3 * CHUNK_MAX
+
+    def test_read_whole_and_ranges(self):
+        """Test reading whole contents and ranges spanning chunks."""
+        store = BlobStore()
+        data = _random_bytes(300_000)
+        digests, ends = store.write(data)
+
+        assert store.read(digests, ends) == data
+        assert store.read(digests, ends, 1000, 2000) == data[1000:2000]
+        assert store.read(digests, ends, ends[0] - 5, ends[1] + 5) == (
+            data[ends[0] - 5 : ends[1] + 5]
+        )
+        assert store.read(digests, ends, 299_990) == data[299_990:]
+
+    def test_read_clips_to_contents(self):
+        """Test reads past the end are clipped."""
+        store = BlobStore()
+        digests, ends = store.write(b"abcdef")
+
+        assert store.read(digests, ends, 4, 100) == b"ef"
+        assert store.read(digests, ends, 10) == b""
+        assert store.read([], []) == b""
+
+    def test_get_missing_chunk_raises(self):
+        """Test reading an unknown digest raises KeyError."""
+        with pytest.raises(KeyError):
+            BlobStore().get("0" * 64)
+
+    def test_reads_see_later_writes(self):
+        """Test chunks written after a read are readable through the map."""
+        store = BlobStore()
+        first = store.put(b"first")
+        assert store.get(first) == b"first"
+
+        digests, ends = store.write(b"second chunk")
+        assert store.read(digests, ends) == b"second chunk"
+
+    def test_reopen_directory(self, tmp_path):
+        """Test a store reopened from its directory finds its chunks."""
+        store = BlobStore(tmp_path)
+        digests, ends = store.write(b"persisted")
+        store.close()
+
+        reopened = BlobStore(tmp_path)
+        assert reopened.read(digests, ends) == b"persisted"
+        assert len(reopened) == 1
+
+    def test_partial_record_truncated_on_open(self, tmp_path):
+        """Test a record cut short by an interrupted write is dropped."""
+        store = BlobStore(tmp_path)
+        digest = store.put(b"complete")
+        store.close()
+        with open(tmp_path / PACK_NAME, "ab") as pack:
+            pack.write(b"\x01" * 20)
+
+        reopened = BlobStore(tmp_path)
+
+        assert len(reopened) == 1
+        assert reopened.get(digest) == b"complete"
+        assert os.path.getsize(tmp_path / PACK_NAME) == 36 + len(b"complete")
+
+    def test_copies_share_the_store(self, tmp_path):
+        """Test copying returns the same store and pickling reopens it."""
+        store = BlobStore(tmp_path)
+        digest = store.put(b"shared")
+
+        assert copy.copy(store) is store
+        assert copy.deepcopy(store) is store
+        restored = pickle.loads(pickle.dumps(store))
+        assert restored == store
+        assert restored.get(digest) == b"shared"
+
+    def test_temporary_store_cannot_be_pickled(self):
+        """Test pickling is refused when the directory dies with the store."""
+        store = BlobStore()
+        store.put(b"short-lived")
+
+        with pytest.raises(TypeError, match="temporary directory"):
+            pickle.dumps(store)
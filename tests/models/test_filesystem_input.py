@@ -0,0 +1,183 @@
+"""Unit tests for FileSystemInput.
+
+This test suite covers:
+1. General ModalityInput behavior (applicable to all modalities)
+2. File system-specific validation and features
+"""
+
+import base64
+
+import pytest
+from pydantic import ValidationError
+
+from models.modalities.filesystem_input import FileSystemInput, normalize_path
+from tests.fixtures.modalities.filesystem import create_filesystem_input
+
+
+class TestNormalizePath:
+    """Test path normalization."""
+
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("/", "/"),
+            ("/docs/", "/docs"),
+            ("//docs//a.txt", "/docs/a.txt"),
+            ("/docs/./a.txt", "/docs/a.txt"),
+            ("/docs/../a.txt", "/a.txt"),
+            ("/../..", "/"),
+        ],
+    )
+    def test_normalize(self, path, expected):
+        """Test paths are normalized."""
+        assert normalize_path(path) == expected
+
+    def test_relative_path_rejected(self):
+        """Test relative paths raise ValueError."""
+        with pytest.raises(ValueError, match="absolute"):
+            normalize_path("docs/a.txt")
+
+
+class TestFileSystemInputInstantiation:
+    """Test FileSystemInput instantiation and basic properties."""
+
+    def test_instantiation_with_defaults(self):
+        """Test creating a write input with defaults."""
+        fs_input = create_filesystem_input()
+
+        assert fs_input.modality_type == "filesystem"
+        assert fs_input.operation == "write"
+        assert fs_input.encoding == "utf-8"
+        assert fs_input.offset is None
+        assert fs_input.recursive is False
+
+    def test_modality_type_is_frozen(self):
+        """Test modality_type cannot be changed."""
+        fs_input = create_filesystem_input()
+        with pytest.raises(ValidationError):
+            fs_input.modality_type = "other"
+
+    def test_paths_are_normalized(self):
+        """Test path and destination are normalized on construction."""
+        fs_input = create_filesystem_input(
+            operation="move", path="/a//b/", content=None, destination="/c/./d"
+        )
+        assert fs_input.path == "/a/b"
+        assert fs_input.destination == "/c/d"
+
+    def test_relative_path_rejected(self):
+        """Test relative paths fail validation."""
+        with pytest.raises(ValidationError):
+            create_filesystem_input(path="notes.txt")
+
+    @pytest.mark.parametrize("permissions", ["64", "888", "rwx", "0644"])
+    def test_invalid_permissions_rejected(self, permissions):
+        """Test permissions must be three octal digits."""
+        with pytest.raises(ValidationError):
+            create_filesystem_input(operation="chmod", content=None, permissions=permissions)
+
+    def test_negative_offset_rejected(self):
+        """Test offsets must not be negative."""
+        with pytest.raises(ValidationError):
+            create_filesystem_input(offset=-1)
+
+
+class TestFileSystemInputValidation:
+    """Test operation-specific validation in validate_input()."""
+
+    def test_write_requires_content(self):
+        """Test write without content is rejected."""
+        with pytest.raises(ValueError, match="requires content"):
+            create_filesystem_input(content=None).validate_input()
+
+    def test_offset_only_for_write(self):
+        """Test offsets are rejected for operations other than write."""
+        with pytest.raises(ValueError, match="offset"):
+            create_filesystem_input(operation="append", offset=3).validate_input()
+
+    @pytest.mark.parametrize("operation", ["move", "copy"])
+    def test_transfer_requires_destination(self, operation):
+        """Test move and copy require a destination."""
+        with pytest.raises(ValueError, match="requires destination"):
+            create_filesystem_input(operation=operation, content=None).validate_input()
+
+    @pytest.mark.parametrize("destination", ["/docs", "/docs/sub/dir"])
+    def test_transfer_into_itself_rejected(self, destination):
+        """Test a directory cannot be moved onto or into itself."""
+        fs_input = create_filesystem_input(
+            operation="move", path="/docs", content=None, destination=destination
+        )
+        with pytest.raises(ValueError, match="into itself"):
+            fs_input.validate_input()
+
+    def test_transfer_to_sibling_with_common_prefix_allowed(self):
+        """Test /docs can be moved to /docs2."""
+        create_filesystem_input(
+            operation="move", path="/docs", content=None, destination="/docs2"
+        ).validate_input()
+
+    def test_chmod_requires_permissions(self):
+        """Test chmod without permissions is rejected."""
+        with pytest.raises(ValueError, match="requires permissions"):
+            create_filesystem_input(operation="chmod", content=None).validate_input()
+
+    def test_root_only_allows_chmod(self):
+        """Test the root directory can only have its permissions changed."""
+        with pytest.raises(ValueError, match="root"):
+            create_filesystem_input(operation="delete", path="/", content=None).validate_input()
+        create_filesystem_input(
+            operation="chmod", path="/", content=None, permissions="700"
+        ).validate_input()
+
+    def test_invalid_base64_rejected(self):
+        """Test malformed base64 content is rejected."""
+        fs_input = create_filesystem_input(content="not base64!", encoding="base64")
+        with pytest.raises(ValueError, match="base64"):
+            fs_input.validate_input()
+
+
+class TestFileSystemInputHelpers:
+    """Test content decoding, affected entities, summaries and merging."""
+
+    def test_content_bytes_decodes_base64(self):
+        """Test base64 content is decoded to bytes."""
+        encoded = base64.b64encode(b"\x00\xff").decode("ascii")
+        assert create_filesystem_input(content=encoded, encoding="base64").content_bytes() == b"\x00\xff"
+
+    def test_content_bytes_encodes_text(self):
+        """Test text content is UTF-8 encoded."""
+        assert create_filesystem_input(content="é").content_bytes() == "é".encode()
+
+    def test_affected_entities(self):
+        """Test affected entities include the destination of a copy."""
+        fs_input = create_filesystem_input(
+            operation="copy", path="/a", content=None, destination="/b"
+        )
+        assert fs_input.get_affected_entities() == ["path:/a", "path:/b"]
+
+    @pytest.mark.parametrize(
+        "kwargs,summary",
+        [
+            ({}, "Write 13 bytes to /docs/notes.txt"),
+            ({"offset": 4}, "Write 13 bytes to /docs/notes.txt at offset 4"),
+            ({"operation": "append"}, "Append 13 bytes to /docs/notes.txt"),
+            ({"operation": "mkdir", "content": None}, "Create directory /docs/notes.txt"),
+            (
+                {"operation": "move", "content": None, "destination": "/x"},
+                "Move /docs/notes.txt to /x",
+            ),
+        ],
+    )
+    def test_summary(self, kwargs, summary):
+        """Test summaries describe the operation."""
+        assert create_filesystem_input(**kwargs).get_summary() == summary
+
+    def test_never_merges(self):
+        """Test file system inputs are never merged."""
+        assert not create_filesystem_input().should_merge_with(create_filesystem_input())
+
+    def test_serialization_round_trip(self):
+        """Test inputs survive a JSON round trip."""
+        fs_input = create_filesystem_input(offset=2, permissions="600")
+        restored = FileSystemInput.model_validate_json(fs_input.model_dump_json())
+        assert restored == fs_input
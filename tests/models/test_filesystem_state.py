@@ -0,0 +1,416 @@
+"""Unit tests for FileSystemState.
+
+This test suite covers:
+1. General ModalityState behavior (applicable to all modalities)
+2. File system-specific tree operations, chunked content and undo
+"""
+
+import base64
+import copy
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.modalities.filesystem_state import FileSystemState
+from tests.fixtures.modalities.filesystem import (
+    create_filesystem_input,
+    create_filesystem_state,
+)
+
+
+def _apply_with_undo(state: FileSystemState, **kwargs) -> dict:
+    """Apply an input to state and return the undo data captured before it."""
+    fs_input = create_filesystem_input(**kwargs)
+    undo_data = state.create_undo_data(fs_input)
+    state.apply_input(fs_input)
+    return undo_data
+
+
+class TestFileSystemStateInstantiation:
+    """Test FileSystemState instantiation and basic properties."""
+
+    def test_instantiation_with_minimal_fields(self):
+        """Test a new state has an empty root and its own blob store."""
+        state = FileSystemState(last_updated=datetime.now(timezone.utc))
+
+        assert state.modality_type == "filesystem"
+        assert state.update_count == 0
+        assert state.root.children == {}
+        assert state.blob_directory == str(state.blobs.directory)
+
+    def test_states_share_blob_directory(self, tmp_path):
+        """Test a state opened on an existing blob directory reads its files."""
+        state = create_filesystem_state(
+            files={"/a.txt": "persisted"}, blob_directory=str(tmp_path)
+        )
+        restored = FileSystemState.model_validate(state.model_dump())
+
+        assert restored.read_file("/a.txt") == b"persisted"
+
+    def test_deepcopy_shares_blob_store(self):
+        """Test copies of the state share the blob store but not the tree."""
+        state = create_filesystem_state(files={"/a.txt": "a"})
+        copied = copy.deepcopy(state)
+        copied.apply_input(create_filesystem_input(path="/b.txt", content="b"))
+
+        assert copied.blobs is state.blobs
+        assert "b.txt" not in state.root.children
+
+
+class TestFileSystemStateWrite:
+    """Test writing, appending and reading files."""
+
+    def test_write_creates_parents(self):
+        """Test writing a file creates its missing parent directories."""
+        state = create_filesystem_state(files={"/a/b/c.txt": "hello"})
+
+        assert state.stat("/a/b")["kind"] == "directory"
+        assert state.read_file("/a/b/c.txt") == b"hello"
+        assert state.stat("/a/b/c.txt")["mime_type"] == "text/plain"
+        assert state.update_count == 1
+
+    def test_write_replaces_content(self):
+        """Test writing without an offset replaces the whole file."""
+        state = create_filesystem_state(files={"/a.txt": "long content"})
+        state.apply_input(create_filesystem_input(path="/a.txt", content="short"))
+
+        assert state.read_file("/a.txt") == b"short"
+        assert state.stat("/a.txt")["size"] == 5
+
+    def test_write_at_offset(self):
+        """Test writing at an offset overwrites only those bytes."""
+        state = create_filesystem_state(files={"/a.txt": "hello world"})
+        state.apply_input(create_filesystem_input(path="/a.txt", content="WORLD", offset=6))
+
+        assert state.read_file("/a.txt") == b"hello WORLD"
+
+    def test_write_past_end_zero_fills(self):
+        """Test writing past the end fills the gap with zeros."""
+        state = create_filesystem_state(files={"/a.bin": b"ab"})
+        state.apply_input(create_filesystem_input(path="/a.bin", content="z", offset=5))
+
+        assert state.read_file("/a.bin") == b"ab\0\0\0z"
+
+    def test_append(self):
+        """Test appending adds to the end, creating the file if needed."""
+        state = create_filesystem_state()
+        state.apply_input(create_filesystem_input(operation="append", path="/log", content="a"))
+        state.apply_input(create_filesystem_input(operation="append", path="/log", content="b"))
+
+        assert state.read_file("/log") == b"ab"
+
+    def test_binary_content(self):
+        """Test base64 content is stored as raw bytes."""
+        data = bytes(range(256))
+        state = create_filesystem_state(files={"/data.bin": data})
+
+        assert state.read_file("/data.bin") == data
+
+    def test_write_to_directory_rejected(self):
+        """Test a directory cannot be written as a file."""
+        state = create_filesystem_state(files={"/a/b.txt": "x"})
+        with pytest.raises(ValueError, match="Is a directory"):
+            state.apply_input(create_filesystem_input(path="/a"))
+
+    def test_read_range(self):
+        """Test reading a byte range of a file."""
+        state = create_filesystem_state(files={"/a.txt": "0123456789"})
+
+        assert state.read_file("/a.txt", 2, 3) == b"234"
+        assert state.read_file("/a.txt", 8) == b"89"
+        assert state.read_file("/a.txt", 20) == b""
+
+    def test_read_missing_or_directory_raises(self):
+        """Test reading a missing path or a directory raises ValueError."""
+        state = create_filesystem_state(files={"/a/b.txt": "x"})
+        with pytest.raises(ValueError, match="No such file"):
+            state.read_file("/missing")
+        with pytest.raises(ValueError, match="Is a directory"):
+            state.read_file("/a")
+
+
+class TestFileSystemStateChunking:
+    """Test content deduplication and partial re-chunking."""
+
+    def test_identical_files_stored_once(self):
+        """Test identical contents are stored once."""
+        data = random.Random(1).randbytes(100_000)
+        state = create_filesystem_state(files={"/a.bin": data, "/b.bin": data})
+
+        assert state.blobs.stored_bytes == len(data)
+        assert state.get_snapshot()["total_bytes"] == 2 * len(data)
+
+    def test_copy_stores_nothing(self):
+        """Test copying a file shares its chunks."""
+        state = create_filesystem_state(files={"/a.bin": random.Random(2).randbytes(50_000)})
+        stored = state.blobs.stored_bytes
+        state.apply_input(
+            create_filesystem_input(operation="copy", path="/a.bin", content=None, destination="/b.bin")
+        )
+
+        assert state.blobs.stored_bytes == stored
+        assert state.read_file("/b.bin") == state.read_file("/a.bin")
+
+    def test_small_edit_stores_little(self):
+        """Test patching a large file stores only the chunks it touches."""
+        data = random.Random(3).randbytes(1024 * 1024)
+        state = create_filesystem_state(files={"/big.bin": data})
+        stored = state.blobs.stored_bytes
+        state.apply_input(
+            create_filesystem_input(path="/big.bin", content="patch", offset=500_000)
+        )
+
+        expected = data[:500_000] + b"patch" + data[500_005:]
+        assert state.read_file("/big.bin") == expected
+        assert state.blobs.stored_bytes - stored < 200_000
+
+    def test_manifest_matches_size_after_edits(self):
+        """Test chunk ends stay consistent through splices and appends."""
+        rng = random.Random(4)
+        data = bytearray(rng.randbytes(200_000))
+        state = create_filesystem_state(files={"/f.bin": bytes(data)})
+        for _ in range(10):
+            offset = rng.randrange(len(data) + 100)
+            patch = rng.randbytes(rng.randrange(1, 20_000))
+            if offset > len(data):
+                data.extend(bytes(offset - len(data)))
+            data[offset : offset + len(patch)] = patch
+            state.apply_input(
+                create_filesystem_input(
+                    path="/f.bin",
+                    content=base64.b64encode(patch).decode("ascii"),
+                    encoding="base64",
+                    offset=offset,
+                )
+            )
+
+        assert state.read_file("/f.bin") == bytes(data)
+        assert state.validate_state() == []
+
+
+class TestFileSystemStateTree:
+    """Test directory operations."""
+
+    def test_mkdir_with_permissions(self):
+        """Test mkdir creates nested directories."""
+        state = create_filesystem_state()
+        state.apply_input(
+            create_filesystem_input(operation="mkdir", path="/a/b", content=None, permissions="700")
+        )
+
+        assert state.stat("/a")["permissions"] == "755"
+        assert state.stat("/a/b")["permissions"] == "700"
+
+    def test_delete_non_empty_requires_recursive(self):
+        """Test deleting a non-empty directory requires recursive."""
+        state = create_filesystem_state(files={"/a/b.txt": "x"})
+        with pytest.raises(ValueError, match="not empty"):
+            state.apply_input(create_filesystem_input(operation="delete", path="/a", content=None))
+
+        state.apply_input(
+            create_filesystem_input(operation="delete", path="/a", content=None, recursive=True)
+        )
+        assert state.root.children == {}
+
+    def test_move_directory(self):
+        """Test moving a directory moves its subtree."""
+        state = create_filesystem_state(files={"/a/b/c.txt": "x"})
+        state.apply_input(
+            create_filesystem_input(operation="move", path="/a", content=None, destination="/z/a2")
+        )
+
+        assert state.read_file("/z/a2/b/c.txt") == b"x"
+        assert "a" not in state.root.children
+
+    @pytest.mark.parametrize("operation", ["move", "copy"])
+    def test_transfer_to_existing_destination_rejected(self, operation):
+        """Test move and copy never overwrite."""
+        state = create_filesystem_state(files={"/a.txt": "a", "/b.txt": "b"})
+        with pytest.raises(ValueError, match="already exists"):
+            state.apply_input(
+                create_filesystem_input(
+                    operation=operation, path="/a.txt", content=None, destination="/b.txt"
+                )
+            )
+
+    def test_chmod(self):
+        """Test chmod changes permissions."""
+        state = create_filesystem_state(files={"/a.txt": "a"})
+        state.apply_input(
+            create_filesystem_input(operation="chmod", path="/a.txt", content=None, permissions="600")
+        )
+
+        assert state.stat("/a.txt")["permissions"] == "600"
+
+    def test_missing_source_rejected(self):
+        """Test operations on missing paths raise ValueError."""
+        state = create_filesystem_state()
+        with pytest.raises(ValueError, match="No such file"):
+            state.apply_input(create_filesystem_input(operation="delete", path="/x", content=None))
+
+
+class TestFileSystemStateQuery:
+    """Test query() and snapshots."""
+
+    @pytest.fixture
+    def state(self):
+        return create_filesystem_state(
+            files={
+                "/docs/a.txt": "aaa",
+                "/docs/b.md": "b",
+                "/docs/sub/c.txt": "cc",
+                "/top.txt": "t",
+            }
+        )
+
+    def test_list_children(self, state):
+        """Test listing a directory returns its children only."""
+        result = state.query({"path": "/docs"})
+
+        assert [e["path"] for e in result["entries"]] == [
+            "/docs/a.txt",
+            "/docs/b.md",
+            "/docs/sub",
+        ]
+        assert result["total_count"] == 3
+
+    def test_recursive_pattern_search(self, state):
+        """Test recursive search with a glob pattern."""
+        result = state.query({"recursive": True, "pattern": "*.txt"})
+
+        assert [e["name"] for e in result["entries"]] == ["a.txt", "c.txt", "top.txt"]
+
+    def test_kind_filter_sort_and_pagination(self, state):
+        """Test filtering by kind, sorting by size, and paging."""
+        result = state.query(
+            {"recursive": True, "kind": "file", "sort_by": "size", "sort_order": "desc", "limit": 2}
+        )
+
+        assert [e["size"] for e in result["entries"]] == [3, 2]
+        assert result["count"] == 2
+        assert result["total_count"] == 4
+
+    def test_query_file_returns_its_entry(self, state):
+        """Test querying a file path returns that file."""
+        assert state.query({"path": "/top.txt"})["entries"][0]["size"] == 1
+
+    def test_invalid_query_raises(self, state):
+        """Test unknown sort fields and missing paths raise ValueError."""
+        with pytest.raises(ValueError):
+            state.query({"sort_by": "color"})
+        with pytest.raises(ValueError):
+            state.query({"path": "/missing"})
+
+    def test_snapshot(self, state):
+        """Test the snapshot counts files, directories and bytes."""
+        snapshot = state.get_snapshot()
+
+        assert snapshot["modality_type"] == "filesystem"
+        assert snapshot["file_count"] == 4
+        assert snapshot["directory_count"] == 2
+        assert snapshot["total_bytes"] == 7
+        assert {e["name"] for e in snapshot["root"]} == {"docs", "top.txt"}
+
+    def test_clear(self, state):
+        """Test clear empties the tree."""
+        state.clear()
+
+        assert state.root.children == {}
+        assert state.update_count == 0
+
+
+class TestFileSystemStateUndo:
+    """Test create_undo_data() and apply_undo()."""
+
+    def _assert_undo_restores(self, state: FileSystemState, **kwargs):
+        before = state.model_dump()
+        undo_data = _apply_with_undo(state, **kwargs)
+        state.apply_undo(undo_data)
+        assert state.model_dump() == before
+
+    def test_undo_new_file_removes_created_parents(self):
+        """Test undoing a write removes the file and the parents it created."""
+        state = create_filesystem_state(files={"/a.txt": "a"})
+        self._assert_undo_restores(state, path="/new/dir/f.txt")
+
+    def test_undo_overwrite_restores_content(self):
+        """Test undoing an overwrite restores the previous content."""
+        state = create_filesystem_state(files={"/a.txt": "original"})
+        self._assert_undo_restores(state, path="/a.txt", content="XY", offset=2)
+        assert state.read_file("/a.txt") == b"original"
+
+    def test_undo_append(self):
+        """Test undoing an append."""
+        state = create_filesystem_state(files={"/a.txt": "a"})
+        self._assert_undo_restores(state, operation="append", path="/a.txt", content="b")
+
+    def test_undo_delete(self):
+        """Test undoing a recursive delete restores the subtree."""
+        state = create_filesystem_state(files={"/a/b/c.txt": "c"})
+        self._assert_undo_restores(
+            state, operation="delete", path="/a", content=None, recursive=True
+        )
+
+    def test_undo_move(self):
+        """Test undoing a move into new directories."""
+        state = create_filesystem_state(files={"/a/b.txt": "b"})
+        self._assert_undo_restores(
+            state, operation="move", path="/a/b.txt", content=None, destination="/x/y/b.txt"
+        )
+
+    def test_undo_copy(self):
+        """Test undoing a copy."""
+        state = create_filesystem_state(files={"/a/b.txt": "b"})
+        self._assert_undo_restores(
+            state, operation="copy", path="/a", content=None, destination="/c"
+        )
+
+    def test_undo_chmod_and_mkdir(self):
+        """Test undoing chmod and mkdir."""
+        state = create_filesystem_state(files={"/a.txt": "a"})
+        self._assert_undo_restores(
+            state, operation="chmod", path="/a.txt", content=None, permissions="600"
+        )
+        self._assert_undo_restores(state, operation="mkdir", path="/d/e", content=None)
+
+    def test_undo_restores_counters(self):
+        """Test undo restores update_count and last_updated."""
+        state = create_filesystem_state()
+        previous = state.last_updated
+        undo_data = _apply_with_undo(
+            state, path="/a.txt", timestamp=previous + timedelta(hours=1)
+        )
+        state.apply_undo(undo_data)
+
+        assert state.update_count == 0
+        assert state.last_updated == previous
+
+    def test_failing_operation_gets_noop_undo(self):
+        """Test operations that will fail capture noop undo data."""
+        state = create_filesystem_state()
+        undo_data = state.create_undo_data(
+            create_filesystem_input(operation="delete", path="/missing", content=None)
+        )
+
+        assert undo_data["action"] == "noop"
+
+    def test_invalid_undo_data_rejected(self):
+        """Test undo data without an action raises ValueError."""
+        with pytest.raises(ValueError, match="action"):
+            create_filesystem_state().apply_undo({})
+
+
+class TestFileSystemStateValidation:
+    """Test validate_state()."""
+
+    def test_valid_state(self):
+        """Test a consistent state has no errors."""
+        assert create_filesystem_state(files={"/a.txt": "a"}).validate_state() == []
+
+    def test_missing_chunk_reported(self):
+        """Test a manifest referencing a missing chunk is reported."""
+        state = create_filesystem_state(files={"/a.txt": "a"})
+        state.root.children["a.txt"].chunks = ["0" * 64]
+
+        assert state.validate_state()
@@ -0,0 +1,68 @@
+"""Unit tests for parsing modality inputs of any modality."""
+
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from models.inputs import MODALITY_INPUT_ADAPTER, MODALITY_INPUT_CLASSES
+from models.modalities.email_input import EmailInput
+from models.modalities.location_input import LocationInput
+from tests.fixtures.modalities.email import create_email_input
+
+NOW = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class TestModalityInputAdapter:
+    """Test MODALITY_INPUT_ADAPTER."""
+
+    def test_every_input_class_declares_its_modality(self):
+        """Test each input class defaults modality_type to its modality."""
+        for modality, input_class in MODALITY_INPUT_CLASSES.items():
+            assert input_class.model_fields["modality_type"].default == modality
+
+    def test_dict_parsed_as_class_named_by_modality_type(self):
+        """Test dict payloads are validated as their modality's input class."""
+        parsed = MODALITY_INPUT_ADAPTER.validate_python(
+            {
+                "modality_type": "location",
+                "timestamp": NOW,
+                "latitude": 40.7,
+                "longitude": -74.0,
+            }
+        )
+
+        assert isinstance(parsed, LocationInput)
+        assert parsed.latitude == 40.7
+
+    def test_json_round_trip(self):
+        """Test a dumped input parses back from JSON bytes unchanged."""
+        email_input = create_email_input(operation="receive", timestamp=NOW)
+
+        parsed = MODALITY_INPUT_ADAPTER.validate_json(email_input.model_dump_json())
+
+        assert isinstance(parsed, EmailInput)
+        assert parsed == email_input
+
+    def test_instances_pass_through(self):
+        """Test already-typed inputs are returned as they are."""
+        email_input = create_email_input(timestamp=NOW)
+
+        assert MODALITY_INPUT_ADAPTER.validate_python(email_input) is email_input
+
+    def test_unknown_modality_rejected(self):
+        """Test payloads naming no known modality fail validation."""
+        with pytest.raises(ValidationError, match="does not match any of the expected tags"):
+            MODALITY_INPUT_ADAPTER.validate_python({"modality_type": "fax", "timestamp": NOW})
+
+    def test_invalid_fields_rejected(self):
+        """Test the chosen class's field validation applies."""
+        with pytest.raises(ValidationError, match="latitude"):
+            MODALITY_INPUT_ADAPTER.validate_python(
+                {
+                    "modality_type": "location",
+                    "timestamp": NOW,
+                    "latitude": 100.0,
+                    "longitude": 0.0,
+                }
+            )
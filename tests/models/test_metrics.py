@@ -0,0 +1,188 @@
+"""Unit tests for the metrics registry in models/metrics.py."""
+
+import threading
+
+import pytest
+
+from models.event import EventStatus
+from models.metrics import (
+    EVENT_EXECUTION_SECONDS,
+    MODALITY_APPLY_SECONDS,
+    MODALITY_QUERY_SECONDS,
+    QUEUE_OPERATIONS,
+    REGISTRY,
+    MetricsRegistry,
+    _Metric,
+    approx_size,
+)
+from models.simulation import SimulationEngine
+from tests.fixtures.core.environments import create_environment
+from tests.fixtures.core.events import create_simulator_event
+from tests.fixtures.core.queues import create_event_queue
+from tests.fixtures.modalities import location
+
+
+@pytest.fixture
+def registry():
+    """Provide an empty registry."""
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def clean_registry():
+    """Reset the shared registry around a test."""
+    REGISTRY.clear()
+    REGISTRY.enabled = True
+    yield REGISTRY
+    REGISTRY.clear()
+    REGISTRY.enabled = True
+
+
+def _sample_lines(text: str) -> list[str]:
+    """Return the non-comment lines of an exposition."""
+    return [line for line in text.splitlines() if line and not line.startswith("#")]
+
+
+class TestMetricTypes:
+    """Test counters, gauges, and histograms."""
+
+    def test_counter_renders_total_per_label_set(self, registry):
+        """Verify counters accumulate per label set and render with _total."""
+        counter = registry.counter("jobs", "Jobs run.", ("kind",))
+        counter.labels("a").inc()
+        counter.labels("a").inc(2)
+        counter.labels("b").inc()
+
+        text = registry.render()
+
+        assert "# HELP jobs Jobs run." in text
+        assert "# TYPE jobs counter" in text
+        assert _sample_lines(text) == ['jobs_total{kind="a"} 3', 'jobs_total{kind="b"} 1']
+
+    def test_gauge_is_set_not_accumulated(self, registry):
+        """Verify gauges hold the last value set."""
+        gauge = registry.gauge("depth", "Queue depth.")
+        gauge.set(5)
+        gauge.set(2.5)
+
+        assert _sample_lines(registry.render()) == ["depth 2.5"]
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        """Verify histogram buckets, sum, and count."""
+        histogram = registry.histogram("latency", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        assert _sample_lines(registry.render()) == [
+            'latency_bucket{le="0.1"} 2',
+            'latency_bucket{le="1"} 3',
+            'latency_bucket{le="+Inf"} 4',
+            "latency_sum 3.65",
+            "latency_count 4",
+        ]
+
+    def test_observations_from_threads_are_combined(self, registry):
+        """Verify per-thread shards are summed when rendered."""
+        histogram = registry.histogram("work", "Work.", buckets=(1.0,))
+        threads = [
+            threading.Thread(target=lambda: [histogram.observe(0.5) for _ in range(100)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert "work_count 400" in registry.render()
+        assert 'work_bucket{le="1"} 400' in registry.render()
+
+    def test_histogram_time_observes_block(self, registry):
+        """Verify time() records one observation."""
+        histogram = registry.histogram("work", "Work.", ("kind",))
+        with histogram.labels("x").time():
+            pass
+
+        assert 'work_count{kind="x"} 1' in registry.render()
+
+    def test_label_values_are_escaped(self, registry):
+        """Verify quotes, backslashes, and newlines in label values are escaped."""
+        registry.counter("c", "C.", ("v",)).labels('a"b\\c\nd').inc()
+
+        assert 'c_total{v="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+    def test_wrong_label_count_is_rejected(self, registry):
+        """Verify labels() checks the number of values."""
+        counter = registry.counter("c", "C.", ("a", "b"))
+
+        with pytest.raises(ValueError):
+            counter.labels("only-one")
+
+    def test_duplicate_names_are_rejected(self, registry):
+        """Verify a name can only be registered once."""
+        registry.counter("c", "C.")
+
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("c", "Again.")
+
+    def test_approx_size_counts_nested_values(self):
+        """Verify nested containers add to the estimate."""
+        assert approx_size({"a": ["x" * 1000]}) > approx_size({"a": []}) + 1000
+
+    def test_metric_without_samples_cannot_be_created(self):
+        """Verify a metric type missing an abstract method fails on creation."""
+
+        class Incomplete(_Metric):
+            def _new_child(self):
+                return None
+
+        with pytest.raises(TypeError):
+            Incomplete("incomplete", "Missing samples().")
+
+
+class TestEngineInstrumentation:
+    """Test that engine hot paths update the shared registry."""
+
+    def _create_engine(self) -> SimulationEngine:
+        return SimulationEngine(
+            environment=create_environment(), event_queue=create_event_queue()
+        )
+
+    def _execute_location_event(self, engine: SimulationEngine) -> None:
+        engine.execute_immediate_event(
+            create_simulator_event(
+                scheduled_time=engine.environment.time_state.current_time,
+                modality="location",
+                data=location.create_location_input(),
+            )
+        )
+
+    def test_event_execution_is_recorded(self, clean_registry):
+        """Verify execution latency and outcome, queue, and apply metrics."""
+        engine = self._create_engine()
+
+        self._execute_location_event(engine)
+
+        executed = EVENT_EXECUTION_SECONDS.labels(
+            "location", "apply", EventStatus.EXECUTED.value
+        )
+        assert executed.count == 1
+        assert QUEUE_OPERATIONS.labels("add").value == 1
+        assert MODALITY_APPLY_SECONDS.labels("location").count == 1
+
+    def test_modality_query_is_recorded(self, clean_registry):
+        """Verify ModalityState.query calls are timed per modality."""
+        engine = self._create_engine()
+
+        engine.environment.get_state("location").query({})
+
+        assert MODALITY_QUERY_SECONDS.labels("location").count == 1
+
+    def test_disabled_registry_records_nothing(self, clean_registry):
+        """Verify instrumentation is skipped while the registry is disabled."""
+        engine = self._create_engine()
+        REGISTRY.enabled = False
+
+        self._execute_location_event(engine)
+
+        assert _sample_lines(REGISTRY.render()) == []
+        assert engine.undo_stack.undo_count == 1
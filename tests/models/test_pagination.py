@@ -0,0 +1,208 @@
+"""Unit tests for keyset (cursor) pagination helpers."""
+
+import copy
+import pickle
+from datetime import date, datetime, timezone
+
+import pytest
+
+from models.pagination import (
+    SortedIndex,
+    SortedIndexCache,
+    collect_page,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+class TestCursorEncoding:
+    """Test encoding and decoding of cursors."""
+
+    def test_round_trip_preserves_key_and_id(self):
+        """Verify tuple keys containing datetimes and dates survive a round trip."""
+        key = (datetime(2025, 1, 1, 9, 30, tzinfo=timezone.utc), -1, date(2025, 1, 2))
+
+        cursor = encode_cursor(key, "item-1", "date:desc")
+
+        assert decode_cursor(cursor, "date:desc") == (key, "item-1")
+
+    def test_cursor_is_url_safe(self):
+        """Verify cursors contain no characters that need escaping."""
+        cursor = encode_cursor("subject?/+", "id", "subject:asc")
+
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    def test_malformed_cursor_is_rejected(self):
+        """Verify garbage input raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not-a-cursor!", "date:desc")
+
+    def test_cursor_for_other_sort_is_rejected(self):
+        """Verify a cursor cannot be reused with a different sort order."""
+        cursor = encode_cursor("a", "id", "subject:asc")
+
+        with pytest.raises(ValueError, match="subject:desc"):
+            decode_cursor(cursor, "subject:desc")
+
+
+class TestSortedIndex:
+    """Test ordering and resumption of sorted indexes."""
+
+    ITEMS = [("a", 2), ("b", 1), ("c", 2), ("d", 3), ("e", 1)]
+
+    def test_ascending_order_keeps_source_order_on_ties(self):
+        """Verify ascending iteration matches a stable sort."""
+        index = SortedIndex(self.ITEMS)
+
+        assert list(index.iter_ids()) == ["b", "e", "a", "c", "d"]
+
+    def test_descending_order_keeps_source_order_on_ties(self):
+        """Verify descending iteration matches a stable reverse sort."""
+        index = SortedIndex(self.ITEMS, descending=True)
+
+        expected = [i for i, _ in sorted(self.ITEMS, key=lambda x: x[1], reverse=True)]
+        assert list(index.iter_ids()) == expected
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_resumes_after_each_position(self, descending):
+        """Verify resuming after any item yields exactly the items that follow it."""
+        index = SortedIndex(self.ITEMS, descending=descending)
+        keys = dict(self.ITEMS)
+        order = list(index.iter_ids())
+
+        for position, item_id in enumerate(order):
+            after = (keys[item_id], item_id)
+            assert list(index.iter_ids(after)) == order[position + 1:]
+
+    def test_missing_item_resumes_at_its_key(self):
+        """Verify a cursor for a removed item resumes at the first item with its key."""
+        index = SortedIndex(self.ITEMS)
+
+        assert list(index.iter_ids((2, "gone"))) == ["a", "c", "d"]
+
+    def test_missing_item_resumes_at_its_key_descending(self):
+        """Verify the missing-item fallback also works walking backwards."""
+        index = SortedIndex(self.ITEMS, descending=True)
+
+        assert list(index.iter_ids((2, "gone"))) == ["a", "c", "b", "e"]
+
+
+class TestSortedIndexCache:
+    """Test the per-state index cache."""
+
+    def test_index_is_reused_until_invalidated(self):
+        """Verify the same index is returned until invalidate() is called."""
+        cache = SortedIndexCache()
+        source = {"a": 1, "b": 2}
+
+        first = cache.get("value", False, source, lambda v: v)
+        assert cache.get("value", False, source, lambda v: v) is first
+
+        cache.invalidate()
+        assert cache.get("value", False, source, lambda v: v) is not first
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_appended_items_are_inserted_in_place(self, descending):
+        """Verify additions are inserted into the existing index without a rebuild."""
+        cache = SortedIndexCache()
+        source = {"a": 2, "b": 1}
+        first = cache.get("value", descending, source, lambda v: v)
+
+        source["c"] = 2
+        source["d"] = 0
+
+        index = cache.get("value", descending, source, lambda v: v)
+        assert index is first
+        assert list(index.iter_ids()) == list(
+            SortedIndex(source.items(), descending).iter_ids()
+        )
+
+    def test_index_is_rebuilt_when_items_are_removed(self):
+        """Verify removals are detected even when the size is unchanged."""
+        cache = SortedIndexCache()
+        source = {"a": 1, "b": 2}
+        first = cache.get("value", False, source, lambda v: v)
+
+        del source["a"]
+        source["c"] = 0
+
+        index = cache.get("value", False, source, lambda v: v)
+        assert index is not first
+        assert list(index.iter_ids()) == ["c", "b"]
+
+    def test_index_is_rebuilt_after_clear_and_refill(self):
+        """Verify a collection emptied and refilled is not mistaken for an extension."""
+        cache = SortedIndexCache()
+        source = {"a": 1}
+        cache.get("value", False, source, lambda v: v)
+
+        source.clear()
+        source["b"] = 2
+        source["c"] = 0
+
+        assert list(cache.get("value", False, source, lambda v: v).iter_ids()) == ["c", "b"]
+
+    def test_caches_always_compare_equal(self):
+        """Verify the cache never affects equality of the owning model."""
+        cache = SortedIndexCache()
+        cache.get("value", False, {"a": 1}, lambda v: v)
+
+        assert cache == SortedIndexCache()
+
+    def test_copies_start_empty(self):
+        """Verify copied and pickled caches do not carry indexes over."""
+        cache = SortedIndexCache()
+        cache.get("value", False, {"a": 1}, lambda v: v)
+
+        for clone in (copy.copy(cache), copy.deepcopy(cache), pickle.loads(pickle.dumps(cache))):
+            assert isinstance(clone, SortedIndexCache)
+            assert clone._indexes == {}
+
+
+class TestCollectPage:
+    """Test collection of a page from a candidate stream."""
+
+    def test_collects_limit_items_and_reports_more(self):
+        """Verify a full page reports that more matches follow."""
+        page, has_more = collect_page(range(10), lambda batch: batch, limit=3, batch_size=2)
+
+        assert page == [0, 1, 2]
+        assert has_more is True
+
+    def test_last_page_reports_no_more(self):
+        """Verify an exactly-filled final page reports no more matches."""
+        page, has_more = collect_page(range(3), lambda batch: batch, limit=3)
+
+        assert page == [0, 1, 2]
+        assert has_more is False
+
+    def test_filters_across_batches(self):
+        """Verify matches are gathered across several filtered batches."""
+        evens = lambda batch: [n for n in batch if n % 2 == 0]
+
+        page, has_more = collect_page(range(20), evens, limit=4, batch_size=1)
+
+        assert page == [0, 2, 4, 6]
+        assert has_more is True
+
+    def test_no_limit_collects_everything(self):
+        """Verify limit=None returns every remaining match."""
+        page, has_more = collect_page(range(100), lambda batch: batch, limit=None, batch_size=8)
+
+        assert page == list(range(100))
+        assert has_more is False
+
+    def test_stops_reading_once_page_is_full(self):
+        """Verify candidates beyond the page are not consumed."""
+        consumed = []
+
+        def candidates():
+            for n in range(1000):
+                consumed.append(n)
+                yield n
+
+        collect_page(candidates(), lambda batch: batch, limit=5, batch_size=8)
+
+        assert len(consumed) == 8
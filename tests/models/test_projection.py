@@ -0,0 +1,82 @@
+"""Unit tests for sparse fieldset projection helpers."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from models.modalities.email_state import Email
+from models.projection import project, validate_fields
+
+
+def make_email(subject: str = "Test Subject") -> Email:
+    """Create an Email for projection tests."""
+    return Email(
+        message_id="msg-123",
+        thread_id="thread-456",
+        from_address="sender@example.com",
+        to_addresses=["recipient@example.com"],
+        subject=subject,
+        body_text="Test body",
+        sent_at=datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc),
+        received_at=datetime(2025, 1, 1, 10, 5, tzinfo=timezone.utc),
+    )
+
+
+class TestValidateFields:
+    """Test validation of requested field lists."""
+
+    def test_none_means_no_projection(self):
+        """Verify None passes through unchanged."""
+        assert validate_fields(None, Email) is None
+
+    def test_valid_fields_are_returned_in_order(self):
+        """Verify valid field names are returned in request order."""
+        assert validate_fields(["subject", "message_id"], Email) == [
+            "subject",
+            "message_id",
+        ]
+
+    def test_duplicates_are_removed(self):
+        """Verify repeated field names are collapsed."""
+        assert validate_fields(["subject", "subject", "is_read"], Email) == [
+            "subject",
+            "is_read",
+        ]
+
+    def test_empty_list_raises(self):
+        """Verify an empty projection is rejected."""
+        with pytest.raises(ValueError, match="at least one field"):
+            validate_fields([], Email)
+
+    def test_unknown_field_raises(self):
+        """Verify unknown field names are rejected and reported."""
+        with pytest.raises(ValueError, match="Unknown fields for Email: bogus"):
+            validate_fields(["subject", "bogus"], Email)
+
+
+class TestProject:
+    """Test projecting models down to selected fields."""
+
+    def test_project_includes_only_requested_fields(self):
+        """Verify only requested fields are present in the output."""
+        email = make_email(subject="Hello")
+
+        result = project(email, ["message_id", "subject"])
+
+        assert result == {"message_id": email.message_id, "subject": "Hello"}
+
+    def test_project_none_returns_full_dump(self):
+        """Verify no projection matches model_dump()."""
+        email = make_email()
+
+        assert project(email, None) == email.model_dump()
+
+    def test_projected_values_match_full_dump(self):
+        """Verify projected values are identical to the full dump's values."""
+        email = make_email()
+        fields = ["sent_at", "to_addresses", "is_read"]
+
+        full = email.model_dump()
+        result = project(email, fields)
+
+        assert result == {name: full[name] for name in fields}
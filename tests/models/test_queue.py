@@ -308,6 +308,73 @@ class TestEventQueueAddEvents:
         assert queue.events[2].scheduled_time == now + timedelta(hours=3)
         assert queue.events[3].scheduled_time == now + timedelta(hours=4)
 
+    def test_add_events_keeps_existing_events_first_on_ties(self):
+        """Verify merged events sharing a sort key follow the queued ones."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        created = now - timedelta(hours=1)
+        queue = create_event_queue(
+            events=[
+                create_simulator_event(
+                    event_id=f"old-{hours}",
+                    scheduled_time=now + timedelta(hours=hours),
+                    created_at=created,
+                )
+                for hours in (1, 2, 3)
+            ]
+        )
+
+        queue.add_events(
+            [
+                create_simulator_event(
+                    event_id=f"new-{hours}",
+                    scheduled_time=now + timedelta(hours=hours),
+                    created_at=created,
+                )
+                for hours in (3, 2, 4)
+            ]
+        )
+
+        assert [e.event_id for e in queue.events] == [
+            "old-1",
+            "old-2",
+            "new-2",
+            "old-3",
+            "new-3",
+            "new-4",
+        ]
+
+    def test_add_events_in_consecutive_batches(self):
+        """Verify batches arriving in time order end up fully sorted."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        queue = create_event_queue()
+
+        for batch in range(3):
+            queue.add_events(
+                [
+                    create_simulator_event(
+                        scheduled_time=now + timedelta(minutes=batch * 10 + minute)
+                    )
+                    for minute in (5, 0, 9)
+                ]
+            )
+
+        assert len(queue.events) == 9
+        assert queue.validate() == []
+
+    def test_add_events_sees_events_edited_directly(self):
+        """Verify duplicate checks follow events added or removed directly."""
+        queue = create_event_queue()
+        queue.add_events([create_simulator_event(event_id="first")])
+        queue.events.append(create_simulator_event(event_id="appended"))
+
+        with pytest.raises(ValueError, match="already exist in queue"):
+            queue.add_events([create_simulator_event(event_id="appended")])
+
+        queue.events.clear()
+        queue.add_events([create_simulator_event(event_id="first")])
+
+        assert [e.event_id for e in queue.events] == ["first"]
+
     def test_add_events_rejects_duplicates_within_batch(self):
         """Verify add_events rejects duplicate IDs in new events."""
         queue = create_event_queue()
@@ -490,6 +557,110 @@ class TestEventQueueGetDueEvents:
         assert queue.events[0].status == EventStatus.PENDING
 
 
+class TestEventQueueCoalesceEvents:
+    """Test coalesce_events() method.
+
+    QUEUE-SPECIFIC: Tests collapsing mergeable due events.
+    """
+
+    def _location_event(self, scheduled_time, **kwargs):
+        return create_simulator_event(
+            modality="location",
+            scheduled_time=scheduled_time,
+            data=create_location_input(timestamp=scheduled_time, **kwargs),
+        )
+
+    def test_coalesce_disabled_by_default(self):
+        """Verify queues do not coalesce unless asked to."""
+        assert EventQueue().coalesce is False
+
+    def test_mergeable_run_collapses_into_latest(self):
+        """Verify a run of mergeable events leaves only its last event."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        events = [
+            self._location_event(now + timedelta(milliseconds=500 * i))
+            for i in range(3)
+        ]
+        queue = create_event_queue(events=events)
+
+        remaining = queue.coalesce_events(queue.get_due_events(now + timedelta(hours=1)))
+
+        assert remaining == [events[2]]
+        for merged, survivor in zip(events, events[1:]):
+            assert merged.status == EventStatus.SKIPPED
+            assert merged.metadata["merged_into"] == survivor.event_id
+        assert events[2].status == EventStatus.PENDING
+        assert "merged_into" not in events[2].metadata
+
+    def test_events_that_should_not_merge_are_kept(self):
+        """Verify events too far apart are all returned."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        events = [self._location_event(now + timedelta(minutes=i)) for i in range(3)]
+        queue = create_event_queue(events=events)
+
+        remaining = queue.coalesce_events(queue.get_due_events(now + timedelta(hours=1)))
+
+        assert remaining == events
+        assert all(e.status == EventStatus.PENDING for e in events)
+
+    def test_different_entities_do_not_merge(self):
+        """Verify events for different entities are coalesced separately."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        home = self._location_event(now, named_location="Home")
+        office = self._location_event(now + timedelta(milliseconds=500), named_location="Office")
+        queue = create_event_queue(events=[home, office])
+
+        remaining = queue.coalesce_events(queue.get_due_events(now + timedelta(hours=1)))
+
+        assert remaining == [home, office]
+
+    def test_other_modalities_keep_their_order(self):
+        """Verify non-mergeable events pass through in execution order."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        first = self._location_event(now)
+        email_event = create_simulator_event(
+            modality="email",
+            scheduled_time=now + timedelta(milliseconds=200),
+            data=create_email_input(),
+        )
+        last = self._location_event(now + timedelta(milliseconds=500))
+        queue = create_event_queue(events=[first, email_event, last])
+
+        remaining = queue.coalesce_events(queue.get_due_events(now + timedelta(hours=1)))
+
+        assert remaining == [email_event, last]
+        assert first.metadata["merged_into"] == last.event_id
+
+    def test_unparseable_input_is_left_pending(self):
+        """Verify an event whose input cannot be parsed is passed through."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        broken = create_simulator_event(
+            modality="location", scheduled_time=now, data={"latitude": "north"}
+        )
+        first = self._location_event(now + timedelta(milliseconds=200))
+        last = self._location_event(now + timedelta(milliseconds=500))
+        queue = create_event_queue(events=[broken, first, last])
+
+        remaining = queue.coalesce_events(queue.get_due_events(now + timedelta(hours=1)))
+
+        assert remaining == [broken, last]
+        assert broken.status == EventStatus.PENDING
+
+    def test_errors_from_input_methods_propagate(self, monkeypatch):
+        """Verify a bug in an input's get_affected_entities() is not swallowed."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        event = self._location_event(now)
+        queue = create_event_queue(events=[event])
+
+        def broken_entities(self):
+            raise RuntimeError("bug")
+
+        monkeypatch.setattr(type(event.data), "get_affected_entities", broken_entities)
+
+        with pytest.raises(RuntimeError, match="bug"):
+            queue.coalesce_events(queue.get_due_events(now + timedelta(hours=1)))
+
+
 class TestEventQueuePeekNext:
     """Test peek_next() method.
 
@@ -1054,6 +1225,63 @@ class TestEventQueueSortEvents:
         assert queue.events[2].created_at == now + timedelta(minutes=3)
 
 
+class TestEventQueueIterEvents:
+    """Test iter_events() and cursor_for() methods.
+
+    QUEUE-SPECIFIC: Tests keyset iteration over the sorted queue.
+    """
+
+    def test_iter_events_without_cursor_yields_all(self):
+        """Verify iteration without a cursor yields every event in order."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        queue = create_event_queue(
+            events=[
+                create_simulator_event(scheduled_time=now + timedelta(hours=h))
+                for h in (3, 1, 2)
+            ]
+        )
+
+        assert list(queue.iter_events()) == queue.events
+
+    def test_iter_events_resumes_after_cursor(self):
+        """Verify a cursor resumes right after its event, including on ties."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        same_time = now + timedelta(hours=1)
+        queue = create_event_queue(
+            events=[
+                create_simulator_event(
+                    scheduled_time=same_time, priority=0, created_at=now
+                )
+                for _ in range(4)
+            ]
+            + [create_simulator_event(scheduled_time=now + timedelta(hours=2))]
+        )
+
+        for position, event in enumerate(queue.events):
+            cursor = queue.cursor_for(event)
+            assert list(queue.iter_events(cursor)) == queue.events[position + 1:]
+
+    def test_iter_events_after_removed_event(self):
+        """Verify a cursor for a removed event resumes at its sort key."""
+        now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        first = create_simulator_event(scheduled_time=now + timedelta(hours=1))
+        second = create_simulator_event(scheduled_time=now + timedelta(hours=2))
+        third = create_simulator_event(scheduled_time=now + timedelta(hours=3))
+        queue = create_event_queue(events=[first, second, third])
+
+        cursor = queue.cursor_for(second)
+        queue.remove_event(second.event_id)
+
+        assert list(queue.iter_events(cursor)) == [third]
+
+    def test_iter_events_rejects_invalid_cursor(self):
+        """Verify an invalid cursor raises ValueError."""
+        queue = create_event_queue(events=[create_simulator_event()])
+
+        with pytest.raises(ValueError):
+            list(queue.iter_events("garbage"))
+
+
 class TestEventQueueSerialization:
     """Test serialization behavior.
 
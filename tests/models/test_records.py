@@ -0,0 +1,136 @@
+"""Unit tests for the compact entity records modality states hold."""
+
+from dataclasses import fields
+from datetime import datetime, timezone
+
+import pytest
+
+from models.modalities.calendar_input import Attendee
+from models.modalities.calendar_state import CalendarEvent, CalendarEventRecord
+from models.modalities.chat_state import ChatMessageRecord
+from models.modalities.email_state import Email, EmailRecord, EmailState
+from models.modalities.location_state import LocationHistoryRecord
+from models.modalities.sms_state import SMSMessageRecord
+from models.modalities.weather_state import WeatherReportHistoryRecord
+
+NOW = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+RECORD_TYPES = [
+    CalendarEventRecord,
+    ChatMessageRecord,
+    EmailRecord,
+    LocationHistoryRecord,
+    SMSMessageRecord,
+    WeatherReportHistoryRecord,
+]
+
+
+def make_email() -> Email:
+    """Create an Email for record tests."""
+    return Email(
+        message_id="msg-1",
+        thread_id="thread-1",
+        from_address="sender@example.com",
+        to_addresses=["recipient@example.com"],
+        subject="Hello",
+        body_text="Body",
+        sent_at=NOW,
+        received_at=NOW,
+        labels=["work"],
+    )
+
+
+def make_event() -> CalendarEvent:
+    """Create a CalendarEvent with nested attendees for record tests."""
+    return CalendarEvent(
+        event_id="event-1",
+        calendar_id="primary",
+        title="Standup",
+        start=NOW,
+        end=NOW,
+        attendees=[Attendee(email="bob@example.com")],
+        recurrence_exceptions={"2025-01-02"},
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+class TestRecordDeclarations:
+    """Test that records mirror their models."""
+
+    @pytest.mark.parametrize("record_type", RECORD_TYPES, ids=lambda t: t.__name__)
+    def test_fields_match_model(self, record_type):
+        """Test record fields match the model's fields in name and order."""
+        assert [f.name for f in fields(record_type)] == list(record_type.model.model_fields)
+
+    @pytest.mark.parametrize("record_type", RECORD_TYPES, ids=lambda t: t.__name__)
+    def test_records_are_slotted(self, record_type):
+        """Test records carry no per-instance __dict__."""
+        assert "__dict__" not in dir(record_type)
+
+
+class TestConversion:
+    """Test converting between records and models."""
+
+    def test_model_round_trip(self):
+        """Test a model converted to a record and back is unchanged."""
+        email = make_email()
+
+        assert EmailRecord.from_model(email).to_model() == email
+
+    def test_to_model_copies_mutable_values(self):
+        """Test the built model does not share lists with the record."""
+        record = EmailRecord.from_model(make_email())
+
+        record.to_model().labels.append("personal")
+
+        assert record.labels == ["work"]
+
+    def test_model_validate_accepts_dicts_and_models(self):
+        """Test records validate dumped dicts and model instances alike."""
+        email = make_email()
+
+        from_dict = EmailRecord.model_validate(email.model_dump(mode="json"))
+        from_model = EmailRecord.model_validate(email)
+
+        assert isinstance(from_dict, EmailRecord)
+        assert from_dict == from_model
+        assert from_dict.sent_at == NOW
+
+    def test_model_validate_rejects_invalid_data(self):
+        """Test record validation applies the model's field constraints."""
+        with pytest.raises(ValueError):
+            EmailRecord.model_validate({"message_id": "msg-1"})
+
+
+class TestSerialization:
+    """Test that records dump exactly as their models do."""
+
+    @pytest.mark.parametrize("mode", ["python", "json"])
+    @pytest.mark.parametrize(
+        ("record_type", "make_model"),
+        [(EmailRecord, make_email), (CalendarEventRecord, make_event)],
+    )
+    def test_dump_matches_model(self, record_type, make_model, mode):
+        """Test flat and nested records dump like their models."""
+        model = make_model()
+
+        record = record_type.from_model(model)
+
+        assert record.model_dump(mode=mode) == model.model_dump(mode=mode)
+
+    def test_dump_supports_include(self):
+        """Test dump arguments such as include are honored."""
+        record = EmailRecord.from_model(make_email())
+
+        assert record.model_dump(include={"subject"}) == {"subject": "Hello"}
+
+    def test_state_round_trip(self):
+        """Test a state holding records dumps and reloads as records."""
+        state = EmailState(last_updated=NOW, emails={"msg-1": make_email()})
+
+        restored = EmailState.model_validate(state.model_dump(mode="json"))
+
+        assert isinstance(state.emails["msg-1"], EmailRecord)
+        assert isinstance(restored.emails["msg-1"], EmailRecord)
+        assert restored.model_dump() == state.model_dump()
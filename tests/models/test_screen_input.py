@@ -0,0 +1,117 @@
+"""Unit tests for ScreenInput."""
+
+import pytest
+from pydantic import ValidationError
+
+from tests.fixtures.modalities.screen import create_screen_element, create_screen_input
+
+
+class TestScreenInputInstantiation:
+    """Test ScreenInput instantiation."""
+
+    def test_defaults(self):
+        """Test a minimal click input."""
+        screen_input = create_screen_input()
+
+        assert screen_input.modality_type == "screen"
+        assert screen_input.interaction_type == "click"
+        assert screen_input.elements == {}
+        assert screen_input.removed == []
+
+    def test_elements_parsed_from_dicts(self):
+        """Test element dictionaries are validated into ScreenElements."""
+        screen_input = create_screen_input(
+            elements={"menu": {"role": "menu", "parent_id": "submit"}}
+        )
+
+        assert screen_input.elements["menu"].role == "menu"
+        assert screen_input.elements["menu"].properties == {}
+
+    def test_modality_type_is_frozen(self):
+        """Test modality_type cannot be changed."""
+        screen_input = create_screen_input()
+
+        with pytest.raises(ValidationError):
+            screen_input.modality_type = "chat"
+
+    def test_invalid_interaction_rejected(self):
+        """Test unknown interactions fail Pydantic validation."""
+        with pytest.raises(ValidationError):
+            create_screen_input(interaction_type="swipe")
+
+
+class TestScreenInputValidation:
+    """Test validate_input() per interaction."""
+
+    def test_click_valid(self):
+        """Test a targeted click passes validation."""
+        create_screen_input().validate_input()
+
+    @pytest.mark.parametrize("interaction_type", ["click", "type", "hover", "focus"])
+    def test_targeted_interactions_require_target(self, interaction_type):
+        """Test pointer and keyboard-focus interactions need a target."""
+        with pytest.raises(ValueError, match="target_element"):
+            create_screen_input(interaction_type, target_element=None).validate_input()
+
+    @pytest.mark.parametrize("interaction_type", ["scroll", "key", "update"])
+    def test_untargeted_interactions_valid(self, interaction_type):
+        """Test scrolls, keys and updates do not need a target."""
+        create_screen_input(interaction_type, target_element=None).validate_input()
+
+    def test_render_requires_app(self):
+        """Test a render must name its application."""
+        with pytest.raises(ValueError, match="requires app"):
+            create_screen_input("render", target_element=None).validate_input()
+
+    def test_render_rejects_removed(self):
+        """Test a render replaces the screen and cannot list removals."""
+        with pytest.raises(ValueError, match="omit removed"):
+            create_screen_input(
+                "render", target_element=None, app="Mail", removed=["x"]
+            ).validate_input()
+
+    def test_changed_and_removed_rejected(self):
+        """Test an element cannot be both changed and removed."""
+        with pytest.raises(ValueError, match="both changed and removed"):
+            create_screen_input(
+                elements={"x": create_screen_element()}, removed=["x"]
+            ).validate_input()
+
+    def test_self_parent_rejected(self):
+        """Test an element cannot be its own parent."""
+        with pytest.raises(ValueError, match="own parent"):
+            create_screen_input(
+                elements={"x": create_screen_element(parent_id="x")}
+            ).validate_input()
+
+
+class TestScreenInputAbstractMethods:
+    """Test summaries, affected entities and merging."""
+
+    def test_affected_entities(self):
+        """Test an input affects its app and target element."""
+        screen_input = create_screen_input(app="Mail")
+
+        assert screen_input.get_affected_entities() == ["app:Mail", "element:submit"]
+
+    def test_summary_of_render(self):
+        """Test a render summary names the app, window and element count."""
+        screen_input = create_screen_input(
+            "render", target_element=None, app="Mail", window="inbox",
+            elements={"x": create_screen_element()},
+        )
+
+        assert screen_input.get_summary() == "Rendered Mail/inbox (1 elements)"
+
+    def test_summary_of_typing(self):
+        """Test a typing summary shows the text and change count."""
+        screen_input = create_screen_input(
+            "type", target_element="username", interaction_data={"text": "alice"},
+            elements={"username": create_screen_element("textbox", value="alice")},
+        )
+
+        assert screen_input.get_summary() == "Type on username: alice (1 elements changed)"
+
+    def test_never_merges(self):
+        """Test screen inputs are never merged."""
+        assert create_screen_input().should_merge_with(create_screen_input()) is False
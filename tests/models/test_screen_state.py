@@ -0,0 +1,323 @@
+"""Unit tests for ScreenState.
+
+This test suite covers:
+1. General ModalityState behavior (applicable to all modalities)
+2. Screen-specific deltas, reconstruction at earlier times, history and undo
+"""
+
+import copy
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.modalities.screen_state import ScreenState
+from tests.fixtures.modalities.chat import create_chat_input
+from tests.fixtures.modalities.screen import (
+    create_screen_element,
+    create_screen_input,
+    create_screen_state,
+)
+
+START = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _apply(state: ScreenState, interaction_type: str = "click", **kwargs) -> None:
+    """Apply an input one second after the state's last update."""
+    kwargs.setdefault("timestamp", state.last_updated + timedelta(seconds=1))
+    state.apply_input(create_screen_input(interaction_type, **kwargs))
+
+
+def _type(state: ScreenState, element_id: str, text: str, **kwargs) -> None:
+    """Type text into a textbox, replacing its value."""
+    _apply(
+        state,
+        "type",
+        target_element=element_id,
+        interaction_data={"text": text},
+        elements={element_id: create_screen_element("textbox", value=text)},
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def login() -> ScreenState:
+    """A state showing a login form rendered at START."""
+    return create_screen_state(app="Browser", last_updated=START)
+
+
+class TestScreenStateInstantiation:
+    """Test ScreenState instantiation and basic properties."""
+
+    def test_instantiation_with_minimal_fields(self):
+        """Test a new state shows an empty screen."""
+        state = ScreenState(last_updated=START)
+
+        assert state.modality_type == "screen"
+        assert state.current_app is None
+        assert state.current_window is None
+        assert state.ui_elements == {}
+
+    def test_rendered_screen(self, login):
+        """Test the current app, window and elements after a render."""
+        assert login.current_app == "Browser"
+        assert login.current_window == "main"
+        assert set(login.ui_elements) == {"form", "username", "password", "submit"}
+
+    def test_model_round_trip(self, login):
+        """Test dumping and validating a state rebuilds its history."""
+        _type(login, "username", "alice")
+        _apply(login, removed=["form", "username", "password", "submit"], window="home")
+
+        restored = ScreenState.model_validate(login.model_dump())
+
+        assert restored.model_dump() == login.model_dump()
+        assert restored.ui_elements == login.ui_elements
+        assert restored.current_window == "home"
+
+    def test_deepcopy_is_independent(self, login):
+        """Test a deep copy does not share the current screen."""
+        copied = copy.deepcopy(login)
+        _type(copied, "username", "alice")
+
+        assert login.ui_elements["username"].value == ""
+
+    def test_apply_wrong_input_type_rejected(self, login):
+        """Test applying another modality's input raises ValueError."""
+        with pytest.raises(ValueError, match="ScreenInput"):
+            login.apply_input(create_chat_input())
+
+    def test_apply_updates_metadata(self, login):
+        """Test applying an input bumps update_count and last_updated."""
+        timestamp = START + timedelta(minutes=5)
+
+        _apply(login, timestamp=timestamp)
+
+        assert login.update_count == 2
+        assert login.last_updated == timestamp
+
+    def test_validate_state(self, login):
+        """Test orphaned elements are reported."""
+        assert login.validate_state() == []
+
+        _apply(login, "update", target_element=None, removed=["form"])
+
+        assert len(login.validate_state()) == 3
+
+    def test_clear(self, login):
+        """Test clearing drops the screen and its history."""
+        login.clear()
+
+        assert login.ui_elements == {}
+        assert len(login.timeline) == 0
+        assert login.update_count == 0
+
+
+class TestScreenStateInteractions:
+    """Test applying interactions."""
+
+    def test_typing_changes_value(self, login):
+        """Test a type interaction replaces the textbox."""
+        _type(login, "username", "alice")
+
+        assert login.ui_elements["username"].value == "alice"
+        assert login.ui_elements["password"].value == ""
+
+    def test_click_opens_dialog(self, login):
+        """Test a click can add elements and switch window."""
+        _apply(
+            login,
+            window="dialog",
+            elements={"dialog": create_screen_element("dialog", name="Welcome")},
+        )
+
+        assert login.current_window == "dialog"
+        assert login.ui_elements["dialog"].name == "Welcome"
+
+    def test_missing_target_rejected(self, login):
+        """Test interacting with an element not on screen raises ValueError."""
+        with pytest.raises(ValueError, match="not on screen"):
+            _apply(login, target_element="logout")
+
+    def test_target_added_by_same_step_allowed(self, login):
+        """Test a step may target an element it adds."""
+        _apply(
+            login,
+            "focus",
+            target_element="search",
+            elements={"search": create_screen_element("textbox")},
+        )
+
+        assert "search" in login.ui_elements
+
+    def test_missing_removed_element_rejected(self, login):
+        """Test removing an element not on screen raises ValueError."""
+        with pytest.raises(ValueError, match="not on screen"):
+            _apply(login, "update", target_element=None, removed=["logout"])
+
+    def test_render_target_must_be_in_new_screen(self, login):
+        """Test a render's target must be among its elements."""
+        with pytest.raises(ValueError, match="not on screen"):
+            _apply(login, "render", target_element="submit", app="Mail", elements={})
+
+    def test_failed_interaction_changes_nothing(self, login):
+        """Test a rejected interaction does not add a step."""
+        with pytest.raises(ValueError):
+            _apply(login, target_element="logout")
+
+        assert len(login.timeline) == 1
+        assert login.update_count == 1
+
+
+class TestScreenStateQueries:
+    """Test reading screens and history."""
+
+    def test_current_screen(self, login):
+        """Test querying without parameters returns the current screen."""
+        result = login.query({})
+
+        assert result["app"] == "Browser"
+        assert result["count"] == 4
+        assert result["elements"]["username"]["role"] == "textbox"
+
+    def test_screen_at_earlier_time(self, login):
+        """Test the screen is rebuilt as it was at an earlier time."""
+        _type(login, "username", "a", timestamp=START + timedelta(seconds=1))
+        _type(login, "username", "al", timestamp=START + timedelta(seconds=2))
+        _type(login, "username", "ali", timestamp=START + timedelta(seconds=3))
+
+        result = login.query({"at": START + timedelta(seconds=2)})
+
+        assert result["elements"]["username"]["value"] == "al"
+
+    def test_screen_before_first_interaction(self, login):
+        """Test the screen before any interaction is empty."""
+        result = login.query({"at": START - timedelta(seconds=1)})
+
+        assert result["app"] is None
+        assert result["elements"] == {}
+
+    def test_role_filter(self, login):
+        """Test filtering elements by role."""
+        result = login.query({"role": "textbox"})
+
+        assert set(result["elements"]) == {"username", "password"}
+
+    def test_subtree(self, login):
+        """Test selecting an element and its descendants."""
+        _apply(
+            login,
+            "update",
+            target_element=None,
+            elements={"other": create_screen_element("link")},
+        )
+
+        result = login.query({"root": "form"})
+
+        assert set(result["elements"]) == {"form", "username", "password", "submit"}
+
+    def test_missing_root_rejected(self, login):
+        """Test a root not on screen raises ValueError."""
+        with pytest.raises(ValueError, match="not on screen"):
+            login.query({"root": "missing"})
+
+    def test_history_newest_first(self, login):
+        """Test interaction history with type filter and offset."""
+        _type(login, "username", "alice")
+        _apply(login)
+        _type(login, "password", "secret")
+
+        result = login.query({"history": True, "interaction_type": "type"})
+        assert [item["target_element"] for item in result["interactions"]] == [
+            "password",
+            "username",
+        ]
+        assert result["interactions"][0]["changed"] == ["password"]
+
+        page = login.query({"history": True, "limit": 2, "offset": 1})
+        assert [item["interaction_type"] for item in page["interactions"]] == ["click", "type"]
+
+    def test_history_time_range(self, login):
+        """Test interaction history between since and until."""
+        for second in range(1, 6):
+            _apply(login, timestamp=START + timedelta(seconds=second))
+
+        result = login.query(
+            {
+                "history": True,
+                "since": START + timedelta(seconds=2),
+                "until": START + timedelta(seconds=4),
+            }
+        )
+
+        assert result["count"] == 2
+
+    def test_snapshot(self, login):
+        """Test the snapshot reports the screen and history size."""
+        _type(login, "username", "alice")
+
+        snapshot = login.get_snapshot()
+
+        assert snapshot["current_app"] == "Browser"
+        assert snapshot["element_count"] == 4
+        assert snapshot["ui_elements"]["username"]["value"] == "alice"
+        assert snapshot["history_length"] == 2
+        assert snapshot["keyframe_count"] >= 1
+
+
+class TestScreenStateUndo:
+    """Test create_undo_data() and apply_undo() round trips."""
+
+    @pytest.mark.parametrize(
+        ("interaction_type", "kwargs"),
+        [
+            (
+                "type",
+                {
+                    "target_element": "username",
+                    "elements": {"username": {"role": "textbox", "value": "x"}},
+                },
+            ),
+            ("update", {"target_element": None, "removed": ["submit"]}),
+            ("render", {"target_element": None, "app": "Mail", "elements": {}}),
+            ("scroll", {"target_element": None, "interaction_data": {"dy": 100}}),
+        ],
+    )
+    def test_undo_restores_state(self, login, interaction_type, kwargs):
+        """Test undoing an interaction restores the screen and history."""
+        for number in range(100):
+            _type(login, "username", str(number))
+        before = login.model_dump()
+        elements = dict(login.ui_elements)
+
+        screen_input = create_screen_input(
+            interaction_type, timestamp=login.last_updated + timedelta(seconds=1), **kwargs
+        )
+        undo_data = login.create_undo_data(screen_input)
+        login.apply_input(screen_input)
+        login.apply_undo(undo_data)
+
+        assert login.model_dump() == before
+        assert login.ui_elements == elements
+        assert login.validate_state() == []
+
+    def test_undo_data_is_small(self, login):
+        """Test undo data does not copy the screen."""
+        undo_data = login.create_undo_data(create_screen_input())
+
+        assert set(undo_data) == {
+            "action",
+            "length",
+            "state_previous_update_count",
+            "state_previous_last_updated",
+        }
+
+    def test_unknown_undo_action_rejected(self, login):
+        """Test apply_undo rejects unknown actions."""
+        with pytest.raises(ValueError, match="Unknown undo action"):
+            login.apply_undo(
+                {
+                    "action": "explode",
+                    "state_previous_update_count": 0,
+                    "state_previous_last_updated": START.isoformat(),
+                }
+            )
@@ -0,0 +1,264 @@
+"""Unit tests for the screen keyframe and delta timeline."""
+
+import copy
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.modalities.screen_input import ScreenElement
+from models.modalities.screen_timeline import (
+    KEYFRAME_MIN_CHANGES,
+    ScreenFrame,
+    ScreenStep,
+    ScreenTimeline,
+)
+
+START = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _element(value: str = "", role: str = "textbox") -> ScreenElement:
+    return ScreenElement(role=role, value=value)
+
+
+def _render(seconds: int, count: int, app: str = "App") -> ScreenStep:
+    """Return a render of count elements at START + seconds."""
+    return ScreenStep(
+        timestamp=START + timedelta(seconds=seconds),
+        interaction_type="render",
+        app=app,
+        window="main",
+        elements={f"e{number}": _element(str(number)) for number in range(count)},
+    )
+
+
+def _edit(seconds: int, **elements: str) -> ScreenStep:
+    """Return a step that sets the values of some elements."""
+    return ScreenStep(
+        timestamp=START + timedelta(seconds=seconds),
+        interaction_type="type",
+        elements={element_id: _element(value) for element_id, value in elements.items()},
+    )
+
+
+class TestScreenTimelineRecord:
+    """Test recording steps and the current screen."""
+
+    def test_empty(self):
+        """Test a new timeline shows an empty screen."""
+        timeline = ScreenTimeline()
+
+        assert len(timeline) == 0
+        assert timeline.current == ScreenFrame()
+        assert timeline.frame_at(START) == ScreenFrame()
+
+    def test_render_replaces_screen(self):
+        """Test a render replaces every element and is a keyframe."""
+        timeline = ScreenTimeline()
+        timeline.record(_render(0, 3))
+        timeline.record(_render(1, 2, app="Other"))
+
+        assert timeline.current.app == "Other"
+        assert set(timeline.current.elements) == {"e0", "e1"}
+        assert timeline.keyframe_count == 2
+
+    def test_delta_changes_and_removes(self):
+        """Test a delta replaces, adds and removes elements."""
+        timeline = ScreenTimeline()
+        timeline.record(_render(0, 3))
+        timeline.record(
+            ScreenStep(
+                timestamp=START + timedelta(seconds=1),
+                interaction_type="click",
+                window="dialog",
+                elements={"e0": _element("x"), "new": _element("y")},
+                removed=("e2",),
+            )
+        )
+
+        current = timeline.current
+        assert current.app == "App"
+        assert current.window == "dialog"
+        assert current.elements["e0"].value == "x"
+        assert set(current.elements) == {"e0", "e1", "new"}
+
+    def test_out_of_order_step_rejected(self):
+        """Test a step earlier than the last one raises ValueError."""
+        timeline = ScreenTimeline()
+        timeline.record(_render(10, 1))
+
+        with pytest.raises(ValueError, match="earlier than the last step"):
+            timeline.record(_edit(5, e0="x"))
+
+    def test_keyframes_follow_change_volume(self):
+        """Test keyframes are taken once changes reach the screen size."""
+        timeline = ScreenTimeline()
+        timeline.record(_render(0, 200))
+        for second in range(1, 401):
+            timeline.record(_edit(second, e0=str(second)))
+
+        # One render plus a keyframe every 200 single-element changes
+        assert timeline.keyframe_count == 3
+
+    def test_small_screens_keyframe_at_minimum(self):
+        """Test a tiny screen still waits KEYFRAME_MIN_CHANGES changes."""
+        timeline = ScreenTimeline()
+        timeline.record(_render(0, 1))
+        for second in range(1, KEYFRAME_MIN_CHANGES):
+            timeline.record(_edit(second, e0="x"))
+        assert timeline.keyframe_count == 1
+
+        timeline.record(_edit(KEYFRAME_MIN_CHANGES, e0="y"))
+        assert timeline.keyframe_count == 2
+
+    def test_unchanged_elements_are_shared(self):
+        """Test keyframes share element objects rather than copying them."""
+        timeline = ScreenTimeline()
+        timeline.record(_render(0, 10))
+        original = timeline.current.elements["e5"]
+        for second in range(1, 200):
+            timeline.record(_edit(second, e0=str(second)))
+
+        assert timeline.frame_at(START + timedelta(seconds=150)).elements["e5"] is original
+
+
+class TestScreenTimelineFrameAt:
+    """Test rebuilding earlier screens."""
+
+    def test_frame_at_times(self):
+        """Test the screen at a time includes every step at or before it."""
+        timeline = ScreenTimeline()
+        timeline.record(_render(0, 2))
+        timeline.record(_edit(10, e0="a"))
+        timeline.record(_edit(20, e0="b"))
+
+        assert timeline.frame_at(START - timedelta(seconds=1)) == ScreenFrame()
+        assert timeline.frame_at(START + timedelta(seconds=9)).elements["e0"].value == "0"
+        assert timeline.frame_at(START + timedelta(seconds=10)).elements["e0"].value == "a"
+        assert timeline.frame_at(START + timedelta(hours=1)).elements["e0"].value == "b"
+
+    def test_frame_at_is_a_copy(self):
+        """Test modifying a returned frame leaves the timeline unchanged."""
+        timeline = ScreenTimeline()
+        timeline.record(_render(0, 2))
+
+        timeline.frame_at(START).elements.clear()
+
+        assert len(timeline.current.elements) == 2
+
+    def test_frame_at_matches_replay(self):
+        """Test random steps rebuild the same screens as a full replay."""
+        rng = random.Random(11)
+        timeline = ScreenTimeline()
+        frames = []
+        for second in range(1500):
+            elements = timeline.current.elements
+            if not elements or rng.random() < 0.01:
+                step = _render(second, rng.randrange(1, 100))
+            else:
+                ids = list(elements)
+                removed = tuple(rng.sample(ids, min(len(ids), rng.randrange(0, 2))))
+                changed = {
+                    rng.choice(ids) if rng.random() < 0.7 else f"n{second}": _element(str(second))
+                    for _ in range(rng.randrange(0, 3))
+                }
+                step = ScreenStep(
+                    timestamp=START + timedelta(seconds=second),
+                    interaction_type="type",
+                    elements=changed,
+                    removed=tuple(element_id for element_id in removed if element_id not in changed),
+                )
+            timeline.record(step)
+            frames.append(timeline.current.copy())
+
+        for second in rng.sample(range(1500), 200):
+            assert timeline.frame_at(START + timedelta(seconds=second)) == frames[second]
+
+
+class TestScreenTimelineTruncate:
+    """Test dropping steps for undo."""
+
+    def test_truncate_restores_earlier_screen(self):
+        """Test truncating rebuilds the current screen and keyframes."""
+        timeline = ScreenTimeline()
+        timeline.record(_render(0, 1))
+        for second in range(1, 150):
+            timeline.record(_edit(second, e0=str(second)))
+        expected = copy.deepcopy(timeline)
+        for second in range(150, 300):
+            timeline.record(_edit(second, e0=str(second)))
+
+        timeline.truncate(150)
+
+        assert timeline == expected
+        assert timeline.current == expected.current
+        assert timeline.keyframe_count == expected.keyframe_count
+        assert timeline.validate() == []
+
+    def test_truncate_keeps_keyframe_schedule(self):
+        """Test steps recorded after truncating keyframe like a fresh timeline."""
+        timeline = ScreenTimeline()
+        fresh = ScreenTimeline()
+        timeline.record(_render(0, 1))
+        fresh.record(_render(0, 1))
+        for second in range(1, 100):
+            timeline.record(_edit(second, e0="x"))
+        timeline.truncate(30)
+        for second in range(1, 30):
+            fresh.record(_edit(second, e0="x"))
+
+        for second in range(30, 200):
+            timeline.record(_edit(second, e0="y"))
+            fresh.record(_edit(second, e0="y"))
+
+        assert timeline.keyframe_count == fresh.keyframe_count
+
+    def test_truncate_to_empty(self):
+        """Test truncating every step leaves an empty screen."""
+        timeline = ScreenTimeline()
+        timeline.record(_render(0, 3))
+
+        timeline.truncate(0)
+
+        assert len(timeline) == 0
+        assert timeline.current == ScreenFrame()
+        assert timeline.keyframe_count == 0
+
+
+class TestScreenTimelineSerialization:
+    """Test round trips and copies."""
+
+    def test_list_round_trip(self):
+        """Test from_list(to_list()) rebuilds steps and keyframes."""
+        timeline = ScreenTimeline()
+        timeline.record(_render(0, 50))
+        for second in range(1, 120):
+            timeline.record(_edit(second, e1=str(second)))
+
+        restored = ScreenTimeline.from_list(timeline.to_list())
+
+        assert restored == timeline
+        assert restored.current == timeline.current
+        assert restored.keyframe_count == timeline.keyframe_count
+
+    def test_deepcopy_is_independent(self):
+        """Test recording into a copy leaves the original unchanged."""
+        timeline = ScreenTimeline()
+        timeline.record(_render(0, 2))
+
+        copied = copy.deepcopy(timeline)
+        copied.record(_edit(1, e0="x"))
+
+        assert len(timeline) == 1
+        assert timeline.current.elements["e0"].value == "0"
+
+    def test_steps_in_range(self):
+        """Test selecting steps by since and until."""
+        timeline = ScreenTimeline()
+        timeline.record(_render(0, 1))
+        for second in range(1, 10):
+            timeline.record(_edit(second, e0=str(second)))
+
+        steps = timeline.steps(START + timedelta(seconds=3), START + timedelta(seconds=6))
+
+        assert [step.elements["e0"].value for step in steps] == ["3", "4", "5"]
@@ -22,6 +22,7 @@ SIMULATION_LOOP-SPECIFIC TESTS: These verify SimulationLoop-specific functionali
     - Stop signal: graceful shutdown
 """
 
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 
@@ -442,6 +443,24 @@ class TestSimulationEngineTimeControl:
 
         assert engine.environment.time_state.is_paused is False
 
+    def test_set_time_scale(self):
+        """SIMULATION_ENGINE-SPECIFIC: Test changing the time scale."""
+        engine = create_simulation_engine()
+
+        engine.set_time_scale(2.5)
+
+        assert engine.environment.time_state.time_scale == 2.5
+
+    @pytest.mark.parametrize("scale", [0.0, -1.0, float("nan")])
+    def test_set_time_scale_rejects_non_positive(self, scale):
+        """SIMULATION_ENGINE-SPECIFIC: Test non-positive time scales are rejected."""
+        engine = create_simulation_engine()
+
+        with pytest.raises(ValueError, match="must be positive"):
+            engine.set_time_scale(scale)
+
+        assert engine.environment.time_state.time_scale == 1.0
+
 
 class TestSimulationEngineEventManagement:
     """SIMULATION_ENGINE-SPECIFIC: Test event management methods."""
@@ -541,6 +560,64 @@ class TestSimulationEngineEventManagement:
         assert bad_event.error_message is not None
 
 
+class TestSimulationEngineCoalescing:
+    """SIMULATION_ENGINE-SPECIFIC: Test coalescing of mergeable due events."""
+
+    def _add_location_burst(self, engine, count):
+        start = engine.environment.time_state.current_time + timedelta(minutes=1)
+        events = []
+        for i in range(count):
+            scheduled_time = start + timedelta(milliseconds=100 * i)
+            events.append(
+                create_simulator_event(
+                    scheduled_time=scheduled_time,
+                    modality="location",
+                    data=location.create_location_input(
+                        latitude=40.0 + i / 1000, timestamp=scheduled_time
+                    ),
+                    created_at=scheduled_time - timedelta(minutes=5),
+                )
+            )
+        engine.event_queue.add_events(events)
+        return events
+
+    def test_coalescing_executes_only_latest_event(self):
+        """SIMULATION_ENGINE-SPECIFIC: Test a burst executes once when coalescing."""
+        engine = create_simulation_engine(event_queue=EventQueue(coalesce=True))
+        events = self._add_location_burst(engine, 5)
+        engine.start(auto_advance=False)
+
+        result = engine.advance_time(timedelta(hours=1))
+
+        assert result["events_executed"] == 1
+        assert events[-1].status == EventStatus.EXECUTED
+        assert all(e.status == EventStatus.SKIPPED for e in events[:-1])
+        assert engine.environment.get_state("location").current_latitude == events[-1].data.latitude
+
+    def test_without_coalescing_every_event_executes(self):
+        """SIMULATION_ENGINE-SPECIFIC: Test coalescing is opt-in."""
+        engine = create_simulation_engine()
+        events = self._add_location_burst(engine, 5)
+        engine.start(auto_advance=False)
+
+        result = engine.advance_time(timedelta(hours=1))
+
+        assert result["events_executed"] == 5
+        assert all(e.status == EventStatus.EXECUTED for e in events)
+
+    def test_reset_clears_merge_marks(self):
+        """SIMULATION_ENGINE-SPECIFIC: Test reset returns merged events to pending."""
+        engine = create_simulation_engine(event_queue=EventQueue(coalesce=True))
+        events = self._add_location_burst(engine, 3)
+        engine.start(auto_advance=False)
+        engine.advance_time(timedelta(hours=1))
+
+        engine.reset()
+
+        assert all(e.status == EventStatus.PENDING for e in events)
+        assert all("merged_into" not in e.metadata for e in events)
+
+
 class TestSimulationEngineStateAccess:
     """GENERAL PATTERN: Test state access methods."""
 
@@ -763,6 +840,47 @@ class TestSimulationLoopLifecycle:
 
         assert loop.is_running is False
 
+    def test_stop_while_holding_write_lock_raises(self):
+        """SIMULATION_LOOP-SPECIFIC: Test stopping under the engine's write lock is refused."""
+        engine = create_simulation_engine()
+        engine.start(auto_advance=False)
+        loop = SimulationLoop(engine=engine)
+        loop.start()
+
+        with engine.operation_lock.write():
+            with pytest.raises(RuntimeError, match="write lock"):
+                loop.stop()
+            assert loop.is_running is True
+
+        loop.stop()
+        assert loop.is_running is False
+
+    def test_stop_surfaces_join_timeout(self):
+        """SIMULATION_LOOP-SPECIFIC: Test a tick outlasting the stop timeout raises."""
+        engine = create_simulation_engine()
+        engine.start(auto_advance=False)
+        locked = threading.Event()
+
+        def hold_write_lock():
+            with engine.operation_lock.write():
+                locked.set()
+                time.sleep(0.3)
+
+        holder = threading.Thread(target=hold_write_lock)
+        holder.start()
+        assert locked.wait(timeout=1.0)
+        # The loop's first tick blocks until the holder releases the lock
+        loop = SimulationLoop(engine=engine)
+        loop.start()
+
+        with pytest.raises(TimeoutError, match="did not stop"):
+            loop.stop(timeout=0.01)
+        assert loop.is_running is True
+
+        holder.join()
+        loop.stop()
+        assert loop.is_running is False
+
     def test_loop_calls_tick(self):
         """SIMULATION_LOOP-SPECIFIC: Test that loop calls engine.tick()."""
         engine = create_simulation_engine()
@@ -1327,6 +1445,27 @@ class TestSimulationEngineRedo:
         after_redo_snapshot = location_state.get_snapshot()
         assert after_redo_snapshot == after_execute_snapshot
 
+    def test_redo_dict_payload(self):
+        """Verify redo parses an event whose input is held as a dict."""
+        engine = create_simulation_engine()
+        current_time = engine.environment.time_state.current_time
+        event = create_simulator_event(
+            scheduled_time=current_time + timedelta(hours=1),
+            modality="location",
+            data=location.create_location_input(latitude=42.0, longitude=-71.0),
+        )
+        engine.add_event(event)
+        engine.start(auto_advance=False)
+        engine.advance_time(timedelta(hours=2))
+        engine.undo(count=1)
+        # As if the queue had been restored from dumped events
+        event.data = event.data.model_dump()
+
+        result = engine.redo(count=1)
+
+        assert result["redone_count"] == 1
+        assert engine.environment.get_state("location").current_latitude == 42.0
+
     def test_redo_nothing_to_redo(self):
         """Verify redo with empty stack returns appropriate response."""
         engine = create_simulation_engine()
@@ -1499,3 +1638,17 @@ class TestSimulationEngineUndoClearReset:
         assert engine.undo_stack.undo_count == 0
         assert engine.undo_stack.redo_count == 0
 
+
+    @pytest.mark.parametrize("operation", ["reset", "clear"])
+    def test_reset_and_clear_wait_for_operation_lock(self, operation):
+        """Verify reset and clear do not run while another operation holds the lock."""
+        engine = create_simulation_engine()
+        worker = threading.Thread(target=getattr(engine, operation))
+
+        with engine.operation_lock.write():
+            worker.start()
+            worker.join(timeout=0.1)
+            assert worker.is_alive()
+
+        worker.join(timeout=5)
+        assert not worker.is_alive()
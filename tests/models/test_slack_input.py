@@ -0,0 +1,141 @@
+"""Unit tests for SlackInput (and the TeamChatInput it shares with Discord)."""
+
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from models.modalities.discord_input import DiscordInput
+from models.modalities.team_chat import extract_mentions
+from tests.fixtures.modalities.slack import create_slack_input
+
+
+class TestSlackInputInstantiation:
+    """Test SlackInput instantiation."""
+
+    def test_defaults(self):
+        """Test a minimal post_message input."""
+        slack_input = create_slack_input()
+
+        assert slack_input.modality_type == "slack"
+        assert slack_input.operation == "post_message"
+        assert slack_input.thread_seq is None
+        assert slack_input.space_id is None
+
+    def test_workspace_id_is_space_id(self):
+        """Test Slack channels belong to workspaces, Discord channels to servers."""
+        slack_input = create_slack_input(operation="create_channel", workspace_id="T1")
+        discord_input = DiscordInput(
+            operation="create_channel",
+            channel_id="general",
+            server_id="S1",
+            timestamp=datetime.now(timezone.utc),
+        )
+
+        assert slack_input.space_id == "T1"
+        assert discord_input.space_id == "S1"
+        assert discord_input.modality_type == "discord"
+
+    def test_modality_type_is_frozen(self):
+        """Test modality_type cannot be changed."""
+        slack_input = create_slack_input()
+
+        with pytest.raises(ValidationError):
+            slack_input.modality_type = "discord"
+
+    def test_invalid_operation_rejected(self):
+        """Test unknown operations fail Pydantic validation."""
+        with pytest.raises(ValidationError):
+            create_slack_input(operation="archive_channel")
+
+    def test_negative_seq_rejected(self):
+        """Test message and thread seqs must not be negative."""
+        with pytest.raises(ValidationError):
+            create_slack_input(thread_seq=-1)
+        with pytest.raises(ValidationError):
+            create_slack_input(operation="delete_message", message_seq=-1)
+
+
+class TestSlackInputValidation:
+    """Test validate_input() per operation."""
+
+    def test_post_message_valid(self):
+        """Test a complete post passes validation."""
+        create_slack_input().validate_input()
+
+    @pytest.mark.parametrize(
+        ("kwargs", "missing"),
+        [
+            ({"channel_id": None}, "channel_id"),
+            ({"author": None}, "author"),
+            ({"text": None}, "text"),
+        ],
+    )
+    def test_post_message_requires_fields(self, kwargs, missing):
+        """Test post_message requires a channel, author and text."""
+        with pytest.raises(ValueError, match=missing):
+            create_slack_input(**kwargs).validate_input()
+
+    def test_add_user_requires_user_id(self):
+        """Test add_user requires user_id but not channel_id."""
+        with pytest.raises(ValueError, match="user_id"):
+            create_slack_input(operation="add_user", channel_id=None).validate_input()
+        create_slack_input(
+            operation="add_user", channel_id=None, user_id="bob"
+        ).validate_input()
+
+    @pytest.mark.parametrize(
+        "operation", ["edit_message", "delete_message", "add_reaction", "remove_reaction"]
+    )
+    def test_message_operations_require_seq(self, operation):
+        """Test operations on a message require message_seq."""
+        with pytest.raises(ValueError, match="message_seq"):
+            create_slack_input(
+                operation=operation, emoji="tada", user_id="bob"
+            ).validate_input()
+
+    def test_reactions_require_emoji_and_user(self):
+        """Test reactions require an emoji and the reacting user."""
+        with pytest.raises(ValueError, match="emoji"):
+            create_slack_input(
+                operation="add_reaction", message_seq=0, user_id="bob"
+            ).validate_input()
+        with pytest.raises(ValueError, match="user_id"):
+            create_slack_input(
+                operation="remove_reaction", message_seq=0, emoji="tada"
+            ).validate_input()
+
+    def test_mark_read_seq_optional(self):
+        """Test mark_read defaults to the latest message."""
+        create_slack_input(operation="mark_read", author=None, text=None).validate_input()
+
+
+class TestSlackInputHelpers:
+    """Test summaries, affected entities, merging and mention parsing."""
+
+    def test_affected_entities(self):
+        """Test the entity affected by each kind of operation."""
+        assert create_slack_input().get_affected_entities() == ["channel:general"]
+        assert create_slack_input(
+            operation="delete_message", message_seq=4
+        ).get_affected_entities() == ["message:general/4"]
+        assert create_slack_input(
+            operation="add_user", user_id="bob"
+        ).get_affected_entities() == ["user:bob"]
+
+    def test_summary_truncates_text(self):
+        """Test long message text is shortened in the summary."""
+        summary = create_slack_input(text="x" * 80, thread_seq=3).get_summary()
+
+        assert summary.startswith("alice in thread 3 in #general: ")
+        assert summary.endswith("...")
+
+    def test_never_merges(self):
+        """Test team chat inputs are not merged."""
+        assert not create_slack_input().should_merge_with(create_slack_input())
+
+    def test_extract_mentions(self):
+        """Test user mentions are found once each, in order, skipping @here."""
+        text = "<@U1> and <@!U2>, cc @bob.smith and @here; email me@example.com <@U1>"
+
+        assert extract_mentions(text) == ["U1", "U2", "bob.smith"]
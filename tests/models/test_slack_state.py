@@ -0,0 +1,440 @@
+"""Unit tests for SlackState (and the TeamChatState it shares with Discord).
+
+This test suite covers:
+1. General ModalityState behavior (applicable to all modalities)
+2. Team chat-specific threads, mentions, read tracking, paging and undo
+"""
+
+import copy
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.modalities.slack_state import SlackState
+from tests.fixtures.modalities.chat import create_chat_input
+from tests.fixtures.modalities.slack import create_slack_input, create_slack_state
+
+START = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _post(state: SlackState, channel_id: str, author: str, text: str, **kwargs) -> None:
+    """Post a message one second after the state's last update."""
+    state.apply_input(
+        create_slack_input(
+            channel_id=channel_id,
+            author=author,
+            text=text,
+            timestamp=state.last_updated + timedelta(seconds=1),
+            **kwargs,
+        )
+    )
+
+
+def _apply_with_undo(state: SlackState, **kwargs) -> dict:
+    """Apply an input to state and return the undo data captured before it."""
+    kwargs.setdefault("timestamp", state.last_updated + timedelta(seconds=1))
+    slack_input = create_slack_input(**kwargs)
+    undo_data = state.create_undo_data(slack_input)
+    state.apply_input(slack_input)
+    return undo_data
+
+
+class TestSlackStateInstantiation:
+    """Test SlackState instantiation and basic properties."""
+
+    def test_instantiation_with_minimal_fields(self):
+        """Test a new state has no channels or users."""
+        state = SlackState(last_updated=START)
+
+        assert state.modality_type == "slack"
+        assert state.user_id == "user"
+        assert state.channels == {}
+        assert state.users == {}
+
+    def test_model_round_trip(self):
+        """Test dumping and validating a state rebuilds equal channel logs."""
+        state = create_slack_state(
+            messages={"general": [("alice", "hi <@user>"), ("bob", "hello")]},
+            last_updated=START,
+        )
+        _post(state, "general", "bob", "reply", thread_seq=0)
+
+        restored = SlackState.model_validate(state.model_dump(mode="json"))
+
+        assert restored.model_dump() == state.model_dump()
+        assert restored.channels["general"].log.replies(0) == [2]
+
+    def test_deepcopy_is_independent(self):
+        """Test copies do not share channel logs."""
+        state = create_slack_state(messages={"general": [("alice", "hi")]}, last_updated=START)
+        copied = copy.deepcopy(state)
+        _post(copied, "general", "bob", "new")
+
+        assert len(state.channels["general"].log) == 1
+
+
+class TestSlackStateApplyInput:
+    """Test applying each operation."""
+
+    def test_wrong_input_type_rejected(self):
+        """Test inputs of other modalities are rejected."""
+        state = SlackState(last_updated=START)
+
+        with pytest.raises(ValueError, match="SlackInput"):
+            state.apply_input(create_chat_input())
+
+    def test_create_channel(self):
+        """Test creating a channel in a workspace."""
+        state = SlackState(last_updated=START)
+        state.apply_input(
+            create_slack_input(
+                operation="create_channel",
+                channel_id="C1",
+                channel_name="eng",
+                workspace_id="T1",
+                is_private=True,
+                timestamp=START,
+            )
+        )
+
+        channel = state.channels["C1"]
+        assert channel.name == "eng"
+        assert channel.space_id == "T1"
+        assert channel.is_private
+        assert state.update_count == 1
+
+    def test_create_existing_channel_rejected(self):
+        """Test a channel cannot be created twice."""
+        state = create_slack_state(messages={"general": [("alice", "hi")]})
+
+        with pytest.raises(ValueError, match="already exists"):
+            state.apply_input(create_slack_input(operation="create_channel"))
+
+    def test_post_creates_channel(self):
+        """Test posting to an unknown channel creates it."""
+        state = SlackState(last_updated=START)
+        _post(state, "random", "alice", "hello")
+
+        assert len(state.channels["random"].log) == 1
+        assert state.last_updated == START + timedelta(seconds=1)
+
+    def test_reply_to_missing_message_rejected(self):
+        """Test replies must address an existing message."""
+        state = create_slack_state(messages={"general": [("alice", "hi")]})
+
+        with pytest.raises(ValueError, match="not found"):
+            _post(state, "general", "bob", "reply", thread_seq=5)
+
+    def test_add_user_keeps_added_at(self):
+        """Test renaming a user keeps when they were first added."""
+        state = SlackState(last_updated=START)
+        state.apply_input(
+            create_slack_input(operation="add_user", user_id="bob", timestamp=START)
+        )
+        state.apply_input(
+            create_slack_input(
+                operation="add_user",
+                user_id="bob",
+                display_name="Bob",
+                timestamp=START + timedelta(hours=1),
+            )
+        )
+
+        assert state.users["bob"].display_name == "Bob"
+        assert state.users["bob"].added_at == START
+
+    def test_edit_and_delete(self):
+        """Test editing then deleting a message."""
+        state = create_slack_state(messages={"general": [("alice", "hi")]}, last_updated=START)
+        _apply_with_undo(state, operation="edit_message", message_seq=0, text="hello")
+        assert state.channels["general"].log.text(0) == "hello"
+
+        _apply_with_undo(state, operation="delete_message", message_seq=0)
+        assert state.channels["general"].log.is_deleted(0)
+
+        with pytest.raises(ValueError, match="deleted"):
+            _apply_with_undo(state, operation="edit_message", message_seq=0, text="again")
+        with pytest.raises(ValueError, match="already deleted"):
+            _apply_with_undo(state, operation="delete_message", message_seq=0)
+
+    def test_reactions(self):
+        """Test adding and removing reactions."""
+        state = create_slack_state(messages={"general": [("alice", "hi")]}, last_updated=START)
+        _apply_with_undo(
+            state, operation="add_reaction", message_seq=0, emoji="tada", user_id="bob"
+        )
+        _apply_with_undo(
+            state, operation="add_reaction", message_seq=0, emoji="tada", user_id="bob"
+        )
+        assert state.channels["general"].log.reactions(0) == {"tada": ["bob"]}
+
+        _apply_with_undo(
+            state, operation="remove_reaction", message_seq=0, emoji="tada", user_id="bob"
+        )
+        assert state.channels["general"].log.reactions(0) == {}
+
+        with pytest.raises(ValueError, match="has not reacted"):
+            _apply_with_undo(
+                state, operation="remove_reaction", message_seq=0, emoji="tada", user_id="bob"
+            )
+
+    def test_missing_message_rejected(self):
+        """Test operations on a seq past the end of the channel fail."""
+        state = create_slack_state(messages={"general": [("alice", "hi")]})
+
+        with pytest.raises(ValueError, match="Message 3 not found"):
+            state.apply_input(
+                create_slack_input(operation="delete_message", message_seq=3)
+            )
+
+
+class TestSlackStateReadTracking:
+    """Test unread counts, mentions and read cursors."""
+
+    def test_unread_counts(self):
+        """Test unread and mention counts per channel and in total."""
+        state = create_slack_state(
+            messages={
+                "general": [("alice", "hi"), ("bob", "<@user> look")],
+                "random": [("carol", "@user lunch?")],
+            },
+            last_updated=START,
+        )
+
+        snapshot = state.get_snapshot()
+        assert snapshot["message_count"] == 3
+        assert snapshot["unread_count"] == 3
+        assert snapshot["unread_mention_count"] == 2
+
+    def test_mark_read(self):
+        """Test marking read up to a message and up to the latest."""
+        state = create_slack_state(
+            messages={"general": [("alice", "a"), ("bob", "<@user> b"), ("carol", "c")]},
+            last_updated=START,
+        )
+        _apply_with_undo(state, operation="mark_read", message_seq=0)
+        summary = state.get_snapshot()["channels"][0]
+        assert summary["unread_count"] == 2
+        assert summary["unread_mention_count"] == 1
+
+        _apply_with_undo(state, operation="mark_read")
+        assert state.get_snapshot()["unread_count"] == 0
+
+    def test_own_post_marks_channel_read(self):
+        """Test posting as the simulated user reads the channel."""
+        state = create_slack_state(messages={"general": [("alice", "hi")]}, last_updated=START)
+        _post(state, "general", "user", "hello")
+
+        assert state.channels["general"].last_read_seq == 1
+        assert state.get_snapshot()["unread_count"] == 0
+
+    def test_deleted_messages_not_unread(self):
+        """Test deleted messages are not counted as unread."""
+        state = create_slack_state(
+            messages={"general": [("alice", "a"), ("bob", "<@user> b")]}, last_updated=START
+        )
+        _apply_with_undo(state, operation="delete_message", message_seq=1)
+
+        snapshot = state.get_snapshot()
+        assert snapshot["unread_count"] == 1
+        assert snapshot["unread_mention_count"] == 0
+
+    def test_edit_moves_mentions(self):
+        """Test editing a mention out of a message updates mention counts."""
+        state = create_slack_state(messages={"general": [("bob", "<@user> hi")]}, last_updated=START)
+        _apply_with_undo(state, operation="edit_message", message_seq=0, text="hi all")
+
+        assert state.get_snapshot()["unread_mention_count"] == 0
+
+
+class TestSlackStateQuery:
+    """Test querying channels, history, threads and mentions."""
+
+    @pytest.fixture
+    def busy_state(self) -> SlackState:
+        """A channel of 25 messages plus a thread and another channel."""
+        state = create_slack_state(
+            messages={"general": [(f"u{i % 3}", f"message {i}") for i in range(25)]},
+            last_updated=START,
+        )
+        _post(state, "general", "bob", "reply <@user>", thread_seq=3)
+        _post(state, "random", "carol", "hey @user")
+        return state
+
+    def test_list_channels(self, busy_state):
+        """Test channels are listed most recently active first."""
+        result = busy_state.query({})
+
+        assert [channel["channel_id"] for channel in result["channels"]] == ["random", "general"]
+        assert result["count"] == 2
+        assert result["messages"] == []
+
+    def test_history_pages_newest_first(self, busy_state):
+        """Test paging through history with cursors."""
+        first = busy_state.query({"channel_id": "general", "limit": 10})
+        assert [m["seq"] for m in first["messages"]] == list(range(24, 14, -1))
+        assert first["next_cursor"] == 15
+
+        second = busy_state.query(
+            {"channel_id": "general", "limit": 10, "cursor": first["next_cursor"]}
+        )
+        third = busy_state.query(
+            {"channel_id": "general", "limit": 10, "cursor": second["next_cursor"]}
+        )
+        assert [m["seq"] for m in third["messages"]] == list(range(4, -1, -1))
+        assert third["next_cursor"] is None
+
+    def test_history_ascending_with_replies(self, busy_state):
+        """Test ascending order and including thread replies."""
+        result = busy_state.query(
+            {"channel_id": "general", "order": "asc", "include_replies": True, "cursor": 22}
+        )
+
+        assert [m["seq"] for m in result["messages"]] == [23, 24, 25]
+        assert result["messages"][-1]["thread_seq"] == 3
+
+    def test_history_time_window(self, busy_state):
+        """Test since/until select a time window."""
+        result = busy_state.query(
+            {
+                "channel_id": "general",
+                "since": START + timedelta(seconds=5),
+                "until": START + timedelta(seconds=8),
+                "order": "asc",
+            }
+        )
+
+        assert [m["seq"] for m in result["messages"]] == [5, 6, 7]
+
+    def test_history_filters(self, busy_state):
+        """Test author, search and unread filters."""
+        by_author = busy_state.query({"channel_id": "general", "author": "u1"})
+        assert all(m["author"] == "u1" for m in by_author["messages"])
+        assert by_author["count"] == 8
+
+        search = busy_state.query({"channel_id": "general", "search": "MESSAGE 1"})
+        assert {m["seq"] for m in search["messages"]} == {1} | set(range(10, 20))
+
+        busy_state.channels["general"].last_read_seq = 22
+        unread = busy_state.query({"channel_id": "general", "unread_only": True})
+        assert [m["seq"] for m in unread["messages"]] == [24, 23]
+
+    def test_thread(self, busy_state):
+        """Test reading a thread from any of its messages."""
+        result = busy_state.query({"channel_id": "general", "thread_seq": 25})
+
+        assert [m["seq"] for m in result["messages"]] == [3, 25]
+        assert result["messages"][0]["reply_count"] == 1
+
+    def test_mentions_across_channels(self, busy_state):
+        """Test mentions are merged across channels, newest first."""
+        result = busy_state.query({"mentions_of": "user"})
+
+        assert [(m["channel_id"], m["seq"]) for m in result["messages"]] == [
+            ("random", 0),
+            ("general", 25),
+        ]
+        assert result["messages"][0]["mentions"] == ["user"]
+
+    def test_unread_mentions(self, busy_state):
+        """Test unread_only skips mentions before the read cursor."""
+        busy_state.channels["random"].last_read_seq = 0
+
+        result = busy_state.query({"mentions_of": "user", "unread_only": True})
+
+        assert [m["channel_id"] for m in result["messages"]] == ["general"]
+
+    def test_missing_channel_rejected(self, busy_state):
+        """Test querying an unknown channel raises ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            busy_state.query({"channel_id": "nope"})
+
+
+class TestSlackStateUndo:
+    """Test undoing every operation restores the previous state."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"operation": "create_channel", "channel_id": "new"},
+            {"operation": "add_user", "user_id": "alice", "display_name": "Alice"},
+            {"operation": "add_user", "user_id": "dave"},
+            {"channel_id": "general", "author": "bob", "text": "<@carol> hi"},
+            {"channel_id": "general", "author": "user", "text": "mine"},
+            {"channel_id": "brand-new", "author": "bob", "text": "first"},
+            {"channel_id": "general", "author": "bob", "text": "reply", "thread_seq": 0},
+            {"operation": "edit_message", "message_seq": 1, "text": "<@dave> edited"},
+            {"operation": "edit_message", "message_seq": 2, "text": "edited twice"},
+            {"operation": "delete_message", "message_seq": 1},
+            {"operation": "add_reaction", "message_seq": 0, "emoji": "tada", "user_id": "dave"},
+            {"operation": "remove_reaction", "message_seq": 0, "emoji": "eyes", "user_id": "bob"},
+            {"operation": "mark_read", "message_seq": 1},
+        ],
+    )
+    def test_undo_restores_state(self, kwargs):
+        """Test apply then undo leaves the state unchanged."""
+        state = create_slack_state(
+            messages={"general": [("alice", "hi"), ("bob", "<@carol> look"), ("carol", "x")]},
+            last_updated=START,
+        )
+        state.apply_input(
+            create_slack_input(operation="add_user", user_id="alice", timestamp=START)
+        )
+        for operation, extra in [
+            ("edit_message", {"message_seq": 2, "text": "edited once"}),
+            ("add_reaction", {"message_seq": 0, "emoji": "eyes", "user_id": "bob"}),
+        ]:
+            _apply_with_undo(state, operation=operation, **extra)
+        before = state.model_dump()
+
+        undo_data = _apply_with_undo(state, **kwargs)
+        state.apply_undo(undo_data)
+
+        assert state.model_dump() == before
+        assert state.validate_state() == []
+
+    def test_undo_post_restores_mentions(self):
+        """Test undoing a post removes it from the mention index."""
+        state = create_slack_state(messages={"general": [("alice", "hi")]}, last_updated=START)
+        undo_data = _apply_with_undo(
+            state, channel_id="general", author="bob", text="<@user> ping"
+        )
+
+        state.apply_undo(undo_data)
+
+        assert state.query({"mentions_of": "user"})["count"] == 0
+
+    def test_undo_failed_operation_is_noop(self):
+        """Test undo data for an input that will fail does nothing."""
+        state = create_slack_state(messages={"general": [("alice", "hi")]}, last_updated=START)
+        undo_data = state.create_undo_data(
+            create_slack_input(operation="delete_message", message_seq=9)
+        )
+
+        assert undo_data["action"] == "noop"
+
+    def test_unknown_undo_action_rejected(self):
+        """Test unknown undo actions raise ValueError."""
+        state = SlackState(last_updated=START)
+
+        with pytest.raises(ValueError, match="Unknown undo action"):
+            state.apply_undo(
+                {
+                    "action": "bogus",
+                    "state_previous_update_count": 0,
+                    "state_previous_last_updated": START.isoformat(),
+                }
+            )
+
+
+class TestSlackStateClear:
+    """Test clearing state."""
+
+    def test_clear(self):
+        """Test clear removes channels and users."""
+        state = create_slack_state(messages={"general": [("alice", "hi")]})
+        state.clear()
+
+        assert state.channels == {}
+        assert state.update_count == 0
+        assert state.summary == "0 channels, 0 messages (0 unread)"
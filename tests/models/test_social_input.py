@@ -0,0 +1,114 @@
+"""Unit tests for SocialMediaInput."""
+
+import pytest
+from pydantic import ValidationError
+
+from tests.fixtures.modalities.social import create_social_input
+
+
+class TestSocialMediaInputInstantiation:
+    """Test SocialMediaInput instantiation."""
+
+    def test_defaults(self):
+        """Test a minimal post input."""
+        social_input = create_social_input()
+
+        assert social_input.modality_type == "social"
+        assert social_input.operation == "post"
+        assert social_input.reply_to is None
+        assert social_input.repost_of is None
+
+    def test_new_post_id_defaults_to_input_id(self):
+        """Test a post without post_id takes the input ID."""
+        social_input = create_social_input()
+        assert social_input.new_post_id == social_input.input_id
+        assert create_social_input(post_id="p1").new_post_id == "p1"
+
+    def test_modality_type_is_frozen(self):
+        """Test modality_type cannot be changed."""
+        social_input = create_social_input()
+
+        with pytest.raises(ValidationError):
+            social_input.modality_type = "chat"
+
+    def test_invalid_operation_rejected(self):
+        """Test unknown operations fail Pydantic validation."""
+        with pytest.raises(ValidationError):
+            create_social_input(operation="block")
+
+
+class TestSocialMediaInputValidation:
+    """Test validate_input() per operation."""
+
+    def test_post_valid(self):
+        """Test a complete post passes validation."""
+        create_social_input().validate_input()
+
+    @pytest.mark.parametrize(
+        ("kwargs", "missing"),
+        [
+            ({"content": None}, "content"),
+            ({"operation": "reply", "content": None, "reply_to": "p1"}, "content"),
+            ({"operation": "reply"}, "reply_to"),
+            ({"operation": "repost"}, "repost_of"),
+            ({"operation": "like"}, "post_id"),
+            ({"operation": "unlike"}, "post_id"),
+            ({"operation": "delete"}, "post_id"),
+            ({"operation": "follow"}, "target_user_id"),
+            ({"operation": "unfollow"}, "target_user_id"),
+        ],
+    )
+    def test_required_fields(self, kwargs, missing):
+        """Test each operation requires its fields."""
+        with pytest.raises(ValueError, match=missing):
+            create_social_input(**kwargs).validate_input()
+
+    def test_repost_without_comment_valid(self):
+        """Test a repost does not need content."""
+        create_social_input(operation="repost", content=None, repost_of="p1").validate_input()
+
+    def test_follow_self_rejected(self):
+        """Test users cannot follow themselves."""
+        with pytest.raises(ValueError, match="themselves"):
+            create_social_input(
+                operation="follow", user_id="alice", target_user_id="alice"
+            ).validate_input()
+
+
+class TestSocialMediaInputAbstractMethods:
+    """Test summaries, affected entities and merging."""
+
+    def test_affected_entities_of_reply(self):
+        """Test a reply affects the new post and its parent."""
+        social_input = create_social_input(operation="reply", reply_to="p1", post_id="p2")
+
+        assert social_input.get_affected_entities() == ["post:p2", "post:p1"]
+
+    def test_affected_entities_of_follow(self):
+        """Test a follow affects both users."""
+        social_input = create_social_input(operation="follow", target_user_id="bob")
+
+        assert social_input.get_affected_entities() == ["user:alice", "user:bob"]
+
+    def test_affected_entities_of_like(self):
+        """Test a like affects the liked post."""
+        social_input = create_social_input(operation="like", post_id="p1")
+
+        assert social_input.get_affected_entities() == ["post:p1"]
+
+    def test_summary_truncates_content(self):
+        """Test long post text is shortened in the summary."""
+        summary = create_social_input(content="x" * 80).get_summary()
+
+        assert summary.startswith("@alice posted: ")
+        assert summary.endswith("...")
+
+    def test_summary_of_follow(self):
+        """Test a follow summary names both users."""
+        summary = create_social_input(operation="follow", target_user_id="bob").get_summary()
+
+        assert summary == "@alice followed @bob"
+
+    def test_never_merges(self):
+        """Test social media inputs are never merged."""
+        assert create_social_input().should_merge_with(create_social_input()) is False
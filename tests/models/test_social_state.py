@@ -0,0 +1,500 @@
+"""Unit tests for SocialMediaState.
+
+This test suite covers:
+1. General ModalityState behavior (applicable to all modalities)
+2. Social media-specific ranking, fan-out, follows, feed paging and undo
+"""
+
+import copy
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.modalities.social_state import SocialMediaState
+from tests.fixtures.modalities.chat import create_chat_input
+from tests.fixtures.modalities.social import create_social_input, create_social_state
+
+START = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _apply(state: SocialMediaState, operation: str = "post", **kwargs) -> None:
+    """Apply an input one second after the state's last update."""
+    kwargs.setdefault("timestamp", state.last_updated + timedelta(seconds=1))
+    state.apply_input(create_social_input(operation=operation, **kwargs))
+
+
+def _apply_with_undo(state: SocialMediaState, operation: str = "post", **kwargs) -> dict:
+    """Apply an input to state and return the undo data captured before it."""
+    kwargs.setdefault("timestamp", state.last_updated + timedelta(seconds=1))
+    social_input = create_social_input(operation=operation, **kwargs)
+    undo_data = state.create_undo_data(social_input)
+    state.apply_input(social_input)
+    return undo_data
+
+
+def _feed(state: SocialMediaState, user: str = "user", **params) -> list[str]:
+    """Return the post IDs of a feed page."""
+    result = state.query({"feed_of": user, "limit": 1000, **params})
+    return [post["post_id"] for post in result["posts"]]
+
+
+def _timelines(state: SocialMediaState) -> dict[str, list[str]]:
+    """Return every built timeline's post IDs."""
+    return {user: timeline.post_ids() for user, timeline in state._timelines.items()}
+
+
+def _rebuilt(state: SocialMediaState) -> dict[str, list[str]]:
+    """Return every built timeline's post IDs, rebuilt from scratch."""
+    return {user: state._build_timeline(user).post_ids() for user in state._timelines}
+
+
+@pytest.fixture
+def network() -> SocialMediaState:
+    """A state where the simulated user follows alice and bob, not carol."""
+    return create_social_state(
+        following={"user": ["alice", "bob"]},
+        posts=[("a1", "alice", "first"), ("b1", "bob", "second"), ("c1", "carol", "third")],
+        last_updated=START,
+    )
+
+
+class TestSocialMediaStateInstantiation:
+    """Test SocialMediaState instantiation and basic properties."""
+
+    def test_instantiation_with_minimal_fields(self):
+        """Test a new state has no posts or follows."""
+        state = SocialMediaState(last_updated=START)
+
+        assert state.modality_type == "social"
+        assert state.user_id == "user"
+        assert state.posts == {}
+        assert state.following == {}
+        assert state.query({})["posts"] == []
+
+    def test_model_round_trip(self, network):
+        """Test dumping and validating a state rebuilds equal feeds."""
+        _apply(network, "like", user_id="dave", post_id="a1")
+        _apply(network, "reply", user_id="bob", content="re", reply_to="a1", post_id="r1")
+
+        restored = SocialMediaState.model_validate(network.model_dump())
+
+        assert restored.model_dump() == network.model_dump()
+        assert _feed(restored) == _feed(network)
+        assert restored.query({"replies_to": "a1"})["count"] == 1
+
+    def test_deepcopy_is_independent(self, network):
+        """Test a deep copy does not share timelines with the original."""
+        copied = copy.deepcopy(network)
+        _apply(copied, user_id="alice", content="new", post_id="a2")
+
+        assert "a2" in _feed(copied)
+        assert "a2" not in _feed(network)
+
+    def test_apply_wrong_input_type_rejected(self, network):
+        """Test applying another modality's input raises ValueError."""
+        with pytest.raises(ValueError, match="SocialMediaInput"):
+            network.apply_input(create_chat_input())
+
+    def test_apply_updates_metadata(self, network):
+        """Test applying an input bumps update_count and last_updated."""
+        count = network.update_count
+        timestamp = START + timedelta(hours=1)
+
+        _apply(network, user_id="alice", content="later", timestamp=timestamp)
+
+        assert network.update_count == count + 1
+        assert network.last_updated == timestamp
+
+    def test_validate_state(self, network):
+        """Test a consistent state has no validation errors."""
+        assert network.validate_state() == []
+        network.following["bob"] = {"bob"}
+        assert network.validate_state() == ["User 'bob' follows themselves"]
+
+    def test_clear(self, network):
+        """Test clearing removes posts, follows and timelines."""
+        network.clear()
+
+        assert network.posts == {}
+        assert network.following == {}
+        assert network.update_count == 0
+        assert _feed(network) == []
+
+
+class TestSocialMediaStateFeeds:
+    """Test feed contents and ranking."""
+
+    def test_feed_includes_own_and_followed_posts(self, network):
+        """Test a feed shows the user's and their followees' posts, newest first."""
+        _apply(network, user_id="user", content="mine", post_id="u1")
+
+        assert _feed(network) == ["u1", "b1", "a1"]
+
+    def test_feed_of_another_user(self, network):
+        """Test reading a feed builds it for any user."""
+        assert _feed(network, "carol") == ["c1"]
+        _apply(network, user_id="carol", content="more", post_id="c2")
+        assert _feed(network, "carol") == ["c2", "c1"]
+
+    def test_like_raises_rank(self, network):
+        """Test a like moves an older post above a newer one."""
+        _apply(network, "like", user_id="dave", post_id="a1")
+
+        assert _feed(network) == ["a1", "b1"]
+
+    def test_unlike_lowers_rank(self, network):
+        """Test removing the like restores the original order."""
+        _apply(network, "like", user_id="dave", post_id="a1")
+        _apply(network, "unlike", user_id="dave", post_id="a1")
+
+        assert _feed(network) == ["b1", "a1"]
+
+    def test_reply_raises_parent_rank(self, network):
+        """Test replies rank their parent up and stay out of feeds."""
+        _apply(network, "reply", user_id="carol", content="re", reply_to="a1", post_id="r1")
+
+        assert network.posts["a1"].reply_count == 1
+        assert _feed(network) == ["a1", "b1"]
+
+    def test_repost_fans_out_to_reposter_followers(self, network):
+        """Test a repost of an unfollowed author reaches the reposter's followers."""
+        _apply(network, "repost", user_id="bob", content=None, repost_of="c1", post_id="rp1")
+
+        feed = network.query({})["posts"]
+        assert feed[0]["post_id"] == "rp1"
+        assert feed[0]["repost"]["post_id"] == "c1"
+        assert network.posts["c1"].repost_count == 1
+
+    def test_repost_of_repost_reposts_original(self, network):
+        """Test reposting a repost counts on the original post."""
+        _apply(network, "repost", user_id="bob", content=None, repost_of="a1", post_id="rp1")
+        _apply(network, "repost", user_id="carol", content=None, repost_of="rp1", post_id="rp2")
+
+        assert network.posts["rp2"].repost_of == "a1"
+        assert network.posts["a1"].repost_count == 2
+
+    def test_order_independent_of_as_of(self, network):
+        """Test scores decay with as_of but the order does not change."""
+        _apply(network, "like", user_id="dave", post_id="b1")
+        early = network.query({"as_of": START + timedelta(hours=1)})["posts"]
+        late = network.query({"as_of": START + timedelta(days=3)})["posts"]
+
+        assert [post["post_id"] for post in early] == [post["post_id"] for post in late]
+        assert late[0]["score"] < early[0]["score"]
+
+    def test_decay_lets_new_posts_overtake(self, network):
+        """Test a fresh post outranks a liked post once enough time passes."""
+        for user in ("dave", "erin", "frank"):
+            _apply(network, "like", user_id=user, post_id="a1")
+        _apply(network, user_id="bob", content="soon", post_id="b2",
+               timestamp=START + timedelta(minutes=30))
+        _apply(network, user_id="bob", content="later", post_id="b3",
+               timestamp=START + timedelta(hours=24))
+
+        feed = _feed(network)
+        assert feed.index("a1") < feed.index("b2")
+        assert feed[0] == "b3"
+
+    def test_liked_flag_and_counts(self, network):
+        """Test rendered posts report likes by the simulated user."""
+        _apply(network, "like", user_id="user", post_id="a1")
+
+        post = network.query({})["posts"][0]
+        assert post["liked"] is True
+        assert post["like_count"] == 1
+        assert "liked_by" not in post
+
+    def test_delete_removes_from_feed(self, network):
+        """Test deleting a post retracts it from timelines."""
+        _apply(network, "delete", user_id="alice", post_id="a1")
+
+        assert _feed(network) == ["b1"]
+        assert "a1" not in network.posts
+
+
+class TestSocialMediaStateFollows:
+    """Test follows and the follower graph."""
+
+    def test_follow_merges_posts(self, network):
+        """Test following a user adds their existing posts to the feed."""
+        _apply(network, "follow", user_id="user", target_user_id="carol")
+
+        assert _feed(network) == ["c1", "b1", "a1"]
+
+    def test_unfollow_removes_posts(self, network):
+        """Test unfollowing a user removes their posts from the feed."""
+        _apply(network, "unfollow", user_id="user", target_user_id="alice")
+
+        assert _feed(network) == ["b1"]
+        assert network.following["user"] == {"bob"}
+
+    def test_follow_twice_rejected(self, network):
+        """Test following a followed user raises ValueError."""
+        with pytest.raises(ValueError, match="already follows"):
+            _apply(network, "follow", user_id="user", target_user_id="alice")
+
+    def test_unfollow_unfollowed_rejected(self, network):
+        """Test unfollowing an unfollowed user raises ValueError."""
+        with pytest.raises(ValueError, match="does not follow"):
+            _apply(network, "unfollow", user_id="user", target_user_id="carol")
+
+    def test_follower_queries(self, network):
+        """Test listing followers and followees."""
+        _apply(network, "follow", user_id="carol", target_user_id="alice")
+
+        assert network.query({"followers_of": "alice"})["users"] == ["carol", "user"]
+        assert network.query({"following_of": "user"})["users"] == ["alice", "bob"]
+
+    def test_snapshot(self, network):
+        """Test the snapshot reports follows and the first feed page."""
+        _apply(network, "follow", user_id="alice", target_user_id="user")
+
+        snapshot = network.get_snapshot()
+
+        assert snapshot["post_count"] == 3
+        assert snapshot["following"] == ["alice", "bob"]
+        assert snapshot["follower_count"] == 1
+        assert [post["post_id"] for post in snapshot["feed"]] == ["b1", "a1"]
+        assert snapshot["next_cursor"] is None
+
+
+class TestSocialMediaStateErrors:
+    """Test operations that fail on the current state."""
+
+    def test_duplicate_post_id_rejected(self, network):
+        """Test creating a post with a taken ID raises ValueError."""
+        with pytest.raises(ValueError, match="already exists"):
+            _apply(network, user_id="alice", post_id="a1")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"operation": "reply", "reply_to": "missing"},
+            {"operation": "repost", "repost_of": "missing"},
+            {"operation": "like", "post_id": "missing"},
+        ],
+    )
+    def test_missing_post_rejected(self, network, kwargs):
+        """Test acting on a missing post raises ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            _apply(network, user_id="bob", **kwargs)
+
+    def test_double_like_rejected(self, network):
+        """Test liking a post twice raises ValueError."""
+        _apply(network, "like", user_id="bob", post_id="a1")
+
+        with pytest.raises(ValueError, match="already likes"):
+            _apply(network, "like", user_id="bob", post_id="a1")
+
+    def test_unlike_without_like_rejected(self, network):
+        """Test unliking an unliked post raises ValueError."""
+        with pytest.raises(ValueError, match="does not like"):
+            _apply(network, "unlike", user_id="bob", post_id="a1")
+
+    def test_delete_other_users_post_rejected(self, network):
+        """Test users can only delete their own posts."""
+        with pytest.raises(ValueError, match="cannot delete"):
+            _apply(network, "delete", user_id="bob", post_id="a1")
+
+
+class TestSocialMediaStateQueries:
+    """Test paging and non-feed queries."""
+
+    def test_feed_cursor_pages(self):
+        """Test following next_cursor reads the whole feed exactly once."""
+        state = create_social_state(
+            posts=[(f"p{number:02d}", "user", "post") for number in range(25)],
+            last_updated=START,
+        )
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 10, **({"cursor": cursor} if cursor else {})}
+            result = state.query(params)
+            seen.extend(post["post_id"] for post in result["posts"])
+            cursor = result["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == [f"p{number:02d}" for number in reversed(range(25))]
+
+    def test_cursor_survives_rerank(self):
+        """Test a cursor continues after the page boundary post moves."""
+        state = create_social_state(
+            posts=[(f"p{number}", "user", "post") for number in range(6)],
+            last_updated=START,
+        )
+        first = state.query({"limit": 3})
+        _apply(state, "like", user_id="bob", post_id="p3")
+
+        second = state.query({"limit": 3, "cursor": first["next_cursor"]})
+
+        assert [post["post_id"] for post in second["posts"]] == ["p2", "p1", "p0"]
+
+    def test_cursor_of_another_feed_rejected(self):
+        """Test a cursor from one user's feed cannot page another's."""
+        state = create_social_state(
+            posts=[(f"p{number}", "user", "post") for number in range(3)],
+            last_updated=START,
+        )
+        cursor = state.query({"limit": 1})["next_cursor"]
+
+        with pytest.raises(ValueError):
+            state.query({"feed_of": "alice", "cursor": cursor})
+
+    def test_invalid_cursor_rejected(self, network):
+        """Test a malformed cursor raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            network.query({"cursor": "nonsense"})
+
+    def test_replies_oldest_first(self, network):
+        """Test replies are listed in the order they were written."""
+        _apply(network, "reply", user_id="bob", content="one", reply_to="a1", post_id="r1")
+        _apply(network, "reply", user_id="carol", content="two", reply_to="a1", post_id="r2")
+
+        result = network.query({"replies_to": "a1"})
+
+        assert [post["post_id"] for post in result["posts"]] == ["r1", "r2"]
+
+    def test_replies_to_missing_post_rejected(self, network):
+        """Test listing replies of a missing post raises ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            network.query({"replies_to": "missing"})
+
+    def test_author_newest_first(self, network):
+        """Test an author's posts are listed newest first with offset."""
+        _apply(network, user_id="alice", content="more", post_id="a2")
+        _apply(network, "repost", user_id="alice", content=None, repost_of="b1", post_id="a3")
+
+        result = network.query({"author": "alice", "offset": 1, "limit": 5})
+
+        assert [post["post_id"] for post in result["posts"]] == ["a2", "a1"]
+
+
+class TestSocialMediaStateTimelineLimit:
+    """Test capped timelines stay equal to a full rebuild."""
+
+    def test_truncated_timeline_rebuilt_on_delete(self):
+        """Test deleting from a full timeline brings back an evicted post."""
+        state = create_social_state(
+            posts=[(f"p{number}", "user", "post") for number in range(4)],
+            last_updated=START,
+            timeline_limit=3,
+        )
+        assert _feed(state) == ["p3", "p2", "p1"]
+
+        _apply(state, "delete", user_id="user", post_id="p2")
+
+        assert _feed(state) == ["p3", "p1", "p0"]
+
+    def test_truncated_timeline_rebuilt_on_unlike(self):
+        """Test a post falling below an evicted one is replaced by it."""
+        state = create_social_state(
+            posts=[(f"p{number}", "user", "post") for number in range(4)],
+            last_updated=START,
+            timeline_limit=3,
+        )
+        _apply(state, "like", user_id="bob", post_id="p0")
+        _apply(state, "like", user_id="carol", post_id="p0")
+        assert "p1" not in _feed(state)
+
+        _apply(state, "unlike", user_id="bob", post_id="p0")
+        _apply(state, "unlike", user_id="carol", post_id="p0")
+
+        assert _feed(state) == ["p3", "p2", "p1"]
+
+    def test_incremental_updates_match_rebuild(self):
+        """Test random operations keep every timeline equal to a rebuild."""
+        rng = random.Random(7)
+        users = ["user", "alice", "bob", "carol", "dave"]
+        state = SocialMediaState(last_updated=START, timeline_limit=5)
+        for user in users:
+            state.query({"feed_of": user})
+
+        for step in range(400):
+            user = rng.choice(users)
+            posts = list(state.posts)
+            roll = rng.random()
+            kwargs: dict = {"user_id": user, "content": "text", "post_id": f"s{step}"}
+            if roll < 0.3 or not posts:
+                operation = "post"
+            elif roll < 0.4:
+                operation, kwargs["reply_to"] = "reply", rng.choice(posts)
+            elif roll < 0.5:
+                operation, kwargs["repost_of"] = "repost", rng.choice(posts)
+            elif roll < 0.7:
+                operation, kwargs["post_id"] = rng.choice(["like", "unlike"]), rng.choice(posts)
+            elif roll < 0.8:
+                own = [post_id for post_id in posts if state.posts[post_id].author == user]
+                if not own:
+                    continue
+                operation, kwargs["post_id"] = "delete", rng.choice(own)
+            else:
+                others = [other for other in users if other != user]
+                operation, kwargs["target_user_id"] = rng.choice(["follow", "unfollow"]), rng.choice(others)
+            try:
+                _apply(state, operation, timestamp=START + timedelta(minutes=step), **kwargs)
+            except ValueError:
+                continue
+            assert _timelines(state) == _rebuilt(state)
+
+
+class TestSocialMediaStateUndo:
+    """Test create_undo_data() and apply_undo() round trips."""
+
+    @pytest.mark.parametrize(
+        ("operation", "kwargs"),
+        [
+            ("post", {"user_id": "alice", "post_id": "a2"}),
+            ("reply", {"user_id": "bob", "reply_to": "a1", "post_id": "r1"}),
+            ("repost", {"user_id": "bob", "content": None, "repost_of": "c1", "post_id": "rp1"}),
+            ("like", {"user_id": "bob", "post_id": "a1"}),
+            ("delete", {"user_id": "alice", "post_id": "a1"}),
+            ("follow", {"user_id": "user", "target_user_id": "carol"}),
+            ("unfollow", {"user_id": "user", "target_user_id": "alice"}),
+        ],
+    )
+    def test_undo_restores_state(self, network, operation, kwargs):
+        """Test undoing an operation restores posts, follows and feeds."""
+        _apply(network, "like", user_id="dave", post_id="b1")
+        before = network.model_dump()
+        feed = _feed(network)
+
+        undo_data = _apply_with_undo(network, operation, **kwargs)
+        network.apply_undo(undo_data)
+
+        assert network.model_dump() == before
+        assert _feed(network) == feed
+        assert _timelines(network) == _rebuilt(network)
+
+    def test_undo_unlike(self, network):
+        """Test undoing an unlike restores the like."""
+        _apply(network, "like", user_id="bob", post_id="a1")
+        undo_data = _apply_with_undo(network, "unlike", user_id="bob", post_id="a1")
+
+        network.apply_undo(undo_data)
+
+        assert network.posts["a1"].liked_by == {"bob"}
+        assert _feed(network) == ["a1", "b1"]
+
+    def test_undo_of_failing_operation_is_noop(self, network):
+        """Test undo data for an operation that will fail changes nothing."""
+        social_input = create_social_input(
+            operation="follow", user_id="user", target_user_id="alice", timestamp=START
+        )
+        undo_data = network.create_undo_data(social_input)
+
+        assert undo_data["action"] == "noop"
+
+    def test_unknown_undo_action_rejected(self, network):
+        """Test apply_undo rejects unknown actions."""
+        with pytest.raises(ValueError, match="Unknown undo action"):
+            network.apply_undo(
+                {
+                    "action": "explode",
+                    "state_previous_update_count": 0,
+                    "state_previous_last_updated": START.isoformat(),
+                }
+            )
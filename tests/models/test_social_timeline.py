@@ -0,0 +1,155 @@
+"""Unit tests for social media rank keys and timeline buffers."""
+
+import copy
+import math
+from datetime import datetime, timedelta, timezone
+
+from models.modalities.social_timeline import (
+    HALF_LIFE,
+    Timeline,
+    decayed_score,
+    engagement,
+    rank_key,
+)
+
+START = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class TestRankKey:
+    """Test rank keys and decayed scores."""
+
+    def test_engagement_weights(self):
+        """Test replies and reposts weigh more than likes."""
+        assert engagement(0, 0, 0) == 1.0
+        assert engagement(1, 0, 0) < engagement(0, 1, 0) < engagement(0, 0, 1)
+
+    def test_score_halves_after_half_life(self):
+        """Test a post's score halves every half-life."""
+        key = rank_key(START, 3, 0, 0)
+
+        assert math.isclose(decayed_score(key, START), 4.0)
+        assert math.isclose(decayed_score(key, START + HALF_LIFE), 2.0)
+
+    def test_order_is_independent_of_time(self):
+        """Test a newer post outranks an older one at every later time."""
+        old = rank_key(START, 2, 0, 0)
+        new = rank_key(START + timedelta(hours=3), 0, 0, 0)
+
+        for hours in (3, 10, 1000):
+            now = START + timedelta(hours=hours)
+            assert (decayed_score(new, now) > decayed_score(old, now)) == (new > old)
+
+    def test_older_post_with_enough_engagement_outranks(self):
+        """Test engagement outweighs age once it exceeds the decay."""
+        old = rank_key(START, 3, 0, 0)
+        new = rank_key(START + HALF_LIFE, 0, 0, 0)
+
+        assert old > new
+
+    def test_naive_datetimes_treated_as_utc(self):
+        """Test naive and UTC timestamps give the same key."""
+        assert rank_key(START.replace(tzinfo=None), 0, 0, 0) == rank_key(START, 0, 0, 0)
+
+
+class TestTimeline:
+    """Test the Timeline buffer."""
+
+    def test_offer_keeps_best_first(self):
+        """Test posts are ordered by key, best first."""
+        timeline = Timeline(limit=10)
+        timeline.offer("a", 1.0)
+        timeline.offer("b", 3.0)
+        timeline.offer("c", 2.0)
+
+        assert timeline.post_ids() == ["b", "c", "a"]
+        assert timeline.key("c") == 2.0
+        assert "a" in timeline
+        assert len(timeline) == 3
+
+    def test_ties_broken_by_post_id(self):
+        """Test posts with equal keys are ordered by ID."""
+        timeline = Timeline(limit=10)
+        timeline.offer("b", 1.0)
+        timeline.offer("a", 1.0)
+
+        assert timeline.post_ids() == ["a", "b"]
+
+    def test_full_timeline_evicts_worst(self):
+        """Test adding to a full timeline evicts the worst post."""
+        timeline = Timeline(limit=2)
+        timeline.offer("a", 1.0)
+        timeline.offer("b", 2.0)
+
+        assert timeline.offer("c", 3.0) is True
+        assert timeline.post_ids() == ["c", "b"]
+        assert timeline.truncated is True
+
+    def test_full_timeline_rejects_worse_post(self):
+        """Test a post below every held post is not added."""
+        timeline = Timeline(limit=2)
+        timeline.offer("a", 1.0)
+        timeline.offer("b", 2.0)
+
+        assert timeline.offer("c", 0.5) is False
+        assert timeline.post_ids() == ["b", "a"]
+        assert timeline.truncated is True
+
+    def test_remove(self):
+        """Test removing a held and a missing post."""
+        timeline = Timeline(limit=10)
+        timeline.offer("a", 1.0)
+        timeline.offer("b", 2.0)
+
+        assert timeline.remove("a") is True
+        assert timeline.remove("a") is False
+        assert timeline.post_ids() == ["b"]
+        assert timeline.key("a") is None
+
+    def test_page_and_continue(self):
+        """Test paging by the last entry of the previous page."""
+        timeline = Timeline(limit=10)
+        for number in range(5):
+            timeline.offer(f"p{number}", float(number))
+
+        first, has_more = timeline.page(limit=2)
+        assert [post_id for post_id, _ in first] == ["p4", "p3"]
+        assert has_more is True
+
+        second, has_more = timeline.page(after=(first[-1][1], first[-1][0]), limit=3)
+        assert [post_id for post_id, _ in second] == ["p2", "p1", "p0"]
+        assert has_more is False
+
+    def test_page_after_removed_post(self):
+        """Test a cursor stays valid after its post is removed."""
+        timeline = Timeline(limit=10)
+        for number in range(4):
+            timeline.offer(f"p{number}", float(number))
+        timeline.remove("p2")
+
+        page, _ = timeline.page(after=(2.0, "p2"), limit=10)
+
+        assert [post_id for post_id, _ in page] == ["p1", "p0"]
+
+    def test_build_matches_offers(self):
+        """Test building from candidates equals offering them one by one."""
+        candidates = [(f"p{number}", float(number % 7)) for number in range(20)]
+        offered = Timeline(limit=5)
+        for post_id, key in candidates:
+            offered.offer(post_id, key)
+
+        built = Timeline.build(candidates, limit=5)
+
+        assert built.post_ids() == offered.post_ids()
+        assert built.truncated is True
+        assert Timeline.build(candidates[:3], limit=5).truncated is False
+
+    def test_deepcopy_is_independent(self):
+        """Test a deep copy does not share entries with the original."""
+        timeline = Timeline(limit=10)
+        timeline.offer("a", 1.0)
+
+        copied = copy.deepcopy(timeline)
+        copied.offer("b", 2.0)
+
+        assert timeline.post_ids() == ["a"]
+        assert copied.post_ids() == ["b", "a"]
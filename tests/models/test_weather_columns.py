@@ -0,0 +1,189 @@
+"""Unit tests for the columnar weather report storage (ReportColumns)."""
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from models.modalities.weather_columns import ReportColumns
+from models.modalities.weather_input import WeatherReport
+from models.modalities.weather_state import WeatherLocationState, WeatherState
+from tests.fixtures.modalities.weather import (
+    create_forecast_report,
+    create_weather_input,
+    create_weather_state,
+)
+
+
+def _fahrenheit(kelvin: float) -> float:
+    return (kelvin - 273.15) * 9 / 5 + 32
+
+
+class TestReportColumns:
+    """Test storing a WeatherReport in columns and reading it back."""
+
+    def test_round_trip_matches_model_dump(self):
+        """Test that to_dict() gives exactly what the report dumps to."""
+        report = create_forecast_report()
+
+        columns = ReportColumns.from_report(report)
+
+        assert columns.to_dict() == report.model_dump()
+        assert columns.to_report() == report
+
+    def test_sections_are_read_only_arrays(self):
+        """Test that numeric fields become arrays and optional ones use NaN."""
+        columns = ReportColumns.from_report(create_forecast_report())
+
+        assert columns.hourly["temp"].dtype == np.float64
+        assert columns.hourly["dt"].dtype == np.int64
+        assert np.isnan(columns.hourly["visibility"][1])
+        assert columns.daily["temp.max"].tolist() == [293.0, 293.0]
+        assert isinstance(columns.hourly["weather"], tuple)
+        with pytest.raises(ValueError):
+            columns.hourly["temp"][0] = 0.0
+
+    def test_missing_and_empty_sections(self):
+        """Test that None and empty sections keep their distinction."""
+        report = create_forecast_report().model_copy(update={"minutely": [], "daily": None})
+
+        data = ReportColumns.from_report(report).to_dict()
+
+        assert data["minutely"] == []
+        assert data["daily"] is None
+
+    def test_to_dict_returns_copies(self):
+        """Test that changing a returned dict does not change the stored report."""
+        columns = ReportColumns.from_report(create_forecast_report())
+
+        data = columns.to_dict()
+        data["current"]["weather"][0]["main"] = "Changed"
+        data["hourly"][2]["rain"]["1h"] = 99.0
+
+        assert columns.to_dict()["current"]["weather"][0]["main"] == "Clear"
+        assert columns.to_dict()["hourly"][2]["rain"]["1h"] == 0.5
+
+
+class TestReportColumnsConversion:
+    """Test unit conversion and section exclusion."""
+
+    def test_imperial_conversion(self):
+        """Test that temperatures and speeds are converted in every section."""
+        report = create_forecast_report()
+
+        data = ReportColumns.from_report(report).convert("imperial").to_dict()
+
+        assert data["current"]["temp"] == _fahrenheit(report.current.temp)
+        assert data["current"]["wind_gust"] == report.current.wind_gust * 2.23694
+        for hour, original in zip(data["hourly"], report.hourly):
+            assert hour["temp"] == _fahrenheit(original.temp)
+            assert hour["dew_point"] == _fahrenheit(original.dew_point)
+            assert hour["wind_speed"] == original.wind_speed * 2.23694
+            assert hour["pressure"] == original.pressure
+        assert data["hourly"][1]["wind_gust"] is None
+        assert data["daily"][0]["temp"]["min"] == _fahrenheit(282.0)
+        assert data["daily"][0]["feels_like"]["morn"] == _fahrenheit(282.0)
+        assert data["daily"][0]["wind_gust"] is None
+        assert data["minutely"] == report.model_dump()["minutely"]
+
+    def test_metric_conversion_leaves_speeds(self):
+        """Test that metric converts to Celsius and keeps m/s."""
+        report = create_forecast_report()
+
+        data = ReportColumns.from_report(report).convert("metric").to_dict()
+
+        assert data["hourly"][0]["temp"] == report.hourly[0].temp - 273.15
+        assert data["hourly"][0]["wind_speed"] == report.hourly[0].wind_speed
+
+    def test_conversion_shares_unchanged_columns(self):
+        """Test that converting leaves the original alone and copies nothing else."""
+        columns = ReportColumns.from_report(create_forecast_report())
+        original = columns.to_dict()
+
+        converted = columns.convert("imperial")
+
+        assert columns.to_dict() == original
+        assert converted.hourly["pressure"] is columns.hourly["pressure"]
+        assert converted.hourly["temp"] is not columns.hourly["temp"]
+        assert converted.minutely is columns.minutely
+        assert columns.convert("standard") is columns
+
+    def test_exclude_sections(self):
+        """Test that excluded sections are dropped and the rest shared."""
+        columns = ReportColumns.from_report(create_forecast_report())
+
+        filtered = columns.exclude(["minutely", "alerts"])
+
+        assert filtered.minutely is None
+        assert filtered.alerts is None
+        assert filtered.hourly is columns.hourly
+        assert columns.minutely is not None
+        assert columns.exclude(None) is columns
+
+
+class TestWeatherStateColumns:
+    """Test that weather state stores and serves reports in columns."""
+
+    def test_location_fields_accept_weather_reports(self):
+        """Test that models convert reports and dump them in report format."""
+        report = create_forecast_report()
+        now = datetime.now(timezone.utc)
+
+        location = WeatherLocationState(
+            latitude=37.77,
+            longitude=-122.42,
+            current_report=report,
+            first_seen=now,
+            last_updated=now,
+        )
+        restored = WeatherLocationState.model_validate_json(location.model_dump_json())
+
+        assert isinstance(location.current_report, ReportColumns)
+        assert location.model_dump()["current_report"] == report.model_dump()
+        assert restored.current_report == location.current_report
+
+    def test_query_converts_history(self):
+        """Test that queries convert every returned report from history."""
+        state = create_weather_state()
+        for hour in range(3):
+            state.apply_input(
+                create_weather_input(
+                    report=create_forecast_report(dt=1735732800 + 3600 * hour),
+                    timestamp=datetime(2025, 1, 1, 12 + hour, tzinfo=timezone.utc),
+                )
+            )
+
+        result = state.query(
+            {
+                "lat": 37.7749,
+                "lon": -122.4194,
+                "from": datetime(2025, 1, 1, tzinfo=timezone.utc),
+                "units": "imperial",
+                "exclude": ["minutely"],
+                "offset": 1,
+            }
+        )
+
+        assert result["total_count"] == 3
+        assert result["count"] == 2
+        for report in result["reports"]:
+            WeatherReport.model_validate(report)
+            assert report["minutely"] is None
+            assert report["hourly"][0]["temp"] == _fahrenheit(285.0)
+        assert [report["current"]["dt"] for report in result["reports"]] == [
+            1735736400,
+            1735740000,
+        ]
+
+    def test_state_round_trip(self):
+        """Test that a state with forecast history survives serialization."""
+        state = create_weather_state()
+        for hour in range(2):
+            state.apply_input(
+                create_weather_input(report=create_forecast_report(dt=1735732800 + hour))
+            )
+
+        restored = WeatherState.model_validate(state.model_dump())
+
+        assert restored.get_snapshot() == state.get_snapshot()
+        assert restored.locations == state.locations
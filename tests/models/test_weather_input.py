@@ -216,10 +216,25 @@ class TestWeatherInputAbstractMethods:
         # Should mention rain in some form
         assert any(word in summary.lower() for word in ["rain", "rainy", "precipitation"])
 
-    def test_should_merge_with_returns_false(self):
-        """Test that should_merge_with returns False for weather inputs."""
-        weather1 = create_weather_input()
-        weather2 = create_weather_input()
+    def test_should_merge_with_same_location_within_five_minutes(self):
+        """Test that updates for one location within 5 minutes merge."""
+        weather1 = create_weather_input(timestamp=datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc))
+        weather2 = create_weather_input(timestamp=datetime(2025, 1, 1, 12, 5, tzinfo=timezone.utc))
+        
+        assert weather1.should_merge_with(weather2) is True
+
+    def test_should_merge_with_false_after_five_minutes(self):
+        """Test that updates more than 5 minutes apart do not merge."""
+        weather1 = create_weather_input(timestamp=datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc))
+        weather2 = create_weather_input(timestamp=datetime(2025, 1, 1, 12, 6, tzinfo=timezone.utc))
+        
+        assert weather1.should_merge_with(weather2) is False
+
+    def test_should_merge_with_false_for_different_location(self):
+        """Test that updates for different locations do not merge."""
+        timestamp = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        weather1 = create_weather_input(timestamp=timestamp)
+        weather2 = create_weather_input(latitude=40.7128, longitude=-74.0060, timestamp=timestamp)
         
         assert weather1.should_merge_with(weather2) is False
 
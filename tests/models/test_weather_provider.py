@@ -0,0 +1,204 @@
+"""Unit tests for fetching real weather through WeatherProvider.
+
+Requests go to the local OpenWeather stand-in (scenarios/openweather.py),
+served by the openweather_standin fixture.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from models.modalities.weather_provider import (
+    WeatherProvider,
+    get_weather_provider,
+    set_weather_provider,
+)
+from tests.fixtures.modalities.weather import create_weather_state
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _provider_like(provider, **kwargs):
+    """Create a provider for the same endpoint with other settings."""
+    return WeatherProvider(base_url=provider.base_url, **kwargs)
+
+
+class TestWeatherProviderCache:
+    """Test caching fetched reports."""
+
+    def test_repeated_fetch_uses_cache(self, openweather_standin):
+        """Test that a second fetch of a nearby location makes no request."""
+        app, provider = openweather_standin
+
+        first = provider.fetch(40.7128, -74.0060, "key")
+        second = provider.fetch(40.7131, -74.0058, "key")
+
+        assert second is first
+        assert app.state.requests == 1
+        assert provider.stats.requests == 1
+        assert provider.stats.hits == 1
+
+    def test_key_includes_exclude_and_api_key(self, openweather_standin):
+        """Test that other sections or API keys are fetched separately."""
+        app, provider = openweather_standin
+
+        provider.fetch(40.7128, -74.0060, "key", ["minutely", "daily"])
+        provider.fetch(40.7128, -74.0060, "key", ["daily", "minutely"])
+        report = provider.fetch(40.7128, -74.0060, "key")
+        provider.fetch(40.7128, -74.0060, "other")
+
+        assert report.minutely is not None
+        assert app.state.requests == 3
+
+    def test_expired_reports_are_fetched_again(self, openweather_standin):
+        """Test that a report is fetched again after its TTL."""
+        app, provider = openweather_standin
+        clock = FakeClock()
+        provider = _provider_like(provider, cache_ttl=60, clock=clock)
+
+        provider.fetch(40.7128, -74.0060, "key")
+        clock.now = 59
+        provider.fetch(40.7128, -74.0060, "key")
+        clock.now = 60
+        provider.fetch(40.7128, -74.0060, "key")
+
+        assert app.state.requests == 2
+
+    def test_least_recently_used_report_is_evicted(self, openweather_standin):
+        """Test that a full cache drops the report used longest ago."""
+        app, provider = openweather_standin
+        provider = _provider_like(provider, cache_size=2)
+
+        provider.fetch(10.0, 10.0, "key")
+        provider.fetch(20.0, 20.0, "key")
+        provider.fetch(10.0, 10.0, "key")
+        provider.fetch(30.0, 30.0, "key")
+        provider.fetch(10.0, 10.0, "key")
+        provider.fetch(20.0, 20.0, "key")
+
+        assert app.state.requests == 4
+
+    def test_zero_ttl_disables_cache(self, openweather_standin):
+        """Test that every fetch makes a request when caching is off."""
+        app, provider = openweather_standin
+        provider = _provider_like(provider, cache_ttl=0)
+
+        provider.fetch(40.7128, -74.0060, "key")
+        provider.fetch(40.7128, -74.0060, "key")
+
+        assert app.state.requests == 2
+
+    def test_errors_are_not_cached(self, openweather_standin):
+        """Test that a failed fetch raises and is tried again next time."""
+        app, provider = openweather_standin
+
+        with pytest.raises(RuntimeError, match="401"):
+            provider.fetch(40.7128, -74.0060, "")
+        with pytest.raises(RuntimeError, match="400"):
+            provider.fetch(95.0, 0.0, "key")
+        with pytest.raises(RuntimeError, match="401"):
+            provider.fetch(40.7128, -74.0060, "")
+
+        assert app.state.requests == 3
+
+    def test_invalid_settings_raise(self):
+        """Test that a negative TTL or empty cache is rejected."""
+        with pytest.raises(ValueError, match="cache_ttl"):
+            WeatherProvider(cache_ttl=-1)
+        with pytest.raises(ValueError, match="cache_size"):
+            WeatherProvider(cache_size=0)
+
+
+class TestWeatherProviderCoalescing:
+    """Test coalescing concurrent identical fetches."""
+
+    def test_concurrent_fetches_share_one_request(self, openweather_standin):
+        """Test that fetches made while one is in flight wait for it."""
+        app, provider = openweather_standin
+        provider = _provider_like(provider, cache_ttl=0)
+        app.state.latency = 0.2
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            reports = list(
+                pool.map(lambda _: provider.fetch(40.7128, -74.0060, "key"), range(8))
+            )
+
+        assert app.state.requests == 1
+        assert provider.stats.coalesced == 7
+        assert all(report is reports[0] for report in reports)
+
+    def test_waiting_fetches_get_the_error(self, openweather_standin):
+        """Test that a failed request fails every fetch waiting for it."""
+        app, provider = openweather_standin
+        app.state.latency = 0.2
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(provider.fetch, 40.7128, -74.0060, "") for _ in range(4)
+            ]
+            for future in futures:
+                with pytest.raises(RuntimeError, match="401"):
+                    future.result()
+
+        assert app.state.requests == 1
+
+
+class TestSharedWeatherProvider:
+    """Test the provider shared by every WeatherState."""
+
+    def test_created_from_environment(self, monkeypatch):
+        """Test that the shared provider reads its settings from the environment."""
+        monkeypatch.setenv("OPENWEATHER_BASE_URL", "http://127.0.0.1:1/onecall")
+        monkeypatch.setenv("OPENWEATHER_CACHE_TTL", "30")
+        set_weather_provider(None)
+        try:
+            provider = get_weather_provider()
+
+            assert provider.base_url == "http://127.0.0.1:1/onecall"
+            assert provider.cache_ttl == 30
+            assert get_weather_provider() is provider
+        finally:
+            set_weather_provider(None)
+
+    def test_invalid_ttl_raises(self, monkeypatch):
+        """Test that a non-numeric OPENWEATHER_CACHE_TTL is rejected."""
+        monkeypatch.setenv("OPENWEATHER_CACHE_TTL", "ten")
+        set_weather_provider(None)
+
+        with pytest.raises(ValueError, match="OPENWEATHER_CACHE_TTL"):
+            get_weather_provider()
+
+    def test_state_queries_real_weather(self, openweather_standin):
+        """Test that a real query fetches, stores and converts the report."""
+        app, provider = openweather_standin
+        state = create_weather_state(openweather_api_key="key")
+
+        result = state.query(
+            {"lat": 40.7128, "lon": -74.0060, "real": True, "units": "metric"}
+        )
+        state.query({"lat": 40.7128, "lon": -74.0060, "real": True})
+
+        location = next(iter(state.locations.values()))
+        stored = location.current_report.to_dict()
+        assert app.state.requests == 1
+        assert result["count"] == 1
+        assert result["reports"][0]["current"]["temp"] == pytest.approx(
+            stored["current"]["temp"] - 273.15
+        )
+        assert location.update_count == 2
+
+    def test_state_without_api_key_raises(self, monkeypatch):
+        """Test that a real fetch needs an API key."""
+        monkeypatch.delenv("OPENWEATHER_API_KEY", raising=False)
+        state = create_weather_state(openweather_api_key=None)
+
+        with pytest.raises(ValueError, match="API key"):
+            state.fetch_openweather_report(40.7128, -74.0060)
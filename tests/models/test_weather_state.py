@@ -474,6 +474,24 @@ class TestWeatherStateQuery:
         assert temp_celsius < 100  # Should be in Celsius range
 
 
+    def test_query_fetched_report_records_without_fetching(self):
+        """Test that a prefetched real report is recorded without an API call.
+
+        WEATHER-SPECIFIC: No API key is configured, so any fetch would raise.
+        """
+        state = create_weather_state()
+        weather = HOT_WEATHER
+
+        result = state.query_fetched_report(
+            {"lat": weather.latitude, "lon": weather.longitude, "units": "metric"},
+            weather.report,
+        )
+
+        assert result["count"] == 1
+        assert result["reports"][0]["current"]["temp"] < 100
+        assert state.query({"lat": weather.latitude, "lon": weather.longitude})["count"] == 1
+
+
 class TestWeatherStateSerialization:
     """Test WeatherState serialization and deserialization.
     
@@ -1022,7 +1040,7 @@ class TestWeatherStateApplyUndo:
         
         location_key = state._get_location_key(first_weather.latitude, first_weather.longitude)
         # Store a copy of the report data, not the object reference
-        original_report_dict = state.locations[location_key].current_report.model_dump()
+        original_report_dict = state.locations[location_key].current_report.to_dict()
         
         # Create second update with DIFFERENT weather and capture undo
         # Use RAINY_WEATHER but at the same coordinates
@@ -1035,11 +1053,11 @@ class TestWeatherStateApplyUndo:
         state.apply_input(second_weather)
         
         # Current report should have changed (different report data)
-        assert state.locations[location_key].current_report.model_dump() != original_report_dict
+        assert state.locations[location_key].current_report.to_dict() != original_report_dict
         
         # Apply undo - should restore original report
         state.apply_undo(undo_data)
-        assert state.locations[location_key].current_report.model_dump() == original_report_dict
+        assert state.locations[location_key].current_report.to_dict() == original_report_dict
 
     def test_apply_undo_restores_location_metadata(self):
         """Test that apply_undo restores location-level metadata.
@@ -1248,7 +1266,7 @@ class TestWeatherStateApplyUndo:
         
         original_snapshot = state.get_snapshot()
         location_key = state._get_location_key(first_weather.latitude, first_weather.longitude)
-        original_report = state.locations[location_key].current_report.model_dump()
+        original_report = state.locations[location_key].current_report.to_dict()
         
         # Second update with undo cycle
         second_weather = create_weather_input(
@@ -1263,7 +1281,7 @@ class TestWeatherStateApplyUndo:
         # State should be restored
         restored_snapshot = state.get_snapshot()
         assert restored_snapshot["update_count"] == original_snapshot["update_count"]
-        restored_report = state.locations[location_key].current_report.model_dump()
+        restored_report = state.locations[location_key].current_report.to_dict()
         assert restored_report == original_report
 
     def test_multiple_undo_operations(self):
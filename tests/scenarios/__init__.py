@@ -0,0 +1 @@
+"""Scenario generator tests package."""
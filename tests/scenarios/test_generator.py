@@ -0,0 +1,207 @@
+"""Unit tests for the synthetic scenario generator in scenarios/."""
+
+import io
+import json
+from datetime import timedelta
+from itertools import islice
+
+import pytest
+
+from models.event import EventStatus, SimulatorEvent
+from models.queue import EventQueue
+from scenarios import (
+    ScenarioConfig,
+    ScenarioGenerator,
+    create_engine,
+    read_ndjson,
+    stream_into_queue,
+    write_ndjson,
+)
+from scenarios.generator import USER_EMAIL, USER_PHONE
+from scenarios.ndjson import dump_event, load_event
+
+
+def _dump(config: ScenarioConfig) -> list[str]:
+    """Generate a scenario and encode it as NDJSON lines."""
+    return [dump_event(event) for event in ScenarioGenerator(config).events()]
+
+
+class TestScenarioGenerator:
+    """Tests for generating events."""
+
+    def test_same_seed_gives_identical_events(self):
+        """Test that generation is fully deterministic for a seed."""
+        config = ScenarioConfig(seed=3, days=2)
+
+        assert _dump(config) == _dump(config)
+        assert _dump(config) != _dump(ScenarioConfig(seed=4, days=2))
+
+    def test_events_are_in_schedule_order_with_unique_ids(self):
+        """Test that merged streams come out sorted and IDs do not collide."""
+        events = list(ScenarioGenerator(ScenarioConfig(seed=1, days=3)).events())
+
+        times = [event.scheduled_time for event in events]
+        assert times == sorted(times)
+        assert len({event.event_id for event in events}) == len(events)
+        assert {event.modality for event in events} == {
+            "email",
+            "sms",
+            "calendar",
+            "location",
+            "weather",
+        }
+
+    def test_generation_is_lazy(self):
+        """Test that a very long scenario starts producing events immediately."""
+        generator = ScenarioGenerator(ScenarioConfig(days=100_000))
+
+        first = list(islice(generator.events(), 1000))
+
+        assert len(first) == 1000
+
+    def test_per_modality_rates_are_configurable(self):
+        """Test that intervals set counts and zero rates disable a modality."""
+        config = ScenarioConfig(
+            days=1,
+            location_interval=10,
+            weather_interval=0,
+            email_rate=0,
+            sms_rate=0,
+            meetings_per_day=0,
+            recurring_meetings=0,
+        )
+
+        events = list(ScenarioGenerator(config).events())
+
+        assert len(events) == 86400 // 10
+        assert {event.modality for event in events} == {"location"}
+
+    def test_replies_continue_existing_threads(self):
+        """Test that replies point at earlier messages in the same thread."""
+        config = ScenarioConfig(seed=5, days=5, email_reply_probability=0.8)
+        emails = {}
+        sms_contacts = set()
+
+        for event in ScenarioGenerator(config).events():
+            data = event.data
+            if event.modality == "email":
+                if data.operation == "reply":
+                    original = emails[data.in_reply_to]
+                    assert data.from_address == USER_EMAIL
+                    assert data.to_addresses == [original.from_address]
+                elif data.in_reply_to is not None:
+                    assert emails[data.in_reply_to].operation == "reply"
+                emails[data.message_id] = data
+            elif event.modality == "sms":
+                if data.action == "receive_message":
+                    sms_contacts.add(data.message_data["from_number"])
+                else:
+                    assert data.message_data["from_number"] == USER_PHONE
+                    assert data.message_data["to_numbers"][0] in sms_contacts
+
+        operations = [e.operation for e in emails.values()]
+        assert "reply" in operations
+
+    def test_invalid_config_is_rejected(self):
+        """Test that out-of-range parameters fail loudly."""
+        with pytest.raises(ValueError, match="sms_reply_probability"):
+            ScenarioConfig(sms_reply_probability=1.5)
+
+
+class TestScenarioFiles:
+    """Tests for NDJSON scenario files and loading queues."""
+
+    def test_file_round_trip_runs_without_failures(self):
+        """Test that a written scenario reads back and executes cleanly."""
+        config = ScenarioConfig(seed=2, days=2)
+        buffer = io.StringIO()
+        written = write_ndjson(ScenarioGenerator(config).events(), buffer, config)
+        buffer.seek(0)
+
+        loaded_config, events = read_ndjson(buffer)
+        engine = create_engine(loaded_config)
+        added = stream_into_queue(events, engine.event_queue, batch_size=500)
+        engine.start()
+        engine.advance_time(timedelta(days=config.days))
+        engine.stop()
+
+        assert loaded_config == config
+        assert added == written
+        statuses = {event.status for event in engine.event_queue.events}
+        assert statuses == {EventStatus.EXECUTED}
+
+    def test_file_without_config(self):
+        """Test that a file written without a config has no config."""
+        config = ScenarioConfig(days=1)
+        buffer = io.StringIO()
+        write_ndjson(islice(ScenarioGenerator(config).events(), 5), buffer)
+        buffer.seek(0)
+
+        loaded_config, events = read_ndjson(buffer)
+
+        assert loaded_config is None
+        assert len(list(events)) == 5
+
+    def test_file_without_header(self):
+        """Test that a file of bare event lines can be read."""
+        config = ScenarioConfig(days=1)
+        lines = [dump_event(event) for event in islice(ScenarioGenerator(config).events(), 5)]
+        buffer = io.StringIO("\n".join(lines) + "\n")
+
+        loaded_config, events = read_ndjson(buffer)
+
+        assert loaded_config is None
+        assert len(list(events)) == 5
+
+    def test_trusted_read_marks_inputs_validated(self):
+        """Test that trusted reads skip re-validating written inputs."""
+        config = ScenarioConfig(days=1)
+        buffer = io.StringIO()
+        write_ndjson(islice(ScenarioGenerator(config).events(), 5), buffer)
+
+        buffer.seek(0)
+        _, untrusted = read_ndjson(buffer)
+        assert not any(event.data.is_validated for event in untrusted)
+
+        buffer.seek(0)
+        _, trusted = read_ndjson(buffer, trusted=True)
+        assert all(event.data.is_validated for event in trusted)
+
+    def test_dict_payload_is_written_as_its_input(self):
+        """Test that an event holding its input as a dict is written typed."""
+        event = next(iter(ScenarioGenerator(ScenarioConfig(days=1)).events()))
+        expected = dump_event(event)
+        event.data = event.data.model_dump()
+
+        assert dump_event(event) == expected
+
+    def test_missing_priority_uses_event_default(self):
+        """Test that a line without priority loads like a directly built event."""
+        event = next(iter(ScenarioGenerator(ScenarioConfig(days=1)).events()))
+        record = json.loads(dump_event(event))
+        del record["priority"]
+
+        loaded = load_event(json.dumps(record))
+
+        assert loaded.priority == SimulatorEvent.model_fields["priority"].default
+
+    def test_file_without_header_is_never_trusted(self):
+        """Test that bare event files are validated even when trust is asked for."""
+        config = ScenarioConfig(days=1)
+        lines = [dump_event(event) for event in islice(ScenarioGenerator(config).events(), 5)]
+        buffer = io.StringIO("\n".join(lines) + "\n")
+
+        _, events = read_ndjson(buffer, trusted=True)
+
+        assert not any(event.data.is_validated for event in events)
+
+    def test_stream_into_queue_in_batches(self):
+        """Test that events are added in several batches, sorted."""
+        queue = EventQueue()
+        events = ScenarioGenerator(ScenarioConfig(days=1)).events()
+
+        count = stream_into_queue(islice(events, 250), queue, batch_size=100)
+
+        assert count == 250
+        times = [event.scheduled_time for event in queue.events]
+        assert times == sorted(times)
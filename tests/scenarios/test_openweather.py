@@ -0,0 +1,111 @@
+"""Unit tests for the local OpenWeather stand-in in scenarios/openweather.py."""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from models.modalities.weather_input import WeatherReport
+from scenarios.openweather import (
+    ONECALL_PATH,
+    create_app,
+    generate_report,
+    load_recordings,
+)
+from tests.fixtures.modalities.weather import create_forecast_report
+
+NOW = 1735732800
+
+
+def _get(client, **params):
+    return client.get(ONECALL_PATH, params={"appid": "key", **params})
+
+
+class TestGenerateReport:
+    """Tests for generated One Call reports."""
+
+    def test_report_has_every_section(self):
+        """Test that generated reports are complete and valid."""
+        report = generate_report(40.7128, -74.0060, NOW)
+
+        assert report.current.dt == NOW
+        assert len(report.minutely) == 60
+        assert len(report.hourly) == 48
+        assert len(report.daily) == 8
+        assert report.timezone_offset == -5 * 3600
+        assert report.timezone == "Etc/GMT+5"
+
+    def test_deterministic_within_an_hour(self):
+        """Test that a location gets the same forecast throughout an hour."""
+        first = generate_report(40.7128, -74.0060, NOW)
+        later = generate_report(40.7131, -74.0058, NOW + 1800)
+        next_hour = generate_report(40.7128, -74.0060, NOW + 3600)
+
+        assert later.hourly == first.hourly
+        assert next_hour.hourly != first.hourly
+
+    def test_colder_towards_the_poles(self):
+        """Test that temperatures fall with latitude."""
+        equator = generate_report(0.0, 0.0, NOW)
+        arctic = generate_report(70.0, 0.0, NOW)
+
+        assert arctic.daily[0].temp.max < equator.daily[0].temp.max
+
+
+class TestOneCallEndpoint:
+    """Tests for GET /data/3.0/onecall."""
+
+    def test_serves_generated_report(self):
+        """Test that unknown locations get a generated report."""
+        client = TestClient(create_app(clock=lambda: NOW))
+
+        response = _get(client, lat=40.7128, lon=-74.0060)
+
+        assert response.status_code == 200
+        assert response.json() == generate_report(40.7128, -74.0060, NOW).model_dump()
+
+    def test_exclude_and_units(self):
+        """Test that sections are excluded and units converted like the real API."""
+        client = TestClient(create_app(clock=lambda: NOW))
+        standard = generate_report(40.7128, -74.0060, NOW)
+
+        data = _get(
+            client, lat=40.7128, lon=-74.0060, exclude="minutely,daily", units="metric"
+        ).json()
+
+        assert data["minutely"] is None
+        assert data["daily"] is None
+        assert data["current"]["temp"] == pytest.approx(standard.current.temp - 273.15)
+
+    def test_serves_recordings(self, tmp_path):
+        """Test that recorded responses are served for their location."""
+        report = create_forecast_report()
+        (tmp_path / "sf.json").write_text(json.dumps(report.model_dump()))
+        client = TestClient(create_app(load_recordings(tmp_path)))
+
+        data = _get(client, lat=37.7749, lon=-122.4194).json()
+
+        assert WeatherReport.model_validate(data) == report
+
+    def test_invalid_recording_raises(self, tmp_path):
+        """Test that a file that is not a One Call response is rejected."""
+        (tmp_path / "bad.json").write_text(json.dumps({"lat": 1.0}))
+
+        with pytest.raises(ValueError, match="bad.json"):
+            load_recordings(tmp_path)
+
+    def test_errors_use_openweather_format(self):
+        """Test that bad keys and coordinates get OpenWeather's errors."""
+        app = create_app(api_key="secret")
+        client = TestClient(app)
+
+        no_key = client.get(ONECALL_PATH, params={"lat": 1, "lon": 1})
+        wrong_key = _get(client, lat=1, lon=1)
+        bad_lat = client.get(ONECALL_PATH, params={"appid": "secret", "lat": 91, "lon": 1})
+
+        assert no_key.status_code == 401
+        assert no_key.json()["cod"] == 401
+        assert wrong_key.status_code == 401
+        assert bad_lat.status_code == 400
+        assert bad_lat.json()["message"] == "wrong latitude or longitude"
+        assert app.state.requests == 3
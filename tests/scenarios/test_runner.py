@@ -0,0 +1,123 @@
+"""Unit tests for the headless scenario runner in scenarios/runner.py."""
+
+import json
+from itertools import islice
+
+import pytest
+
+from scenarios import ScenarioConfig, ScenarioGenerator, write_ndjson
+from scenarios.ndjson import dump_event
+from scenarios.runner import build_report, load_agent, run_scenario, run_scenarios
+
+CALLS = []
+
+
+def counting_agent(engine, step):
+    """Record each call so tests can check how the agent was driven."""
+    CALLS.append((engine.environment.time_state.current_time, step["events_executed"]))
+
+
+@pytest.fixture
+def scenario_file(tmp_path):
+    """Write a two-day scenario and return its path."""
+    config = ScenarioConfig(seed=4, days=2)
+    path = tmp_path / "scenario.ndjson"
+    with open(path, "w") as file:
+        write_ndjson(ScenarioGenerator(config).events(), file, config)
+    return str(path)
+
+
+class TestRunScenario:
+    """Tests for running a single scenario."""
+
+    def test_runs_every_event_and_reports_metrics(self, scenario_file):
+        """Test that the whole scenario executes and is counted by modality."""
+        result = run_scenario(scenario_file)
+
+        assert result.failed == {}
+        assert sum(result.executed.values()) == result.events
+        assert result.steps == 48
+        assert result.snapshot["event_queue"]["pending_events"] == 0
+
+    def test_agent_is_called_after_every_step(self, scenario_file):
+        """Test that the agent sees each step and can act on the engine."""
+        CALLS.clear()
+
+        result = run_scenario(scenario_file, agent_path=f"{__name__}:counting_agent")
+
+        assert len(CALLS) == result.steps
+        assert sum(executed for _, executed in CALLS) == result.events
+        assert [when for when, _ in CALLS] == sorted(when for when, _ in CALLS)
+
+    def test_inbox_triage_agent_reads_all_mail(self, scenario_file):
+        """Test the example agent by checking nothing is left unread."""
+        result = run_scenario(
+            scenario_file, agent_path="scenarios.agents:inbox_triage"
+        )
+
+        inbox = result.snapshot["environment"]["modalities"]["email"]["folders"]["inbox"]
+        assert inbox["message_count"] > 0
+        assert inbox["unread_count"] == 0
+
+    def test_file_without_header_runs_to_last_event(self, tmp_path):
+        """Test that bare event files start at the first event."""
+        config = ScenarioConfig(days=1, location_interval=600)
+        path = tmp_path / "bare.ndjson"
+        with open(path, "w") as file:
+            for event in islice(ScenarioGenerator(config).events(), 20):
+                file.write(dump_event(event) + "\n")
+
+        result = run_scenario(str(path), include_snapshot=False)
+
+        assert result.events == 20
+        assert sum(result.executed.values()) == 20
+        assert result.snapshot is None
+
+    def test_coalescing_merges_high_frequency_fixes(self, tmp_path):
+        """Test that coalesced runs account for every event once."""
+        config = ScenarioConfig(days=1, location_interval=1, weather_interval=60)
+        path = tmp_path / "gps.ndjson"
+        with open(path, "w") as file:
+            write_ndjson(islice(ScenarioGenerator(config).events(), 600), file)
+
+        result = run_scenario(str(path), include_snapshot=False, coalesce=True)
+
+        assert result.failed == {}
+        assert result.merged["location"] > 0
+        assert sum(result.executed.values()) + sum(result.merged.values()) == 600
+
+
+class TestRunScenarios:
+    """Tests for running batches of scenarios."""
+
+    def test_worker_processes_match_in_process_runs(self, scenario_file):
+        """Test that pooled runs give the same results as in-process runs."""
+        pooled = run_scenarios([scenario_file], repeat=2, workers=2)
+        inline = run_scenarios([scenario_file], workers=0)
+
+        assert [result.run for result in pooled] == [0, 1]
+        expected = inline[0].snapshot["environment"]["modalities"]
+        for result in pooled:
+            modalities = result.snapshot["environment"]["modalities"]
+            assert result.executed == inline[0].executed
+            assert {name: state["update_count"] for name, state in modalities.items()} == {
+                name: state["update_count"] for name, state in expected.items()
+            }
+
+    def test_report_totals(self, scenario_file):
+        """Test that the report sums runs and serializes to JSON."""
+        results = run_scenarios([scenario_file], repeat=2, workers=0)
+
+        report = build_report(results, workers=0, wall_seconds=2.0)
+
+        assert report["runs"] == 2
+        assert report["events"] == 2 * results[0].events
+        assert report["failed"] == 0
+        assert json.loads(json.dumps(report, default=str))["results"][1]["run"] == 1
+
+    def test_bad_agent_path_fails_before_running(self, scenario_file):
+        """Test that malformed or missing agents are rejected up front."""
+        with pytest.raises(ValueError, match="module:function"):
+            load_agent("scenarios.agents")
+        with pytest.raises(ValueError, match="not a callable"):
+            run_scenarios([scenario_file], agent_path="scenarios.agents:missing")